@@ -135,6 +135,8 @@ class ApprovalItem(Base):
         compliance_details: Detailed compliance check results (JSONB)
         quality_breakdown: Quality score breakdown by factor (JSONB)
         rewrite_suggestions: AI-generated rewrite suggestions (JSONB)
+        validation_snapshot: Per-sentence compliance findings of the last
+            validated caption, for incremental revalidation (JSONB)
         would_auto_publish: Whether content meets auto-publish criteria
         suggested_publish_time: Suggested time for publishing
         scheduled_publish_time: Confirmed scheduled publish time
@@ -222,6 +224,13 @@ class ApprovalItem(Base):
         default=None,
     )
 
+    # Last validated caption's per-sentence findings (incremental revalidation)
+    validation_snapshot: Mapped[Optional[dict]] = mapped_column(
+        JSONB,
+        nullable=True,
+        default=None,
+    )
+
     # Auto-publish eligibility
     would_auto_publish: Mapped[bool] = mapped_column(
         Boolean,
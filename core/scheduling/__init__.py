@@ -7,6 +7,9 @@ Components:
     - OptimalTimeCalculator: Calculate optimal publish times
     - ConflictDetector: Detect scheduling conflicts
     - schedule_publish_job: ARQ job for publishing
+    - rescore_research_pool_job: ARQ job for refreshing Research Pool scores
+    - fan_out_scan_job / scan_shard_job / finish_scan_job /
+      run_scan_pipeline_job: ARQ jobs for scans sharded across workers
     - WorkerSettings: ARQ worker configuration
 
 Usage:
@@ -30,6 +33,11 @@ from .jobs import (
     schedule_publish_job,
     cancel_publish_job,
     get_scheduled_jobs_status,
+    rescore_research_pool_job,
+    fan_out_scan_job,
+    scan_shard_job,
+    finish_scan_job,
+    run_scan_pipeline_job,
     WorkerSettings,
     enqueue_publish_job,
     update_publish_job,
@@ -48,6 +56,11 @@ __all__ = [
     "schedule_publish_job",
     "cancel_publish_job",
     "get_scheduled_jobs_status",
+    "rescore_research_pool_job",
+    "fan_out_scan_job",
+    "scan_shard_job",
+    "finish_scan_job",
+    "run_scan_pipeline_job",
     "WorkerSettings",
     "enqueue_publish_job",
     "update_publish_job",
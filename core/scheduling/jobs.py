@@ -7,6 +7,11 @@ Jobs:
     - schedule_publish_job: Triggers publishing at scheduled time
     - cancel_publish_job: Cancels a scheduled publish job
     - update_publish_job: Updates job when rescheduled
+    - rescore_research_pool_job: Refreshes Research Pool scores as items age
+    - fan_out_scan_job: Splits a scanner's scan into shards on any worker
+    - scan_shard_job: Scans one shard of sources; the last one enqueues finish_scan_job
+    - finish_scan_job: Merges a sharded scan and enqueues run_scan_pipeline_job
+    - run_scan_pipeline_job: Runs a pipeline from its checkpointed scan
 
 Usage:
     from core.scheduling.jobs import schedule_publish_job, WorkerSettings
@@ -20,10 +25,17 @@ Usage:
     )
 """
 
+import json
 import logging
 from datetime import datetime
 from typing import Optional
-from uuid import UUID
+from uuid import UUID, uuid4
+
+try:
+    from arq.worker import func
+except ImportError:
+    # Fallback for testing without arq installed
+    func = None
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +46,18 @@ PUBLISH_JOB_TIMEOUT = 60
 _discord_alert_timestamps: dict[str, datetime] = {}
 DISCORD_RATE_LIMIT_SECONDS = 60  # 1 minute between same error type
 
+# Research Pool rescoring progress, readable while the job runs
+RESCORE_PROGRESS_KEY = "research:rescore:progress"
+RESCORE_PROGRESS_TTL_SECONDS = 3600
+
+# Longest a fanned-out scan waits for shards that never settle (e.g. a shard
+# killed at WorkerSettings.job_timeout) before finishing without them
+SCAN_FINISH_DEADLINE_SECONDS = 3600
+
+# A pipeline run harvests, validates, scores and publishes a whole merged
+# scan, far longer than WorkerSettings.job_timeout allows
+SCAN_PIPELINE_JOB_TIMEOUT = 1800
+
 
 async def _emit_publish_event(
     item_id: str,
@@ -443,6 +467,378 @@ async def get_scheduled_jobs_status(
     return result
 
 
+async def rescore_research_pool_job(
+    ctx: dict,
+    chunk_size: Optional[int] = None,
+) -> dict:
+    """Job to rescore the whole Research Pool.
+
+    Recency is part of every composite score, so stored scores drift as
+    items age. Pages through research_items by id, scores in chunks, and
+    writes and commits each chunk with a single batched UPDATE via
+    ResearchScoringService.rescore_pool. Progress is logged per chunk and
+    mirrored to RESCORE_PROGRESS_KEY in Redis when available.
+
+    Args:
+        ctx: ARQ context with Redis connection
+        chunk_size: Items per chunk (defaults to DEFAULT_RESCORE_CHUNK_SIZE)
+
+    Returns:
+        Run summary (scanned, updated, chunks, elapsed_seconds,
+        items_per_second) or {"status": "<ERROR>"} on failure
+    """
+    logger.info("Research Pool rescoring job started")
+
+    try:
+        # Import here to avoid circular deps
+        from core.database import get_async_session
+        from core.scheduling.scan_pipelines import build_research_scorer
+        from teams.dawo.research import ResearchPoolRepository
+        from teams.dawo.research.scoring import ResearchScoringService, RescoreResult
+        from teams.dawo.research.scoring.service import DEFAULT_RESCORE_CHUNK_SIZE
+    except ImportError as e:
+        logger.error("Failed to import required modules: %s", e)
+        return {"status": "IMPORT_ERROR"}
+
+    redis = ctx.get("redis")
+
+    async def report_progress(progress: RescoreResult) -> None:
+        """Mirror the running totals to Redis for progress polling."""
+        if not redis:
+            return
+        try:
+            await redis.set(
+                RESCORE_PROGRESS_KEY,
+                json.dumps(progress.to_dict()),
+                ex=RESCORE_PROGRESS_TTL_SECONDS,
+            )
+        except Exception as e:
+            # Don't fail the run over progress reporting
+            logger.warning("Failed to report rescore progress: %s", e)
+
+    try:
+        async with get_async_session() as session:
+            service = ResearchScoringService(
+                repository=ResearchPoolRepository(session),
+                scorer=build_research_scorer(),
+            )
+            result = await service.rescore_pool(
+                chunk_size=chunk_size or DEFAULT_RESCORE_CHUNK_SIZE,
+                progress_callback=report_progress,
+            )
+    except Exception as e:
+        logger.exception("Error in rescore_research_pool_job: %s", e)
+        return {"status": f"ERROR: {str(e)}"}
+
+    return {"status": "RESCORED", **result.to_dict()}
+
+
+async def scan_shard_job(
+    ctx: dict,
+    pipeline: str,
+    run_id: str,
+    scan_id: str,
+    shard_index: int,
+    sources: list[str],
+) -> dict:
+    """Job to scan one shard of a fanned-out scan.
+
+    Runs the pipeline's scanner over a subset of its sources and records
+    the result in Redis (ScanShardStore). A failing shard is recorded too,
+    so the merged scan reports it while the other shards carry the run.
+    The shard that settles last enqueues finish_scan_job.
+
+    Args:
+        ctx: ARQ context with Redis connection and scanners (keyed by
+            pipeline name, filled by WorkerSettings.on_startup)
+        pipeline: Pipeline name (e.g. "reddit")
+        run_id: Pipeline run the scan feeds
+        scan_id: Fan-out attempt shared by all shards of the scan
+        shard_index: Index of this shard
+        sources: Sources to scan, a slice of scanner.sources()
+
+    Returns:
+        {"status": "SCANNED", "items": ..., "duplicates": ...} or
+        {"status": "<ERROR>"} on failure
+    """
+    from teams.dawo.scanners.sharding import ScanShardStore
+
+    scanner = ctx.get("scanners", {}).get(pipeline)
+    if scanner is None:
+        logger.error("No scanner configured for pipeline %s", pipeline)
+        return {"status": "NOT_CONFIGURED"}
+
+    redis = ctx["redis"]
+    store = ScanShardStore(redis)
+    try:
+        result = await scanner.scan(sources)
+    except Exception as e:
+        logger.exception("Shard %d of %s scan %s failed: %s", shard_index, pipeline, scan_id, e)
+        await store.record_failure(
+            pipeline, scan_id, shard_index, f"Shard {shard_index} ({', '.join(sources)}): {e}"
+        )
+        response = {"status": f"ERROR: {str(e)}"}
+    else:
+        duplicates = await store.record(scanner, pipeline, scan_id, shard_index, result)
+        response = {
+            "status": "SCANNED",
+            "items": len(getattr(result, scanner.SHARD_ITEMS_FIELD)),
+            "duplicates": duplicates,
+        }
+
+    if await store.settled(pipeline, scan_id):
+        await _enqueue_scan_finish(redis, pipeline, run_id, scan_id)
+    return response
+
+
+async def _enqueue_scan_finish(
+    redis,
+    pipeline: str,
+    run_id: str,
+    scan_id: str,
+    shard_count: Optional[int] = None,
+    defer_by: Optional[int] = None,
+) -> None:
+    """Enqueue finish_scan_job for a fanned-out scan.
+
+    Job ids are derived from the scan id, so shards settling together
+    enqueue one finish job between them (ARQ skips a duplicate job id).
+
+    Args:
+        redis: ARQ Redis pool
+        pipeline: Pipeline name
+        run_id: Pipeline run the scan feeds
+        scan_id: Fan-out attempt
+        shard_count: Shards enqueued (needed to report missing shards)
+        defer_by: Seconds to defer by (the deadline job), or None
+    """
+    suffix = ":deadline" if defer_by is not None else ""
+    await redis.enqueue_job(
+        "finish_scan_job",
+        pipeline=pipeline,
+        run_id=run_id,
+        scan_id=scan_id,
+        shard_count=shard_count,
+        _job_id=f"finish_scan_job:{pipeline}:{scan_id}{suffix}",
+        _defer_by=defer_by,
+    )
+
+
+async def fan_out_scan_job(
+    ctx: dict,
+    pipeline: str,
+    run_id: Optional[str] = None,
+    sources_per_shard: Optional[int] = None,
+) -> dict:
+    """Job to start a pipeline run with its scan spread across workers.
+
+    Splits scanner.sources() into shards and enqueues one scan_shard_job
+    per shard, then returns - it never waits on other jobs. The shard that
+    settles last enqueues finish_scan_job, which merges the shards and
+    enqueues run_scan_pipeline_job. A deferred finish_scan_job is enqueued
+    as well, so shards that never settle (killed or lost) cannot stall
+    the run.
+
+    Retrying with the same run_id skips the fan-out once the merged scan
+    is checkpointed.
+
+    Args:
+        ctx: ARQ context with Redis connection, scanners, research_pipelines
+            (pipeline factories; both keyed by pipeline name) and
+            checkpoint_store, filled by WorkerSettings.on_startup
+        pipeline: Pipeline name (e.g. "reddit")
+        run_id: Run id to resume, or None for a new run
+        sources_per_shard: Sources per shard job (defaults to
+            DEFAULT_SOURCES_PER_SHARD)
+
+    Returns:
+        {"status": "FANNED_OUT", "run_id": ..., "scan_id": ..., "shards": ...},
+        {"status": "SCAN_CHECKPOINTED", "run_id": ...} when only the
+        pipeline needs to resume, or {"status": "<ERROR>"} on failure
+    """
+    from teams.dawo.scanners.sharding import (
+        DEFAULT_SOURCES_PER_SHARD,
+        ScanShardStore,
+        split_sources,
+    )
+
+    scanner = ctx.get("scanners", {}).get(pipeline)
+    build_pipeline = ctx.get("research_pipelines", {}).get(pipeline)
+    checkpoint_store = ctx.get("checkpoint_store")
+    if scanner is None or build_pipeline is None or checkpoint_store is None:
+        logger.error("Sharded scans are not configured for pipeline %s", pipeline)
+        return {"status": "NOT_CONFIGURED"}
+
+    redis = ctx["redis"]
+    run_id = run_id or uuid4().hex
+
+    try:
+        if "scan" in await checkpoint_store.load(pipeline, run_id):
+            await redis.enqueue_job("run_scan_pipeline_job", pipeline=pipeline, run_id=run_id)
+            return {"status": "SCAN_CHECKPOINTED", "run_id": run_id}
+
+        shards = split_sources(
+            scanner.sources(), sources_per_shard or DEFAULT_SOURCES_PER_SHARD
+        )
+        scan_id = uuid4().hex
+        shard_store = ScanShardStore(redis)
+        await shard_store.begin(pipeline, scan_id, len(shards))
+        logger.info(
+            "Fanning out %s run %s (scan %s) into %d shards",
+            pipeline, run_id, scan_id, len(shards),
+        )
+
+        await _enqueue_scan_finish(
+            redis, pipeline, run_id, scan_id,
+            shard_count=len(shards),
+            defer_by=SCAN_FINISH_DEADLINE_SECONDS,
+        )
+        for index, shard in enumerate(shards):
+            await redis.enqueue_job(
+                "scan_shard_job",
+                pipeline=pipeline,
+                run_id=run_id,
+                scan_id=scan_id,
+                shard_index=index,
+                sources=shard,
+            )
+        if not shards:
+            await _enqueue_scan_finish(redis, pipeline, run_id, scan_id, shard_count=0)
+    except Exception as e:
+        logger.exception("Error in fan_out_scan_job: %s", e)
+        return {"status": f"ERROR: {str(e)}"}
+
+    return {"status": "FANNED_OUT", "run_id": run_id, "scan_id": scan_id, "shards": len(shards)}
+
+
+async def finish_scan_job(
+    ctx: dict,
+    pipeline: str,
+    run_id: str,
+    scan_id: str,
+    shard_count: Optional[int] = None,
+) -> dict:
+    """Job to merge a fanned-out scan and hand it to the pipeline.
+
+    Enqueued by the last shard to settle, and as a deadline job by
+    fan_out_scan_job. Whichever runs first claims the scan; the other
+    returns without doing anything. Shards that have not settled by the
+    deadline are reported as failed. The shards' results are merged
+    (deduplicated by the scanner's shard_key) and stored as the run's
+    "scan" checkpoint, then run_scan_pipeline_job is enqueued to run
+    harvest onwards under its own timeout.
+
+    Args:
+        ctx: ARQ context with Redis connection, scanners, research_pipelines
+            (pipeline factories; both keyed by pipeline name) and
+            checkpoint_store, filled by WorkerSettings.on_startup
+        pipeline: Pipeline name (e.g. "reddit")
+        run_id: Pipeline run the scan feeds
+        scan_id: Fan-out attempt to merge
+        shard_count: Shards enqueued (missing ones are reported)
+
+    Returns:
+        {"status": "SCAN_MERGED", "run_id": ..., "failed_shards": ...},
+        {"status": "ALREADY_CLAIMED"} if another job merged the scan, or
+        {"status": "<ERROR>"} on failure
+    """
+    from teams.dawo.scanners.sharding import ScanShardStore
+
+    scanner = ctx.get("scanners", {}).get(pipeline)
+    build_pipeline = ctx.get("research_pipelines", {}).get(pipeline)
+    checkpoint_store = ctx.get("checkpoint_store")
+    if scanner is None or build_pipeline is None or checkpoint_store is None:
+        logger.error("Sharded scans are not configured for pipeline %s", pipeline)
+        return {"status": "NOT_CONFIGURED"}
+
+    redis = ctx["redis"]
+    try:
+        shard_store = ScanShardStore(redis)
+        if not await shard_store.claim(pipeline, scan_id):
+            logger.debug("Scan %s of %s run %s already merged", scan_id, pipeline, run_id)
+            return {"status": "ALREADY_CLAIMED", "run_id": run_id}
+
+        scan_result, failures = await shard_store.collect(
+            pipeline, scan_id, scanner.SHARD_ITEMS_FIELD, shard_count=shard_count
+        )
+        await shard_store.clear(pipeline, scan_id)
+        if scan_result is None:
+            logger.error("Every shard of %s run %s failed", pipeline, run_id)
+            return {"status": "SCAN_FAILED", "run_id": run_id, "errors": failures}
+        await checkpoint_store.save(pipeline, run_id, "scan", scan_result)
+
+        await redis.enqueue_job("run_scan_pipeline_job", pipeline=pipeline, run_id=run_id)
+    except Exception as e:
+        logger.exception("Error in finish_scan_job: %s", e)
+        return {"status": f"ERROR: {str(e)}"}
+
+    return {"status": "SCAN_MERGED", "run_id": run_id, "failed_shards": len(failures)}
+
+
+async def run_scan_pipeline_job(
+    ctx: dict,
+    pipeline: str,
+    run_id: str,
+) -> dict:
+    """Job to run a pipeline from its checkpointed scan.
+
+    Enqueued once the run's "scan" checkpoint is stored. Builds the
+    pipeline with a publisher bound to this job's database session, and
+    pipeline.execute(run_id) resumes after the scan. Registered with
+    SCAN_PIPELINE_JOB_TIMEOUT rather than WorkerSettings.job_timeout.
+
+    Args:
+        ctx: ARQ context with research_pipelines (factories keyed by
+            pipeline name) and checkpoint_store, filled by
+            WorkerSettings.on_startup
+        pipeline: Pipeline name (e.g. "reddit")
+        run_id: Pipeline run to resume
+
+    Returns:
+        {"status": <PipelineStatus>, "run_id": ..., "retry_scheduled": ...}
+        or {"status": "<ERROR>"} on failure
+    """
+    build_pipeline = ctx.get("research_pipelines", {}).get(pipeline)
+    if build_pipeline is None or ctx.get("checkpoint_store") is None:
+        logger.error("Sharded scans are not configured for pipeline %s", pipeline)
+        return {"status": "NOT_CONFIGURED"}
+
+    try:
+        # Import here to avoid circular deps
+        from core.database import get_async_session
+    except ImportError as e:
+        logger.error("Failed to import required modules: %s", e)
+        return {"status": "IMPORT_ERROR"}
+
+    try:
+        async with get_async_session() as session:
+            result = await build_pipeline(session).execute(run_id=run_id)
+    except Exception as e:
+        logger.exception("Error in run_scan_pipeline_job: %s", e)
+        return {"status": f"ERROR: {str(e)}"}
+
+    return {
+        "status": result.status.value,
+        "run_id": result.run_id,
+        "retry_scheduled": result.retry_scheduled,
+    }
+
+
+def _with_timeout(coroutine, timeout: int):
+    """Register a job with its own timeout instead of job_timeout.
+
+    Args:
+        coroutine: Job function
+        timeout: Timeout in seconds
+
+    Returns:
+        ARQ Function wrapping the job (the bare job without arq installed)
+    """
+    if func is None:
+        return coroutine
+    return func(coroutine, timeout=timeout)
+
+
 class WorkerSettings:
     """ARQ worker configuration for scheduling jobs.
 
@@ -460,6 +856,11 @@ class WorkerSettings:
         schedule_publish_job,
         cancel_publish_job,
         get_scheduled_jobs_status,
+        rescore_research_pool_job,
+        fan_out_scan_job,
+        scan_shard_job,
+        finish_scan_job,
+        _with_timeout(run_scan_pipeline_job, SCAN_PIPELINE_JOB_TIMEOUT),
     ]
 
     # No cron jobs - all scheduled dynamically
@@ -472,12 +873,22 @@ class WorkerSettings:
 
     @staticmethod
     async def on_startup(ctx: dict) -> None:
-        """Called when worker starts."""
+        """Called when worker starts.
+
+        Builds the scanners, pipeline factories and checkpoint store read
+        by the sharded scan jobs.
+        """
+        from core.scheduling.scan_pipelines import setup_scan_pipelines
+
+        await setup_scan_pipelines(ctx)
         logger.info("ARQ worker started for scheduling jobs")
 
     @staticmethod
     async def on_shutdown(ctx: dict) -> None:
         """Called when worker shuts down."""
+        from core.scheduling.scan_pipelines import close_scan_pipelines
+
+        await close_scan_pipelines(ctx)
         logger.info("ARQ worker shutting down")
 
 
@@ -558,6 +969,10 @@ __all__ = [
     "schedule_publish_job",
     "cancel_publish_job",
     "get_scheduled_jobs_status",
+    "rescore_research_pool_job",
+    "fan_out_scan_job",
+    "scan_shard_job",
+    "finish_scan_job",
     "WorkerSettings",
     "enqueue_publish_job",
     "update_publish_job",
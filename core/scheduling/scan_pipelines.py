@@ -0,0 +1,321 @@
+"""Worker-side wiring of the sharded scan pipelines.
+
+Fills the ARQ worker context read by fan_out_scan_job, scan_shard_job,
+finish_scan_job and run_scan_pipeline_job:
+    - scanners: shardable scanners keyed by pipeline name
+    - research_pipelines: factories keyed by pipeline name, called with a
+      database session to build the pipeline for one run
+    - checkpoint_store: PipelineCheckpointStore on the worker's Redis
+
+Scanners and their HTTP clients are built once at worker startup and
+closed at shutdown. The publisher needs a database session, so pipelines
+are built per run inside run_scan_pipeline_job.
+
+Only the Reddit and news pipelines can be built from the config files and
+environment variables. The YouTube, Instagram and PubMed stages need an
+LLM client, which the Team Builder injects; it can add those scanners and
+factories to the context itself.
+
+Usage:
+    await setup_scan_pipelines(ctx)  # WorkerSettings.on_startup
+    ...
+    await close_scan_pipelines(ctx)  # WorkerSettings.on_shutdown
+"""
+
+import dataclasses
+import json
+import logging
+import os
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_DIR = Path("config")
+
+# Builds a pipeline for one run from a database session
+PipelineFactory = Callable[[Any], Any]
+
+
+def _load_json(config_dir: Path, filename: str) -> dict:
+    """Load a JSON config file from the config directory.
+
+    Args:
+        config_dir: Directory holding the dawo_*.json files
+        filename: File name within config_dir
+
+    Returns:
+        Parsed config dict
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(config_dir / filename, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _known_fields(raw: dict, config_class: type) -> dict:
+    """Pick the entries of a raw config that are fields of a config dataclass.
+
+    Args:
+        raw: Parsed JSON config (may hold extra keys, e.g. "schedule")
+        config_class: Dataclass to build from it
+
+    Returns:
+        Keyword arguments for config_class
+    """
+    names = {field.name for field in dataclasses.fields(config_class)}
+    return {key: value for key, value in raw.items() if key in names}
+
+
+def build_research_scorer() -> Any:
+    """Build the Research Pool scorer with its default configs.
+
+    Returns:
+        ResearchItemScorer
+    """
+    from teams.dawo.research.scoring import (
+        ResearchItemScorer,
+        ScoringConfig,
+        RelevanceScorer,
+        RelevanceConfig,
+        RecencyScorer,
+        RecencyConfig,
+        SourceQualityScorer,
+        SourceQualityConfig,
+        EngagementScorer,
+        EngagementConfig,
+        ComplianceAdjuster,
+    )
+
+    return ResearchItemScorer(
+        config=ScoringConfig(),
+        relevance_scorer=RelevanceScorer(config=RelevanceConfig()),
+        recency_scorer=RecencyScorer(config=RecencyConfig()),
+        source_quality_scorer=SourceQualityScorer(config=SourceQualityConfig()),
+        engagement_scorer=EngagementScorer(config=EngagementConfig()),
+        compliance_adjuster=ComplianceAdjuster(),
+    )
+
+
+def _publisher(session: Any) -> Any:
+    """Build a Research Pool publisher bound to a database session."""
+    from teams.dawo.research import ResearchPoolRepository, ResearchPublisher
+
+    return ResearchPublisher(ResearchPoolRepository(session))
+
+
+async def _build_reddit(
+    config_dir: Path,
+    retry_config: dict,
+    research_compliance: Any,
+    scorer: Any,
+    checkpoint_store: Any,
+    resources: AsyncExitStack,
+) -> Optional[tuple[Any, PipelineFactory]]:
+    """Build the Reddit scanner and pipeline factory.
+
+    Args:
+        config_dir: Directory holding dawo_reddit_scanner.json
+        retry_config: Raw retry config from load_retry_config
+        research_compliance: Shared ResearchComplianceValidator
+        scorer: Shared ResearchItemScorer
+        checkpoint_store: Shared PipelineCheckpointStore
+        resources: Exit stack the HTTP client is entered into
+
+    Returns:
+        (scanner, factory), or None if the API credentials are not set
+    """
+    from teams.dawo.middleware import RetryMiddleware, get_retry_config_for_api
+    from teams.dawo.scanners.reddit import (
+        RedditClient,
+        RedditClientConfig,
+        RedditHarvester,
+        RedditResearchPipeline,
+        RedditScanner,
+        RedditScannerConfig,
+        RedditTransformer,
+        RedditValidator,
+    )
+
+    raw = _load_json(config_dir, "dawo_reddit_scanner.json")
+    api = raw.get("reddit_api", {})
+    credentials = {
+        name: os.environ.get(api.get(f"{name}_env", f"REDDIT_{name.upper()}"), "")
+        for name in ("client_id", "client_secret", "username", "password")
+    }
+    if not all(credentials.values()):
+        logger.warning("Reddit credentials not configured, skipping reddit pipeline")
+        return None
+
+    config = RedditScannerConfig(**_known_fields(raw, RedditScannerConfig))
+    client_config = RedditClientConfig(
+        **credentials,
+        **({"user_agent": api["user_agent"]} if "user_agent" in api else {}),
+    )
+    client = RedditClient(
+        client_config, RetryMiddleware(get_retry_config_for_api(retry_config, "reddit"))
+    )
+    await resources.enter_async_context(client)
+
+    scanner = RedditScanner(config, client)
+    harvester = RedditHarvester(client, max_concurrency=config.max_concurrent_requests)
+    transformer = RedditTransformer(keywords=config.keywords)
+    validator = RedditValidator(research_compliance)
+
+    def factory(session: Any) -> RedditResearchPipeline:
+        return RedditResearchPipeline(
+            scanner,
+            harvester,
+            transformer,
+            validator,
+            scorer,
+            _publisher(session),
+            checkpoint_store=checkpoint_store,
+        )
+
+    return scanner, factory
+
+
+async def _build_news(
+    config_dir: Path,
+    retry_config: dict,
+    research_compliance: Any,
+    scorer: Any,
+    checkpoint_store: Any,
+    redis: Any,
+) -> tuple[Any, PipelineFactory]:
+    """Build the news scanner and pipeline factory.
+
+    Args:
+        config_dir: Directory holding dawo_news_scanner.json
+        retry_config: Raw retry config from load_retry_config
+        research_compliance: Shared ResearchComplianceValidator
+        scorer: Shared ResearchItemScorer
+        checkpoint_store: Shared PipelineCheckpointStore
+        redis: Worker Redis, holding the feeds' ETag/Last-Modified validators
+
+    Returns:
+        (scanner, factory)
+    """
+    from teams.dawo.middleware import RetryMiddleware, get_retry_config_for_api
+    from teams.dawo.scanners.news import (
+        FeedSource,
+        NewsCategorizer,
+        NewsFeedClient,
+        NewsFeedClientConfig,
+        NewsHarvester,
+        NewsPriorityScorer,
+        NewsResearchPipeline,
+        NewsScanner,
+        NewsScannerConfig,
+        NewsTransformer,
+        NewsValidator,
+        RedisFeedValidatorStore,
+    )
+
+    raw = _load_json(config_dir, "dawo_news_scanner.json")
+    fields = _known_fields(raw, NewsScannerConfig)
+    fields["feeds"] = [FeedSource(**feed) for feed in raw["feeds"]]
+    config = NewsScannerConfig(**fields)
+    feed_client = NewsFeedClient(
+        NewsFeedClientConfig(),
+        RetryMiddleware(get_retry_config_for_api(retry_config, "news")),
+        validator_store=RedisFeedValidatorStore(redis),
+    )
+
+    scanner = NewsScanner(config, feed_client)
+    harvester = NewsHarvester()
+    transformer = NewsTransformer(
+        NewsCategorizer(competitor_brands=config.competitor_brands),
+        NewsPriorityScorer(),
+    )
+    validator = NewsValidator(research_compliance)
+
+    def factory(session: Any) -> NewsResearchPipeline:
+        return NewsResearchPipeline(
+            scanner,
+            harvester,
+            transformer,
+            validator,
+            scorer,
+            _publisher(session),
+            checkpoint_store=checkpoint_store,
+        )
+
+    return scanner, factory
+
+
+async def setup_scan_pipelines(
+    ctx: dict,
+    config_dir: Path = DEFAULT_CONFIG_DIR,
+) -> None:
+    """Fill the worker context for sharded scans.
+
+    Sets ctx["checkpoint_store"], ctx["scanners"] and
+    ctx["research_pipelines"]. A pipeline that cannot be built is logged
+    and left out, so its jobs return NOT_CONFIGURED; the others still run.
+
+    Args:
+        ctx: ARQ worker context with Redis connection
+        config_dir: Directory holding the dawo_*.json files
+    """
+    from teams.dawo.middleware import PipelineCheckpointStore, load_retry_config
+
+    ctx.setdefault("scanners", {})
+    ctx.setdefault("research_pipelines", {})
+
+    redis = ctx.get("redis")
+    if redis is None:
+        logger.warning("No Redis in worker context, sharded scans disabled")
+        return
+
+    checkpoint_store = PipelineCheckpointStore(redis)
+    ctx["checkpoint_store"] = checkpoint_store
+    resources = AsyncExitStack()
+    ctx["scan_resources"] = resources
+
+    try:
+        from teams.dawo.validators import EUComplianceChecker, ResearchComplianceValidator
+
+        retry_config = load_retry_config(config_dir / "dawo_retry_config.json")
+        research_compliance = ResearchComplianceValidator(
+            EUComplianceChecker(_load_json(config_dir, "dawo_compliance_rules.json"))
+        )
+        scorer = build_research_scorer()
+    except Exception as e:
+        # The worker's other jobs still run without sharded scans
+        logger.exception("Failed to build shared pipeline stages: %s", e)
+        return
+
+    builders = {
+        "reddit": lambda: _build_reddit(
+            config_dir, retry_config, research_compliance, scorer, checkpoint_store, resources
+        ),
+        "news": lambda: _build_news(
+            config_dir, retry_config, research_compliance, scorer, checkpoint_store, redis
+        ),
+    }
+    for pipeline, build in builders.items():
+        try:
+            built = await build()
+        except Exception as e:
+            logger.exception("Failed to build %s pipeline: %s", pipeline, e)
+            continue
+        if built is None:
+            continue
+        ctx["scanners"][pipeline], ctx["research_pipelines"][pipeline] = built
+        logger.info("Sharded scans configured for %s", pipeline)
+
+
+async def close_scan_pipelines(ctx: dict) -> None:
+    """Close the HTTP clients opened by setup_scan_pipelines.
+
+    Args:
+        ctx: ARQ worker context
+    """
+    resources = ctx.pop("scan_resources", None)
+    if resources is not None:
+        await resources.aclose()
@@ -0,0 +1,65 @@
+"""Add source_key to research_items for idempotent bulk upserts.
+
+Adds:
+- source_key: Stable per-source identifier (post permalink, video URL, PMID URL)
+- uq_research_items_source_key: Unique index on (source, source_key), used as
+  the ON CONFLICT target by ResearchPoolRepository.bulk_upsert
+
+Existing rows are backfilled from url. Rows that duplicate an earlier
+(source, url) pair keep a NULL source_key so the unique index can be built
+without deleting data; they can be cleaned up separately.
+
+Revision ID: 2026_02_09_001
+Revises: 2026_02_08_003
+Create Date: 2026-02-09
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "2026_02_09_001"
+down_revision = "2026_02_08_003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add source_key column, backfill from url, and create unique index."""
+
+    op.add_column(
+        "research_items",
+        sa.Column("source_key", sa.String(255), nullable=True),
+    )
+
+    # Backfill the oldest row of each (source, url) group; later duplicates
+    # stay NULL (NULLs never conflict in a unique index)
+    op.execute(
+        """
+        UPDATE research_items AS ri
+        SET source_key = LEFT(ri.url, 255)
+        FROM (
+            SELECT id,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY source, LEFT(url, 255)
+                       ORDER BY created_at, id
+                   ) AS rn
+            FROM research_items
+        ) AS ranked
+        WHERE ri.id = ranked.id AND ranked.rn = 1
+        """
+    )
+
+    op.create_index(
+        "uq_research_items_source_key",
+        "research_items",
+        ["source", "source_key"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop source_key unique index and column."""
+
+    op.drop_index("uq_research_items_source_key", table_name="research_items")
+    op.drop_column("research_items", "source_key")
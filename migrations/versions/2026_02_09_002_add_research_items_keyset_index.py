@@ -0,0 +1,36 @@
+"""Add composite keyset index for Research Pool cursor pagination.
+
+Adds:
+- idx_research_items_score_keyset: (score DESC, created_at DESC, id DESC),
+  matching the default ResearchPoolRepository.query_page sort so each page
+  is an index range scan starting at the cursor instead of an offset scan
+
+Revision ID: 2026_02_09_002
+Revises: 2026_02_09_001
+Create Date: 2026-02-09
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "2026_02_09_002"
+down_revision = "2026_02_09_001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create composite keyset index on research_items."""
+
+    op.create_index(
+        "idx_research_items_score_keyset",
+        "research_items",
+        [sa.text("score DESC"), sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Drop composite keyset index."""
+
+    op.drop_index("idx_research_items_score_keyset", table_name="research_items")
@@ -0,0 +1,35 @@
+"""Add validation snapshot to approval_items.
+
+Adds:
+- validation_snapshot: Per-sentence compliance findings of the last
+  validated caption, so caption edits only re-check changed sentences
+
+Revision ID: 2026_02_10_001
+Revises: 2026_02_09_002
+Create Date: 2026-02-10
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "2026_02_10_001"
+down_revision = "2026_02_09_002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add validation_snapshot column to approval_items."""
+
+    op.add_column(
+        "approval_items",
+        sa.Column("validation_snapshot", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove validation_snapshot column."""
+
+    op.drop_column("approval_items", "validation_snapshot")
@@ -19,6 +19,7 @@ Exports:
     PlatformOptimizationResult: Platform-specific optimization check result
     EngagementPrediction: Engagement prediction based on historical data
     DEFAULT_WEIGHTS: Default scoring weight configuration
+    DEFAULT_BATCH_CONCURRENCY: Default requests scored at once by score_batch()
     validate_weights: Weight validation utility
 
 Scorer Classes (individual components):
@@ -33,6 +34,7 @@ Scorer Classes (individual components):
 from .agent import (
     ContentQualityScorer,
     ContentQualityScorerProtocol,
+    DEFAULT_BATCH_CONCURRENCY,
 )
 from .schemas import (
     QualityScoreRequest,
@@ -79,6 +81,7 @@ __all__: list[str] = [
     "EngagementPrediction",
     # Constants and utilities
     "DEFAULT_WEIGHTS",
+    "DEFAULT_BATCH_CONCURRENCY",
     "validate_weights",
     # Scorer classes
     "ComplianceScorer",
@@ -8,9 +8,12 @@ Uses the 'generate' tier for AI detectability analysis.
 Configuration is received via dependency injection - NEVER loads config directly.
 """
 
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Optional, Protocol
+from typing import Any, Awaitable, Iterator, Optional, Protocol
+import asyncio
 import logging
+import time
 
 from .schemas import (
     QualityScoreRequest,
@@ -38,6 +41,9 @@ from .scorers import (
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Requests scored at once by score_batch()
+DEFAULT_BATCH_CONCURRENCY = 8
+
 
 class ContentQualityScorerProtocol(Protocol):
     """Protocol for content quality scorer.
@@ -97,6 +103,10 @@ class ContentQualityScorer:
         self._weights = weights or DEFAULT_WEIGHTS.copy()
         validate_weights(self._weights)
 
+        # Kept for validations shared across score_batch() variants
+        self._compliance_checker = compliance_checker
+        self._brand_validator = brand_validator
+
         # Initialize component scorers with individual configs
         self._compliance_scorer = ComplianceScorer(
             compliance_checker=compliance_checker,
@@ -127,61 +137,130 @@ class ContentQualityScorer:
         """Calculate quality score for content.
 
         Scores content across all components and returns a weighted
-        total score along with individual component breakdowns.
+        total score along with individual component breakdowns. The
+        compliance, brand voice, engagement and authenticity components
+        are independent and run concurrently.
+
+        Args:
+            request: QualityScoreRequest with content and metadata
+
+        Returns:
+            QualityScoreResult with total score and component breakdown
+        """
+        return await self._score_request(request)
+
+    async def score_batch(
+        self,
+        requests: list[QualityScoreRequest],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[QualityScoreResult]:
+        """Calculate quality scores for many requests.
+
+        Variants of the same content (e.g. the same caption as feed post
+        and story) share one compliance check and one brand validation.
+        A result precomputed on any variant is used for all of them.
+
+        Args:
+            requests: QualityScoreRequests to score
+            max_concurrency: Maximum requests scored at once
+
+        Returns:
+            QualityScoreResult per request, in input order
+
+        Raises:
+            ValueError: If max_concurrency is not positive
+        """
+        if max_concurrency <= 0:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+
+        shared = _SharedValidations(requests, self._compliance_checker, self._brand_validator)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def score(request: QualityScoreRequest) -> QualityScoreResult:
+            async with semaphore:
+                return await self._score_request(request, shared)
+
+        try:
+            return list(await asyncio.gather(*(score(request) for request in requests)))
+        finally:
+            shared.cancel_pending()
+
+    async def _score_request(
+        self,
+        request: QualityScoreRequest,
+        shared: Optional["_SharedValidations"] = None,
+    ) -> QualityScoreResult:
+        """Score one request, optionally sharing validations with a batch.
 
         Args:
             request: QualityScoreRequest with content and metadata
+            shared: Compliance and brand results shared by a batch
 
         Returns:
             QualityScoreResult with total score and component breakdown
         """
         start_time = datetime.now(timezone.utc)
-        component_scores: list[ComponentScore] = []
+        latencies: dict[str, float] = {}
         recommendations: list[str] = []
 
-        try:
-            # Score compliance
-            compliance_score = await self._compliance_scorer.score(
+        async def compliance() -> ComponentScore:
+            check = request.compliance_check
+            if check is None and shared is not None:
+                check = await shared.compliance_check(request.content)
+            return await self._compliance_scorer.score(
                 content=request.content,
-                precomputed_check=request.compliance_check,
+                precomputed_check=check,
             )
-            component_scores.append(compliance_score)
 
-            # Score brand voice
-            brand_score = await self._brand_scorer.score(
+        async def brand_voice() -> ComponentScore:
+            validation = request.brand_validation
+            if validation is None and shared is not None:
+                validation = await shared.brand_validation(request.content)
+            return await self._brand_scorer.score(
                 content=request.content,
-                precomputed_validation=request.brand_validation,
+                precomputed_validation=validation,
             )
-            component_scores.append(brand_score)
 
+        try:
             # Score visual quality (synchronous - uses input score)
-            visual_score = self._visual_scorer.score(
-                visual_quality_score=request.visual_quality_score,
-            )
-            component_scores.append(visual_score)
-
-            # Score platform optimization
-            platform_result = self._platform_scorer.score(
-                content=request.content,
-                content_type=request.content_type,
-                hashtags=request.hashtags,
-            )
-            component_scores.append(platform_result)
+            with _timed("visual_quality", latencies):
+                visual_score = self._visual_scorer.score(
+                    visual_quality_score=request.visual_quality_score,
+                )
+
+            # Score platform optimization (synchronous - rule based)
+            with _timed("platform", latencies):
+                platform_result = self._platform_scorer.score(
+                    content=request.content,
+                    content_type=request.content_type,
+                    hashtags=request.hashtags,
+                )
             recommendations.extend(platform_result.details.get("suggestions", []))
 
-            # Score engagement prediction
-            engagement_score = await self._engagement_scorer.score(
-                source_type=request.source_type,
-                content_type=request.content_type.value if request.content_type else None,
-                hashtags=request.hashtags,
+            # Independent components (validators, history, LLM) run concurrently
+            compliance_score, brand_score, engagement_score, authenticity_score = (
+                await asyncio.gather(
+                    _timed_call("compliance", latencies, compliance()),
+                    _timed_call("brand_voice", latencies, brand_voice()),
+                    _timed_call("engagement", latencies, self._engagement_scorer.score(
+                        source_type=request.source_type,
+                        content_type=request.content_type.value if request.content_type else None,
+                        hashtags=request.hashtags,
+                    )),
+                    _timed_call("authenticity", latencies, self._authenticity_scorer.score(
+                        content=request.content,
+                    )),
+                )
             )
-            component_scores.append(engagement_score)
 
-            # Score authenticity
-            authenticity_score = await self._authenticity_scorer.score(
-                content=request.content,
-            )
-            component_scores.append(authenticity_score)
+            component_scores: list[ComponentScore] = [
+                compliance_score,
+                brand_score,
+                visual_score,
+                platform_result,
+                engagement_score,
+                authenticity_score,
+            ]
 
             # Calculate weighted total
             total_score = sum(cs.weighted_score for cs in component_scores)
@@ -200,6 +279,7 @@ class ContentQualityScorer:
                 platform_optimization=platform_result.details.get("result"),
                 engagement_prediction=engagement_score.details.get("prediction"),
                 scoring_time_ms=scoring_time_ms,
+                component_latency_ms=latencies,
                 recommendations=recommendations,
                 created_at=datetime.now(timezone.utc),
             )
@@ -207,3 +287,90 @@ class ContentQualityScorer:
         except Exception as e:
             logger.error("Quality scoring failed: %s", e)
             raise
+
+
+class _SharedValidations:
+    """Compliance and brand results shared by batch requests with the same content.
+
+    The first request that needs a result for a content starts the check;
+    other variants await the same task. Results precomputed on any variant
+    are used for the whole group.
+
+    Attributes:
+        _checker: EU Compliance Checker
+        _validator: Brand Voice Validator
+        _compliance: Normalized content -> compliance check (future or task)
+        _brand: Normalized content -> brand validation (future or task)
+    """
+
+    def __init__(
+        self,
+        requests: list[QualityScoreRequest],
+        compliance_checker: object,
+        brand_validator: object,
+    ) -> None:
+        """Seed shared results from precomputed request fields."""
+        self._checker = compliance_checker
+        self._validator = brand_validator
+        self._compliance: dict[str, asyncio.Future] = {}
+        self._brand: dict[str, asyncio.Future] = {}
+        for request in requests:
+            key = _content_key(request.content)
+            if request.compliance_check is not None and key not in self._compliance:
+                self._compliance[key] = _resolved(request.compliance_check)
+            if request.brand_validation is not None and key not in self._brand:
+                self._brand[key] = _resolved(request.brand_validation)
+
+    def compliance_check(self, content: str) -> asyncio.Future:
+        """Shared compliance check of content (started on first request)."""
+        key = _content_key(content)
+        if key not in self._compliance:
+            self._compliance[key] = asyncio.ensure_future(self._checker.check_content(content))
+        return self._compliance[key]
+
+    def brand_validation(self, content: str) -> asyncio.Future:
+        """Shared brand validation of content (started on first request)."""
+        key = _content_key(content)
+        if key not in self._brand:
+            self._brand[key] = asyncio.ensure_future(self._validator.validate_content(content))
+        return self._brand[key]
+
+    def cancel_pending(self) -> None:
+        """Cancel checks still running after the batch ended (on failure)."""
+        for future in (*self._compliance.values(), *self._brand.values()):
+            if not future.done():
+                future.cancel()
+
+
+def _content_key(content: str) -> str:
+    """Key under which variants of the same content share validations."""
+    from teams.dawo.validators.verdict_cache import normalize_content
+
+    return normalize_content(content)
+
+
+def _resolved(value: Any) -> asyncio.Future:
+    """Completed future holding a precomputed value."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+
+@contextmanager
+def _timed(component: str, latencies: dict[str, float]) -> Iterator[None]:
+    """Record the wall time of a block as a component latency."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        latencies[component] = round((time.perf_counter() - start) * 1000, 1)
+
+
+async def _timed_call(
+    component: str,
+    latencies: dict[str, float],
+    awaitable: Awaitable[ComponentScore],
+) -> ComponentScore:
+    """Await a component score, recording its latency."""
+    with _timed(component, latencies):
+        return await awaitable
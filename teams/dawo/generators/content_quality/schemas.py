@@ -181,6 +181,9 @@ class QualityScoreResult:
         platform_optimization: Platform-specific optimization details
         engagement_prediction: Engagement prediction details
         scoring_time_ms: Time taken to calculate scores in milliseconds
+        component_latency_ms: Time taken per component in milliseconds.
+            Components run concurrently, so these overlap and may add up
+            to more than scoring_time_ms.
         recommendations: List of improvement recommendations
         created_at: Result creation timestamp
     """
@@ -191,5 +194,6 @@ class QualityScoreResult:
     platform_optimization: Optional[PlatformOptimizationResult] = None
     engagement_prediction: Optional[EngagementPrediction] = None
     scoring_time_ms: int = 0
+    component_latency_ms: dict[str, float] = field(default_factory=dict)
     recommendations: list[str] = field(default_factory=list)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
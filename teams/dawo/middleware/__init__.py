@@ -7,6 +7,10 @@ Key Components:
 - RetryConfig: Configuration dataclass for retry behavior
 - RetryResult: Result dataclass supporting graceful degradation
 - RetryPipeline: Integrated pipeline (retry + queue + alert)
+- LLMResponseCache: Content-addressed cache for repeated LLM calls
+- PipelineTelemetry: Per-stage timing and external work of pipeline runs
+- PipelineCheckpointStore: Stage outputs that let retried runs resume
+- ProcessBatchExecutor: Worker processes for CPU-bound batch pattern checks
 
 Architecture Compliance:
 - Configuration injected via constructor (Team Builder's responsibility)
@@ -39,6 +43,35 @@ from teams.dawo.middleware.discord_alerts import (
 )
 from teams.dawo.middleware.http_client import RetryableHttpClient
 from teams.dawo.middleware.integration import RetryPipeline
+from teams.dawo.middleware.llm_cache import (
+    LLMResponseCache,
+    LLMCacheBackend,
+    LLMCacheStats,
+    SQLiteLLMCacheBackend,
+    RedisLLMCacheBackend,
+    cached_generate,
+    template_id,
+)
+from teams.dawo.middleware.telemetry import (
+    PipelineTelemetry,
+    PipelineTelemetryStore,
+    PipelineTelemetrySummary,
+    StageMetrics,
+    StageSummary,
+    STREAMED_RESPONSE,
+    get_telemetry_store,
+    telemetry_event_hooks,
+)
+from teams.dawo.middleware.checkpoint import (
+    PipelineCheckpointStore,
+    RunCheckpoint,
+    open_run_checkpoint,
+)
+from teams.dawo.middleware.process_pool import (
+    ProcessBatchExecutor,
+    WorkerSpec,
+    map_batch,
+)
 
 __all__ = [
     # Core retry types
@@ -53,6 +86,31 @@ __all__ = [
     "DiscordAlertManager",
     # Integration pipeline
     "RetryPipeline",
+    # LLM response cache
+    "LLMResponseCache",
+    "LLMCacheBackend",
+    "LLMCacheStats",
+    "SQLiteLLMCacheBackend",
+    "RedisLLMCacheBackend",
+    "cached_generate",
+    "template_id",
+    # Pipeline telemetry
+    "PipelineTelemetry",
+    "PipelineTelemetryStore",
+    "PipelineTelemetrySummary",
+    "StageMetrics",
+    "StageSummary",
+    "STREAMED_RESPONSE",
+    "get_telemetry_store",
+    "telemetry_event_hooks",
+    # Pipeline checkpoints
+    "PipelineCheckpointStore",
+    "RunCheckpoint",
+    "open_run_checkpoint",
+    # Process-pool batch execution
+    "ProcessBatchExecutor",
+    "WorkerSpec",
+    "map_batch",
     # Config loading (Team Builder only)
     "load_retry_config",
     "get_retry_config_for_api",
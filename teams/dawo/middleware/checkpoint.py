@@ -0,0 +1,299 @@
+"""Stage checkpoints so retried pipeline runs resume instead of starting over.
+
+A pipeline run that fails mid-way returns retry_scheduled=True. Without
+checkpoints the retry re-executes every stage from the scan: new API quota
+and new LLM calls for items that were already summarized or validated.
+
+Pipelines route each expensive stage through RunCheckpoint.run(). The
+stage's output is stored in Redis, keyed by pipeline and run id, as soon as
+the stage completes. A retry that passes the same run id to execute() gets
+those outputs back and resumes at the stage that failed:
+- Checkpoints of one run live in a single Redis hash (field per stage)
+- The hash expires after ttl_seconds, so abandoned runs clean themselves up
+- The hash is deleted once a run finishes without scheduling a retry
+
+Outputs are pickled (schema models and dataclasses round-trip unchanged).
+Redis is trusted internal storage here, as it is for ARQ job arguments.
+
+Architecture Compliance:
+- Redis client is injected via constructor (NEVER connect directly)
+- Graceful degradation - checkpoint failures never fail the pipeline
+
+Usage:
+    store = PipelineCheckpointStore(redis_client)  # From Team Builder
+    checkpoint = await open_run_checkpoint(store, "reddit", run_id)
+    harvested = await checkpoint.run("harvest", harvester.harvest, posts)
+    ...
+    return await checkpoint.settle(result)
+"""
+
+import inspect
+import logging
+import pickle
+from typing import Any, Awaitable, Callable, Optional, Protocol, TypeVar, Union
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+# Long enough to outlive the YouTube quota retry (next reset, up to ~24h away)
+DEFAULT_CHECKPOINT_TTL_SECONDS = 48 * 3600
+
+# Redis key namespace: {prefix}:{pipeline}:{run_id}
+CHECKPOINT_KEY_PREFIX = "dawo:pipeline_checkpoint"
+
+ResultT = TypeVar("ResultT")
+
+
+class RetryableResult(Protocol):
+    """Pipeline result fields the checkpoint reads and sets."""
+
+    retry_scheduled: bool
+    run_id: Optional[str]
+
+
+class PipelineCheckpointStore:
+    """Redis store of completed stage outputs per pipeline run.
+
+    Attributes:
+        _redis: Async Redis client (injected)
+        _ttl_seconds: Lifetime of a run's checkpoints
+        _prefix: Key namespace
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        ttl_seconds: int = DEFAULT_CHECKPOINT_TTL_SECONDS,
+        prefix: str = CHECKPOINT_KEY_PREFIX,
+    ) -> None:
+        """Initialize with injected Redis client.
+
+        Args:
+            redis_client: Async Redis client (bytes responses, e.g. ARQ pool)
+            ttl_seconds: Lifetime of a run's checkpoints
+            prefix: Key namespace
+
+        Raises:
+            ValueError: If ttl_seconds is not positive
+        """
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        self._redis = redis_client
+        self._ttl_seconds = ttl_seconds
+        self._prefix = prefix
+
+    def _key(self, pipeline: str, run_id: str) -> str:
+        """Redis hash holding one run's checkpoints."""
+        return f"{self._prefix}:{pipeline}:{run_id}"
+
+    async def load(self, pipeline: str, run_id: str) -> dict[str, Any]:
+        """Completed stage outputs of a run.
+
+        Args:
+            pipeline: Pipeline name
+            run_id: Run id
+
+        Returns:
+            Stage name -> output (empty if none stored or expired)
+        """
+        raw = await self._redis.hgetall(self._key(pipeline, run_id))
+        stages: dict[str, Any] = {}
+        for field, payload in (raw or {}).items():
+            stage = field.decode("utf-8") if isinstance(field, bytes) else field
+            try:
+                stages[stage] = pickle.loads(payload)
+            except Exception as e:
+                # Unreadable entry (e.g. schema changed) - the stage re-runs
+                logger.warning(
+                    "Discarding unreadable %s checkpoint %s/%s: %s",
+                    pipeline, run_id, stage, e,
+                )
+        return stages
+
+    async def save(self, pipeline: str, run_id: str, stage: str, output: Any) -> None:
+        """Store a completed stage's output and refresh the run's TTL.
+
+        Args:
+            pipeline: Pipeline name
+            run_id: Run id
+            stage: Stage name
+            output: Stage output (must be picklable)
+        """
+        key = self._key(pipeline, run_id)
+        await self._redis.hset(key, stage, pickle.dumps(output))
+        await self._redis.expire(key, self._ttl_seconds)
+
+    async def discard(self, pipeline: str, run_id: str, *stages: str) -> None:
+        """Delete some stage outputs of a run.
+
+        Args:
+            pipeline: Pipeline name
+            run_id: Run id
+            *stages: Stage names
+        """
+        await self._redis.hdel(self._key(pipeline, run_id), *stages)
+
+    async def clear(self, pipeline: str, run_id: str) -> None:
+        """Delete all checkpoints of a run.
+
+        Args:
+            pipeline: Pipeline name
+            run_id: Run id
+        """
+        await self._redis.delete(self._key(pipeline, run_id))
+
+
+class RunCheckpoint:
+    """Checkpoints of one pipeline run.
+
+    Created by open_run_checkpoint(). Without a store every stage simply
+    runs, so pipelines use the same code path whether or not checkpointing
+    is configured.
+
+    Attributes:
+        pipeline: Pipeline name
+        run_id: Run id (pass back to execute() to resume)
+        resumed: Stages restored from a previous attempt
+    """
+
+    def __init__(
+        self,
+        store: Optional[PipelineCheckpointStore],
+        pipeline: str,
+        run_id: str,
+        stages: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Initialize with the outputs already stored for the run.
+
+        Args:
+            store: Checkpoint store, or None to disable checkpointing
+            pipeline: Pipeline name
+            run_id: Run id
+            stages: Stage outputs restored from the store
+        """
+        self._store = store
+        self._stages = stages or {}
+        self.pipeline = pipeline
+        self.run_id = run_id
+        self.resumed: list[str] = []
+
+    async def run(
+        self,
+        stage: str,
+        func: Callable[..., Union[ResultT, Awaitable[ResultT]]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ResultT:
+        """Return a stage's stored output, or run it and store the output.
+
+        Args:
+            stage: Stage name (unique within the pipeline)
+            func: Stage callable, sync or async
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Stage output
+        """
+        if stage in self._stages:
+            logger.info(
+                "Resuming %s run %s: reusing %s checkpoint",
+                self.pipeline, self.run_id, stage,
+            )
+            self.resumed.append(stage)
+            return self._stages[stage]
+
+        output = func(*args, **kwargs)
+        if inspect.isawaitable(output):
+            output = await output
+
+        if self._store is not None:
+            try:
+                await self._store.save(self.pipeline, self.run_id, stage, output)
+                self._stages[stage] = output
+            except Exception as e:
+                logger.warning(
+                    "Failed to checkpoint %s stage %s of run %s: %s",
+                    self.pipeline, stage, self.run_id, e,
+                )
+        return output
+
+    async def forget(self, *stages: str) -> None:
+        """Drop stage outputs so a retry runs those stages again.
+
+        For stages that completed but whose output is what the retry
+        should redo, such as a scan that found nothing.
+
+        Args:
+            *stages: Stage names
+        """
+        for stage in stages:
+            self._stages.pop(stage, None)
+        if self._store is not None:
+            try:
+                await self._store.discard(self.pipeline, self.run_id, *stages)
+            except Exception as e:
+                logger.warning(
+                    "Failed to discard %s checkpoints %s of run %s: %s",
+                    self.pipeline, ", ".join(stages), self.run_id, e,
+                )
+
+    async def settle(self, result: RetryableResult) -> RetryableResult:
+        """Stamp the run id on a result and drop checkpoints no retry needs.
+
+        Checkpoints are kept (until their TTL) when the result schedules a
+        retry, so the retry can resume from them.
+
+        Args:
+            result: Pipeline result
+
+        Returns:
+            The same result, with run_id set
+        """
+        result.run_id = self.run_id
+        if self._store is not None and not result.retry_scheduled:
+            try:
+                await self._store.clear(self.pipeline, self.run_id)
+            except Exception as e:
+                logger.warning(
+                    "Failed to clear %s checkpoints of run %s: %s",
+                    self.pipeline, self.run_id, e,
+                )
+        return result
+
+
+async def open_run_checkpoint(
+    store: Optional[PipelineCheckpointStore],
+    pipeline: str,
+    run_id: Optional[str] = None,
+) -> RunCheckpoint:
+    """Open the checkpoints of a run, loading any from a previous attempt.
+
+    Args:
+        store: Checkpoint store, or None to disable checkpointing
+        pipeline: Pipeline name
+        run_id: Run id of the attempt being retried, or None for a new run
+
+    Returns:
+        RunCheckpoint for the run
+    """
+    run_id = run_id or uuid4().hex
+    stages: dict[str, Any] = {}
+    if store is not None:
+        try:
+            stages = await store.load(pipeline, run_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to load %s checkpoints of run %s, starting over: %s",
+                pipeline, run_id, e,
+            )
+    return RunCheckpoint(store, pipeline, run_id, stages)
+
+
+__all__ = [
+    "DEFAULT_CHECKPOINT_TTL_SECONDS",
+    "CHECKPOINT_KEY_PREFIX",
+    "PipelineCheckpointStore",
+    "RunCheckpoint",
+    "open_run_checkpoint",
+]
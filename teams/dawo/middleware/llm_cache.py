@@ -0,0 +1,454 @@
+"""Content-addressed cache for deterministic LLM responses.
+
+Extractor agents (FindingSummarizer, ClaimValidator, ThemeExtractor,
+HealthClaimDetector, KeyInsightExtractor, EUComplianceChecker) build their
+prompts from content that rarely changes between runs - the same PMID
+abstract, the same competitor caption. This module lets them reuse an
+earlier response instead of paying for an identical LLM call.
+
+Cache keys are derived from:
+- Prompt template id (name + hash of the template text, so editing a
+  prompt invalidates its entries automatically)
+- Model tier ("scan", "generate", "strategize")
+- Hash of the normalized template inputs
+
+Backends:
+- SQLiteLLMCacheBackend: Local disk (or ":memory:") store
+- RedisLLMCacheBackend: Shared store for multiple workers
+
+Both expire entries after a TTL and evict least-recently-used entries
+beyond max_entries.
+
+Architecture Compliance:
+- Backend (and its Redis client / path) injected via constructor
+- Cache failures degrade to a plain LLM call - they never stop a pipeline
+- Only responses that parse successfully are stored
+
+Usage:
+    cache = LLMResponseCache(SQLiteLLMCacheBackend("/var/cache/dawo/llm.db"))
+    summarizer = FindingSummarizer(llm_client, response_cache=cache)
+
+    # Inside an agent
+    result = await cached_generate(
+        cache,
+        template=SUMMARY_TEMPLATE_ID,
+        tier=TaskType.GENERATE.value,
+        inputs={"title": title, "abstract": abstract, "max_tokens": 800},
+        generate=lambda: llm.generate(prompt=prompt, max_tokens=800),
+        parse=parse_response,
+    )
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Protocol, TypeVar, runtime_checkable
+
+from teams.dawo.middleware.telemetry import record_llm_call
+
+
+# Module logger
+logger = logging.getLogger(__name__)
+
+# Cache defaults
+DEFAULT_LLM_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # One week
+DEFAULT_LLM_CACHE_MAX_ENTRIES = 10_000
+LLM_CACHE_KEY_PREFIX = "dawo:llm_cache"
+
+# Characters of the template hash kept in template ids
+TEMPLATE_HASH_LENGTH = 12
+
+ResultT = TypeVar("ResultT")
+
+
+def template_id(name: str, *templates: str) -> str:
+    """Build a versioned prompt template id.
+
+    Args:
+        name: Stable template name (e.g., "pubmed.finding_summarization")
+        *templates: Template texts (prompt, system prompt) the id covers
+
+    Returns:
+        "<name>:<hash>" - changes whenever any template text changes
+    """
+    digest = hashlib.sha256("\x00".join(templates).encode("utf-8")).hexdigest()
+    return f"{name}:{digest[:TEMPLATE_HASH_LENGTH]}"
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize template inputs so trivially different text shares a key.
+
+    Strings are NFC-normalized with whitespace runs collapsed; containers
+    are normalized recursively.
+    """
+    if isinstance(value, str):
+        return " ".join(unicodedata.normalize("NFC", value).split())
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+@runtime_checkable
+class LLMCacheBackend(Protocol):
+    """Protocol for LLM response cache storage backends."""
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None if missing or expired."""
+        ...
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store a response with a time-to-live."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove a cached response."""
+        ...
+
+
+class SQLiteLLMCacheBackend:
+    """Local SQLite cache backend with TTL and LRU eviction.
+
+    Runs SQLite calls in a worker thread so the event loop is not blocked.
+
+    Attributes:
+        _max_entries: Entries kept before least-recently-used eviction
+        _conn: SQLite connection (shared across worker threads)
+        _lock: Serializes access to the connection
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        max_entries: int = DEFAULT_LLM_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Database file path, or ":memory:" for a process-local cache
+            max_entries: Maximum entries kept (LRU eviction beyond this)
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed_at "
+                "ON llm_cache (accessed_at)"
+            )
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response and mark it recently used."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store a response, then evict expired and excess entries."""
+        await asyncio.to_thread(self._set, key, value, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        """Remove a cached response."""
+        await asyncio.to_thread(self._delete, key)
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _get(self, key: str) -> Optional[str]:
+        """Blocking get; runs in a worker thread."""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+            return row[0]
+
+    def _set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Blocking set with eviction; runs in a worker thread."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl_seconds, now),
+            )
+            self._conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            excess = count - self._max_entries
+            if excess > 0:
+                self._conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN ("
+                    " SELECT key FROM llm_cache ORDER BY accessed_at ASC, rowid ASC LIMIT ?)",
+                    (excess,),
+                )
+
+    def _delete(self, key: str) -> None:
+        """Blocking delete; runs in a worker thread."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+
+
+class RedisLLMCacheBackend:
+    """Redis cache backend shared by all workers.
+
+    Entries expire via Redis TTLs. A sorted set indexes keys by last access
+    time so the cache can be held to max_entries with LRU eviction.
+
+    Attributes:
+        _redis: Async Redis client (injected)
+        _max_entries: Entries kept before least-recently-used eviction
+        _prefix: Key namespace
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        max_entries: int = DEFAULT_LLM_CACHE_MAX_ENTRIES,
+        prefix: str = LLM_CACHE_KEY_PREFIX,
+    ) -> None:
+        """Initialize with injected Redis client.
+
+        Args:
+            redis_client: Async Redis client
+            max_entries: Maximum entries kept (LRU eviction beyond this)
+            prefix: Key namespace for entries and the LRU index
+        """
+        self._redis = redis_client
+        self._max_entries = max_entries
+        self._prefix = prefix
+
+    @property
+    def _index_key(self) -> str:
+        """Sorted set of keys scored by last access time."""
+        return f"{self._prefix}:lru"
+
+    def _entry_key(self, key: str) -> str:
+        """Redis key holding one cached response."""
+        return f"{self._prefix}:{key}"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response and mark it recently used."""
+        value = await self._redis.get(self._entry_key(key))
+        if value is None:
+            # Expired by TTL - drop it from the LRU index too
+            await self._redis.zrem(self._index_key, key)
+            return None
+        await self._redis.zadd(self._index_key, {key: time.time()})
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value: str, ttl_seconds: int) -> None:
+        """Store a response, then evict least-recently-used overflow."""
+        await self._redis.set(self._entry_key(key), value, ex=ttl_seconds)
+        await self._redis.zadd(self._index_key, {key: time.time()})
+
+        excess = await self._redis.zcard(self._index_key) - self._max_entries
+        if excess > 0:
+            evicted = await self._redis.zpopmin(self._index_key, excess)
+            if evicted:
+                await self._redis.delete(
+                    *(self._entry_key(self._member(member)) for member, _ in evicted)
+                )
+
+    async def delete(self, key: str) -> None:
+        """Remove a cached response."""
+        await self._redis.delete(self._entry_key(key))
+        await self._redis.zrem(self._index_key, key)
+
+    @staticmethod
+    def _member(member: Any) -> str:
+        """Decode a sorted set member returned as bytes."""
+        return member.decode("utf-8") if isinstance(member, bytes) else member
+
+
+@dataclass
+class LLMCacheStats:
+    """Hit/miss counters for an LLMResponseCache.
+
+    Attributes:
+        hits: Calls answered from the cache
+        misses: Calls that went to the LLM
+        writes: Responses stored after a miss
+        errors: Backend failures (treated as misses)
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 if none)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LLMResponseCache:
+    """Content-addressed LLM response cache.
+
+    Wraps a storage backend with key derivation, TTL, and hit/miss
+    counters. Only responses that the caller's parser accepts are stored,
+    so a malformed response is never replayed.
+
+    Attributes:
+        stats: Hit/miss counters
+        _backend: Storage backend (injected)
+        _ttl_seconds: Time-to-live for stored responses
+    """
+
+    def __init__(
+        self,
+        backend: LLMCacheBackend,
+        ttl_seconds: int = DEFAULT_LLM_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Initialize with injected backend.
+
+        Args:
+            backend: SQLiteLLMCacheBackend, RedisLLMCacheBackend, or compatible
+            ttl_seconds: Time-to-live for stored responses
+        """
+        self._backend = backend
+        self._ttl_seconds = ttl_seconds
+        self.stats = LLMCacheStats()
+
+    @staticmethod
+    def make_key(template: str, tier: str, inputs: dict[str, Any]) -> str:
+        """Derive the cache key for one LLM call.
+
+        Args:
+            template: Versioned template id from template_id()
+            tier: Model tier the agent runs on
+            inputs: Values substituted into the template, plus any call
+                options (max_tokens, ...) that affect the response
+
+        Returns:
+            "<template>:<tier>:<sha256 of normalized inputs>"
+        """
+        payload = json.dumps(_normalize(inputs), sort_keys=True, ensure_ascii=False, default=str)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{template}:{tier}:{digest}"
+
+    async def get_or_generate(
+        self,
+        template: str,
+        tier: str,
+        inputs: dict[str, Any],
+        generate: Callable[[], Awaitable[str]],
+        parse: Callable[[str], ResultT],
+    ) -> ResultT:
+        """Return the parsed response, calling the LLM only on a miss.
+
+        Args:
+            template: Versioned template id from template_id()
+            tier: Model tier the agent runs on
+            inputs: Template inputs and call options
+            generate: Makes the LLM call and returns the raw response
+            parse: Converts a raw response to the agent's result; its
+                exceptions propagate and the response is not stored
+
+        Returns:
+            Parsed result
+        """
+        key = self.make_key(template, tier, inputs)
+
+        cached = await self._safe_get(key)
+        if cached is not None:
+            try:
+                result = parse(cached)
+            except Exception as e:
+                # Unreadable entry (e.g. parser changed) - drop and regenerate
+                logger.warning("Discarding unparseable LLM cache entry %s: %s", key, e)
+                await self._safe_delete(key)
+            else:
+                self.stats.hits += 1
+                logger.debug("LLM cache hit: %s", template)
+                return result
+
+        self.stats.misses += 1
+        response = await generate()
+        result = parse(response)
+        await self._safe_set(key, response)
+        return result
+
+    async def _safe_get(self, key: str) -> Optional[str]:
+        """Backend get that treats failures as a miss."""
+        try:
+            return await self._backend.get(key)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning("LLM cache read failed, calling LLM: %s", e)
+            return None
+
+    async def _safe_set(self, key: str, value: str) -> None:
+        """Backend set that logs and counts failures."""
+        try:
+            await self._backend.set(key, value, self._ttl_seconds)
+            self.stats.writes += 1
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning("LLM cache write failed: %s", e)
+
+    async def _safe_delete(self, key: str) -> None:
+        """Backend delete that logs and counts failures."""
+        try:
+            await self._backend.delete(key)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning("LLM cache delete failed: %s", e)
+
+
+async def cached_generate(
+    cache: Optional[LLMResponseCache],
+    template: str,
+    tier: str,
+    inputs: dict[str, Any],
+    generate: Callable[[], Awaitable[str]],
+    parse: Callable[[str], ResultT],
+) -> ResultT:
+    """Call the LLM through the cache when one is configured.
+
+    Lets agents accept an optional cache without branching at every call.
+
+    Args:
+        cache: Injected cache, or None to always call the LLM
+        template: Versioned template id from template_id()
+        tier: Model tier the agent runs on
+        inputs: Template inputs and call options
+        generate: Makes the LLM call and returns the raw response
+        parse: Converts a raw response to the agent's result
+
+    Returns:
+        Parsed result
+    """
+    async def counted() -> str:
+        record_llm_call()
+        return await generate()
+
+    if cache is None:
+        return parse(await counted())
+    return await cache.get_or_generate(template, tier, inputs, counted, parse)
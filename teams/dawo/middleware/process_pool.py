@@ -0,0 +1,271 @@
+"""Process-pool execution of CPU-bound pattern checks over large batches.
+
+The pattern paths of EUComplianceChecker, BrandVoiceValidator,
+NewsCategorizer and ResearchItemScorer are pure CPU work. Run on the event
+loop, a multi-thousand item backfill blocks the loop that also serves API
+requests and ARQ heartbeats. ProcessBatchExecutor ships chunks of items to
+worker processes instead and returns results in input order:
+- One shared pool, capped at cores - 1 processes, serves every component
+- Each worker process builds a component the first time a chunk for its
+  picklable WorkerSpec arrives and keeps it, keyed by the spec - rules are
+  compiled once per worker, not per chunk
+- Chunks amortize inter-process pickling over many items
+- In-flight chunks are bounded, so huge batches are not all queued at once
+- A broken pool is dropped and rebuilt on the next call
+
+Components accept an optional injected executor. Without one, map_batch()
+runs the same method inline and yields to the event loop between chunks.
+
+Architecture Compliance:
+- Executor is injected via constructor (Team Builder decides which
+  components get one - typically backfill jobs, not request handlers)
+- Workers are rebuilt from configuration, never from the parent's clients
+
+Usage:
+    executor = ProcessBatchExecutor(max_workers=4)  # From Team Builder
+    checker = EUComplianceChecker(rules, batch_executor=executor)
+    checks = await checker.check_patterns_batch(captions)
+    executor.shutdown()
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Protocol, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Items sent to a worker per task
+DEFAULT_CHUNK_SIZE = 200
+
+# Items checked inline between yields to the event loop (no executor)
+INLINE_CHUNK_SIZE = 50
+
+# Fresh interpreters - forking a process with a running event loop and
+# client threads is not safe
+DEFAULT_START_METHOD = "spawn"
+
+# Chunks queued per worker process
+_CHUNKS_PER_WORKER = 2
+
+# Components a worker process keeps built (least recently used dropped)
+_WORKER_CACHE_SIZE = 8
+
+
+def default_max_workers() -> int:
+    """One worker per core, minus one left for the event loop process."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+@dataclass(frozen=True)
+class WorkerSpec:
+    """Recipe for rebuilding a component inside a worker process.
+
+    Attributes:
+        factory: Importable callable (usually the component class)
+        args: Picklable positional arguments (configuration only, no clients)
+    """
+
+    factory: Callable[..., Any]
+    args: tuple[Any, ...] = ()
+
+    def build(self) -> Any:
+        """Construct the component."""
+        return self.factory(*self.args)
+
+    def key(self) -> str:
+        """Stable identity of the spec (same factory and config)."""
+        payload = pickle.dumps((self.factory, self.args))
+        return hashlib.sha256(payload).hexdigest()
+
+
+class BatchWorker(Protocol):
+    """Component that can be rebuilt in a worker process."""
+
+    def worker_spec(self) -> WorkerSpec:
+        """WorkerSpec that rebuilds this component's pattern-only path."""
+        ...
+
+
+# Components built in this worker process, by WorkerSpec key
+_workers: OrderedDict[str, Any] = OrderedDict()
+
+
+def _run_chunk(key: str, spec: WorkerSpec, method: str, chunk: list[Any]) -> list[Any]:
+    """Run the spec's component method on every item of a chunk.
+
+    The component is built on the worker's first chunk for the spec and
+    reused by later chunks and batches.
+    """
+    worker = _workers.get(key)
+    if worker is None:
+        worker = _workers[key] = spec.build()
+        while len(_workers) > _WORKER_CACHE_SIZE:
+            _workers.popitem(last=False)
+    else:
+        _workers.move_to_end(key)
+    call = getattr(worker, method)
+    return [call(item) for item in chunk]
+
+
+class ProcessBatchExecutor:
+    """Runs batch pattern checks on one shared pool of worker processes.
+
+    Attributes:
+        _max_workers: Processes in the pool
+        _chunk_size: Items per task
+        _start_method: multiprocessing start method
+        _pool: Shared pool, started on first use
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        start_method: str = DEFAULT_START_METHOD,
+    ) -> None:
+        """Initialize the executor (the pool starts on first use).
+
+        Args:
+            max_workers: Processes in the pool (default and cap: cores - 1)
+            chunk_size: Items sent to a worker per task
+            start_method: multiprocessing start method
+
+        Raises:
+            ValueError: If max_workers or chunk_size is not positive
+        """
+        max_workers = max_workers if max_workers is not None else default_max_workers()
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self._max_workers = min(max_workers, default_max_workers())
+        self._chunk_size = chunk_size
+        self._start_method = start_method
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    async def map(self, spec: WorkerSpec, method: str, items: Sequence[Any]) -> list[Any]:
+        """Run spec's component method on every item in worker processes.
+
+        Args:
+            spec: Component to run (built once per worker process)
+            method: Name of a one-argument method of the component
+            items: Picklable items
+
+        Returns:
+            Method results, in input order
+
+        Raises:
+            BrokenProcessPool: If a worker died (the pool is rebuilt next call)
+            Exception: Any exception raised by the method for an item
+        """
+        if not items:
+            return []
+
+        key = spec.key()
+        pool = self._ensure_pool()
+        loop = asyncio.get_running_loop()
+        # Bound queued chunks so a huge batch is not pickled all at once
+        slots = asyncio.Semaphore(self._max_workers * _CHUNKS_PER_WORKER)
+
+        async def run(chunk: list[Any]) -> list[Any]:
+            async with slots:
+                return await loop.run_in_executor(pool, _run_chunk, key, spec, method, chunk)
+
+        chunks = [
+            list(items[start:start + self._chunk_size])
+            for start in range(0, len(items), self._chunk_size)
+        ]
+        try:
+            chunk_results = await asyncio.gather(*(run(chunk) for chunk in chunks))
+        except BrokenProcessPool:
+            logger.error("Worker pool broke running %s, dropping it", spec.factory.__name__)
+            self._discard(pool)
+            raise
+
+        logger.debug(
+            "Ran %s.%s on %d items in %d chunks",
+            spec.factory.__name__, method, len(items), len(chunks),
+        )
+        return [result for chunk in chunk_results for result in chunk]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop every worker process."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self) -> "ProcessBatchExecutor":
+        """Use as an async context manager (shuts down on exit)."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Stop worker processes without blocking the event loop."""
+        await asyncio.to_thread(self.shutdown)
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        """Shared pool, started on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context(self._start_method),
+            )
+            logger.info("Started %d worker processes", self._max_workers)
+        return self._pool
+
+    def _discard(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken pool so the next call starts a fresh one."""
+        if self._pool is pool:
+            self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def map_batch(
+    executor: Optional[ProcessBatchExecutor],
+    worker: BatchWorker,
+    method: str,
+    items: Sequence[Any],
+) -> list[Any]:
+    """Run a component's method over items, in worker processes if configured.
+
+    Lets components accept an optional executor without branching at every
+    batch API.
+
+    Args:
+        executor: Injected executor, or None to run inline
+        worker: Component providing the method and its WorkerSpec
+        method: Name of a one-argument method of the component
+        items: Items (picklable when an executor is used)
+
+    Returns:
+        Method results, in input order
+    """
+    if executor is not None:
+        return await executor.map(worker.worker_spec(), method, items)
+
+    call = getattr(worker, method)
+    results: list[Any] = []
+    for start in range(0, len(items), INLINE_CHUNK_SIZE):
+        results.extend(call(item) for item in items[start:start + INLINE_CHUNK_SIZE])
+        # Let other tasks run between chunks
+        await asyncio.sleep(0)
+    return results
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_START_METHOD",
+    "INLINE_CHUNK_SIZE",
+    "BatchWorker",
+    "ProcessBatchExecutor",
+    "WorkerSpec",
+    "default_max_workers",
+    "map_batch",
+]
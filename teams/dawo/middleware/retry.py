@@ -21,6 +21,8 @@ from typing import Any, Callable, Optional
 
 import httpx
 
+from teams.dawo.middleware.telemetry import record_retry
+
 logger = logging.getLogger(__name__)
 
 # HTTP status codes that warrant retry
@@ -279,6 +281,8 @@ class RetryMiddleware:
 
         while attempt < self._config.max_retries:
             total_calls += 1
+            if total_calls > 1:
+                record_retry()
 
             try:
                 response = await operation()
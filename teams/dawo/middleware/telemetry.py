@@ -0,0 +1,416 @@
+"""Per-stage timing and throughput telemetry for scanner pipelines.
+
+PipelineStatistics only counts items, so a slow run cannot show whether
+scan, harvest, the LLM stages or publish is responsible. Pipelines wrap
+each stage in PipelineTelemetry.stage(), which records:
+- Wall time and items in/out (items/sec)
+- External HTTP calls and bytes transferred
+- LLM calls (cache misses only)
+- Retries made by RetryMiddleware
+
+The active stage is held in a ContextVar, so tasks a stage spawns
+(asyncio.gather, asyncio.to_thread) report into it too. The shared layers
+report without knowing about pipelines:
+- httpx clients built with telemetry_event_hooks(): calls and bytes
+  (streamed requests tagged with STREAMED_RESPONSE report themselves)
+- RetryMiddleware.execute_with_retry(): retries
+- cached_generate(): LLM calls
+Outside a stage every report is a no-op.
+
+Finished runs are appended to PipelineTelemetryStore, a rolling in-memory
+history per pipeline, served by the /api/telemetry endpoints.
+
+Architecture Compliance:
+- Thread-safe store with a bounded window per pipeline
+- Store injected into pipelines (defaults to the global singleton)
+
+Usage:
+    telemetry = PipelineTelemetry(pipeline="reddit")
+    with telemetry.stage("harvest", items_in=len(posts)) as stage:
+        harvested = await harvester.harvest(posts)
+        stage.items_out = len(harvested)
+    get_telemetry_store().record(telemetry.finish())
+"""
+
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Runs kept per pipeline (5 scanners x 4 runs/day ~ 7 weeks each)
+DEFAULT_TELEMETRY_HISTORY = 200
+
+# Request extension marking a streamed response: the httpx hook leaves its
+# body to the caller, which reports it with record_call() once consumed
+STREAMED_RESPONSE = "dawo_streamed_response"
+
+# Stage currently running in this task, if any
+_current_stage: ContextVar[Optional["StageMetrics"]] = ContextVar(
+    "dawo_pipeline_stage", default=None
+)
+
+
+@dataclass
+class StageMetrics:
+    """Timing and external work of one pipeline stage.
+
+    Attributes:
+        name: Stage name (scan, harvest, transform, ...)
+        wall_seconds: Wall time spent in the stage
+        items_in: Items handed to the stage
+        items_out: Items the stage produced
+        external_calls: HTTP requests sent (including retries)
+        llm_calls: LLM calls made (cache hits excluded)
+        retries: Repeated attempts made by the retry middleware
+        bytes_transferred: Request plus response bytes on the wire
+    """
+
+    name: str
+    wall_seconds: float = 0.0
+    items_in: int = 0
+    items_out: int = 0
+    external_calls: int = 0
+    llm_calls: int = 0
+    retries: int = 0
+    bytes_transferred: int = 0
+
+    @property
+    def items_per_second(self) -> float:
+        """Items produced per second of wall time."""
+        if self.wall_seconds <= 0:
+            return 0.0
+        return self.items_out / self.wall_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form, including items_per_second."""
+        return {**asdict(self), "items_per_second": round(self.items_per_second, 3)}
+
+
+@dataclass
+class PipelineTelemetry:
+    """Stage metrics of one pipeline run.
+
+    Attributes:
+        pipeline: Pipeline name (reddit, youtube, instagram, news, pubmed)
+        started_at: When the run started
+        total_seconds: Wall time of the run, set by finish()
+        stages: Stage metrics in execution order
+    """
+
+    pipeline: str
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    total_seconds: float = 0.0
+    stages: list[StageMetrics] = field(default_factory=list)
+    _started: float = field(
+        default_factory=time.perf_counter, init=False, repr=False, compare=False
+    )
+
+    @contextmanager
+    def stage(self, name: str, items_in: int = 0) -> Iterator[StageMetrics]:
+        """Time a stage and collect the external work done inside it.
+
+        Args:
+            name: Stage name
+            items_in: Items handed to the stage
+
+        Yields:
+            StageMetrics for the stage; set items_out before leaving
+        """
+        metrics = StageMetrics(name=name, items_in=items_in)
+        self.stages.append(metrics)
+        token = _current_stage.set(metrics)
+        started = time.perf_counter()
+        try:
+            yield metrics
+        finally:
+            metrics.wall_seconds = time.perf_counter() - started
+            _current_stage.reset(token)
+
+    def get_stage(self, name: str) -> Optional[StageMetrics]:
+        """Metrics of a stage by name, or None if it did not run."""
+        return next((stage for stage in self.stages if stage.name == name), None)
+
+    def finish(self) -> "PipelineTelemetry":
+        """Record the run's total wall time.
+
+        Returns:
+            Self, for chaining into PipelineTelemetryStore.record()
+        """
+        self.total_seconds = time.perf_counter() - self._started
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form."""
+        return {
+            "pipeline": self.pipeline,
+            "started_at": self.started_at.isoformat(),
+            "total_seconds": round(self.total_seconds, 4),
+            "stages": [stage.to_dict() for stage in self.stages],
+        }
+
+
+# =============================================================================
+# Reporting hooks (no-ops outside a stage)
+# =============================================================================
+
+def current_stage() -> Optional[StageMetrics]:
+    """Stage running in this task, or None."""
+    return _current_stage.get()
+
+
+def record_call(bytes_transferred: int = 0) -> None:
+    """Count one external request and its bytes against the current stage."""
+    stage = _current_stage.get()
+    if stage is not None:
+        stage.external_calls += 1
+        stage.bytes_transferred += bytes_transferred
+
+
+def record_retry() -> None:
+    """Count one repeated attempt against the current stage."""
+    stage = _current_stage.get()
+    if stage is not None:
+        stage.retries += 1
+
+
+def record_llm_call() -> None:
+    """Count one LLM call against the current stage."""
+    stage = _current_stage.get()
+    if stage is not None:
+        stage.llm_calls += 1
+
+
+async def _record_httpx_response(response: "httpx.Response") -> None:
+    """httpx response hook: count the exchange and its wire bytes."""
+    if _current_stage.get() is None:
+        return
+    if response.request.extensions.get(STREAMED_RESPONSE):
+        return
+    # Body is read here instead of by the caller
+    await response.aread()
+    sent = int(response.request.headers.get("content-length", 0))
+    record_call(sent + response.num_bytes_downloaded)
+
+
+def telemetry_event_hooks() -> dict[str, list[Any]]:
+    """Event hooks reporting an httpx.AsyncClient's traffic to telemetry.
+
+    Streamed requests must be sent with extensions={STREAMED_RESPONSE: True}
+    and reported by the caller, or the hook would buffer the whole body.
+
+    Usage:
+        httpx.AsyncClient(timeout=30.0, event_hooks=telemetry_event_hooks())
+    """
+    return {"response": [_record_httpx_response]}
+
+
+# =============================================================================
+# Rolling history
+# =============================================================================
+
+@dataclass
+class StageSummary:
+    """Stage averages over a pipeline's recorded runs.
+
+    Attributes:
+        name: Stage name
+        runs: Runs in which the stage executed
+        avg_wall_seconds: Mean stage wall time
+        max_wall_seconds: Slowest stage wall time
+        avg_items_per_second: Mean throughput
+        avg_external_calls: Mean HTTP requests
+        avg_llm_calls: Mean LLM calls
+        avg_retries: Mean retries
+        avg_bytes_transferred: Mean bytes on the wire
+    """
+
+    name: str
+    runs: int = 0
+    avg_wall_seconds: float = 0.0
+    max_wall_seconds: float = 0.0
+    avg_items_per_second: float = 0.0
+    avg_external_calls: float = 0.0
+    avg_llm_calls: float = 0.0
+    avg_retries: float = 0.0
+    avg_bytes_transferred: float = 0.0
+
+
+@dataclass
+class PipelineTelemetrySummary:
+    """Aggregate of a pipeline's recorded runs.
+
+    Attributes:
+        pipeline: Pipeline name
+        runs: Runs in the window
+        last_run_at: Start of the most recent run
+        avg_total_seconds: Mean run wall time
+        max_total_seconds: Slowest run wall time
+        stages: Per-stage averages in execution order
+    """
+
+    pipeline: str
+    runs: int = 0
+    last_run_at: Optional[datetime] = None
+    avg_total_seconds: float = 0.0
+    max_total_seconds: float = 0.0
+    stages: list[StageSummary] = field(default_factory=list)
+
+
+def _mean(values: list[float]) -> float:
+    return round(sum(values) / len(values), 4) if values else 0.0
+
+
+class PipelineTelemetryStore:
+    """Rolling history of pipeline runs, per pipeline.
+
+    Thread-safe; keeps the most recent window_size runs of each pipeline.
+    """
+
+    def __init__(self, window_size: int = DEFAULT_TELEMETRY_HISTORY) -> None:
+        """Initialize an empty store.
+
+        Args:
+            window_size: Runs kept per pipeline
+
+        Raises:
+            ValueError: If window_size is not positive
+        """
+        if window_size <= 0:
+            raise ValueError(f"window_size must be positive, got {window_size}")
+        self._window_size = window_size
+        self._lock = Lock()
+        self._runs: dict[str, deque[PipelineTelemetry]] = {}
+
+    def record(self, telemetry: PipelineTelemetry) -> None:
+        """Append a finished run to its pipeline's history.
+
+        Args:
+            telemetry: Finished run telemetry
+        """
+        with self._lock:
+            runs = self._runs.setdefault(
+                telemetry.pipeline, deque(maxlen=self._window_size)
+            )
+            runs.append(telemetry)
+
+        logger.debug(
+            "Recorded %s pipeline telemetry: %.2fs, %s",
+            telemetry.pipeline,
+            telemetry.total_seconds,
+            ", ".join(f"{s.name}={s.wall_seconds:.2f}s" for s in telemetry.stages),
+        )
+
+    def pipelines(self) -> list[str]:
+        """Names of pipelines with recorded runs."""
+        with self._lock:
+            return sorted(self._runs)
+
+    def get_history(self, pipeline: str, limit: Optional[int] = None) -> list[PipelineTelemetry]:
+        """Recorded runs of a pipeline, newest first.
+
+        Args:
+            pipeline: Pipeline name
+            limit: Maximum runs to return (None = whole window)
+
+        Returns:
+            Runs, newest first (empty if none recorded)
+        """
+        with self._lock:
+            runs = list(reversed(self._runs.get(pipeline, ())))
+        return runs[:limit] if limit is not None else runs
+
+    def summarize(self, pipeline: str) -> PipelineTelemetrySummary:
+        """Average each stage over a pipeline's recorded runs.
+
+        Args:
+            pipeline: Pipeline name
+
+        Returns:
+            PipelineTelemetrySummary (runs=0 if none recorded)
+        """
+        runs = self.get_history(pipeline)
+        if not runs:
+            return PipelineTelemetrySummary(pipeline=pipeline)
+
+        by_stage: dict[str, list[StageMetrics]] = {}
+        for run in reversed(runs):  # Oldest first keeps execution order
+            for stage in run.stages:
+                by_stage.setdefault(stage.name, []).append(stage)
+
+        stages = [
+            StageSummary(
+                name=name,
+                runs=len(samples),
+                avg_wall_seconds=_mean([s.wall_seconds for s in samples]),
+                max_wall_seconds=round(max(s.wall_seconds for s in samples), 4),
+                avg_items_per_second=_mean([s.items_per_second for s in samples]),
+                avg_external_calls=_mean([s.external_calls for s in samples]),
+                avg_llm_calls=_mean([s.llm_calls for s in samples]),
+                avg_retries=_mean([s.retries for s in samples]),
+                avg_bytes_transferred=_mean([s.bytes_transferred for s in samples]),
+            )
+            for name, samples in by_stage.items()
+        ]
+        return PipelineTelemetrySummary(
+            pipeline=pipeline,
+            runs=len(runs),
+            last_run_at=runs[0].started_at,
+            avg_total_seconds=_mean([run.total_seconds for run in runs]),
+            max_total_seconds=round(max(run.total_seconds for run in runs), 4),
+            stages=stages,
+        )
+
+    def reset(self) -> None:
+        """Drop all recorded runs.
+
+        Primarily for testing purposes.
+        """
+        with self._lock:
+            self._runs.clear()
+
+
+# Singleton instance for global access
+_telemetry_store: Optional[PipelineTelemetryStore] = None
+_telemetry_lock = Lock()
+
+
+def get_telemetry_store() -> PipelineTelemetryStore:
+    """Get the global pipeline telemetry store.
+
+    Thread-safe singleton accessor.
+
+    Returns:
+        PipelineTelemetryStore singleton instance
+    """
+    global _telemetry_store
+    if _telemetry_store is None:
+        with _telemetry_lock:
+            if _telemetry_store is None:
+                _telemetry_store = PipelineTelemetryStore()
+    return _telemetry_store
+
+
+__all__ = [
+    "DEFAULT_TELEMETRY_HISTORY",
+    "StageMetrics",
+    "PipelineTelemetry",
+    "StageSummary",
+    "PipelineTelemetrySummary",
+    "PipelineTelemetryStore",
+    "get_telemetry_store",
+    "current_stage",
+    "record_call",
+    "record_retry",
+    "record_llm_call",
+    "telemetry_event_hooks",
+]
@@ -9,7 +9,9 @@ Components:
     - ComplianceStatus: Enum for EU compliance check status
     - ResearchPoolRepository: Async repository for CRUD operations
     - ResearchQueryFilters: Dataclass for query filtering
+    - BulkUpsertResult: Inserted/updated counts from idempotent batch ingestion
     - ResearchPublisher: Service for publishing research items
+    - SeenItemStore: Cross-run seen-set scanners consult after discovery
 
 Usage:
     from teams.dawo.research import (
@@ -32,8 +34,9 @@ Usage:
 from .models import ResearchItem, ResearchSource, ComplianceStatus
 from .schemas import ResearchItemCreate, ResearchItemUpdate
 from .exceptions import ResearchPoolError, ItemNotFoundError, DatabaseError, ValidationError
-from .repository import ResearchPoolRepository, ResearchQueryFilters
+from .repository import ResearchPoolRepository, ResearchQueryFilters, BulkUpsertResult
 from .publisher import ResearchPublisher, TransformedResearch
+from .seen_store import SeenItemStore, SeenStoreStats
 
 __all__ = [
     # Models
@@ -52,6 +55,10 @@ __all__ = [
     # Repository
     "ResearchPoolRepository",
     "ResearchQueryFilters",
+    "BulkUpsertResult",
     # Publisher
     "ResearchPublisher",
+    # Seen-item store
+    "SeenItemStore",
+    "SeenStoreStats",
 ]
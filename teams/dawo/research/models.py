@@ -14,6 +14,7 @@ Database Schema (PostgreSQL):
     - research_items table with performance indexes
     - GIN indexes for tags and full-text search
     - B-tree indexes for source, score, created_at, compliance_status
+    - Unique index on (source, source_key) for idempotent bulk upserts
 """
 
 from datetime import datetime
@@ -75,6 +76,7 @@ MAX_TITLE_LENGTH = 500
 MAX_URL_LENGTH = 2048
 MAX_TAG_LENGTH = 100
 MAX_SOURCE_LENGTH = 20
+MAX_SOURCE_KEY_LENGTH = 255
 MAX_COMPLIANCE_LENGTH = 20
 
 
@@ -93,6 +95,8 @@ class ResearchItem(Base):
         title: Headline or summary of the research
         content: Full text or transcript excerpt
         url: Source link for reference
+        source_key: Stable per-source identifier (post id, video id, PMID, URL)
+                    used for idempotent upserts; unique together with source
         tags: Topic/theme tags for categorization
         source_metadata: Source-specific data (JSONB for flexibility)
         created_at: Timestamp when item was discovered
@@ -133,6 +137,13 @@ class ResearchItem(Base):
         nullable=False,
     )
 
+    # Stable source identifier for idempotent re-ingestion
+    # Unique per source: (source, source_key) is the upsert conflict target
+    source_key: Mapped[Optional[str]] = mapped_column(
+        String(MAX_SOURCE_KEY_LENGTH),
+        nullable=True,
+    )
+
     # Categorization
     tags: Mapped[list[str]] = mapped_column(
         ARRAY(String(MAX_TAG_LENGTH)),
@@ -177,6 +188,13 @@ class ResearchItem(Base):
     __table_args__ = (
         # Score DESC for top-content queries
         Index("idx_research_items_score", score.desc()),
+        # Composite keyset index for cursor pagination in score order
+        Index(
+            "idx_research_items_score_keyset",
+            score.desc(),
+            created_at.desc(),
+            id.desc(),
+        ),
         # Created at DESC for recent-first queries
         Index("idx_research_items_created_at", created_at.desc()),
         # Compliance status for filtering
@@ -185,6 +203,13 @@ class ResearchItem(Base):
         Index("idx_research_items_tags", tags, postgresql_using="gin"),
         # GIN index on search_vector for full-text search
         Index("idx_research_items_search", search_vector, postgresql_using="gin"),
+        # Unique source identity - conflict target for bulk_upsert
+        Index(
+            "uq_research_items_source_key",
+            source,
+            source_key,
+            unique=True,
+        ),
     )
 
     def __repr__(self) -> str:
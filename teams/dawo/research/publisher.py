@@ -29,14 +29,20 @@ import re
 
 from pydantic import BaseModel, Field, field_validator
 
-from .models import ResearchSource, ComplianceStatus, MAX_SCORE, MIN_SCORE
+from .models import (
+    ResearchSource,
+    ComplianceStatus,
+    MAX_SCORE,
+    MIN_SCORE,
+    MAX_SOURCE_KEY_LENGTH,
+)
 from .schemas import ResearchItemCreate
 
 # URL validation pattern - must start with http:// or https://
 URL_PATTERN = re.compile(r"^https?://\S+$")
 
 if TYPE_CHECKING:
-    from .repository import ResearchPoolRepository
+    from .repository import ResearchPoolRepository, BulkUpsertResult
     from .models import ResearchItem
 
 # Module logger
@@ -77,6 +83,11 @@ class TransformedResearch(BaseModel):
         max_length=2048,
         description="Source URL for reference",
     )
+    source_key: Optional[str] = Field(
+        default=None,
+        max_length=MAX_SOURCE_KEY_LENGTH,
+        description="Stable source identifier (post id, video id, PMID); defaults to url",
+    )
     tags: list[str] = Field(
         default_factory=list,
         description="Topic/theme tags for categorization",
@@ -172,6 +183,7 @@ class ResearchPublisher:
             title=item.title,
             content=item.content,
             url=item.url,
+            source_key=item.source_key,
             tags=item.tags,
             source_metadata=item.source_metadata,
             score=item.score,
@@ -193,13 +205,34 @@ class ResearchPublisher:
     async def publish_batch(self, items: list[TransformedResearch]) -> int:
         """Publish multiple research items in a batch.
 
-        More efficient than calling publish() in a loop for large batches.
+        Idempotent: items already in the pool (same source and source_key)
+        are updated in place rather than duplicated, so re-running a
+        scanner pipeline is safe.
+
+        Args:
+            items: List of transformed research items
+
+        Returns:
+            Number of items written (inserted + updated)
+
+        Raises:
+            ValidationError: If any item validation fails
+            DatabaseError: If persistence fails
+        """
+        result = await self.upsert_batch(items)
+        return result.total
+
+    async def upsert_batch(
+        self,
+        items: list[TransformedResearch],
+    ) -> "BulkUpsertResult":
+        """Upsert multiple research items and report inserted vs. updated.
 
         Args:
             items: List of transformed research items
 
         Returns:
-            Number of items successfully published
+            BulkUpsertResult with inserted and updated counts
 
         Raises:
             ValidationError: If any item validation fails
@@ -215,6 +248,7 @@ class ResearchPublisher:
                 title=item.title,
                 content=item.content,
                 url=item.url,
+                source_key=item.source_key,
                 tags=item.tags,
                 source_metadata=item.source_metadata,
                 score=item.score,
@@ -224,9 +258,14 @@ class ResearchPublisher:
             for item in items
         ]
 
-        # Delegate to repository bulk insert
-        count = await self._repository.bulk_insert(create_items)
+        # Delegate to repository bulk upsert
+        result = await self._repository.bulk_upsert(create_items)
 
-        logger.info("Published batch of %d research items", count)
+        logger.info(
+            "Published batch of %d research items: inserted=%d, updated=%d",
+            result.total,
+            result.inserted,
+            result.updated,
+        )
 
-        return count
+        return result
@@ -16,24 +16,97 @@ Usage:
     # Query with filters
     filters = ResearchQueryFilters(source=ResearchSource.REDDIT, min_score=7.0)
     items = await repo.query(filters)
+
+    # Keyset pagination - pass next_cursor back for the following page
+    items, next_cursor = await repo.query_page(filters)
+    filters.cursor = next_cursor
+
+    # Idempotent batch ingestion (re-runs update instead of duplicating)
+    result = await repo.bulk_upsert(items)
+    print(result.inserted, result.updated)
+
+    # Whole-pool rescoring: keyset-paginate rows, write (and commit) per batch
+    rows = await repo.fetch_scoring_rows(after_id=last_id, limit=1000)
+    await repo.bulk_update_scores(new_scores)
+
+    # Cross-run dedup: which discovered items are already in the pool
+    seen = await repo.find_existing_source_keys(ResearchSource.PUBMED, urls)
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, Sequence
+from typing import AsyncIterator, Optional, Sequence
 from uuid import UUID, uuid4
+import base64
+import json
 import logging
 
-from sqlalchemy import select, func, update, delete
+from sqlalchemy import (
+    select,
+    func,
+    update,
+    delete,
+    literal_column,
+    tuple_,
+    values,
+    column,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .models import ResearchItem, ResearchSource, ComplianceStatus, DEFAULT_LIMIT
+from .models import (
+    ResearchItem,
+    ResearchSource,
+    ComplianceStatus,
+    DEFAULT_LIMIT,
+    MAX_SOURCE_KEY_LENGTH,
+)
 from .schemas import ResearchItemCreate, ResearchItemUpdate
 from .exceptions import ItemNotFoundError, DatabaseError
 
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT ... ON CONFLICT statement (11 columns per row keeps each
+# statement well under PostgreSQL's 32767 bind parameter limit)
+UPSERT_CHUNK_SIZE = 1000
+
+# Columns refreshed when an incoming row conflicts with an existing item.
+# id and created_at are preserved so references and discovery time stay stable.
+UPSERT_UPDATE_COLUMNS = (
+    "title",
+    "content",
+    "url",
+    "tags",
+    "source_metadata",
+    "score",
+    "compliance_status",
+)
+
+# Default rows per server-side cursor fetch when streaming the pool
+STREAM_CHUNK_SIZE = 1000
+
+# Columns the scoring engine reads (see ResearchScoringService._model_to_dict)
+SCORING_COLUMNS = (
+    "id",
+    "source",
+    "title",
+    "content",
+    "url",
+    "tags",
+    "source_metadata",
+    "created_at",
+    "score",
+    "compliance_status",
+)
+
+# Keyset columns encoded in pagination cursors, per sort order
+CURSOR_KEYS = {
+    "score": ("score", "created_at", "id"),
+    "date": ("created_at", "id"),
+    "search": ("rank", "score", "id"),
+}
+
 
 @dataclass
 class ResearchQueryFilters:
@@ -51,8 +124,10 @@ class ResearchQueryFilters:
         end_date: Created before this datetime (inclusive)
         compliance_status: Filter by compliance check result
         limit: Maximum items to return (default: 50)
-        offset: Number of items to skip (default: 0)
+        offset: Number of items to skip (default: 0); ignored when cursor is set
         sort_by: Sort order - "score" (default), "date", or "relevance"
+        cursor: Opaque keyset cursor from query_page/search_page (next page
+                starts after the last item of the previous one)
     """
 
     source: Optional[ResearchSource] = None
@@ -65,6 +140,25 @@ class ResearchQueryFilters:
     limit: int = DEFAULT_LIMIT
     offset: int = 0
     sort_by: str = "score"
+    cursor: Optional[str] = None
+
+
+@dataclass
+class BulkUpsertResult:
+    """Outcome of a bulk upsert into the Research Pool.
+
+    Attributes:
+        inserted: Number of new items created
+        updated: Number of existing items refreshed in place
+    """
+
+    inserted: int = 0
+    updated: int = 0
+
+    @property
+    def total(self) -> int:
+        """Total number of rows written."""
+        return self.inserted + self.updated
 
 
 class ResearchPoolRepository:
@@ -111,6 +205,7 @@ class ResearchPoolRepository:
                 title=item.title,
                 content=item.content,
                 url=item.url,
+                source_key=item.source_key,
                 tags=item.tags or [],
                 source_metadata=item.source_metadata or {},
                 created_at=item.created_at or datetime.now(timezone.utc),
@@ -147,6 +242,7 @@ class ResearchPoolRepository:
 
         Applies filters dynamically based on provided values.
         Results are sorted by score descending by default.
+        Use query_page() to also receive the cursor for the next page.
 
         Args:
             filters: Query filter parameters
@@ -154,56 +250,58 @@ class ResearchPoolRepository:
         Returns:
             List of matching ResearchItem objects
         """
-        stmt = select(ResearchItem)
+        items, _ = await self.query_page(filters)
+        return items
 
-        # Apply source filter
-        if filters.source is not None:
-            stmt = stmt.where(ResearchItem.source == filters.source.value)
+    async def query_page(
+        self,
+        filters: ResearchQueryFilters,
+    ) -> tuple[list[ResearchItem], Optional[str]]:
+        """Query one page of research items using keyset pagination.
 
-        # Apply tags filter (ANY match - overlap)
-        if filters.tags:
-            stmt = stmt.where(ResearchItem.tags.overlap(filters.tags))
+        When filters.cursor is set, the page starts strictly after the
+        cursor position in (score, created_at, id) or (created_at, id)
+        order, so deep pages cost the same as the first one. Without a
+        cursor, filters.offset is honoured for backward compatibility.
 
-        # Apply score range filters
-        if filters.min_score is not None:
-            stmt = stmt.where(ResearchItem.score >= filters.min_score)
-        if filters.max_score is not None:
-            stmt = stmt.where(ResearchItem.score <= filters.max_score)
+        Args:
+            filters: Query filter parameters (including optional cursor)
 
-        # Apply date range filters
-        if filters.start_date is not None:
-            stmt = stmt.where(ResearchItem.created_at >= filters.start_date)
-        if filters.end_date is not None:
-            stmt = stmt.where(ResearchItem.created_at <= filters.end_date)
+        Returns:
+            Tuple of (items, next_cursor); next_cursor is None on the last page
+        """
+        sort_key = "date" if filters.sort_by == "date" else "score"
+        sort_columns = self._sort_columns(sort_key)
 
-        # Apply compliance status filter
-        if filters.compliance_status is not None:
-            stmt = stmt.where(
-                ResearchItem.compliance_status == filters.compliance_status.value
-            )
+        stmt = self._apply_filters(select(ResearchItem), filters)
+        stmt = stmt.order_by(*(column.desc() for column in sort_columns))
 
-        # Apply sorting
-        if filters.sort_by == "date":
-            stmt = stmt.order_by(ResearchItem.created_at.desc())
-        elif filters.sort_by == "relevance":
-            # Relevance sorting is handled by search() method with ts_rank
-            # Default to score for regular queries
-            stmt = stmt.order_by(
-                ResearchItem.score.desc(),
-                ResearchItem.created_at.desc(),
-            )
-        else:
-            # Default: score DESC, then created_at DESC
-            stmt = stmt.order_by(
-                ResearchItem.score.desc(),
-                ResearchItem.created_at.desc(),
-            )
+        # Keyset: all sort columns are DESC, so one row-value comparison
+        # continues after the cursor and can walk the composite index
+        cursor_values = (
+            self._decode_cursor(filters.cursor, sort_key) if filters.cursor else None
+        )
+        if cursor_values is not None:
+            stmt = stmt.where(tuple_(*sort_columns) < tuple_(*cursor_values))
+        elif filters.offset:
+            stmt = stmt.offset(filters.offset)
 
-        # Apply pagination
-        stmt = stmt.limit(filters.limit).offset(filters.offset)
+        # Fetch limit + 1 to check if more items exist
+        stmt = stmt.limit(filters.limit + 1)
 
         result = await self._session.execute(stmt)
-        return result.scalars().all()
+        items = list(result.scalars().all())
+
+        next_cursor = None
+        if len(items) > filters.limit:
+            items = items[:filters.limit]
+            last_item = items[-1]
+            next_cursor = self._encode_cursor(
+                sort_key,
+                {key: getattr(last_item, key) for key in CURSOR_KEYS[sort_key]},
+            )
+
+        return items, next_cursor
 
     async def update_score(self, item_id: UUID, score: float) -> None:
         """Update the score of a research item.
@@ -235,6 +333,189 @@ class ResearchPoolRepository:
             logger.error("Failed to update score for item %s: %s", item_id, e)
             raise DatabaseError("update_score", e) from e
 
+    async def bulk_update_scores(
+        self,
+        scores: Sequence[tuple[UUID, float]],
+        commit: bool = True,
+    ) -> int:
+        """Write many item scores with a single UPDATE ... FROM (VALUES ...).
+
+        Rows whose stored score already equals the new one are skipped, so
+        the returned count reflects scores that actually changed. Unknown
+        IDs are ignored rather than raising ItemNotFoundError.
+
+        Args:
+            scores: (item_id, score) pairs
+            commit: Commit after the update. Pass False to batch it with
+                    other writes and call commit() afterwards.
+
+        Returns:
+            Number of rows whose score changed
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        if not scores:
+            return 0
+
+        table = ResearchItem.__table__
+        new_scores = values(
+            column("id", table.c.id.type),
+            column("score", table.c.score.type),
+            name="new_scores",
+        ).data([(item_id, float(score)) for item_id, score in scores])
+
+        try:
+            stmt = (
+                update(ResearchItem)
+                .where(ResearchItem.id == new_scores.c.id)
+                .where(ResearchItem.score.is_distinct_from(new_scores.c.score))
+                .values(score=new_scores.c.score)
+                .execution_options(synchronize_session=False)
+            )
+            result = await self._session.execute(stmt)
+            if commit:
+                await self._session.commit()
+            return result.rowcount
+
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Failed to bulk update %d scores: %s", len(scores), e)
+            raise DatabaseError("bulk_update_scores", e) from e
+
+    async def fetch_scoring_rows(
+        self,
+        after_id: Optional[UUID] = None,
+        limit: int = STREAM_CHUNK_SIZE,
+    ) -> list[dict]:
+        """Fetch one keyset-paginated batch of items for scoring, by id.
+
+        Only SCORING_COLUMNS are selected and rows are returned as plain
+        dicts, so no ORM objects accumulate in the session identity map.
+        Each call is a short query, so callers can commit between batches
+        without holding a cursor or a long transaction open.
+
+        Args:
+            after_id: Last id of the previous batch (None for the first)
+            limit: Maximum rows in the batch
+
+        Returns:
+            Up to limit item dicts keyed by SCORING_COLUMNS, ordered by id
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        stmt = (
+            select(*(getattr(ResearchItem, name) for name in SCORING_COLUMNS))
+            .order_by(ResearchItem.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(ResearchItem.id > after_id)
+
+        try:
+            result = await self._session.execute(stmt)
+            return [dict(row) for row in result.mappings()]
+
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Failed to fetch research items for scoring: %s", e)
+            raise DatabaseError("fetch_scoring_rows", e) from e
+
+    async def find_existing_source_keys(
+        self,
+        source: ResearchSource,
+        source_keys: Sequence[str],
+    ) -> set[str]:
+        """Return the source keys that already have a research item.
+
+        Keys are truncated like _build_upsert_row before comparison, so a
+        key matches the row its own item would have been upserted into.
+
+        Args:
+            source: Research source the keys belong to
+            source_keys: Candidate source keys (permalinks, URLs, ...)
+
+        Returns:
+            Subset of source_keys already present in the pool
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        by_stored_key: dict[str, list[str]] = {}
+        for key in source_keys:
+            by_stored_key.setdefault(key[:MAX_SOURCE_KEY_LENGTH], []).append(key)
+
+        stored_keys = list(by_stored_key)
+        existing: set[str] = set()
+
+        try:
+            for start in range(0, len(stored_keys), UPSERT_CHUNK_SIZE):
+                chunk = stored_keys[start:start + UPSERT_CHUNK_SIZE]
+                stmt = select(ResearchItem.source_key).where(
+                    ResearchItem.source == source.value,
+                    ResearchItem.source_key.in_(chunk),
+                )
+                result = await self._session.execute(stmt)
+                for stored_key in result.scalars():
+                    existing.update(by_stored_key.get(stored_key, ()))
+
+            return existing
+
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Failed to look up %d source keys: %s", len(source_keys), e)
+            raise DatabaseError("find_existing_source_keys", e) from e
+
+    async def stream_source_keys(
+        self,
+        source: ResearchSource,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[list[str]]:
+        """Stream every source key of one source through a server-side cursor.
+
+        Args:
+            source: Research source to stream
+            chunk_size: Keys fetched from the cursor per chunk
+
+        Yields:
+            Lists of up to chunk_size source keys
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        stmt = (
+            select(ResearchItem.source_key)
+            .where(
+                ResearchItem.source == source.value,
+                ResearchItem.source_key.is_not(None),
+            )
+            .execution_options(yield_per=chunk_size)
+        )
+
+        try:
+            result = await self._session.stream(stmt)
+            async for partition in result.scalars().partitions(chunk_size):
+                yield list(partition)
+
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Failed to stream %s source keys: %s", source.value, e)
+            raise DatabaseError("stream_source_keys", e) from e
+
+    async def commit(self) -> None:
+        """Commit work left pending by methods called with commit=False.
+
+        Raises:
+            DatabaseError: If the commit fails
+        """
+        try:
+            await self._session.commit()
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Failed to commit research pool changes: %s", e)
+            raise DatabaseError("commit", e) from e
+
     async def update_compliance_status(
         self,
         item_id: UUID,
@@ -284,22 +565,7 @@ class ResearchPoolRepository:
 
         if filters:
             # Apply same filters as query method
-            if filters.source is not None:
-                stmt = stmt.where(ResearchItem.source == filters.source.value)
-            if filters.tags:
-                stmt = stmt.where(ResearchItem.tags.overlap(filters.tags))
-            if filters.min_score is not None:
-                stmt = stmt.where(ResearchItem.score >= filters.min_score)
-            if filters.max_score is not None:
-                stmt = stmt.where(ResearchItem.score <= filters.max_score)
-            if filters.start_date is not None:
-                stmt = stmt.where(ResearchItem.created_at >= filters.start_date)
-            if filters.end_date is not None:
-                stmt = stmt.where(ResearchItem.created_at <= filters.end_date)
-            if filters.compliance_status is not None:
-                stmt = stmt.where(
-                    ResearchItem.compliance_status == filters.compliance_status.value
-                )
+            stmt = self._apply_filters(stmt, filters)
 
         result = await self._session.execute(stmt)
         return result.scalar_one()
@@ -327,6 +593,7 @@ class ResearchPoolRepository:
                     title=item.title,
                     content=item.content,
                     url=item.url,
+                    source_key=item.source_key,
                     tags=item.tags or [],
                     source_metadata=item.source_metadata or {},
                     created_at=item.created_at or datetime.now(timezone.utc),
@@ -346,6 +613,94 @@ class ResearchPoolRepository:
             logger.error("Failed to bulk insert research items: %s", e)
             raise DatabaseError("bulk_insert", e) from e
 
+    async def bulk_upsert(self, items: list[ResearchItemCreate]) -> BulkUpsertResult:
+        """Idempotently insert or update multiple research items.
+
+        Uses multi-row INSERT ... ON CONFLICT (source, source_key) DO UPDATE,
+        so re-running a scanner pipeline refreshes existing items instead of
+        duplicating them. Items without a source_key are keyed by URL.
+        Duplicates within the batch collapse to the last occurrence.
+
+        Args:
+            items: List of research items to upsert
+
+        Returns:
+            BulkUpsertResult with inserted and updated counts
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        result = BulkUpsertResult()
+        if not items:
+            return result
+
+        # Collapse in-batch duplicates - ON CONFLICT cannot touch a row twice
+        rows_by_key: dict[tuple[str, str], dict] = {}
+        for item in items:
+            row = self._build_upsert_row(item)
+            rows_by_key[(row["source"], row["source_key"])] = row
+        rows = list(rows_by_key.values())
+
+        try:
+            for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                chunk = rows[start:start + UPSERT_CHUNK_SIZE]
+                stmt = pg_insert(ResearchItem).values(chunk)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[ResearchItem.source, ResearchItem.source_key],
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in UPSERT_UPDATE_COLUMNS
+                    },
+                ).returning(
+                    # xmax is 0 only for freshly inserted tuples
+                    literal_column("(xmax = 0)").label("inserted")
+                )
+
+                executed = await self._session.execute(stmt)
+                for inserted in executed.scalars():
+                    if inserted:
+                        result.inserted += 1
+                    else:
+                        result.updated += 1
+
+            await self._session.commit()
+
+        except Exception as e:
+            await self._session.rollback()
+            logger.error("Failed to bulk upsert research items: %s", e)
+            raise DatabaseError("bulk_upsert", e) from e
+
+        logger.info(
+            "Bulk upserted research items: inserted=%d, updated=%d",
+            result.inserted,
+            result.updated,
+        )
+        return result
+
+    @staticmethod
+    def _build_upsert_row(item: ResearchItemCreate) -> dict:
+        """Build a column-value mapping for bulk_upsert.
+
+        Args:
+            item: Research item to convert
+
+        Returns:
+            Dict of column values
+        """
+        return {
+            "id": item.id or uuid4(),
+            "source": item.source.value,
+            "title": item.title,
+            "content": item.content,
+            "url": item.url,
+            "source_key": item.source_key,
+            "tags": item.tags or [],
+            "source_metadata": item.source_metadata or {},
+            "created_at": item.created_at or datetime.now(timezone.utc),
+            "score": item.score,
+            "compliance_status": item.compliance_status.value,
+        }
+
     async def search(
         self,
         query: str,
@@ -355,6 +710,7 @@ class ResearchPoolRepository:
 
         Uses PostgreSQL tsvector for efficient full-text search.
         Results are ranked by relevance using ts_rank.
+        Use search_page() to also receive the cursor for the next page.
 
         Args:
             query: Search query string (words to search for)
@@ -363,52 +719,192 @@ class ResearchPoolRepository:
         Returns:
             List of matching ResearchItem objects, ranked by relevance
         """
+        items, _ = await self.search_page(query, filters)
+        return items
+
+    async def search_page(
+        self,
+        query: str,
+        filters: Optional[ResearchQueryFilters] = None,
+    ) -> tuple[list[ResearchItem], Optional[str]]:
+        """Full-text search returning one page and the next-page cursor.
+
+        Pages are keyed on (ts_rank, score, id); the cursor carries the
+        rank of the last item so the next page needs no offset scan.
+
+        Args:
+            query: Search query string (words to search for)
+            filters: Optional additional filters (including optional cursor)
+
+        Returns:
+            Tuple of (items ranked by relevance, next_cursor)
+        """
         if not query or not query.strip():
             # Empty query returns empty results
-            return []
+            return [], None
 
         # Build the search query using PostgreSQL full-text search
         # plainto_tsquery converts plain text to tsquery (handles spaces, etc.)
         search_query = func.plainto_tsquery("english", query)
+        rank = func.ts_rank(ResearchItem.search_vector, search_query)
 
         # Build statement with full-text search
         stmt = (
-            select(ResearchItem)
+            select(ResearchItem, rank.label("rank"))
             .where(ResearchItem.search_vector.op("@@")(search_query))
         )
 
         # Apply additional filters if provided
         if filters:
-            if filters.source is not None:
-                stmt = stmt.where(ResearchItem.source == filters.source.value)
-            if filters.tags:
-                stmt = stmt.where(ResearchItem.tags.overlap(filters.tags))
-            if filters.min_score is not None:
-                stmt = stmt.where(ResearchItem.score >= filters.min_score)
-            if filters.max_score is not None:
-                stmt = stmt.where(ResearchItem.score <= filters.max_score)
-            if filters.start_date is not None:
-                stmt = stmt.where(ResearchItem.created_at >= filters.start_date)
-            if filters.end_date is not None:
-                stmt = stmt.where(ResearchItem.created_at <= filters.end_date)
-            if filters.compliance_status is not None:
-                stmt = stmt.where(
-                    ResearchItem.compliance_status == filters.compliance_status.value
-                )
+            stmt = self._apply_filters(stmt, filters)
 
-        # Order by relevance (ts_rank) descending
+        # Order by relevance (ts_rank) descending, score as secondary sort
         stmt = stmt.order_by(
-            func.ts_rank(ResearchItem.search_vector, search_query).desc(),
-            ResearchItem.score.desc(),  # Secondary sort by score
+            rank.desc(),
+            ResearchItem.score.desc(),
+            ResearchItem.id.desc(),  # Stable sort for pagination
         )
 
         # Apply pagination from filters or use defaults
         limit = filters.limit if filters else DEFAULT_LIMIT
-        offset = filters.offset if filters else 0
-        stmt = stmt.limit(limit).offset(offset)
+        cursor_values = (
+            self._decode_cursor(filters.cursor, "search")
+            if filters and filters.cursor
+            else None
+        )
+        if cursor_values is not None:
+            stmt = stmt.where(
+                tuple_(rank, ResearchItem.score, ResearchItem.id)
+                < tuple_(*cursor_values)
+            )
+        elif filters and filters.offset:
+            stmt = stmt.offset(filters.offset)
+        stmt = stmt.limit(limit + 1)
 
         result = await self._session.execute(stmt)
-        return result.scalars().all()
+        rows = list(result.all())
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_item, last_rank = rows[-1]
+            next_cursor = self._encode_cursor(
+                "search",
+                {"rank": last_rank, "score": last_item.score, "id": last_item.id},
+            )
+
+        return [row[0] for row in rows], next_cursor
+
+    @staticmethod
+    def _apply_filters(stmt, filters: ResearchQueryFilters):
+        """Apply ResearchQueryFilters WHERE clauses to a statement.
+
+        Args:
+            stmt: SELECT statement over ResearchItem
+            filters: Query filter parameters
+
+        Returns:
+            Statement with filter clauses applied
+        """
+        # Apply source filter
+        if filters.source is not None:
+            stmt = stmt.where(ResearchItem.source == filters.source.value)
+
+        # Apply tags filter (ANY match - overlap)
+        if filters.tags:
+            stmt = stmt.where(ResearchItem.tags.overlap(filters.tags))
+
+        # Apply score range filters
+        if filters.min_score is not None:
+            stmt = stmt.where(ResearchItem.score >= filters.min_score)
+        if filters.max_score is not None:
+            stmt = stmt.where(ResearchItem.score <= filters.max_score)
+
+        # Apply date range filters
+        if filters.start_date is not None:
+            stmt = stmt.where(ResearchItem.created_at >= filters.start_date)
+        if filters.end_date is not None:
+            stmt = stmt.where(ResearchItem.created_at <= filters.end_date)
+
+        # Apply compliance status filter
+        if filters.compliance_status is not None:
+            stmt = stmt.where(
+                ResearchItem.compliance_status == filters.compliance_status.value
+            )
+
+        return stmt
+
+    @staticmethod
+    def _sort_columns(sort_key: str) -> tuple:
+        """Get the (all DESC) keyset columns for a sort order.
+
+        Args:
+            sort_key: "score" or "date"
+
+        Returns:
+            Tuple of ResearchItem columns, most significant first
+        """
+        if sort_key == "date":
+            return (ResearchItem.created_at, ResearchItem.id)
+        # "score" (also used for "relevance" outside of search())
+        return (ResearchItem.score, ResearchItem.created_at, ResearchItem.id)
+
+    @staticmethod
+    def _encode_cursor(sort_key: str, values: dict) -> str:
+        """Encode pagination cursor as base64 JSON.
+
+        Args:
+            sort_key: Sort order the cursor belongs to
+            values: Keyset values of the last item on the page
+
+        Returns:
+            Base64-encoded cursor string
+        """
+        cursor_data = {"sort": sort_key}
+        for key in CURSOR_KEYS[sort_key]:
+            value = values[key]
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, UUID):
+                value = str(value)
+            elif value is not None:
+                value = float(value)
+            cursor_data[key] = value
+        json_str = json.dumps(cursor_data)
+        return base64.urlsafe_b64encode(json_str.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort_key: str) -> Optional[tuple]:
+        """Decode pagination cursor from base64 JSON.
+
+        Args:
+            cursor: Base64-encoded cursor string
+            sort_key: Sort order of the current request
+
+        Returns:
+            Tuple of keyset values in column order, or None if the cursor is
+            invalid or was issued for a different sort order
+        """
+        try:
+            json_str = base64.urlsafe_b64decode(cursor.encode()).decode()
+            data = json.loads(json_str)
+
+            if data.get("sort") != sort_key:
+                logger.warning("Pagination cursor does not match sort order")
+                return None
+
+            values = []
+            for key in CURSOR_KEYS[sort_key]:
+                if key == "created_at":
+                    values.append(datetime.fromisoformat(data[key]))
+                elif key == "id":
+                    values.append(UUID(data[key]))
+                else:
+                    values.append(float(data[key]))
+            return tuple(values)
+        except Exception:
+            logger.warning("Failed to decode pagination cursor")
+            return None
 
     async def delete(self, item_id: UUID) -> bool:
         """Delete a research item by ID.
@@ -14,9 +14,15 @@ from uuid import UUID
 
 import re
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
-from .models import ResearchSource, ComplianceStatus, MAX_SCORE, MIN_SCORE
+from .models import (
+    ResearchSource,
+    ComplianceStatus,
+    MAX_SCORE,
+    MIN_SCORE,
+    MAX_SOURCE_KEY_LENGTH,
+)
 
 
 # URL validation pattern - must start with http:// or https://
@@ -53,6 +59,11 @@ class ResearchItemCreate(BaseModel):
         max_length=2048,
         description="Source URL for reference",
     )
+    source_key: Optional[str] = Field(
+        default=None,
+        max_length=MAX_SOURCE_KEY_LENGTH,
+        description="Stable source identifier for upserts; defaults to url",
+    )
     tags: list[str] = Field(
         default_factory=list,
         description="Topic/theme tags for categorization",
@@ -94,6 +105,19 @@ class ResearchItemCreate(BaseModel):
             raise ValueError("URL must start with http:// or https://")
         return v
 
+    @model_validator(mode="after")
+    def default_source_key(self) -> "ResearchItemCreate":
+        """Key items without a source_key by URL.
+
+        Every write path (add_item, bulk_insert, bulk_upsert) stores the
+        same key, so an item first published singly is updated, not
+        duplicated, by a later upsert. Truncated like the migration
+        backfill so keys stay comparable.
+        """
+        if not self.source_key:
+            self.source_key = self.url[:MAX_SOURCE_KEY_LENGTH]
+        return self
+
     model_config = {
         "from_attributes": True,
     }
@@ -12,6 +12,8 @@ Components:
     - ScoringConfig: Configuration with component weights
     - ScoringWeights: Weight values for each scoring component
     - ScoringResult: Result dataclass with score breakdown
+    - BatchScoringResult: Array-backed batch result with lazy reasoning
+    - RescoreResult: Progress and throughput of a whole-pool rescore
     - ComponentScore: Individual component score result
 
 Usage:
@@ -33,6 +35,8 @@ from .config import (
 )
 from .schemas import (
     ScoringResult,
+    BatchScoringResult,
+    RescoreResult,
     ComponentScore,
     ScoringResultResponse,
     ComponentScoreResponse,
@@ -62,6 +66,8 @@ __all__ = [
     "ScoringWeights",
     # Schemas (dataclasses)
     "ScoringResult",
+    "BatchScoringResult",
+    "RescoreResult",
     "ComponentScore",
     # Schemas (Pydantic API responses)
     "ScoringResultResponse",
@@ -12,7 +12,9 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Sequence
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -99,3 +101,27 @@ class ComplianceAdjuster:
 
         final_score = base_score + adjustment.adjustment
         return min(final_score, MAX_FINAL_SCORE)
+
+    def adjust_batch(
+        self, items: Sequence[dict[str, Any]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate compliance adjustments for a batch of items.
+
+        Args:
+            items: Dictionaries with 'compliance_status' field.
+
+        Returns:
+            Tuple of (adjustment array, rejected boolean mask).
+        """
+        statuses = [item.get("compliance_status", "WARNING") for item in items]
+        adjustments = np.fromiter(
+            (COMPLIANT_BONUS if status == "COMPLIANT" else 0.0 for status in statuses),
+            dtype=np.float64,
+            count=len(statuses),
+        )
+        rejected = np.fromiter(
+            (status == "REJECTED" for status in statuses),
+            dtype=bool,
+            count=len(statuses),
+        )
+        return adjustments, rejected
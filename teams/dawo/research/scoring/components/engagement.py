@@ -15,9 +15,11 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Sequence
 
-from ..schemas import ComponentScore
+import numpy as np
+
+from ..schemas import ComponentScore, round_score
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +71,13 @@ class EngagementScorer:
             config: EngagementConfig with threshold settings.
         """
         self._config = config
+        # source -> (metadata key, max threshold, log scale?) for score_batch
+        self._metric_specs: dict[str, tuple[str, int, bool]] = {
+            "reddit": ("upvotes", config.reddit_max_upvotes, False),
+            "youtube": ("views", config.youtube_max_views, True),
+            "instagram": ("likes", config.instagram_max_likes, False),
+            "pubmed": ("citation_count", config.pubmed_max_citations, False),
+        }
 
     def score(self, item: dict[str, Any]) -> ComponentScore:
         """Calculate engagement score for a research item.
@@ -168,7 +177,7 @@ class EngagementScorer:
         if value >= max_threshold:
             return MAX_ENGAGEMENT_SCORE
 
-        return round((value / max_threshold) * MAX_ENGAGEMENT_SCORE, 2)
+        return round_score((value / max_threshold) * MAX_ENGAGEMENT_SCORE)
 
     def _log_scale(self, value: int, max_threshold: int) -> float:
         """Calculate logarithmic scale score.
@@ -190,4 +199,49 @@ class EngagementScorer:
         log_max = math.log10(max_threshold)
         score = (log_value / log_max) * MAX_ENGAGEMENT_SCORE
 
-        return round(min(score, MAX_ENGAGEMENT_SCORE), 2)
+        return round_score(min(score, MAX_ENGAGEMENT_SCORE))
+
+    def score_batch(self, items: Sequence[dict[str, Any]]) -> np.ndarray:
+        """Calculate raw engagement scores for a batch of items.
+
+        Gathers each item's source metric into one array and applies the
+        linear and log scales vectorized. Items without a metric (news,
+        unknown sources, missing data) get the default score.
+
+        Args:
+            items: Dictionaries with 'source' and 'source_metadata' fields.
+
+        Returns:
+            Float array of engagement scores (0-10), one per item.
+        """
+        count = len(items)
+        values = np.zeros(count, dtype=np.float64)
+        thresholds = np.ones(count, dtype=np.float64)
+        log_scaled = np.zeros(count, dtype=bool)
+        has_metric = np.zeros(count, dtype=bool)
+
+        for index, item in enumerate(items):
+            spec = self._metric_specs.get(item.get("source", "").lower())
+            if spec is None:
+                continue
+            key, max_threshold, is_log = spec
+            value = item.get("source_metadata", {}).get(key)
+            if value is None:
+                continue
+            values[index] = value
+            thresholds[index] = max_threshold
+            log_scaled[index] = is_log
+            has_metric[index] = True
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            linear = values / thresholds * MAX_ENGAGEMENT_SCORE
+            log = (
+                np.log10(np.maximum(values, 1.0))
+                / np.log10(thresholds)
+                * MAX_ENGAGEMENT_SCORE
+            )
+        scaled = round_score(np.where(log_scaled, np.minimum(log, MAX_ENGAGEMENT_SCORE), linear))
+        scaled = np.where(values >= thresholds, MAX_ENGAGEMENT_SCORE, scaled)
+        scaled = np.where(values <= 0, MIN_ENGAGEMENT_SCORE, scaled)
+
+        return np.where(has_metric, scaled, DEFAULT_ENGAGEMENT_SCORE)
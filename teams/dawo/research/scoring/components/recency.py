@@ -14,9 +14,11 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional, Sequence
 
-from ..schemas import ComponentScore
+import numpy as np
+
+from ..schemas import ComponentScore, round_score
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,8 @@ logger = logging.getLogger(__name__)
 RECENCY_DECAY_DAYS: int = 30
 MAX_RECENCY_SCORE: float = 10.0
 MIN_RECENCY_SCORE: float = 0.0
+MISSING_CREATED_AT_SCORE: float = 5.0
+SECONDS_PER_DAY: float = 24 * 60 * 60
 
 
 @dataclass
@@ -72,7 +76,7 @@ class RecencyScorer:
             logger.warning("Item missing created_at, defaulting to score 5")
             return ComponentScore(
                 component_name="recency",
-                raw_score=5.0,
+                raw_score=MISSING_CREATED_AT_SCORE,
                 notes="Missing created_at timestamp",
             )
 
@@ -84,7 +88,7 @@ class RecencyScorer:
             created_at = created_at.replace(tzinfo=timezone.utc)
 
         delta = now - created_at
-        days_old = delta.total_seconds() / (24 * 60 * 60)
+        days_old = delta.total_seconds() / SECONDS_PER_DAY
 
         # Apply decay formula
         decay_factor = 1 - (days_old / self._config.decay_days)
@@ -94,7 +98,7 @@ class RecencyScorer:
         raw_score = max(MIN_RECENCY_SCORE, min(MAX_RECENCY_SCORE, raw_score))
 
         # Round to 2 decimal places for cleaner output
-        raw_score = round(raw_score, 2)
+        raw_score = round_score(raw_score)
 
         # Build notes
         days_old_int = int(days_old)
@@ -112,3 +116,59 @@ class RecencyScorer:
             raw_score=raw_score,
             notes=notes,
         )
+
+    def score_batch(
+        self,
+        items: Sequence[dict[str, Any]],
+        now: Optional[datetime] = None,
+    ) -> np.ndarray:
+        """Calculate raw recency scores for a batch of items.
+
+        Applies the same linear decay as score() on a timestamp array.
+        Items without created_at get the neutral missing-timestamp score.
+
+        Args:
+            items: Dictionaries with 'created_at' field (datetime).
+            now: Reference time (defaults to current UTC time).
+
+        Returns:
+            Float array of recency scores (0-10), one per item.
+        """
+        now = now or datetime.now(timezone.utc)
+
+        created = np.fromiter(
+            (self._timestamp(item.get("created_at")) for item in items),
+            dtype=np.float64,
+            count=len(items),
+        )
+
+        days_old = (now.timestamp() - created) / SECONDS_PER_DAY
+        scores = MAX_RECENCY_SCORE * (1 - days_old / self._config.decay_days)
+        scores = round_score(np.clip(scores, MIN_RECENCY_SCORE, MAX_RECENCY_SCORE))
+
+        missing = np.isnan(created)
+        if missing.any():
+            logger.warning(
+                "%d items missing created_at, defaulting to score %s",
+                int(missing.sum()),
+                MISSING_CREATED_AT_SCORE,
+            )
+            scores[missing] = MISSING_CREATED_AT_SCORE
+
+        return scores
+
+    @staticmethod
+    def _timestamp(created_at: Optional[datetime]) -> float:
+        """Convert created_at to a POSIX timestamp (NaN when missing).
+
+        Args:
+            created_at: Creation datetime, naive values treated as UTC.
+
+        Returns:
+            Seconds since the epoch.
+        """
+        if created_at is None:
+            return np.nan
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return created_at.timestamp()
@@ -6,13 +6,18 @@ Calculates relevance score based on keyword matching:
 - Total max score: 10
 
 Keywords are matched case-insensitively in both title and content.
+All keywords are compiled once into a single KeywordMatcher, so each item
+is scanned in one pass regardless of how many keyword variants are configured.
 """
 
 from __future__ import annotations
 
 import logging
+import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Sequence
+
+import numpy as np
 
 from ..schemas import ComponentScore
 
@@ -92,6 +97,130 @@ class RelevanceConfig:
     secondary_keywords: list[str] = field(default_factory=lambda: DEFAULT_SECONDARY_KEYWORDS.copy())
 
 
+@dataclass(frozen=True)
+class KeywordMatches:
+    """Distinct keywords found in a text, in configuration order.
+
+    Attributes:
+        primary: Matched primary keywords (mushroom products).
+        secondary: Matched secondary keywords (wellness themes).
+    """
+
+    primary: list[str]
+    secondary: list[str]
+
+
+class KeywordMatcher:
+    """Single-pass multi-keyword substring matcher.
+
+    Compiles every primary and secondary keyword into one regex shaped
+    like a character trie (shared prefixes factored out), so each text
+    position is tested against all keywords at once and the cost of a scan
+    no longer grows with the number of configured variants. The regex
+    returns the longest keyword starting at a position; keywords contained
+    in that hit (e.g. "adaptogen" inside "adaptogenic") are added from a
+    precomputed table, which keeps results identical to checking each
+    keyword with `in`.
+
+    Attributes:
+        _primary: Lowercase primary keywords in config order.
+        _secondary: Lowercase secondary keywords in config order.
+        _pattern: Compiled trie regex (None if no keywords).
+        _implied: Keyword -> all keywords it contains (itself included).
+    """
+
+    def __init__(self, primary_keywords: list[str], secondary_keywords: list[str]) -> None:
+        """Compile the matcher from keyword lists.
+
+        Args:
+            primary_keywords: Primary keywords (any case).
+            secondary_keywords: Secondary keywords (any case).
+        """
+        self._primary = [kw.lower() for kw in primary_keywords if kw]
+        self._secondary = [kw.lower() for kw in secondary_keywords if kw]
+
+        distinct = set(self._primary) | set(self._secondary)
+        self._pattern = re.compile(_trie_pattern(distinct)) if distinct else None
+        self._implied: dict[str, frozenset[str]] = {
+            keyword: frozenset(other for other in distinct if other in keyword)
+            for keyword in distinct
+        }
+
+    def find(self, text: str) -> set[str]:
+        """Find every keyword occurring in text.
+
+        Args:
+            text: Lowercase text to search.
+
+        Returns:
+            Set of matched lowercase keywords.
+        """
+        if self._pattern is None:
+            return set()
+
+        hits: set[str] = set()
+        search = self._pattern.search
+        pos = 0
+        # Resume one character after each hit so keywords starting inside
+        # an earlier hit are not skipped
+        while (hit := search(text, pos)) is not None:
+            hits.add(hit.group())
+            pos = hit.start() + 1
+
+        found: set[str] = set()
+        for keyword in hits:
+            found |= self._implied[keyword]
+        return found
+
+    def match(self, text: str) -> KeywordMatches:
+        """Find distinct primary and secondary keyword hits in one pass.
+
+        Args:
+            text: Lowercase text to search.
+
+        Returns:
+            KeywordMatches with hits in configuration order.
+        """
+        found = self.find(text)
+        return KeywordMatches(
+            primary=[kw for kw in self._primary if kw in found],
+            secondary=[kw for kw in self._secondary if kw in found],
+        )
+
+
+def _trie_pattern(keywords: set[str]) -> str:
+    """Build a regex that matches the longest keyword at a position.
+
+    Keywords are folded into a character trie and emitted as nested
+    groups, e.g. {"immune", "immunity"} -> "immun(?:e|ity)". Nodes that
+    end a keyword make their continuation optional, and greedy matching
+    prefers the longer keyword.
+
+    Args:
+        keywords: Non-empty lowercase keywords.
+
+    Returns:
+        Regex source string.
+    """
+    trie: dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        ends_here = "" in node
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if ends_here else "")
+
+    return emit(trie)
+
+
 class RelevanceScorer:
     """Scores research items based on relevance to DAWO products.
 
@@ -101,6 +230,7 @@ class RelevanceScorer:
 
     Attributes:
         _config: RelevanceConfig with keyword lists.
+        _matcher: KeywordMatcher compiled once from the config.
     """
 
     def __init__(self, config: RelevanceConfig) -> None:
@@ -110,9 +240,7 @@ class RelevanceScorer:
             config: RelevanceConfig with keyword lists.
         """
         self._config = config
-        # Pre-lowercase keywords for efficient matching
-        self._primary_keywords_lower = [kw.lower() for kw in config.primary_keywords]
-        self._secondary_keywords_lower = [kw.lower() for kw in config.secondary_keywords]
+        self._matcher = KeywordMatcher(config.primary_keywords, config.secondary_keywords)
 
     def score(self, item: dict[str, Any]) -> ComponentScore:
         """Calculate relevance score for a research item.
@@ -123,25 +251,17 @@ class RelevanceScorer:
         Returns:
             ComponentScore with relevance score (0-10).
         """
-        title = item.get("title", "")
-        content = item.get("content", "")
-        text = f"{title} {content}".lower()
+        matches = self._match(item)
 
-        # Count unique primary keyword matches
-        primary_matches = self._count_unique_matches(text, self._primary_keywords_lower)
-        primary_bonus = min(primary_matches * PRIMARY_KEYWORD_BONUS, MAX_PRIMARY_BONUS)
-
-        # Count unique secondary keyword matches
-        secondary_matches = self._count_unique_matches(text, self._secondary_keywords_lower)
-        secondary_bonus = min(secondary_matches * SECONDARY_KEYWORD_BONUS, MAX_SECONDARY_BONUS)
+        # Count unique keyword concepts
+        matched_primary = self._dedupe_concepts(matches.primary)
+        matched_secondary = self._dedupe_concepts(matches.secondary)
+        primary_matches = len(matched_primary)
+        secondary_matches = len(matched_secondary)
 
-        # Calculate total score (capped at 10)
-        raw_score = min(primary_bonus + secondary_bonus, MAX_SCORE)
+        raw_score = self._combine(primary_matches, secondary_matches)
 
         # Build notes with matched keywords
-        matched_primary = self._find_matched_keywords(text, self._primary_keywords_lower)
-        matched_secondary = self._find_matched_keywords(text, self._secondary_keywords_lower)
-
         notes_parts = []
         if matched_primary:
             notes_parts.append(f"Primary: {', '.join(matched_primary[:3])}")
@@ -151,7 +271,10 @@ class RelevanceScorer:
         notes = "; ".join(notes_parts) if notes_parts else "No relevant keywords found"
 
         logger.debug(
-            f"Relevance score: {raw_score} (primary: {primary_matches}, secondary: {secondary_matches})"
+            "Relevance score: %s (primary: %d, secondary: %d)",
+            raw_score,
+            primary_matches,
+            secondary_matches,
         )
 
         return ComponentScore(
@@ -160,48 +283,71 @@ class RelevanceScorer:
             notes=notes,
         )
 
-    def _count_unique_matches(self, text: str, keywords: list[str]) -> int:
-        """Count unique keyword matches in text.
+    def score_batch(self, items: Sequence[dict[str, Any]]) -> np.ndarray:
+        """Calculate raw relevance scores for a batch of items.
 
-        Groups similar keywords (e.g., "lion's mane" and "lions mane") to avoid
-        double-counting the same concept.
+        Skips notes and per-item logging; use score() for the breakdown.
 
         Args:
-            text: Lowercase text to search.
-            keywords: List of lowercase keywords.
+            items: Dictionaries with 'title' and 'content' fields.
 
         Returns:
-            Number of unique keyword matches.
+            Float array of relevance scores (0-10), one per item.
         """
-        # Group keywords by base concept to avoid double-counting
-        matched_concepts: set[str] = set()
+        return np.fromiter(
+            (self._raw_score(item) for item in items),
+            dtype=np.float64,
+            count=len(items),
+        )
 
-        for keyword in keywords:
-            if keyword in text:
-                # Use first word as concept identifier (simplified grouping)
-                concept = keyword.split()[0]
-                matched_concepts.add(concept)
+    def _raw_score(self, item: dict[str, Any]) -> float:
+        """Calculate the relevance score without building notes.
+
+        Args:
+            item: Dictionary with 'title' and 'content' fields.
 
-        return len(matched_concepts)
+        Returns:
+            Relevance score (0-10).
+        """
+        matches = self._match(item)
+        return self._combine(
+            len(self._dedupe_concepts(matches.primary)),
+            len(self._dedupe_concepts(matches.secondary)),
+        )
 
-    def _find_matched_keywords(self, text: str, keywords: list[str]) -> list[str]:
-        """Find which keywords matched in text.
+    def _match(self, item: dict[str, Any]) -> KeywordMatches:
+        """Run the compiled matcher over an item's title and content."""
+        text = f"{item.get('title', '')} {item.get('content', '')}".lower()
+        return self._matcher.match(text)
+
+    @staticmethod
+    def _combine(primary_matches: int, secondary_matches: int) -> float:
+        """Convert concept match counts into a capped relevance score."""
+        primary_bonus = min(primary_matches * PRIMARY_KEYWORD_BONUS, MAX_PRIMARY_BONUS)
+        secondary_bonus = min(secondary_matches * SECONDARY_KEYWORD_BONUS, MAX_SECONDARY_BONUS)
+        return min(primary_bonus + secondary_bonus, MAX_SCORE)
+
+    @staticmethod
+    def _dedupe_concepts(keywords: list[str]) -> list[str]:
+        """Keep the first matched keyword per concept.
+
+        Groups similar keywords (e.g., "lion's mane" and "lions mane") to avoid
+        double-counting the same concept.
 
         Args:
-            text: Lowercase text to search.
-            keywords: List of lowercase keywords.
+            keywords: Matched lowercase keywords in configuration order.
 
         Returns:
-            List of matched keywords (deduplicated by concept).
+            Matched keywords deduplicated by concept.
         """
         matched: list[str] = []
         seen_concepts: set[str] = set()
 
         for keyword in keywords:
-            if keyword in text:
-                concept = keyword.split()[0]
-                if concept not in seen_concepts:
-                    matched.append(keyword)
-                    seen_concepts.add(concept)
+            # Use first word as concept identifier (simplified grouping)
+            concept = keyword.split()[0]
+            if concept not in seen_concepts:
+                matched.append(keyword)
+                seen_concepts.add(concept)
 
         return matched
@@ -18,7 +18,9 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Sequence
+
+import numpy as np
 
 from ..schemas import ComponentScore
 
@@ -118,3 +120,26 @@ class SourceQualityScorer:
             raw_score=raw_score,
             notes=notes,
         )
+
+    def score_batch(self, items: Sequence[dict[str, Any]]) -> np.ndarray:
+        """Calculate raw source quality scores for a batch of items.
+
+        Args:
+            items: Dictionaries with 'source' and 'source_metadata' fields.
+
+        Returns:
+            Float array of source quality scores (0-10), one per item.
+        """
+        tiers = self._config.source_tiers
+        bonuses = self._config.study_bonuses
+
+        base = np.empty(len(items), dtype=np.float64)
+        bonus = np.zeros(len(items), dtype=np.float64)
+        for index, item in enumerate(items):
+            source = item.get("source", "").lower()
+            base[index] = tiers.get(source, DEFAULT_SOURCE_SCORE)
+            if source == "pubmed":
+                study_type = item.get("source_metadata", {}).get("study_type", "")
+                bonus[index] = bonuses.get(study_type, 0.0)
+
+        return np.minimum(base + bonus, MAX_SOURCE_QUALITY_SCORE)
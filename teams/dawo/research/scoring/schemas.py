@@ -3,17 +3,42 @@
 Defines the data structures for scoring results:
 - ComponentScore: Result from a single scoring component (dataclass for internal use)
 - ScoringResult: Combined result from composite scoring (dataclass for internal use)
+- BatchScoringResult: Array-backed result from batch scoring (dataclass for internal use)
+- RescoreResult: Progress and throughput of a whole-pool rescore (dataclass for internal use)
 - ComponentScoreResponse: Pydantic model for API responses
 - ScoringResultResponse: Pydantic model for API responses
+- round_score: The one rounding rule for item and batch scores
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Any, Callable, Iterator, Sequence
 
+import numpy as np
 from pydantic import BaseModel, Field
 
+# Decimal places kept on component and final scores
+SCORE_DECIMALS = 2
+
+
+def round_score(score: float | np.ndarray) -> float | np.ndarray:
+    """Round a score, or an array of scores, to SCORE_DECIMALS places.
+
+    Both score() and score_batch() paths round through here: Python's
+    round() and np.round() disagree on many .xx5 values, so mixing them
+    lets a single item and the same item in a batch differ by 0.01.
+
+    Args:
+        score: A score or an array of scores.
+
+    Returns:
+        A float for a scalar score, otherwise an array.
+    """
+    rounded = np.round(score, SCORE_DECIMALS)
+    return float(rounded) if np.ndim(rounded) == 0 else rounded
+
 
 @dataclass
 class ComponentScore:
@@ -80,6 +105,103 @@ class ScoringResult:
         )
 
 
+@dataclass
+class BatchScoringResult:
+    """Array-backed result from scoring a batch of items.
+
+    Holds one entry per input item, in input order. Per-item ScoringResult
+    objects (with notes and reasoning) are only built when requested via
+    result() or results(), so bulk rescoring pays for arrays alone.
+
+    Attributes:
+        final_scores: Final composite scores (0-10).
+        relevance: Raw relevance component scores.
+        recency: Raw recency component scores.
+        source_quality: Raw source quality component scores.
+        engagement: Raw engagement component scores.
+        weights: Per-item weight matrix, columns ordered as
+            (relevance, recency, source_quality, engagement, compliance).
+        weighted_sums: Weighted averages before compliance adjustment.
+        compliance_adjustments: Compliance bonus applied per item.
+        rejected: Mask of items forced to 0 by REJECTED status.
+        scored_at: Timestamp when scoring was performed.
+    """
+
+    final_scores: np.ndarray
+    relevance: np.ndarray
+    recency: np.ndarray
+    source_quality: np.ndarray
+    engagement: np.ndarray
+    weights: np.ndarray
+    weighted_sums: np.ndarray
+    compliance_adjustments: np.ndarray
+    rejected: np.ndarray
+    scored_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    items: Sequence[dict[str, Any]] = field(default=(), repr=False)
+    materializer: Callable[["BatchScoringResult", int], ScoringResult] | None = field(
+        default=None, repr=False
+    )
+
+    def __len__(self) -> int:
+        """Number of scored items."""
+        return len(self.final_scores)
+
+    def result(self, index: int) -> ScoringResult:
+        """Build the full ScoringResult (notes and reasoning) for one item.
+
+        Args:
+            index: Position of the item in the scored batch.
+
+        Returns:
+            ScoringResult equivalent to scoring the item individually.
+        """
+        if self.materializer is None:
+            raise ValueError("BatchScoringResult has no materializer for reasoning")
+        return self.materializer(self, index)
+
+    def results(self) -> Iterator[ScoringResult]:
+        """Lazily build ScoringResult objects for every item in order."""
+        for index in range(len(self)):
+            yield self.result(index)
+
+
+@dataclass
+class RescoreResult:
+    """Progress and throughput of a whole-pool rescoring run.
+
+    Updated after every chunk, so the same object doubles as a progress
+    report while the run is in flight.
+
+    Attributes:
+        scanned: Items read from the pool and scored so far.
+        updated: Items whose stored score changed.
+        chunks: Chunks processed so far.
+        elapsed_seconds: Wall-clock time since the run started.
+    """
+
+    scanned: int = 0
+    updated: int = 0
+    chunks: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        """Scoring throughput over the run so far."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.scanned / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for job results and progress reporting."""
+        return {
+            "scanned": self.scanned,
+            "updated": self.updated,
+            "chunks": self.chunks,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "items_per_second": round(self.items_per_second, 1),
+        }
+
+
 # =============================================================================
 # Pydantic API Response Models (Task 8.3)
 # =============================================================================
@@ -17,10 +17,14 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Sequence
 
-from .config import ScoringConfig
-from .schemas import ScoringResult, ComponentScore
+import numpy as np
+
+from teams.dawo.middleware.process_pool import ProcessBatchExecutor, WorkerSpec, map_batch
+
+from .config import ScoringConfig, ScoringWeights
+from .schemas import ScoringResult, ComponentScore, BatchScoringResult, round_score
 from .components.relevance import RelevanceScorer
 from .components.recency import RecencyScorer
 from .components.source_quality import SourceQualityScorer
@@ -33,6 +37,9 @@ logger = logging.getLogger(__name__)
 MAX_FINAL_SCORE: float = 10.0
 MIN_FINAL_SCORE: float = 0.0
 
+# Neutral compliance contribution to the weighted average
+COMPLIANCE_BASE_SCORE: float = 5.0
+
 
 class ResearchItemScorer:
     """Composite scorer for research items.
@@ -59,6 +66,7 @@ class ResearchItemScorer:
         _source_quality: SourceQualityScorer component.
         _engagement: EngagementScorer component.
         _compliance: ComplianceAdjuster component.
+        _batch_executor: Optional worker processes for calculate_score_batch().
     """
 
     def __init__(
@@ -69,6 +77,7 @@ class ResearchItemScorer:
         source_quality_scorer: SourceQualityScorer,
         engagement_scorer: EngagementScorer,
         compliance_adjuster: ComplianceAdjuster,
+        batch_executor: ProcessBatchExecutor | None = None,
     ) -> None:
         """Accept all dependencies via injection from Team Builder.
 
@@ -79,6 +88,8 @@ class ResearchItemScorer:
             source_quality_scorer: SourceQualityScorer for source tiers.
             engagement_scorer: EngagementScorer for engagement metrics.
             compliance_adjuster: ComplianceAdjuster for compliance status.
+            batch_executor: Optional process pool for calculate_score_batch().
+                Without one, batches run on the event loop.
         """
         self._config = config
         self._relevance = relevance_scorer
@@ -86,6 +97,7 @@ class ResearchItemScorer:
         self._source_quality = source_quality_scorer
         self._engagement = engagement_scorer
         self._compliance = compliance_adjuster
+        self._batch_executor = batch_executor
 
     def calculate_score(self, item: dict[str, Any]) -> ScoringResult:
         """Calculate composite score for a research item.
@@ -112,7 +124,7 @@ class ResearchItemScorer:
         engagement_score.weighted_score = engagement_score.raw_score * weights.engagement
 
         # Calculate compliance base score (default to 5 for neutral contribution)
-        compliance_base = 5.0 * weights.compliance
+        compliance_base = COMPLIANCE_BASE_SCORE * weights.compliance
 
         # Calculate weighted average
         weighted_sum = (
@@ -128,7 +140,7 @@ class ResearchItemScorer:
         final_score = self._compliance.apply_adjustment(weighted_sum, compliance_adjustment)
 
         # Ensure score is in valid range
-        final_score = max(MIN_FINAL_SCORE, min(MAX_FINAL_SCORE, round(final_score, 2)))
+        final_score = max(MIN_FINAL_SCORE, min(MAX_FINAL_SCORE, round_score(final_score)))
 
         # Build component scores dictionary
         component_scores = {
@@ -147,10 +159,14 @@ class ResearchItemScorer:
         )
 
         logger.info(
-            f"Scored item {item.get('id', 'unknown')}: {final_score} "
-            f"(rel={relevance_score.raw_score}, rec={recency_score.raw_score}, "
-            f"sq={source_quality_score.raw_score}, eng={engagement_score.raw_score}, "
-            f"comp={compliance_adjustment.adjustment})"
+            "Scored item %s: %s (rel=%s, rec=%s, sq=%s, eng=%s, comp=%s)",
+            item.get("id", "unknown"),
+            final_score,
+            relevance_score.raw_score,
+            recency_score.raw_score,
+            source_quality_score.raw_score,
+            engagement_score.raw_score,
+            compliance_adjustment.adjustment,
         )
 
         return ScoringResult(
@@ -160,6 +176,176 @@ class ResearchItemScorer:
             scored_at=datetime.now(timezone.utc),
         )
 
+    def calculate_scores(self, items: Sequence[dict[str, Any]]) -> BatchScoringResult:
+        """Calculate composite scores for a batch of research items.
+
+        Computes every component as a NumPy array and combines them with
+        per-source weight vectors, producing the same scores as calling
+        calculate_score() per item. Notes and reasoning are not built here;
+        call result(i) on the returned batch to materialize them.
+
+        Args:
+            items: Dictionaries with research item fields.
+
+        Returns:
+            BatchScoringResult with one entry per item, in input order.
+        """
+        now = datetime.now(timezone.utc)
+
+        relevance = self._relevance.score_batch(items)
+        recency = self._recency.score_batch(items, now=now)
+        source_quality = self._source_quality.score_batch(items)
+        engagement = self._engagement.score_batch(items)
+        weights = self._weight_matrix(items)
+
+        # Same summation order as calculate_score for identical results
+        weighted_sums = (
+            relevance * weights[:, 0]
+            + recency * weights[:, 1]
+            + source_quality * weights[:, 2]
+            + engagement * weights[:, 3]
+            + COMPLIANCE_BASE_SCORE * weights[:, 4]
+        )
+
+        adjustments, rejected = self._compliance.adjust_batch(items)
+        final_scores = np.minimum(weighted_sums + adjustments, MAX_FINAL_SCORE)
+        final_scores[rejected] = MIN_FINAL_SCORE
+        final_scores = np.clip(round_score(final_scores), MIN_FINAL_SCORE, MAX_FINAL_SCORE)
+
+        logger.info(
+            "Scored batch of %d items (mean=%.2f, rejected=%d)",
+            len(items),
+            float(final_scores.mean()) if len(items) else 0.0,
+            int(rejected.sum()),
+        )
+
+        return BatchScoringResult(
+            final_scores=final_scores,
+            relevance=relevance,
+            recency=recency,
+            source_quality=source_quality,
+            engagement=engagement,
+            weights=weights,
+            weighted_sums=weighted_sums,
+            compliance_adjustments=adjustments,
+            rejected=rejected,
+            scored_at=now,
+            items=items,
+            materializer=self._materialize_result,
+        )
+
+    async def calculate_score_batch(self, items: Sequence[dict[str, Any]]) -> list[ScoringResult]:
+        """Calculate full ScoringResults for many items, for backfills.
+
+        Runs calculate_score() per item on the injected batch executor's
+        worker processes, so the event loop stays free. Without an executor
+        the items are scored inline, yielding between chunks. Use
+        calculate_scores() when only the score arrays are needed.
+
+        Args:
+            items: Dictionaries with research item fields.
+
+        Returns:
+            ScoringResult per item, in input order.
+        """
+        return await map_batch(self._batch_executor, self, "calculate_score", items)
+
+    def worker_spec(self) -> WorkerSpec:
+        """Rebuild this scorer from its config and components in a worker process."""
+        return WorkerSpec(
+            ResearchItemScorer,
+            (
+                self._config,
+                self._relevance,
+                self._recency,
+                self._source_quality,
+                self._engagement,
+                self._compliance,
+            ),
+        )
+
+    def _weight_matrix(self, items: Sequence[dict[str, Any]]) -> np.ndarray:
+        """Build the (n, 5) per-item weight matrix from per-source weights.
+
+        Args:
+            items: Dictionaries with 'source' field.
+
+        Returns:
+            Weight matrix with columns (relevance, recency, source_quality,
+            engagement, compliance).
+        """
+        rows_by_source: dict[str, tuple[float, ...]] = {}
+        rows = []
+        for item in items:
+            source = item.get("source", "").lower()
+            row = rows_by_source.get(source)
+            if row is None:
+                row = self._weight_vector(self._config.get_weights_for_source(source))
+                rows_by_source[source] = row
+            rows.append(row)
+
+        if not rows:
+            return np.empty((0, 5), dtype=np.float64)
+        return np.array(rows, dtype=np.float64)
+
+    @staticmethod
+    def _weight_vector(weights: ScoringWeights) -> tuple[float, ...]:
+        """Flatten ScoringWeights into weight matrix column order."""
+        return (
+            weights.relevance,
+            weights.recency,
+            weights.source_quality,
+            weights.engagement,
+            weights.compliance,
+        )
+
+    def _materialize_result(self, batch: BatchScoringResult, index: int) -> ScoringResult:
+        """Build a full ScoringResult for one item of a scored batch.
+
+        Raw scores come from the batch arrays; notes are produced by the
+        component scorers on demand.
+
+        Args:
+            batch: Result of calculate_scores().
+            index: Position of the item in the batch.
+
+        Returns:
+            ScoringResult with component breakdown and reasoning.
+        """
+        item = batch.items[index]
+        weights = batch.weights[index]
+        components = (
+            ("relevance", batch.relevance, self._relevance),
+            ("recency", batch.recency, self._recency),
+            ("source_quality", batch.source_quality, self._source_quality),
+            ("engagement", batch.engagement, self._engagement),
+        )
+
+        component_scores: dict[str, ComponentScore] = {}
+        for column, (name, raw_scores, component) in enumerate(components):
+            raw_score = float(raw_scores[index])
+            component_scores[name] = ComponentScore(
+                component_name=name,
+                raw_score=raw_score,
+                weighted_score=raw_score * float(weights[column]),
+                notes=component.score(item).notes,
+            )
+
+        final_score = float(batch.final_scores[index])
+        reasoning = self._build_reasoning(
+            final_score,
+            float(batch.weighted_sums[index]),
+            component_scores,
+            self._compliance.adjust(item),
+        )
+
+        return ScoringResult(
+            final_score=final_score,
+            component_scores=component_scores,
+            reasoning=reasoning,
+            scored_at=batch.scored_at,
+        )
+
     def _build_reasoning(
         self,
         final_score: float,
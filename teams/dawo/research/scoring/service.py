@@ -9,16 +9,20 @@ This service is registered in team_spec.py and injectable via Team Builder.
 from __future__ import annotations
 
 import logging
-from typing import Any
+import time
+from typing import Any, Awaitable, Callable, Optional
 from uuid import UUID
 
-from ..repository import ResearchPoolRepository
+from ..repository import ResearchPoolRepository, STREAM_CHUNK_SIZE
 from .scorer import ResearchItemScorer
-from .schemas import ScoringResult
+from .schemas import ScoringResult, RescoreResult
 from ..exceptions import ItemNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Items scored and written back per chunk during whole-pool rescoring
+DEFAULT_RESCORE_CHUNK_SIZE = STREAM_CHUNK_SIZE
+
 
 class ResearchScoringService:
     """Service for scoring research items and updating the Research Pool.
@@ -80,6 +84,74 @@ class ResearchScoringService:
 
         return result
 
+    async def rescore_pool(
+        self,
+        chunk_size: int = DEFAULT_RESCORE_CHUNK_SIZE,
+        progress_callback: Optional[Callable[[RescoreResult], Awaitable[None]]] = None,
+    ) -> RescoreResult:
+        """Rescore every item in the Research Pool.
+
+        Recency decays as items age, so stored scores go stale. This walks
+        the pool in batches of chunk_size items (keyset pagination by id),
+        scores each batch with the vectorized
+        ResearchItemScorer.calculate_scores, and writes it back with one
+        UPDATE ... FROM (VALUES ...), committed per batch. No transaction
+        stays open for the whole run; a failed run keeps the batches it
+        already wrote, and rerunning recomputes every score anyway.
+
+        Args:
+            chunk_size: Items scored and written per batch.
+            progress_callback: Awaited with the running RescoreResult after
+                every batch.
+
+        Returns:
+            RescoreResult with counts, elapsed time, and throughput.
+
+        Raises:
+            DatabaseError: If reading or updating fails.
+        """
+        result = RescoreResult()
+        started = time.perf_counter()
+        after_id: Optional[UUID] = None
+
+        while True:
+            rows = await self._repository.fetch_scoring_rows(after_id=after_id, limit=chunk_size)
+            if not rows:
+                break
+
+            batch = self._scorer.calculate_scores(rows)
+            scores = [
+                (row["id"], float(score))
+                for row, score in zip(rows, batch.final_scores)
+            ]
+            result.updated += await self._repository.bulk_update_scores(scores)
+            result.scanned += len(rows)
+            result.chunks += 1
+            result.elapsed_seconds = time.perf_counter() - started
+            after_id = rows[-1]["id"]
+
+            logger.info(
+                "Rescore progress: %d items scanned, %d updated (%.1f items/s)",
+                result.scanned,
+                result.updated,
+                result.items_per_second,
+            )
+            if progress_callback is not None:
+                await progress_callback(result)
+            if len(rows) < chunk_size:
+                break
+
+        result.elapsed_seconds = time.perf_counter() - started
+
+        logger.info(
+            "Rescored research pool: %d items, %d updated in %.2fs (%.1f items/s)",
+            result.scanned,
+            result.updated,
+            result.elapsed_seconds,
+            result.items_per_second,
+        )
+        return result
+
     async def score_item(self, item: Any) -> ScoringResult:
         """Score a research item without updating the database.
 
@@ -0,0 +1,265 @@
+"""Cross-run seen-item store for scanner discovery.
+
+Scanners dedupe within a single run, but without this store every run
+re-harvests, re-summarizes and re-validates items already in the Research
+Pool. SeenItemStore lets a scanner drop those items right after discovery,
+before any harvester API call or LLM stage sees them.
+
+Lookup tiers:
+- Bloom filter (Redis bitmap, one per source): a negative answer means the
+  item was never discovered before, so no database query is needed
+- Research Pool (Postgres): every Bloom positive is confirmed against
+  research_items (source, source_key), which stays the source of truth
+
+Every looked-up key is added to the Bloom filter. Keys of items that never
+reach the pool (failed runs, rejected items) only cause Bloom positives,
+which the Postgres check resolves - so they are re-harvested, never lost.
+
+A source's Bloom filter is seeded from the pool on first use. Without
+Redis (or when it fails) every key is checked in Postgres; if Postgres
+also fails, all items are treated as new so scanning never stops.
+
+Architecture Compliance:
+- Repository and Redis client injected via constructor
+- Graceful degradation when Redis or the database is unavailable
+
+Usage:
+    store = SeenItemStore(ResearchPoolRepository(session), redis_client)
+    scanner = PubMedScanner(config, client, seen_store=store)
+
+    # Inside a scanner
+    seen = await store.find_seen(ResearchSource.PUBMED, candidate_urls)
+"""
+
+import hashlib
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from .models import ResearchSource
+from .repository import ResearchPoolRepository, STREAM_CHUNK_SIZE
+
+
+# Module logger
+logger = logging.getLogger(__name__)
+
+# Bloom filter sizing (per source): ~1.2 MB bitmap for 1M keys at 1% FPR
+DEFAULT_BLOOM_CAPACITY = 1_000_000
+DEFAULT_BLOOM_ERROR_RATE = 0.01
+SEEN_STORE_KEY_PREFIX = "dawo:seen"
+
+
+def bloom_parameters(capacity: int, error_rate: float) -> tuple[int, int]:
+    """Size a Bloom filter for a capacity and false positive rate.
+
+    Args:
+        capacity: Expected number of keys
+        error_rate: Target false positive rate (0 < error_rate < 1)
+
+    Returns:
+        Tuple of (bit count, hash function count)
+
+    Raises:
+        ValueError: If capacity or error_rate is out of range
+    """
+    if capacity <= 0:
+        raise ValueError("capacity must be positive")
+    if not 0 < error_rate < 1:
+        raise ValueError("error_rate must be between 0 and 1")
+
+    bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+
+def bloom_offsets(key: str, bits: int, hashes: int) -> list[int]:
+    """Bit offsets for a key, using double hashing over one digest.
+
+    Args:
+        key: Item key
+        bits: Bloom filter size in bits
+        hashes: Number of hash functions
+
+    Returns:
+        List of hashes bit offsets in [0, bits)
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:], "big") | 1
+    return [(h1 + i * h2) % bits for i in range(hashes)]
+
+
+@dataclass
+class SeenStoreStats:
+    """Counters for a SeenItemStore.
+
+    Attributes:
+        lookups: Keys checked
+        bloom_negatives: Keys answered as new by the Bloom filter alone
+        database_checks: Keys confirmed against the Research Pool
+        seen: Keys found already ingested
+        errors: Redis or database failures (degraded, not raised)
+    """
+
+    lookups: int = 0
+    bloom_negatives: int = 0
+    database_checks: int = 0
+    seen: int = 0
+    errors: int = 0
+
+
+class SeenItemStore:
+    """Persistent seen-set consulted by scanners after discovery.
+
+    Attributes:
+        stats: Lookup counters
+        _repository: Research Pool repository (Postgres fallback)
+        _redis: Async Redis client holding the Bloom bitmaps, or None
+        _bits: Bloom filter size in bits
+        _hashes: Bloom hash function count
+        _prefix: Redis key namespace
+    """
+
+    def __init__(
+        self,
+        repository: ResearchPoolRepository,
+        redis_client: Optional[Any] = None,
+        capacity: int = DEFAULT_BLOOM_CAPACITY,
+        error_rate: float = DEFAULT_BLOOM_ERROR_RATE,
+        prefix: str = SEEN_STORE_KEY_PREFIX,
+    ) -> None:
+        """Initialize with injected repository and optional Redis client.
+
+        Args:
+            repository: Research Pool repository for authoritative checks
+            redis_client: Async Redis client, or None for Postgres-only lookups
+            capacity: Expected keys per source (Bloom sizing)
+            error_rate: Target Bloom false positive rate
+            prefix: Redis key namespace
+        """
+        self._repository = repository
+        self._redis = redis_client
+        self._bits, self._hashes = bloom_parameters(capacity, error_rate)
+        self._prefix = prefix
+        self.stats = SeenStoreStats()
+
+    def _bloom_key(self, source: ResearchSource) -> str:
+        """Redis bitmap key for a source's Bloom filter."""
+        return f"{self._prefix}:{source.value}:bloom"
+
+    def _seeded_key(self, source: ResearchSource) -> str:
+        """Redis marker set once a source's Bloom filter holds the pool."""
+        return f"{self._prefix}:{source.value}:seeded"
+
+    async def find_seen(
+        self,
+        source: ResearchSource,
+        keys: Sequence[str],
+    ) -> set[str]:
+        """Return the keys whose items are already in the Research Pool.
+
+        Also records every key in the Bloom filter for later runs.
+
+        Args:
+            source: Research source the keys belong to
+            keys: Source keys of discovered items (the source_key each item
+                will be published with)
+
+        Returns:
+            Subset of keys already ingested
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return set()
+        self.stats.lookups += len(unique_keys)
+
+        candidates = await self._bloom_candidates(source, unique_keys)
+        self.stats.bloom_negatives += len(unique_keys) - len(candidates)
+
+        seen: set[str] = set()
+        if candidates:
+            self.stats.database_checks += len(candidates)
+            try:
+                seen = await self._repository.find_existing_source_keys(source, candidates)
+            except Exception as e:
+                self.stats.errors += 1
+                logger.warning(
+                    "Seen-item lookup failed for %s, treating %d items as new: %s",
+                    source.value,
+                    len(candidates),
+                    e,
+                )
+
+        self.stats.seen += len(seen)
+        logger.info(
+            "Seen-item check for %s: %d keys, %d already ingested",
+            source.value,
+            len(unique_keys),
+            len(seen),
+        )
+        return seen
+
+    async def rebuild(self, source: ResearchSource) -> int:
+        """Load every source key of a source into its Bloom filter.
+
+        Args:
+            source: Research source to seed
+
+        Returns:
+            Number of keys added
+        """
+        added = 0
+        async for keys in self._repository.stream_source_keys(source, STREAM_CHUNK_SIZE):
+            await self._set_bits(source, keys)
+            added += len(keys)
+
+        await self._redis.set(self._seeded_key(source), 1)
+        logger.info("Seeded %s seen-item filter with %d keys", source.value, added)
+        return added
+
+    async def _bloom_candidates(
+        self,
+        source: ResearchSource,
+        keys: list[str],
+    ) -> list[str]:
+        """Keys that may have been seen, recording all keys in the filter.
+
+        Falls back to all keys (every one checked in Postgres) when Redis
+        is not configured or fails.
+        """
+        if self._redis is None:
+            return keys
+
+        try:
+            if not await self._redis.exists(self._seeded_key(source)):
+                await self.rebuild(source)
+
+            pipe = self._redis.pipeline(transaction=False)
+            for key in keys:
+                for offset in bloom_offsets(key, self._bits, self._hashes):
+                    pipe.getbit(self._bloom_key(source), offset)
+            bits = await pipe.execute()
+
+            candidates = [
+                key
+                for i, key in enumerate(keys)
+                if all(bits[i * self._hashes:(i + 1) * self._hashes])
+            ]
+            await self._set_bits(source, keys)
+            return candidates
+
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning("Seen-item Bloom filter unavailable, checking database: %s", e)
+            return keys
+
+    async def _set_bits(self, source: ResearchSource, keys: Sequence[str]) -> None:
+        """Add keys to a source's Bloom filter."""
+        if not keys:
+            return
+        pipe = self._redis.pipeline(transaction=False)
+        for key in keys:
+            for offset in bloom_offsets(key, self._bits, self._hashes):
+                pipe.setbit(self._bloom_key(source), offset, 1)
+        await pipe.execute()
@@ -92,6 +92,7 @@ from .config import (
     # Config constants
     INSTAGRAM_RATE_LIMIT_PER_HOUR,
     INSTAGRAM_MAX_RESULTS_PER_CALL,
+    INSTAGRAM_MAX_BATCH_SIZE,
     DEFAULT_HASHTAGS,
     DEFAULT_HOURS_BACK,
     DEFAULT_MAX_POSTS_PER_HASHTAG,
@@ -143,6 +144,7 @@ __all__ = [
     # Config constants
     "INSTAGRAM_RATE_LIMIT_PER_HOUR",
     "INSTAGRAM_MAX_RESULTS_PER_CALL",
+    "INSTAGRAM_MAX_BATCH_SIZE",
     "DEFAULT_HASHTAGS",
     "DEFAULT_HOURS_BACK",
     "DEFAULT_MAX_POSTS_PER_HASHTAG",
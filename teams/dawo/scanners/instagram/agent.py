@@ -13,7 +13,7 @@ Registration: team_spec.py with tier="scan" (maps to fast model at runtime)
 
 Usage:
     # Created by Team Builder with injected dependencies
-    scanner = InstagramScanner(config, client)
+    scanner = InstagramScanner(config, client, seen_store=seen_store)
 
     # Execute scan stage
     result = await scanner.scan()
@@ -24,6 +24,8 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
+from teams.dawo.research import ResearchSource, SeenItemStore
+
 from .config import InstagramScannerConfig
 from .schemas import RawInstagramPost, ScanResult, ScanStatistics
 from .tools import InstagramClient, InstagramAPIError, InstagramScanError
@@ -32,6 +34,10 @@ from .tools import InstagramClient, InstagramAPIError, InstagramScanError
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Shard source prefixes (sources() mixes hashtags and accounts)
+HASHTAG_SOURCE_PREFIX = "#"
+ACCOUNT_SOURCE_PREFIX = "@"
+
 
 class InstagramScanner:
     """Instagram Trend Scanner - discovers content from Instagram.
@@ -45,44 +51,90 @@ class InstagramScanner:
         - Competitor account monitoring
         - Time-based filtering (configurable hours back)
         - Deduplication by media ID
+        - Cross-run skipping of posts already in the Research Pool
+        - Shardable by hashtag/account for distributed scans (sources())
 
     Configuration is injected via constructor - NEVER loads files directly.
 
     Attributes:
         _config: Scanner configuration (hashtags, competitors, filters)
         _client: Instagram API client for making requests
+        _seen_store: Optional cross-run seen-item store
     """
 
+    # ScanResult field holding discovered items (sharded scans)
+    SHARD_ITEMS_FIELD = "posts"
+
     def __init__(
         self,
         config: InstagramScannerConfig,
         client: InstagramClient,
+        seen_store: Optional[SeenItemStore] = None,
     ):
         """Initialize scanner with injected dependencies.
 
         Args:
             config: Scanner configuration from Team Builder
             client: Instagram API client with credentials
+            seen_store: Optional store used to skip posts ingested by
+                earlier runs (None = dedupe within this run only)
         """
         self._config = config
         self._client = client
+        self._seen_store = seen_store
 
-    async def scan(self) -> ScanResult:
+    def sources(self) -> list[str]:
+        """Hashtags ("#tag") and accounts ("@name") a scan covers.
+
+        Each source is scannable as its own shard.
+        """
+        return [
+            f"{HASHTAG_SOURCE_PREFIX}{hashtag}" for hashtag in self._config.hashtags
+        ] + [
+            f"{ACCOUNT_SOURCE_PREFIX}{account}"
+            for account in self._config.competitor_accounts
+        ]
+
+    @staticmethod
+    def shard_key(post: RawInstagramPost) -> str:
+        """Deduplication key of a post across shards."""
+        return post.media_id
+
+    async def scan(self, sources: Optional[list[str]] = None) -> ScanResult:
         """Execute the scan stage - discover Instagram posts.
 
         Iterates through configured hashtags and competitor accounts,
         collecting posts that meet the filtering criteria.
 
+        Args:
+            sources: Hashtags/accounts to scan, as returned by sources()
+                (a shard); None scans every configured hashtag and account
+
         Returns:
             ScanResult with discovered posts and statistics
 
         Raises:
             InstagramScanError: If critical error prevents scanning
         """
+        if sources is None:
+            hashtags = self._config.hashtags
+            accounts = self._config.competitor_accounts
+        else:
+            hashtags = [
+                source[len(HASHTAG_SOURCE_PREFIX):]
+                for source in sources
+                if source.startswith(HASHTAG_SOURCE_PREFIX)
+            ]
+            accounts = [
+                source[len(ACCOUNT_SOURCE_PREFIX):]
+                for source in sources
+                if source.startswith(ACCOUNT_SOURCE_PREFIX)
+            ]
+
         logger.info(
             "Starting Instagram scan: %d hashtags, %d competitors, hours_back=%d",
-            len(self._config.hashtags),
-            len(self._config.competitor_accounts),
+            len(hashtags),
+            len(accounts),
             self._config.hours_back,
         )
 
@@ -93,7 +145,7 @@ class InstagramScanner:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=self._config.hours_back)
 
         # Search hashtags
-        for hashtag in self._config.hashtags:
+        for hashtag in hashtags:
             stats.hashtags_searched += 1
 
             try:
@@ -117,7 +169,7 @@ class InstagramScanner:
                 # Continue with other hashtags
 
         # Monitor competitor accounts
-        for account in self._config.competitor_accounts:
+        for account in accounts:
             stats.accounts_monitored += 1
 
             try:
@@ -140,19 +192,48 @@ class InstagramScanner:
                 errors.append(error_msg)
                 # Continue with other accounts
 
+        posts = await self._drop_seen(list(all_posts.values()), stats)
+
         logger.info(
-            "Scan complete: %d posts found, %d after filtering, %d unique",
+            "Scan complete: %d posts found, %d after filtering, %d unique, %d new",
             stats.total_posts_found,
             stats.posts_after_filter,
             len(all_posts),
+            len(posts),
         )
 
         return ScanResult(
-            posts=list(all_posts.values()),
+            posts=posts,
             statistics=stats,
             errors=errors,
         )
 
+    async def _drop_seen(
+        self,
+        posts: list[RawInstagramPost],
+        stats: ScanStatistics,
+    ) -> list[RawInstagramPost]:
+        """Drop posts already published by an earlier run.
+
+        Posts are keyed by permalink, the URL the transformer publishes.
+
+        Args:
+            posts: Unique posts discovered in this run
+            stats: Scan statistics to update
+
+        Returns:
+            Posts not yet in the Research Pool
+        """
+        if self._seen_store is None or not posts:
+            return posts
+
+        seen = await self._seen_store.find_seen(
+            ResearchSource.INSTAGRAM,
+            [post.permalink for post in posts],
+        )
+        stats.already_seen = len(seen)
+        return [post for post in posts if post.permalink not in seen]
+
     async def _search_hashtag(
         self,
         hashtag: str,
@@ -250,4 +331,7 @@ class InstagramScanner:
             media_type=result.get("media_type", "IMAGE"),
             hashtag_source=hashtag_source,
             is_competitor=is_competitor,
+            like_count=result.get("like_count"),
+            comments_count=result.get("comments_count"),
+            username=result.get("username"),
         )
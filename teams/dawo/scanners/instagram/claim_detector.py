@@ -23,6 +23,9 @@ import json
 import logging
 from typing import Any, Optional, Protocol
 
+from teams.dawo.config import TaskType
+from teams.dawo.middleware.llm_cache import LLMResponseCache, cached_generate, template_id
+
 from .schemas import (
     HarvestedPost,
     DetectedClaim,
@@ -35,6 +38,11 @@ from .prompts import HEALTH_CLAIM_DETECTION_PROMPT
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Response cache key component - changes whenever the prompt text changes
+HEALTH_CLAIM_DETECTION_TEMPLATE_ID = template_id(
+    "instagram.health_claim_detection", HEALTH_CLAIM_DETECTION_PROMPT
+)
+
 
 class LLMClientProtocol(Protocol):
     """Protocol for LLM client dependency injection."""
@@ -93,21 +101,25 @@ class HealthClaimDetector:
     Attributes:
         _llm: LLM client for claim detection
         _patterns: Compliance patterns from config (optional)
+        _cache: Optional LLM response cache
     """
 
     def __init__(
         self,
         llm_client: LLMClientProtocol,
         compliance_patterns: Optional[dict[str, Any]] = None,
+        response_cache: Optional[LLMResponseCache] = None,
     ):
         """Initialize health claim detector with injected dependencies.
 
         Args:
             llm_client: LLM client configured for tier="generate"
             compliance_patterns: Optional compliance patterns from config
+            response_cache: Optional cache for repeated captions
         """
         self._llm = llm_client
         self._patterns = compliance_patterns or {}
+        self._cache = response_cache
 
     async def detect_claims(
         self,
@@ -138,22 +150,24 @@ class HealthClaimDetector:
             )
 
         # Format prompt
-        formatted_prompt = HEALTH_CLAIM_DETECTION_PROMPT.format(
-            account_name=account_name,
-            is_competitor=str(is_competitor).lower(),
-            caption=caption[:5000],  # Truncate very long captions
-        )
+        inputs = {
+            "account_name": account_name,
+            "is_competitor": str(is_competitor).lower(),
+            "caption": caption[:5000],  # Truncate very long captions
+        }
+        formatted_prompt = HEALTH_CLAIM_DETECTION_PROMPT.format(**inputs)
 
         try:
-            # Call LLM
-            response = await self._llm.generate(
-                prompt=formatted_prompt,
-                max_tokens=800,
+            # Call LLM (or reuse a cached response), then parse JSON
+            return await cached_generate(
+                self._cache,
+                template=HEALTH_CLAIM_DETECTION_TEMPLATE_ID,
+                tier=TaskType.GENERATE.value,
+                inputs={**inputs, "max_tokens": 800},
+                generate=lambda: self._llm.generate(prompt=formatted_prompt, max_tokens=800),
+                parse=self._parse_response,
             )
 
-            # Parse JSON response
-            return self._parse_response(response)
-
         except json.JSONDecodeError as e:
             logger.warning("Failed to parse LLM response as JSON: %s", e)
             # Return clean result on parse failure
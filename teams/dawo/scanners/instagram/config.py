@@ -24,6 +24,7 @@ from dataclasses import dataclass, field
 # Instagram Graph API constants
 INSTAGRAM_RATE_LIMIT_PER_HOUR = 200  # Business account rate limit
 INSTAGRAM_MAX_RESULTS_PER_CALL = 30  # Instagram API caps at 30
+INSTAGRAM_MAX_BATCH_SIZE = 50  # Graph API batch request cap
 
 # Default scanner configuration
 DEFAULT_HASHTAGS = [
@@ -5,7 +5,8 @@ Implements the harvest stage of the Harvester Framework:
 
 The InstagramHarvester:
     1. Takes raw posts from scanner
-    2. Fetches full caption and engagement metrics
+    2. Uses caption and engagement metrics the search already returned,
+       fetching the rest in Graph API batch requests
     3. Extracts hashtags from caption
     4. Returns HarvestedPost objects with complete metadata
 
@@ -62,7 +63,7 @@ class InstagramHarvester:
     This is intentional for privacy/copyright compliance with Meta's ToS.
 
     Features:
-        - Full caption retrieval
+        - Full caption retrieval (batched; skipped when prefetched)
         - Engagement metrics (likes, comments)
         - Hashtag extraction
         - Account metadata
@@ -89,7 +90,8 @@ class InstagramHarvester:
         """Harvest full details for raw posts.
 
         Takes raw posts from scanner and enriches them with
-        complete metadata from the Instagram API.
+        complete metadata from the Instagram API. Posts the search already
+        described fully cost no call; the rest are looked up in batches.
 
         Args:
             raw_posts: List of raw posts from scanner
@@ -103,25 +105,39 @@ class InstagramHarvester:
         """
         logger.info("Starting harvest for %d posts", len(raw_posts))
 
+        # Posts from field-expanded searches need no lookup; batch the rest
+        pending = [post.media_id for post in raw_posts if not post.has_details]
+        fetched: dict[str, dict] = {}
+        if pending:
+            try:
+                fetched = await self._client.get_media_details_batch(pending)
+            except InstagramAPIError as e:
+                logger.warning("Batch detail lookup failed for %d posts: %s", len(pending), e)
+
         harvested: list[HarvestedPost] = []
         failed_count = 0
 
         for raw_post in raw_posts:
-            try:
-                post = await self._harvest_post(raw_post)
-                if post:
-                    harvested.append(post)
-            except InstagramAPIError as e:
-                logger.warning("Failed to harvest post %s: %s", raw_post.media_id, e)
+            if raw_post.has_details:
+                details = self._prefetched_details(raw_post)
+            else:
+                details = fetched.get(raw_post.media_id)
+            if details is None:
+                logger.warning("No details returned for post %s", raw_post.media_id)
                 failed_count += 1
-                # Continue with remaining posts
-            except Exception as e:
-                logger.error("Unexpected error harvesting post %s: %s", raw_post.media_id, e)
+                continue
+
+            post = self._build_post(raw_post, details)
+            if post:
+                harvested.append(post)
+            else:
                 failed_count += 1
-                # Continue with remaining posts
 
         logger.info(
-            "Harvest complete: %d successful, %d failed", len(harvested), failed_count
+            "Harvest complete: %d successful, %d failed (%d lookups)",
+            len(harvested),
+            failed_count,
+            len(pending),
         )
 
         return harvested
@@ -138,10 +154,47 @@ class InstagramHarvester:
         Returns:
             HarvestedPost with full metadata, or None if failed
         """
-        try:
-            # Fetch full media details
+        if raw_post.has_details:
+            details = self._prefetched_details(raw_post)
+        else:
+            # Fetch full media details (API errors propagate to the caller)
             details = await self._client.get_media_details(raw_post.media_id)
 
+        return self._build_post(raw_post, details)
+
+    def _prefetched_details(self, raw_post: RawInstagramPost) -> dict:
+        """Details already returned by a field-expanded search.
+
+        Args:
+            raw_post: Raw post with has_details set
+
+        Returns:
+            Dict shaped like a media detail response
+        """
+        return {
+            "caption": raw_post.caption,
+            "permalink": raw_post.permalink,
+            "like_count": raw_post.like_count or 0,
+            "comments_count": raw_post.comments_count,
+            "media_type": raw_post.media_type,
+            "username": raw_post.username,
+        }
+
+    def _build_post(
+        self,
+        raw_post: RawInstagramPost,
+        details: dict,
+    ) -> Optional[HarvestedPost]:
+        """Build a HarvestedPost from a raw post and its details.
+
+        Args:
+            raw_post: Raw post from scanner
+            details: Media details (fetched or prefetched)
+
+        Returns:
+            HarvestedPost with full metadata, or None if parsing failed
+        """
+        try:
             # Extract hashtags from caption
             caption = details.get("caption", raw_post.caption) or ""
             hashtags = extract_hashtags(caption)
@@ -162,9 +215,6 @@ class InstagramHarvester:
                 hashtag_source=raw_post.hashtag_source,
             )
 
-        except InstagramAPIError:
-            # Re-raise API errors for caller to handle
-            raise
         except Exception as e:
             logger.error("Error parsing post details for %s: %s", raw_post.media_id, e)
             return None
@@ -11,6 +11,7 @@ UNIQUE to Instagram:
 
 The pipeline chains all stages together with:
     - Statistics tracking through each stage
+    - Per-stage timing and external call telemetry
     - Graceful degradation on API failures
     - Rate limit exhaustion handling (wait until hour reset)
     - Partial failure handling (continue on item failures)
@@ -29,6 +30,16 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
+from teams.dawo.middleware.telemetry import (
+    PipelineTelemetry,
+    PipelineTelemetryStore,
+    get_telemetry_store,
+)
+from teams.dawo.middleware.checkpoint import (
+    PipelineCheckpointStore,
+    RunCheckpoint,
+    open_run_checkpoint,
+)
 from teams.dawo.research import (
     ResearchPublisher,
     TransformedResearch,
@@ -102,6 +113,8 @@ class InstagramResearchPipeline:
         _validator: InstagramValidator for compliance checking
         _scorer: ResearchItemScorer for relevance scoring
         _publisher: ResearchPublisher for database persistence
+        _telemetry_store: Rolling history that receives each run's telemetry
+        _checkpoint_store: Stage outputs kept so retried runs resume (optional)
     """
 
     def __init__(
@@ -112,6 +125,8 @@ class InstagramResearchPipeline:
         validator: InstagramValidator,
         scorer: ResearchItemScorer,
         publisher: ResearchPublisher,
+        telemetry_store: Optional[PipelineTelemetryStore] = None,
+        checkpoint_store: Optional[PipelineCheckpointStore] = None,
     ):
         """Initialize pipeline with injected stage components.
 
@@ -122,6 +137,8 @@ class InstagramResearchPipeline:
             validator: Compliance checking stage
             scorer: Relevance scoring stage
             publisher: Database persistence stage
+            telemetry_store: Run telemetry history (default: global store)
+            checkpoint_store: Stage checkpoints for resuming retries (default: none)
         """
         self._scanner = scanner
         self._harvester = harvester
@@ -129,14 +146,20 @@ class InstagramResearchPipeline:
         self._validator = validator
         self._scorer = scorer
         self._publisher = publisher
+        self._telemetry_store = telemetry_store or get_telemetry_store()
+        self._checkpoint_store = checkpoint_store
 
-    async def execute(self) -> PipelineResult:
+    async def execute(self, run_id: Optional[str] = None) -> PipelineResult:
         """Execute the complete pipeline.
 
         Runs all stages in sequence, tracking statistics and handling
         errors gracefully. Returns INCOMPLETE status on API failures
         and RATE_LIMITED on rate limit exhaustion (with retry_after).
 
+        Args:
+            run_id: Run id of a failed attempt (PipelineResult.run_id) to
+                resume from its checkpoints; None starts a new run
+
         Returns:
             PipelineResult with status, statistics, and published IDs
 
@@ -144,19 +167,26 @@ class InstagramResearchPipeline:
             - COMPLETE: All stages ran successfully
             - INCOMPLETE: Instagram API failure, retry scheduled
             - PARTIAL: Some items failed but pipeline completed
-            - FAILED: Critical error, no retry
+            - FAILED: Nothing published; retry scheduled only if publish failed
             - RATE_LIMITED: Hourly rate limit exhausted, retry in ~1 hour
         """
+        checkpoint = await open_run_checkpoint(self._checkpoint_store, "instagram", run_id)
+        return await checkpoint.settle(await self._execute(checkpoint))
+
+    async def _execute(self, checkpoint: RunCheckpoint) -> PipelineResult:
+        """Run the stages, reusing checkpointed outputs of earlier attempts."""
         logger.info("Starting Instagram Research Pipeline execution")
 
         stats = PipelineStatistics()
+        telemetry = PipelineTelemetry(pipeline="instagram")
         published_ids: list[UUID] = []
 
         try:
             # Stage 1: Scan - Discover posts
             logger.info("Stage 1/6: Scanning Instagram")
-            scan_result = await self._scanner.scan()
-            stats.total_found = len(scan_result.posts)
+            with telemetry.stage("scan") as stage:
+                scan_result = await checkpoint.run("scan", self._scanner.scan)
+            stats.total_found = stage.items_out = len(scan_result.posts)
             stats.api_calls_made = scan_result.statistics.api_calls_made
             logger.info("Scan complete: %d posts found", stats.total_found)
 
@@ -165,12 +195,16 @@ class InstagramResearchPipeline:
                 return PipelineResult(
                     status=PipelineStatus.COMPLETE,
                     statistics=stats,
+                    telemetry=telemetry,
                 )
 
             # Stage 2: Harvest - Enrich with metadata
             logger.info("Stage 2/6: Harvesting post metadata")
-            harvested = await self._harvester.harvest(scan_result.posts)
-            stats.harvested = len(harvested)
+            with telemetry.stage("harvest", items_in=stats.total_found) as stage:
+                harvested = await checkpoint.run(
+                    "harvest", self._harvester.harvest, scan_result.posts
+                )
+            stats.harvested = stage.items_out = len(harvested)
             logger.info("Harvest complete: %d posts enriched", stats.harvested)
 
             if not harvested:
@@ -178,12 +212,16 @@ class InstagramResearchPipeline:
                 return PipelineResult(
                     status=PipelineStatus.COMPLETE,
                     statistics=stats,
+                    telemetry=telemetry,
                 )
 
             # Stage 3: Transform - Convert to Research Pool schema (includes LLM stages)
             logger.info("Stage 3/6: Transforming to Research Pool schema (with theme + claim extraction)")
-            transformed = await self._transformer.transform(harvested)
-            stats.transformed = len(transformed)
+            with telemetry.stage("transform", items_in=stats.harvested) as stage:
+                transformed = await checkpoint.run(
+                    "transform", self._transformer.transform, harvested
+                )
+            stats.transformed = stage.items_out = len(transformed)
 
             # Count themes and claims from metadata
             stats.themes_extracted = sum(
@@ -205,21 +243,28 @@ class InstagramResearchPipeline:
 
             # Stage 4: Validate - Check EU compliance
             logger.info("Stage 4/6: Validating EU compliance")
-            validated = await self._validator.validate(transformed)
-            stats.validated = len(validated)
+            with telemetry.stage("validate", items_in=stats.transformed) as stage:
+                validated = await checkpoint.run(
+                    "validate", self._validator.validate, transformed
+                )
+            stats.validated = stage.items_out = len(validated)
             logger.info("Validation complete: %d items validated", stats.validated)
 
             # Stage 5: Score - Calculate relevance scores
             logger.info("Stage 5/6: Scoring research items")
-            scored = await self._score_items(validated)
-            stats.scored = len(scored)
+            with telemetry.stage("score", items_in=stats.validated) as stage:
+                scored = await self._score_items(validated)
+            stats.scored = stage.items_out = len(scored)
             logger.info("Scoring complete: %d items scored", stats.scored)
 
             # Stage 6: Publish - Save to Research Pool
             logger.info("Stage 6/6: Publishing to Research Pool")
-            publish_count, published_ids = await self._publish_items(scored)
-            stats.published = publish_count
+            with telemetry.stage("publish", items_in=stats.scored) as stage:
+                publish_count, published_ids = await self._publish_items(scored)
+            stats.published = stage.items_out = publish_count
             stats.failed = stats.scored - stats.published
+            # Retry a publish that stored nothing from the checkpoints, not from the scan
+            publish_failed = stats.scored > 0 and stats.published == 0
             logger.info("Publish complete: %d items published", stats.published)
 
             # Determine final status
@@ -235,7 +280,9 @@ class InstagramResearchPipeline:
             return PipelineResult(
                 status=status,
                 statistics=stats,
+                retry_scheduled=publish_failed,
                 published_ids=published_ids,
+                telemetry=telemetry,
             )
 
         except RateLimitError as e:
@@ -252,6 +299,7 @@ class InstagramResearchPipeline:
                 error=str(e),
                 retry_scheduled=True,
                 retry_after=retry_after,
+                telemetry=telemetry,
             )
 
         except InstagramAPIError as e:
@@ -264,6 +312,7 @@ class InstagramResearchPipeline:
                 statistics=stats,
                 error=str(e),
                 retry_scheduled=True,
+                telemetry=telemetry,
             )
 
         except Exception as e:
@@ -276,6 +325,9 @@ class InstagramResearchPipeline:
                 statistics=stats,
             ) from e
 
+        finally:
+            self._telemetry_store.record(telemetry.finish())
+
     async def _score_items(
         self,
         validated: list[ValidatedResearch],
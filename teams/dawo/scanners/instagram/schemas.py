@@ -30,6 +30,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from teams.dawo.middleware.telemetry import PipelineTelemetry
+
 
 class PipelineStatus(str, Enum):
     """Pipeline execution status.
@@ -79,6 +81,9 @@ class RawInstagramPost(BaseModel):
         media_type: Type of media (IMAGE, VIDEO, CAROUSEL_ALBUM)
         hashtag_source: Which hashtag search found this post (if any)
         is_competitor: Whether from a monitored competitor account
+        like_count: Likes, if returned by the search (None if hidden/absent)
+        comments_count: Comments, if returned by the search
+        username: Account username, if returned by the search
     """
 
     media_id: str = Field(..., description="Instagram media ID")
@@ -88,6 +93,17 @@ class RawInstagramPost(BaseModel):
     media_type: str = Field(default="IMAGE", description="Type of media")
     hashtag_source: Optional[str] = Field(default=None, description="Source hashtag")
     is_competitor: bool = Field(default=False, description="From competitor account")
+    like_count: Optional[int] = Field(default=None, ge=0, description="Prefetched likes")
+    comments_count: Optional[int] = Field(default=None, ge=0, description="Prefetched comments")
+    username: Optional[str] = Field(default=None, description="Prefetched account username")
+
+    @property
+    def has_details(self) -> bool:
+        """Whether the search returned everything the harvester needs.
+
+        like_count is not required - it is omitted when the owner hides likes.
+        """
+        return self.username is not None and self.comments_count is not None
 
     model_config = {"frozen": True}
 
@@ -257,6 +273,7 @@ class ScanStatistics:
         total_posts_found: Raw posts from API
         posts_after_filter: Posts meeting date criteria
         duplicates_removed: Posts deduplicated by media ID
+        already_seen: Posts already in the Research Pool from earlier runs
         api_calls_made: Total Instagram API calls
     """
 
@@ -265,6 +282,7 @@ class ScanStatistics:
     total_posts_found: int = 0
     posts_after_filter: int = 0
     duplicates_removed: int = 0
+    already_seen: int = 0
     api_calls_made: int = 0
 
 
@@ -328,6 +346,8 @@ class PipelineResult:
         retry_scheduled: True if queued for next cycle
         retry_after: Timestamp when retry is allowed (for rate limit)
         published_ids: UUIDs of successfully published items
+        telemetry: Per-stage timing, throughput and external calls
+        run_id: Run id; pass to execute() when retrying to resume
     """
 
     status: PipelineStatus
@@ -336,3 +356,5 @@ class PipelineResult:
     retry_scheduled: bool = False
     retry_after: Optional[datetime] = None
     published_ids: list[UUID] = field(default_factory=list)
+    telemetry: Optional[PipelineTelemetry] = None
+    run_id: Optional[str] = None
@@ -23,6 +23,9 @@ import json
 import logging
 from typing import Any, Optional
 
+from teams.dawo.config import TaskType
+from teams.dawo.middleware.llm_cache import LLMResponseCache, cached_generate, template_id
+
 from .schemas import ThemeResult, HarvestedPost
 from .prompts import (
     THEME_EXTRACTION_PROMPT,
@@ -34,6 +37,12 @@ from .prompts import (
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Response cache key components - change whenever the prompt text changes
+THEME_EXTRACTION_TEMPLATE_ID = template_id("instagram.theme_extraction", THEME_EXTRACTION_PROMPT)
+THEME_EXTRACTION_SHORT_TEMPLATE_ID = template_id(
+    "instagram.theme_extraction_short", THEME_EXTRACTION_SHORT_PROMPT
+)
+
 
 class ThemeExtractionError(Exception):
     """Exception raised for theme extraction errors.
@@ -71,15 +80,22 @@ class ThemeExtractor:
 
     Attributes:
         _llm: LLM client for theme extraction
+        _cache: Optional LLM response cache
     """
 
-    def __init__(self, llm_client: Any):
+    def __init__(
+        self,
+        llm_client: Any,
+        response_cache: Optional[LLMResponseCache] = None,
+    ):
         """Initialize theme extractor with injected dependencies.
 
         Args:
             llm_client: LLM client configured for tier="generate"
+            response_cache: Optional cache for repeated captions
         """
         self._llm = llm_client
+        self._cache = response_cache
 
     async def extract_themes(
         self,
@@ -114,27 +130,31 @@ class ThemeExtractor:
         # Choose prompt based on caption length
         if len(caption) < SHORT_CAPTION_THRESHOLD:
             prompt = THEME_EXTRACTION_SHORT_PROMPT
+            prompt_id = THEME_EXTRACTION_SHORT_TEMPLATE_ID
         else:
             prompt = THEME_EXTRACTION_PROMPT
+            prompt_id = THEME_EXTRACTION_TEMPLATE_ID
 
         # Format prompt
-        formatted_prompt = prompt.format(
-            account_name=account_name,
-            hashtags=", ".join(hashtags) if hashtags else "none",
-            caption_length=len(caption),
-            caption=caption[:5000],  # Truncate very long captions
-        )
+        inputs = {
+            "account_name": account_name,
+            "hashtags": ", ".join(hashtags) if hashtags else "none",
+            "caption_length": len(caption),
+            "caption": caption[:5000],  # Truncate very long captions
+        }
+        formatted_prompt = prompt.format(**inputs)
 
         try:
-            # Call LLM
-            response = await self._llm.generate(
-                prompt=formatted_prompt,
-                max_tokens=500,
+            # Call LLM (or reuse a cached response), then parse JSON
+            return await cached_generate(
+                self._cache,
+                template=prompt_id,
+                tier=TaskType.GENERATE.value,
+                inputs={**inputs, "max_tokens": 500},
+                generate=lambda: self._llm.generate(prompt=formatted_prompt, max_tokens=500),
+                parse=lambda response: self._parse_response(response, hashtags),
             )
 
-            # Parse JSON response
-            return self._parse_response(response, hashtags)
-
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse LLM response as JSON: {e}")
             # Return default result on parse failure
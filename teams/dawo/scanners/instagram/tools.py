@@ -4,6 +4,10 @@ Provides access to Instagram Graph API with:
     - InstagramClient: Instagram Graph API client
     - RateLimitTracker: Hourly rate limit management
 
+Calls are kept to a minimum: search responses request every field the
+harvester needs (field expansion), hashtag IDs are cached, and remaining
+per-post lookups are grouped into Graph API batch requests.
+
 ALL API calls go through retry middleware - NEVER make direct calls.
 
 CRITICAL: Instagram Graph API Limitations:
@@ -20,15 +24,19 @@ Usage:
     posts = await client.search_hashtag("lionsmane", limit=25)
 """
 
+import json
 import logging
 import re
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Protocol, runtime_checkable
+from typing import Any, Optional, Protocol, runtime_checkable
+
+from teams.dawo.middleware.telemetry import telemetry_event_hooks
 
 from .config import (
     InstagramClientConfig,
     INSTAGRAM_RATE_LIMIT_PER_HOUR,
     INSTAGRAM_MAX_RESULTS_PER_CALL,
+    INSTAGRAM_MAX_BATCH_SIZE,
 )
 
 
@@ -38,6 +46,11 @@ logger = logging.getLogger(__name__)
 # Instagram Graph API base URL
 INSTAGRAM_API_BASE = "https://graph.facebook.com/v19.0"
 
+# Media fields requested up front so the harvester rarely needs a lookup.
+# Hashtag media cannot return username; Business Discovery media can.
+MEDIA_FIELDS = "id,caption,permalink,timestamp,like_count,comments_count,media_type"
+MEDIA_DETAIL_FIELDS = f"{MEDIA_FIELDS},username"
+
 
 @runtime_checkable
 class RetryResultProtocol(Protocol):
@@ -130,6 +143,9 @@ class RateLimitTracker:
     Instagram Business accounts have a limit of 200 calls per hour.
     This class tracks usage and prevents exceeding the limit.
 
+    Meta counts every request inside a Graph API batch as its own call,
+    so a batch is charged its request count, not one.
+
     Attributes:
         _calls_this_hour: Calls made in current hour
         _hour_start: Start of current tracking hour
@@ -200,10 +216,12 @@ class InstagramClient:
         _retry: Retry middleware for API calls
         _rate_limit: Rate limit tracking instance
         _session: HTTPX async client
+        _hashtag_ids: Hashtag name -> Instagram hashtag ID (IDs never change)
     """
 
     BASE_URL = INSTAGRAM_API_BASE
     MAX_RESULTS = INSTAGRAM_MAX_RESULTS_PER_CALL
+    MAX_BATCH_SIZE = INSTAGRAM_MAX_BATCH_SIZE
 
     def __init__(
         self,
@@ -223,11 +241,14 @@ class InstagramClient:
         self._rate_limit = rate_limit_tracker or RateLimitTracker()
         # httpx.AsyncClient - imported at runtime to avoid hard dependency
         self._session = None
+        self._hashtag_ids: dict[str, str] = {}
 
     async def __aenter__(self) -> "InstagramClient":
         """Async context manager entry."""
         import httpx
-        self._session = httpx.AsyncClient(timeout=30.0)
+        self._session = httpx.AsyncClient(
+            timeout=30.0, event_hooks=telemetry_event_hooks()
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -240,14 +261,22 @@ class InstagramClient:
         """Ensure HTTP session is available."""
         if not self._session:
             import httpx
-            self._session = httpx.AsyncClient(timeout=30.0)
+            self._session = httpx.AsyncClient(
+                timeout=30.0, event_hooks=telemetry_event_hooks()
+            )
 
-    async def _api_call(self, url: str, params: dict) -> dict:
+    async def _api_call(
+        self,
+        url: str,
+        params: dict,
+        data: Optional[dict] = None,
+    ) -> Any:
         """Make an API call with retry middleware.
 
         Args:
             url: API endpoint URL
             params: Query parameters
+            data: Form body; when given the call is a POST
 
         Returns:
             Parsed JSON response
@@ -257,8 +286,11 @@ class InstagramClient:
         """
         await self._ensure_session()
 
-        async def make_request() -> dict:
-            response = await self._session.get(url, params=params)
+        async def make_request() -> Any:
+            if data is None:
+                response = await self._session.get(url, params=params)
+            else:
+                response = await self._session.post(url, params=params, data=data)
 
             # Check for rate limit errors
             if response.status_code == 429:
@@ -313,30 +345,35 @@ class InstagramClient:
         """
         logger.debug(f"Searching Instagram for hashtag '{hashtag}' (limit={limit})")
 
-        # Check rate limit (2 calls: hashtag lookup + media fetch)
-        self._rate_limit.check_and_use(2)
+        name = hashtag.lower().strip("#")
+        hashtag_id = self._hashtag_ids.get(name)
+
+        # Check rate limit (hashtag lookup, unless cached, + media fetch)
+        self._rate_limit.check_and_use(1 if hashtag_id else 2)
 
         # Step 1: Get hashtag ID
-        hashtag_url = f"{self.BASE_URL}/ig_hashtag_search"
-        hashtag_params = {
-            "user_id": self._config.business_account_id,
-            "q": hashtag.lower().strip("#"),
-            "access_token": self._config.access_token,
-        }
+        if not hashtag_id:
+            hashtag_url = f"{self.BASE_URL}/ig_hashtag_search"
+            hashtag_params = {
+                "user_id": self._config.business_account_id,
+                "q": name,
+                "access_token": self._config.access_token,
+            }
 
-        hashtag_data = await self._api_call(hashtag_url, hashtag_params)
+            hashtag_data = await self._api_call(hashtag_url, hashtag_params)
 
-        if not hashtag_data.get("data"):
-            logger.warning(f"No hashtag found for '{hashtag}'")
-            return []
+            if not hashtag_data.get("data"):
+                logger.warning(f"No hashtag found for '{hashtag}'")
+                return []
 
-        hashtag_id = hashtag_data["data"][0]["id"]
+            hashtag_id = hashtag_data["data"][0]["id"]
+            self._hashtag_ids[name] = hashtag_id
 
         # Step 2: Get recent media for hashtag
         media_url = f"{self.BASE_URL}/{hashtag_id}/recent_media"
         media_params = {
             "user_id": self._config.business_account_id,
-            "fields": "id,caption,permalink,timestamp,like_count,comments_count,media_type",
+            "fields": MEDIA_FIELDS,
             "limit": min(limit, self.MAX_RESULTS),
             "access_token": self._config.access_token,
         }
@@ -374,8 +411,12 @@ class InstagramClient:
         self._rate_limit.check_and_use(1)
 
         url = f"{self.BASE_URL}/{self._config.business_account_id}"
+        media_limit = min(limit, self.MAX_RESULTS)
         params = {
-            "fields": f"business_discovery.username({username}){{media.limit({min(limit, self.MAX_RESULTS)}){{id,caption,permalink,timestamp,like_count,comments_count,media_type}}}}",
+            "fields": (
+                f"business_discovery.username({username})"
+                f"{{username,media.limit({media_limit}){{{MEDIA_DETAIL_FIELDS}}}}}"
+            ),
             "access_token": self._config.access_token,
         }
 
@@ -386,6 +427,11 @@ class InstagramClient:
         media = business_discovery.get("media", {})
         items = media.get("data", [])
 
+        # Every item is complete, so the harvester needs no detail lookup
+        account = business_discovery.get("username", username)
+        for item in items:
+            item.setdefault("username", account)
+
         logger.debug(f"User media returned {len(items)} posts for '@{username}'")
         return items
 
@@ -412,12 +458,96 @@ class InstagramClient:
 
         url = f"{self.BASE_URL}/{media_id}"
         params = {
-            "fields": "id,caption,permalink,timestamp,like_count,comments_count,media_type,username",
+            "fields": MEDIA_DETAIL_FIELDS,
             "access_token": self._config.access_token,
         }
 
         return await self._api_call(url, params)
 
+    async def get_media_details_batch(
+        self,
+        media_ids: list[str],
+    ) -> dict[str, dict]:
+        """Get details for many media items via Graph API batch requests.
+
+        Lookups are grouped into batches of up to 50, one HTTP round trip
+        each. Items whose lookup fails are left out of the result; once the
+        hourly limit cannot cover the next batch, remaining items are left
+        out too.
+
+        Args:
+            media_ids: Instagram media IDs
+
+        Returns:
+            Dict mapping media ID to full media details
+        """
+        details: dict[str, dict] = {}
+
+        for start in range(0, len(media_ids), self.MAX_BATCH_SIZE):
+            chunk = media_ids[start:start + self.MAX_BATCH_SIZE]
+
+            try:
+                self._rate_limit.check_and_use(len(chunk))
+            except RateLimitError as e:
+                logger.warning(
+                    "Skipping details for %d media: %s",
+                    len(media_ids) - start,
+                    e,
+                )
+                break
+
+            try:
+                details.update(await self._batch_media_details(chunk))
+            except InstagramAPIError as e:
+                logger.warning("Batch detail lookup failed for %d media: %s", len(chunk), e)
+
+        return details
+
+    async def _batch_media_details(self, media_ids: list[str]) -> dict[str, dict]:
+        """Send one Graph API batch request of media detail lookups.
+
+        Args:
+            media_ids: Up to MAX_BATCH_SIZE media IDs
+
+        Returns:
+            Dict mapping media ID to details for successful lookups
+
+        Raises:
+            InstagramAPIError: If the batch request itself fails
+        """
+        logger.debug(f"Batch lookup of {len(media_ids)} media details")
+
+        batch = [
+            {"method": "GET", "relative_url": f"{media_id}?fields={MEDIA_DETAIL_FIELDS}"}
+            for media_id in media_ids
+        ]
+        responses = await self._api_call(
+            f"{self.BASE_URL}/",
+            params={},
+            data={
+                "access_token": self._config.access_token,
+                "batch": json.dumps(batch),
+                "include_headers": "false",
+            },
+        )
+
+        details: dict[str, dict] = {}
+        for media_id, item in zip(media_ids, responses or []):
+            # Null entries are requests Meta did not complete in time
+            if not item or item.get("code") != 200:
+                logger.warning(
+                    "Detail lookup failed for media %s: %s",
+                    media_id,
+                    item.get("body") if item else "timed out",
+                )
+                continue
+            try:
+                details[media_id] = json.loads(item.get("body") or "{}")
+            except ValueError:
+                logger.warning("Unparseable detail response for media %s", media_id)
+
+        return details
+
     @property
     def rate_limit_remaining(self) -> int:
         """Get remaining API calls for this hour."""
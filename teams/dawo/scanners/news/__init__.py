@@ -18,7 +18,8 @@ Harvester Framework Pipeline:
 
 Components:
     - NewsScanner: Main agent class for scan stage
-    - NewsFeedClient: RSS/Atom feed client
+    - NewsFeedClient: RSS/Atom feed client (conditional GET, pooled session)
+    - InMemoryFeedValidatorStore / RedisFeedValidatorStore: ETag/Last-Modified stores
     - NewsHarvester: Cleans and normalizes articles
     - NewsCategorizer: Rule-based categorization (tier=scan, no LLM)
     - NewsPriorityScorer: Rule-based priority scoring (tier=scan, no LLM)
@@ -74,6 +75,11 @@ Registration:
 from .agent import NewsScanner, NewsScanError
 from .tools import (
     NewsFeedClient,
+    FeedValidators,
+    FeedValidatorStore,
+    InMemoryFeedValidatorStore,
+    RedisFeedValidatorStore,
+    FeedFetchStats,
     FeedFetchError,
     FeedParseError,
 )
@@ -84,7 +90,9 @@ from .config import (
     # Config constants
     DEFAULT_FETCH_TIMEOUT,
     DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_CONNECTIONS,
     DEFAULT_HOURS_BACK,
+    DEFAULT_MAX_CONCURRENT_FEEDS,
     DEFAULT_KEYWORDS,
     MAX_SUMMARY_LENGTH,
 )
@@ -123,6 +131,11 @@ __all__ = [
     "NewsScanner",
     # Clients
     "NewsFeedClient",
+    "FeedValidators",
+    "FeedValidatorStore",
+    "InMemoryFeedValidatorStore",
+    "RedisFeedValidatorStore",
+    "FeedFetchStats",
     # Config
     "FeedSource",
     "NewsFeedClientConfig",
@@ -130,7 +143,9 @@ __all__ = [
     # Config constants
     "DEFAULT_FETCH_TIMEOUT",
     "DEFAULT_MAX_RETRIES",
+    "DEFAULT_MAX_CONNECTIONS",
     "DEFAULT_HOURS_BACK",
+    "DEFAULT_MAX_CONCURRENT_FEEDS",
     "DEFAULT_KEYWORDS",
     "MAX_SUMMARY_LENGTH",
     # Schemas
@@ -7,18 +7,22 @@ UNIQUE to News Scanner:
     - Fully rule-based: NO LLM stages
     - Uses tier="scan" (but no actual LLM calls - pure Python)
     - Processes RSS/Atom feeds from industry news sources
+    - Fetches feeds concurrently over one pooled HTTP session
 
 Usage:
-    scanner = NewsScanner(config, feed_client)
+    scanner = NewsScanner(config, feed_client, seen_store=seen_store)
     result = await scanner.scan()
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Optional, Union
+
+from teams.dawo.research import ResearchSource, SeenItemStore
 
 from .config import NewsScannerConfig, FeedSource
 from .schemas import RawNewsArticle, ScanResult, ScanStatistics
-from .tools import NewsFeedClient, FeedFetchError
+from .tools import NewsFeedClient, FeedFetchError, FeedValidators
 
 logger = logging.getLogger(__name__)
 
@@ -32,64 +36,115 @@ class NewsScanError(Exception):
 class NewsScanner:
     """Scanner agent for news research.
 
-    Fetches news from configured RSS/Atom feeds, filters by keywords
-    and date, and deduplicates by URL.
+    Fetches news from configured RSS/Atom feeds (up to
+    config.max_concurrent_feeds at once), filters by keywords and date,
+    and deduplicates by URL. With a seen store, articles already
+    in the Research Pool from earlier runs are skipped as well.
+    Feeds are also the shard unit of distributed scans (sources()).
 
     Attributes:
         _config: Scanner configuration
         _client: Feed client for fetching
+        _seen_store: Optional cross-run seen-item store
     """
 
+    # ScanResult field holding discovered items (sharded scans)
+    SHARD_ITEMS_FIELD = "articles"
+
     def __init__(
         self,
         config: NewsScannerConfig,
         feed_client: NewsFeedClient,
+        seen_store: Optional[SeenItemStore] = None,
     ) -> None:
         """Initialize news scanner.
 
         Args:
             config: Scanner configuration
             feed_client: Feed client for HTTP requests
+            seen_store: Optional store used to skip articles ingested by
+                earlier runs (None = dedupe within this run only)
         """
         self._config = config
         self._client = feed_client
+        self._seen_store = seen_store
+
+    def sources(self) -> list[str]:
+        """Feed names a scan covers, each scannable as its own shard."""
+        return [feed.name for feed in self._config.feeds]
 
-    async def scan(self) -> ScanResult:
+    @staticmethod
+    def shard_key(article: RawNewsArticle) -> str:
+        """Deduplication key of an article across shards."""
+        return article.url
+
+    async def scan(self, sources: Optional[list[str]] = None) -> ScanResult:
         """Execute news scan across all configured feeds.
 
+        Args:
+            sources: Names of the feeds to scan (a shard of sources());
+                None scans every configured feed
+
         Returns:
             ScanResult with articles and statistics
 
         Raises:
             NewsScanError: If all feeds fail
         """
+        feeds = self._config.feeds
+        if sources is not None:
+            wanted = set(sources)
+            feeds = [feed for feed in feeds if feed.name in wanted]
+
         all_articles: list[RawNewsArticle] = []
         errors: list[str] = []
         statistics = ScanStatistics()
+        feed_validators: dict[str, FeedValidators] = {}
+
+        semaphore = asyncio.Semaphore(self._config.max_concurrent_feeds)
+
+        async def fetch(feed: FeedSource) -> Union[list[RawNewsArticle], FeedFetchError]:
+            async with semaphore:
+                try:
+                    return await self._scan_feed(feed)
+                except FeedFetchError as e:
+                    return e
 
-        for feed in self._config.feeds:
-            try:
-                articles = await self._scan_feed(feed)
-                all_articles.extend(articles)
-                statistics.feeds_processed += 1
-                statistics.total_articles_found += len(articles)
-                logger.info("Fetched %d articles from %s", len(articles), feed.name)
-            except FeedFetchError as e:
+        async with self._client.session():
+            outcomes = await asyncio.gather(
+                *(fetch(feed) for feed in feeds)
+            )
+
+        # Aggregate in config order so URL dedup keeps the same first occurrence
+        for feed, outcome in zip(feeds, outcomes):
+            if isinstance(outcome, FeedFetchError):
                 statistics.feeds_failed += 1
-                errors.append(f"Feed {feed.name}: {e}")
-                logger.error("Failed to fetch feed %s: %s", feed.name, e)
+                errors.append(f"Feed {feed.name}: {outcome}")
+                logger.error("Failed to fetch feed %s: %s", feed.name, outcome)
+                continue
+
+            validators = self._client.take_validators(feed.url)
+            if validators is not None:
+                feed_validators[feed.url] = validators
+            all_articles.extend(outcome)
+            statistics.feeds_processed += 1
+            statistics.total_articles_found += len(outcome)
+            logger.info("Fetched %d articles from %s", len(outcome), feed.name)
 
         # Deduplicate by URL
         unique_articles = self._deduplicate(all_articles)
         statistics.duplicates_removed = len(all_articles) - len(unique_articles)
+        unique_articles = await self._drop_seen(unique_articles, statistics)
         statistics.articles_after_filter = len(unique_articles)
 
         logger.info(
-            "Scan complete: %d feeds processed, %d failed, %d articles, %d duplicates removed",
+            "Scan complete: %d feeds processed, %d failed, %d articles, "
+            "%d duplicates removed, %d already seen",
             statistics.feeds_processed,
             statistics.feeds_failed,
             statistics.articles_after_filter,
             statistics.duplicates_removed,
+            statistics.already_seen,
         )
 
         # If all feeds failed, raise error
@@ -100,8 +155,20 @@ class NewsScanner:
             articles=unique_articles,
             statistics=statistics,
             errors=errors,
+            feed_validators=feed_validators,
         )
 
+    async def store_feed_validators(self, result: ScanResult) -> None:
+        """Make the next scan of the feeds conditional.
+
+        Call once the scan's articles are published; until then the feeds
+        are fetched in full again.
+
+        Args:
+            result: ScanResult whose articles were published
+        """
+        await self._client.store_validators(result.feed_validators)
+
     async def _scan_feed(self, feed: FeedSource) -> list[RawNewsArticle]:
         """Scan a single feed.
 
@@ -120,6 +187,30 @@ class NewsScanner:
             keywords=self._config.keywords,
         )
 
+    async def _drop_seen(
+        self,
+        articles: list[RawNewsArticle],
+        statistics: ScanStatistics,
+    ) -> list[RawNewsArticle]:
+        """Remove articles already published by an earlier run.
+
+        Args:
+            articles: Unique articles from this run
+            statistics: Scan statistics to update
+
+        Returns:
+            Articles not yet in the Research Pool
+        """
+        if self._seen_store is None or not articles:
+            return articles
+
+        seen = await self._seen_store.find_seen(
+            ResearchSource.NEWS,
+            [article.url for article in articles],
+        )
+        statistics.already_seen = len(seen)
+        return [article for article in articles if article.url not in seen]
+
     def _deduplicate(self, articles: list[RawNewsArticle]) -> list[RawNewsArticle]:
         """Remove duplicate articles by URL.
 
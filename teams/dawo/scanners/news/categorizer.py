@@ -13,12 +13,15 @@ Categories:
 Usage:
     categorizer = NewsCategorizer(competitor_brands=["Brand1"])
     result = categorizer.categorize(article)
+    results = await categorizer.categorize_batch(articles)
 """
 
 import logging
 import re
 from typing import Optional
 
+from teams.dawo.middleware.process_pool import ProcessBatchExecutor, WorkerSpec, map_batch
+
 from .schemas import HarvestedArticle, NewsCategory, PriorityLevel, CategoryResult
 from .patterns import (
     REGULATORY_PATTERNS,
@@ -37,15 +40,25 @@ class NewsCategorizer:
     Classifies articles into categories based on keyword patterns.
 
     Attributes:
+        _competitor_brands: Competitor brand names as configured
         _competitor_patterns: Compiled patterns for competitor detection
+        _batch_executor: Optional worker processes for categorize_batch()
     """
 
-    def __init__(self, competitor_brands: Optional[list[str]] = None) -> None:
+    def __init__(
+        self,
+        competitor_brands: Optional[list[str]] = None,
+        batch_executor: Optional[ProcessBatchExecutor] = None,
+    ) -> None:
         """Initialize categorizer.
 
         Args:
             competitor_brands: List of competitor brand names to detect
+            batch_executor: Optional process pool for categorize_batch().
+                Without one, batches run on the event loop.
         """
+        self._competitor_brands = list(competitor_brands or [])
+        self._batch_executor = batch_executor
         self._competitor_patterns: list[re.Pattern[str]] = []
         if competitor_brands:
             for brand in competitor_brands:
@@ -53,6 +66,25 @@ class NewsCategorizer:
                     re.compile(rf"\b{re.escape(brand)}\b", re.IGNORECASE)
                 )
 
+    async def categorize_batch(self, articles: list[HarvestedArticle]) -> list[CategoryResult]:
+        """Categorize many articles, for backfills.
+
+        Runs categorize() per article on the injected batch executor's
+        worker processes. Without an executor the articles are categorized
+        inline, yielding to the event loop between chunks.
+
+        Args:
+            articles: Harvested news articles
+
+        Returns:
+            CategoryResult per article, in input order
+        """
+        return await map_batch(self._batch_executor, self, "categorize", articles)
+
+    def worker_spec(self) -> WorkerSpec:
+        """Rebuild this categorizer in a worker process."""
+        return WorkerSpec(NewsCategorizer, (self._competitor_brands,))
+
     def categorize(self, article: HarvestedArticle) -> CategoryResult:
         """Categorize a news article using pattern matching.
 
@@ -27,9 +27,12 @@ from dataclasses import dataclass, field
 # Feed client constants
 DEFAULT_FETCH_TIMEOUT = 30  # seconds
 DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_CONNECTIONS = 20  # Pooled connections in a shared session
+DNS_CACHE_TTL_SECONDS = 300
 
 # Scanner defaults
 DEFAULT_HOURS_BACK = 24
+DEFAULT_MAX_CONCURRENT_FEEDS = 8  # Feeds fetched at once per scan
 
 # Default keywords for news filtering (synced with config/dawo_news_scanner.json)
 DEFAULT_KEYWORDS = [
@@ -89,15 +92,17 @@ def _default_feeds() -> list[FeedSource]:
 
 @dataclass(frozen=True)
 class NewsFeedClientConfig:
-    """Feed client configuration - timeouts and retries.
+    """Feed client configuration - timeouts, retries and pooling.
 
     Attributes:
         fetch_timeout: Timeout for HTTP requests in seconds
         max_retries: Maximum retry attempts for failed requests
+        max_connections: Connection pool size of a shared session
     """
 
     fetch_timeout: int = DEFAULT_FETCH_TIMEOUT
     max_retries: int = DEFAULT_MAX_RETRIES
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
 
     def __post_init__(self) -> None:
         """Validate client configuration."""
@@ -105,6 +110,8 @@ class NewsFeedClientConfig:
             raise ValueError(f"fetch_timeout must be >= 1, got {self.fetch_timeout}")
         if self.max_retries < 0:
             raise ValueError(f"max_retries must be >= 0, got {self.max_retries}")
+        if self.max_connections < 1:
+            raise ValueError(f"max_connections must be >= 1, got {self.max_connections}")
 
 
 @dataclass
@@ -119,12 +126,14 @@ class NewsScannerConfig:
         keywords: Keywords for article filtering
         competitor_brands: Brand names to flag as competitor news
         hours_back: How many hours back to search
+        max_concurrent_feeds: Feeds fetched concurrently during a scan
     """
 
     feeds: list[FeedSource] = field(default_factory=_default_feeds)
     keywords: list[str] = field(default_factory=lambda: DEFAULT_KEYWORDS.copy())
     competitor_brands: list[str] = field(default_factory=list)
     hours_back: int = DEFAULT_HOURS_BACK
+    max_concurrent_feeds: int = DEFAULT_MAX_CONCURRENT_FEEDS
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
@@ -134,6 +143,10 @@ class NewsScannerConfig:
             errors.append("feeds list cannot be empty")
         if self.hours_back < 1:
             errors.append(f"hours_back must be >= 1, got {self.hours_back}")
+        if self.max_concurrent_feeds < 1:
+            errors.append(
+                f"max_concurrent_feeds must be >= 1, got {self.max_concurrent_feeds}"
+            )
 
         if errors:
             raise ValueError(f"Invalid NewsScannerConfig: {'; '.join(errors)}")
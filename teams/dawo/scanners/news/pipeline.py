@@ -3,7 +3,12 @@
 Orchestrates the Harvester Framework pipeline stages:
     Scanner -> Harvester -> Categorizer -> PriorityScorer -> Transformer -> Validator -> Scorer -> Publisher
 
-Handles partial failures and graceful degradation per AC #4.
+Handles partial failures and graceful degradation per AC #4. Feed
+ETag/Last-Modified validators are stored only once every article of the
+scan was published (or dropped by a stage), so a failed run refetches the
+feeds in full. Each stage's
+timing and external calls are returned in PipelineResult.telemetry and
+appended to the pipeline telemetry store.
 
 Usage:
     pipeline = NewsResearchPipeline(
@@ -16,10 +21,22 @@ import logging
 from typing import Any, Optional, Protocol
 from uuid import UUID
 
+from teams.dawo.middleware.telemetry import (
+    PipelineTelemetry,
+    PipelineTelemetryStore,
+    get_telemetry_store,
+)
+from teams.dawo.middleware.checkpoint import (
+    PipelineCheckpointStore,
+    RunCheckpoint,
+    open_run_checkpoint,
+)
+
 from .schemas import (
     PipelineResult,
     PipelineStatistics,
     PipelineStatus,
+    ScanResult,
     ValidatedResearch,
 )
 from .agent import NewsScanner, NewsScanError
@@ -69,6 +86,8 @@ class NewsResearchPipeline:
         _validator: News validator stage
         _scorer: Research item scorer
         _publisher: Research publisher
+        _telemetry_store: Rolling history that receives each run's telemetry
+        _checkpoint_store: Stage outputs kept so retried runs resume (optional)
     """
 
     def __init__(
@@ -79,6 +98,8 @@ class NewsResearchPipeline:
         validator: NewsValidator,
         scorer: ResearchItemScorerProtocol,
         publisher: ResearchPublisherProtocol,
+        telemetry_store: Optional[PipelineTelemetryStore] = None,
+        checkpoint_store: Optional[PipelineCheckpointStore] = None,
     ) -> None:
         """Initialize pipeline.
 
@@ -89,6 +110,8 @@ class NewsResearchPipeline:
             validator: News validator
             scorer: Research item scorer
             publisher: Research publisher
+            telemetry_store: Run telemetry history (default: global store)
+            checkpoint_store: Stage checkpoints for resuming retries (default: none)
         """
         self._scanner = scanner
         self._harvester = harvester
@@ -96,27 +119,43 @@ class NewsResearchPipeline:
         self._validator = validator
         self._scorer = scorer
         self._publisher = publisher
+        self._telemetry_store = telemetry_store or get_telemetry_store()
+        self._checkpoint_store = checkpoint_store
 
-    async def execute(self) -> PipelineResult:
+    async def execute(self, run_id: Optional[str] = None) -> PipelineResult:
         """Execute the full pipeline.
 
+        Args:
+            run_id: Run id of a failed attempt (PipelineResult.run_id) to
+                resume from its checkpoints; None starts a new run
+
         Returns:
             PipelineResult with status and statistics
 
         Raises:
             PipelineError: On critical failure
         """
+        checkpoint = await open_run_checkpoint(self._checkpoint_store, "news", run_id)
+        return await checkpoint.settle(await self._execute(checkpoint))
+
+    async def _execute(self, checkpoint: RunCheckpoint) -> PipelineResult:
+        """Run the stages, reusing checkpointed outputs of earlier attempts."""
         statistics = PipelineStatistics()
+        telemetry = PipelineTelemetry(pipeline="news")
         published_ids: list[UUID] = []
         error_message: Optional[str] = None
         status = PipelineStatus.COMPLETE
+        scan_result: Optional[ScanResult] = None
+        # Cleared when articles may not have reached the Research Pool
+        store_feed_validators = True
 
         try:
             # Stage 1: Scan
             logger.info("Starting news scan...")
             try:
-                scan_result = await self._scanner.scan()
-                statistics.total_found = len(scan_result.articles)
+                with telemetry.stage("scan") as stage:
+                    scan_result = await checkpoint.run("scan", self._scanner.scan)
+                statistics.total_found = stage.items_out = len(scan_result.articles)
                 statistics.feeds_processed = scan_result.statistics.feeds_processed
                 statistics.feeds_failed = scan_result.statistics.feeds_failed
             except NewsScanError as e:
@@ -126,6 +165,7 @@ class NewsResearchPipeline:
                     statistics=statistics,
                     error=str(e),
                     retry_scheduled=True,
+                    telemetry=telemetry,
                 )
 
             if not scan_result.articles:
@@ -133,24 +173,32 @@ class NewsResearchPipeline:
                 return PipelineResult(
                     status=PipelineStatus.COMPLETE,
                     statistics=statistics,
+                    telemetry=telemetry,
                 )
 
             # Stage 2: Harvest
             logger.info("Harvesting %d articles...", len(scan_result.articles))
-            harvested = self._harvester.harvest(scan_result.articles)
-            statistics.harvested = len(harvested)
+            with telemetry.stage("harvest", items_in=statistics.total_found) as stage:
+                harvested = await checkpoint.run(
+                    "harvest", self._harvester.harvest, scan_result.articles
+                )
+            statistics.harvested = stage.items_out = len(harvested)
 
             if not harvested:
                 logger.info("No articles harvested, pipeline complete")
                 return PipelineResult(
                     status=PipelineStatus.COMPLETE,
                     statistics=statistics,
+                    telemetry=telemetry,
                 )
 
             # Stage 3-5: Transform (includes categorize + prioritize)
             logger.info("Transforming %d articles...", len(harvested))
-            transformed = self._transformer.transform(harvested)
-            statistics.transformed = len(transformed)
+            with telemetry.stage("transform", items_in=statistics.harvested) as stage:
+                transformed = await checkpoint.run(
+                    "transform", self._transformer.transform, harvested
+                )
+            statistics.transformed = stage.items_out = len(transformed)
             statistics.categorized = len(transformed)
 
             # Count regulatory flagged
@@ -163,30 +211,40 @@ class NewsResearchPipeline:
                 return PipelineResult(
                     status=PipelineStatus.COMPLETE,
                     statistics=statistics,
+                    telemetry=telemetry,
                 )
 
             # Stage 6: Validate
             logger.info("Validating %d articles...", len(transformed))
-            validated = self._validator.validate(transformed)
-            statistics.validated = len(validated)
+            with telemetry.stage("validate", items_in=statistics.transformed) as stage:
+                validated = await checkpoint.run(
+                    "validate", self._validator.validate, transformed
+                )
+            statistics.validated = stage.items_out = len(validated)
 
             if not validated:
                 logger.info("No articles validated, pipeline complete")
                 return PipelineResult(
                     status=PipelineStatus.COMPLETE,
                     statistics=statistics,
+                    telemetry=telemetry,
                 )
 
             # Stage 7: Score (adjust with Research Item Scorer)
             logger.info("Scoring %d articles...", len(validated))
-            scored = self._apply_scoring(validated)
-            statistics.scored = len(scored)
+            with telemetry.stage("score", items_in=statistics.validated) as stage:
+                scored = self._apply_scoring(validated)
+            statistics.scored = stage.items_out = len(scored)
 
             # Stage 8: Publish
             logger.info("Publishing %d articles...", len(scored))
-            published_ids = await self._publish_items(scored)
-            statistics.published = len(published_ids)
+            with telemetry.stage("publish", items_in=statistics.scored) as stage:
+                published_ids = await self._publish_items(scored)
+            statistics.published = stage.items_out = len(published_ids)
             statistics.failed = statistics.validated - len(published_ids)
+            store_feed_validators = statistics.failed == 0
+            # Retry a publish that stored nothing from the checkpoints, not from the scan
+            publish_failed = statistics.scored > 0 and not published_ids
 
             # Determine final status
             if statistics.feeds_failed > 0:
@@ -206,17 +264,26 @@ class NewsResearchPipeline:
                 status=status,
                 statistics=statistics,
                 error=error_message,
+                retry_scheduled=publish_failed,
                 published_ids=published_ids,
+                telemetry=telemetry,
             )
 
         except Exception as e:
             logger.error("Pipeline failed: %s", e, exc_info=True)
+            store_feed_validators = False
             return PipelineResult(
                 status=PipelineStatus.FAILED,
                 statistics=statistics,
                 error=str(e),
+                telemetry=telemetry,
             )
 
+        finally:
+            self._telemetry_store.record(telemetry.finish())
+            if scan_result is not None and store_feed_validators:
+                await self._scanner.store_feed_validators(scan_result)
+
     def _apply_scoring(
         self,
         validated: list[ValidatedResearch],
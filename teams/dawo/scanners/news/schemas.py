@@ -31,6 +31,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from teams.dawo.middleware.telemetry import PipelineTelemetry
+
 
 class PipelineStatus(str, Enum):
     """Pipeline execution status.
@@ -219,6 +221,7 @@ class ScanStatistics:
         total_articles_found: Raw articles from all feeds
         articles_after_filter: Articles meeting date/keyword criteria
         duplicates_removed: Articles deduplicated by URL
+        already_seen: Articles already in the Research Pool from earlier runs
     """
 
     feeds_processed: int = 0
@@ -226,6 +229,7 @@ class ScanStatistics:
     total_articles_found: int = 0
     articles_after_filter: int = 0
     duplicates_removed: int = 0
+    already_seen: int = 0
 
 
 @dataclass
@@ -236,11 +240,14 @@ class ScanResult:
         articles: List of raw articles passing filters
         statistics: Scan execution statistics
         errors: Any non-fatal errors encountered
+        feed_validators: ETag/Last-Modified (FeedValidators) by feed URL,
+            to store once the articles are published
     """
 
     articles: list[RawNewsArticle] = field(default_factory=list)
     statistics: ScanStatistics = field(default_factory=ScanStatistics)
     errors: list[str] = field(default_factory=list)
+    feed_validators: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -287,6 +294,8 @@ class PipelineResult:
         error: Error message if failed/incomplete
         retry_scheduled: True if queued for next cycle
         published_ids: UUIDs of successfully published items
+        telemetry: Per-stage timing, throughput and external calls
+        run_id: Run id; pass to execute() when retrying to resume
     """
 
     status: PipelineStatus
@@ -294,3 +303,5 @@ class PipelineResult:
     error: Optional[str] = None
     retry_scheduled: bool = False
     published_ids: list[UUID] = field(default_factory=list)
+    telemetry: Optional[PipelineTelemetry] = None
+    run_id: Optional[str] = None
@@ -2,25 +2,63 @@
 
 Provides:
     - NewsFeedClient: RSS/Atom feed client for news aggregation
+    - FeedValidators: ETag/Last-Modified pair for conditional GETs
+    - InMemoryFeedValidatorStore: Process-local validator store (default)
+    - RedisFeedValidatorStore: Validator store shared across workers
     - FeedFetchError: Exception for feed fetch failures
     - FeedParseError: Exception for feed parse failures
 
 Feed client wraps all HTTP calls with retry middleware (Story 1.5).
+
+Conditional GET:
+    The client remembers each feed's ETag/Last-Modified and sends them as
+    If-None-Match/If-Modified-Since. An unchanged feed answers 304 Not
+    Modified and fetch_feed returns no articles without running feedparser.
+    Validators of a fetched feed are held back (take_validators) until its
+    articles are published (store_validators) - a run that fails before
+    publishing refetches the full feed next time instead of losing it.
+
+Usage:
+    client = NewsFeedClient(config, retry, validator_store=store)
+
+    # One pooled HTTP session for every fetch inside the block
+    async with client.session():
+        articles = await client.fetch_feed(feed)
+    validators = client.take_validators(feed.url)
+
+    # ... once the articles are published
+    await client.store_validators({feed.url: validators})
 """
 
+import json
 import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional, Protocol
+from typing import Any, AsyncIterator, Optional, Protocol, TYPE_CHECKING
 
 import aiohttp
 import feedparser
 from bs4 import BeautifulSoup
 
-from .config import FeedSource, NewsFeedClientConfig, DEFAULT_FETCH_TIMEOUT
+from teams.dawo.middleware.telemetry import record_call
+
+from .config import (
+    FeedSource,
+    NewsFeedClientConfig,
+    DEFAULT_FETCH_TIMEOUT,
+    DNS_CACHE_TTL_SECONDS,
+)
 from .schemas import RawNewsArticle
 
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
 logger = logging.getLogger(__name__)
 
+# Redis hash holding validators for every feed URL
+FEED_VALIDATORS_KEY = "dawo:news:feed_validators"
+
 
 class FeedFetchError(Exception):
     """Raised when feed fetch fails after retries."""
@@ -42,30 +80,211 @@ class RetryMiddlewareProtocol(Protocol):
         ...
 
 
+@dataclass(frozen=True)
+class FeedValidators:
+    """HTTP cache validators of a feed response.
+
+    Attributes:
+        etag: ETag header value, sent back as If-None-Match
+        last_modified: Last-Modified header value, sent back as If-Modified-Since
+    """
+
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_empty(self) -> bool:
+        """Whether the response carried no validators at all."""
+        return self.etag is None and self.last_modified is None
+
+    def request_headers(self) -> dict[str, str]:
+        """Conditional request headers for the next fetch."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True)
+class FeedResponse:
+    """Result of a single feed HTTP request.
+
+    Attributes:
+        content: Feed body, or None when the server answered 304
+        validators: Validators to send on the next request
+    """
+
+    content: Optional[str]
+    validators: FeedValidators
+
+
+class FeedValidatorStore(Protocol):
+    """Protocol for ETag/Last-Modified storage keyed by feed URL."""
+
+    async def get(self, url: str) -> Optional[FeedValidators]:
+        """Return stored validators for a feed URL, if any."""
+        ...
+
+    async def set(self, url: str, validators: FeedValidators) -> None:
+        """Store validators for a feed URL."""
+        ...
+
+
+class InMemoryFeedValidatorStore:
+    """Process-local validator store.
+
+    Validators survive between scans for as long as the client lives.
+
+    Attributes:
+        _validators: Validators keyed by feed URL
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._validators: dict[str, FeedValidators] = {}
+
+    async def get(self, url: str) -> Optional[FeedValidators]:
+        """Return stored validators for a feed URL, if any."""
+        return self._validators.get(url)
+
+    async def set(self, url: str, validators: FeedValidators) -> None:
+        """Store validators for a feed URL."""
+        self._validators[url] = validators
+
+
+class RedisFeedValidatorStore:
+    """Validator store shared by every worker through a Redis hash.
+
+    Redis failures are logged and treated as "no validators", which only
+    costs a full fetch.
+
+    Attributes:
+        _redis: Async Redis client (injected)
+        _key: Redis hash key
+    """
+
+    def __init__(
+        self,
+        redis_client: "redis.Redis",
+        key: str = FEED_VALIDATORS_KEY,
+    ) -> None:
+        """Initialize with injected Redis client.
+
+        Args:
+            redis_client: Async Redis client
+            key: Redis hash key holding all feeds' validators
+        """
+        self._redis = redis_client
+        self._key = key
+
+    async def get(self, url: str) -> Optional[FeedValidators]:
+        """Return stored validators for a feed URL, if any."""
+        try:
+            raw = await self._redis.hget(self._key, url)
+        except Exception as e:
+            logger.warning("Failed to read feed validators for %s: %s", url, e)
+            return None
+
+        if not raw:
+            return None
+        try:
+            data = json.loads(raw)
+            return FeedValidators(
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+            )
+        except (ValueError, AttributeError) as e:
+            logger.warning("Ignoring malformed feed validators for %s: %s", url, e)
+            return None
+
+    async def set(self, url: str, validators: FeedValidators) -> None:
+        """Store validators for a feed URL."""
+        payload = json.dumps(
+            {"etag": validators.etag, "last_modified": validators.last_modified}
+        )
+        try:
+            await self._redis.hset(self._key, url, payload)
+        except Exception as e:
+            logger.warning("Failed to store feed validators for %s: %s", url, e)
+
+
+@dataclass
+class FeedFetchStats:
+    """Counters for a NewsFeedClient.
+
+    Attributes:
+        requests: Feed HTTP requests that got a response
+        not_modified: Requests answered 304 (feedparser skipped)
+    """
+
+    requests: int = 0
+    not_modified: int = 0
+
+
 class NewsFeedClient:
     """RSS/Atom feed client for news aggregation.
 
     Accepts configuration via dependency injection - NEVER loads files directly.
     Wraps all fetches with retry middleware (Story 1.5).
 
+    Fetches inside a session() block share one pooled aiohttp session;
+    fetches outside it open a session per request.
+
     Attributes:
+        stats: Request counters
         _config: Feed client configuration
         _retry: Retry middleware for HTTP calls
+        _validators: ETag/Last-Modified store for conditional GETs
+        _pending: Validators of parsed feeds not yet stored, by feed URL
+        _session: Shared HTTP session while a session() block is open
     """
 
     def __init__(
         self,
         config: NewsFeedClientConfig,
         retry_middleware: RetryMiddlewareProtocol,
+        validator_store: Optional[FeedValidatorStore] = None,
     ) -> None:
         """Initialize feed client.
 
         Args:
             config: Feed client configuration
             retry_middleware: Retry middleware for HTTP requests (required per project-context.md)
+            validator_store: ETag/Last-Modified store (default: in-memory)
         """
         self._config = config
         self._retry = retry_middleware
+        self._validators = validator_store or InMemoryFeedValidatorStore()
+        self._pending: dict[str, FeedValidators] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.stats = FeedFetchStats()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["NewsFeedClient"]:
+        """Share one pooled HTTP session across all fetches in the block.
+
+        Reuses connections (and TLS sessions) between feeds on the same
+        host. Nested blocks reuse the outer session.
+
+        Yields:
+            This client
+        """
+        if self._session is not None:
+            yield self
+            return
+
+        timeout = aiohttp.ClientTimeout(total=self._config.fetch_timeout)
+        connector = aiohttp.TCPConnector(
+            limit=self._config.max_connections,
+            ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+        )
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            self._session = session
+            try:
+                yield self
+            finally:
+                self._session = None
 
     async def fetch_feed(
         self,
@@ -88,13 +307,25 @@ class NewsFeedClient:
             FeedParseError: On feed parsing failure
         """
         try:
-            content = await self._fetch_content(feed.url)
-            return self._parse_feed(
-                content=content,
+            validators = await self._validators.get(feed.url)
+            response = await self._fetch_content(feed.url, validators)
+
+            if response.content is None:
+                logger.info("Feed %s not modified since last fetch", feed.name)
+                return []
+
+            articles = self._parse_feed(
+                content=response.content,
                 feed=feed,
                 hours_back=hours_back,
                 keywords=keywords,
             )
+
+            # Held until the articles are published, so a broken body or a
+            # failed run is refetched
+            if not response.validators.is_empty():
+                self._pending[feed.url] = response.validators
+            return articles
         except FeedFetchError:
             raise
         except FeedParseError:
@@ -103,43 +334,76 @@ class NewsFeedClient:
             logger.error("Unexpected error fetching feed %s: %s", feed.name, e)
             raise FeedFetchError(f"Failed to fetch {feed.name}: {e}") from e
 
-    async def _fetch_content(self, url: str) -> str:
+    def take_validators(self, url: str) -> Optional[FeedValidators]:
+        """Hand over the validators of the last successful fetch of a feed.
+
+        Args:
+            url: Feed URL
+
+        Returns:
+            Validators to store once the feed's articles are published, or
+            None if the feed was not fetched (or sent none)
+        """
+        return self._pending.pop(url, None)
+
+    async def store_validators(self, validators: dict[str, FeedValidators]) -> None:
+        """Store validators so the next fetch of each feed is conditional.
+
+        Call only after the articles fetched with them are published.
+
+        Args:
+            validators: Validators by feed URL (from take_validators)
+        """
+        for url, feed_validators in validators.items():
+            await self._validators.set(url, feed_validators)
+
+    async def _fetch_content(
+        self,
+        url: str,
+        validators: Optional[FeedValidators] = None,
+    ) -> FeedResponse:
         """Fetch raw content from URL.
 
         Uses retry middleware (Story 1.5 integration).
 
         Args:
             url: Feed URL to fetch
+            validators: Validators from the previous fetch, if any
 
         Returns:
-            Raw feed content as string
+            FeedResponse (content is None when the feed is unchanged)
 
         Raises:
             FeedFetchError: On HTTP error or timeout (after retries exhausted)
         """
         # Wrap with retry middleware per project-context.md requirement
-        return await self._retry.execute(self._fetch_content_raw, url)
+        return await self._retry.execute(self._fetch_content_raw, url, validators)
 
-    async def _fetch_content_raw(self, url: str) -> str:
+    async def _fetch_content_raw(
+        self,
+        url: str,
+        validators: Optional[FeedValidators] = None,
+    ) -> FeedResponse:
         """Raw HTTP fetch without retry wrapper.
 
         Args:
             url: Feed URL to fetch
+            validators: Validators from the previous fetch, if any
 
         Returns:
-            Raw feed content as string
+            FeedResponse (content is None when the feed is unchanged)
 
         Raises:
             FeedFetchError: On HTTP error or timeout
         """
-        timeout = aiohttp.ClientTimeout(total=self._config.fetch_timeout)
+        headers = validators.request_headers() if validators else {}
         try:
+            if self._session is not None:
+                return await self._get(self._session, url, headers)
+
+            timeout = aiohttp.ClientTimeout(total=self._config.fetch_timeout)
             async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        logger.error("Feed fetch failed: %s returned %d", url, response.status)
-                        raise FeedFetchError(f"HTTP {response.status} from {url}")
-                    return await response.text()
+                return await self._get(session, url, headers)
         except aiohttp.ClientError as e:
             logger.error("Connection error fetching %s: %s", url, e)
             raise FeedFetchError(f"Connection error: {e}") from e
@@ -147,6 +411,43 @@ class NewsFeedClient:
             logger.error("Timeout fetching %s", url)
             raise FeedFetchError(f"Timeout fetching {url}") from e
 
+    async def _get(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: dict[str, str],
+    ) -> FeedResponse:
+        """Issue a (conditional) GET on an open session.
+
+        Args:
+            session: HTTP session to use
+            url: Feed URL to fetch
+            headers: Conditional request headers
+
+        Returns:
+            FeedResponse for the request
+
+        Raises:
+            FeedFetchError: On unexpected HTTP status
+        """
+        async with session.get(url, headers=headers) as response:
+            self.stats.requests += 1
+            body = await response.read()
+            record_call(len(body))
+            validators = FeedValidators(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+
+            if response.status == 304:
+                self.stats.not_modified += 1
+                return FeedResponse(content=None, validators=validators)
+            if response.status != 200:
+                logger.error("Feed fetch failed: %s returned %d", url, response.status)
+                raise FeedFetchError(f"HTTP {response.status} from {url}")
+            # text() decodes the body already read above
+            return FeedResponse(content=await response.text(), validators=validators)
+
     def _parse_feed(
         self,
         content: str,
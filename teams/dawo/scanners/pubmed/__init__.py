@@ -21,6 +21,7 @@ Harvester Framework Pipeline (Extended for PubMed):
 Components:
     - PubMedScanner: Main agent class for scan stage
     - PubMedClient: Entrez API client using Biopython
+    - AsyncPubMedClient: Async E-utilities client using the history server
     - PubMedHarvester: Parses articles and extracts metadata
     - FindingSummarizer: LLM stage for plain-language summaries (tier="generate")
     - ClaimValidator: LLM stage for EU claim assessment (tier="generate")
@@ -31,6 +32,7 @@ Components:
 Configuration:
     - EntrezConfig: NCBI E-utilities credentials
     - PubMedScannerConfig: Scanner behavior settings
+    - EUtilsClientConfig: AsyncPubMedClient HTTP settings
 
 Schemas:
     - RawPubMedArticle: Raw data from Entrez
@@ -84,15 +86,21 @@ from .tools import (
     extract_sample_size,
     classify_study_type,
 )
+from .eutils import AsyncPubMedClient, HistorySet, TokenBucket
 from .config import (
     EntrezConfig,
     PubMedScannerConfig,
+    LLMBatchConfig,
+    EUtilsClientConfig,
     # Config constants
     DEFAULT_LOOKBACK_DAYS,
     DEFAULT_MAX_RESULTS_PER_QUERY,
     DEFAULT_BATCH_SIZE,
+    DEFAULT_HISTORY_BATCH_SIZE,
     RATE_LIMIT_NO_KEY,
     RATE_LIMIT_WITH_KEY,
+    DEFAULT_LLM_MAX_CONCURRENCY,
+    DEFAULT_LLM_CALL_TIMEOUT,
 )
 from .schemas import (
     RawPubMedArticle,
@@ -104,6 +112,7 @@ from .schemas import (
     ValidatedResearch,
     ScanResult,
     ScanStatistics,
+    LLMCallStats,
     PipelineResult,
     PipelineStatistics,
     PipelineStatus,
@@ -128,15 +137,23 @@ __all__ = [
     "PubMedScanner",
     # Client
     "PubMedClient",
+    "AsyncPubMedClient",
+    "HistorySet",
+    "TokenBucket",
     # Config
     "EntrezConfig",
     "PubMedScannerConfig",
+    "LLMBatchConfig",
+    "EUtilsClientConfig",
     # Config constants
     "DEFAULT_LOOKBACK_DAYS",
     "DEFAULT_MAX_RESULTS_PER_QUERY",
     "DEFAULT_BATCH_SIZE",
+    "DEFAULT_HISTORY_BATCH_SIZE",
     "RATE_LIMIT_NO_KEY",
     "RATE_LIMIT_WITH_KEY",
+    "DEFAULT_LLM_MAX_CONCURRENCY",
+    "DEFAULT_LLM_CALL_TIMEOUT",
     # Schemas
     "RawPubMedArticle",
     "HarvestedArticle",
@@ -147,6 +164,7 @@ __all__ = [
     "ValidatedResearch",
     "ScanResult",
     "ScanStatistics",
+    "LLMCallStats",
     "PipelineResult",
     "PipelineStatistics",
     "PipelineStatus",
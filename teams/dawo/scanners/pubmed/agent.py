@@ -8,24 +8,29 @@ The PubMedScanner:
     2. Filters by publication type (RCT, Meta-Analysis, Review)
     3. Filters by publication date (default: last 90 days)
     4. Deduplicates results by PMID
-    5. Returns list of RawPubMedArticle for harvesting
+    5. Skips PMIDs already in the Research Pool (optional seen store)
+    6. Returns list of RawPubMedArticle for harvesting
 
 Registration: team_spec.py with tier="scan" (no actual LLM calls in scan stage)
 
 Usage:
     # Created by Team Builder with injected dependencies
-    scanner = PubMedScanner(config, pubmed_client)
+    scanner = PubMedScanner(config, pubmed_client, seen_store=seen_store)
 
     # Execute scan stage
     result = await scanner.scan()
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, Union
+
+from teams.dawo.research import ResearchSource, SeenItemStore
 
 from .config import PubMedScannerConfig
 from .schemas import RawPubMedArticle, ScanResult, ScanStatistics
 from .tools import PubMedClient, PubMedSearchError
+from .eutils import AsyncPubMedClient
+from .harvester import PUBMED_URL_TEMPLATE
 
 
 # Module logger
@@ -61,35 +66,59 @@ class PubMedScanner:
         - Publication type filtering (RCT, Meta-Analysis, Review)
         - Date filtering (default: last 90 days)
         - PMID deduplication across queries
+        - Cross-run skipping of PMIDs already in the Research Pool
         - Statistics tracking for monitoring
+        - Shardable by search query for distributed scans (sources())
 
     All dependencies are injected via constructor - NEVER loads files directly.
 
     Attributes:
         _config: Scanner configuration
         _client: PubMed Entrez client
+        _seen_store: Optional cross-run seen-item store
     """
 
+    # ScanResult field holding discovered items (sharded scans)
+    SHARD_ITEMS_FIELD = "articles"
+
     def __init__(
         self,
         config: PubMedScannerConfig,
-        client: PubMedClient,
+        client: Union[PubMedClient, AsyncPubMedClient],
+        seen_store: Optional[SeenItemStore] = None,
     ):
         """Initialize scanner with injected dependencies.
 
         Args:
             config: Scanner configuration with queries and filters
-            client: PubMed client for Entrez API access
+            client: PubMed client for Entrez API access (AsyncPubMedClient
+                fetches all of a scan's PMIDs through the history server)
+            seen_store: Optional store used to skip PMIDs ingested by
+                earlier runs (None = dedupe within this run only)
         """
         self._config = config
         self._client = client
+        self._seen_store = seen_store
+
+    def sources(self) -> list[str]:
+        """Search queries a scan covers, each scannable as its own shard."""
+        return list(self._config.search_queries)
+
+    @staticmethod
+    def shard_key(article: RawPubMedArticle) -> str:
+        """Deduplication key of an article across shards."""
+        return article.pmid
 
-    async def scan(self) -> ScanResult:
+    async def scan(self, sources: Optional[list[str]] = None) -> ScanResult:
         """Execute scan stage: search PubMed for relevant articles.
 
         Executes all configured search queries, applies filters,
         and deduplicates results by PMID.
 
+        Args:
+            sources: Search queries to run (a shard of sources()); None
+                runs every configured query
+
         Returns:
             ScanResult with RawPubMedArticle list and statistics
 
@@ -101,15 +130,16 @@ class PubMedScanner:
         queries_executed = 0
         queries_failed = 0
         errors: list[str] = []
+        queries = self._config.search_queries if sources is None else list(sources)
 
         logger.info(
             "Starting PubMed scan with %d queries, lookback=%d days",
-            len(self._config.search_queries),
+            len(queries),
             self._config.lookback_days,
         )
 
         # Execute each search query
-        for query in self._config.search_queries:
+        for query in queries:
             try:
                 pmids = await self._client.search(
                     query=query,
@@ -135,27 +165,31 @@ class PubMedScanner:
                 continue
 
         # Check if all queries failed
-        if queries_failed == len(self._config.search_queries):
+        if queries_failed == len(queries):
             raise PubMedScanError(
                 f"All {queries_failed} queries failed",
                 partial_results=[],
             )
 
-        # Fetch article details for all unique PMIDs
-        articles = await self._fetch_article_details(list(all_pmids))
+        # Skip PMIDs published by earlier runs, then fetch details for the rest
+        new_pmids = await self._drop_seen(sorted(all_pmids))
+        articles = await self._fetch_article_details(new_pmids)
 
         statistics = ScanStatistics(
             queries_executed=queries_executed,
             total_pmids_found=total_found,
             pmids_after_dedup=len(all_pmids),
             queries_failed=queries_failed,
+            already_seen=len(all_pmids) - len(new_pmids),
         )
 
         logger.info(
-            "PubMed scan complete: %d queries, %d total PMIDs, %d unique, %d articles",
+            "PubMed scan complete: %d queries, %d total PMIDs, %d unique, "
+            "%d already seen, %d articles",
             queries_executed,
             total_found,
             len(all_pmids),
+            statistics.already_seen,
             len(articles),
         )
 
@@ -165,6 +199,30 @@ class PubMedScanner:
             errors=errors,
         )
 
+    async def _drop_seen(self, pmids: list[str]) -> list[str]:
+        """Remove PMIDs already published by an earlier run.
+
+        PMIDs are keyed by PubMed URL, the URL the transformer publishes.
+        Skipping them here saves the efetch call and both LLM stages.
+
+        Args:
+            pmids: Unique PMIDs from this run
+
+        Returns:
+            PMIDs not yet in the Research Pool
+        """
+        if self._seen_store is None or not pmids:
+            return pmids
+
+        seen = await self._seen_store.find_seen(
+            ResearchSource.PUBMED,
+            [PUBMED_URL_TEMPLATE.format(pmid=pmid) for pmid in pmids],
+        )
+        return [
+            pmid for pmid in pmids
+            if PUBMED_URL_TEMPLATE.format(pmid=pmid) not in seen
+        ]
+
     async def _fetch_article_details(
         self,
         pmids: list[str],
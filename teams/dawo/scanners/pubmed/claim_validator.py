@@ -18,19 +18,30 @@ Usage:
 
     # Execute claim validation
     result = await validator.validate_claim_potential(summary)
+
+    # Validate a batch concurrently (bounded by LLMBatchConfig)
+    results = await validator.validate_batch(summaries, stats=stats.claim_validation_calls)
 """
 
 import json
 import logging
 from typing import Any, Optional
 
-from .schemas import FindingSummary, ClaimValidationResult, ContentPotential
+from teams.dawo.config import TaskType
+from teams.dawo.middleware.llm_cache import LLMResponseCache, cached_generate, template_id
+
+from .config import LLMBatchConfig
+from .schemas import FindingSummary, ClaimValidationResult, ContentPotential, LLMCallStats
 from .prompts import CLAIM_VALIDATION_PROMPT
+from .llm_batch import run_llm_batch
 
 
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Response cache key component - changes whenever the prompt text changes
+CLAIM_VALIDATION_TEMPLATE_ID = template_id("pubmed.claim_validation", CLAIM_VALIDATION_PROMPT)
+
 
 class ClaimValidationError(Exception):
     """Exception raised for claim validation errors.
@@ -71,21 +82,29 @@ class ClaimValidator:
     Attributes:
         _llm: LLM client configured for tier="generate"
         _compliance: EU compliance checker (optional, for future integration)
+        _batch_config: Concurrency and timeout limits for validate_batch
+        _cache: Optional LLM response cache
     """
 
     def __init__(
         self,
         llm_client: Any,
         compliance_checker: Optional[Any] = None,
+        batch_config: Optional[LLMBatchConfig] = None,
+        response_cache: Optional[LLMResponseCache] = None,
     ):
         """Initialize claim validator with injected dependencies.
 
         Args:
             llm_client: LLM client configured for tier="generate"
             compliance_checker: Optional EU compliance checker (Story 1.2)
+            batch_config: Fan-out limits for validate_batch (defaults if None)
+            response_cache: Optional cache for repeated findings
         """
         self._llm = llm_client
         self._compliance = compliance_checker
+        self._batch_config = batch_config or LLMBatchConfig()
+        self._cache = response_cache
 
     async def validate_claim_potential(
         self,
@@ -103,23 +122,25 @@ class ClaimValidator:
             ClaimValidationError: If validation fails
         """
         # Format prompt
-        prompt = CLAIM_VALIDATION_PROMPT.format(
-            compound=summary.compound_studied,
-            effect=summary.effect_measured,
-            summary=summary.key_findings,
-            strength=summary.study_strength,
-        )
+        inputs = {
+            "compound": summary.compound_studied,
+            "effect": summary.effect_measured,
+            "summary": summary.key_findings,
+            "strength": summary.study_strength,
+        }
+        prompt = CLAIM_VALIDATION_PROMPT.format(**inputs)
 
         try:
-            # Call LLM
-            response = await self._llm.generate(
-                prompt=prompt,
-                max_tokens=600,
+            # Call LLM (or reuse a cached response), then parse
+            return await cached_generate(
+                self._cache,
+                template=CLAIM_VALIDATION_TEMPLATE_ID,
+                tier=TaskType.GENERATE.value,
+                inputs={**inputs, "max_tokens": 600},
+                generate=lambda: self._llm.generate(prompt=prompt, max_tokens=600),
+                parse=self._parse_response,
             )
 
-            # Parse response
-            return self._parse_response(response)
-
         except json.JSONDecodeError as e:
             logger.warning(
                 "Failed to parse LLM response as JSON for %s: %s",
@@ -141,26 +162,30 @@ class ClaimValidator:
     async def validate_batch(
         self,
         summaries: dict[str, FindingSummary],
+        stats: Optional[LLMCallStats] = None,
     ) -> dict[str, ClaimValidationResult]:
-        """Validate multiple summaries.
+        """Validate multiple summaries concurrently.
+
+        Runs up to batch_config.max_concurrency LLM calls at once, each
+        bounded by batch_config.call_timeout. Summaries that fail or time
+        out get the conservative default result.
 
         Args:
             summaries: Dict mapping PMID to FindingSummary
+            stats: Optional LLMCallStats to record per-call latency into
 
         Returns:
             Dict mapping PMID to ClaimValidationResult
         """
-        results: dict[str, ClaimValidationResult] = {}
-
-        for pmid, summary in summaries.items():
-            try:
-                result = await self.validate_claim_potential(summary)
-                results[pmid] = result
-            except ClaimValidationError as e:
-                logger.warning("Claim validation failed for %s: %s", pmid, e)
-                results[pmid] = self._default_result()
-
-        return results
+        return await run_llm_batch(
+            list(summaries.items()),
+            call=self.validate_claim_potential,
+            fallback=lambda summary: self._default_result(),
+            recoverable=(ClaimValidationError,),
+            config=self._batch_config,
+            stats=stats,
+            stage="Claim validation",
+        )
 
     def _parse_response(self, response: str) -> ClaimValidationResult:
         """Parse LLM response into ClaimValidationResult.
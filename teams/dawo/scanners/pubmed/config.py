@@ -3,6 +3,8 @@
 Provides configuration structures for:
     - EntrezConfig: NCBI Entrez E-utilities credentials
     - PubMedScannerConfig: Scanner behavior settings
+    - LLMBatchConfig: Fan-out limits for the LLM stages
+    - EUtilsClientConfig: HTTP settings for AsyncPubMedClient
 
 Configuration is injected via constructor - NEVER loaded from files directly.
 Team Builder is responsible for loading config and injecting it.
@@ -36,6 +38,16 @@ DEFAULT_LOOKBACK_DAYS = 90  # Scientific publication cadence is slower
 DEFAULT_MAX_RESULTS_PER_QUERY = 50
 DEFAULT_BATCH_SIZE = 200  # NCBI efetch limit per request
 
+# Async E-utilities client (history server)
+DEFAULT_HISTORY_BATCH_SIZE = 500  # Records per efetch from a WebEnv history set
+MAX_HISTORY_BATCH_SIZE = 10_000  # NCBI efetch retmax ceiling
+DEFAULT_EUTILS_TIMEOUT = 60.0  # Seconds per E-utilities request
+DEFAULT_EUTILS_MAX_CONNECTIONS = 4  # Pooled connections to eutils.ncbi.nlm.nih.gov
+
+# LLM stage fan-out (FindingSummarizer, ClaimValidator)
+DEFAULT_LLM_MAX_CONCURRENCY = 8  # In-flight LLM calls per batch
+DEFAULT_LLM_CALL_TIMEOUT = 60.0  # Seconds per LLM call before falling back
+
 # Default search queries for mushroom/adaptogen research
 DEFAULT_SEARCH_QUERIES = [
     "lion's mane cognition",
@@ -82,6 +94,57 @@ class EntrezConfig:
             raise ValueError("email is required by NCBI policy")
 
 
+@dataclass(frozen=True)
+class LLMBatchConfig:
+    """Fan-out limits for batch LLM stages.
+
+    Used by FindingSummarizer.summarize_batch and ClaimValidator.validate_batch
+    to run calls concurrently without flooding the LLM provider.
+
+    Attributes:
+        max_concurrency: Maximum LLM calls in flight at once
+        call_timeout: Seconds to wait for a single call before using the
+            default result for that item
+    """
+
+    max_concurrency: int = DEFAULT_LLM_MAX_CONCURRENCY
+    call_timeout: float = DEFAULT_LLM_CALL_TIMEOUT
+
+    def __post_init__(self) -> None:
+        """Validate fan-out limits."""
+        if self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {self.max_concurrency}")
+        if self.call_timeout <= 0:
+            raise ValueError(f"call_timeout must be > 0, got {self.call_timeout}")
+
+
+@dataclass(frozen=True)
+class EUtilsClientConfig:
+    """HTTP settings for AsyncPubMedClient.
+
+    Attributes:
+        history_batch_size: Records per efetch request from a history set
+        timeout: Seconds per E-utilities request
+        max_connections: Connection pool size
+    """
+
+    history_batch_size: int = DEFAULT_HISTORY_BATCH_SIZE
+    timeout: float = DEFAULT_EUTILS_TIMEOUT
+    max_connections: int = DEFAULT_EUTILS_MAX_CONNECTIONS
+
+    def __post_init__(self) -> None:
+        """Validate client settings."""
+        if not 1 <= self.history_batch_size <= MAX_HISTORY_BATCH_SIZE:
+            raise ValueError(
+                f"history_batch_size must be between 1 and {MAX_HISTORY_BATCH_SIZE}, "
+                f"got {self.history_batch_size}"
+            )
+        if self.timeout <= 0:
+            raise ValueError(f"timeout must be > 0, got {self.timeout}")
+        if self.max_connections < 1:
+            raise ValueError(f"max_connections must be >= 1, got {self.max_connections}")
+
+
 def _default_search_queries() -> list[str]:
     """Create default search queries list.
 
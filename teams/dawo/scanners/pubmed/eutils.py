@@ -0,0 +1,594 @@
+"""Native async NCBI E-utilities client using the history server.
+
+Alternative to PubMedClient for large scans and backfills. PubMedClient
+runs Biopython's blocking Entrez calls in a thread executor, fetches
+200-PMID batches one after another and holds each full Entrez.read tree
+in memory. AsyncPubMedClient instead:
+
+    - Talks to E-utilities over one pooled httpx.AsyncClient, reporting
+      calls and bytes to pipeline telemetry
+    - Posts all of a scan's PMIDs to the history server once (EPost) and
+      fetches them back in large WebEnv/query_key batches, concurrently
+    - Paces every request through a token bucket (3 req/sec, or 10 with
+      an API key, per NCBI policy)
+    - Parses efetch XML incrementally while it streams, discarding each
+      PubmedArticle element once it has been converted
+
+search() and fetch_details() match PubMedClient, so PubMedScanner works
+with either client. Article dicts have the same keys as
+PubMedClient._parse_article.
+
+Usage:
+    # Created by Team Builder with injected config
+    async with AsyncPubMedClient(entrez_config, retry_middleware) as client:
+        scanner = PubMedScanner(scanner_config, client)
+        result = await scanner.scan()
+
+    # Backfill without holding every article at once
+    async for articles in client.iter_details(pmids):
+        ...
+"""
+
+import asyncio
+import logging
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Optional
+
+import httpx
+
+from teams.dawo.middleware.retry import RetryMiddleware, RetryResult
+from teams.dawo.middleware.telemetry import (
+    STREAMED_RESPONSE,
+    record_call,
+    telemetry_event_hooks,
+)
+
+from .config import (
+    EntrezConfig,
+    EUtilsClientConfig,
+    RATE_LIMIT_NO_KEY,
+    RATE_LIMIT_WITH_KEY,
+)
+from .tools import (
+    DEFAULT_TOOL_NAME,
+    PubMedFetchError,
+    PubMedSearchError,
+    build_search_term,
+)
+
+
+# Module logger
+logger = logging.getLogger(__name__)
+
+EUTILS_BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+
+# Same cap PubMedClient._extract_authors applies
+MAX_AUTHORS = 10
+
+MONTH_NUMBERS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4,
+    "may": 5, "jun": 6, "jul": 7, "aug": 8,
+    "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+
+class TokenBucket:
+    """Async token bucket pacing requests to a fixed rate.
+
+    Waiters are served in arrival order. With the default capacity of 1
+    no bursts are allowed, so requests are spaced at least 1/rate apart.
+
+    Attributes:
+        _rate: Tokens added per second
+        _capacity: Maximum tokens held
+        _tokens: Tokens currently available
+        _updated: Clock reading of the last refill
+        _clock: Monotonic clock (injectable for tests)
+        _lock: Serializes waiters
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens (requests) per second
+            capacity: Maximum burst size
+            clock: Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for a refill if the bucket is empty."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                wait_time = (1 - self._tokens) / self._rate
+                logger.debug("Rate limiting: waiting %.2f seconds", wait_time)
+                await asyncio.sleep(wait_time)
+                self._refill()
+            self._tokens = max(0.0, self._tokens - 1)
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+@dataclass(frozen=True)
+class HistorySet:
+    """A result set stored on the NCBI history server.
+
+    Attributes:
+        webenv: Web environment string
+        query_key: Query key of the set within webenv
+        count: Number of records in the set
+    """
+
+    webenv: str
+    query_key: str
+    count: int
+
+
+class AsyncPubMedClient:
+    """Async PubMed E-utilities client backed by the history server.
+
+    Accepts configuration via dependency injection - NEVER loads files directly.
+    Wraps every request with retry middleware (Story 1.5).
+
+    Attributes:
+        _config: Entrez configuration with email and API key
+        _retry: Retry middleware for resilient API calls
+        _client_config: HTTP settings (batch size, timeout, pool size)
+        _bucket: Token bucket enforcing the NCBI rate limit
+        _http: Pooled HTTP client (created on first use)
+    """
+
+    def __init__(
+        self,
+        config: EntrezConfig,
+        retry_middleware: RetryMiddleware,
+        client_config: Optional[EUtilsClientConfig] = None,
+    ):
+        """Initialize client with injected dependencies.
+
+        Args:
+            config: Entrez configuration with email and optional API key
+            retry_middleware: Retry middleware from Story 1.5 (required)
+            client_config: HTTP settings (defaults to EUtilsClientConfig())
+        """
+        self._config = config
+        self._retry = retry_middleware
+        self._client_config = client_config or EUtilsClientConfig()
+        self._bucket = TokenBucket(
+            RATE_LIMIT_WITH_KEY if config.api_key else RATE_LIMIT_NO_KEY
+        )
+        self._http: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "AsyncPubMedClient":
+        """Async context manager entry."""
+        self._get_http()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=EUTILS_BASE_URL,
+                timeout=self._client_config.timeout,
+                limits=httpx.Limits(
+                    max_connections=self._client_config.max_connections,
+                    max_keepalive_connections=self._client_config.max_connections,
+                ),
+                event_hooks=telemetry_event_hooks(),
+            )
+        return self._http
+
+    def _params(self, **params: Any) -> dict[str, Any]:
+        """Add NCBI identification parameters to a request."""
+        params["tool"] = DEFAULT_TOOL_NAME
+        params["email"] = self._config.email
+        if self._config.api_key:
+            params["api_key"] = self._config.api_key
+        return params
+
+    async def _call(self, operation: Callable[[], Any], context: str) -> Any:
+        """Run one rate-limited request through the retry middleware.
+
+        Every attempt (including retries) takes its own token.
+
+        Raises:
+            RuntimeError: With the last error if the request did not succeed
+        """
+        async def paced() -> Any:
+            await self._bucket.acquire()
+            return await operation()
+
+        result: RetryResult = await self._retry.execute_with_retry(
+            paced,
+            context=f"pubmed_{context}",
+        )
+        if not result.success:
+            raise RuntimeError(result.last_error or f"{context} failed")
+        return result.response
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 50,
+        date_filter: Optional[int] = None,
+        publication_types: Optional[list[str]] = None,
+    ) -> list[str]:
+        """Search PubMed for articles matching query.
+
+        Args:
+            query: Search query (supports PubMed syntax)
+            max_results: Maximum results to return
+            date_filter: Only include articles from last N days
+            publication_types: Filter by publication types
+
+        Returns:
+            List of PMIDs matching query, by relevance
+
+        Raises:
+            PubMedSearchError: On search failure
+        """
+        term = build_search_term(query, date_filter, publication_types)
+        params = self._params(
+            db="pubmed",
+            term=term,
+            retmax=max_results,
+            sort="relevance",
+            retmode="json",
+        )
+        logger.debug("Searching PubMed: %s (max_results=%d)", term, max_results)
+
+        async def request() -> dict[str, Any]:
+            response = await self._get_http().get("/esearch.fcgi", params=params)
+            response.raise_for_status()
+            return response.json()
+
+        try:
+            data = await self._call(request, "esearch")
+        except Exception as e:
+            logger.error("PubMed search failed for query '%s': %s", query, e)
+            raise PubMedSearchError(f"Search failed: {e}", query) from e
+
+        result = data.get("esearchresult", {})
+        if "ERROR" in result:
+            raise PubMedSearchError(f"Search failed: {result['ERROR']}", query)
+
+        pmids = result.get("idlist", [])
+        logger.info("PubMed search returned %d results for query: %s", len(pmids), query)
+        return pmids
+
+    async def post_history(self, pmids: list[str]) -> HistorySet:
+        """Store PMIDs on the history server with a single EPost.
+
+        Args:
+            pmids: PubMed IDs to store
+
+        Returns:
+            HistorySet referencing the stored PMIDs
+
+        Raises:
+            PubMedFetchError: On EPost failure
+        """
+        data = self._params(db="pubmed", id=",".join(pmids))
+
+        async def request() -> bytes:
+            response = await self._get_http().post("/epost.fcgi", data=data)
+            response.raise_for_status()
+            return response.content
+
+        try:
+            root = ET.fromstring(await self._call(request, "epost"))
+        except Exception as e:
+            logger.error("PubMed EPost of %d PMIDs failed: %s", len(pmids), e)
+            raise PubMedFetchError(f"EPost failed: {e}", pmids) from e
+
+        webenv = root.findtext("WebEnv")
+        query_key = root.findtext("QueryKey")
+        if not webenv or not query_key:
+            error = root.findtext("ERROR") or "missing WebEnv/QueryKey"
+            raise PubMedFetchError(f"EPost failed: {error}", pmids)
+
+        return HistorySet(webenv=webenv, query_key=query_key, count=len(pmids))
+
+    async def fetch_details(
+        self,
+        pmids: list[str],
+        batch_size: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch full article details for given PMIDs.
+
+        Posts the PMIDs to the history server and fetches every batch
+        concurrently (paced by the token bucket).
+
+        Args:
+            pmids: List of PubMed IDs
+            batch_size: Records per efetch (default: client_config.history_batch_size)
+
+        Returns:
+            List of parsed article dictionaries, in history order
+
+        Raises:
+            PubMedFetchError: On fetch failure
+        """
+        if not pmids:
+            return []
+
+        batch_size = batch_size or self._client_config.history_batch_size
+        history = await self.post_history(pmids)
+        batches = await asyncio.gather(
+            *(
+                self._fetch_history_batch(history, start, batch_size)
+                for start in range(0, history.count, batch_size)
+            )
+        )
+
+        articles = [article for batch in batches for article in batch]
+        logger.info("Fetched %d articles from %d PMIDs", len(articles), len(pmids))
+        return articles
+
+    async def iter_details(
+        self,
+        pmids: list[str],
+        batch_size: Optional[int] = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield article details one history batch at a time.
+
+        For backfills: only one batch of parsed articles is held at once.
+
+        Args:
+            pmids: List of PubMed IDs
+            batch_size: Records per efetch (default: client_config.history_batch_size)
+
+        Yields:
+            Lists of parsed article dictionaries
+
+        Raises:
+            PubMedFetchError: On fetch failure
+        """
+        if not pmids:
+            return
+
+        batch_size = batch_size or self._client_config.history_batch_size
+        history = await self.post_history(pmids)
+        for start in range(0, history.count, batch_size):
+            yield await self._fetch_history_batch(history, start, batch_size)
+
+    async def _fetch_history_batch(
+        self,
+        history: HistorySet,
+        start: int,
+        batch_size: int,
+    ) -> list[dict[str, Any]]:
+        """Fetch and incrementally parse one efetch batch from a history set.
+
+        Args:
+            history: History set to read from
+            start: Index of the first record (retstart)
+            batch_size: Records to fetch (retmax)
+
+        Returns:
+            List of parsed articles
+
+        Raises:
+            PubMedFetchError: On fetch failure
+        """
+        params = self._params(
+            db="pubmed",
+            WebEnv=history.webenv,
+            query_key=history.query_key,
+            retstart=start,
+            retmax=batch_size,
+            rettype="xml",
+            retmode="xml",
+        )
+
+        async def request() -> list[dict[str, Any]]:
+            async with self._get_http().stream(
+                "GET",
+                "/efetch.fcgi",
+                params=params,
+                extensions={STREAMED_RESPONSE: True},
+            ) as response:
+                try:
+                    response.raise_for_status()
+                    parser = ArticleStreamParser()
+                    async for chunk in response.aiter_bytes():
+                        parser.feed(chunk)
+                    return parser.close()
+                finally:
+                    # Streamed body is not seen by the telemetry hook
+                    record_call(response.num_bytes_downloaded)
+
+        try:
+            articles = await self._call(request, "efetch")
+        except Exception as e:
+            logger.error("Failed to fetch history batch starting at index %d: %s", start, e)
+            raise PubMedFetchError(f"Fetch failed: {e}") from e
+
+        logger.debug("Fetched %d articles from history batch at %d", len(articles), start)
+        return articles
+
+
+class ArticleStreamParser:
+    """Incremental efetch XML parser.
+
+    Fed raw bytes as they arrive; converts each PubmedArticle as soon as
+    its end tag is seen and then drops it from the tree, so memory stays
+    bounded by one article rather than the whole response.
+
+    Attributes:
+        _parser: ElementTree pull parser
+        _root: PubmedArticleSet element (cleared after every article)
+        _articles: Articles parsed so far
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._root: Optional[ET.Element] = None
+        self._articles: list[dict[str, Any]] = []
+
+    def feed(self, data: bytes) -> None:
+        """Parse the next chunk of the response body."""
+        self._parser.feed(data)
+        self._drain()
+
+    def close(self) -> list[dict[str, Any]]:
+        """Finish parsing and return every parsed article."""
+        self._parser.close()
+        self._drain()
+        return self._articles
+
+    def _drain(self) -> None:
+        """Convert completed PubmedArticle elements."""
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                continue
+
+            if element.tag == "PubmedArticle":
+                parsed = parse_article_element(element)
+                if parsed:
+                    self._articles.append(parsed)
+                if self._root is not None:
+                    self._root.clear()
+            elif element.tag == "PubmedBookArticle" and self._root is not None:
+                self._root.clear()
+
+
+def parse_article_element(article: ET.Element) -> Optional[dict[str, Any]]:
+    """Parse a PubmedArticle element to the PubMedClient article dict.
+
+    Args:
+        article: PubmedArticle element
+
+    Returns:
+        Parsed article dict or None if parsing fails
+    """
+    try:
+        medline = article.find("MedlineCitation")
+        if medline is None:
+            return None
+
+        pmid = (medline.findtext("PMID") or "").strip()
+        if not pmid:
+            return None
+
+        article_data = medline.find("Article")
+        if article_data is None:
+            return None
+
+        return {
+            "pmid": pmid,
+            "title": _text(article_data.find("ArticleTitle")),
+            "abstract": " ".join(
+                _text(part) for part in article_data.iterfind("Abstract/AbstractText")
+            ),
+            "authors": _extract_authors(article_data),
+            "journal": _text(article_data.find("Journal/Title")),
+            "pub_date": _extract_pub_date(article_data),
+            "doi": _extract_doi(article),
+            "publication_types": [
+                _text(pt) for pt in article_data.iterfind("PublicationTypeList/PublicationType")
+            ],
+        }
+
+    except Exception as e:
+        logger.warning("Failed to parse article: %s", e)
+        return None
+
+
+def _text(element: Optional[ET.Element]) -> str:
+    """Full text of an element, including inline markup (<i>, <sup>)."""
+    if element is None:
+        return ""
+    return "".join(element.itertext()).strip()
+
+
+def _extract_authors(article_data: ET.Element) -> list[str]:
+    """Extract author names from article data."""
+    authors = []
+    for author in article_data.iterfind("AuthorList/Author"):
+        last = author.findtext("LastName", "")
+        first = author.findtext("ForeName", "")
+        if last:
+            authors.append(f"{last} {first}".strip())
+        if len(authors) == MAX_AUTHORS:
+            break
+    return authors
+
+
+def _extract_pub_date(article_data: ET.Element) -> Optional[datetime]:
+    """Extract publication date, preferring the precise ArticleDate."""
+    article_date = article_data.find("ArticleDate")
+    if article_date is not None:
+        try:
+            return datetime(
+                int(article_date.findtext("Year", "2000")),
+                int(article_date.findtext("Month", "1")),
+                int(article_date.findtext("Day", "1")),
+                tzinfo=timezone.utc,
+            )
+        except (ValueError, TypeError):
+            pass
+
+    pub_date = article_data.find("Journal/JournalIssue/PubDate")
+    if pub_date is None:
+        return None
+
+    try:
+        year = int(pub_date.findtext("Year", "0"))
+        if year:
+            month = pub_date.findtext("Month", "Jan")
+            if not month.isdigit():
+                month = MONTH_NUMBERS.get(month.lower()[:3], 1)
+            return datetime(year, int(month), 1, tzinfo=timezone.utc)
+    except (ValueError, TypeError):
+        pass
+
+    return None
+
+
+def _extract_doi(article: ET.Element) -> Optional[str]:
+    """Extract DOI from article identifiers."""
+    for article_id in article.iterfind("PubmedData/ArticleIdList/ArticleId"):
+        if article_id.get("IdType") == "doi":
+            return _text(article_id) or None
+    return None
@@ -18,19 +18,32 @@ Usage:
 
     # Execute summarization
     summary = await summarizer.summarize(harvested_article)
+
+    # Summarize a batch concurrently (bounded by LLMBatchConfig)
+    summaries = await summarizer.summarize_batch(articles, stats=stats.summarize_calls)
 """
 
 import json
 import logging
 from typing import Any, Optional
 
-from .schemas import HarvestedArticle, FindingSummary
+from teams.dawo.config import TaskType
+from teams.dawo.middleware.llm_cache import LLMResponseCache, cached_generate, template_id
+
+from .config import LLMBatchConfig
+from .schemas import HarvestedArticle, FindingSummary, LLMCallStats
 from .prompts import FINDING_SUMMARIZATION_PROMPT
+from .llm_batch import run_llm_batch
 
 
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Response cache key component - changes whenever the prompt text changes
+FINDING_SUMMARIZATION_TEMPLATE_ID = template_id(
+    "pubmed.finding_summarization", FINDING_SUMMARIZATION_PROMPT
+)
+
 
 class SummarizationError(Exception):
     """Exception raised for summarization errors.
@@ -67,15 +80,26 @@ class FindingSummarizer:
 
     Attributes:
         _llm: LLM client configured for tier="generate"
+        _batch_config: Concurrency and timeout limits for summarize_batch
+        _cache: Optional LLM response cache
     """
 
-    def __init__(self, llm_client: Any):
+    def __init__(
+        self,
+        llm_client: Any,
+        batch_config: Optional[LLMBatchConfig] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+    ):
         """Initialize finding summarizer with injected LLM client.
 
         Args:
             llm_client: LLM client configured for tier="generate"
+            batch_config: Fan-out limits for summarize_batch (defaults if None)
+            response_cache: Optional cache for repeated abstracts
         """
         self._llm = llm_client
+        self._batch_config = batch_config or LLMBatchConfig()
+        self._cache = response_cache
 
     async def summarize(
         self,
@@ -97,22 +121,24 @@ class FindingSummarizer:
             return self._default_summary(article)
 
         # Format prompt
-        prompt = FINDING_SUMMARIZATION_PROMPT.format(
-            title=article.title,
-            study_type=article.study_type.value,
-            abstract=article.abstract[:4000],  # Truncate very long abstracts
-        )
+        inputs = {
+            "title": article.title,
+            "study_type": article.study_type.value,
+            "abstract": article.abstract[:4000],  # Truncate very long abstracts
+        }
+        prompt = FINDING_SUMMARIZATION_PROMPT.format(**inputs)
 
         try:
-            # Call LLM
-            response = await self._llm.generate(
-                prompt=prompt,
-                max_tokens=800,
+            # Call LLM (or reuse a cached response), then parse
+            return await cached_generate(
+                self._cache,
+                template=FINDING_SUMMARIZATION_TEMPLATE_ID,
+                tier=TaskType.GENERATE.value,
+                inputs={**inputs, "max_tokens": 800},
+                generate=lambda: self._llm.generate(prompt=prompt, max_tokens=800),
+                parse=lambda response: self._parse_response(response, article),
             )
 
-            # Parse response
-            return self._parse_response(response, article)
-
         except json.JSONDecodeError as e:
             logger.warning(
                 "Failed to parse LLM response as JSON for %s: %s",
@@ -134,26 +160,30 @@ class FindingSummarizer:
     async def summarize_batch(
         self,
         articles: list[HarvestedArticle],
+        stats: Optional[LLMCallStats] = None,
     ) -> dict[str, FindingSummary]:
-        """Summarize multiple articles.
+        """Summarize multiple articles concurrently.
+
+        Runs up to batch_config.max_concurrency LLM calls at once, each
+        bounded by batch_config.call_timeout. Articles that fail or time
+        out get the default summary.
 
         Args:
             articles: List of HarvestedArticle
+            stats: Optional LLMCallStats to record per-call latency into
 
         Returns:
             Dict mapping PMID to FindingSummary
         """
-        results: dict[str, FindingSummary] = {}
-
-        for article in articles:
-            try:
-                summary = await self.summarize(article)
-                results[article.pmid] = summary
-            except SummarizationError as e:
-                logger.warning("Summarization failed for %s: %s", article.pmid, e)
-                results[article.pmid] = self._default_summary(article)
-
-        return results
+        return await run_llm_batch(
+            [(article.pmid, article) for article in articles],
+            call=self.summarize,
+            fallback=self._default_summary,
+            recoverable=(SummarizationError,),
+            config=self._batch_config,
+            stats=stats,
+            stage="Summarization",
+        )
 
     def _parse_response(
         self,
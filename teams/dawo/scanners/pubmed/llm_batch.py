@@ -0,0 +1,97 @@
+"""Bounded-concurrency fan-out for the PubMed LLM stages.
+
+FindingSummarizer and ClaimValidator make one LLM round trip per article.
+run_llm_batch runs those calls concurrently under LLMBatchConfig limits:
+    - At most max_concurrency calls in flight
+    - Each call bounded by call_timeout
+    - Failed or timed-out items fall back to the stage's default result
+    - Results keyed by PMID in input order
+
+Usage:
+    results = await run_llm_batch(
+        [(article.pmid, article) for article in articles],
+        call=self.summarize,
+        fallback=self._default_summary,
+        recoverable=(SummarizationError,),
+        config=self._batch_config,
+        stats=stats,
+        stage="Summarization",
+    )
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional, Sequence, TypeVar
+
+from .config import LLMBatchConfig
+from .schemas import LLMCallStats
+
+
+# Module logger
+logger = logging.getLogger(__name__)
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+async def run_llm_batch(
+    items: Sequence[tuple[str, ItemT]],
+    call: Callable[[ItemT], Awaitable[ResultT]],
+    fallback: Callable[[ItemT], ResultT],
+    recoverable: tuple[type[Exception], ...],
+    config: LLMBatchConfig,
+    stats: Optional[LLMCallStats] = None,
+    stage: str = "LLM call",
+) -> dict[str, ResultT]:
+    """Run one LLM call per item with bounded concurrency.
+
+    Args:
+        items: (PMID, item) pairs; a repeated PMID keeps its last result
+        call: Coroutine function making the LLM call for one item
+        fallback: Builds the default result for an item that failed
+        recoverable: Exception types that trigger the fallback
+        config: Concurrency and timeout limits
+        stats: Optional LLMCallStats to record per-call latency into
+        stage: Stage name for log messages
+
+    Returns:
+        Dict mapping PMID to result, in input order
+    """
+    stats = stats if stats is not None else LLMCallStats()
+    semaphore = asyncio.Semaphore(config.max_concurrency)
+
+    async def run_single(pmid: str, item: ItemT) -> ResultT:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                return await asyncio.wait_for(call(item), timeout=config.call_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "%s timed out for %s after %.1fs",
+                    stage,
+                    pmid,
+                    config.call_timeout,
+                )
+                stats.timeouts += 1
+                return fallback(item)
+            except recoverable as e:
+                logger.warning("%s failed for %s: %s", stage, pmid, e)
+                stats.failures += 1
+                return fallback(item)
+            finally:
+                stats.latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    results = await asyncio.gather(*(run_single(pmid, item) for pmid, item in items))
+
+    logger.info(
+        "%s batch complete: %d calls, mean=%.0fms, p95=%.0fms, timeouts=%d, failures=%d",
+        stage,
+        stats.calls,
+        stats.mean_ms,
+        stats.p95_ms,
+        stats.timeouts,
+        stats.failures,
+    )
+
+    return {pmid: result for (pmid, _), result in zip(items, results)}
@@ -30,6 +30,17 @@ import logging
 from typing import Any, Optional, Protocol
 from uuid import UUID
 
+from teams.dawo.middleware.telemetry import (
+    PipelineTelemetry,
+    PipelineTelemetryStore,
+    get_telemetry_store,
+)
+from teams.dawo.middleware.checkpoint import (
+    PipelineCheckpointStore,
+    RunCheckpoint,
+    open_run_checkpoint,
+)
+
 from .schemas import (
     PipelineResult,
     PipelineStatus,
@@ -121,6 +132,7 @@ class PubMedResearchPipeline:
         - Graceful degradation on failures
         - Partial success tracking
         - Statistics reporting
+        - Per-stage timing and external call telemetry
         - Study type score boosting
 
     All dependencies are injected via constructor.
@@ -134,6 +146,8 @@ class PubMedResearchPipeline:
         _validator: EU compliance validator
         _scorer: Research item scorer
         _publisher: Research publisher
+        _telemetry_store: Rolling history that receives each run's telemetry
+        _checkpoint_store: Stage outputs kept so retried runs resume (optional)
     """
 
     def __init__(
@@ -146,6 +160,8 @@ class PubMedResearchPipeline:
         validator: PubMedValidator,
         scorer: ResearchScorerProtocol,
         publisher: ResearchPublisherProtocol,
+        telemetry_store: Optional[PipelineTelemetryStore] = None,
+        checkpoint_store: Optional[PipelineCheckpointStore] = None,
     ):
         """Initialize pipeline with all stage components.
 
@@ -158,6 +174,8 @@ class PubMedResearchPipeline:
             validator: EU compliance validator
             scorer: Research item scorer (Story 2.2)
             publisher: Research publisher (Story 2.1)
+            telemetry_store: Run telemetry history (default: global store)
+            checkpoint_store: Stage checkpoints for resuming retries (default: none)
         """
         self._scanner = scanner
         self._harvester = harvester
@@ -167,53 +185,95 @@ class PubMedResearchPipeline:
         self._validator = validator
         self._scorer = scorer
         self._publisher = publisher
+        self._telemetry_store = telemetry_store or get_telemetry_store()
+        self._checkpoint_store = checkpoint_store
 
-    async def execute(self) -> PipelineResult:
+    async def execute(self, run_id: Optional[str] = None) -> PipelineResult:
         """Execute full pipeline.
 
+        Args:
+            run_id: Run id of a failed attempt (PipelineResult.run_id) to
+                resume from its checkpoints; None starts a new run
+
         Returns:
             PipelineResult with status and statistics
 
         Note:
             Implements graceful degradation - continues on partial failures
         """
+        checkpoint = await open_run_checkpoint(self._checkpoint_store, "pubmed", run_id)
+        return await checkpoint.settle(await self._execute(checkpoint))
+
+    async def _execute(self, checkpoint: RunCheckpoint) -> PipelineResult:
+        """Run the stages, reusing checkpointed outputs of earlier attempts."""
         stats = PipelineStatistics()
+        telemetry = PipelineTelemetry(pipeline="pubmed")
         published_ids: list[UUID] = []
         errors: list[str] = []
 
         try:
             # Stage 1: Scan
             logger.info("Starting PubMed research pipeline")
-            scan_result = await self._execute_scan(stats, errors)
+            with telemetry.stage("scan") as stage:
+                scan_result = await self._execute_scan(checkpoint, stats, errors)
+            stage.items_out = stats.total_found
             if scan_result is None:
-                return self._incomplete_result(stats, errors)
+                # The retry must scan again rather than reuse an empty scan
+                await checkpoint.forget("scan")
+                return self._incomplete_result(stats, errors, telemetry)
 
             # Stage 2: Harvest
-            harvested = await self._execute_harvest(scan_result, stats, errors)
+            with telemetry.stage("harvest", items_in=stats.total_found) as stage:
+                harvested = await self._execute_harvest(
+                    checkpoint, scan_result, stats, errors
+                )
+            stage.items_out = stats.harvested
             if not harvested:
-                return self._incomplete_result(stats, errors)
+                await checkpoint.forget("harvest")
+                return self._incomplete_result(stats, errors, telemetry)
 
             # Stage 3: Summarize findings
-            summaries = await self._execute_summarize(harvested, stats, errors)
+            with telemetry.stage("summarize", items_in=stats.harvested) as stage:
+                summaries = await self._execute_summarize(
+                    checkpoint, harvested, stats, errors
+                )
+            stage.items_out = stats.summarized
 
             # Stage 4: Validate claims
-            validations = await self._execute_validate_claims(summaries, stats, errors)
+            with telemetry.stage("validate_claims", items_in=stats.summarized) as stage:
+                validations = await self._execute_validate_claims(
+                    checkpoint, summaries, stats, errors
+                )
+            stage.items_out = stats.claim_validated
 
             # Stage 5: Transform
-            transformed = await self._execute_transform(
-                harvested, summaries, validations, stats, errors
-            )
+            with telemetry.stage("transform", items_in=stats.harvested) as stage:
+                transformed = await self._execute_transform(
+                    checkpoint, harvested, summaries, validations, stats, errors
+                )
+            stage.items_out = stats.transformed
             if not transformed:
-                return self._partial_result(stats, errors, published_ids)
+                return self._partial_result(stats, errors, published_ids, telemetry)
 
             # Stage 6: Validate compliance
-            validated = await self._execute_validate(transformed, stats, errors)
+            with telemetry.stage("validate", items_in=stats.transformed) as stage:
+                validated = await self._execute_validate(
+                    checkpoint, transformed, stats, errors
+                )
+            stage.items_out = len(validated)
 
             # Stage 7: Score
-            scored = await self._execute_score(validated, harvested, stats, errors)
+            with telemetry.stage("score", items_in=len(validated)) as stage:
+                scored = await self._execute_score(validated, harvested, stats, errors)
+            stage.items_out = stats.scored
 
             # Stage 8: Publish
-            published_ids = await self._execute_publish(scored, stats, errors)
+            with telemetry.stage("publish", items_in=stats.scored) as stage:
+                published = await self._execute_publish(scored, stats, errors)
+            stage.items_out = stats.published
+            # Retry a failed publish from the checkpoints, not from the scan
+            publish_failed = published is None
+            published_ids = published or []
 
             # Determine final status
             if stats.failed > 0:
@@ -231,8 +291,9 @@ class PubMedResearchPipeline:
                 status=status,
                 statistics=stats,
                 error="; ".join(errors) if errors else None,
-                retry_scheduled=False,
+                retry_scheduled=publish_failed,
                 published_ids=published_ids,
+                telemetry=telemetry,
             )
 
         except PubMedScanError as e:
@@ -243,6 +304,7 @@ class PubMedResearchPipeline:
                 error=f"Scan failed: {e.message}",
                 retry_scheduled=True,
                 published_ids=[],
+                telemetry=telemetry,
             )
         except Exception as e:
             logger.error("Pipeline failed with unexpected error: %s", e)
@@ -252,16 +314,20 @@ class PubMedResearchPipeline:
                 error=f"Unexpected error: {str(e)}",
                 retry_scheduled=True,
                 published_ids=published_ids,
+                telemetry=telemetry,
             )
+        finally:
+            self._telemetry_store.record(telemetry.finish())
 
     async def _execute_scan(
         self,
+        checkpoint: RunCheckpoint,
         stats: PipelineStatistics,
         errors: list[str],
     ):
         """Execute scan stage."""
         logger.info("Executing scan stage")
-        scan_result = await self._scanner.scan()
+        scan_result = await checkpoint.run("scan", self._scanner.scan)
 
         stats.total_found = len(scan_result.articles)
         stats.queries_executed = scan_result.statistics.queries_executed
@@ -278,13 +344,16 @@ class PubMedResearchPipeline:
 
     async def _execute_harvest(
         self,
+        checkpoint: RunCheckpoint,
         raw_articles,
         stats: PipelineStatistics,
         errors: list[str],
     ):
         """Execute harvest stage."""
         logger.info("Executing harvest stage")
-        harvested = await self._harvester.harvest(raw_articles)
+        harvested = await checkpoint.run(
+            "harvest", self._harvester.harvest, raw_articles
+        )
 
         stats.harvested = len(harvested)
 
@@ -295,13 +364,19 @@ class PubMedResearchPipeline:
 
     async def _execute_summarize(
         self,
+        checkpoint: RunCheckpoint,
         harvested,
         stats: PipelineStatistics,
         errors: list[str],
     ):
         """Execute summarize stage."""
         logger.info("Executing summarize stage")
-        summaries = await self._summarizer.summarize_batch(harvested)
+        summaries = await checkpoint.run(
+            "summarize",
+            self._summarizer.summarize_batch,
+            harvested,
+            stats=stats.summarize_calls,
+        )
 
         stats.summarized = len(summaries)
 
@@ -309,13 +384,19 @@ class PubMedResearchPipeline:
 
     async def _execute_validate_claims(
         self,
+        checkpoint: RunCheckpoint,
         summaries,
         stats: PipelineStatistics,
         errors: list[str],
     ):
         """Execute claim validation stage."""
         logger.info("Executing claim validation stage")
-        validations = await self._claim_validator.validate_batch(summaries)
+        validations = await checkpoint.run(
+            "validate_claims",
+            self._claim_validator.validate_batch,
+            summaries,
+            stats=stats.claim_validation_calls,
+        )
 
         stats.claim_validated = len(validations)
 
@@ -323,6 +404,7 @@ class PubMedResearchPipeline:
 
     async def _execute_transform(
         self,
+        checkpoint: RunCheckpoint,
         harvested,
         summaries,
         validations,
@@ -331,8 +413,8 @@ class PubMedResearchPipeline:
     ):
         """Execute transform stage."""
         logger.info("Executing transform stage")
-        transformed = await self._transformer.transform(
-            harvested, summaries, validations
+        transformed = await checkpoint.run(
+            "transform", self._transformer.transform, harvested, summaries, validations
         )
 
         stats.transformed = len(transformed)
@@ -344,13 +426,14 @@ class PubMedResearchPipeline:
 
     async def _execute_validate(
         self,
+        checkpoint: RunCheckpoint,
         transformed,
         stats: PipelineStatistics,
         errors: list[str],
     ):
         """Execute validation stage."""
         logger.info("Executing validation stage")
-        validated = await self._validator.validate(transformed)
+        validated = await checkpoint.run("validate", self._validator.validate, transformed)
 
         stats.validated = len([v for v in validated if v.compliance_status != "REJECTED"])
 
@@ -412,8 +495,12 @@ class PubMedResearchPipeline:
         scored: list[ValidatedResearch],
         stats: PipelineStatistics,
         errors: list[str],
-    ) -> list[UUID]:
-        """Execute publish stage."""
+    ) -> Optional[list[UUID]]:
+        """Execute publish stage.
+
+        Returns:
+            Published item IDs, or None if the batch publish failed
+        """
         logger.info("Executing publish stage")
         published_ids: list[UUID] = []
 
@@ -434,6 +521,7 @@ class PubMedResearchPipeline:
             logger.error("Failed to publish batch: %s", e)
             errors.append(f"Publish failed: {str(e)}")
             stats.failed += len(publishable)
+            return None
 
         return published_ids
 
@@ -441,6 +529,7 @@ class PubMedResearchPipeline:
         self,
         stats: PipelineStatistics,
         errors: list[str],
+        telemetry: PipelineTelemetry,
     ) -> PipelineResult:
         """Create INCOMPLETE result for scan failures."""
         return PipelineResult(
@@ -449,6 +538,7 @@ class PubMedResearchPipeline:
             error="; ".join(errors) if errors else "No articles found",
             retry_scheduled=True,
             published_ids=[],
+            telemetry=telemetry,
         )
 
     def _partial_result(
@@ -456,6 +546,7 @@ class PubMedResearchPipeline:
         stats: PipelineStatistics,
         errors: list[str],
         published_ids: list[UUID],
+        telemetry: PipelineTelemetry,
     ) -> PipelineResult:
         """Create PARTIAL result for partial failures."""
         return PipelineResult(
@@ -464,4 +555,5 @@ class PubMedResearchPipeline:
             error="; ".join(errors) if errors else None,
             retry_scheduled=False,
             published_ids=published_ids,
+            telemetry=telemetry,
         )
@@ -16,6 +16,7 @@ Schemas:
     - ClaimValidationResult: EU claim potential assessment
     - ValidatedResearch: Post-compliance check data for Research Pool
     - ScanResult: Scanner stage output with statistics
+    - LLMCallStats: Per-call latency and outcome counts for an LLM stage
     - PipelineResult: Full pipeline execution result
     - PipelineStatus: Pipeline completion status enum
     - ContentPotential: Content usage categories
@@ -30,6 +31,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from teams.dawo.middleware.telemetry import PipelineTelemetry
+
 
 class PipelineStatus(str, Enum):
     """Pipeline execution status.
@@ -245,12 +248,14 @@ class ScanStatistics:
         total_pmids_found: Total PMIDs returned across all queries
         pmids_after_dedup: PMIDs after deduplication
         queries_failed: Number of queries that failed
+        already_seen: PMIDs already in the Research Pool from earlier runs
     """
 
     queries_executed: int = 0
     total_pmids_found: int = 0
     pmids_after_dedup: int = 0
     queries_failed: int = 0
+    already_seen: int = 0
 
 
 @dataclass
@@ -268,6 +273,50 @@ class ScanResult:
     errors: list[str] = field(default_factory=list)
 
 
+@dataclass
+class LLMCallStats:
+    """Per-call latency and outcomes for one LLM pipeline stage.
+
+    Filled by FindingSummarizer.summarize_batch and
+    ClaimValidator.validate_batch. Latency covers the LLM call itself,
+    not time spent waiting for a concurrency slot.
+
+    Attributes:
+        latencies_ms: Wall-clock latency of each call in milliseconds
+        timeouts: Calls that hit the per-call timeout
+        failures: Calls that raised and fell back to the default result
+    """
+
+    latencies_ms: list[float] = field(default_factory=list)
+    timeouts: int = 0
+    failures: int = 0
+
+    @property
+    def calls(self) -> int:
+        """Number of calls recorded."""
+        return len(self.latencies_ms)
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean call latency in milliseconds (0.0 if no calls)."""
+        if not self.latencies_ms:
+            return 0.0
+        return sum(self.latencies_ms) / len(self.latencies_ms)
+
+    @property
+    def p95_ms(self) -> float:
+        """95th percentile call latency in milliseconds (0.0 if no calls)."""
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    @property
+    def max_ms(self) -> float:
+        """Slowest call latency in milliseconds (0.0 if no calls)."""
+        return max(self.latencies_ms, default=0.0)
+
+
 @dataclass
 class PipelineStatistics:
     """Full pipeline execution statistics.
@@ -287,6 +336,8 @@ class PipelineStatistics:
         failed: Items that failed at any stage
         queries_executed: Number of search queries run
         queries_failed: Number of queries that failed
+        summarize_calls: Per-call latency for the summarization stage
+        claim_validation_calls: Per-call latency for the claim validation stage
     """
 
     total_found: int = 0
@@ -300,6 +351,8 @@ class PipelineStatistics:
     failed: int = 0
     queries_executed: int = 0
     queries_failed: int = 0
+    summarize_calls: LLMCallStats = field(default_factory=LLMCallStats)
+    claim_validation_calls: LLMCallStats = field(default_factory=LLMCallStats)
 
 
 @dataclass
@@ -312,6 +365,8 @@ class PipelineResult:
         error: Error message if failed/incomplete
         retry_scheduled: True if queued for next cycle
         published_ids: UUIDs of successfully published items
+        telemetry: Per-stage timing, throughput and external calls
+        run_id: Run id; pass to execute() when retrying to resume
     """
 
     status: PipelineStatus
@@ -319,3 +374,5 @@ class PipelineResult:
     error: Optional[str] = None
     retry_scheduled: bool = False
     published_ids: list[UUID] = field(default_factory=list)
+    telemetry: Optional[PipelineTelemetry] = None
+    run_id: Optional[str] = None
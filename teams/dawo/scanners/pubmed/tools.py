@@ -2,7 +2,8 @@
 
 Uses Biopython's Entrez module for NCBI E-utilities access.
 Accepts configuration via dependency injection - NEVER loads files directly.
-Wraps all fetches with retry middleware (Story 1.5).
+Wraps all fetches with retry middleware (Story 1.5) and reports calls and
+response bytes to pipeline telemetry.
 
 NCBI Policy Requirements:
     - Email is REQUIRED for all requests
@@ -32,6 +33,8 @@ import re
 from datetime import datetime, timezone, timedelta
 from typing import Any, Optional, Protocol
 
+from teams.dawo.middleware.telemetry import record_call
+
 from .config import EntrezConfig, RATE_LIMIT_NO_KEY, RATE_LIMIT_WITH_KEY, DEFAULT_BATCH_SIZE
 from .prompts import SAMPLE_SIZE_PATTERNS, STUDY_TYPE_MAPPINGS
 
@@ -51,6 +54,28 @@ class RetryMiddlewareProtocol(Protocol):
 DEFAULT_TOOL_NAME = "DAWO.ECO Research Scanner"
 
 
+class _CountingHandle:
+    """Entrez response handle that counts the bytes read through it.
+
+    Entrez calls bypass httpx, so telemetry is reported from the number
+    of response bytes Entrez.read() consumed.
+
+    Attributes:
+        bytes_read: Bytes read from the wrapped handle so far
+    """
+
+    def __init__(self, handle: Any) -> None:
+        """Wrap an Entrez response handle."""
+        self._handle = handle
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the wrapped handle, counting the bytes."""
+        data = self._handle.read(size)
+        self.bytes_read += len(data)
+        return data
+
+
 class PubMedSearchError(Exception):
     """Exception raised for PubMed search failures.
 
@@ -85,6 +110,7 @@ class PubMedClient:
     Uses Biopython's Entrez module for NCBI E-utilities access.
     Accepts configuration via dependency injection - NEVER loads files directly.
     Wraps all fetches with retry middleware (Story 1.5).
+    Reports each Entrez call and its response bytes to pipeline telemetry.
 
     Attributes:
         _config: Entrez configuration with email and API key
@@ -195,8 +221,10 @@ class PubMedClient:
                 ),
             )
 
-            record = Entrez.read(handle)
+            counted = _CountingHandle(handle)
+            record = Entrez.read(counted)
             handle.close()
+            record_call(counted.bytes_read)
 
             pmids = record.get("IdList", [])
             logger.info(
@@ -229,26 +257,7 @@ class PubMedClient:
         Returns:
             Complete search term with all filters
         """
-        term = query
-
-        # Add date filter
-        if date_filter:
-            end_date = datetime.now(timezone.utc)
-            start_date = end_date - timedelta(days=date_filter)
-            date_range = (
-                f'("{start_date.strftime("%Y/%m/%d")}"[PDAT] : '
-                f'"{end_date.strftime("%Y/%m/%d")}"[PDAT])'
-            )
-            term = f"({term}) AND {date_range}"
-
-        # Add publication type filter
-        if publication_types:
-            type_filters = " OR ".join(
-                f'"{pt}"[Publication Type]' for pt in publication_types
-            )
-            term = f"({term}) AND ({type_filters})"
-
-        return term
+        return build_search_term(query, date_filter, publication_types)
 
     async def fetch_details(
         self,
@@ -311,8 +320,10 @@ class PubMedClient:
             ),
         )
 
-        records = Entrez.read(handle)
+        counted = _CountingHandle(handle)
+        records = Entrez.read(counted)
         handle.close()
+        record_call(counted.bytes_read)
 
         articles = []
         for article in records.get("PubmedArticle", []):
@@ -460,6 +471,43 @@ class PubMedClient:
         return pub_types
 
 
+def build_search_term(
+    query: str,
+    date_filter: Optional[int],
+    publication_types: Optional[list[str]],
+) -> str:
+    """Build complete PubMed search term with filters.
+
+    Args:
+        query: Base search query
+        date_filter: Days back to filter
+        publication_types: Publication types to include
+
+    Returns:
+        Complete search term with all filters
+    """
+    term = query
+
+    # Add date filter
+    if date_filter:
+        end_date = datetime.now(timezone.utc)
+        start_date = end_date - timedelta(days=date_filter)
+        date_range = (
+            f'("{start_date.strftime("%Y/%m/%d")}"[PDAT] : '
+            f'"{end_date.strftime("%Y/%m/%d")}"[PDAT])'
+        )
+        term = f"({term}) AND {date_range}"
+
+    # Add publication type filter
+    if publication_types:
+        type_filters = " OR ".join(
+            f'"{pt}"[Publication Type]' for pt in publication_types
+        )
+        term = f"({term}) AND ({type_filters})"
+
+    return term
+
+
 def extract_sample_size(abstract: str) -> Optional[int]:
     """Extract sample size from abstract text.
 
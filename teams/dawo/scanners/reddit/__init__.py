@@ -9,6 +9,7 @@ Harvester Framework Pipeline:
 Components:
     - RedditScanner: Main agent class for scan stage
     - RedditClient: OAuth2 Reddit API client
+    - AdaptiveRateLimiter: Token bucket fed by Reddit's rate limit headers
     - RedditHarvester: Enriches posts with full details
     - RedditTransformer: Standardizes data for Research Pool
     - RedditValidator: EU compliance validation
@@ -53,6 +54,7 @@ Registration:
 from .agent import RedditScanner, RedditScanError
 from .tools import (
     RedditClient,
+    AdaptiveRateLimiter,
     RedditAPIError,
     RedditAuthError,
     RedditRateLimitError,
@@ -64,6 +66,7 @@ from .config import (
     DEFAULT_TIME_FILTER,
     DEFAULT_MAX_POSTS_PER_SUBREDDIT,
     DEFAULT_RATE_LIMIT_REQUESTS_PER_MINUTE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_SUBREDDITS,
     DEFAULT_KEYWORDS,
     MAX_CONTENT_LENGTH,
@@ -89,6 +92,7 @@ __all__ = [
     "RedditScanner",
     # Client
     "RedditClient",
+    "AdaptiveRateLimiter",
     # Config
     "RedditClientConfig",
     "RedditScannerConfig",
@@ -97,6 +101,7 @@ __all__ = [
     "DEFAULT_TIME_FILTER",
     "DEFAULT_MAX_POSTS_PER_SUBREDDIT",
     "DEFAULT_RATE_LIMIT_REQUESTS_PER_MINUTE",
+    "DEFAULT_MAX_CONCURRENT_REQUESTS",
     "DEFAULT_SUBREDDITS",
     "DEFAULT_KEYWORDS",
     "MAX_CONTENT_LENGTH",
@@ -10,16 +10,19 @@ Registration: team_spec.py with tier="scan" (maps to fast model at runtime)
 
 Usage:
     # Created by Team Builder with injected dependencies
-    scanner = RedditScanner(config, client)
+    scanner = RedditScanner(config, client, seen_store=seen_store)
 
     # Execute scan stage
     result = await scanner.scan()
     # result.posts contains RawRedditPost objects
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Union
+
+from teams.dawo.research import ResearchSource, SeenItemStore
 
 from .config import RedditScannerConfig
 from .schemas import RawRedditPost, ScanResult, ScanStatistics
@@ -60,47 +63,72 @@ class RedditScanner:
 
     Features:
         - Multi-subreddit scanning
-        - Multi-keyword search per subreddit
+        - Multi-keyword search per subreddit, searches run concurrently
+          (config.max_concurrent_requests, paced by the client's limiter)
         - Upvote threshold filtering (default 10+)
         - Time-based filtering (default: last 24 hours)
         - Deduplication by post ID
+        - Cross-run skipping of posts already in the Research Pool
+        - Shardable by subreddit for distributed scans (sources())
 
     Configuration is injected via constructor - NEVER loads files directly.
 
     Attributes:
         _config: Scanner configuration (subreddits, keywords, filters)
         _client: Reddit API client for making requests
+        _seen_store: Optional cross-run seen-item store
     """
 
+    # ScanResult field holding discovered items (sharded scans)
+    SHARD_ITEMS_FIELD = "posts"
+
     def __init__(
         self,
         config: RedditScannerConfig,
         client: RedditClient,
+        seen_store: Optional[SeenItemStore] = None,
     ):
         """Initialize scanner with injected dependencies.
 
         Args:
             config: Scanner configuration from Team Builder
             client: Reddit API client with credentials
+            seen_store: Optional store used to skip posts ingested by
+                earlier runs (None = dedupe within this run only)
         """
         self._config = config
         self._client = client
+        self._seen_store = seen_store
+
+    def sources(self) -> list[str]:
+        """Subreddits a scan covers, each scannable as its own shard."""
+        return list(self._config.subreddits)
+
+    @staticmethod
+    def shard_key(post: RawRedditPost) -> str:
+        """Deduplication key of a post across shards."""
+        return post.id
 
-    async def scan(self) -> ScanResult:
+    async def scan(self, sources: Optional[list[str]] = None) -> ScanResult:
         """Execute the scan stage - discover Reddit posts.
 
         Iterates through configured subreddits and keywords, collecting
         posts that meet the filtering criteria.
 
+        Args:
+            sources: Subreddits to scan (a shard of sources()); None scans
+                every configured subreddit
+
         Returns:
             ScanResult with discovered posts and statistics
 
         Raises:
             RedditScanError: If critical error prevents scanning
         """
+        subreddits = self._config.subreddits if sources is None else list(sources)
         logger.info(
             "Starting Reddit scan: %d subreddits, %d keywords",
-            len(self._config.subreddits),
+            len(subreddits),
             len(self._config.keywords),
         )
 
@@ -108,47 +136,95 @@ class RedditScanner:
         all_posts: dict[str, RawRedditPost] = {}  # Keyed by post ID for deduplication
         errors: list[str] = []
 
-        for subreddit in self._config.subreddits:
-            stats.subreddits_scanned += 1
-
-            for keyword in self._config.keywords:
-                stats.keywords_searched += 1
+        searches = [
+            (subreddit, keyword)
+            for subreddit in subreddits
+            for keyword in self._config.keywords
+        ]
+        semaphore = asyncio.Semaphore(self._config.max_concurrent_requests)
 
+        async def search(
+            subreddit: str,
+            keyword: str,
+        ) -> Union[list[RawRedditPost], RedditAPIError]:
+            async with semaphore:
                 try:
-                    posts = await self._search_and_filter(subreddit, keyword)
-                    stats.total_posts_found += len(posts)
+                    return await self._search_and_filter(subreddit, keyword)
+                except RedditAPIError as e:
+                    return e
+
+        outcomes = await asyncio.gather(
+            *(search(subreddit, keyword) for subreddit, keyword in searches)
+        )
+        stats.subreddits_scanned = len(subreddits)
+        stats.keywords_searched = len(searches)
+
+        # Aggregate in subreddit/keyword order so dedup matches a serial scan
+        for (subreddit, keyword), outcome in zip(searches, outcomes):
+            if isinstance(outcome, RedditAPIError):
+                error_msg = f"Failed to search r/{subreddit} for '{keyword}': {outcome}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+                # Continue with other subreddits/keywords
+                continue
 
-                    # Filter by upvotes and time
-                    filtered = self._apply_filters(posts)
-                    stats.posts_after_filter += len(filtered)
+            stats.total_posts_found += len(outcome)
 
-                    # Deduplicate by adding to dict (overwrites duplicates)
-                    before_count = len(all_posts)
-                    for post in filtered:
-                        all_posts[post.id] = post
-                    stats.duplicates_removed += (
-                        before_count + len(filtered) - len(all_posts)
-                    )
+            # Filter by upvotes and time
+            filtered = self._apply_filters(outcome)
+            stats.posts_after_filter += len(filtered)
 
-                except RedditAPIError as e:
-                    error_msg = f"Failed to search r/{subreddit} for '{keyword}': {e}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
-                    # Continue with other subreddits/keywords
+            # Deduplicate by adding to dict (overwrites duplicates)
+            before_count = len(all_posts)
+            for post in filtered:
+                all_posts[post.id] = post
+            stats.duplicates_removed += (
+                before_count + len(filtered) - len(all_posts)
+            )
+
+        posts = await self._drop_seen(list(all_posts.values()), stats)
 
         logger.info(
-            "Scan complete: %d posts found, %d after filtering, %d unique",
+            "Scan complete: %d posts found, %d after filtering, %d unique, %d new",
             stats.total_posts_found,
             stats.posts_after_filter,
             len(all_posts),
+            len(posts),
         )
 
         return ScanResult(
-            posts=list(all_posts.values()),
+            posts=posts,
             statistics=stats,
             errors=errors,
         )
 
+    async def _drop_seen(
+        self,
+        posts: list[RawRedditPost],
+        stats: ScanStatistics,
+    ) -> list[RawRedditPost]:
+        """Drop posts already published by an earlier run.
+
+        Posts are keyed by permalink, the source_key the pipeline
+        publishes them with.
+
+        Args:
+            posts: Unique posts discovered in this run
+            stats: Scan statistics to update
+
+        Returns:
+            Posts not yet in the Research Pool
+        """
+        if self._seen_store is None or not posts:
+            return posts
+
+        seen = await self._seen_store.find_seen(
+            ResearchSource.REDDIT,
+            [post.permalink for post in posts if post.permalink],
+        )
+        stats.already_seen = len(seen)
+        return [post for post in posts if post.permalink not in seen]
+
     async def _search_and_filter(
         self,
         subreddit: str,
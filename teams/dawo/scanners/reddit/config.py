@@ -27,6 +27,7 @@ DEFAULT_MIN_UPVOTES = 10
 DEFAULT_TIME_FILTER = "day"
 DEFAULT_MAX_POSTS_PER_SUBREDDIT = 100
 DEFAULT_RATE_LIMIT_REQUESTS_PER_MINUTE = 60
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8  # In-flight API calls per scan/harvest
 DEFAULT_USER_AGENT = "DAWO.ECO/1.0.0 (by /u/dawo_bot)"
 
 # Default subreddits for mushroom/wellness research
@@ -113,6 +114,7 @@ class RedditScannerConfig:
         time_filter: Reddit time filter ("hour", "day", "week", "month", "year")
         max_posts_per_subreddit: Limit per subreddit-keyword combo
         rate_limit_requests_per_minute: API rate limit
+        max_concurrent_requests: Subreddit/keyword searches in flight at once
     """
 
     subreddits: list[str] = field(default_factory=lambda: DEFAULT_SUBREDDITS.copy())
@@ -121,6 +123,7 @@ class RedditScannerConfig:
     time_filter: str = DEFAULT_TIME_FILTER
     max_posts_per_subreddit: int = DEFAULT_MAX_POSTS_PER_SUBREDDIT
     rate_limit_requests_per_minute: int = DEFAULT_RATE_LIMIT_REQUESTS_PER_MINUTE
+    max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
@@ -142,6 +145,10 @@ class RedditScannerConfig:
             errors.append(
                 f"rate_limit must be >= 1, got {self.rate_limit_requests_per_minute}"
             )
+        if self.max_concurrent_requests < 1:
+            errors.append(
+                f"max_concurrent_requests must be >= 1, got {self.max_concurrent_requests}"
+            )
 
         if errors:
             raise ValueError(f"Invalid RedditScannerConfig: {'; '.join(errors)}")
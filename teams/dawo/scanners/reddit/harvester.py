@@ -7,13 +7,15 @@ The harvester takes raw post data from the scanner and fetches complete
 post details from the Reddit API, including full body text and engagement metrics.
 
 Usage:
-    harvester = RedditHarvester(client)
+    harvester = RedditHarvester(client, max_concurrency=8)
     enriched = await harvester.harvest(raw_posts)
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Optional, Union
 
+from .config import DEFAULT_MAX_CONCURRENT_REQUESTS
 from .schemas import RawRedditPost, HarvestedPost
 from .tools import RedditClient, RedditAPIError
 
@@ -43,7 +45,7 @@ class RedditHarvester:
     information including full body text, author, and engagement metrics.
 
     Features:
-        - Batch processing of raw posts
+        - Concurrent batch processing of raw posts (bounded)
         - Graceful handling of deleted/removed posts
         - Rate limiting via underlying client
         - Detailed logging of harvest progress
@@ -52,15 +54,28 @@ class RedditHarvester:
 
     Attributes:
         _client: Reddit API client for fetching details
+        _max_concurrency: Detail requests in flight at once
     """
 
-    def __init__(self, client: RedditClient):
+    def __init__(
+        self,
+        client: RedditClient,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    ):
         """Initialize harvester with injected client.
 
         Args:
             client: Reddit API client with authentication
+            max_concurrency: Detail requests in flight at once; the client's
+                rate limiter still paces them to Reddit's quota
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
         """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
         self._client = client
+        self._max_concurrency = max_concurrency
 
     async def harvest(
         self,
@@ -85,25 +100,35 @@ class RedditHarvester:
         """
         logger.info("Starting harvest for %d posts", len(raw_posts))
 
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def harvest_one(
+            raw_post: RawRedditPost,
+        ) -> Union[Optional[HarvestedPost], RedditAPIError]:
+            async with semaphore:
+                try:
+                    return await self._harvest_single(raw_post)
+                except RedditAPIError as e:
+                    return e
+
+        outcomes = await asyncio.gather(*(harvest_one(post) for post in raw_posts))
+
         harvested: list[HarvestedPost] = []
         skipped = 0
 
-        for raw_post in raw_posts:
-            try:
-                post = await self._harvest_single(raw_post)
-                if post:
-                    harvested.append(post)
-                else:
-                    skipped += 1
-
-            except RedditAPIError as e:
+        for raw_post, outcome in zip(raw_posts, outcomes):
+            if isinstance(outcome, RedditAPIError):
                 logger.error(
                     "Failed to harvest post %s: %s",
                     raw_post.id,
-                    e,
+                    outcome,
                 )
                 skipped += 1
                 # Continue with remaining posts
+            elif outcome:
+                harvested.append(outcome)
+            else:
+                skipped += 1
 
         logger.info(
             "Harvest complete: %d posts harvested, %d skipped",
@@ -5,6 +5,7 @@ Implements the complete pipeline orchestration:
 
 The pipeline chains all stages together with:
     - Statistics tracking through each stage
+    - Per-stage timing and external call telemetry
     - Graceful degradation on API failures
     - Partial failure handling (continue on item failures)
     - Comprehensive logging
@@ -20,6 +21,16 @@ import logging
 from typing import Optional
 from uuid import UUID
 
+from teams.dawo.middleware.telemetry import (
+    PipelineTelemetry,
+    PipelineTelemetryStore,
+    get_telemetry_store,
+)
+from teams.dawo.middleware.checkpoint import (
+    PipelineCheckpointStore,
+    RunCheckpoint,
+    open_run_checkpoint,
+)
 from teams.dawo.research import ResearchPublisher, TransformedResearch
 from teams.dawo.research.scoring import ResearchItemScorer
 
@@ -80,6 +91,8 @@ class RedditResearchPipeline:
         _validator: RedditValidator for compliance checking
         _scorer: ResearchItemScorer for relevance scoring
         _publisher: ResearchPublisher for database persistence
+        _telemetry_store: Rolling history that receives each run's telemetry
+        _checkpoint_store: Stage outputs kept so retried runs resume (optional)
     """
 
     def __init__(
@@ -90,6 +103,8 @@ class RedditResearchPipeline:
         validator: RedditValidator,
         scorer: ResearchItemScorer,
         publisher: ResearchPublisher,
+        telemetry_store: Optional[PipelineTelemetryStore] = None,
+        checkpoint_store: Optional[PipelineCheckpointStore] = None,
     ):
         """Initialize pipeline with injected stage components.
 
@@ -100,6 +115,8 @@ class RedditResearchPipeline:
             validator: Compliance checking stage
             scorer: Relevance scoring stage
             publisher: Database persistence stage
+            telemetry_store: Run telemetry history (default: global store)
+            checkpoint_store: Stage checkpoints for resuming retries (default: none)
         """
         self._scanner = scanner
         self._harvester = harvester
@@ -107,14 +124,20 @@ class RedditResearchPipeline:
         self._validator = validator
         self._scorer = scorer
         self._publisher = publisher
+        self._telemetry_store = telemetry_store or get_telemetry_store()
+        self._checkpoint_store = checkpoint_store
 
-    async def execute(self) -> PipelineResult:
+    async def execute(self, run_id: Optional[str] = None) -> PipelineResult:
         """Execute the complete pipeline.
 
         Runs all stages in sequence, tracking statistics and handling
         errors gracefully. Returns INCOMPLETE status on API failures
         to trigger retry scheduling.
 
+        Args:
+            run_id: Run id of a failed attempt (PipelineResult.run_id) to
+                resume from its checkpoints; None starts a new run
+
         Returns:
             PipelineResult with status, statistics, and published IDs
 
@@ -122,18 +145,25 @@ class RedditResearchPipeline:
             - COMPLETE: All stages ran successfully
             - INCOMPLETE: Reddit API failure, retry scheduled
             - PARTIAL: Some items failed but pipeline completed
-            - FAILED: Critical error, no retry
+            - FAILED: Nothing published; retry scheduled only if publish failed
         """
+        checkpoint = await open_run_checkpoint(self._checkpoint_store, "reddit", run_id)
+        return await checkpoint.settle(await self._execute(checkpoint))
+
+    async def _execute(self, checkpoint: RunCheckpoint) -> PipelineResult:
+        """Run the stages, reusing checkpointed outputs of earlier attempts."""
         logger.info("Starting Reddit Research Pipeline execution")
 
         stats = PipelineStatistics()
+        telemetry = PipelineTelemetry(pipeline="reddit")
         published_ids: list[UUID] = []
 
         try:
             # Stage 1: Scan - Discover posts
             logger.info("Stage 1/6: Scanning Reddit")
-            scan_result = await self._scanner.scan()
-            stats.total_found = len(scan_result.posts)
+            with telemetry.stage("scan") as stage:
+                scan_result = await checkpoint.run("scan", self._scanner.scan)
+            stats.total_found = stage.items_out = len(scan_result.posts)
             logger.info("Scan complete: %d posts found", stats.total_found)
 
             if not scan_result.posts:
@@ -141,12 +171,16 @@ class RedditResearchPipeline:
                 return PipelineResult(
                     status=PipelineStatus.COMPLETE,
                     statistics=stats,
+                    telemetry=telemetry,
                 )
 
             # Stage 2: Harvest - Enrich with details
             logger.info("Stage 2/6: Harvesting post details")
-            harvested = await self._harvester.harvest(scan_result.posts)
-            stats.harvested = len(harvested)
+            with telemetry.stage("harvest", items_in=stats.total_found) as stage:
+                harvested = await checkpoint.run(
+                    "harvest", self._harvester.harvest, scan_result.posts
+                )
+            stats.harvested = stage.items_out = len(harvested)
             logger.info("Harvest complete: %d posts enriched", stats.harvested)
 
             if not harvested:
@@ -154,31 +188,42 @@ class RedditResearchPipeline:
                 return PipelineResult(
                     status=PipelineStatus.COMPLETE,
                     statistics=stats,
+                    telemetry=telemetry,
                 )
 
             # Stage 3: Transform - Convert to Research Pool schema
             logger.info("Stage 3/6: Transforming to Research Pool schema")
-            transformed = await self._transformer.transform(harvested)
-            stats.transformed = len(transformed)
+            with telemetry.stage("transform", items_in=stats.harvested) as stage:
+                transformed = await checkpoint.run(
+                    "transform", self._transformer.transform, harvested
+                )
+            stats.transformed = stage.items_out = len(transformed)
             logger.info("Transform complete: %d items created", stats.transformed)
 
             # Stage 4: Validate - Check EU compliance
             logger.info("Stage 4/6: Validating EU compliance")
-            validated = await self._validator.validate(transformed)
-            stats.validated = len(validated)
+            with telemetry.stage("validate", items_in=stats.transformed) as stage:
+                validated = await checkpoint.run(
+                    "validate", self._validator.validate, transformed
+                )
+            stats.validated = stage.items_out = len(validated)
             logger.info("Validation complete: %d items validated", stats.validated)
 
             # Stage 5: Score - Calculate relevance scores
             logger.info("Stage 5/6: Scoring research items")
-            scored = await self._score_items(validated)
-            stats.scored = len(scored)
+            with telemetry.stage("score", items_in=stats.validated) as stage:
+                scored = await self._score_items(validated)
+            stats.scored = stage.items_out = len(scored)
             logger.info("Scoring complete: %d items scored", stats.scored)
 
             # Stage 6: Publish - Save to Research Pool
             logger.info("Stage 6/6: Publishing to Research Pool")
-            publish_count, published_ids = await self._publish_items(scored)
-            stats.published = publish_count
+            with telemetry.stage("publish", items_in=stats.scored) as stage:
+                publish_count, published_ids = await self._publish_items(scored)
+            stats.published = stage.items_out = publish_count
             stats.failed = stats.scored - stats.published
+            # Retry a publish that stored nothing from the checkpoints, not from the scan
+            publish_failed = stats.scored > 0 and stats.published == 0
             logger.info("Publish complete: %d items published", stats.published)
 
             # Determine final status
@@ -194,7 +239,9 @@ class RedditResearchPipeline:
             return PipelineResult(
                 status=status,
                 statistics=stats,
+                retry_scheduled=publish_failed,
                 published_ids=published_ids,
+                telemetry=telemetry,
             )
 
         except RedditAPIError as e:
@@ -207,6 +254,7 @@ class RedditResearchPipeline:
                 statistics=stats,
                 error=str(e),
                 retry_scheduled=True,
+                telemetry=telemetry,
             )
 
         except Exception as e:
@@ -219,6 +267,9 @@ class RedditResearchPipeline:
                 statistics=stats,
             ) from e
 
+        finally:
+            self._telemetry_store.record(telemetry.finish())
+
     async def _score_items(
         self,
         validated: list[ValidatedResearch],
@@ -257,6 +308,8 @@ class RedditResearchPipeline:
                     title=item.title,
                     content=item.content,
                     url=item.url,
+                    # Link posts share external URLs; permalink is per-post
+                    source_key=item.source_metadata.get("permalink"),
                     tags=item.tags,
                     source_metadata=item.source_metadata,
                     created_at=item.created_at,
@@ -21,6 +21,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from teams.dawo.middleware.telemetry import PipelineTelemetry
+
 
 class PipelineStatus(str, Enum):
     """Pipeline execution status.
@@ -144,6 +146,7 @@ class ScanStatistics:
         total_posts_found: Raw posts from API
         posts_after_filter: Posts meeting upvote/time criteria
         duplicates_removed: Posts deduplicated by ID
+        already_seen: Posts already in the Research Pool from earlier runs
     """
 
     subreddits_scanned: int = 0
@@ -151,6 +154,7 @@ class ScanStatistics:
     total_posts_found: int = 0
     posts_after_filter: int = 0
     duplicates_removed: int = 0
+    already_seen: int = 0
 
 
 @dataclass
@@ -203,6 +207,8 @@ class PipelineResult:
         error: Error message if failed/incomplete
         retry_scheduled: True if queued for next cycle
         published_ids: UUIDs of successfully published items
+        telemetry: Per-stage timing, throughput and external calls
+        run_id: Run id; pass to execute() when retrying to resume
     """
 
     status: PipelineStatus
@@ -210,3 +216,5 @@ class PipelineResult:
     error: Optional[str] = None
     retry_scheduled: bool = False
     published_ids: list[UUID] = field(default_factory=list)
+    telemetry: Optional[PipelineTelemetry] = None
+    run_id: Optional[str] = None
@@ -4,7 +4,8 @@ Provides authenticated access to Reddit's OAuth2 API with:
     - OAuth2 "script" type authentication
     - Subreddit search functionality
     - Post detail retrieval
-    - Built-in rate limiting (60 requests/minute)
+    - Header-driven rate limiting (X-Ratelimit-Remaining/Reset, falling
+      back to 60 requests/minute until Reddit reports its quota)
     - Retry middleware integration
 
 ALL API calls go through retry middleware - NEVER make direct calls.
@@ -19,12 +20,14 @@ Usage:
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Optional, Any
+from typing import Any, Callable, Mapping, Optional
 
 import httpx
 
 from teams.dawo.middleware.retry import RetryMiddleware, RetryResult
+from teams.dawo.middleware.telemetry import telemetry_event_hooks
 
 from .config import RedditClientConfig
 
@@ -74,6 +77,108 @@ class RedditRateLimitError(RedditAPIError):
     pass
 
 
+class AdaptiveRateLimiter:
+    """Token bucket refilled from Reddit's rate limit headers.
+
+    Reddit grants a request quota per fixed window and reports it on every
+    response (X-Ratelimit-Remaining, X-Ratelimit-Reset, X-Ratelimit-Used).
+    The bucket holds the remaining quota minus requests still in flight,
+    so concurrent callers can spend the whole quota immediately and only
+    sleep once it is exhausted, until the window resets.
+
+    Until the first response arrives the bucket assumes
+    requests_per_window requests per window_seconds.
+
+    Attributes:
+        _limit: Requests per window (learned from Used + Remaining)
+        _window: Assumed window length for refills without fresh headers
+        _tokens: Requests that may still be sent in the current window
+        _reset_at: Clock reading at which the window resets
+        _in_flight: Requests acquired but not yet completed
+        _clock: Monotonic clock (injectable for tests)
+        _lock: Serializes waiters
+    """
+
+    def __init__(
+        self,
+        requests_per_window: int = DEFAULT_RATE_LIMIT,
+        window_seconds: float = RATE_LIMIT_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize with a full bucket.
+
+        Args:
+            requests_per_window: Assumed quota until headers are seen
+            window_seconds: Assumed window length until headers are seen
+            clock: Monotonic clock returning seconds
+        """
+        self._limit = requests_per_window
+        self._window = window_seconds
+        self._clock = clock
+        self._tokens = float(requests_per_window)
+        self._reset_at = clock() + window_seconds
+        self._in_flight = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def remaining(self) -> int:
+        """Requests that may still be sent in the current window."""
+        return int(self._tokens)
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until the window resets if empty."""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now >= self._reset_at:
+                    self._tokens = float(max(self._limit - self._in_flight, 0))
+                    self._reset_at = now + self._window
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._in_flight += 1
+                    return
+
+                wait_time = self._reset_at - now
+                logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+
+    def complete(self, headers: Optional[Mapping[str, Any]] = None) -> None:
+        """Mark an acquired request finished and apply its rate limit headers.
+
+        Args:
+            headers: Response headers, or None if the request got no response
+        """
+        self._in_flight = max(self._in_flight - 1, 0)
+        if headers is None:
+            return
+
+        remaining = _header_number(headers, "x-ratelimit-remaining")
+        reset = _header_number(headers, "x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+
+        used = _header_number(headers, "x-ratelimit-used")
+        if used is not None:
+            self._limit = int(used + remaining)
+
+        # Requests still in flight were already counted against our tokens
+        # but not yet against Reddit's remaining count
+        self._tokens = max(remaining - self._in_flight, 0.0)
+        self._reset_at = self._clock() + reset
+
+
+def _header_number(headers: Mapping[str, Any], name: str) -> Optional[float]:
+    """Parse a numeric header value, or None if missing or malformed."""
+    value = headers.get(name)
+    if not isinstance(value, (str, int, float)):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
 class RedditClient:
     """Reddit API client with OAuth2 authentication.
 
@@ -83,7 +188,7 @@ class RedditClient:
     Features:
         - OAuth2 "script" type authentication
         - Automatic token refresh
-        - Rate limiting (60 requests/minute)
+        - Header-driven rate limiting, safe for concurrent callers
         - Retry middleware integration
 
     Attributes:
@@ -92,31 +197,35 @@ class RedditClient:
         _client: HTTPX async client
         _access_token: Current OAuth2 access token
         _token_expires: Token expiration timestamp
-        _request_timestamps: Recent request times for rate limiting
+        _limiter: Rate limiter fed by Reddit's response headers
+        _auth_lock: Ensures concurrent callers authenticate once
     """
 
     def __init__(
         self,
         config: RedditClientConfig,
         retry_middleware: RetryMiddleware,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
     ):
         """Initialize Reddit client with injected dependencies.
 
         Args:
             config: Reddit API credentials (from environment)
             retry_middleware: Retry middleware for API calls
+            rate_limiter: Rate limiter to use (pass one instance to share a
+                quota between clients of the same account)
         """
         self._config = config
         self._retry = retry_middleware
         self._client: Optional[httpx.AsyncClient] = None
         self._access_token: Optional[str] = None
         self._token_expires: Optional[datetime] = None
-        self._request_timestamps: list[float] = []
-        self._rate_limit = DEFAULT_RATE_LIMIT
+        self._limiter = rate_limiter or AdaptiveRateLimiter()
+        self._auth_lock = asyncio.Lock()
 
     async def __aenter__(self) -> "RedditClient":
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._client = httpx.AsyncClient(timeout=30.0, event_hooks=telemetry_event_hooks())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -193,35 +302,12 @@ class RedditClient:
             raise RedditAuthError(f"Authentication failed: {e}") from e
 
     async def _rate_limit_wait(self) -> None:
-        """Wait if necessary to respect rate limits.
-
-        Implements sliding window rate limiting (60 requests/minute).
+        """Wait if necessary to respect Reddit's rate limit.
 
-        Note: Uses asyncio event loop time (monotonic) rather than wall clock time.
-        Monotonic time is preferred for rate limiting because:
-        - It's immune to system clock adjustments
-        - It provides consistent intervals for API compliance
-        - asyncio.sleep() uses the same time source for accuracy
+        Every call must be matched by a _limiter.complete() once the
+        request has finished, passing the response headers if any.
         """
-        # Use monotonic time for rate limiting - immune to clock drift/adjustments
-        now = asyncio.get_event_loop().time()
-        cutoff = now - RATE_LIMIT_WINDOW
-
-        # Remove old timestamps
-        self._request_timestamps = [
-            ts for ts in self._request_timestamps if ts > cutoff
-        ]
-
-        # If at limit, wait until oldest request falls out of window
-        if len(self._request_timestamps) >= self._rate_limit:
-            oldest = self._request_timestamps[0]
-            wait_time = oldest + RATE_LIMIT_WINDOW - now
-            if wait_time > 0:
-                logger.debug(f"Rate limit reached, waiting {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
-
-        # Record this request
-        self._request_timestamps.append(now)
+        await self._limiter.acquire()
 
     async def _api_request(
         self,
@@ -242,8 +328,8 @@ class RedditClient:
         Raises:
             RedditAPIError: If request fails after retries
         """
-        await self._ensure_authenticated()
-        await self._rate_limit_wait()
+        async with self._auth_lock:
+            await self._ensure_authenticated()
 
         if not self._client:
             raise RedditAPIError("Client not initialized - use async context manager")
@@ -255,12 +341,19 @@ class RedditClient:
         }
 
         async def make_request() -> dict:
-            response = await self._client.request(
-                method,
-                url,
-                params=params,
-                headers=headers,
-            )
+            # Paced per attempt, so retries also respect the quota
+            await self._rate_limit_wait()
+            response_headers = None
+            try:
+                response = await self._client.request(
+                    method,
+                    url,
+                    params=params,
+                    headers=headers,
+                )
+                response_headers = response.headers
+            finally:
+                self._limiter.complete(response_headers)
             response.raise_for_status()
             return response.json()
 
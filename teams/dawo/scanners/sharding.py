@@ -0,0 +1,387 @@
+"""Sharded scan support: split a scan into per-source jobs and merge them.
+
+Every scanner's scan() walks its configured sources (subreddits, queries,
+hashtags/accounts, feeds) inside one coroutine, so a scan is bound to one
+worker process. In distributed mode the fan_out_scan_job ARQ job splits
+the sources into shards, scan_shard_job runs each shard on any worker,
+and the shards meet in Redis:
+- Items are written with HSETNX keyed by the scanner's dedup key, so the
+  first shard to report an item wins and duplicates never reach Redis
+- Each shard's statistics and errors are stored next to the items
+- No job waits for another: the shard that settles last (or a deadline
+  job, for shards that never settle) enqueues finish_scan_job, and a
+  claim key makes sure only one of them merges the scan
+- finish_scan_job collects one merged ScanResult and stores it as the
+  pipeline's "scan" checkpoint; run_scan_pipeline_job then runs harvest
+  onwards unchanged
+
+Every fan-out attempt gets its own scan id, so shards still running from
+an abandoned attempt never write into a newer one.
+
+Scanners take part by implementing ShardableScanner: sources(),
+scan(sources=...), SHARD_ITEMS_FIELD and shard_key().
+
+Architecture Compliance:
+- Redis client is injected via constructor (NEVER connect directly)
+- Shard keys expire, so abandoned fan-outs clean themselves up
+
+Usage:
+    store = ScanShardStore(redis_client)
+    shards = split_sources(scanner.sources(), sources_per_shard=1)
+    await store.begin("reddit", scan_id, len(shards))
+    # scan_shard_job, on any worker:
+    await store.record(scanner, "reddit", scan_id, index, await scanner.scan(shard))
+    if await store.settled("reddit", scan_id):
+        ...  # enqueue finish_scan_job
+    # finish_scan_job:
+    if await store.claim("reddit", scan_id):
+        scan_result, errors = await store.collect(
+            "reddit", scan_id, scanner.SHARD_ITEMS_FIELD, shard_count=len(shards)
+        )
+"""
+
+import logging
+import pickle
+from dataclasses import fields, replace
+from typing import Any, Optional, Protocol, Sequence, runtime_checkable
+
+logger = logging.getLogger(__name__)
+
+# One shard per source, as the scanners already search one source per request
+DEFAULT_SOURCES_PER_SHARD = 1
+
+# Redis key namespace: {prefix}:{pipeline}:{scan_id}:items|shards|expected|claim
+SCAN_SHARD_KEY_PREFIX = "dawo:scan_shards"
+
+# Shard results only live until the coordinator has merged them
+DEFAULT_SCAN_SHARD_TTL_SECONDS = 6 * 3600
+
+
+@runtime_checkable
+class ShardableScanner(Protocol):
+    """Scanner whose scan can be split by source.
+
+    Attributes:
+        SHARD_ITEMS_FIELD: ScanResult field holding the discovered items
+    """
+
+    SHARD_ITEMS_FIELD: str
+
+    def sources(self) -> list[str]:
+        """Shardable source identifiers, in config order."""
+        ...
+
+    async def scan(self, sources: Optional[list[str]] = None) -> Any:
+        """Scan the given sources (None = all configured sources)."""
+        ...
+
+    @staticmethod
+    def shard_key(item: Any) -> str:
+        """Deduplication key of a discovered item."""
+        ...
+
+
+def split_sources(
+    sources: Sequence[str],
+    sources_per_shard: int = DEFAULT_SOURCES_PER_SHARD,
+) -> list[list[str]]:
+    """Split sources into shards of at most sources_per_shard.
+
+    Args:
+        sources: Source identifiers in config order
+        sources_per_shard: Sources scanned by one shard job
+
+    Returns:
+        Shards in source order
+
+    Raises:
+        ValueError: If sources_per_shard is not positive
+    """
+    if sources_per_shard < 1:
+        raise ValueError(f"sources_per_shard must be >= 1, got {sources_per_shard}")
+    return [
+        list(sources[start:start + sources_per_shard])
+        for start in range(0, len(sources), sources_per_shard)
+    ]
+
+
+def merge_statistics(statistics: Sequence[Any], duplicates: int = 0) -> Any:
+    """Sum per-shard ScanStatistics into one.
+
+    Numeric fields are summed. Items dropped as cross-shard duplicates are
+    added to duplicates_removed when the statistics have that field; other
+    unique-count fields stay per-shard sums.
+
+    Args:
+        statistics: Per-shard ScanStatistics dataclasses (same type)
+        duplicates: Items another shard had already reported
+
+    Returns:
+        Merged ScanStatistics
+    """
+    merged = statistics[0]
+    for other in statistics[1:]:
+        merged = replace(merged, **{
+            f.name: getattr(merged, f.name) + getattr(other, f.name)
+            for f in fields(merged)
+            if isinstance(getattr(merged, f.name), (int, float))
+        })
+    if duplicates and hasattr(merged, "duplicates_removed"):
+        merged = replace(merged, duplicates_removed=merged.duplicates_removed + duplicates)
+    return merged
+
+
+class ScanShardStore:
+    """Redis meeting point of a fanned-out scan's shards.
+
+    Attributes:
+        _redis: Async Redis client (injected)
+        _ttl_seconds: Lifetime of shard results
+        _prefix: Key namespace
+    """
+
+    def __init__(
+        self,
+        redis_client: Any,
+        ttl_seconds: int = DEFAULT_SCAN_SHARD_TTL_SECONDS,
+        prefix: str = SCAN_SHARD_KEY_PREFIX,
+    ) -> None:
+        """Initialize with injected Redis client.
+
+        Args:
+            redis_client: Async Redis client (bytes responses, e.g. ARQ pool)
+            ttl_seconds: Lifetime of shard results
+            prefix: Key namespace
+
+        Raises:
+            ValueError: If ttl_seconds is not positive
+        """
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        self._redis = redis_client
+        self._ttl_seconds = ttl_seconds
+        self._prefix = prefix
+
+    def _items_key(self, pipeline: str, scan_id: str) -> str:
+        """Hash of dedup key -> (shard, position, item)."""
+        return f"{self._prefix}:{pipeline}:{scan_id}:items"
+
+    def _shards_key(self, pipeline: str, scan_id: str) -> str:
+        """Hash of shard index -> ScanResult without items."""
+        return f"{self._prefix}:{pipeline}:{scan_id}:shards"
+
+    def _expected_key(self, pipeline: str, scan_id: str) -> str:
+        """Number of shards the fan-out enqueued."""
+        return f"{self._prefix}:{pipeline}:{scan_id}:expected"
+
+    def _claim_key(self, pipeline: str, scan_id: str) -> str:
+        """Set by the one job allowed to merge the scan."""
+        return f"{self._prefix}:{pipeline}:{scan_id}:claim"
+
+    async def begin(self, pipeline: str, scan_id: str, shard_count: int) -> None:
+        """Record how many shards a fan-out enqueued.
+
+        Args:
+            pipeline: Pipeline name
+            scan_id: Fan-out attempt shared by all shards of the scan
+            shard_count: Number of shard jobs
+        """
+        await self._redis.set(
+            self._expected_key(pipeline, scan_id), shard_count, ex=self._ttl_seconds
+        )
+
+    async def settled(self, pipeline: str, scan_id: str) -> bool:
+        """Whether every enqueued shard has recorded a result or failure.
+
+        Args:
+            pipeline: Pipeline name
+            scan_id: Fan-out attempt shared by all shards of the scan
+
+        Returns:
+            True once all shards settled (False if the scan is unknown)
+        """
+        expected = await self._redis.get(self._expected_key(pipeline, scan_id))
+        if expected is None:
+            return False
+        return await self._redis.hlen(self._shards_key(pipeline, scan_id)) >= int(expected)
+
+    async def claim(self, pipeline: str, scan_id: str) -> bool:
+        """Claim the right to merge the scan (first caller wins).
+
+        The claim outlives clear(), so a deadline job firing after the scan
+        was merged cannot merge it again.
+
+        Args:
+            pipeline: Pipeline name
+            scan_id: Fan-out attempt shared by all shards of the scan
+
+        Returns:
+            True if this caller claimed the scan
+        """
+        claimed = await self._redis.set(
+            self._claim_key(pipeline, scan_id), 1, nx=True, ex=self._ttl_seconds
+        )
+        return bool(claimed)
+
+    async def record(
+        self,
+        scanner: ShardableScanner,
+        pipeline: str,
+        scan_id: str,
+        shard_index: int,
+        result: Any,
+    ) -> int:
+        """Store a shard's items (deduplicated) and its statistics.
+
+        Args:
+            scanner: Scanner that produced the result
+            pipeline: Pipeline name
+            scan_id: Fan-out attempt shared by all shards of the scan
+            shard_index: Index of this shard
+            result: The shard's ScanResult
+
+        Returns:
+            Items another shard had already reported
+        """
+        items_key = self._items_key(pipeline, scan_id)
+        shards_key = self._shards_key(pipeline, scan_id)
+        items = getattr(result, scanner.SHARD_ITEMS_FIELD)
+
+        duplicates = 0
+        for position, item in enumerate(items):
+            added = await self._redis.hsetnx(
+                items_key,
+                scanner.shard_key(item),
+                pickle.dumps((shard_index, position, item)),
+            )
+            if not added:
+                duplicates += 1
+
+        summary = replace(result, **{scanner.SHARD_ITEMS_FIELD: []})
+        await self._redis.hset(shards_key, str(shard_index), pickle.dumps((summary, duplicates)))
+        for key in (items_key, shards_key):
+            await self._redis.expire(key, self._ttl_seconds)
+        return duplicates
+
+    async def record_failure(
+        self,
+        pipeline: str,
+        scan_id: str,
+        shard_index: int,
+        error: str,
+    ) -> None:
+        """Mark a shard as failed so the merged scan can report it.
+
+        Args:
+            pipeline: Pipeline name
+            scan_id: Fan-out attempt shared by all shards of the scan
+            shard_index: Index of the failed shard
+            error: Failure description
+        """
+        shards_key = self._shards_key(pipeline, scan_id)
+        await self._redis.hset(shards_key, str(shard_index), pickle.dumps(error))
+        await self._redis.expire(shards_key, self._ttl_seconds)
+
+    async def collect(
+        self,
+        pipeline: str,
+        scan_id: str,
+        items_field: str,
+        shard_count: Optional[int] = None,
+    ) -> tuple[Optional[Any], list[str]]:
+        """Merge all recorded shards into one ScanResult.
+
+        Items keep shard order, then their order within the shard. Only
+        one item is kept per (shard, position). Dict fields of the results
+        are merged across shards.
+
+        Args:
+            pipeline: Pipeline name
+            scan_id: Fan-out attempt shared by all shards of the scan
+            items_field: ScanResult field holding the items
+            shard_count: Shards enqueued; those that recorded nothing are
+                reported as failed (default: only recorded shards count)
+
+        Returns:
+            Tuple of (merged ScanResult or None if every shard failed,
+            errors of failed shards)
+        """
+        shard_entries = await self._redis.hgetall(self._shards_key(pipeline, scan_id))
+        summaries: list[tuple[int, Any]] = []
+        failures: list[str] = []
+        duplicates = 0
+        recorded: set[int] = set()
+        for index, payload in (shard_entries or {}).items():
+            recorded.add(int(index))
+            entry = pickle.loads(payload)
+            if isinstance(entry, str):
+                failures.append(entry)
+                continue
+            summary, shard_duplicates = entry
+            summaries.append((int(index), summary))
+            duplicates += shard_duplicates
+        failures.extend(
+            f"Shard {index}: did not finish"
+            for index in range(shard_count or 0)
+            if index not in recorded
+        )
+
+        if not summaries:
+            return None, failures
+        summaries.sort(key=lambda pair: pair[0])
+
+        raw_items = await self._redis.hgetall(self._items_key(pipeline, scan_id))
+        # Order by (shard, position) only - items need not be comparable
+        ordered = sorted(
+            (pickle.loads(payload) for payload in (raw_items or {}).values()),
+            key=lambda entry: entry[:2],
+        )
+        items: list[Any] = []
+        placed: set[tuple[int, int]] = set()
+        for shard, position, item in ordered:
+            # A retried shard may report a different item at a position it
+            # already filled - keep the first
+            if (shard, position) in placed:
+                continue
+            placed.add((shard, position))
+            items.append(item)
+
+        results = [summary for _, summary in summaries]
+        # Per-source maps (e.g. news feed validators) are the union of the shards'
+        maps = {
+            f.name: {key: value for r in results for key, value in getattr(r, f.name).items()}
+            for f in fields(results[0])
+            if isinstance(getattr(results[0], f.name), dict)
+        }
+        merged = replace(
+            results[0],
+            **{items_field: items},
+            **maps,
+            statistics=merge_statistics([r.statistics for r in results], duplicates),
+            errors=[error for r in results for error in r.errors] + failures,
+        )
+        return merged, failures
+
+    async def clear(self, pipeline: str, scan_id: str) -> None:
+        """Delete a scan's shard results.
+
+        Args:
+            pipeline: Pipeline name
+            scan_id: Fan-out attempt shared by all shards of the scan
+        """
+        await self._redis.delete(
+            self._items_key(pipeline, scan_id),
+            self._shards_key(pipeline, scan_id),
+            self._expected_key(pipeline, scan_id),
+        )
+
+
+__all__ = [
+    "DEFAULT_SOURCES_PER_SHARD",
+    "SCAN_SHARD_KEY_PREFIX",
+    "DEFAULT_SCAN_SHARD_TTL_SECONDS",
+    "ShardableScanner",
+    "ScanShardStore",
+    "split_sources",
+    "merge_statistics",
+]
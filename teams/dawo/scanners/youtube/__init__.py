@@ -15,7 +15,9 @@ Harvester Framework Pipeline (Extended for YouTube):
 Components:
     - YouTubeScanner: Main agent class for scan stage
     - YouTubeClient: YouTube Data API v3 client
+    - QueryPlanner: Quota-aware search query ordering and pruning
     - TranscriptClient: YouTube transcript extraction
+    - TranscriptCache: Compressed on-disk transcript store
     - YouTubeHarvester: Enriches videos with details and transcript
     - KeyInsightExtractor: LLM-powered insight extraction (tier=generate)
     - YouTubeTransformer: Standardizes data for Research Pool
@@ -26,6 +28,7 @@ Configuration:
     - YouTubeClientConfig: API key (from environment)
     - TranscriptConfig: Transcript extraction settings
     - YouTubeScannerConfig: Scanner behavior settings
+    - QueryPlannerConfig: Query planner settings
 
 Schemas:
     - RawYouTubeVideo: Raw API search result
@@ -68,6 +71,7 @@ from .tools import (
     YouTubeClient,
     TranscriptClient,
     QuotaTracker,
+    RedisQuotaTracker,
     YouTubeAPIError,
     QuotaExhaustedError,
     YouTubeScanError,
@@ -77,19 +81,25 @@ from .config import (
     YouTubeClientConfig,
     TranscriptConfig,
     YouTubeScannerConfig,
+    QueryPlannerConfig,
     # Config constants
     YOUTUBE_DAILY_QUOTA,
     SEARCH_QUOTA_COST,
     VIDEO_QUOTA_COST,
+    DEFAULT_QUOTA_RESERVE_UNITS,
     DEFAULT_SEARCH_QUERIES,
     DEFAULT_MIN_VIEWS,
     DEFAULT_DAYS_BACK,
     DEFAULT_MAX_VIDEOS_PER_QUERY,
     DEFAULT_PREFERRED_LANGUAGES,
     DEFAULT_MAX_TRANSCRIPT_LENGTH,
+    DEFAULT_MAX_CONCURRENT_TRANSCRIPTS,
+    DEFAULT_TRANSCRIPT_CACHE_MAX_BYTES,
     MAX_CONTENT_LENGTH,
     DEFAULT_HEALTH_CHANNEL_KEYWORDS,
 )
+from .planner import QueryPlanner, QueryPlan, QueryYield
+from .transcript_cache import TranscriptCache
 from .schemas import (
     RawYouTubeVideo,
     HarvestedVideo,
@@ -124,21 +134,31 @@ __all__ = [
     # Clients
     "YouTubeClient",
     "TranscriptClient",
+    "TranscriptCache",
     "QuotaTracker",
+    "RedisQuotaTracker",
+    # Query planning
+    "QueryPlanner",
+    "QueryPlan",
+    "QueryYield",
     # Config
     "YouTubeClientConfig",
     "TranscriptConfig",
     "YouTubeScannerConfig",
+    "QueryPlannerConfig",
     # Config constants
     "YOUTUBE_DAILY_QUOTA",
     "SEARCH_QUOTA_COST",
     "VIDEO_QUOTA_COST",
+    "DEFAULT_QUOTA_RESERVE_UNITS",
     "DEFAULT_SEARCH_QUERIES",
     "DEFAULT_MIN_VIEWS",
     "DEFAULT_DAYS_BACK",
     "DEFAULT_MAX_VIDEOS_PER_QUERY",
     "DEFAULT_PREFERRED_LANGUAGES",
     "DEFAULT_MAX_TRANSCRIPT_LENGTH",
+    "DEFAULT_MAX_CONCURRENT_TRANSCRIPTS",
+    "DEFAULT_TRANSCRIPT_CACHE_MAX_BYTES",
     "MAX_CONTENT_LENGTH",
     "DEFAULT_HEALTH_CHANNEL_KEYWORDS",
     # Schemas
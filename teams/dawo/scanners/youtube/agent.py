@@ -10,7 +10,7 @@ Registration: team_spec.py with tier="scan" (maps to fast model at runtime)
 
 Usage:
     # Created by Team Builder with injected dependencies
-    scanner = YouTubeScanner(config, client)
+    scanner = YouTubeScanner(config, client, seen_store=seen_store, planner=planner)
 
     # Execute scan stage
     result = await scanner.scan()
@@ -21,9 +21,18 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
-from .config import YouTubeScannerConfig
+from teams.dawo.research import ResearchSource, SeenItemStore
+
+from .config import YouTubeScannerConfig, SEARCH_QUOTA_COST
+from .planner import QueryPlanner
 from .schemas import RawYouTubeVideo, ScanResult, ScanStatistics
-from .tools import YouTubeClient, YouTubeAPIError, YouTubeScanError
+from .tools import (
+    YouTubeClient,
+    YouTubeAPIError,
+    QuotaExhaustedError,
+    YouTubeScanError,
+)
+from .transformer import YOUTUBE_URL_BASE
 
 
 # Module logger
@@ -43,33 +52,63 @@ class YouTubeScanner:
         - Time-based filtering (configurable days back)
         - Deduplication by video ID
         - Health/wellness channel prioritization
+        - Cross-run skipping of videos already in the Research Pool
+        - Quota-aware query ordering and pruning (with a QueryPlanner)
+        - Shardable by search query for distributed scans (sources())
 
     Configuration is injected via constructor - NEVER loads files directly.
 
     Attributes:
         _config: Scanner configuration (queries, filters)
         _client: YouTube API client for making requests
+        _seen_store: Optional cross-run seen-item store
+        _planner: Optional quota-aware query planner
     """
 
+    # ScanResult field holding discovered items (sharded scans)
+    SHARD_ITEMS_FIELD = "videos"
+
     def __init__(
         self,
         config: YouTubeScannerConfig,
         client: YouTubeClient,
+        seen_store: Optional[SeenItemStore] = None,
+        planner: Optional[QueryPlanner] = None,
     ):
         """Initialize scanner with injected dependencies.
 
         Args:
             config: Scanner configuration from Team Builder
             client: YouTube API client with credentials
+            seen_store: Optional store used to skip videos ingested by
+                earlier runs (None = dedupe within this run only)
+            planner: Optional planner that orders, prunes and budgets the
+                search queries (None = search every query in config order)
         """
         self._config = config
         self._client = client
+        self._seen_store = seen_store
+        self._planner = planner
+
+    def sources(self) -> list[str]:
+        """Search queries a scan covers, each scannable as its own shard."""
+        return list(self._config.search_queries)
 
-    async def scan(self) -> ScanResult:
+    @staticmethod
+    def shard_key(video: RawYouTubeVideo) -> str:
+        """Deduplication key of a video across shards."""
+        return video.video_id
+
+    async def scan(self, sources: Optional[list[str]] = None) -> ScanResult:
         """Execute the scan stage - discover YouTube videos.
 
-        Iterates through configured search queries, collecting
-        videos that meet the filtering criteria.
+        Iterates through the search queries (as planned by the QueryPlanner,
+        if one is injected), collecting videos that meet the filtering
+        criteria. Stops searching once the daily quota is exhausted.
+
+        Args:
+            sources: Search queries to scan (a shard of sources()); None
+                scans every configured query
 
         Returns:
             ScanResult with discovered videos and statistics
@@ -77,30 +116,41 @@ class YouTubeScanner:
         Raises:
             YouTubeScanError: If critical error prevents scanning
         """
+        queries = list(self._config.search_queries if sources is None else sources)
+        stats = ScanStatistics()
+
+        if self._planner is not None:
+            plan = await self._planner.plan(queries, self._config.max_videos_per_query)
+            queries = plan.queries
+            stats.queries_pruned = len(plan.pruned)
+            stats.queries_deferred = len(plan.deferred)
+
         logger.info(
             "Starting YouTube scan: %d queries, min_views=%d, days_back=%d",
-            len(self._config.search_queries),
+            len(queries),
             self._config.min_views,
             self._config.days_back,
         )
 
-        stats = ScanStatistics()
         all_videos: dict[str, RawYouTubeVideo] = {}  # Keyed by video_id for deduplication
+        found_by_query: dict[str, list[str]] = {}
         errors: list[str] = []
 
         published_after = datetime.now(timezone.utc) - timedelta(days=self._config.days_back)
 
-        for query in self._config.search_queries:
+        for index, query in enumerate(queries):
             stats.queries_searched += 1
 
             try:
                 videos = await self._search_and_filter(query, published_after)
+                stats.quota_used += SEARCH_QUOTA_COST
                 stats.total_videos_found += len(videos)
 
                 # Filter by view count (note: view count requires separate API call in harvester)
                 # At scan stage, we collect all results - harvester will filter by views
                 filtered = videos
                 stats.videos_after_filter += len(filtered)
+                found_by_query[query] = [video.video_id for video in filtered]
 
                 # Deduplicate by video ID
                 before_count = len(all_videos)
@@ -108,25 +158,103 @@ class YouTubeScanner:
                     all_videos[video.video_id] = video
                 stats.duplicates_removed += before_count + len(filtered) - len(all_videos)
 
+            except QuotaExhaustedError as e:
+                stats.queries_searched -= 1
+                stats.queries_deferred += len(queries) - index
+                error_msg = f"YouTube quota exhausted before '{query}': {e}"
+                logger.warning(error_msg)
+                errors.append(error_msg)
+                break
+
             except YouTubeAPIError as e:
+                stats.quota_used += SEARCH_QUOTA_COST
                 error_msg = f"Failed to search YouTube for '{query}': {e}"
                 logger.error(error_msg)
                 errors.append(error_msg)
                 # Continue with other queries
 
+        videos = await self._drop_seen(list(all_videos.values()), stats)
+        await self._record_yield(found_by_query, videos)
+
         logger.info(
-            "Scan complete: %d videos found, %d after filtering, %d unique",
+            "Scan complete: %d videos found, %d after filtering, %d unique, %d new",
             stats.total_videos_found,
             stats.videos_after_filter,
             len(all_videos),
+            len(videos),
         )
 
         return ScanResult(
-            videos=list(all_videos.values()),
+            videos=videos,
             statistics=stats,
             errors=errors,
         )
 
+    async def record_scores(self, scores: dict[str, float]) -> None:
+        """Report Research Pool scores of scanned videos to the planner.
+
+        Called by the pipeline after scoring so queries that surface
+        high-scoring videos are ranked ahead next run.
+
+        Args:
+            scores: Video ID -> final score
+        """
+        if self._planner is not None and scores:
+            await self._planner.record_scores(scores)
+
+    async def _record_yield(
+        self,
+        found_by_query: dict[str, list[str]],
+        new_videos: list[RawYouTubeVideo],
+    ) -> None:
+        """Record each searched query's cost and new videos with the planner.
+
+        Args:
+            found_by_query: Query -> video IDs it returned
+            new_videos: Videos left after dropping already-seen ones
+        """
+        if self._planner is None:
+            return
+
+        new_ids = {video.video_id for video in new_videos}
+        for query, video_ids in found_by_query.items():
+            await self._planner.record_search(
+                query,
+                SEARCH_QUOTA_COST,
+                [video_id for video_id in dict.fromkeys(video_ids) if video_id in new_ids],
+            )
+
+    async def _drop_seen(
+        self,
+        videos: list[RawYouTubeVideo],
+        stats: ScanStatistics,
+    ) -> list[RawYouTubeVideo]:
+        """Drop videos already published by an earlier run.
+
+        Videos are keyed by watch URL, the URL the transformer publishes.
+        Skipping them here also saves the harvester's statistics calls
+        and transcript fetches.
+
+        Args:
+            videos: Unique videos discovered in this run
+            stats: Scan statistics to update
+
+        Returns:
+            Videos not yet in the Research Pool
+        """
+        if self._seen_store is None or not videos:
+            return videos
+
+        seen = await self._seen_store.find_seen(
+            ResearchSource.YOUTUBE,
+            [f"{YOUTUBE_URL_BASE}{video.video_id}" for video in videos],
+        )
+        stats.already_seen = len(seen)
+        return [
+            video for video in videos
+            if f"{YOUTUBE_URL_BASE}{video.video_id}" not in seen
+        ]
+
     async def _search_and_filter(
         self,
         query: str,
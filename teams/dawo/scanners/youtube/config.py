@@ -4,6 +4,7 @@ Provides configuration structures for:
     - YouTubeClientConfig: API credentials for YouTube Data API v3
     - TranscriptConfig: Transcript extraction settings
     - YouTubeScannerConfig: Scanner behavior settings
+    - QueryPlannerConfig: Quota-aware query planning settings
 
 Configuration is injected via constructor - NEVER loaded from files directly.
 Team Builder is responsible for loading config and injecting it.
@@ -25,6 +26,17 @@ from dataclasses import dataclass, field
 YOUTUBE_DAILY_QUOTA = 10000
 SEARCH_QUOTA_COST = 100  # units per search call
 VIDEO_QUOTA_COST = 1     # units per video in batch (max 50)
+QUOTA_KEY_PREFIX = "dawo:youtube:quota"
+QUOTA_KEY_TTL_SECONDS = 2 * 24 * 60 * 60  # Keep yesterday's ledger for inspection
+
+# Query planner defaults
+DEFAULT_QUOTA_RESERVE_UNITS = 500        # Never planned; headroom for retries and other callers
+DEFAULT_PRUNE_AFTER_SEARCHES = 3         # Searches before a query's yield is trusted
+DEFAULT_MIN_YIELD_PER_UNIT = 0.01        # 1 new video per search.list call
+DEFAULT_REEXPLORE_AFTER_SKIPS = 5        # Runs a pruned query sits out before a retry
+DEFAULT_HIGH_SCORE_THRESHOLD = 7.0       # Research Pool score counted as high-scoring
+DEFAULT_HIGH_SCORE_WEIGHT = 5.0          # A high-scoring video is worth this many new ones
+QUERY_YIELD_KEY_PREFIX = "dawo:youtube:query_yield"
 
 # Default scanner configuration
 DEFAULT_SEARCH_QUERIES = [
@@ -42,6 +54,8 @@ DEFAULT_MAX_VIDEOS_PER_QUERY = 50
 # Transcript configuration
 DEFAULT_PREFERRED_LANGUAGES = ["en", "en-US", "en-GB"]
 DEFAULT_MAX_TRANSCRIPT_LENGTH = 50000
+DEFAULT_MAX_CONCURRENT_TRANSCRIPTS = 4   # Transcript downloads in flight at once
+DEFAULT_TRANSCRIPT_CACHE_MAX_BYTES = 512 * 1024 * 1024  # Compressed, ~25k transcripts
 
 # Content limits
 MAX_CONTENT_LENGTH = 10000
@@ -91,12 +105,30 @@ class TranscriptConfig:
     Attributes:
         preferred_languages: Language codes in preference order
         max_transcript_length: Maximum transcript length in characters
+        max_concurrent_fetches: Transcript downloads in flight at once
     """
 
     preferred_languages: list[str] = field(
         default_factory=lambda: DEFAULT_PREFERRED_LANGUAGES.copy()
     )
     max_transcript_length: int = DEFAULT_MAX_TRANSCRIPT_LENGTH
+    max_concurrent_fetches: int = DEFAULT_MAX_CONCURRENT_TRANSCRIPTS
+
+    def __post_init__(self) -> None:
+        """Validate configuration values."""
+        errors = []
+
+        if self.max_transcript_length < 1:
+            errors.append(
+                f"max_transcript_length must be >= 1, got {self.max_transcript_length}"
+            )
+        if self.max_concurrent_fetches < 1:
+            errors.append(
+                f"max_concurrent_fetches must be >= 1, got {self.max_concurrent_fetches}"
+            )
+
+        if errors:
+            raise ValueError(f"Invalid TranscriptConfig: {'; '.join(errors)}")
 
 
 @dataclass
@@ -145,3 +177,61 @@ class YouTubeScannerConfig:
 
         if errors:
             raise ValueError(f"Invalid YouTubeScannerConfig: {'; '.join(errors)}")
+
+
+@dataclass
+class QueryPlannerConfig:
+    """Quota-aware query planning configuration.
+
+    Each planned query is charged one search.list call plus one videos.list
+    unit per result it may return, so the harvester's statistics calls are
+    budgeted before the search is made.
+
+    Attributes:
+        quota_reserve_units: Daily units the planner never spends
+        prune_after_searches: Searches before a low-yield query is pruned
+        min_yield_per_unit: Observed yield below which a query is pruned
+        reexplore_after_skips: Runs a pruned query is skipped before retrying
+        high_score_threshold: Minimum score counted as a high-scoring video
+        high_score_weight: Yield credit of a high-scoring video, in new videos
+    """
+
+    quota_reserve_units: int = DEFAULT_QUOTA_RESERVE_UNITS
+    prune_after_searches: int = DEFAULT_PRUNE_AFTER_SEARCHES
+    min_yield_per_unit: float = DEFAULT_MIN_YIELD_PER_UNIT
+    reexplore_after_skips: int = DEFAULT_REEXPLORE_AFTER_SKIPS
+    high_score_threshold: float = DEFAULT_HIGH_SCORE_THRESHOLD
+    high_score_weight: float = DEFAULT_HIGH_SCORE_WEIGHT
+
+    def __post_init__(self) -> None:
+        """Validate configuration values."""
+        errors = []
+
+        if self.quota_reserve_units < 0 or self.quota_reserve_units >= YOUTUBE_DAILY_QUOTA:
+            errors.append(
+                f"quota_reserve_units must be 0-{YOUTUBE_DAILY_QUOTA - 1}, "
+                f"got {self.quota_reserve_units}"
+            )
+        if self.prune_after_searches < 1:
+            errors.append(
+                f"prune_after_searches must be >= 1, got {self.prune_after_searches}"
+            )
+        if self.min_yield_per_unit < 0:
+            errors.append(
+                f"min_yield_per_unit must be >= 0, got {self.min_yield_per_unit}"
+            )
+        if self.reexplore_after_skips < 1:
+            errors.append(
+                f"reexplore_after_skips must be >= 1, got {self.reexplore_after_skips}"
+            )
+        if not 0 <= self.high_score_threshold <= 10:
+            errors.append(
+                f"high_score_threshold must be 0-10, got {self.high_score_threshold}"
+            )
+        if self.high_score_weight < 0:
+            errors.append(
+                f"high_score_weight must be >= 0, got {self.high_score_weight}"
+            )
+
+        if errors:
+            raise ValueError(f"Invalid QueryPlannerConfig: {'; '.join(errors)}")
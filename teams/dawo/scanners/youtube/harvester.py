@@ -16,6 +16,7 @@ Usage:
     harvested = await harvester.harvest(raw_videos)
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Optional
@@ -56,7 +57,7 @@ class YouTubeHarvester:
 
     Features:
         - Batch fetching of video statistics (up to 50 per request)
-        - Transcript extraction with fallback handling
+        - Concurrent transcript extraction with fallback handling
         - View count filtering (min_views from config)
         - Graceful handling of missing transcripts
 
@@ -117,11 +118,9 @@ class YouTubeHarvester:
             logger.error(f"Failed to fetch video statistics: {e}")
             raise HarvesterError(f"Statistics fetch failed: {e}") from e
 
-        # Step 2: Filter by view count and enrich with transcripts
-        harvested: list[HarvestedVideo] = []
+        # Step 2: Filter by view count
+        eligible: list[tuple[RawYouTubeVideo, dict]] = []
         skipped_low_views = 0
-        transcripts_extracted = 0
-        transcripts_unavailable = 0
 
         for raw_video in raw_videos:
             video_stats = stats_map.get(raw_video.video_id, {})
@@ -137,9 +136,18 @@ class YouTubeHarvester:
                 )
                 continue
 
-            # Extract transcript
-            transcript_result = await self._extract_transcript(raw_video.video_id)
+            eligible.append((raw_video, video_stats))
+
+        # Step 3: Extract transcripts concurrently (the client bounds downloads)
+        transcript_results = await asyncio.gather(
+            *(self._extract_transcript(raw_video.video_id) for raw_video, _ in eligible)
+        )
+
+        harvested: list[HarvestedVideo] = []
+        transcripts_extracted = 0
+        transcripts_unavailable = 0
 
+        for (raw_video, video_stats), transcript_result in zip(eligible, transcript_results):
             if transcript_result.available:
                 transcripts_extracted += 1
             else:
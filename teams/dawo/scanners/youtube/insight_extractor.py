@@ -21,6 +21,9 @@ import logging
 import re
 from typing import Any, Optional
 
+from teams.dawo.config import TaskType
+from teams.dawo.middleware.llm_cache import LLMResponseCache, cached_generate, template_id
+
 from .schemas import InsightResult, QuotableInsight
 from .prompts import (
     KEY_INSIGHT_EXTRACTION_PROMPT,
@@ -33,6 +36,14 @@ from .prompts import (
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Response cache key components - change whenever the prompt text changes
+KEY_INSIGHT_EXTRACTION_TEMPLATE_ID = template_id(
+    "youtube.key_insight_extraction", KEY_INSIGHT_EXTRACTION_PROMPT
+)
+KEY_INSIGHT_EXTRACTION_SHORT_TEMPLATE_ID = template_id(
+    "youtube.key_insight_extraction_short", KEY_INSIGHT_EXTRACTION_SHORT_PROMPT
+)
+
 
 class InsightExtractionError(Exception):
     """Exception raised for insight extraction errors.
@@ -74,16 +85,23 @@ class KeyInsightExtractor:
 
     Attributes:
         _llm_client: LLM client for generate tier (injected)
+        _cache: Optional LLM response cache (injected)
     """
 
-    def __init__(self, llm_client: Any):
+    def __init__(
+        self,
+        llm_client: Any,
+        response_cache: Optional[LLMResponseCache] = None,
+    ):
         """Initialize insight extractor with LLM client.
 
         Args:
             llm_client: LLM client for tier="generate" (Sonnet)
                        Expected interface: async generate(prompt: str) -> str
+            response_cache: Optional cache for repeated transcripts
         """
         self._llm_client = llm_client
+        self._cache = response_cache
 
     async def extract_insights(
         self,
@@ -115,28 +133,35 @@ class KeyInsightExtractor:
 
         # Select prompt based on transcript length
         if word_count < SHORT_TRANSCRIPT_THRESHOLD:
-            prompt = KEY_INSIGHT_EXTRACTION_SHORT_PROMPT.format(
-                video_title=title,
-                channel_name=channel_name,
-                transcript=transcript,
-            )
+            inputs = {
+                "video_title": title,
+                "channel_name": channel_name,
+                "transcript": transcript,
+            }
+            prompt = KEY_INSIGHT_EXTRACTION_SHORT_PROMPT.format(**inputs)
+            prompt_id = KEY_INSIGHT_EXTRACTION_SHORT_TEMPLATE_ID
             logger.debug("Using short prompt for brief transcript")
         else:
-            prompt = KEY_INSIGHT_EXTRACTION_PROMPT.format(
-                video_title=title,
-                channel_name=channel_name,
-                transcript_length=word_count,
-                transcript=transcript,
-            )
+            inputs = {
+                "video_title": title,
+                "channel_name": channel_name,
+                "transcript_length": word_count,
+                "transcript": transcript,
+            }
+            prompt = KEY_INSIGHT_EXTRACTION_PROMPT.format(**inputs)
+            prompt_id = KEY_INSIGHT_EXTRACTION_TEMPLATE_ID
             logger.debug("Using full prompt for standard transcript")
 
         try:
-            # Call LLM for insight extraction
-            response = await self._llm_client.generate(prompt)
-            logger.debug(f"LLM response length: {len(response)} chars")
-
-            # Parse JSON response
-            result = self._parse_response(response, title)
+            # Call LLM for insight extraction (or reuse a cached response)
+            result = await cached_generate(
+                self._cache,
+                template=prompt_id,
+                tier=TaskType.GENERATE.value,
+                inputs=inputs,
+                generate=lambda: self._llm_client.generate(prompt),
+                parse=lambda response: self._parse_response(response, title),
+            )
 
             # Log confidence warnings
             if result.confidence_score < LOW_CONFIDENCE_THRESHOLD:
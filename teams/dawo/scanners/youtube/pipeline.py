@@ -9,6 +9,7 @@ timestamp for next day reset.
 
 The pipeline chains all stages together with:
     - Statistics tracking through each stage (including insights_generated)
+    - Per-stage timing and external call telemetry
     - Graceful degradation on API failures
     - Quota exhaustion handling (wait until next day)
     - Partial failure handling (continue on item failures)
@@ -26,6 +27,16 @@ from datetime import datetime, timezone, timedelta
 from typing import Optional
 from uuid import UUID
 
+from teams.dawo.middleware.telemetry import (
+    PipelineTelemetry,
+    PipelineTelemetryStore,
+    get_telemetry_store,
+)
+from teams.dawo.middleware.checkpoint import (
+    PipelineCheckpointStore,
+    RunCheckpoint,
+    open_run_checkpoint,
+)
 from teams.dawo.research import ResearchPublisher, TransformedResearch
 from teams.dawo.research.scoring import ResearchItemScorer
 
@@ -92,6 +103,8 @@ class YouTubeResearchPipeline:
         _validator: YouTubeValidator for compliance checking
         _scorer: ResearchItemScorer for relevance scoring
         _publisher: ResearchPublisher for database persistence
+        _telemetry_store: Rolling history that receives each run's telemetry
+        _checkpoint_store: Stage outputs kept so retried runs resume (optional)
     """
 
     def __init__(
@@ -102,6 +115,8 @@ class YouTubeResearchPipeline:
         validator: YouTubeValidator,
         scorer: ResearchItemScorer,
         publisher: ResearchPublisher,
+        telemetry_store: Optional[PipelineTelemetryStore] = None,
+        checkpoint_store: Optional[PipelineCheckpointStore] = None,
     ):
         """Initialize pipeline with injected stage components.
 
@@ -112,6 +127,8 @@ class YouTubeResearchPipeline:
             validator: Compliance checking stage
             scorer: Relevance scoring stage
             publisher: Database persistence stage
+            telemetry_store: Run telemetry history (default: global store)
+            checkpoint_store: Stage checkpoints for resuming retries (default: none)
         """
         self._scanner = scanner
         self._harvester = harvester
@@ -119,14 +136,20 @@ class YouTubeResearchPipeline:
         self._validator = validator
         self._scorer = scorer
         self._publisher = publisher
+        self._telemetry_store = telemetry_store or get_telemetry_store()
+        self._checkpoint_store = checkpoint_store
 
-    async def execute(self) -> PipelineResult:
+    async def execute(self, run_id: Optional[str] = None) -> PipelineResult:
         """Execute the complete pipeline.
 
         Runs all stages in sequence, tracking statistics and handling
         errors gracefully. Returns INCOMPLETE status on API failures
         and QUOTA_EXCEEDED on quota exhaustion (with retry_after).
 
+        Args:
+            run_id: Run id of a failed attempt (PipelineResult.run_id) to
+                resume from its checkpoints; None starts a new run
+
         Returns:
             PipelineResult with status, statistics, and published IDs
 
@@ -134,19 +157,26 @@ class YouTubeResearchPipeline:
             - COMPLETE: All stages ran successfully
             - INCOMPLETE: YouTube API failure, retry scheduled
             - PARTIAL: Some items failed but pipeline completed
-            - FAILED: Critical error, no retry
+            - FAILED: Nothing published; retry scheduled only if publish failed
             - QUOTA_EXCEEDED: Daily quota exhausted, retry tomorrow
         """
+        checkpoint = await open_run_checkpoint(self._checkpoint_store, "youtube", run_id)
+        return await checkpoint.settle(await self._execute(checkpoint))
+
+    async def _execute(self, checkpoint: RunCheckpoint) -> PipelineResult:
+        """Run the stages, reusing checkpointed outputs of earlier attempts."""
         logger.info("Starting YouTube Research Pipeline execution")
 
         stats = PipelineStatistics()
+        telemetry = PipelineTelemetry(pipeline="youtube")
         published_ids: list[UUID] = []
 
         try:
             # Stage 1: Scan - Discover videos
             logger.info("Stage 1/6: Scanning YouTube")
-            scan_result = await self._scanner.scan()
-            stats.total_found = len(scan_result.videos)
+            with telemetry.stage("scan") as stage:
+                scan_result = await checkpoint.run("scan", self._scanner.scan)
+            stats.total_found = stage.items_out = len(scan_result.videos)
             stats.quota_used = scan_result.statistics.quota_used
             logger.info(f"Scan complete: {stats.total_found} videos found")
 
@@ -155,12 +185,16 @@ class YouTubeResearchPipeline:
                 return PipelineResult(
                     status=PipelineStatus.COMPLETE,
                     statistics=stats,
+                    telemetry=telemetry,
                 )
 
             # Stage 2: Harvest - Enrich with details and transcripts
             logger.info("Stage 2/6: Harvesting video details and transcripts")
-            harvested = await self._harvester.harvest(scan_result.videos)
-            stats.harvested = len(harvested)
+            with telemetry.stage("harvest", items_in=stats.total_found) as stage:
+                harvested = await checkpoint.run(
+                    "harvest", self._harvester.harvest, scan_result.videos
+                )
+            stats.harvested = stage.items_out = len(harvested)
             stats.transcripts_extracted = sum(
                 1 for v in harvested if v.transcript_available
             )
@@ -174,12 +208,16 @@ class YouTubeResearchPipeline:
                 return PipelineResult(
                     status=PipelineStatus.COMPLETE,
                     statistics=stats,
+                    telemetry=telemetry,
                 )
 
             # Stage 3: Transform - Convert to Research Pool schema (with LLM insights)
             logger.info("Stage 3/6: Transforming to Research Pool schema (with insights)")
-            transformed = await self._transformer.transform(harvested)
-            stats.transformed = len(transformed)
+            with telemetry.stage("transform", items_in=stats.harvested) as stage:
+                transformed = await checkpoint.run(
+                    "transform", self._transformer.transform, harvested
+                )
+            stats.transformed = stage.items_out = len(transformed)
             # Count items that have insights (non-empty content with "Key Insights")
             stats.insights_generated = sum(
                 1 for t in transformed if "Key Insights:" in t.content
@@ -191,21 +229,33 @@ class YouTubeResearchPipeline:
 
             # Stage 4: Validate - Check EU compliance
             logger.info("Stage 4/6: Validating EU compliance")
-            validated = await self._validator.validate(transformed)
-            stats.validated = len(validated)
+            with telemetry.stage("validate", items_in=stats.transformed) as stage:
+                validated = await checkpoint.run(
+                    "validate", self._validator.validate, transformed
+                )
+            stats.validated = stage.items_out = len(validated)
             logger.info(f"Validation complete: {stats.validated} items validated")
 
             # Stage 5: Score - Calculate relevance scores
             logger.info("Stage 5/6: Scoring research items")
-            scored = await self._score_items(validated)
-            stats.scored = len(scored)
+            with telemetry.stage("score", items_in=stats.validated) as stage:
+                scored = await self._score_items(validated)
+            stats.scored = stage.items_out = len(scored)
             logger.info(f"Scoring complete: {stats.scored} items scored")
+            await self._scanner.record_scores({
+                item.source_metadata["video_id"]: item.score
+                for item in scored
+                if item.source_metadata.get("video_id")
+            })
 
             # Stage 6: Publish - Save to Research Pool
             logger.info("Stage 6/6: Publishing to Research Pool")
-            publish_count, published_ids = await self._publish_items(scored)
-            stats.published = publish_count
+            with telemetry.stage("publish", items_in=stats.scored) as stage:
+                publish_count, published_ids = await self._publish_items(scored)
+            stats.published = stage.items_out = publish_count
             stats.failed = stats.scored - stats.published
+            # Retry a publish that stored nothing from the checkpoints, not from the scan
+            publish_failed = stats.scored > 0 and stats.published == 0
             logger.info(f"Publish complete: {stats.published} items published")
 
             # Determine final status
@@ -219,7 +269,9 @@ class YouTubeResearchPipeline:
             return PipelineResult(
                 status=status,
                 statistics=stats,
+                retry_scheduled=publish_failed,
                 published_ids=published_ids,
+                telemetry=telemetry,
             )
 
         except QuotaExhaustedError as e:
@@ -240,6 +292,7 @@ class YouTubeResearchPipeline:
                 error=str(e),
                 retry_scheduled=True,
                 retry_after=tomorrow,
+                telemetry=telemetry,
             )
 
         except YouTubeAPIError as e:
@@ -252,6 +305,7 @@ class YouTubeResearchPipeline:
                 statistics=stats,
                 error=str(e),
                 retry_scheduled=True,
+                telemetry=telemetry,
             )
 
         except Exception as e:
@@ -264,6 +318,9 @@ class YouTubeResearchPipeline:
                 statistics=stats,
             ) from e
 
+        finally:
+            self._telemetry_store.record(telemetry.finish())
+
     async def _score_items(
         self,
         validated: list[ValidatedResearch],
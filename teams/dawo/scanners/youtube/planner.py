@@ -0,0 +1,278 @@
+"""Quota-aware search query planner for the YouTube Research Scanner.
+
+Each search.list call costs 100 of the 10,000 daily quota units, and every
+video it returns costs one more unit when the harvester fetches statistics.
+Running every configured query in fixed order burns the budget by mid-run
+and loses the tail. QueryPlanner instead:
+
+    - Ranks queries by historical yield: new videos (plus a bonus for
+      high-scoring ones) per quota unit spent
+    - Prunes queries whose observed yield stayed low, re-trying them after
+      a few skipped runs so a topic that picks up again is noticed
+    - Plans only as many searches as the remaining quota covers, counting
+      each search's worst-case videos.list cost and a fixed reserve
+
+Yield history lives in Redis (one hash per query) so every worker plans
+from the same data; without Redis, or when it fails, an in-process copy is
+used.
+
+Usage:
+    planner = QueryPlanner(RedisQuotaTracker(redis_client), redis_client=redis_client)
+    scanner = YouTubeScanner(config, client, planner=planner)
+
+    # Inside the scanner
+    plan = await planner.plan(config.search_queries, config.max_videos_per_query)
+    ...
+    await planner.record_search(query, SEARCH_QUOTA_COST, new_video_ids)
+
+    # After scoring
+    await planner.record_scores({"abc123": 8.2})
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from .config import (
+    QueryPlannerConfig,
+    SEARCH_QUOTA_COST,
+    VIDEO_QUOTA_COST,
+    QUERY_YIELD_KEY_PREFIX,
+)
+from .tools import QuotaTracker
+
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
+
+# Module logger
+logger = logging.getLogger(__name__)
+
+# Optimistic prior for queries without history: one search yielding this
+# many new videos, so untried queries rank ahead of proven poor ones
+PRIOR_NEW_VIDEOS = 5.0
+
+
+@dataclass
+class QueryYield:
+    """Accumulated outcome of a search query across runs.
+
+    Attributes:
+        searches: search.list calls made for the query
+        units_spent: Quota units charged to the query
+        new_videos: Results not already in the Research Pool
+        high_scoring: New videos that later scored above the threshold
+        skipped_runs: Consecutive runs the query was pruned
+    """
+
+    searches: int = 0
+    units_spent: int = 0
+    new_videos: int = 0
+    high_scoring: int = 0
+    skipped_runs: int = 0
+
+    @classmethod
+    def from_mapping(cls, data: dict[Any, Any]) -> "QueryYield":
+        """Build from a Redis hash (bytes or str keys and values)."""
+        values = {
+            (k.decode() if isinstance(k, bytes) else k): int(v)
+            for k, v in data.items()
+        }
+        return cls(**{
+            name: values.get(name, 0)
+            for name in cls.__dataclass_fields__
+        })
+
+
+@dataclass
+class QueryPlan:
+    """Queries chosen for one scan run.
+
+    Attributes:
+        queries: Queries to search, best expected yield first
+        pruned: Queries skipped for low historical yield
+        deferred: Queries dropped because the remaining quota cannot cover them
+        quota_remaining: Daily units left when the plan was made
+        planned_units: Worst-case units the planned queries may spend
+    """
+
+    queries: list[str] = field(default_factory=list)
+    pruned: list[str] = field(default_factory=list)
+    deferred: list[str] = field(default_factory=list)
+    quota_remaining: int = 0
+    planned_units: int = 0
+
+
+class QueryPlanner:
+    """Orders and budgets YouTube search queries by yield per quota unit.
+
+    Configuration is injected via constructor - NEVER loads files directly.
+
+    Attributes:
+        _quota: Quota tracker the budget is read from
+        _config: Planner settings
+        _redis: Async Redis client holding yield history, or None
+        _key_prefix: Prefix of the per-query yield hashes
+        _local: In-process yield history (fallback and Redis-less mode)
+        _attribution: Video ID -> queries that found it, for record_scores
+    """
+
+    def __init__(
+        self,
+        quota_tracker: QuotaTracker,
+        config: Optional[QueryPlannerConfig] = None,
+        redis_client: Optional["redis.Redis"] = None,
+        key_prefix: str = QUERY_YIELD_KEY_PREFIX,
+    ) -> None:
+        """Initialize planner with injected dependencies.
+
+        Args:
+            quota_tracker: Tracker shared with the YouTubeClient
+            config: Planner settings (defaults if None)
+            redis_client: Optional async Redis client for shared history
+            key_prefix: Prefix of the per-query yield hashes
+        """
+        self._quota = quota_tracker
+        self._config = config or QueryPlannerConfig()
+        self._redis = redis_client
+        self._key_prefix = key_prefix
+        self._local: dict[str, QueryYield] = {}
+        self._attribution: dict[str, set[str]] = {}
+
+    async def plan(
+        self,
+        queries: Sequence[str],
+        max_videos_per_query: int,
+    ) -> QueryPlan:
+        """Choose which queries to search this run, and in what order.
+
+        Args:
+            queries: Configured search queries
+            max_videos_per_query: Results requested per search, used to
+                budget the harvester's videos.list calls
+
+        Returns:
+            QueryPlan with ordered queries and the ones left out
+        """
+        remaining = await self._quota.remaining()
+        plan = QueryPlan(quota_remaining=remaining)
+        budget = remaining - self._config.quota_reserve_units
+        cost = SEARCH_QUOTA_COST + max_videos_per_query * VIDEO_QUOTA_COST
+
+        history = {query: await self._load(query) for query in dict.fromkeys(queries)}
+        candidates: list[str] = []
+        for query, record in history.items():
+            if self._is_low_yield(record) and (
+                record.skipped_runs < self._config.reexplore_after_skips
+            ):
+                plan.pruned.append(query)
+                await self._increment(query, skipped_runs=1)
+            else:
+                candidates.append(query)
+
+        # Stable sort keeps configured order between equally ranked queries
+        candidates.sort(key=lambda q: self._expected_yield(history[q]), reverse=True)
+
+        for query in candidates:
+            if plan.planned_units + cost > budget:
+                plan.deferred.append(query)
+                continue
+            plan.queries.append(query)
+            plan.planned_units += cost
+            if history[query].skipped_runs:
+                await self._increment(query, skipped_runs=-history[query].skipped_runs)
+
+        logger.info(
+            "Query plan: %d planned (%d units), %d pruned, %d deferred, %d units left",
+            len(plan.queries),
+            plan.planned_units,
+            len(plan.pruned),
+            len(plan.deferred),
+            remaining,
+        )
+        return plan
+
+    async def record_search(
+        self,
+        query: str,
+        units: int,
+        new_video_ids: Sequence[str],
+    ) -> None:
+        """Record one search's cost and the new videos it found.
+
+        Args:
+            query: Query that was searched
+            units: Quota units the search cost
+            new_video_ids: Returned videos not already in the Research Pool
+        """
+        await self._increment(
+            query,
+            searches=1,
+            units_spent=units,
+            new_videos=len(new_video_ids),
+        )
+        for video_id in new_video_ids:
+            self._attribution.setdefault(video_id, set()).add(query)
+
+    async def record_scores(self, scores: dict[str, float]) -> None:
+        """Credit queries whose videos scored above the threshold.
+
+        Only videos recorded by record_search in this process are credited;
+        each is credited once.
+
+        Args:
+            scores: Video ID -> Research Pool score
+        """
+        credit: dict[str, int] = {}
+        for video_id, score in scores.items():
+            queries = self._attribution.pop(video_id, set())
+            if score >= self._config.high_score_threshold:
+                for query in queries:
+                    credit[query] = credit.get(query, 0) + 1
+
+        for query, count in credit.items():
+            await self._increment(query, high_scoring=count)
+
+    def _expected_yield(self, record: QueryYield) -> float:
+        """Yield per unit, smoothed toward an optimistic prior."""
+        value = (
+            record.new_videos
+            + self._config.high_score_weight * record.high_scoring
+            + PRIOR_NEW_VIDEOS
+        )
+        return value / (record.units_spent + SEARCH_QUOTA_COST)
+
+    def _is_low_yield(self, record: QueryYield) -> bool:
+        """Whether enough history shows the query is not worth its cost."""
+        if record.searches < self._config.prune_after_searches or not record.units_spent:
+            return False
+        value = record.new_videos + self._config.high_score_weight * record.high_scoring
+        return value / record.units_spent < self._config.min_yield_per_unit
+
+    def _key(self, query: str) -> str:
+        """Redis key of a query's yield hash."""
+        return f"{self._key_prefix}:{query.lower()}"
+
+    async def _load(self, query: str) -> QueryYield:
+        """Load a query's yield history."""
+        if self._redis is not None:
+            try:
+                return QueryYield.from_mapping(await self._redis.hgetall(self._key(query)))
+            except Exception as e:
+                logger.warning("Query yield history unavailable, using local copy: %s", e)
+        return self._local.get(query.lower(), QueryYield())
+
+    async def _increment(self, query: str, **deltas: int) -> None:
+        """Add deltas to a query's yield counters (locally and in Redis)."""
+        record = self._local.setdefault(query.lower(), QueryYield())
+        for name, delta in deltas.items():
+            setattr(record, name, max(0, getattr(record, name) + delta))
+
+        if self._redis is None:
+            return
+        try:
+            key = self._key(query)
+            for name, delta in deltas.items():
+                await self._redis.hincrby(key, name, delta)
+        except Exception as e:
+            logger.warning("Failed to update query yield history: %s", e)
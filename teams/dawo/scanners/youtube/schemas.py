@@ -23,6 +23,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from teams.dawo.middleware.telemetry import PipelineTelemetry
+
 
 class PipelineStatus(str, Enum):
     """Pipeline execution status.
@@ -224,6 +226,9 @@ class ScanStatistics:
         total_videos_found: Raw videos from API
         videos_after_filter: Videos meeting view/date criteria
         duplicates_removed: Videos deduplicated by ID
+        already_seen: Videos already in the Research Pool from earlier runs
+        queries_pruned: Queries skipped by the planner for low yield
+        queries_deferred: Queries skipped because quota could not cover them
         quota_used: YouTube API quota units consumed
     """
 
@@ -231,6 +236,9 @@ class ScanStatistics:
     total_videos_found: int = 0
     videos_after_filter: int = 0
     duplicates_removed: int = 0
+    already_seen: int = 0
+    queries_pruned: int = 0
+    queries_deferred: int = 0
     quota_used: int = 0
 
 
@@ -291,6 +299,8 @@ class PipelineResult:
         retry_scheduled: True if queued for next cycle
         retry_after: Timestamp when retry is allowed (for quota exceeded)
         published_ids: UUIDs of successfully published items
+        telemetry: Per-stage timing, throughput and external calls
+        run_id: Run id; pass to execute() when retrying to resume
     """
 
     status: PipelineStatus
@@ -299,3 +309,5 @@ class PipelineResult:
     retry_scheduled: bool = False
     retry_after: Optional[datetime] = None
     published_ids: list[UUID] = field(default_factory=list)
+    telemetry: Optional[PipelineTelemetry] = None
+    run_id: Optional[str] = None
@@ -3,7 +3,8 @@
 Provides access to YouTube Data API v3 and transcript extraction with:
     - YouTubeClient: YouTube Data API v3 client
     - TranscriptClient: YouTube transcript extraction client
-    - QuotaTracker: Daily quota management
+    - QuotaTracker: Daily quota management (in-process)
+    - RedisQuotaTracker: Daily quota ledger shared across workers
 
 ALL API calls go through retry middleware - NEVER make direct calls.
 
@@ -15,9 +16,14 @@ Usage:
     videos = await client.search_videos("mushroom supplements", published_after)
 """
 
+import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Optional, Any
+from dataclasses import replace
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Optional, Any
+from zoneinfo import ZoneInfo
+
+from teams.dawo.middleware.telemetry import record_call, telemetry_event_hooks
 
 from .config import (
     YouTubeClientConfig,
@@ -25,12 +31,18 @@ from .config import (
     YOUTUBE_DAILY_QUOTA,
     SEARCH_QUOTA_COST,
     VIDEO_QUOTA_COST,
+    QUOTA_KEY_PREFIX,
+    QUOTA_KEY_TTL_SECONDS,
 )
 from .schemas import TranscriptResult
+from .transcript_cache import TranscriptCache
 
 # Import youtube-transcript-api for transcript extraction
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 
+if TYPE_CHECKING:
+    import redis.asyncio as redis
+
 
 # Module logger
 logger = logging.getLogger(__name__)
@@ -38,6 +50,9 @@ logger = logging.getLogger(__name__)
 # YouTube API endpoints
 YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
 
+# YouTube resets the daily quota at midnight Pacific Time
+QUOTA_RESET_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
 
 class YouTubeAPIError(Exception):
     """Exception raised for YouTube API errors.
@@ -132,6 +147,21 @@ class QuotaTracker:
         self._maybe_reset()
         return self.DAILY_LIMIT - self._used_today
 
+    async def reserve(self, cost: int) -> None:
+        """Consume quota before an API call (async form of check_and_use).
+
+        Args:
+            cost: Quota units to consume
+
+        Raises:
+            QuotaExhaustedError: If operation would exceed daily quota
+        """
+        self.check_and_use(cost)
+
+    async def remaining(self) -> int:
+        """Get remaining quota units for today (async form of get_remaining)."""
+        return self.get_remaining()
+
     def _maybe_reset(self) -> None:
         """Reset counter if new day (Pacific Time - YouTube's reset timezone)."""
         today = datetime.now(timezone.utc).date()
@@ -141,6 +171,101 @@ class QuotaTracker:
             self._reset_date = today
 
 
+class RedisQuotaTracker(QuotaTracker):
+    """YouTube quota ledger shared by every worker through Redis.
+
+    Usage is one integer key per Pacific-time quota day, so all processes
+    spend from the same 10,000 units and the ledger resets when YouTube's
+    does. Reservations are an atomic INCRBY; one that overshoots the limit
+    is rolled back and refused.
+
+    If Redis fails, the inherited in-process counter takes over, seeded
+    with the last shared usage seen, so scanning degrades rather than stops.
+
+    Attributes:
+        _redis: Async Redis client holding the ledger
+        _key_prefix: Prefix of the per-day usage keys
+    """
+
+    def __init__(
+        self,
+        redis_client: "redis.Redis",
+        key_prefix: str = QUOTA_KEY_PREFIX,
+    ) -> None:
+        """Initialize tracker with an injected Redis client.
+
+        Args:
+            redis_client: Async Redis client shared by all workers
+            key_prefix: Prefix of the per-day usage keys
+        """
+        super().__init__()
+        self._redis = redis_client
+        self._key_prefix = key_prefix
+
+    async def reserve(self, cost: int) -> None:
+        """Consume quota from the shared ledger before an API call.
+
+        Args:
+            cost: Quota units to consume
+
+        Raises:
+            QuotaExhaustedError: If operation would exceed daily quota
+        """
+        key = self._key(quota_day())
+        try:
+            used = await self._redis.incrby(key, cost)
+            if used == cost:
+                await self._redis.expire(key, QUOTA_KEY_TTL_SECONDS)
+            if used > self.DAILY_LIMIT:
+                await self._redis.decrby(key, cost)
+        except Exception as e:
+            logger.warning("Quota ledger unavailable, using local counter: %s", e)
+            self.check_and_use(cost)
+            return
+
+        if used > self.DAILY_LIMIT:
+            self._sync_local(used - cost)
+            raise QuotaExhaustedError(
+                f"Would exceed daily quota: {used} > {self.DAILY_LIMIT}",
+            )
+
+        self._sync_local(used)
+        logger.debug(f"Quota used: {used}/{self.DAILY_LIMIT} (shared)")
+
+    async def remaining(self) -> int:
+        """Get remaining shared quota units for today."""
+        try:
+            used = int(await self._redis.get(self._key(quota_day())) or 0)
+        except Exception as e:
+            logger.warning("Quota ledger unavailable, using local counter: %s", e)
+            return self.get_remaining()
+
+        self._sync_local(used)
+        return max(0, self.DAILY_LIMIT - used)
+
+    def _key(self, day: date) -> str:
+        """Ledger key for a quota day."""
+        return f"{self._key_prefix}:{day.isoformat()}"
+
+    def _sync_local(self, used: int) -> None:
+        """Mirror shared usage into the local fallback counter."""
+        self._maybe_reset()
+        self._used_today = min(used, self.DAILY_LIMIT)
+
+
+def quota_day(now: Optional[datetime] = None) -> date:
+    """Current YouTube quota day (the date in Pacific Time).
+
+    Args:
+        now: Timezone-aware instant (default: current time)
+
+    Returns:
+        Quota day the instant belongs to
+    """
+    now = now or datetime.now(timezone.utc)
+    return now.astimezone(QUOTA_RESET_TIMEZONE).date()
+
+
 class YouTubeClient:
     """YouTube Data API v3 client.
 
@@ -174,7 +299,8 @@ class YouTubeClient:
         Args:
             config: YouTube API credentials (from environment)
             retry_middleware: Retry middleware for API calls
-            quota_tracker: Optional shared quota tracker
+            quota_tracker: Optional quota tracker; pass a RedisQuotaTracker
+                to share the daily budget across workers
         """
         self._config = config
         self._retry = retry_middleware
@@ -184,7 +310,9 @@ class YouTubeClient:
     async def __aenter__(self) -> "YouTubeClient":
         """Async context manager entry."""
         import httpx
-        self._session = httpx.AsyncClient(timeout=30.0)
+        self._session = httpx.AsyncClient(
+            timeout=30.0, event_hooks=telemetry_event_hooks()
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -218,7 +346,7 @@ class YouTubeClient:
         )
 
         # Check and consume quota
-        self._quota.check_and_use(self.SEARCH_COST)
+        await self._quota.reserve(self.SEARCH_COST)
 
         url = f"{YOUTUBE_API_BASE}/search"
         params = {
@@ -235,7 +363,9 @@ class YouTubeClient:
         async def make_request() -> dict:
             if not self._session:
                 import httpx
-                self._session = httpx.AsyncClient(timeout=30.0)
+                self._session = httpx.AsyncClient(
+                    timeout=30.0, event_hooks=telemetry_event_hooks()
+                )
 
             response = await self._session.get(url, params=params)
             response.raise_for_status()
@@ -282,7 +412,7 @@ class YouTubeClient:
         logger.debug(f"Fetching statistics for {len(batch_ids)} videos")
 
         # Check and consume quota
-        self._quota.check_and_use(quota_cost)
+        await self._quota.reserve(quota_cost)
 
         url = f"{YOUTUBE_API_BASE}/videos"
         params = {
@@ -294,7 +424,9 @@ class YouTubeClient:
         async def make_request() -> dict:
             if not self._session:
                 import httpx
-                self._session = httpx.AsyncClient(timeout=30.0)
+                self._session = httpx.AsyncClient(
+                    timeout=30.0, event_hooks=telemetry_event_hooks()
+                )
 
             response = await self._session.get(url, params=params)
             response.raise_for_status()
@@ -324,9 +456,13 @@ class YouTubeClient:
 
     @property
     def quota_remaining(self) -> int:
-        """Get remaining quota units for today."""
+        """Get remaining quota units for today, as last seen by this process."""
         return self._quota.get_remaining()
 
+    async def get_quota_remaining(self) -> int:
+        """Get remaining quota units for today from the quota ledger."""
+        return await self._quota.remaining()
+
 
 class TranscriptClient:
     """YouTube transcript extraction client.
@@ -334,24 +470,37 @@ class TranscriptClient:
     Uses youtube-transcript-api package for transcript retrieval.
     Prefers manual captions over auto-generated when available.
 
+    The underlying package is blocking, so downloads run in worker threads,
+    at most config.max_concurrent_fetches at a time. Concurrent requests for
+    the same video share one download, and with a TranscriptCache injected
+    each transcript is downloaded once and served from disk afterwards.
+
     Attributes:
         _config: Transcript configuration
         _retry: Retry middleware for API calls
+        _cache: Optional on-disk transcript cache
+        _semaphore: Bounds concurrent downloads
+        _inflight: (video_id, languages) -> download shared by waiters
     """
 
     def __init__(
         self,
         config: TranscriptConfig,
         retry_middleware: Any,  # RetryMiddleware type
+        cache: Optional[TranscriptCache] = None,
     ):
         """Initialize transcript client with injected dependencies.
 
         Args:
             config: Transcript extraction settings
             retry_middleware: Retry middleware for API calls
+            cache: Optional on-disk cache so transcripts are fetched once
         """
         self._config = config
         self._retry = retry_middleware
+        self._cache = cache
+        self._semaphore = asyncio.Semaphore(config.max_concurrent_fetches)
+        self._inflight: dict[tuple[str, tuple[str, ...]], asyncio.Future] = {}
 
     async def get_transcript(
         self,
@@ -366,9 +515,63 @@ class TranscriptClient:
 
         Returns:
             TranscriptResult with text and metadata
+
+        Raises:
+            TranscriptError: If extraction fails unexpectedly
         """
         languages = languages or self._config.preferred_languages
 
+        if self._cache is not None:
+            cached = await self._cache.get(video_id, languages)
+            if cached is not None:
+                return self._truncate(cached)
+
+        key = (video_id, tuple(languages))
+        download = self._inflight.get(key)
+        if download is None:
+            download = asyncio.ensure_future(self._download(video_id, languages))
+            self._inflight[key] = download
+            download.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so one cancelled waiter does not cancel the shared download
+        return self._truncate(await asyncio.shield(download))
+
+    async def _download(
+        self,
+        video_id: str,
+        languages: list[str],
+    ) -> TranscriptResult:
+        """Download a full transcript (bounded) and cache it.
+
+        Args:
+            video_id: YouTube video ID
+            languages: Preferred languages
+
+        Returns:
+            Untruncated TranscriptResult
+        """
+        async with self._semaphore:
+            result = await asyncio.to_thread(self._fetch, video_id, languages)
+        # youtube-transcript-api hides the wire; count the decoded transcript
+        record_call(len(result.text.encode("utf-8")))
+
+        if self._cache is not None:
+            await self._cache.put(video_id, result)
+        return result
+
+    def _fetch(self, video_id: str, languages: list[str]) -> TranscriptResult:
+        """Fetch a transcript with youtube-transcript-api (blocking).
+
+        Args:
+            video_id: YouTube video ID
+            languages: Preferred languages
+
+        Returns:
+            Untruncated TranscriptResult
+
+        Raises:
+            TranscriptError: If extraction fails unexpectedly
+        """
         logger.debug(f"Extracting transcript for video {video_id} (languages={languages})")
 
         try:
@@ -399,11 +602,6 @@ class TranscriptClient:
                 last_seg = segments[-1]
                 duration_seconds = int(last_seg["start"] + last_seg["duration"])
 
-            # Truncate if exceeds max length
-            if len(full_text) > self._config.max_transcript_length:
-                full_text = full_text[: self._config.max_transcript_length]
-                logger.debug(f"Truncated transcript to {self._config.max_transcript_length} chars")
-
             return TranscriptResult(
                 text=full_text,
                 language=transcript.language_code,
@@ -431,3 +629,10 @@ class TranscriptClient:
         except Exception as e:
             logger.error(f"Transcript extraction failed for {video_id}: {e}")
             raise TranscriptError(f"Failed to extract transcript: {e}") from e
+
+    def _truncate(self, result: TranscriptResult) -> TranscriptResult:
+        """Apply max_transcript_length to a (possibly cached) transcript."""
+        if len(result.text) <= self._config.max_transcript_length:
+            return result
+        logger.debug(f"Truncated transcript to {self._config.max_transcript_length} chars")
+        return replace(result, text=result.text[: self._config.max_transcript_length])
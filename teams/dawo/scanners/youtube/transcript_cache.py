@@ -0,0 +1,243 @@
+"""Compressed on-disk cache of YouTube transcripts.
+
+A published video's captions never change, yet every run that re-discovers
+a video re-downloads its transcript. TranscriptCache keeps each fetched
+transcript on local disk so it is downloaded once per deployment.
+
+Storage:
+- One file per (video id, language): <dir>/<id[:2]>/<id>.<language>.json.<codec>
+- Compressed with zstd when the zstandard package is installed, gzip
+  otherwise; the file suffix records the codec so either can be read back
+- Full (untruncated) text is stored; callers truncate on read
+- Files are written to a temp name and renamed, so readers never see
+  partial entries
+
+Eviction is size-based and least-recently-used: hits refresh a file's
+mtime, and once the directory exceeds max_bytes the oldest files are
+removed. Only available transcripts are cached - a missing transcript may
+appear later (auto-captions are generated after upload).
+
+Architecture Compliance:
+- Directory and size budget injected via constructor
+- Disk I/O runs in worker threads; failures are logged and degrade to a
+  normal fetch
+
+Usage:
+    cache = TranscriptCache("/var/cache/dawo/transcripts")
+    client = TranscriptClient(config, retry, cache=cache)
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+from .config import DEFAULT_TRANSCRIPT_CACHE_MAX_BYTES
+from .schemas import TranscriptResult
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional; gzip is always available
+    zstandard = None  # type: ignore[assignment]
+
+
+# Module logger
+logger = logging.getLogger(__name__)
+
+GZIP_SUFFIX = ".json.gz"
+ZSTD_SUFFIX = ".json.zst"
+ZSTD_LEVEL = 10  # Transcripts are written once and read many times
+
+
+class TranscriptCache:
+    """Size-bounded, compressed transcript store keyed by video and language.
+
+    Attributes:
+        _directory: Cache root directory
+        _max_bytes: Total compressed size kept before LRU eviction
+        _index: Path -> (size, last access) for every cached file
+        _total_bytes: Sum of indexed file sizes
+        _lock: Guards the index across worker threads
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: int = DEFAULT_TRANSCRIPT_CACHE_MAX_BYTES,
+    ) -> None:
+        """Open (or create) the cache directory.
+
+        Args:
+            directory: Cache root directory
+            max_bytes: Total compressed size kept before eviction
+
+        Raises:
+            ValueError: If max_bytes is not positive
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be > 0, got {max_bytes}")
+
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+        self._index: Optional[dict[Path, tuple[int, float]]] = None
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    async def get(
+        self,
+        video_id: str,
+        languages: Sequence[str],
+    ) -> Optional[TranscriptResult]:
+        """Return a cached transcript in the first available language.
+
+        Args:
+            video_id: YouTube video ID
+            languages: Acceptable language codes, in preference order
+
+        Returns:
+            Cached TranscriptResult, or None on a miss or read failure
+        """
+        try:
+            return await asyncio.to_thread(self._get_sync, video_id, list(languages))
+        except Exception as e:
+            logger.warning("Transcript cache read failed for %s: %s", video_id, e)
+            return None
+
+    async def put(self, video_id: str, result: TranscriptResult) -> None:
+        """Store an available transcript.
+
+        Args:
+            video_id: YouTube video ID
+            result: Fetched transcript (ignored unless available)
+        """
+        if not result.available or not result.language:
+            return
+        try:
+            await asyncio.to_thread(self._put_sync, video_id, result)
+        except Exception as e:
+            logger.warning("Transcript cache write failed for %s: %s", video_id, e)
+
+    @property
+    def total_bytes(self) -> int:
+        """Compressed bytes currently cached."""
+        with self._lock:
+            self._ensure_index()
+            return self._total_bytes
+
+    def _get_sync(self, video_id: str, languages: list[str]) -> Optional[TranscriptResult]:
+        """Read the first cached language file for a video."""
+        for language in languages:
+            for suffix in (ZSTD_SUFFIX, GZIP_SUFFIX):
+                path = self._path(video_id, language, suffix)
+                try:
+                    raw = path.read_bytes()
+                except FileNotFoundError:
+                    continue
+                payload = json.loads(self._decompress(raw, suffix))
+                self._touch(path)
+                logger.debug("Transcript cache hit for %s (%s)", video_id, language)
+                return TranscriptResult(
+                    text=payload["text"],
+                    language=payload["language"],
+                    is_auto_generated=payload.get("is_auto_generated", False),
+                    available=True,
+                    duration_seconds=payload.get("duration_seconds", 0),
+                )
+        return None
+
+    def _put_sync(self, video_id: str, result: TranscriptResult) -> None:
+        """Compress and atomically write one transcript, then evict."""
+        suffix = ZSTD_SUFFIX if zstandard is not None else GZIP_SUFFIX
+        path = self._path(video_id, result.language or "", suffix)
+        data = self._compress(
+            json.dumps({
+                "text": result.text,
+                "language": result.language,
+                "is_auto_generated": result.is_auto_generated,
+                "duration_seconds": result.duration_seconds,
+            }).encode("utf-8"),
+            suffix,
+        )
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            self._ensure_index()
+            previous = self._index.get(path)
+            if previous is not None:
+                self._total_bytes -= previous[0]
+            self._index[path] = (len(data), path.stat().st_mtime)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def _path(self, video_id: str, language: str, suffix: str) -> Path:
+        """File path of a (video, language) entry."""
+        safe_id = "".join(c for c in video_id if c.isalnum() or c in "-_")
+        safe_language = "".join(c for c in language if c.isalnum() or c in "-_")
+        return self._directory / safe_id[:2] / f"{safe_id}.{safe_language}{suffix}"
+
+    def _touch(self, path: Path) -> None:
+        """Mark an entry as recently used."""
+        try:
+            os.utime(path)
+        except OSError:
+            return
+        with self._lock:
+            if self._index is not None and path in self._index:
+                self._index[path] = (self._index[path][0], path.stat().st_mtime)
+
+    def _ensure_index(self) -> None:
+        """Build the size index from disk on first use (lock held)."""
+        if self._index is not None:
+            return
+        self._index = {}
+        self._total_bytes = 0
+        if not self._directory.exists():
+            return
+        for path in self._directory.glob("*/*.json.*"):
+            if not path.name.endswith((GZIP_SUFFIX, ZSTD_SUFFIX)):
+                continue
+            stat = path.stat()
+            self._index[path] = (stat.st_size, stat.st_mtime)
+            self._total_bytes += stat.st_size
+
+    def _evict(self) -> None:
+        """Remove least-recently-used entries beyond max_bytes (lock held)."""
+        if self._total_bytes <= self._max_bytes:
+            return
+        for path, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= self._max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            del self._index[path]
+            self._total_bytes -= size
+            logger.debug("Evicted cached transcript %s", path.name)
+
+    @staticmethod
+    def _compress(data: bytes, suffix: str) -> bytes:
+        """Compress with the codec named by suffix."""
+        if suffix == ZSTD_SUFFIX:
+            return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        return gzip.compress(data)
+
+    @staticmethod
+    def _decompress(data: bytes, suffix: str) -> bytes:
+        """Decompress with the codec named by suffix."""
+        if suffix == ZSTD_SUFFIX:
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read .zst transcripts")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
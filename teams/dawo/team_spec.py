@@ -169,6 +169,10 @@ from teams.dawo.generators.auto_publish_tagger.statistics import AutoPublishStat
 from teams.dawo.generators.asset_usage.agent import AssetUsageTracker
 from teams.dawo.generators.asset_usage.repository import AssetUsageRepository
 
+# Process-pool batch execution for CPU-bound backfills
+# Use direct module import to avoid circular import with teams.dawo.middleware
+from teams.dawo.middleware.process_pool import ProcessBatchExecutor
+
 # Tier values - use these string constants for type safety
 # These map to TaskType enum values in teams.dawo.config.llm_tiers
 TIER_SCAN = "scan"          # → Haiku (high-volume, fast)
@@ -554,4 +558,14 @@ SERVICES: list[RegisteredService] = [
         capabilities=["asset_tracking", "usage_storage"],
         requires_session=False,  # In-memory storage, future database persistence via Protocol
     ),
+    # Process-pool batch execution (backfills)
+    # Injected as batch_executor into EUComplianceChecker, BrandVoiceValidator,
+    # NewsCategorizer and ResearchItemScorer for backfill jobs only; request
+    # handlers keep running their checks inline
+    RegisteredService(
+        name="process_batch_executor",
+        service_class=ProcessBatchExecutor,
+        capabilities=["cpu_batch", "backfill"],
+        requires_session=False,  # Receives max_workers and chunk_size via injection
+    ),
 ]
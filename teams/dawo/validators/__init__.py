@@ -5,6 +5,9 @@ Validator agents ensure content meets requirements:
 - Brand voice consistency
 - Research compliance validation (Story 2.8)
 
+EU compliance and brand voice verdicts can be cached (VerdictCache) so
+unchanged content is not re-validated.
+
 All validators operate at the 'generate' tier (defaults to sonnet for accurate judgment).
 
 LLMClient Protocol:
@@ -28,6 +31,8 @@ from .eu_compliance import (
     RegulationRef,
     LLMClient,
     ComplianceScoring,
+    ValidationSnapshot,
+    split_sentences,
 )
 
 from .brand_voice import (
@@ -42,6 +47,13 @@ from .brand_voice import (
     validate_profile,
 )
 
+from .verdict_cache import (
+    VerdictCache,
+    VerdictCacheStats,
+    VERDICT_CACHE_KEY_PREFIX,
+    config_fingerprint,
+)
+
 from .research_compliance import (
     ResearchComplianceValidator,
     ValidatedResearch,
@@ -62,6 +74,8 @@ __all__: list[str] = [
     "NovelFoodCheck",
     "RegulationRef",
     "ComplianceScoring",
+    "ValidationSnapshot",
+    "split_sentences",
     # Shared protocol (identical in both modules, exported from eu_compliance)
     "LLMClient",
     # Brand Voice exports
@@ -75,6 +89,11 @@ __all__: list[str] = [
     "BrandProfile",
     "TonePillar",
     "validate_profile",
+    # Verdict cache
+    "VerdictCache",
+    "VerdictCacheStats",
+    "VERDICT_CACHE_KEY_PREFIX",
+    "config_fingerprint",
     # Research Compliance exports (Story 2.8)
     "ResearchComplianceValidator",
     "ValidatedResearch",
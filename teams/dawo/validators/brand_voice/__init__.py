@@ -15,6 +15,8 @@ Exports:
     BrandProfile: Typed brand profile configuration (from profile.py)
     TonePillar: Single tone pillar configuration (from profile.py)
     validate_profile: Profile validation utility (from profile.py)
+    TermIndex: Forbidden terms and tone markers compiled for one-pass scans (from terms.py)
+    TermScan: Term hits of one piece of content (from terms.py)
 """
 
 from .agent import (
@@ -33,6 +35,11 @@ from .profile import (
     validate_profile,
 )
 
+from .terms import (
+    TermIndex,
+    TermScan,
+)
+
 __all__: list[str] = [
     # Core validator
     "BrandVoiceValidator",
@@ -48,4 +55,7 @@ __all__: list[str] = [
     "BrandProfile",
     "TonePillar",
     "validate_profile",
+    # Term matching
+    "TermIndex",
+    "TermScan",
 ]
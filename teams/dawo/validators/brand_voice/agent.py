@@ -18,12 +18,24 @@ import re
 import json
 import logging
 
+from teams.dawo.middleware.llm_cache import template_id
+from teams.dawo.middleware.process_pool import ProcessBatchExecutor, WorkerSpec, map_batch
+
+from ..verdict_cache import VerdictCache, cached_verdict, config_fingerprint
 from .prompts import BRAND_SYSTEM_PROMPT, VALIDATION_PROMPT_TEMPLATE
 from .profile import validate_profile
+from .terms import TermIndex, TermScan, forbidden_group, tone_group
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
+# Verdict cache key component - changes whenever either prompt changes
+VALIDATION_TEMPLATE_ID = template_id(
+    "brand_voice.validation",
+    VALIDATION_PROMPT_TEMPLATE,
+    BRAND_SYSTEM_PROMPT,
+)
+
 # Scoring constants - extracted from magic numbers for clarity
 class ScoringWeights:
     """Constants for brand score calculations.
@@ -94,6 +106,7 @@ class BrandValidationResult:
     brand_score: float = 1.0  # 0.0-1.0 (1.0 = perfect brand alignment)
     authenticity_score: float = 1.0  # 0.0-1.0 (1.0 = very human, 0.0 = very AI)
     tone_analysis: dict = field(default_factory=lambda: {"warm": 0.5, "educational": 0.5, "nordic": 0.5})
+    llm_failed: bool = False  # LLM analysis requested but failed - pattern-only verdict
 
 
 class LLMClient(Protocol):
@@ -131,12 +144,16 @@ class BrandVoiceValidator:
     Attributes:
         profile: Brand profile dictionary containing tone rules and patterns
         llm_client: Optional LLM client for enhanced analysis
+        verdict_cache: Optional cache for repeated content validations
+        batch_executor: Optional worker processes for pattern-only batches
     """
 
     def __init__(
         self,
         brand_profile: dict,
-        llm_client: Optional[LLMClient] = None
+        llm_client: Optional[LLMClient] = None,
+        verdict_cache: Optional[VerdictCache] = None,
+        batch_executor: Optional[ProcessBatchExecutor] = None
     ):
         """Initialize with brand profile configuration.
 
@@ -145,6 +162,11 @@ class BrandVoiceValidator:
                           Injected by Team Builder - NEVER load from file directly.
             llm_client: Optional LLM client for enhanced tone analysis.
                        When provided, enables LLM-based nuanced judgment.
+            verdict_cache: Optional verdict cache. Re-validating identical
+                          content returns the earlier BrandValidationResult
+                          until the brand profile or prompts change.
+            batch_executor: Optional process pool for validate_patterns_batch().
+                           Without one, batches run on the event loop.
 
         Raises:
             ValueError: If brand_profile is missing required keys.
@@ -156,6 +178,9 @@ class BrandVoiceValidator:
 
         self.profile = brand_profile
         self.llm_client = llm_client
+        self.verdict_cache = verdict_cache
+        self.batch_executor = batch_executor
+        self._verdict_fingerprint = config_fingerprint(brand_profile, VALIDATION_TEMPLATE_ID)
 
         # Extract configuration elements
         self.tone_pillars = brand_profile.get("tone_pillars", {})
@@ -167,6 +192,9 @@ class BrandVoiceValidator:
             "fail": 0.0
         })
 
+        # Forbidden terms and tone markers compiled once for single-pass scans
+        self._term_index = TermIndex.from_profile(brand_profile)
+
     async def validate_content(
         self,
         content: str,
@@ -177,47 +205,100 @@ class BrandVoiceValidator:
         Evaluates content for DAWO brand voice alignment and authenticity.
         When an LLM client is available, performs enhanced tone analysis.
 
+        With a verdict cache, content already validated under the same brand
+        profile, EU compliance findings and LLM mode is answered from the cache.
+
         Args:
             content: Text content to validate for brand alignment
             eu_compliance_result: Optional EU compliance result to avoid duplicating
                                  medicinal term detection. If provided and contains
                                  flagged_phrases, those are used instead of re-scanning.
 
+        Returns:
+            BrandValidationResult with overall status and flagged issues
+        """
+        return await cached_verdict(
+            self.verdict_cache,
+            "brand_voice",
+            self._verdict_fingerprint,
+            content,
+            lambda: self._validate_content(content, eu_compliance_result),
+            params={
+                "use_llm": self.llm_client is not None,
+                "eu_phrases": self._eu_flagged_phrases(eu_compliance_result),
+            },
+            cacheable=lambda result: not result.llm_failed,
+        )
+
+    @staticmethod
+    def _eu_flagged_phrases(eu_compliance_result: Optional[object]) -> Optional[list[str]]:
+        """Phrases of an EU compliance result, as they affect the verdict.
+
+        Args:
+            eu_compliance_result: Optional EU compliance check result
+
+        Returns:
+            Flagged phrases, or None when the validator would scan itself
+        """
+        try:
+            flagged_phrases = getattr(eu_compliance_result, 'flagged_phrases', None)
+            phrases = [getattr(flagged, 'phrase', str(flagged)) for flagged in flagged_phrases or []]
+        except Exception:
+            return None
+        return phrases or None
+
+    async def _validate_content(
+        self,
+        content: str,
+        eu_compliance_result: Optional[object] = None
+    ) -> BrandValidationResult:
+        """Run the validation (validate_content without the verdict cache).
+
+        Args:
+            content: Text content to validate for brand alignment
+            eu_compliance_result: Optional EU compliance result
+
         Returns:
             BrandValidationResult with overall status and flagged issues
         """
         issues: list[BrandIssue] = []
+        llm_failed = False
+
+        # One pass finds every forbidden term and tone marker
+        scan = self._term_index.scan(content)
 
         # Phase 1: Pattern-based detection (fast path)
         # Cross-reference with EU Compliance results if available to avoid duplicate work
         medicinal_issues = self._check_medicinal_terms_with_eu_context(
-            content, eu_compliance_result
+            content, eu_compliance_result, scan
         )
         issues.extend(medicinal_issues)
 
         ai_generic_issues = self._check_ai_generic_patterns(content)
         issues.extend(ai_generic_issues)
 
-        superlative_issues = self._check_superlatives(content)
+        superlative_issues = self._check_superlatives(content, scan)
         issues.extend(superlative_issues)
 
-        sales_issues = self._check_sales_pressure(content)
+        sales_issues = self._check_sales_pressure(content, scan)
         issues.extend(sales_issues)
 
         # Phase 2: Tone analysis
-        tone_analysis = self._analyze_tone(content)
+        tone_analysis = self._analyze_tone(content, scan)
 
         # Phase 3: LLM-enhanced analysis (when available)
         if self.llm_client:
             try:
                 llm_issues = await self._llm_enhanced_analysis(content)
+                llm_failed = llm_issues is None
                 # Merge LLM findings, avoiding duplicates
                 existing_phrases = {i.phrase.lower() for i in issues}
-                for issue in llm_issues:
+                for issue in llm_issues or []:
                     if issue.phrase.lower() not in existing_phrases:
                         issues.append(issue)
             except Exception as e:
                 # Fail gracefully - pattern matching still works
+                llm_failed = True
                 logger.warning(f"LLM-enhanced analysis failed, using pattern matching only: {e}")
 
         # Calculate scores
@@ -232,7 +313,8 @@ class BrandVoiceValidator:
             issues=issues,
             brand_score=brand_score,
             authenticity_score=authenticity_score,
-            tone_analysis=tone_analysis
+            tone_analysis=tone_analysis,
+            llm_failed=llm_failed
         )
 
     def validate_content_sync(self, content: str) -> BrandValidationResult:
@@ -248,21 +330,24 @@ class BrandVoiceValidator:
         """
         issues: list[BrandIssue] = []
 
+        # One pass finds every forbidden term and tone marker
+        scan = self._term_index.scan(content)
+
         # Pattern-based detection
-        medicinal_issues = self._check_medicinal_terms(content)
+        medicinal_issues = self._check_medicinal_terms(content, scan)
         issues.extend(medicinal_issues)
 
         ai_generic_issues = self._check_ai_generic_patterns(content)
         issues.extend(ai_generic_issues)
 
-        superlative_issues = self._check_superlatives(content)
+        superlative_issues = self._check_superlatives(content, scan)
         issues.extend(superlative_issues)
 
-        sales_issues = self._check_sales_pressure(content)
+        sales_issues = self._check_sales_pressure(content, scan)
         issues.extend(sales_issues)
 
         # Tone analysis
-        tone_analysis = self._analyze_tone(content)
+        tone_analysis = self._analyze_tone(content, scan)
 
         # Calculate scores
         brand_score = self._calculate_brand_score(issues, tone_analysis)
@@ -279,44 +364,65 @@ class BrandVoiceValidator:
             tone_analysis=tone_analysis
         )
 
-    def _check_medicinal_terms(self, content: str) -> list[BrandIssue]:
+    async def validate_patterns_batch(self, contents: list[str]) -> list[BrandValidationResult]:
+        """Pattern-only validation of many contents, for backfills.
+
+        Runs validate_content_sync() per content on the injected batch
+        executor's worker processes, so the event loop stays free. Without
+        an executor the validations run inline, yielding between chunks.
+
+        Args:
+            contents: Text contents to validate
+
+        Returns:
+            BrandValidationResult per content, in input order
+        """
+        return await map_batch(self.batch_executor, self, "validate_content_sync", contents)
+
+    def worker_spec(self) -> WorkerSpec:
+        """Rebuild this validator (profile only, no clients) in a worker process."""
+        return WorkerSpec(BrandVoiceValidator, (self.profile,))
+
+    def _check_medicinal_terms(
+        self,
+        content: str,
+        scan: Optional[TermScan] = None
+    ) -> list[BrandIssue]:
         """Check for forbidden medicinal terminology.
 
         Args:
             content: Text content to check
+            scan: Term scan of content (scanned here if not given)
 
         Returns:
             List of BrandIssue for each medicinal term found
         """
         issues = []
-        content_lower = content.lower()
-
-        medicinal_terms = self.forbidden_terms.get("medicinal", [])
-        for term in medicinal_terms:
-            # Use word boundary matching
-            pattern = r'\b' + re.escape(term.lower()) + r'\b'
-            matches = re.finditer(pattern, content_lower)
-
-            for match in matches:
-                # Extract surrounding context
-                start = max(0, match.start() - 15)
-                end = min(len(content), match.end() + 15)
-                context = content[start:end].strip()
-
-                issues.append(BrandIssue(
-                    phrase=context,
-                    issue_type=IssueType.MEDICINAL_TERM,
-                    severity="high",
-                    suggestion=self._get_medicinal_suggestion(term),
-                    explanation=f"Medicinal term '{term}' is forbidden. Use wellness/lifestyle language instead."
-                ))
+        if scan is None:
+            scan = self._term_index.scan(content)
+
+        # Word-boundary matches, in term order then position order
+        for term, match_start, match_end in scan.hits(forbidden_group("medicinal")):
+            # Extract surrounding context
+            start = max(0, match_start - 15)
+            end = min(len(content), match_end + 15)
+            context = content[start:end].strip()
+
+            issues.append(BrandIssue(
+                phrase=context,
+                issue_type=IssueType.MEDICINAL_TERM,
+                severity="high",
+                suggestion=self._get_medicinal_suggestion(term),
+                explanation=f"Medicinal term '{term}' is forbidden. Use wellness/lifestyle language instead."
+            ))
 
         return issues
 
     def _check_medicinal_terms_with_eu_context(
         self,
         content: str,
-        eu_compliance_result: Optional[object] = None
+        eu_compliance_result: Optional[object] = None,
+        scan: Optional[TermScan] = None
     ) -> list[BrandIssue]:
         """Check for medicinal terms, cross-referencing EU compliance results.
 
@@ -327,6 +433,7 @@ class BrandVoiceValidator:
         Args:
             content: Text content to check
             eu_compliance_result: Optional EU compliance check result
+            scan: Term scan of content (scanned here if not given)
 
         Returns:
             List of BrandIssue for medicinal terms found
@@ -359,7 +466,7 @@ class BrandVoiceValidator:
                 )
 
         # Fall back to pattern-based detection
-        return self._check_medicinal_terms(content)
+        return self._check_medicinal_terms(content, scan)
 
     def _check_ai_generic_patterns(self, content: str) -> list[BrandIssue]:
         """Check for AI-generic writing patterns.
@@ -399,74 +506,81 @@ class BrandVoiceValidator:
 
         return issues
 
-    def _check_superlatives(self, content: str) -> list[BrandIssue]:
+    def _check_superlatives(
+        self,
+        content: str,
+        scan: Optional[TermScan] = None
+    ) -> list[BrandIssue]:
         """Check for forbidden superlatives.
 
         Args:
             content: Text content to check
+            scan: Term scan of content (scanned here if not given)
 
         Returns:
             List of BrandIssue for each superlative found
         """
         issues = []
-        content_lower = content.lower()
-
-        superlatives = self.forbidden_terms.get("superlatives", [])
-        for term in superlatives:
-            pattern = r'\b' + re.escape(term.lower()) + r'\b'
-            matches = re.finditer(pattern, content_lower)
-
-            for match in matches:
-                start = max(0, match.start() - 10)
-                end = min(len(content), match.end() + 10)
-                context = content[start:end].strip()
-
-                issues.append(BrandIssue(
-                    phrase=context,
-                    issue_type=IssueType.STYLE_VIOLATION,
-                    severity="medium",
-                    suggestion="Use understated confidence. DAWO doesn't need superlatives - let the product speak for itself.",
-                    explanation=f"Superlative '{term}' violates Nordic simplicity. DAWO uses understated confidence."
-                ))
+        if scan is None:
+            scan = self._term_index.scan(content)
+
+        for term, match_start, match_end in scan.hits(forbidden_group("superlatives")):
+            start = max(0, match_start - 10)
+            end = min(len(content), match_end + 10)
+            context = content[start:end].strip()
+
+            issues.append(BrandIssue(
+                phrase=context,
+                issue_type=IssueType.STYLE_VIOLATION,
+                severity="medium",
+                suggestion="Use understated confidence. DAWO doesn't need superlatives - let the product speak for itself.",
+                explanation=f"Superlative '{term}' violates Nordic simplicity. DAWO uses understated confidence."
+            ))
 
         return issues
 
-    def _check_sales_pressure(self, content: str) -> list[BrandIssue]:
+    def _check_sales_pressure(
+        self,
+        content: str,
+        scan: Optional[TermScan] = None
+    ) -> list[BrandIssue]:
         """Check for sales pressure language.
 
         Args:
             content: Text content to check
+            scan: Term scan of content (scanned here if not given)
 
         Returns:
             List of BrandIssue for each sales pressure term found
         """
         issues = []
-        content_lower = content.lower()
-
-        sales_terms = self.forbidden_terms.get("sales_pressure", [])
-        for term in sales_terms:
-            pattern = r'\b' + re.escape(term.lower()) + r'\b'
-            if re.search(pattern, content_lower):
-                issues.append(BrandIssue(
-                    phrase=term,
-                    issue_type=IssueType.TONE_MISMATCH,
-                    severity="medium",
-                    suggestion="Remove urgency language. DAWO is educational first, never salesy.",
-                    explanation=f"Sales pressure term '{term}' violates educational tone. Content should inform, not pressure."
-                ))
+        if scan is None:
+            scan = self._term_index.scan(content)
+
+        # One issue per term, however often it occurs
+        for term in scan.found_terms(forbidden_group("sales_pressure")):
+            issues.append(BrandIssue(
+                phrase=term,
+                issue_type=IssueType.TONE_MISMATCH,
+                severity="medium",
+                suggestion="Remove urgency language. DAWO is educational first, never salesy.",
+                explanation=f"Sales pressure term '{term}' violates educational tone. Content should inform, not pressure."
+            ))
 
         return issues
 
-    def _analyze_tone(self, content: str) -> dict:
+    def _analyze_tone(self, content: str, scan: Optional[TermScan] = None) -> dict:
         """Analyze content for DAWO tone pillars.
 
         Args:
             content: Text content to analyze
+            scan: Term scan of content (scanned here if not given)
 
         Returns:
             Dictionary with scores for warm, educational, nordic (0.0-1.0 each)
         """
-        content_lower = content.lower()
+        if scan is None:
+            scan = self._term_index.scan(content)
         tone_scores = {"warm": 0.5, "educational": 0.5, "nordic": 0.5}
 
         # Map pillar names to output keys (nordic_simplicity -> nordic)
@@ -482,20 +596,9 @@ class BrandVoiceValidator:
             if output_key not in tone_scores:
                 continue
 
-            positive_markers = config.get("positive_markers", [])
-            negative_markers = config.get("negative_markers", [])
-
-            # Count positive markers
-            positive_count = sum(
-                1 for marker in positive_markers
-                if re.search(r'\b' + re.escape(marker.lower()) + r'\b', content_lower)
-            )
-
-            # Count negative markers
-            negative_count = sum(
-                1 for marker in negative_markers
-                if re.search(r'\b' + re.escape(marker.lower()) + r'\b', content_lower)
-            )
+            # Count markers present in the content
+            positive_count = scan.terms_found(tone_group(pillar, positive=True))
+            negative_count = scan.terms_found(tone_group(pillar, positive=False))
 
             # Calculate score (start at 0.5, adjust based on markers)
             score = 0.5
@@ -612,14 +715,14 @@ class BrandVoiceValidator:
         else:
             return ValidationStatus.FAIL
 
-    async def _llm_enhanced_analysis(self, content: str) -> list[BrandIssue]:
+    async def _llm_enhanced_analysis(self, content: str) -> Optional[list[BrandIssue]]:
         """Use LLM for nuanced brand voice analysis.
 
         Args:
             content: Text content to analyze
 
         Returns:
-            List of BrandIssue from LLM analysis
+            List of BrandIssue from LLM analysis, or None if the LLM call failed
         """
         if not self.llm_client:
             return []
@@ -649,7 +752,7 @@ class BrandVoiceValidator:
 
         except Exception as e:
             logger.warning(f"LLM analysis request failed: {e}")
-            return []
+            return None
 
     def _parse_llm_response(self, response: str) -> list[BrandIssue]:
         """Parse LLM response into structured BrandIssues.
@@ -0,0 +1,186 @@
+"""Compiled term index for brand voice validation.
+
+The brand profile's forbidden terms (medicinal, superlatives, sales
+pressure) and tone-pillar markers are plain words and phrases matched on
+word boundaries. TermIndex compiles them once per profile so content is
+tokenized once per validation and every term group is found in that one
+pass, instead of one regex search per term.
+
+Hits are identical to searching r'\\b' + re.escape(term) + r'\\b' for every
+term in the lowercased content:
+- A term starting with a word character can only match at a token start
+  whose token equals the term's leading word, so candidates are found by
+  a dict lookup per token
+- A term starting with a non-word character can only match at a token end
+- Candidates are confirmed with startswith and an end-boundary check
+- Each term's hits are non-overlapping, like re.finditer per term
+
+Usage:
+    index = TermIndex.from_profile(brand_profile)
+    scan = index.scan(content)
+    for term, start, end in scan.hits(forbidden_group("medicinal")):
+        ...
+    found = scan.terms_found(tone_group("warm", positive=True))
+"""
+
+import re
+from typing import Iterable, Iterator
+
+# Forbidden term categories the validator checks
+FORBIDDEN_CATEGORIES = ("medicinal", "superlatives", "sales_pressure")
+
+_WORD = re.compile(r"\w+")
+
+
+def forbidden_group(category: str) -> str:
+    """Term group name of a forbidden_terms category."""
+    return f"forbidden:{category}"
+
+
+def tone_group(pillar: str, positive: bool) -> str:
+    """Term group name of a tone pillar's positive or negative markers."""
+    return f"{'positive' if positive else 'negative'}:{pillar}"
+
+
+def _at_word_boundary(text: str, pos: int) -> bool:
+    """Whether pos in text is a \\b word boundary."""
+    before = pos > 0 and _WORD.match(text, pos - 1) is not None
+    after = pos < len(text) and _WORD.match(text, pos) is not None
+    return before != after
+
+
+class TermScan:
+    """Term hits of one piece of content, by group.
+
+    Attributes:
+        _groups: Group name -> terms as configured
+        _hits: Group name -> term position -> (start, end) hits in order
+    """
+
+    def __init__(self, groups: dict[str, list[str]]) -> None:
+        """Initialize an empty scan over the index's groups."""
+        self._groups = groups
+        self._hits: dict[str, dict[int, list[tuple[int, int]]]] = {}
+
+    def add(self, group: str, index: int, start: int, end: int) -> None:
+        """Record a hit of the group's index-th term."""
+        self._hits.setdefault(group, {}).setdefault(index, []).append((start, end))
+
+    def hits(self, group: str) -> Iterator[tuple[str, int, int]]:
+        """Hits of a group's terms, in term order then position order.
+
+        Args:
+            group: Group name (forbidden_group() or tone_group())
+
+        Yields:
+            Tuples of (term as configured, start, end) with offsets into
+            the lowercased content
+        """
+        group_hits = self._hits.get(group, {})
+        for index in sorted(group_hits):
+            term = self._groups[group][index]
+            for start, end in group_hits[index]:
+                yield term, start, end
+
+    def found_terms(self, group: str) -> list[str]:
+        """The group's terms found at least once, in term order."""
+        return [self._groups[group][index] for index in sorted(self._hits.get(group, {}))]
+
+    def terms_found(self, group: str) -> int:
+        """Number of the group's terms found at least once."""
+        return len(self._hits.get(group, {}))
+
+
+class TermIndex:
+    """Brand profile terms compiled for single-pass matching.
+
+    Built from a snapshot of the profile; recompile after changing it.
+
+    Attributes:
+        _groups: Group name -> terms as configured
+        _entries: Lowercased term -> every (group, term position) using it
+        _by_token: Leading word of a term -> lowercased terms starting with it
+        _non_word_initial: Lowercased terms starting with a non-word character
+    """
+
+    def __init__(self, groups: dict[str, Iterable[str]]) -> None:
+        """Compile term groups.
+
+        Args:
+            groups: Group name -> terms. Empty terms are ignored.
+        """
+        self._groups = {name: list(terms) for name, terms in groups.items()}
+        self._entries: dict[str, list[tuple[str, int]]] = {}
+        for name, terms in self._groups.items():
+            for index, term in enumerate(terms):
+                if term:
+                    self._entries.setdefault(term.lower(), []).append((name, index))
+
+        self._by_token: dict[str, list[str]] = {}
+        self._non_word_initial: list[str] = []
+        for text in self._entries:
+            leading = _WORD.match(text)
+            if leading:
+                self._by_token.setdefault(leading.group(), []).append(text)
+            else:
+                self._non_word_initial.append(text)
+
+    @classmethod
+    def from_profile(cls, brand_profile: dict) -> "TermIndex":
+        """Compile a brand profile's forbidden terms and tone markers.
+
+        Args:
+            brand_profile: Brand profile dictionary (already validated)
+
+        Returns:
+            TermIndex with forbidden_group() and tone_group() groups
+        """
+        forbidden_terms = brand_profile.get("forbidden_terms", {})
+        groups: dict[str, Iterable[str]] = {
+            forbidden_group(category): forbidden_terms.get(category, [])
+            for category in FORBIDDEN_CATEGORIES
+        }
+        for pillar, config in brand_profile.get("tone_pillars", {}).items():
+            groups[tone_group(pillar, positive=True)] = config.get("positive_markers", [])
+            groups[tone_group(pillar, positive=False)] = config.get("negative_markers", [])
+        return cls(groups)
+
+    def scan(self, content: str) -> TermScan:
+        """Find every term of every group in content.
+
+        Args:
+            content: Text to scan (matched case-insensitively)
+
+        Returns:
+            TermScan with offsets into content.lower()
+        """
+        text = content.lower()
+        scan = TermScan(self._groups)
+        next_start: dict[str, int] = {}
+
+        def visit(pos: int, candidates: Iterable[str]) -> None:
+            for candidate in candidates:
+                end = pos + len(candidate)
+                if pos < next_start.get(candidate, 0):
+                    continue
+                if not text.startswith(candidate, pos) or not _at_word_boundary(text, end):
+                    continue
+                next_start[candidate] = end
+                for group, index in self._entries[candidate]:
+                    scan.add(group, index, pos, end)
+
+        # Token starts and ends in ascending order
+        for token in _WORD.finditer(text):
+            visit(token.start(), self._by_token.get(token.group(), ()))
+            if self._non_word_initial:
+                visit(token.end(), self._non_word_initial)
+        return scan
+
+
+__all__ = [
+    "FORBIDDEN_CATEGORIES",
+    "TermIndex",
+    "TermScan",
+    "forbidden_group",
+    "tone_group",
+]
@@ -13,6 +13,8 @@ Exports:
     RegulationRef: EU regulation reference constants
     LLMClient: Protocol for LLM client interface
     ComplianceScoring: Constants for score calculations
+    ValidationSnapshot: Per-sentence findings for incremental revalidation
+    split_sentences: Sentence splitter used by incremental checks
 """
 
 from .agent import (
@@ -26,6 +28,7 @@ from .agent import (
     LLMClient,
     ComplianceScoring,
 )
+from .incremental import ValidationSnapshot, split_sentences
 
 __all__: list[str] = [
     "EUComplianceChecker",
@@ -37,4 +40,6 @@ __all__: list[str] = [
     "RegulationRef",
     "LLMClient",
     "ComplianceScoring",
+    "ValidationSnapshot",
+    "split_sentences",
 ]
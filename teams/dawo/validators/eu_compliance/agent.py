@@ -15,15 +15,50 @@ The checker operates in two modes:
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Protocol
+import asyncio
 import logging
 import re
 
-from .prompts import COMPLIANCE_SYSTEM_PROMPT, CLASSIFICATION_PROMPT_TEMPLATE
+from teams.dawo.config import TaskType
+from teams.dawo.middleware.llm_cache import LLMResponseCache, cached_generate, template_id
+from teams.dawo.middleware.process_pool import ProcessBatchExecutor, WorkerSpec, map_batch
+
+from ..verdict_cache import VerdictCache, cached_verdict, config_fingerprint
+from .incremental import ValidationSnapshot, sentence_key, sentence_spans
+from .prompts import (
+    BATCH_CLASSIFICATION_PROMPT_TEMPLATE,
+    CLASSIFICATION_PROMPT_TEMPLATE,
+    COMPLIANCE_SYSTEM_PROMPT,
+    NO_FINDINGS_LINE,
+)
 from .rules import ComplianceRules
 
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Response cache key component - changes whenever either prompt changes
+CLASSIFICATION_TEMPLATE_ID = template_id(
+    "eu_compliance.classification",
+    CLASSIFICATION_PROMPT_TEMPLATE,
+    COMPLIANCE_SYSTEM_PROMPT,
+)
+BATCH_CLASSIFICATION_TEMPLATE_ID = template_id(
+    "eu_compliance.batch_classification",
+    BATCH_CLASSIFICATION_PROMPT_TEMPLATE,
+    COMPLIANCE_SYSTEM_PROMPT,
+)
+
+# Packed batch checks: contents per LLM prompt, and prompts in flight
+DEFAULT_PACK_SIZE = 8
+DEFAULT_PACK_CONCURRENCY = 4
+
+# Fields of one finding block in LLM responses
+_FINDING_FIELDS = ("PHRASE", "STATUS", "EXPLANATION", "REFERENCE")
+
+# Item header in packed prompts and responses ("ITEM: 3"); also accepts
+# "ITEM 3", "ITEM 3:" and "ITEM: 3:" from models that reformat it
+_PACKED_ITEM_HEADER = re.compile(r"^ITEM\s*:?\s*(\d+)\s*:?$", re.IGNORECASE)
+
 
 class ComplianceScoring:
     """Constants for compliance score calculations.
@@ -101,6 +136,7 @@ class ContentComplianceCheck:
     novel_food_check: Optional[NovelFoodCheck] = None
     compliance_score: float = 1.0  # 0.0-1.0, 1.0 = fully compliant
     llm_enhanced: bool = False  # Whether LLM was used for this check
+    llm_failed: bool = False  # LLM check requested but failed - pattern-only verdict
 
     @property
     def is_compliant(self) -> bool:
@@ -137,6 +173,26 @@ class LLMClient(Protocol):
         ...
 
 
+def _result_to_dict(result: ComplianceResult) -> dict[str, str]:
+    """Serialize a phrase result for a ValidationSnapshot."""
+    return {
+        "phrase": result.phrase,
+        "status": result.status.value,
+        "explanation": result.explanation,
+        "regulation_reference": result.regulation_reference,
+    }
+
+
+def _result_from_dict(data: dict[str, str]) -> ComplianceResult:
+    """Deserialize a phrase result stored in a ValidationSnapshot."""
+    return ComplianceResult(
+        phrase=data["phrase"],
+        status=ComplianceStatus(data["status"]),
+        explanation=data["explanation"],
+        regulation_reference=data["regulation_reference"],
+    )
+
+
 class EUComplianceChecker:
     """EU Health Claims Regulation compliance validator.
 
@@ -149,15 +205,24 @@ class EUComplianceChecker:
     1. Pattern-only mode (default): Fast regex-based checking
     2. LLM-enhanced mode: Uses LLM for nuanced classification when provided
 
+    Rule patterns are compiled once at construction into a single-pass
+    matcher (CompiledRules); build a new checker to pick up rule changes.
+
     Attributes:
         rules: ComplianceRules instance containing patterns and classifications
         llm_client: Optional LLM client for enhanced classification
+        response_cache: Optional cache for repeated LLM classifications
+        verdict_cache: Optional cache for repeated content checks
+        batch_executor: Optional worker processes for pattern-only batches
     """
 
     def __init__(
         self,
         compliance_rules: dict,
-        llm_client: Optional[LLMClient] = None
+        llm_client: Optional[LLMClient] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        verdict_cache: Optional[VerdictCache] = None,
+        batch_executor: Optional[ProcessBatchExecutor] = None
     ):
         """Initialize with compliance rules configuration.
 
@@ -166,9 +231,24 @@ class EUComplianceChecker:
                              Injected by Team Builder - NEVER load from file directly.
             llm_client: Optional LLM client for enhanced classification.
                        When provided, enables LLM-based nuanced judgment.
+            response_cache: Optional LLM response cache. Identical content
+                           reuses the earlier classification.
+            verdict_cache: Optional verdict cache. Re-checking identical
+                          content returns the earlier ContentComplianceCheck
+                          until the rules or prompts change.
+            batch_executor: Optional process pool for check_patterns_batch().
+                           Without one, batches run on the event loop.
         """
+        self._compliance_rules = compliance_rules
         self.rules = ComplianceRules(compliance_rules)
+        self._compiled_rules = self.rules.compile()
+        self._verdict_fingerprint = config_fingerprint(
+            compliance_rules, CLASSIFICATION_TEMPLATE_ID
+        )
         self.llm_client = llm_client
+        self.response_cache = response_cache
+        self.verdict_cache = verdict_cache
+        self.batch_executor = batch_executor
 
     async def check_content(
         self,
@@ -184,35 +264,118 @@ class EUComplianceChecker:
         When an LLM client is available and use_llm=True, performs enhanced
         checking that can detect nuanced violations beyond pattern matching.
 
+        With a verdict cache, content already checked under the same rules,
+        product name and LLM mode is answered from the cache.
+
         Args:
             content: Text content to check for compliance
             product_name: Optional product name for Novel Food validation
             use_llm: Whether to use LLM for enhanced checking (default True)
 
+        Returns:
+            ContentComplianceCheck with overall status and flagged phrases
+        """
+        use_llm = bool(self.llm_client and use_llm)
+        return await cached_verdict(
+            self.verdict_cache,
+            "eu_compliance",
+            self._verdict_fingerprint,
+            content,
+            lambda: self._check_content(content, product_name, use_llm),
+            params={"product_name": product_name, "use_llm": use_llm},
+            cacheable=lambda check: not check.llm_failed,
+        )
+
+    async def _check_content(
+        self,
+        content: str,
+        product_name: Optional[str],
+        use_llm: bool
+    ) -> ContentComplianceCheck:
+        """Run the compliance check (check_content without the verdict cache).
+
+        Args:
+            content: Text content to check for compliance
+            product_name: Optional product name for Novel Food validation
+            use_llm: Whether to use LLM for enhanced checking
+
         Returns:
             ContentComplianceCheck with overall status and flagged phrases
         """
         flagged_phrases: list[ComplianceResult] = []
         llm_enhanced = False
+        llm_failed = False
 
-        # Phase 1: Pattern-based detection (fast path)
-        prohibited_results = self._check_prohibited_phrases(content)
-        flagged_phrases.extend(prohibited_results)
-
-        borderline_results = self._check_borderline_phrases(content)
-        flagged_phrases.extend(borderline_results)
+        # Phase 1: Pattern-based detection (fast path, single pass)
+        flagged_phrases.extend(self._check_rule_phrases(content))
 
         # Phase 2: LLM-enhanced detection (when available)
-        if self.llm_client and use_llm:
+        if use_llm:
             llm_results = await self._llm_enhanced_check(content, product_name)
+            llm_failed = llm_results is None
             if llm_results:
-                # Merge LLM findings, avoiding duplicates
-                existing_phrases = {r.phrase.lower() for r in flagged_phrases}
-                for result in llm_results:
-                    if result.phrase.lower() not in existing_phrases:
-                        flagged_phrases.append(result)
+                self._merge_llm_results(flagged_phrases, llm_results)
                 llm_enhanced = True
 
+        return self._finish_check(
+            flagged_phrases, content, product_name, llm_enhanced, llm_failed
+        )
+
+    def check_content_sync(
+        self,
+        content: str,
+        product_name: Optional[str] = None
+    ) -> ContentComplianceCheck:
+        """Synchronous pattern-only compliance check (no LLM).
+
+        Args:
+            content: Text content to check for compliance
+            product_name: Optional product name for Novel Food validation
+
+        Returns:
+            ContentComplianceCheck based on rule patterns
+        """
+        return self._finish_check(self._check_rule_phrases(content), content, product_name)
+
+    async def check_patterns_batch(self, contents: list[str]) -> list[ContentComplianceCheck]:
+        """Pattern-only checks of many contents, for backfills.
+
+        Runs check_content_sync() per content on the injected batch
+        executor's worker processes, so the event loop stays free. Without
+        an executor the checks run inline, yielding between chunks.
+
+        Args:
+            contents: Text contents to check
+
+        Returns:
+            ContentComplianceCheck per content, in input order
+        """
+        return await map_batch(self.batch_executor, self, "check_content_sync", contents)
+
+    def worker_spec(self) -> WorkerSpec:
+        """Rebuild this checker (rules only, no clients) in a worker process."""
+        return WorkerSpec(EUComplianceChecker, (self._compliance_rules,))
+
+    def _finish_check(
+        self,
+        flagged_phrases: list[ComplianceResult],
+        content: str,
+        product_name: Optional[str],
+        llm_enhanced: bool = False,
+        llm_failed: bool = False
+    ) -> ContentComplianceCheck:
+        """Add the Novel Food finding and score the flagged phrases.
+
+        Args:
+            flagged_phrases: Pattern (and LLM) findings so far
+            content: Text content being checked
+            product_name: Optional product name for Novel Food validation
+            llm_enhanced: Whether LLM findings were merged
+            llm_failed: Whether the LLM stage failed
+
+        Returns:
+            ContentComplianceCheck with overall status and flagged phrases
+        """
         # Phase 3: Novel Food classification check
         novel_food_check = None
         if product_name:
@@ -234,14 +397,283 @@ class EUComplianceChecker:
             flagged_phrases=flagged_phrases,
             novel_food_check=novel_food_check,
             compliance_score=compliance_score,
-            llm_enhanced=llm_enhanced
+            llm_enhanced=llm_enhanced,
+            llm_failed=llm_failed
+        )
+
+    async def check_content_batch(
+        self,
+        contents: list[str],
+        pack_size: int = DEFAULT_PACK_SIZE,
+        max_concurrency: int = DEFAULT_PACK_CONCURRENCY,
+        use_llm: bool = True
+    ) -> list[ContentComplianceCheck]:
+        """Check many contents with several packed into each LLM prompt.
+
+        Contents already in the verdict cache are answered from it. The
+        rest are pre-screened with the pattern rules: contents the patterns
+        already reject need no LLM judgment; the others are packed
+        pack_size per prompt, with at most max_concurrency prompts in
+        flight, and each item's findings are merged back into its own
+        result. A failed prompt (or a response that does not answer every
+        item) leaves that pack's contents with their pattern-only verdict
+        and llm_failed set.
+
+        Novel Food validation needs a product name, so it is not part of
+        batch checks - use check_content for it.
+
+        Args:
+            contents: Text contents to check
+            pack_size: Contents per LLM prompt
+            max_concurrency: LLM prompts in flight at once
+            use_llm: Whether to use LLM for enhanced checking (default True)
+
+        Returns:
+            ContentComplianceCheck for each content, in input order
+
+        Raises:
+            ValueError: If pack_size or max_concurrency is less than 1
+        """
+        if pack_size < 1:
+            raise ValueError(f"pack_size must be >= 1, got {pack_size}")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+        # Same verdicts as check_content(content) without a product name
+        use_llm = bool(self.llm_client and use_llm)
+        params = {"product_name": None, "use_llm": use_llm}
+        checks: list[Optional[ContentComplianceCheck]] = [None] * len(contents)
+        if self.verdict_cache is not None:
+            checks = list(await asyncio.gather(*(
+                self.verdict_cache.get("eu_compliance", self._verdict_fingerprint, content, params)
+                for content in contents
+            )))
+        uncached = [index for index, check in enumerate(checks) if check is None]
+
+        # Phase 1: Pattern pre-screen (no LLM)
+        flagged_by_content = {index: self._check_rule_phrases(contents[index]) for index in uncached}
+
+        # Phase 2: Packed LLM judgment for contents patterns did not reject
+        pending = [
+            index
+            for index in uncached
+            if self._calculate_overall_status(flagged_by_content[index]) != OverallStatus.REJECTED
+        ] if use_llm else []
+        packs = [pending[start:start + pack_size] for start in range(0, len(pending), pack_size)]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def check_pack(pack: list[int]) -> Optional[dict[int, list[ComplianceResult]]]:
+            async with semaphore:
+                return await self._llm_packed_check([contents[index] for index in pack])
+
+        llm_results_by_content: dict[int, Optional[list[ComplianceResult]]] = {}
+        for pack, pack_results in zip(packs, await asyncio.gather(*map(check_pack, packs))):
+            for position, index in enumerate(pack):
+                llm_results_by_content[index] = (
+                    pack_results[position] if pack_results is not None else None
+                )
+
+        logger.debug(
+            "Batch compliance check: %d content(s), %d cached, %d needed LLM, %d prompt(s)",
+            len(contents),
+            len(contents) - len(uncached),
+            len(pending),
+            len(packs),
+        )
+
+        for index in uncached:
+            flagged_phrases = flagged_by_content[index]
+            llm_enhanced = False
+            llm_failed = False
+            if index in llm_results_by_content:
+                llm_results = llm_results_by_content[index]
+                llm_failed = llm_results is None
+                if llm_results:
+                    self._merge_llm_results(flagged_phrases, llm_results)
+                    llm_enhanced = True
+            check = ContentComplianceCheck(
+                overall_status=self._calculate_overall_status(flagged_phrases),
+                flagged_phrases=flagged_phrases,
+                compliance_score=self._calculate_compliance_score(flagged_phrases),
+                llm_enhanced=llm_enhanced,
+                llm_failed=llm_failed
+            )
+            checks[index] = check
+            # Cache only what check_content would also have reached: pattern
+            # rejections skipped the LLM, failed packs fell back to patterns
+            judged = index in llm_results_by_content or not use_llm
+            if self.verdict_cache is not None and judged and not llm_failed:
+                await self.verdict_cache.set(
+                    "eu_compliance", self._verdict_fingerprint, contents[index], check, params
+                )
+        return checks
+
+    async def check_content_incremental(
+        self,
+        content: str,
+        previous: Optional[ValidationSnapshot] = None,
+        use_llm: bool = True
+    ) -> tuple[ContentComplianceCheck, ValidationSnapshot]:
+        """Check content, re-checking only sentences changed since a snapshot.
+
+        Content is split into sentences. Without a reusable snapshot (same
+        rules, prompts and LLM mode) the patterns run per sentence and the
+        whole content gets one LLM call, whose findings are attributed to
+        the sentence they occur in. With one, sentences recorded in the
+        snapshot reuse their findings and the changed sentences are checked
+        together in one packed LLM call. Findings are merged in sentence
+        order and scored exactly like check_content.
+
+        Novel Food validation needs the whole content and a product name,
+        so it is not part of incremental checks - use check_content for it.
+
+        Args:
+            content: Text content to check for compliance
+            previous: Snapshot returned by the last check of this content
+            use_llm: Whether to use LLM for enhanced checking (default True)
+
+        Returns:
+            Tuple of (ContentComplianceCheck, snapshot to pass next time).
+            Sentences whose LLM stage failed are left out of the snapshot
+            so the next check retries them.
+        """
+        use_llm = bool(self.llm_client and use_llm)
+        reusable = (
+            previous.sentences
+            if previous and previous.reusable_for(self._verdict_fingerprint, use_llm)
+            else {}
         )
 
+        spans = sentence_spans(content)
+        keys = [sentence_key(content[start:end]) for start, end in spans]
+        snapshot = ValidationSnapshot(self._verdict_fingerprint, use_llm)
+
+        unplaced: list[ComplianceResult] = []
+        if reusable:
+            findings, llm_failed = await self._check_changed_sentences(
+                content, spans, keys, reusable, use_llm, snapshot
+            )
+        else:
+            findings, unplaced, llm_failed = await self._check_whole_content(
+                content, spans, keys, use_llm, snapshot
+            )
+
+        flagged_phrases = [
+            _result_from_dict(entry) for key in keys for entry in findings[key]
+        ] + unplaced
+        logger.debug(
+            "Incremental compliance check: %d of %d sentence(s) reused",
+            sum(key in reusable for key in keys),
+            len(keys),
+        )
+
+        return ContentComplianceCheck(
+            overall_status=self._calculate_overall_status(flagged_phrases),
+            flagged_phrases=flagged_phrases,
+            compliance_score=self._calculate_compliance_score(flagged_phrases),
+            llm_enhanced=use_llm and not llm_failed,
+            llm_failed=llm_failed
+        ), snapshot
+
+    async def _check_whole_content(
+        self,
+        content: str,
+        spans: list[tuple[int, int]],
+        keys: list[str],
+        use_llm: bool,
+        snapshot: ValidationSnapshot
+    ) -> tuple[dict[str, list[dict[str, str]]], list[ComplianceResult], bool]:
+        """Check every sentence, with one LLM call for the whole content.
+
+        Args:
+            content: Text content to check
+            spans: Sentence spans in content
+            keys: Sentence key per span
+            use_llm: Whether to use the LLM
+            snapshot: Snapshot to record sentence findings in
+
+        Returns:
+            Tuple of (sentence key -> findings, LLM findings that could not
+            be placed in a sentence, whether the LLM stage failed). Nothing
+            is recorded in the snapshot if the LLM failed or a finding could
+            not be placed, so the next check starts over.
+        """
+        flagged_by_sentence = [
+            self._check_rule_phrases(content[start:end]) for start, end in spans
+        ]
+        unplaced: list[ComplianceResult] = []
+        llm_failed = False
+
+        if use_llm:
+            llm_results = await self._llm_enhanced_check(content)
+            llm_failed = llm_results is None
+            lowered = content.lower()
+            for result in llm_results or []:
+                position = lowered.find(result.phrase.lower())
+                index = next(
+                    (i for i, (_, end) in enumerate(spans) if position < end),
+                    None,
+                ) if position >= 0 else None
+                if index is None:
+                    unplaced.append(result)
+                else:
+                    self._merge_llm_results(flagged_by_sentence[index], [result])
+
+        findings = {
+            key: [_result_to_dict(r) for r in flagged]
+            for key, flagged in zip(keys, flagged_by_sentence)
+        }
+        if not llm_failed and not unplaced:
+            snapshot.sentences.update(findings)
+        return findings, unplaced, llm_failed
+
+    async def _check_changed_sentences(
+        self,
+        content: str,
+        spans: list[tuple[int, int]],
+        keys: list[str],
+        reusable: dict[str, list[dict[str, str]]],
+        use_llm: bool,
+        snapshot: ValidationSnapshot
+    ) -> tuple[dict[str, list[dict[str, str]]], bool]:
+        """Reuse recorded sentences and check the rest in one packed prompt.
+
+        Args:
+            content: Text content to check
+            spans: Sentence spans in content
+            keys: Sentence key per span
+            reusable: Findings recorded by the previous snapshot
+            use_llm: Whether to use the LLM
+            snapshot: Snapshot to record sentence findings in
+
+        Returns:
+            Tuple of (sentence key -> findings, whether the LLM stage failed)
+        """
+        changed = {
+            key: content[start:end]
+            for key, (start, end) in zip(keys, spans)
+            if key not in reusable
+        }
+        checks = await self.check_content_batch(
+            list(changed.values()), pack_size=max(len(changed), 1), use_llm=use_llm
+        )
+
+        findings = {key: reusable[key] for key in keys if key in reusable}
+        snapshot.sentences.update(findings)
+        llm_failed = False
+        for key, check in zip(changed, checks):
+            findings[key] = [_result_to_dict(r) for r in check.flagged_phrases]
+            if check.llm_failed:
+                llm_failed = True
+            else:
+                snapshot.sentences[key] = findings[key]
+        return findings, llm_failed
+
     async def _llm_enhanced_check(
         self,
         content: str,
         product_name: Optional[str] = None
-    ) -> list[ComplianceResult]:
+    ) -> Optional[list[ComplianceResult]]:
         """Use LLM for nuanced compliance checking.
 
         Analyzes content using the LLM with EU Health Claims context.
@@ -252,165 +684,224 @@ class EUComplianceChecker:
             product_name: Optional product for context
 
         Returns:
-            List of ComplianceResult from LLM analysis
+            List of ComplianceResult from LLM analysis, or None if the
+            LLM call failed
         """
         if not self.llm_client:
             return []
 
         try:
             # Build the classification prompt
-            prompt = CLASSIFICATION_PROMPT_TEMPLATE.format(
-                content=content,
-                product_name=product_name or "Not specified"
+            inputs = {
+                "content": content,
+                "product_name": product_name or "Not specified",
+            }
+            prompt = CLASSIFICATION_PROMPT_TEMPLATE.format(**inputs)
+
+            # Call LLM with compliance system prompt (or reuse a cached
+            # response), then parse into ComplianceResults
+            return await cached_generate(
+                self.response_cache,
+                template=CLASSIFICATION_TEMPLATE_ID,
+                tier=TaskType.GENERATE.value,
+                inputs=inputs,
+                generate=lambda: self.llm_client.generate(
+                    prompt=prompt,
+                    system=COMPLIANCE_SYSTEM_PROMPT
+                ),
+                parse=self._parse_llm_response,
             )
 
-            # Call LLM with compliance system prompt
-            response = await self.llm_client.generate(
-                prompt=prompt,
-                system=COMPLIANCE_SYSTEM_PROMPT
+        except Exception as e:
+            # Log exception but fail gracefully - pattern matching still works
+            logger.warning("LLM enhanced check failed, falling back to patterns: %s", e)
+            return None
+
+    async def _llm_packed_check(
+        self,
+        contents: list[str]
+    ) -> Optional[dict[int, list[ComplianceResult]]]:
+        """Classify several contents with one LLM prompt.
+
+        Args:
+            contents: Text contents packed into the prompt
+
+        Returns:
+            Content position -> ComplianceResults for every item the LLM
+            answered, or None if the LLM call failed
+        """
+        try:
+            inputs = {"contents": contents}
+            prompt = BATCH_CLASSIFICATION_PROMPT_TEMPLATE.format(
+                count=len(contents),
+                items="\n\n".join(
+                    f"ITEM: {number}\n{content}"
+                    for number, content in enumerate(contents, start=1)
+                ),
             )
 
-            # Parse LLM response into ComplianceResults
-            return self._parse_llm_response(response)
+            return await cached_generate(
+                self.response_cache,
+                template=BATCH_CLASSIFICATION_TEMPLATE_ID,
+                tier=TaskType.GENERATE.value,
+                inputs=inputs,
+                generate=lambda: self.llm_client.generate(
+                    prompt=prompt,
+                    system=COMPLIANCE_SYSTEM_PROMPT
+                ),
+                parse=lambda response: self._parse_packed_response(
+                    response, len(contents)
+                ),
+            )
 
         except Exception as e:
             # Log exception but fail gracefully - pattern matching still works
-            logger.warning("LLM enhanced check failed, falling back to patterns: %s", e)
-            return []
+            logger.warning("Packed LLM check failed, falling back to patterns: %s", e)
+            return None
+
+    def _parse_packed_response(
+        self,
+        response: str,
+        count: int
+    ) -> dict[int, list[ComplianceResult]]:
+        """Split a packed LLM response into per-item ComplianceResults.
+
+        Args:
+            response: Raw LLM response with "ITEM: <number>" sections
+            count: Number of items sent in the prompt
+
+        Returns:
+            Content position (0-based) -> parsed ComplianceResults
+
+        Raises:
+            ValueError: If the response does not answer exactly the items
+                sent, or an item's section is malformed - the caller then
+                fails the whole pack and the response is not cached
+        """
+        sections: dict[int, list[str]] = {}
+        current: Optional[list[str]] = None
+        for line in response.strip().split('\n'):
+            header = _PACKED_ITEM_HEADER.match(line.strip())
+            if header:
+                current = sections.setdefault(int(header.group(1)) - 1, [])
+            elif current is not None:
+                current.append(line)
+
+        if set(sections) != set(range(count)):
+            answered = sorted(position + 1 for position in sections)
+            raise ValueError(f"Packed response answered items {answered}, expected 1-{count}")
+
+        return {
+            position: self._parse_llm_response("\n".join(lines))
+            for position, lines in sections.items()
+        }
+
+    @staticmethod
+    def _merge_llm_results(
+        flagged_phrases: list[ComplianceResult],
+        llm_results: list[ComplianceResult]
+    ) -> None:
+        """Add LLM findings to pattern findings, avoiding duplicate phrases."""
+        existing_phrases = {r.phrase.lower() for r in flagged_phrases}
+        for result in llm_results:
+            if result.phrase.lower() not in existing_phrases:
+                flagged_phrases.append(result)
 
     def _parse_llm_response(self, response: str) -> list[ComplianceResult]:
         """Parse LLM response into structured ComplianceResults.
 
+        The response must hold complete PHRASE/STATUS/EXPLANATION blocks,
+        or the NO_FLAGGED_PHRASES line when nothing needs flagging. Other
+        lines (commentary) are ignored. PERMITTED phrases are not returned.
+
         Args:
             response: Raw LLM response text
 
         Returns:
             List of parsed ComplianceResult objects
-        """
-        results = []
-        lines = response.strip().split('\n')
 
-        current_phrase = None
-        current_status = None
-        current_explanation = None
-        current_reference = None
+        Raises:
+            ValueError: If the response is empty, truncated mid-finding or
+                holds neither findings nor NO_FLAGGED_PHRASES - so it is not
+                cached and the check reports llm_failed
+        """
+        lines = [line.strip() for line in response.strip().split('\n') if line.strip()]
+        if not lines:
+            raise ValueError("Empty compliance response")
 
+        blocks: list[dict[str, str]] = []
         for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+            for field_name in _FINDING_FIELDS:
+                if line.startswith(f"{field_name}:"):
+                    if field_name == "PHRASE":
+                        blocks.append({})
+                    if blocks:
+                        blocks[-1][field_name] = line[len(field_name) + 1:].strip()
+                    break
 
-            # Parse structured output from LLM
-            if line.startswith('PHRASE:'):
-                if current_phrase and current_status:
-                    results.append(ComplianceResult(
-                        phrase=current_phrase,
-                        status=current_status,
-                        explanation=current_explanation or "LLM-detected violation",
-                        regulation_reference=current_reference or RegulationRef.HEALTH_CLAIMS
-                    ))
-                current_phrase = line[7:].strip()
-                current_status = None
-                current_explanation = None
-                current_reference = None
-
-            elif line.startswith('STATUS:'):
-                status_str = line[7:].strip().upper()
-                if status_str == 'PROHIBITED':
-                    current_status = ComplianceStatus.PROHIBITED
-                    current_reference = RegulationRef.ARTICLE_10
-                elif status_str == 'BORDERLINE':
-                    current_status = ComplianceStatus.BORDERLINE
-                    current_reference = RegulationRef.ARTICLE_13
-                elif status_str == 'PERMITTED':
-                    current_status = ComplianceStatus.PERMITTED
-                    current_reference = RegulationRef.NO_CLAIM
-
-            elif line.startswith('EXPLANATION:'):
-                current_explanation = line[12:].strip()
-
-            elif line.startswith('REFERENCE:'):
-                current_reference = line[10:].strip()
-
-        # Don't forget the last one
-        if current_phrase and current_status and current_status != ComplianceStatus.PERMITTED:
+        if not blocks:
+            if any(line.upper() == NO_FINDINGS_LINE for line in lines):
+                return []
+            raise ValueError("Compliance response has no findings and no NO_FLAGGED_PHRASES line")
+
+        statuses = {
+            "PROHIBITED": (ComplianceStatus.PROHIBITED, RegulationRef.ARTICLE_10),
+            "BORDERLINE": (ComplianceStatus.BORDERLINE, RegulationRef.ARTICLE_13),
+            "PERMITTED": (ComplianceStatus.PERMITTED, RegulationRef.NO_CLAIM),
+        }
+        results = []
+        for block in blocks:
+            status = statuses.get(block.get("STATUS", "").upper())
+            if not block.get("PHRASE") or status is None or not block.get("EXPLANATION"):
+                raise ValueError(f"Incomplete finding in compliance response: {block}")
+            if status[0] == ComplianceStatus.PERMITTED:
+                continue
             results.append(ComplianceResult(
-                phrase=current_phrase,
-                status=current_status,
-                explanation=current_explanation or "LLM-detected violation",
-                regulation_reference=current_reference or RegulationRef.HEALTH_CLAIMS
+                phrase=block["PHRASE"],
+                status=status[0],
+                explanation=block["EXPLANATION"],
+                regulation_reference=block.get("REFERENCE") or status[1]
             ))
 
         return results
 
-    def _check_prohibited_phrases(self, content: str) -> list[ComplianceResult]:
-        """Check content for prohibited health claim patterns.
+    def _check_rule_phrases(self, content: str) -> list[ComplianceResult]:
+        """Check content for prohibited and borderline health claim patterns.
 
         Prohibited phrases include: treats, cures, prevents, disease references.
+        Borderline phrases include: supports, promotes, contributes to - function
+        claims that require EFSA approval. Both are found in a single pass of
+        the compiled rules.
 
         Args:
             content: Text content to check
 
         Returns:
-            List of ComplianceResult for each prohibited phrase found
+            ComplianceResult for each phrase found, prohibited first
         """
         results = []
-        content_lower = content.lower()
-
-        for pattern_info in self.rules.prohibited_patterns:
-            pattern = pattern_info["pattern"]
-            category = pattern_info["category"]
 
-            # Use word boundary matching for accurate detection
-            regex_pattern = r'\b' + re.escape(pattern.lower()) + r'\b'
-            matches = re.finditer(regex_pattern, content_lower)
+        for match in self._compiled_rules.find_all(content):
+            if match.status == ComplianceStatus.PERMITTED.value:
+                continue
 
-            for match in matches:
-                # Extract surrounding context
-                start = max(0, match.start() - ComplianceScoring.CONTEXT_WINDOW_CHARS)
-                end = min(len(content), match.end() + ComplianceScoring.CONTEXT_WINDOW_CHARS)
-                context = content[start:end]
+            # Extract surrounding context
+            start = max(0, match.start - ComplianceScoring.CONTEXT_WINDOW_CHARS)
+            end = min(len(content), match.end + ComplianceScoring.CONTEXT_WINDOW_CHARS)
+            context = content[start:end]
 
+            if match.status == ComplianceStatus.PROHIBITED.value:
                 results.append(ComplianceResult(
                     phrase=context.strip(),
                     status=ComplianceStatus.PROHIBITED,
-                    explanation=self._get_prohibited_explanation(category),
+                    explanation=self._get_prohibited_explanation(match.category),
                     regulation_reference=RegulationRef.ARTICLE_10
                 ))
-
-        return results
-
-    def _check_borderline_phrases(self, content: str) -> list[ComplianceResult]:
-        """Check content for borderline health claim patterns.
-
-        Borderline phrases include: supports, promotes, contributes to.
-        These are function claims that require EFSA approval.
-
-        Args:
-            content: Text content to check
-
-        Returns:
-            List of ComplianceResult for each borderline phrase found
-        """
-        results = []
-        content_lower = content.lower()
-
-        for pattern_info in self.rules.borderline_patterns:
-            pattern = pattern_info["pattern"]
-            category = pattern_info["category"]
-
-            regex_pattern = r'\b' + re.escape(pattern.lower()) + r'\b'
-            matches = re.finditer(regex_pattern, content_lower)
-
-            for match in matches:
-                start = max(0, match.start() - ComplianceScoring.CONTEXT_WINDOW_CHARS)
-                end = min(len(content), match.end() + ComplianceScoring.CONTEXT_WINDOW_CHARS)
-                context = content[start:end]
-
+            else:
                 results.append(ComplianceResult(
                     phrase=context.strip(),
                     status=ComplianceStatus.BORDERLINE,
-                    explanation=self._get_borderline_explanation(category),
+                    explanation=self._get_borderline_explanation(match.category),
                     regulation_reference=RegulationRef.ARTICLE_13
                 ))
 
@@ -609,38 +1100,30 @@ class EUComplianceChecker:
         Returns:
             ComplianceResult with classification
         """
-        # Check prohibited first (higher priority)
-        for pattern_info in self.rules.prohibited_patterns:
-            pattern = pattern_info["pattern"]
-            if re.search(r'\b' + re.escape(pattern.lower()) + r'\b', phrase.lower()):
+        # Matches come in priority order: prohibited, borderline, permitted
+        matches = self._compiled_rules.find_all(phrase)
+        if matches:
+            match = matches[0]
+            if match.status == ComplianceStatus.PROHIBITED.value:
                 return ComplianceResult(
                     phrase=phrase,
                     status=ComplianceStatus.PROHIBITED,
-                    explanation=self._get_prohibited_explanation(pattern_info["category"]),
+                    explanation=self._get_prohibited_explanation(match.category),
                     regulation_reference=RegulationRef.ARTICLE_10
                 )
-
-        # Check borderline
-        for pattern_info in self.rules.borderline_patterns:
-            pattern = pattern_info["pattern"]
-            if re.search(r'\b' + re.escape(pattern.lower()) + r'\b', phrase.lower()):
+            if match.status == ComplianceStatus.BORDERLINE.value:
                 return ComplianceResult(
                     phrase=phrase,
                     status=ComplianceStatus.BORDERLINE,
-                    explanation=self._get_borderline_explanation(pattern_info["category"]),
+                    explanation=self._get_borderline_explanation(match.category),
                     regulation_reference=RegulationRef.ARTICLE_13
                 )
-
-        # Check permitted patterns
-        for pattern_info in self.rules.permitted_patterns:
-            pattern = pattern_info["pattern"]
-            if re.search(r'\b' + re.escape(pattern.lower()) + r'\b', phrase.lower()):
-                return ComplianceResult(
-                    phrase=phrase,
-                    status=ComplianceStatus.PERMITTED,
-                    explanation="Content uses permitted lifestyle/cultural language.",
-                    regulation_reference=RegulationRef.NO_CLAIM
-                )
+            return ComplianceResult(
+                phrase=phrase,
+                status=ComplianceStatus.PERMITTED,
+                explanation="Content uses permitted lifestyle/cultural language.",
+                regulation_reference=RegulationRef.NO_CLAIM
+            )
 
         # Default to permitted if no patterns match
         return ComplianceResult(
@@ -0,0 +1,135 @@
+"""Sentence-level snapshots for incremental compliance revalidation.
+
+Operators edit approval-queue captions a few words at a time, and every
+save used to re-check the whole caption (including an LLM call). Phrase
+findings are local to the sentence they occur in, so a caption can be
+checked sentence by sentence and the findings of sentences that did not
+change can be reused from the previous check.
+
+A ValidationSnapshot records, for the last validated version of a caption,
+the findings of each sentence keyed by the sentence's hash. It is plain
+JSON so it can be stored with the content (ApprovalItem.validation_snapshot).
+A snapshot is only reused while the checker configuration fingerprint and
+LLM mode match the ones it was taken with.
+
+Usage:
+    check, snapshot = await checker.check_content_incremental(
+        caption, previous=ValidationSnapshot.from_dict(item.validation_snapshot)
+    )
+    item.validation_snapshot = snapshot.to_dict()
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+# Bump when the snapshot layout changes - older snapshots are ignored
+SNAPSHOT_VERSION = 1
+
+# Characters of the sentence hash used as snapshot keys
+SENTENCE_HASH_LENGTH = 16
+
+# Sentence ends at ., ! or ? followed by whitespace, or at a line break
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\s*\n\s*")
+
+
+def sentence_spans(content: str) -> list[tuple[int, int]]:
+    """Character spans of the sentences in content.
+
+    Line breaks always end a sentence, since captions put hashtags and
+    calls to action on their own lines.
+
+    Args:
+        content: Text content to split
+
+    Returns:
+        (start, end) of each non-empty, stripped sentence in content order
+    """
+    spans = []
+    start = 0
+    breaks = [(match.start(), match.end()) for match in _SENTENCE_BREAK.finditer(content)]
+    for break_start, break_end in breaks + [(len(content), len(content))]:
+        segment = content[start:break_start]
+        if segment.strip():
+            offset = start + len(segment) - len(segment.lstrip())
+            spans.append((offset, offset + len(segment.strip())))
+        start = break_end
+    return spans
+
+
+def split_sentences(content: str) -> list[str]:
+    """Split content into sentences for incremental checking.
+
+    Args:
+        content: Text content to split
+
+    Returns:
+        Non-empty, stripped sentences in content order
+    """
+    return [content[start:end] for start, end in sentence_spans(content)]
+
+
+def sentence_key(sentence: str) -> str:
+    """Snapshot key of a sentence (hash of its text)."""
+    return hashlib.sha256(sentence.encode("utf-8")).hexdigest()[:SENTENCE_HASH_LENGTH]
+
+
+@dataclass
+class ValidationSnapshot:
+    """Per-sentence compliance findings of the last validated caption.
+
+    Attributes:
+        fingerprint: Checker configuration fingerprint the findings came from
+        use_llm: Whether the findings include LLM classification
+        sentences: Sentence key -> findings as dicts (phrase, status,
+            explanation, regulation_reference)
+    """
+
+    fingerprint: str
+    use_llm: bool
+    sentences: dict[str, list[dict[str, str]]] = field(default_factory=dict)
+
+    def reusable_for(self, fingerprint: str, use_llm: bool) -> bool:
+        """Whether findings can be reused by a check with these settings."""
+        return self.fingerprint == fingerprint and self.use_llm == use_llm
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to JSON-compatible dict for storage."""
+        return {
+            "version": SNAPSHOT_VERSION,
+            "fingerprint": self.fingerprint,
+            "use_llm": self.use_llm,
+            "sentences": self.sentences,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict[str, Any]]) -> Optional["ValidationSnapshot"]:
+        """Deserialize a stored snapshot.
+
+        Args:
+            data: Stored snapshot dict, or None
+
+        Returns:
+            ValidationSnapshot, or None if data is missing, from another
+            SNAPSHOT_VERSION or malformed
+        """
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            return None
+        sentences = data.get("sentences")
+        if not isinstance(sentences, dict):
+            return None
+        return cls(
+            fingerprint=str(data.get("fingerprint", "")),
+            use_llm=bool(data.get("use_llm", False)),
+            sentences=sentences,
+        )
+
+
+__all__ = [
+    "SNAPSHOT_VERSION",
+    "ValidationSnapshot",
+    "sentence_key",
+    "sentence_spans",
+    "split_sentences",
+]
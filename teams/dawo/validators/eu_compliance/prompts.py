@@ -4,6 +4,10 @@ Contains prompt templates for LLM-based compliance classification.
 Used when pattern matching needs additional context or judgment.
 """
 
+# Line a response uses to say nothing needs flagging - an empty or
+# unstructured response is treated as a failed call, not as compliant
+NO_FINDINGS_LINE = "NO_FLAGGED_PHRASES"
+
 COMPLIANCE_SYSTEM_PROMPT = """You are an EU Health Claims Regulation expert specializing in EC 1924/2006.
 
 Your role is to evaluate content for compliance with EU regulations on nutrition and health claims.
@@ -54,13 +58,33 @@ Evaluate each health-related phrase and classify as:
 - BORDERLINE: Function claims requiring EFSA approval
 - PERMITTED: Lifestyle/cultural language
 
-For each flagged phrase, provide:
-1. The exact phrase
-2. Classification (PROHIBITED/BORDERLINE/PERMITTED)
-3. Explanation of why it's classified this way
-4. Relevant regulation reference
+Respond with one block per flagged phrase:
+PHRASE: <exact phrase>
+STATUS: <PROHIBITED/BORDERLINE/PERMITTED>
+EXPLANATION: <why it's classified this way>
+REFERENCE: <relevant regulation reference>
+
+If no phrase needs flagging, respond with the single line NO_FLAGGED_PHRASES.
+"""
+
+BATCH_CLASSIFICATION_PROMPT_TEMPLATE = """Analyze each of the following {count} content items for EU Health Claims compliance.
+Evaluate every item independently - findings in one item never apply to another.
+
+{items}
+
+Evaluate each health-related phrase and classify as:
+- PROHIBITED: Direct treatment/cure/prevention claims
+- BORDERLINE: Function claims requiring EFSA approval
+- PERMITTED: Lifestyle/cultural language
+
+Respond for EVERY item, in item order. Start each item with a line
+"ITEM: <number>", followed by one block per flagged phrase:
+PHRASE: <exact phrase>
+STATUS: <PROHIBITED/BORDERLINE/PERMITTED>
+EXPLANATION: <why it's classified this way>
 
-Return your analysis in structured format.
+An item without flagged phrases has the single line NO_FLAGGED_PHRASES
+after its ITEM line.
 """
 
 NOVEL_FOOD_PROMPT_TEMPLATE = """Evaluate if the following content correctly markets the product according to its Novel Food classification:
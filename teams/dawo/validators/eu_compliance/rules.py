@@ -2,10 +2,138 @@
 
 Handles loading and accessing compliance rules configuration.
 Rules are loaded via dependency injection - NEVER directly from files.
+
+CompiledRules turns the prohibited, borderline and permitted pattern lists
+into one word-boundary matcher, so content is scanned once per check
+instead of once per pattern.
 """
 
+import re
+from dataclasses import dataclass
 from typing import Optional
 
+# Rule lists in classification priority order (values match ComplianceStatus)
+RULE_STATUSES = ("prohibited", "borderline", "permitted")
+
+
+@dataclass(frozen=True)
+class RuleMatch:
+    """A rule pattern found in content.
+
+    Attributes:
+        status: Rule list of the pattern ("prohibited", "borderline", "permitted")
+        category: Pattern category from the rules configuration
+        pattern: Pattern as configured
+        rule_index: Position of the pattern in its rule list
+        start: Match start offset in the lowercased content
+        end: Match end offset in the lowercased content
+    """
+
+    status: str
+    category: Optional[str]
+    pattern: str
+    rule_index: int
+    start: int
+    end: int
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether re treats char as a word character."""
+    return char.isalnum() or char == "_"
+
+
+def _at_word_boundary(text: str, pos: int) -> bool:
+    """Whether pos in text is a \\b word boundary."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+class CompiledRules:
+    """All rule patterns compiled into a single-pass matcher.
+
+    Equivalent to searching r'\\b' + re.escape(pattern) + r'\\b' for
+    every pattern, but the content is scanned once:
+    - One regex finds, at each word boundary, the longest pattern that
+      matches there (alternatives are ordered longest first)
+    - Shorter patterns at the same position are necessarily prefixes of
+      that pattern, so they are confirmed with a boundary check only
+    This keeps overlapping and nested hits (e.g. "cancer" inside
+    "anti-cancer") that a plain alternation would swallow.
+
+    Built from a snapshot of the rules; recompile after changing them.
+    """
+
+    def __init__(self, rules: "ComplianceRules"):
+        """Compile the pattern lists of rules.
+
+        Args:
+            rules: Rules whose prohibited, borderline and permitted
+                patterns are compiled
+        """
+        # Lowercased pattern -> every rule entry using it (rank, index, category, pattern)
+        self._entries: dict[str, list[tuple[int, int, Optional[str], str]]] = {}
+        for rank, status in enumerate(RULE_STATUSES):
+            for index, pattern_info in enumerate(getattr(rules, f"{status}_patterns")):
+                pattern = pattern_info["pattern"]
+                if pattern:
+                    self._entries.setdefault(pattern.lower(), []).append(
+                        (rank, index, pattern_info.get("category"), pattern)
+                    )
+
+        ordered = sorted(self._entries, key=len, reverse=True)
+        # Pattern -> shorter patterns it starts with, longest first
+        self._prefixes = {
+            text: [other for other in ordered if len(other) < len(text) and text.startswith(other)]
+            for text in ordered
+        }
+        self._regex = (
+            re.compile(r"\b(?=(" + "|".join(re.escape(text) for text in ordered) + r")\b)")
+            if ordered else None
+        )
+
+    def find_all(self, content: str) -> list[RuleMatch]:
+        """Find every rule pattern in content in one pass.
+
+        Matching is case-insensitive and on word boundaries. Each pattern's
+        hits are non-overlapping, like re.finditer per pattern.
+
+        Args:
+            content: Text to scan
+
+        Returns:
+            Matches ordered by rule priority (prohibited, borderline,
+            permitted), then rule list order, then position
+        """
+        if self._regex is None:
+            return []
+
+        text = content.lower()
+        matches: list[tuple[int, RuleMatch]] = []
+        next_start: dict[str, int] = {}
+        for found in self._regex.finditer(text):
+            start = found.start()
+            longest = found.group(1)
+            for depth, candidate in enumerate((longest, *self._prefixes[longest])):
+                end = start + len(candidate)
+                if start < next_start.get(candidate, 0):
+                    continue
+                if depth and not _at_word_boundary(text, end):
+                    continue
+                next_start[candidate] = end
+                for rank, index, category, pattern in self._entries[candidate]:
+                    matches.append((rank, RuleMatch(
+                        status=RULE_STATUSES[rank],
+                        category=category,
+                        pattern=pattern,
+                        rule_index=index,
+                        start=start,
+                        end=end,
+                    )))
+
+        matches.sort(key=lambda pair: (pair[0], pair[1].rule_index, pair[1].start))
+        return [match for _, match in matches]
+
 
 class ComplianceRules:
     """Manages EU compliance rules configuration.
@@ -65,6 +193,14 @@ class ComplianceRules:
             if not isinstance(config[key], list):
                 raise ValueError(f"Configuration key '{key}' must be a list")
 
+    def compile(self) -> CompiledRules:
+        """Compile the pattern lists into a single-pass matcher.
+
+        Returns:
+            CompiledRules for the current patterns
+        """
+        return CompiledRules(self)
+
     def get_novel_food_classification(self, product_name: str) -> Optional[dict]:
         """Look up Novel Food classification for a product.
 
@@ -9,11 +9,13 @@ This module is a SHARED COMPONENT used by all research scanners
 Key Features:
     - Scientific citation detection (DOI, PMID, scientific URLs)
     - Source-specific validation rules (PubMed vs social sources)
-    - Batch validation with partial failure handling
+    - Batch validation with partial failure handling and bounded concurrency
+    - Packed batch mode: several items per LLM prompt after a pattern pre-screen
     - Citation-aware status adjustment
 
 Exports:
     ResearchComplianceValidator: Main validator class
+    DEFAULT_MAX_CONCURRENCY: Default limit on checks in flight per batch
     ValidatedResearch: Validated research item output
     CitationInfo: Citation detection result
     ComplianceValidationResult: Full validation result
@@ -35,9 +37,13 @@ Usage:
 
     # Validate batch
     results = await validator.validate_batch(items)
+
+    # Packed batches: 8 items per LLM prompt
+    validator = ResearchComplianceValidator(eu_compliance_checker, pack_size=8)
 """
 
 from .validator import (
+    DEFAULT_MAX_CONCURRENCY,
     ResearchComplianceValidator,
     ValidatedResearch,
 )
@@ -52,6 +58,7 @@ from .schemas import (
 __all__: list[str] = [
     # Main validator
     "ResearchComplianceValidator",
+    "DEFAULT_MAX_CONCURRENCY",
     # Output type
     "ValidatedResearch",
     # Schemas
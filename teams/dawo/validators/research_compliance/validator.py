@@ -9,12 +9,17 @@ Instagram, News, PubMed) for consistent EU compliance checking.
 Key Features:
 - Scientific citation detection (DOI, PMID, URLs)
 - Source-specific validation rules (PubMed vs social sources)
-- Batch validation with partial failure handling
+- Batch validation with partial failure handling and bounded concurrency
+- Packed batch mode: pattern pre-screen, then several items per LLM prompt
 - Citation-aware status adjustment (REJECTED + citation = WARNING)
 
 Usage:
     validator = ResearchComplianceValidator(eu_compliance_checker)
     result = await validator.validate(transformed_research_item)
+
+    # Fewer LLM round trips for large batches
+    validator = ResearchComplianceValidator(eu_compliance_checker, pack_size=8)
+    results = await validator.validate_batch(items)
 """
 
 import asyncio
@@ -41,6 +46,9 @@ from .schemas import (
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Items validated at once by validate_batch (each may make an LLM call)
+DEFAULT_MAX_CONCURRENCY = 10
+
 
 class ValidatedResearch:
     """Research item with compliance validation results.
@@ -100,8 +108,15 @@ class ResearchComplianceValidator:
 
     CRITICAL: Accepts EUComplianceChecker via injection - NEVER loads config directly.
 
+    Batches run at most max_concurrency checks at once. With pack_size set,
+    batches use the checker's packed mode instead: every item is
+    pre-screened with the pattern rules and only items that still need LLM
+    judgment are sent, pack_size items per prompt.
+
     Attributes:
         _compliance_checker: EU Compliance Checker instance
+        _max_concurrency: Checks (or packed prompts) in flight at once
+        _pack_size: Items per LLM prompt in packed mode, None for per-item checks
     """
 
     # DOI pattern: 10.xxxx/xxxxx
@@ -117,14 +132,31 @@ class ResearchComplianceValidator:
         re.compile(r'ncbi\.nlm\.nih\.gov/pmc/articles/PMC\d+'),
     ]
 
-    def __init__(self, compliance_checker: EUComplianceChecker):
+    def __init__(
+        self,
+        compliance_checker: EUComplianceChecker,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        pack_size: Optional[int] = None,
+    ):
         """Initialize with EU Compliance Checker.
 
         Args:
             compliance_checker: EUComplianceChecker instance from Story 1.2.
                                Injected by Team Builder - NEVER load directly.
+            max_concurrency: Checks (or packed prompts) in flight at once
+            pack_size: Items per LLM prompt for packed batch validation,
+                      None to check items one by one
+
+        Raises:
+            ValueError: If max_concurrency or pack_size is less than 1
         """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if pack_size is not None and pack_size < 1:
+            raise ValueError(f"pack_size must be >= 1, got {pack_size}")
         self._compliance_checker = compliance_checker
+        self._max_concurrency = max_concurrency
+        self._pack_size = pack_size
 
     async def validate(
         self,
@@ -150,62 +182,14 @@ class ResearchComplianceValidator:
         )
 
         try:
-            # Get source as string
-            source_str = (
-                research_item.source.value
-                if hasattr(research_item.source, "value")
-                else str(research_item.source)
-            )
-
-            # Step 1: Detect scientific citations
-            citation_info = self._detect_citation(
-                text=research_item.content,
-                source_metadata=research_item.source_metadata,
-            )
-
-            # Step 2: Build text to check (title + content + key findings)
-            texts_to_check = self._extract_texts_to_check(research_item)
+            # Step 1: Build text to check (title + content + key findings)
+            combined_text = "\n\n".join(self._extract_texts_to_check(research_item))
 
-            # Step 3: Check compliance for combined text
-            combined_text = "\n\n".join(texts_to_check)
+            # Step 2: Check compliance for combined text
             check_result = await self._compliance_checker.check_content(combined_text)
 
-            # Step 4: Determine final status with citation adjustment
-            final_status = self._determine_final_status(
-                base_status=check_result.overall_status,
-                citation_info=citation_info,
-                source_type=source_str,
-            )
-
-            # Step 5: Build compliance notes
-            notes = self._build_compliance_notes(
-                status=final_status,
-                citation_info=citation_info,
-                flagged_count=len(check_result.flagged_phrases),
-                source_type=source_str,
-            )
-
-            logger.debug(
-                "Validation complete: source=%s, status=%s, citations=%s",
-                source_str,
-                final_status.value,
-                citation_info.has_citation,
-            )
-
-            return ValidatedResearch(
-                source=source_str,
-                title=research_item.title,
-                content=research_item.content,
-                url=research_item.url,
-                tags=list(research_item.tags),
-                source_metadata=dict(research_item.source_metadata),
-                score=research_item.score,
-                created_at=research_item.created_at or datetime.now(timezone.utc),
-                compliance_status=final_status,
-                compliance_notes=notes,
-                flagged_phrases=check_result.flagged_phrases,
-                has_scientific_citation=citation_info.has_citation,
-            )
+            # Step 3: Apply citation and source rules
+            return self._build_validated(research_item, check_result)
 
         except Exception as e:
             logger.error(
@@ -224,7 +208,9 @@ class ResearchComplianceValidator:
     ) -> list[ValidatedResearch]:
         """Validate batch of research items concurrently.
 
-        Processes items in parallel, handling individual failures gracefully.
+        Processes items in parallel (at most max_concurrency at once),
+        handling individual failures gracefully. In packed mode the batch
+        is checked with a pattern pre-screen and packed LLM prompts.
         Returns partial results even if some items fail.
 
         Args:
@@ -235,22 +221,24 @@ class ResearchComplianceValidator:
         """
         logger.info("Validating batch of %d items", len(items))
 
-        async def validate_single(item: TransformedResearch) -> Optional[ValidatedResearch]:
-            try:
-                return await self.validate(item)
-            except Exception as e:
-                logger.error(
-                    "Batch validation failed for item '%s': %s",
-                    item.title[:50] if item.title else "Unknown",
-                    e,
-                )
-                return None
-
-        # Process all items concurrently
-        results = await asyncio.gather(
-            *[validate_single(item) for item in items],
-            return_exceptions=False,
-        )
+        if self._pack_size is not None:
+            results = await self._validate_packed(items)
+        else:
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+
+            async def validate_single(item: TransformedResearch) -> Optional[ValidatedResearch]:
+                async with semaphore:
+                    try:
+                        return await self.validate(item)
+                    except Exception as e:
+                        self._log_batch_failure(item, e)
+                        return None
+
+            # Process items concurrently, bounded by the semaphore
+            results = await asyncio.gather(
+                *[validate_single(item) for item in items],
+                return_exceptions=False,
+            )
 
         # Filter out None results from failures
         validated = [r for r in results if r is not None]
@@ -269,6 +257,41 @@ class ResearchComplianceValidator:
 
         return validated
 
+    async def _validate_packed(
+        self,
+        items: list[TransformedResearch],
+    ) -> list[Optional[ValidatedResearch]]:
+        """Validate a batch with the checker's packed LLM mode.
+
+        Args:
+            items: List of transformed research items
+
+        Returns:
+            Validated item, or None where validation failed, in input order
+        """
+        checks = await self._compliance_checker.check_content_batch(
+            ["\n\n".join(self._extract_texts_to_check(item)) for item in items],
+            pack_size=self._pack_size,
+            max_concurrency=self._max_concurrency,
+        )
+
+        results: list[Optional[ValidatedResearch]] = []
+        for item, check_result in zip(items, checks):
+            try:
+                results.append(self._build_validated(item, check_result))
+            except Exception as e:
+                self._log_batch_failure(item, e)
+                results.append(None)
+        return results
+
+    def _log_batch_failure(self, item: TransformedResearch, error: Exception) -> None:
+        """Log an item that failed batch validation."""
+        logger.error(
+            "Batch validation failed for item '%s': %s",
+            item.title[:50] if item.title else "Unknown",
+            error,
+        )
+
     async def validate_batch_with_stats(
         self,
         items: list[TransformedResearch],
@@ -287,6 +310,70 @@ class ResearchComplianceValidator:
         stats = self._calculate_stats(items, validated)
         return validated, stats
 
+    def _build_validated(
+        self,
+        research_item: TransformedResearch,
+        check_result: ContentComplianceCheck,
+    ) -> ValidatedResearch:
+        """Apply citation and source rules to a compliance check.
+
+        Args:
+            research_item: Transformed research from scanner
+            check_result: EU compliance check of the item's texts
+
+        Returns:
+            ValidatedResearch with compliance_status set
+        """
+        # Get source as string
+        source_str = (
+            research_item.source.value
+            if hasattr(research_item.source, "value")
+            else str(research_item.source)
+        )
+
+        # Detect scientific citations
+        citation_info = self._detect_citation(
+            text=research_item.content,
+            source_metadata=research_item.source_metadata,
+        )
+
+        # Determine final status with citation adjustment
+        final_status = self._determine_final_status(
+            base_status=check_result.overall_status,
+            citation_info=citation_info,
+            source_type=source_str,
+        )
+
+        # Build compliance notes
+        notes = self._build_compliance_notes(
+            status=final_status,
+            citation_info=citation_info,
+            flagged_count=len(check_result.flagged_phrases),
+            source_type=source_str,
+        )
+
+        logger.debug(
+            "Validation complete: source=%s, status=%s, citations=%s",
+            source_str,
+            final_status.value,
+            citation_info.has_citation,
+        )
+
+        return ValidatedResearch(
+            source=source_str,
+            title=research_item.title,
+            content=research_item.content,
+            url=research_item.url,
+            tags=list(research_item.tags),
+            source_metadata=dict(research_item.source_metadata),
+            score=research_item.score,
+            created_at=research_item.created_at or datetime.now(timezone.utc),
+            compliance_status=final_status,
+            compliance_notes=notes,
+            flagged_phrases=check_result.flagged_phrases,
+            has_scientific_citation=citation_info.has_citation,
+        )
+
     def _extract_texts_to_check(
         self,
         research_item: TransformedResearch,
@@ -0,0 +1,363 @@
+"""Verdict cache for EU compliance and brand voice validation.
+
+The same caption text is validated many times: on every approval-queue
+edit and revalidate call, again by the ContentQualityScorer, and on every
+iteration of the compliance rewrite loop. Most of those calls see
+identical text, and each may include an LLM call. This cache returns the
+earlier verdict instead.
+
+Cache keys are derived from:
+- Validator name ("eu_compliance", "brand_voice")
+- Fingerprint of the validator's configuration (rules or brand profile
+  dict, prompt template ids) - a reloaded JSON config yields a new
+  fingerprint, so stale verdicts are never served
+- Hash of the normalized content (NFC, line endings, outer whitespace)
+- Call parameters that change the verdict (product name, LLM on/off, ...)
+
+Tiers:
+- In-process LRU (always on): answers repeat checks without any I/O
+- Shared backend (optional): any LLMCacheBackend, typically a
+  RedisLLMCacheBackend with VERDICT_CACHE_KEY_PREFIX, shared by workers
+
+Verdicts are pickled, so every hit returns a fresh copy the caller may
+mutate. Redis is trusted internal storage here, as it is for checkpoints.
+
+Architecture Compliance:
+- Shared backend (and its Redis client) injected via constructor
+- Cache failures degrade to running the validator - they never fail a check
+
+Usage:
+    cache = VerdictCache(RedisLLMCacheBackend(redis, prefix=VERDICT_CACHE_KEY_PREFIX))
+    checker = EUComplianceChecker(rules, llm_client, verdict_cache=cache)
+    validator = BrandVoiceValidator(profile, llm_client, verdict_cache=cache)
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import pickle
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from teams.dawo.middleware.llm_cache import LLMCacheBackend
+
+# Module logger
+logger = logging.getLogger(__name__)
+
+# Cache defaults
+DEFAULT_VERDICT_CACHE_TTL_SECONDS = 24 * 60 * 60  # One day
+DEFAULT_VERDICT_MEMORY_ENTRIES = 2_048
+VERDICT_CACHE_KEY_PREFIX = "dawo:verdict_cache"
+
+# Bump when a cached verdict's structure changes
+VERDICT_CACHE_VERSION = 1
+
+# Characters of the config hash kept in fingerprints
+FINGERPRINT_LENGTH = 16
+
+ResultT = TypeVar("ResultT")
+
+
+def config_fingerprint(*parts: Any) -> str:
+    """Fingerprint the configuration a validator's verdicts depend on.
+
+    Args:
+        *parts: JSON-serializable config (rules dict, brand profile dict)
+            and version strings (prompt template ids)
+
+    Returns:
+        Short hash that changes whenever any part changes
+    """
+    payload = json.dumps(
+        [VERDICT_CACHE_VERSION, *parts], sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:FINGERPRINT_LENGTH]
+
+
+def normalize_content(content: str) -> str:
+    """Normalize content so trivially different copies share a verdict.
+
+    Only differences that cannot change a verdict are removed: Unicode
+    normalization form, line-ending style and surrounding whitespace.
+    """
+    return unicodedata.normalize("NFC", content).replace("\r\n", "\n").strip()
+
+
+@dataclass
+class VerdictCacheStats:
+    """Hit/miss counters for a VerdictCache.
+
+    Attributes:
+        memory_hits: Verdicts answered by the in-process LRU
+        shared_hits: Verdicts answered by the shared backend
+        misses: Verdicts computed by the validator
+        errors: Backend failures (treated as misses)
+    """
+
+    memory_hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from either tier (0.0 if none)."""
+        hits = self.memory_hits + self.shared_hits
+        lookups = hits + self.misses
+        return hits / lookups if lookups else 0.0
+
+
+class VerdictCache:
+    """Two-tier cache of validator verdicts.
+
+    Attributes:
+        stats: Hit/miss counters
+        _shared: Optional shared backend (injected)
+        _max_memory_entries: In-process entries kept before LRU eviction
+        _ttl_seconds: Time-to-live for verdicts in both tiers
+        _memory: Key -> (expires_at, pickled verdict), oldest first
+    """
+
+    def __init__(
+        self,
+        shared_backend: Optional[LLMCacheBackend] = None,
+        max_memory_entries: int = DEFAULT_VERDICT_MEMORY_ENTRIES,
+        ttl_seconds: int = DEFAULT_VERDICT_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Initialize with an optional injected shared backend.
+
+        Args:
+            shared_backend: RedisLLMCacheBackend or compatible, or None for
+                an in-process cache only
+            max_memory_entries: Entries kept in process (LRU eviction beyond this)
+            ttl_seconds: Time-to-live for verdicts
+
+        Raises:
+            ValueError: If max_memory_entries or ttl_seconds is not positive
+        """
+        if max_memory_entries <= 0:
+            raise ValueError(f"max_memory_entries must be positive, got {max_memory_entries}")
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        self._shared = shared_backend
+        self._max_memory_entries = max_memory_entries
+        self._ttl_seconds = ttl_seconds
+        self._memory: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self.stats = VerdictCacheStats()
+
+    @staticmethod
+    def make_key(
+        validator: str,
+        fingerprint: str,
+        content: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> str:
+        """Derive the cache key for one validation.
+
+        Args:
+            validator: Validator name
+            fingerprint: config_fingerprint() of the validator's configuration
+            content: Content being validated
+            params: Call parameters that change the verdict
+
+        Returns:
+            "<validator>:<fingerprint>:<sha256 of content and params>"
+        """
+        payload = json.dumps(
+            [normalize_content(content), params or {}],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{validator}:{fingerprint}:{digest}"
+
+    async def get_or_compute(
+        self,
+        validator: str,
+        fingerprint: str,
+        content: str,
+        compute: Callable[[], Awaitable[ResultT]],
+        params: Optional[dict[str, Any]] = None,
+        cacheable: Callable[[ResultT], bool] = lambda result: True,
+    ) -> ResultT:
+        """Return the cached verdict, running the validator only on a miss.
+
+        Args:
+            validator: Validator name
+            fingerprint: config_fingerprint() of the validator's configuration
+            content: Content being validated
+            compute: Runs the validation and returns the verdict
+            params: Call parameters that change the verdict
+            cacheable: Whether a computed verdict may be stored (e.g. not
+                when its LLM stage failed and it fell back to patterns)
+
+        Returns:
+            Verdict (a fresh copy on every call)
+        """
+        verdict = await self.get(validator, fingerprint, content, params)
+        if verdict is not None:
+            return verdict
+
+        verdict = await compute()
+        if cacheable(verdict):
+            await self.set(validator, fingerprint, content, verdict, params)
+        return verdict
+
+    async def get(
+        self,
+        validator: str,
+        fingerprint: str,
+        content: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> Optional[Any]:
+        """Look up a verdict without computing it.
+
+        Args:
+            validator: Validator name
+            fingerprint: config_fingerprint() of the validator's configuration
+            content: Content being validated
+            params: Call parameters that change the verdict
+
+        Returns:
+            Verdict (a fresh copy), or None on a miss
+        """
+        key = self.make_key(validator, fingerprint, content, params)
+
+        payload = self._memory_get(key)
+        if payload is not None:
+            self.stats.memory_hits += 1
+            return pickle.loads(payload)
+
+        payload = await self._shared_get(key)
+        if payload is not None:
+            try:
+                verdict = pickle.loads(payload)
+            except Exception as e:
+                # Unreadable entry (e.g. result class changed) - recompute
+                logger.warning("Discarding unreadable verdict cache entry %s: %s", key, e)
+            else:
+                self.stats.shared_hits += 1
+                self._memory_set(key, payload)
+                return verdict
+
+        self.stats.misses += 1
+        return None
+
+    async def set(
+        self,
+        validator: str,
+        fingerprint: str,
+        content: str,
+        verdict: Any,
+        params: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Store a verdict computed outside get_or_compute (e.g. in a batch).
+
+        Args:
+            validator: Validator name
+            fingerprint: config_fingerprint() of the validator's configuration
+            content: Content that was validated
+            verdict: Verdict to store
+            params: Call parameters that change the verdict
+        """
+        key = self.make_key(validator, fingerprint, content, params)
+        payload = pickle.dumps(verdict)
+        self._memory_set(key, payload)
+        await self._shared_set(key, payload)
+
+    def clear_memory(self) -> None:
+        """Drop all in-process entries (the shared tier is left alone)."""
+        self._memory.clear()
+
+    def _memory_get(self, key: str) -> Optional[bytes]:
+        """In-process lookup that marks the entry recently used."""
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at <= time.monotonic():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return payload
+
+    def _memory_set(self, key: str, payload: bytes) -> None:
+        """In-process store with least-recently-used eviction."""
+        self._memory[key] = (time.monotonic() + self._ttl_seconds, payload)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+
+    async def _shared_get(self, key: str) -> Optional[bytes]:
+        """Shared-tier lookup that treats failures as a miss."""
+        if self._shared is None:
+            return None
+        try:
+            value = await self._shared.get(key)
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning("Verdict cache read failed, validating: %s", e)
+            return None
+        return base64.b64decode(value) if value is not None else None
+
+    async def _shared_set(self, key: str, payload: bytes) -> None:
+        """Shared-tier store that logs and counts failures."""
+        if self._shared is None:
+            return
+        try:
+            await self._shared.set(
+                key, base64.b64encode(payload).decode("ascii"), self._ttl_seconds
+            )
+        except Exception as e:
+            self.stats.errors += 1
+            logger.warning("Verdict cache write failed: %s", e)
+
+
+async def cached_verdict(
+    cache: Optional[VerdictCache],
+    validator: str,
+    fingerprint: str,
+    content: str,
+    compute: Callable[[], Awaitable[ResultT]],
+    params: Optional[dict[str, Any]] = None,
+    cacheable: Callable[[ResultT], bool] = lambda result: True,
+) -> ResultT:
+    """Validate through the verdict cache when one is configured.
+
+    Lets validators accept an optional cache without branching at every call.
+
+    Args:
+        cache: Injected cache, or None to always validate
+        validator: Validator name
+        fingerprint: config_fingerprint() of the validator's configuration
+        content: Content being validated
+        compute: Runs the validation and returns the verdict
+        params: Call parameters that change the verdict
+        cacheable: Whether a computed verdict may be stored
+
+    Returns:
+        Verdict
+    """
+    if cache is None:
+        return await compute()
+    return await cache.get_or_compute(
+        validator, fingerprint, content, compute, params, cacheable
+    )
+
+
+__all__ = [
+    "DEFAULT_VERDICT_CACHE_TTL_SECONDS",
+    "DEFAULT_VERDICT_MEMORY_ENTRIES",
+    "VERDICT_CACHE_KEY_PREFIX",
+    "VERDICT_CACHE_VERSION",
+    "VerdictCache",
+    "VerdictCacheStats",
+    "cached_verdict",
+    "config_fingerprint",
+    "normalize_content",
+]
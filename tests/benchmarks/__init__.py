@@ -0,0 +1,19 @@
+"""Offline benchmarks for the five scanner pipelines.
+
+Each pipeline (reddit, youtube, instagram, news, pubmed) runs end to end
+with its real clients and stages against a cassette of recorded HTTP and
+LLM traffic, and reports wall time, per-stage time, call counts and peak
+RSS. Without a recorded cassette in tests/benchmarks/cassettes/, a
+deterministic synthetic one is generated.
+
+Run (skipped unless enabled):
+    DAWO_BENCHMARKS=1 pytest tests/benchmarks -s
+
+Environment:
+    DAWO_BENCHMARK_LATENCY: Injected delay, e.g. "http=0.05,llm=0.8",
+        "recorded" or "recorded*0.5" (default: none)
+    DAWO_BENCHMARK_JSON: Write reports to this JSON file
+    DAWO_BENCHMARK_BASELINE: Compare wall time against an earlier JSON file
+    DAWO_RECORD_CASSETTES: Set to "1" to record live traffic into
+        tests/benchmarks/cassettes/ (credentials: see pipelines.py)
+"""
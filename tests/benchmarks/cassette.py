@@ -0,0 +1,843 @@
+"""Record/replay of scanner traffic for offline pipeline benchmarks.
+
+A Cassette holds the HTTP exchanges and LLM responses one pipeline run
+needs. In record mode every request goes out for real and is captured; in
+replay mode the same requests are answered from the cassette, with an
+optional injected latency, so a run needs no network or credentials.
+
+Captured clients (patched at the transport, so the scanner clients run
+unmodified):
+    - httpx: AsyncHTTPTransport.handle_async_request (Reddit, YouTube,
+      Instagram, PubMed E-utilities)
+    - aiohttp: ClientSession._request (news feeds)
+    - Biopython Entrez: Bio.Entrez.urlopen (legacy PubMedClient)
+    - requests: HTTPAdapter.send (youtube-transcript-api)
+    - LLM clients: wrapped with RecordingLLMClient / ReplayLLMClient
+
+Matching:
+    Requests match on method, host, path, query and body. Secrets (API
+    keys, tokens, passwords) are dropped from the key and redacted in the
+    stored file; time-dependent parameters (publishedAfter, date ranges)
+    are left out of the key so a cassette keeps matching on later days.
+    Interactions added with match="path" (synthetic cassettes) ignore the
+    query and body. Repeated requests are answered in recorded order,
+    wrapping around when the recording runs out.
+
+Usage:
+    cassette = Cassette.load(path)
+    with replay_cassette(cassette, Latency(http=0.05, llm=0.8)) as player:
+        pipeline = build_pipeline(llm_client=ReplayLLMClient(player))
+        await pipeline.execute()
+    print(player.calls)
+
+    cassette = Cassette()
+    with record_cassette(cassette) as recorder:
+        pipeline = build_pipeline(llm_client=RecordingLLMClient(llm, recorder))
+        await pipeline.execute()
+    cassette.save(path)
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+from unittest.mock import patch
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+
+CASSETTE_VERSION = 1
+REDACTED = "REDACTED"
+
+# Query/form parameters and JSON fields never written to a cassette
+SECRET_PARAMS = frozenset({
+    "access_token",
+    "api_key",
+    "client_secret",
+    "email",
+    "key",
+    "password",
+    "refresh_token",
+    "username",
+})
+
+# Parameters derived from the current time; excluded from match keys
+VOLATILE_PARAMS = frozenset({"publishedAfter", "publishedBefore", "mindate", "maxdate"})
+
+# Response headers that describe the wire encoding, not the stored body
+WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class CassetteMiss(LookupError):
+    """Raised when a replayed request has no recorded interaction.
+
+    Attributes:
+        key: Match key of the unanswered request
+    """
+
+    def __init__(self, key: str):
+        super().__init__(f"No recorded interaction for {key}")
+        self.key = key
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Delay injected into every replayed call.
+
+    Attributes:
+        http: Seconds added to each HTTP exchange
+        llm: Seconds added to each LLM call
+        recorded: Use each interaction's recorded duration instead
+        scale: Multiplier applied to recorded durations
+
+    Raises:
+        ValueError: If any delay or the scale is negative
+    """
+
+    http: float = 0.0
+    llm: float = 0.0
+    recorded: bool = False
+    scale: float = 1.0
+
+    def __post_init__(self) -> None:
+        """Validate configuration values."""
+        errors = []
+        if self.http < 0:
+            errors.append(f"http must be >= 0, got {self.http}")
+        if self.llm < 0:
+            errors.append(f"llm must be >= 0, got {self.llm}")
+        if self.scale < 0:
+            errors.append(f"scale must be >= 0, got {self.scale}")
+        if errors:
+            raise ValueError("; ".join(errors))
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        """Build from a spec string.
+
+        Accepted forms: "" (no delay), "recorded", "recorded*0.5",
+        "http=0.05,llm=0.8".
+
+        Args:
+            spec: Latency spec
+
+        Returns:
+            Parsed Latency
+
+        Raises:
+            ValueError: If the spec cannot be parsed
+        """
+        spec = spec.strip()
+        if not spec:
+            return cls()
+        if spec.startswith("recorded"):
+            _, _, scale = spec.partition("*")
+            return cls(recorded=True, scale=float(scale) if scale else 1.0)
+
+        values: dict[str, float] = {}
+        for part in spec.split(","):
+            name, sep, value = part.partition("=")
+            if not sep or name.strip() not in ("http", "llm"):
+                raise ValueError(f"Invalid latency spec: {spec!r}")
+            values[name.strip()] = float(value)
+        return cls(**values)
+
+    def delay(self, kind: str, recorded_duration: float) -> float:
+        """Seconds to wait before answering one call."""
+        if self.recorded:
+            return recorded_duration * self.scale
+        return self.llm if kind == "llm" else self.http
+
+
+@dataclass
+class Interaction:
+    """One recorded request and its response.
+
+    Attributes:
+        kind: "http" or "llm"
+        key: Match key (see request_key / llm_key)
+        request: Redacted request summary (method, url) for humans
+        status: HTTP status code (200 for LLM calls)
+        headers: Response headers
+        body: Response body (text, or base64 when binary)
+        binary: Whether body is base64 encoded
+        duration: Seconds the live call took when recorded
+    """
+
+    kind: str
+    key: str
+    request: dict[str, Any] = field(default_factory=dict)
+    status: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+    body: str = ""
+    binary: bool = False
+    duration: float = 0.0
+
+    @property
+    def content(self) -> bytes:
+        """Response body as bytes."""
+        if self.binary:
+            return base64.b64decode(self.body)
+        return self.body.encode("utf-8")
+
+    @classmethod
+    def from_content(cls, kind: str, key: str, content: bytes, **kwargs: Any) -> "Interaction":
+        """Build with a byte body, stored as text when it is UTF-8."""
+        try:
+            return cls(kind=kind, key=key, body=content.decode("utf-8"), **kwargs)
+        except UnicodeDecodeError:
+            return cls(
+                kind=kind,
+                key=key,
+                body=base64.b64encode(content).decode("ascii"),
+                binary=True,
+                **kwargs,
+            )
+
+
+@dataclass
+class LLMRule:
+    """Canned LLM response for prompts containing a marker.
+
+    Attributes:
+        contains: Substring identifying the prompt template
+        response: Response text returned for matching prompts
+    """
+
+    contains: str
+    response: str
+
+
+class Cassette:
+    """Recorded interactions of one pipeline run.
+
+    Attributes:
+        interactions: Interactions in recorded order
+        llm_rules: Fallback LLM responses by prompt marker
+        origin: "recorded" (live traffic) or "synthetic" (generated)
+        recorded_at: When the cassette was recorded
+    """
+
+    def __init__(
+        self,
+        interactions: Optional[list[Interaction]] = None,
+        llm_rules: Optional[list[LLMRule]] = None,
+        origin: str = "recorded",
+        recorded_at: Optional[datetime] = None,
+    ) -> None:
+        """Create a cassette.
+
+        Args:
+            interactions: Interactions in recorded order
+            llm_rules: Fallback LLM responses by prompt marker
+            origin: "recorded" or "synthetic"
+            recorded_at: Recording time (default: now)
+        """
+        self.interactions = interactions or []
+        self.llm_rules = llm_rules or []
+        self.origin = origin
+        self.recorded_at = recorded_at or datetime.now(timezone.utc)
+
+    @property
+    def age_hours(self) -> float:
+        """Hours since the cassette was recorded."""
+        return (datetime.now(timezone.utc) - self.recorded_at).total_seconds() / 3600
+
+    def add_http(
+        self,
+        method: str,
+        url: str,
+        content: Union[str, bytes, dict, list] = b"",
+        status: int = 200,
+        headers: Optional[dict[str, str]] = None,
+        body: Optional[bytes] = None,
+        match: str = "exact",
+        duration: float = 0.0,
+    ) -> Interaction:
+        """Append an HTTP interaction.
+
+        Args:
+            method: HTTP method
+            url: Full request URL, including query
+            content: Response body (dicts and lists are JSON encoded)
+            status: Response status code
+            headers: Response headers
+            body: Request body
+            match: "exact" or "path" (ignore query and body)
+            duration: Seconds the live call took
+
+        Returns:
+            The appended Interaction
+        """
+        if isinstance(content, (dict, list)):
+            content = json.dumps(content)
+            headers = {"content-type": "application/json", **(headers or {})}
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+
+        key = path_key(method, url) if match == "path" else request_key(method, url, body)
+        interaction = Interaction.from_content(
+            "http",
+            key,
+            content,
+            request={"method": method.upper(), "url": redact_url(url)},
+            status=status,
+            headers={
+                name: value
+                for name, value in (headers or {}).items()
+                if name.lower() not in WIRE_HEADERS
+            },
+            duration=duration,
+        )
+        self.interactions.append(interaction)
+        return interaction
+
+    def add_llm(self, prompt: str, response: str, duration: float = 0.0) -> Interaction:
+        """Append an LLM interaction keyed by its prompt."""
+        interaction = Interaction(kind="llm", key=llm_key(prompt), body=response, duration=duration)
+        self.interactions.append(interaction)
+        return interaction
+
+    def add_llm_rule(self, contains: str, response: Union[str, dict, list]) -> None:
+        """Answer prompts containing a marker with a canned response."""
+        if not isinstance(response, str):
+            response = json.dumps(response)
+        self.llm_rules.append(LLMRule(contains=contains, response=response))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Cassette":
+        """Read a cassette file."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            interactions=[Interaction(**item) for item in data.get("interactions", [])],
+            llm_rules=[LLMRule(**rule) for rule in data.get("llm_rules", [])],
+            origin=data.get("origin", "recorded"),
+            recorded_at=datetime.fromisoformat(data["recorded_at"]),
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the cassette as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CASSETTE_VERSION,
+            "origin": self.origin,
+            "recorded_at": self.recorded_at.isoformat(),
+            "interactions": [vars(item) for item in self.interactions],
+            "llm_rules": [vars(rule) for rule in self.llm_rules],
+        }
+        path.write_text(json.dumps(data, indent=1), encoding="utf-8")
+
+
+# =============================================================================
+# Match keys and redaction
+# =============================================================================
+
+def _params_key(pairs: list[tuple[str, str]]) -> str:
+    """Canonical encoding of the parameters that identify a request."""
+    kept = sorted(
+        (name, value)
+        for name, value in pairs
+        if name not in SECRET_PARAMS and name not in VOLATILE_PARAMS
+    )
+    return urlencode(kept)
+
+
+def _body_key(body: Optional[bytes]) -> str:
+    """Match key component of a request body."""
+    if not body:
+        return ""
+    try:
+        text = body.decode("utf-8")
+    except UnicodeDecodeError:
+        text = None
+    if text is not None and "=" in text and not text.lstrip().startswith(("{", "[")):
+        return _params_key(parse_qsl(text, keep_blank_values=True))
+    return hashlib.sha256(body).hexdigest()[:16]
+
+
+def request_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+    """Match key of an HTTP request (secrets and volatile params dropped)."""
+    parts = urlsplit(url)
+    key = f"{method.upper()} {parts.netloc}{parts.path}"
+    query = _params_key(parse_qsl(parts.query, keep_blank_values=True))
+    if query:
+        key += f"?{query}"
+    body_part = _body_key(body)
+    if body_part:
+        key += f" body:{body_part}"
+    return key
+
+
+def path_key(method: str, url: str) -> str:
+    """Match key ignoring query and body."""
+    parts = urlsplit(url)
+    return f"{method.upper()} {parts.netloc}{parts.path}"
+
+
+def llm_key(prompt: str) -> str:
+    """Match key of an LLM prompt."""
+    return "llm " + hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:32]
+
+
+def redact_url(url: str) -> str:
+    """URL with secret query parameter values replaced."""
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = urlencode([
+        (name, REDACTED if name in SECRET_PARAMS else value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    ])
+    return parts._replace(query=query).geturl()
+
+
+def redact_content(content: bytes) -> bytes:
+    """JSON response body with secret fields replaced (others unchanged)."""
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return content
+
+    def scrub(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                k: REDACTED if k in SECRET_PARAMS else scrub(v)
+                for k, v in value.items()
+            }
+        if isinstance(value, list):
+            return [scrub(v) for v in value]
+        return value
+
+    scrubbed = scrub(data)
+    return content if scrubbed == data else json.dumps(scrubbed).encode("utf-8")
+
+
+def _with_query(url: str, params: Any) -> str:
+    """Append request params (mapping or pairs) to a URL."""
+    if not params:
+        return url
+    pairs = list(params.items()) if hasattr(params, "items") else list(params)
+    query = urlencode([(str(k), str(v)) for k, v in pairs])
+    return f"{url}{'&' if '?' in url else '?'}{query}"
+
+
+# =============================================================================
+# Player and recorder
+# =============================================================================
+
+class CassettePlayer:
+    """Answers requests from a cassette and counts the calls made.
+
+    Attributes:
+        calls: Calls answered, by host (HTTP) or "llm"
+        misses: Match keys of requests with no recorded interaction
+    """
+
+    def __init__(self, cassette: Cassette, latency: Optional[Latency] = None) -> None:
+        """Index a cassette for replay.
+
+        Args:
+            cassette: Cassette to replay
+            latency: Delay injected per call (default: none)
+        """
+        self._cassette = cassette
+        self._latency = latency or Latency()
+        self._by_key: dict[str, list[Interaction]] = {}
+        self._positions: Counter[str] = Counter()
+        for interaction in cassette.interactions:
+            self._by_key.setdefault(interaction.key, []).append(interaction)
+        self.calls: Counter[str] = Counter()
+        self.misses: list[str] = []
+
+    def _next(self, *keys: str) -> Interaction:
+        """Next interaction for the first key that has any."""
+        for key in keys:
+            recorded = self._by_key.get(key)
+            if recorded:
+                position = self._positions[key]
+                self._positions[key] += 1
+                return recorded[position % len(recorded)]
+        self.misses.append(keys[0])
+        raise CassetteMiss(keys[0])
+
+    def match_http(self, method: str, url: str, body: Optional[bytes] = None) -> Interaction:
+        """Find the response for an HTTP request and count the call.
+
+        Raises:
+            CassetteMiss: If nothing was recorded for the request
+        """
+        interaction = self._next(request_key(method, url, body), path_key(method, url))
+        self.calls[urlsplit(url).netloc] += 1
+        return interaction
+
+    def http_delay(self, interaction: Interaction) -> float:
+        """Injected delay for an HTTP interaction."""
+        return self._latency.delay("http", interaction.duration)
+
+    async def llm(self, prompt: str) -> str:
+        """Answer an LLM prompt (recorded response, then rules).
+
+        Raises:
+            CassetteMiss: If no interaction or rule matches the prompt
+        """
+        key = llm_key(prompt)
+        try:
+            interaction = self._next(key)
+            text, duration = interaction.body, interaction.duration
+        except CassetteMiss:
+            rule = next((r for r in self._cassette.llm_rules if r.contains in prompt), None)
+            if rule is None:
+                raise
+            self.misses.pop()
+            text, duration = rule.response, 0.0
+        self.calls["llm"] += 1
+        delay = self._latency.delay("llm", duration)
+        if delay:
+            await asyncio.sleep(delay)
+        return text
+
+
+class CassetteRecorder:
+    """Appends live traffic to a cassette.
+
+    Attributes:
+        cassette: Cassette being recorded
+        calls: Calls recorded, by host (HTTP) or "llm"
+    """
+
+    def __init__(self, cassette: Cassette) -> None:
+        """Record into a cassette.
+
+        Args:
+            cassette: Cassette to append to
+        """
+        self.cassette = cassette
+        self.calls: Counter[str] = Counter()
+
+    def http(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        status: int,
+        headers: dict[str, str],
+        content: bytes,
+        duration: float,
+    ) -> None:
+        """Record one HTTP exchange."""
+        self.cassette.add_http(
+            method,
+            url,
+            redact_content(content),
+            status=status,
+            headers=headers,
+            body=body,
+            duration=duration,
+        )
+        self.calls[urlsplit(url).netloc] += 1
+
+    def llm(self, prompt: str, response: str, duration: float) -> None:
+        """Record one LLM call."""
+        self.cassette.add_llm(prompt, response, duration)
+        self.calls["llm"] += 1
+
+
+class ReplayLLMClient:
+    """LLM client answering from a cassette.
+
+    Accepts both generate(prompt, max_tokens=...) and
+    generate(prompt, system=...) call styles used by the agents.
+    """
+
+    def __init__(self, player: CassettePlayer) -> None:
+        self._player = player
+
+    async def generate(self, prompt: str, *args: Any, **kwargs: Any) -> str:
+        """Return the recorded response for a prompt."""
+        return await self._player.llm(prompt)
+
+
+class RecordingLLMClient:
+    """LLM client wrapper recording every response into a cassette."""
+
+    def __init__(self, inner: Any, recorder: CassetteRecorder) -> None:
+        self._inner = inner
+        self._recorder = recorder
+
+    async def generate(self, prompt: str, *args: Any, **kwargs: Any) -> str:
+        """Call the wrapped client and record its response."""
+        started = time.perf_counter()
+        response = await self._inner.generate(prompt, *args, **kwargs)
+        self._recorder.llm(prompt, response, time.perf_counter() - started)
+        return response
+
+
+# =============================================================================
+# Transport patches
+# =============================================================================
+
+def _httpx_patch(player: Optional[CassettePlayer], recorder: Optional[CassetteRecorder]) -> Any:
+    """Patch httpx's async transport (None if httpx is not installed)."""
+    try:
+        import httpx
+    except ImportError:
+        return None
+    original = httpx.AsyncHTTPTransport.handle_async_request
+
+    async def handle(transport: Any, request: Any) -> Any:
+        url = str(request.url)
+        body = await request.aread()
+        if player is not None:
+            try:
+                interaction = player.match_http(request.method, url, body)
+            except CassetteMiss as e:
+                raise httpx.ConnectError(str(e), request=request) from e
+            delay = player.http_delay(interaction)
+            if delay:
+                await asyncio.sleep(delay)
+            return httpx.Response(
+                interaction.status,
+                headers=interaction.headers,
+                content=interaction.content,
+                request=request,
+            )
+
+        started = time.perf_counter()
+        response = await original(transport, request)
+        # Transport responses are still encoded; aread() decodes them
+        content = await response.aread()
+        headers = {
+            k: v for k, v in response.headers.items() if k.lower() not in WIRE_HEADERS
+        }
+        recorder.http(
+            request.method, url, body, response.status_code, headers, content,
+            time.perf_counter() - started,
+        )
+        return httpx.Response(
+            response.status_code, headers=headers, content=content, request=request
+        )
+
+    return patch.object(httpx.AsyncHTTPTransport, "handle_async_request", handle)
+
+
+class _ReplayedAiohttpResponse:
+    """Minimal aiohttp.ClientResponse stand-in for replayed feeds."""
+
+    def __init__(self, url: str, interaction: Interaction) -> None:
+        from multidict import CIMultiDict, CIMultiDictProxy
+
+        self.url = url
+        self.status = interaction.status
+        self.headers = CIMultiDictProxy(CIMultiDict(interaction.headers))
+        self._content = interaction.content
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    async def read(self) -> bytes:
+        return self._content
+
+    async def text(self, encoding: Optional[str] = None, errors: str = "strict") -> str:
+        return self._content.decode(encoding or "utf-8", errors)
+
+    async def json(self, **kwargs: Any) -> Any:
+        return json.loads(self._content)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise RuntimeError(f"HTTP {self.status} from {self.url}")
+
+    def release(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+    async def wait_for_close(self) -> None:
+        return None
+
+    async def __aenter__(self) -> "_ReplayedAiohttpResponse":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+def _aiohttp_patch(player: Optional[CassettePlayer], recorder: Optional[CassetteRecorder]) -> Any:
+    """Patch aiohttp's session request (None if aiohttp is not installed)."""
+    try:
+        import aiohttp
+    except ImportError:
+        return None
+    original = aiohttp.ClientSession._request
+
+    async def request(session: Any, method: str, str_or_url: Any, **kwargs: Any) -> Any:
+        url = _with_query(str(str_or_url), kwargs.get("params"))
+        data = kwargs.get("data")
+        body = data.encode("utf-8") if isinstance(data, str) else data if isinstance(data, bytes) else None
+        if player is not None:
+            try:
+                interaction = player.match_http(method, url, body)
+            except CassetteMiss as e:
+                raise aiohttp.ClientConnectionError(str(e)) from e
+            delay = player.http_delay(interaction)
+            if delay:
+                await asyncio.sleep(delay)
+            return _ReplayedAiohttpResponse(url, interaction)
+
+        started = time.perf_counter()
+        response = await original(session, method, str_or_url, **kwargs)
+        content = await response.read()  # Cached on the response for the caller
+        recorder.http(
+            method, url, body, response.status, dict(response.headers), content,
+            time.perf_counter() - started,
+        )
+        return response
+
+    return patch.object(aiohttp.ClientSession, "_request", request)
+
+
+def _entrez_patch(player: Optional[CassettePlayer], recorder: Optional[CassetteRecorder]) -> Any:
+    """Patch Biopython's Entrez opener (None if Biopython is not installed)."""
+    try:
+        from Bio import Entrez
+    except ImportError:
+        return None
+    import email
+    import http.client
+    import urllib.error
+    from urllib.response import addinfourl
+
+    original = Entrez.urlopen
+
+    def response_for(url: str, status: int, headers: dict[str, str], content: bytes) -> Any:
+        message = email.message_from_string(
+            "".join(f"{k}: {v}\n" for k, v in headers.items()),
+            _class=http.client.HTTPMessage,
+        )
+        return addinfourl(io.BytesIO(content), message, url, status)
+
+    def urlopen(request: Any, *args: Any, **kwargs: Any) -> Any:
+        url = request.get_full_url() if hasattr(request, "get_full_url") else str(request)
+        method = request.get_method() if hasattr(request, "get_method") else "GET"
+        body = getattr(request, "data", None)
+        if player is not None:
+            try:
+                interaction = player.match_http(method, url, body)
+            except CassetteMiss as e:
+                raise urllib.error.URLError(str(e)) from e
+            delay = player.http_delay(interaction)
+            if delay:
+                time.sleep(delay)  # Entrez runs in a worker thread
+            return response_for(url, interaction.status, interaction.headers, interaction.content)
+
+        started = time.perf_counter()
+        handle = original(request, *args, **kwargs)
+        content = handle.read()
+        headers = dict(handle.headers.items())
+        status = getattr(handle, "status", 200)
+        recorder.http(method, url, body, status, headers, content, time.perf_counter() - started)
+        return response_for(url, status, headers, content)
+
+    return patch.object(Entrez, "urlopen", urlopen)
+
+
+def _requests_patch(player: Optional[CassettePlayer], recorder: Optional[CassetteRecorder]) -> Any:
+    """Patch requests' adapter (None if requests is not installed)."""
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from requests.structures import CaseInsensitiveDict
+    except ImportError:
+        return None
+    original = HTTPAdapter.send
+
+    def build(request: Any, status: int, headers: dict[str, str], content: bytes) -> Any:
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = content
+        response.url = request.url
+        response.request = request
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers) or "utf-8"
+        return response
+
+    def send(adapter: Any, request: Any, *args: Any, **kwargs: Any) -> Any:
+        body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+        if player is not None:
+            try:
+                interaction = player.match_http(request.method, request.url, body)
+            except CassetteMiss as e:
+                raise requests.ConnectionError(str(e), request=request) from e
+            delay = player.http_delay(interaction)
+            if delay:
+                time.sleep(delay)  # requests runs in a worker thread
+            return build(request, interaction.status, interaction.headers, interaction.content)
+
+        started = time.perf_counter()
+        response = original(adapter, request, *args, **kwargs)
+        content = response.content
+        headers = {
+            k: v for k, v in response.headers.items() if k.lower() not in WIRE_HEADERS
+        }
+        recorder.http(
+            request.method, request.url, body, response.status_code, headers, content,
+            time.perf_counter() - started,
+        )
+        return build(request, response.status_code, headers, content)
+
+    return patch.object(HTTPAdapter, "send", send)
+
+
+_PATCHES = (_httpx_patch, _aiohttp_patch, _entrez_patch, _requests_patch)
+
+
+@contextmanager
+def replay_cassette(
+    cassette: Cassette,
+    latency: Optional[Latency] = None,
+) -> Iterator[CassettePlayer]:
+    """Answer all captured clients' requests from a cassette.
+
+    Args:
+        cassette: Cassette to replay
+        latency: Delay injected per call (default: none)
+
+    Yields:
+        CassettePlayer with call counts and misses
+    """
+    player = CassettePlayer(cassette, latency)
+    with ExitStack() as stack:
+        for make_patch in _PATCHES:
+            patcher = make_patch(player, None)
+            if patcher is not None:
+                stack.enter_context(patcher)
+        yield player
+
+
+@contextmanager
+def record_cassette(cassette: Cassette) -> Iterator[CassetteRecorder]:
+    """Send all captured clients' requests for real and record them.
+
+    Args:
+        cassette: Cassette to append to
+
+    Yields:
+        CassetteRecorder with call counts
+    """
+    recorder = CassetteRecorder(cassette)
+    with ExitStack() as stack:
+        for make_patch in _PATCHES:
+            patcher = make_patch(None, recorder)
+            if patcher is not None:
+                stack.enter_context(patcher)
+        yield recorder
@@ -0,0 +1,55 @@
+"""Benchmark suite settings and end-of-session report."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from .harness import BenchmarkReport, compare, format_reports
+
+REPORTS_KEY = pytest.StashKey[list[BenchmarkReport]]()
+
+
+def pytest_configure(config):
+    """Register the marker and the session's report list."""
+    config.addinivalue_line("markers", "benchmark: offline scanner pipeline benchmark")
+    config.stash[REPORTS_KEY] = []
+
+
+@pytest.fixture(scope="session")
+def benchmark_settings():
+    """Suite settings from DAWO_* environment variables."""
+    from .pipelines import BenchmarkSettings
+
+    return BenchmarkSettings.from_env()
+
+
+@pytest.fixture
+def benchmark_reports(request) -> list[BenchmarkReport]:
+    """Collected reports, printed and written at the end of the session."""
+    return request.config.stash[REPORTS_KEY]
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the report table and write DAWO_BENCHMARK_JSON."""
+    reports = config.stash.get(REPORTS_KEY, [])
+    if not reports:
+        return
+
+    baseline = None
+    baseline_path = os.environ.get("DAWO_BENCHMARK_BASELINE")
+    if baseline_path:
+        baseline = compare(reports, json.loads(Path(baseline_path).read_text(encoding="utf-8")))
+
+    terminalreporter.section("scanner pipeline benchmarks")
+    for line in format_reports(reports, baseline):
+        terminalreporter.write_line(line)
+
+    output = os.environ.get("DAWO_BENCHMARK_JSON")
+    if output:
+        Path(output).write_text(
+            json.dumps({"reports": [report.to_dict() for report in reports]}, indent=2),
+            encoding="utf-8",
+        )
+        terminalreporter.write_line(f"wrote {output}")
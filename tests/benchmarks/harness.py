@@ -0,0 +1,227 @@
+"""Timing and resource measurement for scanner pipeline benchmarks.
+
+run_benchmark executes one pipeline and reports:
+    - Wall time of pipeline.execute()
+    - Time spent in each stage (scanner, harvester, ..., publisher),
+      measured by wrapping the pipeline's stage attributes
+    - Calls made, by host and LLM, as answered by the cassette
+    - Peak RSS of the benchmark process
+
+Peak RSS is the process high-water mark, so it only grows across
+benchmarks in one session; run a single pipeline (-k reddit) for an
+isolated figure.
+
+Reports are plain dataclasses; to_dict() output is what the suite writes
+to DAWO_BENCHMARK_JSON, and compare() diffs it against a baseline file.
+"""
+
+import asyncio
+import functools
+import sys
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional, Union
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+
+# Pipeline attributes holding stages, in execution order
+STAGE_ATTRIBUTES = (
+    "_scanner",
+    "_harvester",
+    "_summarizer",
+    "_claim_validator",
+    "_transformer",
+    "_validator",
+    "_scorer",
+    "_publisher",
+)
+
+
+@dataclass
+class BenchmarkReport:
+    """Measurements of one pipeline run.
+
+    Attributes:
+        pipeline: Pipeline name (reddit, youtube, ...)
+        cassette: Cassette origin (recorded or synthetic)
+        status: PipelineResult status
+        wall_seconds: Wall time of pipeline.execute()
+        stage_seconds: Time spent inside each stage's methods
+        calls: Calls made, by host or "llm"
+        peak_rss_bytes: Process peak RSS after the run (None if unknown)
+        published: Items the pipeline published
+        cassette_misses: Requests the cassette could not answer
+    """
+
+    pipeline: str
+    cassette: str
+    status: str
+    wall_seconds: float
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    calls: dict[str, int] = field(default_factory=dict)
+    peak_rss_bytes: Optional[int] = None
+    published: int = 0
+    cassette_misses: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form."""
+        return asdict(self)
+
+
+class _TimedStage:
+    """Proxy adding the time spent in a stage's methods to a StageTimer."""
+
+    def __init__(self, name: str, target: Any, seconds: dict[str, float]) -> None:
+        self._name = name
+        self._target = target
+        self._seconds = seconds
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._target, attr)
+        if not callable(value):
+            return value
+
+        name, seconds = self._name, self._seconds
+
+        @functools.wraps(value)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                result = value(*args, **kwargs)
+            except BaseException:
+                seconds[name] += time.perf_counter() - started
+                raise
+            if not asyncio.iscoroutine(result):
+                seconds[name] += time.perf_counter() - started
+                return result
+
+            async def finish() -> Any:
+                try:
+                    return await result
+                finally:
+                    seconds[name] += time.perf_counter() - started
+
+            return finish()
+
+        return timed
+
+
+class StageTimer:
+    """Accumulates time spent in each pipeline stage.
+
+    Attributes:
+        seconds: Stage name -> seconds spent in its methods
+    """
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = defaultdict(float)
+
+    def instrument(self, pipeline: Any) -> None:
+        """Wrap a pipeline's stage attributes with timing proxies."""
+        for attribute in STAGE_ATTRIBUTES:
+            stage = getattr(pipeline, attribute, None)
+            if stage is not None:
+                name = attribute.lstrip("_")
+                setattr(pipeline, attribute, _TimedStage(name, stage, self.seconds))
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, or None if unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+async def run_benchmark(
+    name: str,
+    pipeline: Any,
+    player: Any,
+    cassette_origin: str,
+) -> BenchmarkReport:
+    """Execute a pipeline and measure it.
+
+    Args:
+        name: Pipeline name for the report
+        pipeline: Pipeline with stage attributes and an execute() coroutine
+        player: CassettePlayer (or recorder) exposing calls and misses
+        cassette_origin: Cassette origin for the report
+
+    Returns:
+        BenchmarkReport for the run
+    """
+    timer = StageTimer()
+    timer.instrument(pipeline)
+
+    started = time.perf_counter()
+    result = await pipeline.execute()
+    wall = time.perf_counter() - started
+
+    status = getattr(result.status, "value", result.status)
+    return BenchmarkReport(
+        pipeline=name,
+        cassette=cassette_origin,
+        status=str(status),
+        wall_seconds=round(wall, 4),
+        stage_seconds={k: round(v, 4) for k, v in timer.seconds.items()},
+        calls=dict(player.calls),
+        peak_rss_bytes=peak_rss_bytes(),
+        published=getattr(result.statistics, "published", 0),
+        cassette_misses=len(getattr(player, "misses", [])),
+    )
+
+
+def format_reports(
+    reports: list[BenchmarkReport],
+    baseline: Optional[dict[str, dict[str, Any]]] = None,
+) -> list[str]:
+    """Render reports as a text table, with deltas against a baseline.
+
+    Args:
+        reports: Reports to render
+        baseline: Pipeline name -> report dict from an earlier run
+
+    Returns:
+        Table lines
+    """
+    lines = [
+        f"{'pipeline':<10} {'status':<14} {'wall s':>9} {'vs base':>8} "
+        f"{'calls':>6} {'rss MiB':>8}  stages (s)"
+    ]
+    for report in reports:
+        previous = (baseline or {}).get(report.pipeline)
+        delta = ""
+        if previous and previous.get("wall_seconds"):
+            change = report.wall_seconds / previous["wall_seconds"] - 1
+            delta = f"{change:+.1%}"
+        rss = f"{report.peak_rss_bytes / 2**20:.0f}" if report.peak_rss_bytes else "-"
+        stages = " ".join(f"{k}={v:.3f}" for k, v in report.stage_seconds.items())
+        lines.append(
+            f"{report.pipeline:<10} {report.status:<14} {report.wall_seconds:>9.3f} "
+            f"{delta:>8} {sum(report.calls.values()):>6} {rss:>8}  {stages}"
+        )
+    return lines
+
+
+def compare(
+    reports: list[BenchmarkReport],
+    baseline: Union[list[dict[str, Any]], dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """Index a baseline JSON document by pipeline name.
+
+    Args:
+        reports: Current reports (only their pipelines are kept)
+        baseline: Contents of an earlier DAWO_BENCHMARK_JSON file
+
+    Returns:
+        Pipeline name -> baseline report dict
+    """
+    entries = baseline.get("reports", []) if isinstance(baseline, dict) else baseline
+    wanted = {report.pipeline for report in reports}
+    return {entry["pipeline"]: entry for entry in entries if entry.get("pipeline") in wanted}
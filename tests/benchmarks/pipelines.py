@@ -0,0 +1,460 @@
+"""Benchmark wiring of the five scanner pipelines.
+
+Each builder assembles a pipeline the way Team Builder does: real clients,
+scanners, harvesters, transformers, validators (EU compliance from
+config/dawo_compliance_rules.json, pattern-only) and the real
+ResearchItemScorer. Only the Research Pool publisher is replaced, by an
+in-memory one, so numbers measure the scanner side and not a database.
+
+run_pipeline picks the cassette (recorded file if present, otherwise
+synthetic), replays or records it, and returns a BenchmarkReport.
+
+Recording needs live credentials in the environment:
+    REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USERNAME, REDDIT_PASSWORD,
+    YOUTUBE_API_KEY, INSTAGRAM_ACCESS_TOKEN, INSTAGRAM_BUSINESS_ACCOUNT_ID,
+    PUBMED_EMAIL, PUBMED_API_KEY (optional)
+and, to record real LLM responses, DAWO_BENCHMARK_LLM=package.module:factory
+naming a callable that returns an LLM client. Without it, LLM calls are
+answered by the synthetic rules while HTTP traffic is recorded.
+"""
+
+import importlib
+import json
+import math
+import os
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+from uuid import uuid4
+
+from teams.dawo.middleware.retry import RetryConfig, RetryMiddleware
+from teams.dawo.research.scoring import (
+    ComplianceAdjuster,
+    EngagementConfig,
+    EngagementScorer,
+    RecencyConfig,
+    RecencyScorer,
+    RelevanceConfig,
+    RelevanceScorer,
+    ResearchItemScorer,
+    ScoringConfig,
+    SourceQualityConfig,
+    SourceQualityScorer,
+)
+from teams.dawo.validators.eu_compliance import EUComplianceChecker
+from teams.dawo.validators.research_compliance import ResearchComplianceValidator
+
+from . import synthetic
+from .cassette import (
+    Cassette,
+    CassettePlayer,
+    Latency,
+    RecordingLLMClient,
+    ReplayLLMClient,
+    record_cassette,
+    replay_cassette,
+)
+from .harness import BenchmarkReport, run_benchmark
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+CASSETTE_DIR = Path(__file__).resolve().parent / "cassettes"
+COMPLIANCE_RULES_PATH = REPO_ROOT / "config" / "dawo_compliance_rules.json"
+
+PIPELINES = ("reddit", "youtube", "instagram", "news", "pubmed")
+
+# Same accounts when recording and replaying, so request keys match
+BENCHMARK_COMPETITORS = ["foursigmatic", "hostdefense"]
+
+# Fast retries: a cassette miss should fail the run, not stall it
+REPLAY_RETRY_CONFIG = RetryConfig(max_retries=1, base_delay=0.01, max_delay=0.01)
+
+
+@dataclass(frozen=True)
+class BenchmarkSettings:
+    """How the suite runs, read from the environment.
+
+    Attributes:
+        latency: Delay injected per replayed call (DAWO_BENCHMARK_LATENCY)
+        record: Record live traffic instead of replaying (DAWO_RECORD_CASSETTES=1)
+        cassette_dir: Where recorded cassettes are read and written
+    """
+
+    latency: Latency = Latency()
+    record: bool = False
+    cassette_dir: Path = CASSETTE_DIR
+
+    @classmethod
+    def from_env(cls) -> "BenchmarkSettings":
+        """Read settings from DAWO_* environment variables."""
+        return cls(
+            latency=Latency.parse(os.environ.get("DAWO_BENCHMARK_LATENCY", "")),
+            record=os.environ.get("DAWO_RECORD_CASSETTES") == "1",
+            cassette_dir=Path(os.environ.get("DAWO_CASSETTE_DIR", CASSETTE_DIR)),
+        )
+
+
+class InMemoryPublisher:
+    """Research Pool publisher stand-in that keeps items in a list.
+
+    publish_batch returns a count (reddit, youtube, instagram pipelines) or
+    one record per item (news, pubmed pipelines), matching each pipeline's
+    publisher protocol.
+    """
+
+    def __init__(self, batch_returns_items: bool = False) -> None:
+        self.items: list[Any] = []
+        self._batch_returns_items = batch_returns_items
+
+    async def publish(self, item: Any) -> Any:
+        self.items.append(item)
+        return SimpleNamespace(id=uuid4())
+
+    async def publish_batch(self, items: list[Any]) -> Any:
+        records = [await self.publish(item) for item in items]
+        return records if self._batch_returns_items else len(records)
+
+
+class ItemScorer:
+    """ResearchItemScorer adapter for pipelines that score item objects.
+
+    The news pipeline calls calculate_score(item) and the pubmed pipeline
+    score(item) with ValidatedResearch objects; the scorer takes dicts.
+    """
+
+    def __init__(self, scorer: ResearchItemScorer) -> None:
+        self._scorer = scorer
+
+    def calculate_score(self, item: Any) -> Any:
+        if not isinstance(item, dict):
+            item = {
+                "title": item.title,
+                "content": item.content,
+                "source": item.source,
+                "source_metadata": item.source_metadata,
+                "tags": item.tags,
+                "created_at": item.created_at,
+                "compliance_status": item.compliance_status,
+            }
+        return self._scorer.calculate_score(item)
+
+    score = calculate_score
+
+
+class PassthroughRetry:
+    """Retry adapter for NewsFeedClient, which calls execute(func, *args)."""
+
+    async def execute(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        return await func(*args, **kwargs)
+
+
+def _scorer() -> ResearchItemScorer:
+    """Composite scorer with default configuration."""
+    return ResearchItemScorer(
+        config=ScoringConfig(),
+        relevance_scorer=RelevanceScorer(config=RelevanceConfig()),
+        recency_scorer=RecencyScorer(config=RecencyConfig()),
+        source_quality_scorer=SourceQualityScorer(config=SourceQualityConfig()),
+        engagement_scorer=EngagementScorer(config=EngagementConfig()),
+        compliance_adjuster=ComplianceAdjuster(),
+    )
+
+
+def _research_compliance() -> ResearchComplianceValidator:
+    """Pattern-only EU compliance validation with the shipped rules."""
+    rules = json.loads(COMPLIANCE_RULES_PATH.read_text(encoding="utf-8"))
+    return ResearchComplianceValidator(compliance_checker=EUComplianceChecker(rules))
+
+
+def _env(name: str, default: str) -> str:
+    """Credential from the environment (placeholder when replaying)."""
+    return os.environ.get(name) or default
+
+
+def _widen(base: int, age_hours: float, unit_hours: int = 1) -> int:
+    """Extend a lookback window so a recorded cassette's items stay in range."""
+    return base + math.ceil(age_hours / unit_hours)
+
+
+# =============================================================================
+# Pipeline builders
+# =============================================================================
+
+@asynccontextmanager
+async def reddit_pipeline(
+    llm_client: Any,
+    retry: RetryMiddleware,
+    age_hours: float,
+    workdir: Path,
+) -> AsyncIterator[Any]:
+    """Reddit pipeline with a live RedditClient."""
+    from teams.dawo.scanners.reddit import (
+        RedditClient,
+        RedditClientConfig,
+        RedditHarvester,
+        RedditResearchPipeline,
+        RedditScanner,
+        RedditScannerConfig,
+        RedditTransformer,
+        RedditValidator,
+    )
+
+    client_config = RedditClientConfig(
+        client_id=_env("REDDIT_CLIENT_ID", "benchmark"),
+        client_secret=_env("REDDIT_CLIENT_SECRET", "benchmark"),
+        username=_env("REDDIT_USERNAME", "benchmark"),
+        password=_env("REDDIT_PASSWORD", "benchmark"),
+    )
+    # "week" skips the client-side 24h cutoff, so recorded posts keep matching
+    config = RedditScannerConfig(time_filter="week")
+    async with RedditClient(client_config, retry) as client:
+        yield RedditResearchPipeline(
+            RedditScanner(config, client),
+            RedditHarvester(client),
+            RedditTransformer(),
+            RedditValidator(_research_compliance()),
+            _scorer(),
+            InMemoryPublisher(),
+        )
+
+
+@asynccontextmanager
+async def youtube_pipeline(
+    llm_client: Any,
+    retry: RetryMiddleware,
+    age_hours: float,
+    workdir: Path,
+    transcripts: Optional[dict[str, str]] = None,
+) -> AsyncIterator[Any]:
+    """YouTube pipeline; transcripts optionally pre-seeded in the cache."""
+    from teams.dawo.scanners.youtube import (
+        KeyInsightExtractor,
+        TranscriptCache,
+        TranscriptClient,
+        TranscriptResult,
+        YouTubeClient,
+        YouTubeClientConfig,
+        YouTubeHarvester,
+        YouTubeScanner,
+        YouTubeScannerConfig,
+        YouTubeResearchPipeline,
+        YouTubeTransformer,
+        YouTubeValidator,
+    )
+
+    config = YouTubeScannerConfig(days_back=_widen(7, age_hours, unit_hours=24))
+    cache = TranscriptCache(workdir / "transcripts")
+    for video_id, text in (transcripts or {}).items():
+        await cache.put(video_id, TranscriptResult(text=text, language="en", available=True))
+
+    async with YouTubeClient(YouTubeClientConfig(api_key=_env("YOUTUBE_API_KEY", "benchmark")), retry) as client:
+        yield YouTubeResearchPipeline(
+            YouTubeScanner(config, client),
+            YouTubeHarvester(client, TranscriptClient(config.transcript_config, retry, cache=cache), config),
+            YouTubeTransformer(KeyInsightExtractor(llm_client)),
+            YouTubeValidator(_research_compliance()),
+            _scorer(),
+            InMemoryPublisher(),
+        )
+
+
+@asynccontextmanager
+async def instagram_pipeline(
+    llm_client: Any,
+    retry: RetryMiddleware,
+    age_hours: float,
+    workdir: Path,
+) -> AsyncIterator[Any]:
+    """Instagram pipeline with a live InstagramClient."""
+    from teams.dawo.scanners.instagram import (
+        HealthClaimDetector,
+        InstagramClient,
+        InstagramClientConfig,
+        InstagramHarvester,
+        InstagramResearchPipeline,
+        InstagramScanner,
+        InstagramScannerConfig,
+        InstagramTransformer,
+        InstagramValidator,
+        ThemeExtractor,
+    )
+
+    client_config = InstagramClientConfig(
+        access_token=_env("INSTAGRAM_ACCESS_TOKEN", "benchmark"),
+        business_account_id=_env("INSTAGRAM_BUSINESS_ACCOUNT_ID", "17840000000000000"),
+    )
+    config = InstagramScannerConfig(
+        competitor_accounts=BENCHMARK_COMPETITORS,
+        hours_back=_widen(24, age_hours),
+    )
+    async with InstagramClient(client_config, retry) as client:
+        yield InstagramResearchPipeline(
+            InstagramScanner(config, client),
+            InstagramHarvester(client),
+            InstagramTransformer(ThemeExtractor(llm_client), HealthClaimDetector(llm_client)),
+            InstagramValidator(_research_compliance()),
+            _scorer(),
+            InMemoryPublisher(),
+        )
+
+
+@asynccontextmanager
+async def news_pipeline(
+    llm_client: Any,
+    retry: RetryMiddleware,
+    age_hours: float,
+    workdir: Path,
+) -> AsyncIterator[Any]:
+    """News pipeline with a live NewsFeedClient."""
+    from teams.dawo.scanners.news import (
+        NewsCategorizer,
+        NewsFeedClient,
+        NewsFeedClientConfig,
+        NewsHarvester,
+        NewsPriorityScorer,
+        NewsResearchPipeline,
+        NewsScanner,
+        NewsScannerConfig,
+        NewsTransformer,
+        NewsValidator,
+    )
+
+    config = NewsScannerConfig(hours_back=_widen(24, age_hours))
+    client = NewsFeedClient(NewsFeedClientConfig(), PassthroughRetry())
+    yield NewsResearchPipeline(
+        NewsScanner(config, client),
+        NewsHarvester(),
+        NewsTransformer(NewsCategorizer(config.competitor_brands), NewsPriorityScorer()),
+        NewsValidator(_research_compliance()),
+        ItemScorer(_scorer()),
+        InMemoryPublisher(batch_returns_items=True),
+    )
+
+
+@asynccontextmanager
+async def pubmed_pipeline(
+    llm_client: Any,
+    retry: RetryMiddleware,
+    age_hours: float,
+    workdir: Path,
+) -> AsyncIterator[Any]:
+    """PubMed pipeline with the E-utilities (httpx) client."""
+    from teams.dawo.scanners.pubmed import (
+        AsyncPubMedClient,
+        ClaimValidator,
+        EntrezConfig,
+        FindingSummarizer,
+        PubMedHarvester,
+        PubMedResearchPipeline,
+        PubMedScanner,
+        PubMedScannerConfig,
+        PubMedTransformer,
+        PubMedValidator,
+    )
+
+    entrez = EntrezConfig(
+        email=_env("PUBMED_EMAIL", "benchmark@example.com"),
+        api_key=os.environ.get("PUBMED_API_KEY"),
+    )
+    config = PubMedScannerConfig(email=entrez.email, api_key=entrez.api_key)
+    async with AsyncPubMedClient(entrez, retry) as client:
+        yield PubMedResearchPipeline(
+            PubMedScanner(config, client),
+            PubMedHarvester(),
+            FindingSummarizer(llm_client),
+            ClaimValidator(llm_client),
+            PubMedTransformer(),
+            PubMedValidator(_research_compliance()),
+            ItemScorer(_scorer()),
+            InMemoryPublisher(batch_returns_items=True),
+        )
+
+
+BUILDERS = {
+    "reddit": reddit_pipeline,
+    "youtube": youtube_pipeline,
+    "instagram": instagram_pipeline,
+    "news": news_pipeline,
+    "pubmed": pubmed_pipeline,
+}
+
+
+def synthetic_cassette(name: str) -> tuple[Cassette, dict[str, Any]]:
+    """Synthetic cassette for a pipeline, plus extra builder arguments."""
+    if name == "reddit":
+        from teams.dawo.scanners.reddit import RedditScannerConfig
+
+        config = RedditScannerConfig()
+        return synthetic.reddit_cassette(config.subreddits, config.keywords), {}
+    if name == "youtube":
+        from teams.dawo.scanners.youtube import YouTubeScannerConfig
+
+        cassette, transcripts = synthetic.youtube_cassette(YouTubeScannerConfig().search_queries)
+        return cassette, {"transcripts": transcripts}
+    if name == "instagram":
+        from teams.dawo.scanners.instagram import InstagramScannerConfig
+
+        return synthetic.instagram_cassette(
+            InstagramScannerConfig().hashtags,
+            BENCHMARK_COMPETITORS,
+            _env("INSTAGRAM_BUSINESS_ACCOUNT_ID", "17840000000000000"),
+        ), {}
+    if name == "news":
+        from teams.dawo.scanners.news import NewsScannerConfig
+
+        return synthetic.news_cassette([feed.url for feed in NewsScannerConfig().feeds]), {}
+    if name == "pubmed":
+        from teams.dawo.scanners.pubmed import PubMedScannerConfig
+
+        config = PubMedScannerConfig(email="benchmark@example.com")
+        return synthetic.pubmed_cassette(config.search_queries), {}
+    raise ValueError(f"Unknown pipeline: {name}")
+
+
+def _live_llm_client() -> Any:
+    """LLM client from DAWO_BENCHMARK_LLM, or synthetic rules if unset."""
+    target = os.environ.get("DAWO_BENCHMARK_LLM")
+    if not target:
+        return ReplayLLMClient(CassettePlayer(synthetic.rules_cassette()))
+    module_name, _, factory = target.partition(":")
+    return getattr(importlib.import_module(module_name), factory)()
+
+
+async def run_pipeline(
+    name: str,
+    settings: BenchmarkSettings,
+    workdir: Path,
+) -> BenchmarkReport:
+    """Benchmark one pipeline against its cassette (or record one).
+
+    Args:
+        name: Pipeline name (see PIPELINES)
+        settings: Suite settings
+        workdir: Scratch directory for caches
+
+    Returns:
+        BenchmarkReport for the run
+    """
+    path = settings.cassette_dir / f"{name}.json"
+    builder = BUILDERS[name]
+
+    if settings.record:
+        cassette = Cassette()
+        with record_cassette(cassette) as recorder:
+            llm = RecordingLLMClient(_live_llm_client(), recorder)
+            async with builder(llm, RetryMiddleware(RetryConfig()), 0.0, workdir) as pipeline:
+                report = await run_benchmark(name, pipeline, recorder, "recording")
+        cassette.save(path)
+        return report
+
+    if path.exists():
+        cassette, extra = Cassette.load(path), {}
+    else:
+        cassette, extra = synthetic_cassette(name)
+
+    with replay_cassette(cassette, settings.latency) as player:
+        retry = RetryMiddleware(REPLAY_RETRY_CONFIG)
+        async with builder(ReplayLLMClient(player), retry, cassette.age_hours, workdir, **extra) as pipeline:
+            return await run_benchmark(name, pipeline, player, cassette.origin)
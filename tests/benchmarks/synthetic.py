@@ -0,0 +1,416 @@
+"""Generated cassettes for benchmarking without recorded traffic.
+
+Each builder returns a Cassette shaped like the live API's responses for
+a given scanner configuration, so the benchmark suite runs out of the box.
+Timestamps are relative to now, so every item passes the scanners'
+recency filters. Interactions match on path (query and body ignored);
+repeated requests to one path get successive responses.
+
+Content is deterministic (seeded) so runs are comparable. Recorded
+cassettes in tests/benchmarks/cassettes/ take precedence when present.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Sequence
+from xml.sax.saxutils import escape
+
+from .cassette import Cassette
+
+
+SEED = 2026
+
+MUSHROOMS = ["lion's mane", "chaga", "reishi", "cordyceps", "shiitake", "maitake"]
+TOPICS = ["focus", "sleep", "energy", "immunity", "stress", "morning routine", "dosage"]
+
+# Canned LLM responses, keyed by a marker unique to each prompt template
+LLM_RULES = {
+    "quotable_insights": {
+        "main_summary": "Overview of functional mushroom research and daily use.",
+        "quotable_insights": [
+            {
+                "text": "Most studies on lion's mane are still small.",
+                "context": "Discussing the state of the research",
+                "topic": "research",
+                "is_claim": False,
+            }
+        ],
+        "key_topics": ["lions_mane", "research", "cognition"],
+        "confidence_score": 0.82,
+    },
+    "Generate 3-7 relevant tags": ["lions_mane", "research", "educational"],
+    "messaging_patterns": {
+        "content_type": "educational",
+        "messaging_patterns": ["personal_story"],
+        "detected_products": [],
+        "influencer_indicators": False,
+        "key_topics": ["lions_mane", "focus", "wellness"],
+        "confidence_score": 0.78,
+    },
+    "claims_detected": {
+        "claims_detected": [],
+        "requires_cleanmarket_review": False,
+        "overall_risk_level": "none",
+        "summary": "No health claims found",
+    },
+    "lowercase tags": ["lions_mane", "wellness", "morning_routine"],
+    "compound_studied": {
+        "compound_studied": "Hericium erinaceus",
+        "effect_measured": "cognitive function",
+        "key_findings": "Participants showed modest improvements on cognitive tests.",
+        "statistical_significance": "p<0.05, n=77",
+        "study_strength": "moderate",
+        "content_potential": ["educational", "citation_worthy"],
+        "caveat": "Research finding - not an approved health claim.",
+    },
+    "eu_claim_status": {
+        "content_potential": ["citation_only", "educational"],
+        "usage_guidance": "Cite the study when discussing research directions.",
+        "eu_claim_status": "no_approved_claim",
+        "caveat": "Can cite study but NOT claim treatment/prevention/cure",
+        "can_cite_study": True,
+        "can_make_claim": False,
+    },
+}
+
+
+def rules_cassette() -> Cassette:
+    """Empty synthetic cassette with the shared LLM rules."""
+    cassette = Cassette(origin="synthetic")
+    for marker, response in LLM_RULES.items():
+        cassette.add_llm_rule(marker, response)
+    return cassette
+
+
+def _paragraph(rng: random.Random, sentences: int) -> str:
+    """Deterministic wellness-themed prose."""
+    parts = []
+    for _ in range(sentences):
+        mushroom = rng.choice(MUSHROOMS)
+        topic = rng.choice(TOPICS)
+        parts.append(
+            rng.choice([
+                f"I have been taking {mushroom} for a few weeks and noticed a difference in {topic}.",
+                f"Researchers are still studying {mushroom} and its links to {topic}.",
+                f"My {topic} routine now includes a {mushroom} tea every morning.",
+                f"Has anyone compared {mushroom} extracts from different brands for {topic}?",
+            ])
+        )
+    return " ".join(parts)
+
+
+def reddit_cassette(
+    subreddits: Sequence[str],
+    keywords: Sequence[str],
+    posts_per_search: int = 10,
+) -> Cassette:
+    """Reddit OAuth, search and post detail responses.
+
+    Args:
+        subreddits: Subreddits the scanner searches
+        keywords: Keywords searched in every subreddit
+        posts_per_search: Posts returned by each search
+
+    Returns:
+        Synthetic Cassette
+    """
+    rng = random.Random(SEED)
+    cassette = rules_cassette()
+    now = datetime.now(timezone.utc).timestamp()
+    rate_headers = {
+        "x-ratelimit-remaining": "590",
+        "x-ratelimit-used": "10",
+        "x-ratelimit-reset": "300",
+    }
+    cassette.add_http(
+        "POST",
+        "https://www.reddit.com/api/v1/access_token",
+        {"access_token": "synthetic", "token_type": "bearer", "expires_in": 86400},
+        match="path",
+    )
+
+    for subreddit in subreddits:
+        for k, _ in enumerate(keywords):
+            posts = []
+            for i in range(posts_per_search):
+                post_id = f"{subreddit[:3].lower()}{k:02d}{i:03d}"
+                posts.append({
+                    "id": post_id,
+                    "title": f"{rng.choice(MUSHROOMS).title()} and {rng.choice(TOPICS)}",
+                    "selftext": _paragraph(rng, 6),
+                    "author": f"user_{rng.randrange(10_000)}",
+                    "subreddit": subreddit,
+                    "score": rng.randrange(5, 500),
+                    "upvote_ratio": round(rng.uniform(0.7, 1.0), 2),
+                    "num_comments": rng.randrange(0, 120),
+                    "permalink": f"/r/{subreddit}/comments/{post_id}/post/",
+                    "url": f"https://reddit.com/r/{subreddit}/comments/{post_id}/post/",
+                    "created_utc": now - rng.randrange(60, 20 * 3600),
+                    "is_self": True,
+                })
+            cassette.add_http(
+                "GET",
+                f"https://oauth.reddit.com/r/{subreddit}/search",
+                {"kind": "Listing", "data": {"children": [{"kind": "t3", "data": p} for p in posts]}},
+                headers=rate_headers,
+                match="path",
+            )
+            for post in posts:
+                cassette.add_http(
+                    "GET",
+                    f"https://oauth.reddit.com/comments/{post['id']}",
+                    [
+                        {"kind": "Listing", "data": {"children": [{"kind": "t3", "data": post}]}},
+                        {"kind": "Listing", "data": {"children": []}},
+                    ],
+                    headers=rate_headers,
+                    match="path",
+                )
+    return cassette
+
+
+def youtube_cassette(
+    queries: Sequence[str],
+    videos_per_query: int = 10,
+) -> tuple[Cassette, dict[str, str]]:
+    """YouTube search and videos.list responses, plus transcripts.
+
+    Transcripts are not HTTP fixtures (youtube-transcript-api's wire format
+    changes between versions); they are returned for seeding a
+    TranscriptCache, so synthetic runs measure the warm-cache path.
+
+    Args:
+        queries: Search queries the scanner runs
+        videos_per_query: Results per search
+
+    Returns:
+        (Synthetic Cassette, video ID -> transcript text)
+    """
+    rng = random.Random(SEED)
+    cassette = rules_cassette()
+    now = datetime.now(timezone.utc)
+    transcripts: dict[str, str] = {}
+    statistics = []
+
+    for q, query in enumerate(queries):
+        items = []
+        for i in range(videos_per_query):
+            video_id = f"vid{q:02d}{i:03d}xyz"
+            published = now - timedelta(hours=rng.randrange(1, 96))
+            items.append({
+                "id": {"kind": "youtube#video", "videoId": video_id},
+                "snippet": {
+                    "publishedAt": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "channelId": f"UC{rng.randrange(10**8):08d}",
+                    "channelTitle": rng.choice(["Mushroom Health Lab", "Daily Wellness", "Forager Joe"]),
+                    "title": f"{query.title()} - what the research says",
+                    "description": _paragraph(rng, 2),
+                },
+            })
+            statistics.append({
+                "id": video_id,
+                "snippet": items[-1]["snippet"],
+                "statistics": {
+                    "viewCount": str(rng.randrange(500, 250_000)),
+                    "likeCount": str(rng.randrange(10, 5_000)),
+                    "commentCount": str(rng.randrange(0, 800)),
+                },
+                "contentDetails": {"duration": f"PT{rng.randrange(4, 40)}M{rng.randrange(60)}S"},
+            })
+            transcripts[video_id] = _paragraph(rng, 60)
+        cassette.add_http(
+            "GET",
+            "https://www.googleapis.com/youtube/v3/search",
+            {"kind": "youtube#searchListResponse", "items": items},
+            match="path",
+        )
+
+    cassette.add_http(
+        "GET",
+        "https://www.googleapis.com/youtube/v3/videos",
+        {"kind": "youtube#videoListResponse", "items": statistics},
+        match="path",
+    )
+    return cassette, transcripts
+
+
+def instagram_cassette(
+    hashtags: Sequence[str],
+    competitor_accounts: Sequence[str],
+    business_account_id: str,
+    posts_per_source: int = 20,
+) -> Cassette:
+    """Instagram hashtag, business discovery and batch detail responses.
+
+    Args:
+        hashtags: Hashtags the scanner searches
+        competitor_accounts: Accounts read through business discovery
+        business_account_id: Account ID in the client configuration
+        posts_per_source: Posts per hashtag or account
+
+    Returns:
+        Synthetic Cassette
+    """
+    rng = random.Random(SEED)
+    cassette = rules_cassette()
+    now = datetime.now(timezone.utc)
+    base = "https://graph.facebook.com/v19.0"
+
+    def media(media_id: str) -> dict:
+        timestamp = now - timedelta(minutes=rng.randrange(10, 20 * 60))
+        return {
+            "id": media_id,
+            "caption": f"{_paragraph(rng, 3)} #{rng.choice(hashtags)} #wellness",
+            "permalink": f"https://www.instagram.com/p/{media_id}/",
+            "timestamp": timestamp.strftime("%Y-%m-%dT%H:%M:%S+0000"),
+            "like_count": rng.randrange(5, 3_000),
+            "comments_count": rng.randrange(0, 200),
+            "media_type": "IMAGE",
+        }
+
+    for h, hashtag in enumerate(hashtags):
+        hashtag_id = f"17841{h:010d}"
+        cassette.add_http("GET", f"{base}/ig_hashtag_search", {"data": [{"id": hashtag_id}]}, match="path")
+        cassette.add_http(
+            "GET",
+            f"{base}/{hashtag_id}/recent_media",
+            {"data": [media(f"{h:02d}{i:05d}") for i in range(posts_per_source)]},
+            match="path",
+        )
+
+    for a, account in enumerate(competitor_accounts):
+        items = [dict(media(f"9{a:02d}{i:04d}"), username=account) for i in range(posts_per_source)]
+        cassette.add_http(
+            "GET",
+            f"{base}/{business_account_id}",
+            {"business_discovery": {"username": account, "media": {"data": items}}},
+            match="path",
+        )
+
+    detail = {"username": "wellness_creator", "like_count": 120, "comments_count": 8}
+    cassette.add_http(
+        "POST",
+        f"{base}/",
+        [{"code": 200, "body": json.dumps(detail)} for _ in range(50)],
+        match="path",
+    )
+    return cassette
+
+
+def news_cassette(feed_urls: Sequence[str], items_per_feed: int = 30) -> Cassette:
+    """RSS feed responses.
+
+    Args:
+        feed_urls: Feed URLs the scanner fetches
+        items_per_feed: Items in each feed
+
+    Returns:
+        Synthetic Cassette
+    """
+    rng = random.Random(SEED)
+    cassette = rules_cassette()
+    now = datetime.now(timezone.utc)
+    headlines = [
+        "EU regulators review novel food status of {m}",
+        "Functional mushrooms market grows as {m} demand rises",
+        "Study links {m} extract to {t} in small trial",
+        "Supplements industry responds to new health claims guidance",
+        "Mattilsynet issues warning on {m} product labelling",
+    ]
+
+    for f, url in enumerate(feed_urls):
+        items = []
+        for i in range(items_per_feed):
+            title = rng.choice(headlines).format(m=rng.choice(MUSHROOMS), t=rng.choice(TOPICS))
+            published = format_datetime(now - timedelta(minutes=rng.randrange(10, 20 * 60)))
+            items.append(
+                "<item>"
+                f"<title>{escape(title)}</title>"
+                f"<link>https://news.example.com/{f}/{i}</link>"
+                f"<description>{escape(_paragraph(rng, 4))}</description>"
+                f"<pubDate>{published}</pubDate>"
+                f"<guid>https://news.example.com/{f}/{i}</guid>"
+                "</item>"
+            )
+        feed = (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>Feed {f}</title><link>{escape(url)}</link>"
+            f"{''.join(items)}</channel></rss>"
+        )
+        cassette.add_http(
+            "GET",
+            url,
+            feed,
+            headers={"content-type": "application/rss+xml; charset=utf-8"},
+            match="path",
+        )
+    return cassette
+
+
+def pubmed_cassette(queries: Sequence[str], pmids_per_query: int = 5) -> Cassette:
+    """E-utilities esearch, epost and efetch responses.
+
+    Args:
+        queries: Search queries the scanner runs
+        pmids_per_query: PMIDs returned by each search
+
+    Returns:
+        Synthetic Cassette
+    """
+    rng = random.Random(SEED)
+    cassette = rules_cassette()
+    base = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+    today = datetime.now(timezone.utc)
+    articles = []
+
+    for q, _ in enumerate(queries):
+        pmids = [str(38_000_000 + q * 100 + i) for i in range(pmids_per_query)]
+        cassette.add_http(
+            "GET",
+            f"{base}/esearch.fcgi",
+            {"esearchresult": {"count": str(len(pmids)), "retmax": str(len(pmids)), "idlist": pmids}},
+            match="path",
+        )
+        for pmid in pmids:
+            mushroom = rng.choice(MUSHROOMS)
+            published = today - timedelta(days=rng.randrange(1, 60))
+            articles.append(
+                "<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>"
+                "<Journal><Title>Journal of Functional Foods</Title></Journal>"
+                "<ArticleTitle>Effects of {mushroom} on {topic}: a randomized trial</ArticleTitle>"
+                "<Abstract><AbstractText>{abstract} In this trial n={n} participants "
+                "were randomized.</AbstractText></Abstract>"
+                "<AuthorList><Author><LastName>Nordmann</LastName><ForeName>Kari</ForeName></Author></AuthorList>"
+                "<PublicationTypeList><PublicationType>Randomized Controlled Trial</PublicationType></PublicationTypeList>"
+                "<ArticleDate><Year>{y}</Year><Month>{mo}</Month><Day>{d}</Day></ArticleDate>"
+                "</Article></MedlineCitation>"
+                "<PubmedData><ArticleIdList><ArticleId IdType=\"doi\">10.1000/syn.{pmid}</ArticleId>"
+                "</ArticleIdList></PubmedData></PubmedArticle>".format(
+                    pmid=pmid,
+                    mushroom=escape(mushroom),
+                    topic=rng.choice(TOPICS),
+                    abstract=escape(_paragraph(rng, 8)),
+                    n=rng.randrange(20, 400),
+                    y=published.year,
+                    mo=published.month,
+                    d=published.day,
+                )
+            )
+
+    cassette.add_http(
+        "POST",
+        f"{base}/epost.fcgi",
+        "<ePostResult><QueryKey>1</QueryKey><WebEnv>MCID_synthetic</WebEnv></ePostResult>",
+        headers={"content-type": "text/xml"},
+        match="path",
+    )
+    cassette.add_http(
+        "GET",
+        f"{base}/efetch.fcgi",
+        f"<?xml version=\"1.0\"?><PubmedArticleSet>{''.join(articles)}</PubmedArticleSet>",
+        headers={"content-type": "text/xml"},
+        match="path",
+    )
+    return cassette
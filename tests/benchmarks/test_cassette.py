@@ -0,0 +1,144 @@
+"""Tests for cassette matching, redaction and replay.
+
+Tests verify:
+- Secrets are redacted and volatile parameters left out of match keys
+- Latency spec parsing
+- Replay order, wrap-around and path-match fallback
+- LLM rule fallback
+- Save/load round trip
+"""
+
+import json
+
+import pytest
+
+from .cassette import (
+    Cassette,
+    CassetteMiss,
+    CassettePlayer,
+    Latency,
+    path_key,
+    redact_content,
+    redact_url,
+    request_key,
+)
+
+
+class TestMatchKeys:
+    """Tests for request keys and redaction."""
+
+    def test_secrets_and_volatile_params_ignored(self):
+        """Test keys match across tokens and date windows."""
+        first = request_key(
+            "GET",
+            "https://www.googleapis.com/youtube/v3/search?q=reishi&key=abc&publishedAfter=2026-01-01",
+        )
+        second = request_key(
+            "get",
+            "https://www.googleapis.com/youtube/v3/search?key=xyz&publishedAfter=2026-02-01&q=reishi",
+        )
+
+        assert first == second
+        assert first != request_key("GET", "https://www.googleapis.com/youtube/v3/search?q=chaga")
+
+    def test_redact_url_and_content(self):
+        """Test secrets never reach the stored file."""
+        url = redact_url("https://graph.facebook.com/v19.0/me?access_token=secret&fields=id")
+        content = redact_content(json.dumps({"access_token": "secret", "data": [1]}).encode())
+
+        assert "secret" not in url
+        assert "fields=id" in url
+        assert b"secret" not in content
+        assert json.loads(content)["data"] == [1]
+
+    def test_path_key_ignores_query(self):
+        """Test path keys cover every query of an endpoint."""
+        assert path_key("GET", "https://oauth.reddit.com/r/x/search?q=a") == path_key(
+            "GET", "https://oauth.reddit.com/r/x/search?q=b"
+        )
+
+
+class TestLatency:
+    """Tests for Latency.parse."""
+
+    @pytest.mark.parametrize(
+        "spec,expected",
+        [
+            ("", Latency()),
+            ("http=0.05,llm=0.8", Latency(http=0.05, llm=0.8)),
+            ("recorded", Latency(recorded=True)),
+            ("recorded*0.5", Latency(recorded=True, scale=0.5)),
+        ],
+    )
+    def test_parse(self, spec, expected):
+        """Test accepted spec forms."""
+        assert Latency.parse(spec) == expected
+
+    def test_invalid_spec(self):
+        """Test unknown names and negative delays are rejected."""
+        with pytest.raises(ValueError):
+            Latency.parse("dns=1")
+        with pytest.raises(ValueError, match="http"):
+            Latency.parse("http=-1")
+
+    def test_recorded_delay_scaled(self):
+        """Test recorded durations are scaled."""
+        assert Latency(recorded=True, scale=0.5).delay("http", 0.4) == pytest.approx(0.2)
+
+
+class TestCassettePlayer:
+    """Tests for CassettePlayer."""
+
+    def test_replays_in_order_and_wraps(self):
+        """Test repeated requests get successive responses, then wrap."""
+        cassette = Cassette()
+        cassette.add_http("GET", "https://example.com/feed", "first")
+        cassette.add_http("GET", "https://example.com/feed", "second")
+        player = CassettePlayer(cassette)
+
+        bodies = [player.match_http("GET", "https://example.com/feed").content for _ in range(3)]
+
+        assert bodies == [b"first", b"second", b"first"]
+        assert player.calls["example.com"] == 3
+
+    def test_path_match_fallback_and_miss(self):
+        """Test path interactions answer any query and misses are recorded."""
+        cassette = Cassette()
+        cassette.add_http("GET", "https://example.com/search", {"items": []}, match="path")
+        player = CassettePlayer(cassette)
+
+        assert player.match_http("GET", "https://example.com/search?q=lion").status == 200
+        with pytest.raises(CassetteMiss):
+            player.match_http("GET", "https://example.com/other")
+        assert len(player.misses) == 1
+
+    @pytest.mark.asyncio
+    async def test_llm_rule_fallback(self):
+        """Test recorded prompts win over rules, and rules cover the rest."""
+        cassette = Cassette()
+        cassette.add_llm("exact prompt", "recorded")
+        cassette.add_llm_rule("claims_detected", {"claims_detected": []})
+        player = CassettePlayer(cassette)
+
+        assert await player.llm("exact prompt") == "recorded"
+        assert json.loads(await player.llm("... claims_detected ...")) == {"claims_detected": []}
+        with pytest.raises(CassetteMiss):
+            await player.llm("unknown")
+        assert player.misses and player.calls["llm"] == 2
+
+
+def test_save_load_round_trip(tmp_path):
+    """Test a saved cassette replays identically."""
+    cassette = Cassette(origin="synthetic")
+    cassette.add_http("POST", "https://example.com/api", b"\x00\x01", body=b"q=1", duration=0.2)
+    cassette.add_llm_rule("marker", "response")
+    cassette.save(tmp_path / "c.json")
+
+    loaded = Cassette.load(tmp_path / "c.json")
+    interaction = CassettePlayer(loaded).match_http("POST", "https://example.com/api", b"q=1")
+
+    assert loaded.origin == "synthetic"
+    assert loaded.recorded_at == cassette.recorded_at
+    assert interaction.content == b"\x00\x01"
+    assert interaction.duration == 0.2
+    assert loaded.llm_rules == cassette.llm_rules
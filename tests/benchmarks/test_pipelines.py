@@ -0,0 +1,28 @@
+"""End-to-end offline benchmarks of the scanner pipelines.
+
+Skipped unless DAWO_BENCHMARKS=1 (see tests/benchmarks/__init__.py).
+"""
+
+import os
+
+import pytest
+
+from .pipelines import PIPELINES, run_pipeline
+
+BENCHMARKS_ENABLED = os.environ.get("DAWO_BENCHMARKS") == "1"
+SKIP_REASON = "Pipeline benchmarks disabled. Set DAWO_BENCHMARKS=1 to enable."
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not BENCHMARKS_ENABLED, reason=SKIP_REASON)
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", PIPELINES)
+async def test_pipeline_benchmark(name, benchmark_settings, benchmark_reports, tmp_path):
+    """Test each pipeline completes against its cassette and record timings."""
+    report = await run_pipeline(name, benchmark_settings, tmp_path)
+    benchmark_reports.append(report)
+
+    assert report.cassette_misses == 0
+    assert report.status in ("COMPLETE", "PARTIAL")
+    if report.cassette == "synthetic":
+        assert report.published > 0
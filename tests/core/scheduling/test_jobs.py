@@ -7,10 +7,18 @@ Tests cover:
 - cancel_publish_job execution
 - enqueue_publish_job helper
 - update_publish_job for rescheduling
-- WorkerSettings configuration
+- rescore_research_pool_job execution
+- fan_out_scan_job / scan_shard_job / finish_scan_job /
+  run_scan_pipeline_job sharded scans
+- WorkerSettings configuration and worker context
 """
 
+import sys
+import types
+from pathlib import Path
+
 import pytest
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -21,9 +29,18 @@ from core.scheduling.jobs import (
     get_scheduled_jobs_status,
     enqueue_publish_job,
     update_publish_job,
+    rescore_research_pool_job,
+    fan_out_scan_job,
+    scan_shard_job,
+    finish_scan_job,
+    run_scan_pipeline_job,
+    RESCORE_PROGRESS_KEY,
+    SCAN_PIPELINE_JOB_TIMEOUT,
     WorkerSettings,
 )
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
 
 class MockApprovalItem:
     """Mock ApprovalItem for testing."""
@@ -232,6 +249,327 @@ class TestUpdatePublishJob:
         assert result == "arq:job:new"
 
 
+def _database_module() -> types.ModuleType:
+    """Build a stand-in core.database exposing get_async_session."""
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__ = AsyncMock(return_value=AsyncMock())
+    session_factory.return_value.__aexit__ = AsyncMock(return_value=None)
+    module = types.ModuleType("core.database")
+    module.get_async_session = session_factory
+    return module
+
+
+class TestRescoreResearchPoolJob:
+    """Tests for rescore_research_pool_job function."""
+
+    @pytest.mark.asyncio
+    async def test_returns_summary_and_reports_progress(self):
+        """Job runs rescore_pool and returns its counters."""
+        from teams.dawo.research.scoring import RescoreResult
+
+        redis = AsyncMock()
+        progress = RescoreResult(scanned=10, updated=4, chunks=1, elapsed_seconds=0.5)
+
+        async def fake_rescore(self, chunk_size, progress_callback):
+            await progress_callback(progress)
+            return progress
+
+        with patch.dict(sys.modules, {"core.database": _database_module()}):
+            with patch(
+                "teams.dawo.research.scoring.ResearchScoringService.rescore_pool",
+                fake_rescore,
+            ):
+                result = await rescore_research_pool_job({"redis": redis}, chunk_size=10)
+
+        assert result["status"] == "RESCORED"
+        assert result["scanned"] == 10
+        assert result["updated"] == 4
+        assert result["items_per_second"] == 20.0
+        assert redis.set.call_args[0][0] == RESCORE_PROGRESS_KEY
+
+    @pytest.mark.asyncio
+    async def test_returns_error_status_on_failure(self):
+        """Failures are reported in the job result, not raised."""
+        with patch.dict(sys.modules, {"core.database": _database_module()}):
+            with patch(
+                "teams.dawo.research.scoring.ResearchScoringService.rescore_pool",
+                AsyncMock(side_effect=RuntimeError("boom")),
+            ):
+                result = await rescore_research_pool_job({})
+
+        assert result["status"] == "ERROR: boom"
+
+
+class FakeArqRedis:
+    """ARQ pool stand-in: hashes, strings and enqueue_job running jobs inline.
+
+    Deferred jobs are kept in deferred until run_deferred(); job ids are
+    unique like ARQ's (a duplicate enqueue returns None).
+    """
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.strings: dict[str, bytes] = {}
+        self.ctx: dict = {}
+        self.enqueued: list[tuple[str, dict]] = []
+        self.deferred: list[tuple[str, dict]] = []
+        self.results: dict[str, list[dict]] = {}
+        self.job_ids: set[str] = set()
+
+    async def hsetnx(self, name, key, value):
+        fields = self.hashes.setdefault(name, {})
+        return fields.setdefault(key.encode("utf-8"), value) is value
+
+    async def hset(self, name, key, value):
+        self.hashes.setdefault(name, {})[key.encode("utf-8")] = value
+
+    async def hgetall(self, name):
+        return dict(self.hashes.get(name, {}))
+
+    async def hlen(self, name):
+        return len(self.hashes.get(name, {}))
+
+    async def get(self, name):
+        return self.strings.get(name)
+
+    async def set(self, name, value, ex=None, nx=False):
+        if nx and name in self.strings:
+            return None
+        self.strings[name] = str(value).encode("utf-8")
+        return True
+
+    async def expire(self, name, seconds):
+        pass
+
+    async def delete(self, *names):
+        for name in names:
+            self.hashes.pop(name, None)
+            self.strings.pop(name, None)
+
+    async def enqueue_job(self, function, _job_id=None, _defer_by=None, **kwargs):
+        if _job_id is not None:
+            if _job_id in self.job_ids:
+                return None
+            self.job_ids.add(_job_id)
+        self.enqueued.append((function, kwargs))
+        if _defer_by is not None:
+            self.deferred.append((function, kwargs))
+        else:
+            await self.run(function, kwargs)
+        return MagicMock(job_id=_job_id)
+
+    async def run(self, function, kwargs):
+        jobs = {
+            "scan_shard_job": scan_shard_job,
+            "finish_scan_job": finish_scan_job,
+            "run_scan_pipeline_job": run_scan_pipeline_job,
+        }
+        result = await jobs[function](self.ctx, **kwargs)
+        self.results.setdefault(function, []).append(result)
+
+    async def run_deferred(self):
+        deferred, self.deferred = self.deferred, []
+        for function, kwargs in deferred:
+            await self.run(function, kwargs)
+
+
+@dataclass
+class ShardResult:
+    """Stand-in for a scanner ScanResult."""
+
+    posts: list
+    statistics: "ShardStatistics"
+    errors: list = field(default_factory=list)
+
+
+@dataclass
+class ShardStatistics:
+    """Stand-in for a scanner ScanStatistics."""
+
+    subreddits_scanned: int = 0
+    duplicates_removed: int = 0
+
+
+class FakeShardScanner:
+    """Shardable scanner returning one post per source plus a shared one."""
+
+    SHARD_ITEMS_FIELD = "posts"
+
+    def __init__(self, fail_on: str = "") -> None:
+        self.fail_on = fail_on
+
+    def sources(self):
+        return ["a", "b", "c"]
+
+    @staticmethod
+    def shard_key(post):
+        return post
+
+    async def scan(self, sources=None):
+        if self.fail_on in sources:
+            raise RuntimeError(f"{self.fail_on} down")
+        return _shard_result(sources)
+
+
+def _shard_result(sources) -> ShardResult:
+    """Build a shard result for the given sources."""
+    return ShardResult(
+        posts=[f"post-{s}" for s in sources] + ["shared"],
+        statistics=ShardStatistics(subreddits_scanned=len(sources)),
+    )
+
+
+class TestFanOutScanJob:
+    """Tests for fan_out_scan_job, scan_shard_job, finish_scan_job and
+    run_scan_pipeline_job."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self):
+        """Give run_scan_pipeline_job a stand-in database session."""
+        with patch.dict(sys.modules, {"core.database": _database_module()}):
+            yield
+
+    @staticmethod
+    def _context(scanner) -> tuple[dict, FakeArqRedis, AsyncMock, AsyncMock]:
+        """Build an ARQ context with a scanner, pipeline and checkpoint store."""
+        redis = FakeArqRedis()
+        pipeline = AsyncMock()
+        pipeline.execute.return_value = MagicMock(
+            status=MagicMock(value="COMPLETE"), run_id="run-1", retry_scheduled=False
+        )
+        checkpoint_store = AsyncMock()
+        checkpoint_store.load.return_value = {}
+        redis.ctx = {
+            "redis": redis,
+            "scanners": {"reddit": scanner},
+            "research_pipelines": {"reddit": lambda session: pipeline},
+            "checkpoint_store": checkpoint_store,
+        }
+        return redis.ctx, redis, pipeline, checkpoint_store
+
+    @staticmethod
+    def _shard_jobs(redis: FakeArqRedis) -> list[dict]:
+        """Arguments of the enqueued shard jobs."""
+        return [kwargs for function, kwargs in redis.enqueued if function == "scan_shard_job"]
+
+    @pytest.mark.asyncio
+    async def test_merges_shards_into_scan_checkpoint(self):
+        """Shards are merged, checkpointed as "scan", then the pipeline job runs."""
+        ctx, redis, pipeline, checkpoint_store = self._context(FakeShardScanner())
+
+        result = await fan_out_scan_job(ctx, "reddit", run_id="run-1", sources_per_shard=2)
+
+        assert result["status"] == "FANNED_OUT"
+        assert result["shards"] == 2
+        assert [job["sources"] for job in self._shard_jobs(redis)] == [["a", "b"], ["c"]]
+        pipeline_name, run_id, stage, scan_result = checkpoint_store.save.call_args[0]
+        assert (pipeline_name, run_id, stage) == ("reddit", "run-1", "scan")
+        assert scan_result.posts == ["post-a", "post-b", "shared", "post-c"]
+        assert scan_result.statistics.subreddits_scanned == 3
+        assert scan_result.statistics.duplicates_removed == 1
+        pipeline.execute.assert_awaited_once_with(run_id="run-1")
+        assert redis.results["finish_scan_job"][0]["status"] == "SCAN_MERGED"
+        assert redis.results["run_scan_pipeline_job"][0]["status"] == "COMPLETE"
+        assert redis.enqueued[-1][0] == "run_scan_pipeline_job"
+        assert redis.hashes == {}
+
+    @pytest.mark.asyncio
+    async def test_no_job_waits_for_another(self):
+        """The coordinator returns once shards are enqueued; the last shard finishes."""
+        ctx, redis, pipeline, _ = self._context(FakeShardScanner())
+        redis.run = AsyncMock()  # Enqueue only
+
+        result = await fan_out_scan_job(ctx, "reddit", run_id="run-1")
+        redis.run.reset_mock()
+
+        assert result["status"] == "FANNED_OUT"
+        pipeline.execute.assert_not_awaited()
+        shard_jobs = self._shard_jobs(redis)
+        for kwargs in shard_jobs[:-1]:
+            await scan_shard_job(ctx, **kwargs)
+            assert redis.run.await_count == 0
+        await scan_shard_job(ctx, **shard_jobs[-1])
+        redis.run.assert_awaited_once()
+        assert redis.run.call_args[0][0] == "finish_scan_job"
+
+    @pytest.mark.asyncio
+    async def test_failed_shard_does_not_fail_run(self):
+        """A failing shard is reported; the others still feed the pipeline."""
+        ctx, redis, pipeline, checkpoint_store = self._context(FakeShardScanner(fail_on="b"))
+
+        await fan_out_scan_job(ctx, "reddit", run_id="run-1")
+
+        scan_result = checkpoint_store.save.call_args[0][3]
+        assert scan_result.posts == ["post-a", "shared", "post-c"]
+        assert any("b down" in error for error in scan_result.errors)
+        assert redis.results["finish_scan_job"][0]["failed_shards"] == 1
+        pipeline.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_deadline_finishes_without_lost_shard(self):
+        """A shard that never settles is reported once the deadline job runs."""
+        ctx, redis, pipeline, checkpoint_store = self._context(FakeShardScanner())
+        real_run = redis.run
+
+        async def lose_shard_c(function, kwargs):
+            if function == "scan_shard_job" and kwargs["sources"] == ["c"]:
+                return
+            await real_run(function, kwargs)
+
+        redis.run = lose_shard_c
+        await fan_out_scan_job(ctx, "reddit", run_id="run-1")
+        pipeline.execute.assert_not_awaited()
+
+        await redis.run_deferred()
+
+        scan_result = checkpoint_store.save.call_args[0][3]
+        assert scan_result.posts == ["post-a", "shared", "post-b"]
+        assert "Shard 2: did not finish" in scan_result.errors
+        pipeline.execute.assert_awaited_once_with(run_id="run-1")
+
+    @pytest.mark.asyncio
+    async def test_scan_merged_once(self):
+        """The deadline job does nothing after the last shard finished the scan."""
+        ctx, redis, pipeline, checkpoint_store = self._context(FakeShardScanner())
+
+        await fan_out_scan_job(ctx, "reddit", run_id="run-1")
+        await redis.run_deferred()
+
+        assert redis.results["finish_scan_job"][1]["status"] == "ALREADY_CLAIMED"
+        checkpoint_store.save.assert_awaited_once()
+        pipeline.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_resumed_run_skips_fan_out(self):
+        """A retry whose scan is already checkpointed goes straight to the pipeline job."""
+        ctx, redis, pipeline, checkpoint_store = self._context(FakeShardScanner())
+        checkpoint_store.load.return_value = {"scan": _shard_result(["a"])}
+
+        result = await fan_out_scan_job(ctx, "reddit", run_id="run-1")
+
+        assert result["status"] == "SCAN_CHECKPOINTED"
+        assert [function for function, _ in redis.enqueued] == ["run_scan_pipeline_job"]
+        checkpoint_store.save.assert_not_awaited()
+        pipeline.execute.assert_awaited_once_with(run_id="run-1")
+
+    @pytest.mark.asyncio
+    async def test_not_configured(self):
+        """Pipelines without a scanner/pipeline/checkpoint store are rejected."""
+        result = await fan_out_scan_job({"redis": FakeArqRedis()}, "reddit")
+
+        assert result == {"status": "NOT_CONFIGURED"}
+
+    @pytest.mark.asyncio
+    async def test_pipeline_failure_reported_by_pipeline_job(self):
+        """Errors raised by the pipeline are returned, not raised."""
+        ctx, redis, pipeline, _ = self._context(FakeShardScanner())
+        pipeline.execute.side_effect = RuntimeError("boom")
+
+        result = await run_scan_pipeline_job(ctx, "reddit", run_id="run-1")
+
+        assert result == {"status": "ERROR: boom"}
+
+
 class TestWorkerSettings:
     """Tests for WorkerSettings configuration."""
 
@@ -240,6 +578,21 @@ class TestWorkerSettings:
         assert schedule_publish_job in WorkerSettings.functions
         assert cancel_publish_job in WorkerSettings.functions
         assert get_scheduled_jobs_status in WorkerSettings.functions
+        assert rescore_research_pool_job in WorkerSettings.functions
+        assert fan_out_scan_job in WorkerSettings.functions
+        assert scan_shard_job in WorkerSettings.functions
+        assert finish_scan_job in WorkerSettings.functions
+        registered = [getattr(f, "coroutine", f) for f in WorkerSettings.functions]
+        assert run_scan_pipeline_job in registered
+
+    def test_scan_pipeline_job_has_own_timeout(self):
+        """Pipeline runs are not bound by the worker-wide job_timeout."""
+        pytest.importorskip("arq")
+        registered = {
+            f.name: f for f in WorkerSettings.functions if hasattr(f, "coroutine")
+        }
+        assert registered["run_scan_pipeline_job"].timeout_s == SCAN_PIPELINE_JOB_TIMEOUT
+        assert SCAN_PIPELINE_JOB_TIMEOUT > WorkerSettings.job_timeout
 
     def test_no_cron_jobs_configured(self):
         """Test that no cron jobs are configured (all dynamic)."""
@@ -266,3 +619,81 @@ class TestWorkerSettings:
         ctx = {}
         # Should not raise
         await WorkerSettings.on_shutdown(ctx)
+
+
+class TestWorkerScanContext:
+    """Sharded scans through the context built by WorkerSettings.on_startup."""
+
+    @pytest.fixture(autouse=True)
+    def _environment(self, monkeypatch):
+        """Run from the repo root (config/) with a stand-in database."""
+        monkeypatch.chdir(REPO_ROOT)
+        for name in ("CLIENT_ID", "CLIENT_SECRET", "USERNAME", "PASSWORD"):
+            monkeypatch.delenv(f"REDDIT_{name}", raising=False)
+        with patch.dict(sys.modules, {"core.database": _database_module()}):
+            yield
+
+    @staticmethod
+    async def _start_worker() -> FakeArqRedis:
+        """Run on_startup on a worker context holding only Redis, like ARQ's."""
+        redis = FakeArqRedis()
+        redis.ctx = {"redis": redis}
+        await WorkerSettings.on_startup(redis.ctx)
+        return redis
+
+    @pytest.mark.asyncio
+    async def test_startup_builds_scanners_from_config(self, monkeypatch):
+        """Pipelines with credentials get a scanner and a pipeline factory."""
+        for name in ("CLIENT_ID", "CLIENT_SECRET", "USERNAME", "PASSWORD"):
+            monkeypatch.setenv(f"REDDIT_{name}", "test")
+
+        redis = await self._start_worker()
+
+        assert set(redis.ctx["scanners"]) == {"reddit", "news"}
+        assert set(redis.ctx["research_pipelines"]) == {"reddit", "news"}
+        assert redis.ctx["scanners"]["reddit"].sources()[0] == "Nootropics"
+        assert redis.ctx["checkpoint_store"] is not None
+        await WorkerSettings.on_shutdown(redis.ctx)
+        assert "scan_resources" not in redis.ctx
+
+    @pytest.mark.asyncio
+    async def test_sharded_news_run(self):
+        """A news run fans out, merges and runs the pipeline on the worker context."""
+        from teams.dawo.scanners.news import (
+            NewsFeedClient,
+            NewsResearchPipeline,
+            RawNewsArticle,
+        )
+
+        async def fetch_feed(self, feed, hours_back=24, keywords=None):
+            return [
+                RawNewsArticle(title=feed.name, url=f"https://news.test/{feed.name}", source_name=feed.name),
+                RawNewsArticle(title="Shared", url="https://news.test/shared", source_name=feed.name),
+            ]
+
+        executed = []
+
+        async def execute(self, run_id=None):
+            checkpoints = await self._checkpoint_store.load("news", run_id)
+            executed.append((self, checkpoints["scan"]))
+            return MagicMock(status=MagicMock(value="COMPLETE"), run_id=run_id, retry_scheduled=False)
+
+        redis = await self._start_worker()
+        assert "reddit" not in redis.ctx["scanners"]
+        feeds = redis.ctx["scanners"]["news"].sources()
+
+        with patch.object(NewsFeedClient, "fetch_feed", fetch_feed):
+            with patch.object(NewsResearchPipeline, "execute", execute):
+                result = await fan_out_scan_job(
+                    redis.ctx, "news", run_id="run-1", sources_per_shard=2
+                )
+        await WorkerSettings.on_shutdown(redis.ctx)
+
+        assert result["shards"] == (len(feeds) + 1) // 2
+        assert redis.results["run_scan_pipeline_job"] == [
+            {"status": "COMPLETE", "run_id": "run-1", "retry_scheduled": False}
+        ]
+        pipeline, scan_result = executed[0]
+        assert pipeline._checkpoint_store is redis.ctx["checkpoint_store"]
+        assert len(scan_result.articles) == len(feeds) + 1
+        assert await fan_out_scan_job(redis.ctx, "reddit") == {"status": "NOT_CONFIGURED"}
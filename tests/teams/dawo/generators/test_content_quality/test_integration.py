@@ -5,8 +5,10 @@ Tests end-to-end scoring behavior:
 - 10.2 Sample content from previous stories
 - 10.3 Score consistency
 - 10.4 Performance (< 10 seconds)
+- Concurrent component scoring and batch scoring
 """
 
+import asyncio
 import pytest
 import os
 import time
@@ -341,3 +343,117 @@ class TestContentTypeScoring:
 
         # Should score well for reels
         assert result.total_score >= 5.0
+
+
+class TestConcurrentScoring:
+    """Test concurrent component scoring and score_batch()."""
+
+    @staticmethod
+    def _request(content: str, content_type: ContentType = ContentType.INSTAGRAM_FEED, **kwargs):
+        """Build a scoring request."""
+        return QualityScoreRequest(
+            content=content,
+            content_type=content_type,
+            hashtags=["DAWO", "DAWOmushrooms"],
+            visual_quality_score=8.0,
+            source_type="research",
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_components_run_concurrently(
+        self, mock_compliance_checker, mock_brand_validator, mock_llm_client
+    ):
+        """The compliance check can wait on the brand validation."""
+        brand_started = asyncio.Event()
+        compliance_result = mock_compliance_checker.check_content.return_value
+        brand_result = mock_brand_validator.validate_content.return_value
+
+        async def check_content(content):
+            await brand_started.wait()
+            return compliance_result
+
+        async def validate_content(content):
+            brand_started.set()
+            return brand_result
+
+        mock_compliance_checker.check_content.side_effect = check_content
+        mock_brand_validator.validate_content.side_effect = validate_content
+        scorer = ContentQualityScorer(
+            compliance_checker=mock_compliance_checker,
+            brand_validator=mock_brand_validator,
+            llm_client=mock_llm_client,
+        )
+
+        # Sequential scoring would never reach the brand validation
+        result = await asyncio.wait_for(
+            scorer.score_content(self._request("Morning ritual with our forest tea.")),
+            timeout=2.0,
+        )
+
+        assert [c.component for c in result.component_scores] == [
+            "compliance", "brand_voice", "visual_quality", "platform", "engagement", "authenticity",
+        ]
+        assert set(result.component_latency_ms) == {c.component for c in result.component_scores}
+
+    @pytest.mark.asyncio
+    async def test_batch_shares_validations_across_variants(
+        self, mock_compliance_checker, mock_brand_validator, mock_llm_client
+    ):
+        """Each distinct content is checked and validated once."""
+        scorer = ContentQualityScorer(
+            compliance_checker=mock_compliance_checker,
+            brand_validator=mock_brand_validator,
+            llm_client=mock_llm_client,
+        )
+        caption = "Morning ritual with our forest tea."
+        requests = [
+            self._request(caption),
+            self._request(caption, ContentType.INSTAGRAM_STORY),
+            self._request("A different caption from the forest."),
+            self._request(caption + "\n", ContentType.INSTAGRAM_REEL),
+        ]
+
+        results = await scorer.score_batch(requests, max_concurrency=2)
+
+        assert len(results) == 4
+        assert mock_compliance_checker.check_content.await_count == 2
+        assert mock_brand_validator.validate_content.await_count == 2
+        singles = [await scorer.score_content(request) for request in requests]
+        assert [r.total_score for r in results] == [r.total_score for r in singles]
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_precomputed_variant(
+        self, mock_compliance_checker, mock_brand_validator, mock_llm_client
+    ):
+        """A check precomputed on one variant serves the others."""
+        scorer = ContentQualityScorer(
+            compliance_checker=mock_compliance_checker,
+            brand_validator=mock_brand_validator,
+            llm_client=mock_llm_client,
+        )
+        caption = "Morning ritual with our forest tea."
+        precomputed = mock_compliance_checker.check_content.return_value
+        requests = [
+            self._request(caption),
+            self._request(caption, ContentType.INSTAGRAM_STORY, compliance_check=precomputed),
+        ]
+
+        await scorer.score_batch(requests)
+
+        mock_compliance_checker.check_content.assert_not_awaited()
+        assert mock_brand_validator.validate_content.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_invalid_concurrency(
+        self, mock_compliance_checker, mock_brand_validator, mock_llm_client
+    ):
+        """max_concurrency must be positive."""
+        scorer = ContentQualityScorer(
+            compliance_checker=mock_compliance_checker,
+            brand_validator=mock_brand_validator,
+            llm_client=mock_llm_client,
+        )
+
+        with pytest.raises(ValueError):
+            await scorer.score_batch([], max_concurrency=0)
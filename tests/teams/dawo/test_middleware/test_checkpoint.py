@@ -0,0 +1,181 @@
+"""Tests for pipeline stage checkpoints.
+
+Tests verify:
+- Completed stages are stored and reused by a retry with the same run id
+- Sync and async stages are both supported
+- Checkpoints are cleared unless the result schedules a retry
+- forget() makes a retry re-run a stage
+- Store failures degrade to running every stage
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from teams.dawo.middleware import (
+    PipelineCheckpointStore,
+    RunCheckpoint,
+    open_run_checkpoint,
+)
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for hashes with TTLs."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.expiry: dict[str, int] = {}
+
+    async def hset(self, name: str, key: str, value: bytes) -> None:
+        self.hashes.setdefault(name, {})[key.encode("utf-8")] = value
+
+    async def hgetall(self, name: str) -> dict[bytes, bytes]:
+        return dict(self.hashes.get(name, {}))
+
+    async def hdel(self, name: str, *keys: str) -> int:
+        fields = self.hashes.get(name, {})
+        return sum(fields.pop(key.encode("utf-8"), None) is not None for key in keys)
+
+    async def expire(self, name: str, seconds: int) -> None:
+        self.expiry[name] = seconds
+
+    async def delete(self, *names: str) -> None:
+        for name in names:
+            self.hashes.pop(name, None)
+            self.expiry.pop(name, None)
+
+
+@dataclass
+class Result:
+    """Stand-in for a scanner PipelineResult."""
+
+    retry_scheduled: bool = False
+    run_id: Optional[str] = None
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def store(redis):
+    return PipelineCheckpointStore(redis, ttl_seconds=3600)
+
+
+class TestPipelineCheckpointStore:
+    """Tests for the Redis-backed store."""
+
+    def test_invalid_ttl(self, redis):
+        """TTL must be positive."""
+        with pytest.raises(ValueError):
+            PipelineCheckpointStore(redis, ttl_seconds=0)
+
+    @pytest.mark.asyncio
+    async def test_save_and_load_round_trip(self, store, redis):
+        """Stage outputs round-trip and the run's hash gets a TTL."""
+        await store.save("pubmed", "run-1", "harvest", [{"pmid": "1"}])
+
+        assert await store.load("pubmed", "run-1") == {"harvest": [{"pmid": "1"}]}
+        assert redis.expiry["dawo:pipeline_checkpoint:pubmed:run-1"] == 3600
+
+    @pytest.mark.asyncio
+    async def test_unreadable_entry_is_skipped(self, store, redis):
+        """Corrupt entries are dropped so the stage re-runs."""
+        await store.save("pubmed", "run-1", "scan", ["ok"])
+        redis.hashes["dawo:pipeline_checkpoint:pubmed:run-1"][b"harvest"] = b"garbage"
+
+        assert await store.load("pubmed", "run-1") == {"scan": ["ok"]}
+
+
+class TestRunCheckpoint:
+    """Tests for resuming runs."""
+
+    @pytest.mark.asyncio
+    async def test_retry_reuses_completed_stages(self, store):
+        """A retry with the same run id skips stages that completed."""
+        harvest = AsyncMock(return_value=["post"])
+        summarize = AsyncMock(side_effect=[RuntimeError("LLM down"), {"post": "s"}])
+
+        first = await open_run_checkpoint(store, "youtube")
+        await first.run("harvest", harvest, "query")
+        with pytest.raises(RuntimeError):
+            await first.run("summarize", summarize, ["post"])
+
+        retry = await open_run_checkpoint(store, "youtube", first.run_id)
+        harvested = await retry.run("harvest", harvest, "query")
+        summaries = await retry.run("summarize", summarize, harvested)
+
+        assert harvested == ["post"]
+        assert summaries == {"post": "s"}
+        assert harvest.await_count == 1
+        assert retry.resumed == ["harvest"]
+
+    @pytest.mark.asyncio
+    async def test_sync_stages(self, store):
+        """Synchronous stage callables are supported."""
+        transform = MagicMock(return_value=["item"])
+        checkpoint = await open_run_checkpoint(store, "news")
+
+        assert await checkpoint.run("transform", transform, ["raw"]) == ["item"]
+        transform.assert_called_once_with(["raw"])
+
+    @pytest.mark.asyncio
+    async def test_settle_keeps_checkpoints_for_retry(self, store):
+        """Checkpoints survive a result that schedules a retry."""
+        checkpoint = await open_run_checkpoint(store, "reddit", "run-1")
+        await checkpoint.run("scan", AsyncMock(return_value=["post"]))
+
+        result = await checkpoint.settle(Result(retry_scheduled=True))
+
+        assert result.run_id == "run-1"
+        assert await store.load("reddit", "run-1") == {"scan": ["post"]}
+
+    @pytest.mark.asyncio
+    async def test_settle_clears_finished_run(self, store):
+        """Checkpoints are deleted once no retry needs them."""
+        checkpoint = await open_run_checkpoint(store, "reddit", "run-1")
+        await checkpoint.run("scan", AsyncMock(return_value=["post"]))
+
+        await checkpoint.settle(Result(retry_scheduled=False))
+
+        assert await store.load("reddit", "run-1") == {}
+
+    @pytest.mark.asyncio
+    async def test_forget_reruns_stage(self, store):
+        """Forgotten stages run again on retry."""
+        scan = AsyncMock(side_effect=[[], ["article"]])
+        first = await open_run_checkpoint(store, "pubmed", "run-1")
+        await first.run("scan", scan)
+        await first.forget("scan")
+
+        retry = await open_run_checkpoint(store, "pubmed", "run-1")
+
+        assert await retry.run("scan", scan) == ["article"]
+        assert scan.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_without_store_every_stage_runs(self):
+        """No store means no checkpointing, but the same API."""
+        checkpoint = await open_run_checkpoint(None, "instagram")
+        result = await checkpoint.settle(Result())
+
+        assert await checkpoint.run("scan", AsyncMock(return_value=[1])) == [1]
+        assert result.run_id == checkpoint.run_id
+
+    @pytest.mark.asyncio
+    async def test_store_failures_degrade(self):
+        """Redis errors never fail the stage."""
+        broken = MagicMock(spec=PipelineCheckpointStore)
+        broken.load = AsyncMock(side_effect=ConnectionError("redis down"))
+        broken.save = AsyncMock(side_effect=ConnectionError("redis down"))
+        broken.clear = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        checkpoint = await open_run_checkpoint(broken, "news", "run-1")
+        output = await checkpoint.run("scan", AsyncMock(return_value=["a"]))
+        await checkpoint.settle(Result())
+
+        assert isinstance(checkpoint, RunCheckpoint)
+        assert output == ["a"]
@@ -0,0 +1,263 @@
+"""Tests for the content-addressed LLM response cache.
+
+Tests verify:
+- Cache keys depend on template, tier and normalized inputs
+- Hits skip the LLM call; misses call it and store the response
+- Unparseable responses are never stored
+- SQLite backend TTL and LRU eviction
+- Redis backend TTL and LRU eviction (in-memory fake client)
+- Backend failures degrade to plain LLM calls
+- Extractor agents reuse cached responses
+"""
+
+import json
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from teams.dawo.middleware import (
+    LLMResponseCache,
+    SQLiteLLMCacheBackend,
+    RedisLLMCacheBackend,
+    cached_generate,
+    template_id,
+)
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for string keys and sorted sets."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.expiry: dict[str, int] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    async def get(self, key: str):
+        value = self.values.get(key)
+        return value.encode("utf-8") if value is not None else None
+
+    async def set(self, key: str, value: str, ex: int = None) -> None:
+        self.values[key] = value
+        self.expiry[key] = ex
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    async def zadd(self, name: str, mapping: dict[str, float]) -> None:
+        self.zsets.setdefault(name, {}).update(mapping)
+
+    async def zrem(self, name: str, member: str) -> None:
+        self.zsets.get(name, {}).pop(member, None)
+
+    async def zcard(self, name: str) -> int:
+        return len(self.zsets.get(name, {}))
+
+    async def zpopmin(self, name: str, count: int):
+        zset = self.zsets.get(name, {})
+        popped = sorted(zset.items(), key=lambda item: item[1])[:count]
+        for member, _ in popped:
+            del zset[member]
+        return [(member.encode("utf-8"), score) for member, score in popped]
+
+
+@pytest.fixture
+def cache() -> LLMResponseCache:
+    """Cache backed by an in-memory SQLite database."""
+    return LLMResponseCache(SQLiteLLMCacheBackend(":memory:"))
+
+
+class TestCacheKeys:
+    """Tests for cache key derivation."""
+
+    def test_template_id_changes_with_template_text(self) -> None:
+        """Editing a prompt should produce a new template id."""
+        assert template_id("x", "Prompt {a}") == template_id("x", "Prompt {a}")
+        assert template_id("x", "Prompt {a}") != template_id("x", "Prompt v2 {a}")
+
+    def test_whitespace_and_unicode_normalized(self) -> None:
+        """Trivially different inputs should share a key."""
+        key_a = LLMResponseCache.make_key("t", "generate", {"text": "Café  mushroom\n"})
+        key_b = LLMResponseCache.make_key("t", "generate", {"text": "Café mushroom"})
+
+        assert key_a == key_b
+
+    def test_tier_and_inputs_change_key(self) -> None:
+        """Tier and input values should be part of the key."""
+        base = LLMResponseCache.make_key("t", "generate", {"text": "a"})
+
+        assert base != LLMResponseCache.make_key("t", "scan", {"text": "a"})
+        assert base != LLMResponseCache.make_key("t", "generate", {"text": "b"})
+        assert base != LLMResponseCache.make_key("u", "generate", {"text": "a"})
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache hit/miss behavior."""
+
+    @pytest.mark.asyncio
+    async def test_second_call_is_a_hit(self, cache: LLMResponseCache) -> None:
+        """Identical calls should reach the LLM once."""
+        generate = AsyncMock(return_value='{"value": 1}')
+
+        for _ in range(2):
+            result = await cache.get_or_generate("t", "generate", {"x": 1}, generate, json.loads)
+            assert result == {"value": 1}
+
+        generate.assert_awaited_once()
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.writes == 1
+        assert cache.stats.hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_not_stored(self, cache: LLMResponseCache) -> None:
+        """Parse failures should propagate and leave the cache empty."""
+        generate = AsyncMock(return_value="not json")
+
+        for _ in range(2):
+            with pytest.raises(json.JSONDecodeError):
+                await cache.get_or_generate("t", "generate", {"x": 1}, generate, json.loads)
+
+        assert generate.await_count == 2
+        assert cache.stats.writes == 0
+
+    @pytest.mark.asyncio
+    async def test_backend_failure_falls_back_to_llm(self) -> None:
+        """Backend errors should be counted, not raised."""
+        backend = AsyncMock()
+        backend.get = AsyncMock(side_effect=ConnectionError("redis down"))
+        backend.set = AsyncMock(side_effect=ConnectionError("redis down"))
+        cache = LLMResponseCache(backend)
+        generate = AsyncMock(return_value='{"ok": true}')
+
+        result = await cache.get_or_generate("t", "generate", {}, generate, json.loads)
+
+        assert result == {"ok": True}
+        assert cache.stats.errors == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_generate_without_cache(self) -> None:
+        """cached_generate with no cache should call the LLM directly."""
+        generate = AsyncMock(return_value='{"ok": true}')
+
+        result = await cached_generate(None, "t", "generate", {}, generate, json.loads)
+
+        assert result == {"ok": True}
+        generate.assert_awaited_once()
+
+
+class TestSQLiteBackend:
+    """Tests for SQLiteLLMCacheBackend."""
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self) -> None:
+        """Entries past their TTL should not be returned."""
+        backend = SQLiteLLMCacheBackend(":memory:")
+        await backend.set("k", "v", ttl_seconds=-1)
+
+        assert await backend.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        """The least recently used entry should be evicted first."""
+        backend = SQLiteLLMCacheBackend(":memory:", max_entries=2)
+        await backend.set("a", "1", ttl_seconds=60)
+        await backend.set("b", "2", ttl_seconds=60)
+        time.sleep(0.01)
+        assert await backend.get("a") == "1"  # "b" is now least recent
+
+        await backend.set("c", "3", ttl_seconds=60)
+
+        assert await backend.get("a") == "1"
+        assert await backend.get("b") is None
+        assert await backend.get("c") == "3"
+
+    @pytest.mark.asyncio
+    async def test_persists_to_disk(self, tmp_path) -> None:
+        """A file-backed cache should survive reopening."""
+        path = str(tmp_path / "cache" / "llm.db")
+        first = SQLiteLLMCacheBackend(path)
+        await first.set("k", "v", ttl_seconds=60)
+        first.close()
+
+        assert await SQLiteLLMCacheBackend(path).get("k") == "v"
+
+
+class TestRedisBackend:
+    """Tests for RedisLLMCacheBackend."""
+
+    @pytest.mark.asyncio
+    async def test_set_uses_ttl_and_get_decodes(self) -> None:
+        """Responses should be stored with a TTL and returned as str."""
+        redis = FakeRedis()
+        backend = RedisLLMCacheBackend(redis, prefix="test")
+
+        await backend.set("k", "v", ttl_seconds=30)
+
+        assert redis.expiry["test:k"] == 30
+        assert await backend.get("k") == "v"
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self) -> None:
+        """Overflow beyond max_entries should evict least recently used keys."""
+        redis = FakeRedis()
+        backend = RedisLLMCacheBackend(redis, max_entries=2, prefix="test")
+        await backend.set("a", "1", ttl_seconds=60)
+        await backend.set("b", "2", ttl_seconds=60)
+        await backend.get("a")
+
+        await backend.set("c", "3", ttl_seconds=60)
+
+        assert await backend.get("b") is None
+        assert await backend.get("a") == "1"
+        assert await backend.get("c") == "3"
+
+    @pytest.mark.asyncio
+    async def test_expired_key_removed_from_index(self) -> None:
+        """A key expired by Redis should be dropped from the LRU index."""
+        redis = FakeRedis()
+        backend = RedisLLMCacheBackend(redis, prefix="test")
+        await backend.set("k", "v", ttl_seconds=60)
+        del redis.values["test:k"]  # Simulate TTL expiry
+
+        assert await backend.get("k") is None
+        assert await redis.zcard("test:lru") == 0
+
+
+class TestAgentIntegration:
+    """Tests for extractor agents using the shared cache."""
+
+    @pytest.mark.asyncio
+    async def test_eu_compliance_llm_check_reuses_response(self, cache) -> None:
+        """Identical content should be classified by the LLM only once."""
+        from teams.dawo.validators.eu_compliance import EUComplianceChecker
+
+        llm = AsyncMock()
+        llm.generate = AsyncMock(return_value="NO_FLAGGED_PHRASES")
+        rules = {
+            "prohibited_patterns": [],
+            "borderline_patterns": [],
+            "permitted_patterns": [],
+        }
+        checker = EUComplianceChecker(rules, llm_client=llm, response_cache=cache)
+
+        await checker.check_content("Lion's mane supports focus")
+        await checker.check_content("Lion's mane  supports focus")
+
+        llm.generate.assert_awaited_once()
+        assert cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_theme_extractor_reuses_response(self, cache) -> None:
+        """Re-scanning the same caption should not call the LLM again."""
+        from teams.dawo.scanners.instagram.theme_extractor import ThemeExtractor
+
+        llm = AsyncMock()
+        llm.generate = AsyncMock(return_value=json.dumps({"content_type": "educational"}))
+        extractor = ThemeExtractor(llm, response_cache=cache)
+
+        first = await extractor.extract_themes("Reishi for calm evenings", ["reishi"], "brand")
+        second = await extractor.extract_themes("Reishi for calm evenings", ["reishi"], "brand")
+
+        assert first == second
+        llm.generate.assert_awaited_once()
@@ -0,0 +1,169 @@
+"""Tests for process-pool batch execution.
+
+Tests verify:
+- Results come back in input order across chunks and workers
+- One shared pool (capped at cores - 1) serves every component
+- Each worker process builds a component once per spec and keeps it
+- Worker exceptions propagate to the caller
+- map_batch runs inline without an executor
+- Validators and scorers produce the same results through a pool
+"""
+
+import os
+
+import pytest
+
+from teams.dawo.middleware import ProcessBatchExecutor, WorkerSpec, map_batch
+from teams.dawo.middleware.process_pool import default_max_workers
+from teams.dawo.validators import BrandVoiceValidator, EUComplianceChecker
+
+
+RULES = {
+    "prohibited_patterns": [{"pattern": "cures", "category": "cure_claim"}],
+    "borderline_patterns": [{"pattern": "supports", "category": "function_claim"}],
+    "permitted_patterns": [{"pattern": "ritual", "category": "lifestyle"}],
+}
+
+BRAND_PROFILE = {
+    "brand_name": "DAWO",
+    "tone_pillars": {
+        "warm": {
+            "description": "Friendly, inviting, personal",
+            "positive_markers": ["we", "share"],
+            "negative_markers": ["consumers"],
+        },
+    },
+    "forbidden_terms": {"medicinal": ["cure"], "sales_pressure": ["buy now"], "superlatives": ["best"]},
+    "ai_generic_patterns": ["Look no further"],
+    "scoring_thresholds": {"pass": 0.8, "needs_revision": 0.5, "fail": 0.0},
+}
+
+
+class EchoWorker:
+    """Picklable test component."""
+
+    def __init__(self, suffix: str) -> None:
+        self.suffix = suffix
+
+    def shout(self, text: str) -> str:
+        return f"{text.upper()}{self.suffix}"
+
+    def identity(self, _: object) -> tuple[int, int]:
+        return os.getpid(), id(self)
+
+    def fail(self, text: str) -> str:
+        raise ValueError(f"bad item {text}")
+
+    def worker_spec(self) -> WorkerSpec:
+        return WorkerSpec(EchoWorker, (self.suffix,))
+
+
+@pytest.fixture
+def executor():
+    """Two-worker executor with small chunks."""
+    pool = ProcessBatchExecutor(max_workers=2, chunk_size=3)
+    yield pool
+    pool.shutdown()
+
+
+class TestProcessBatchExecutor:
+    """Tests for ProcessBatchExecutor."""
+
+    def test_invalid_settings(self):
+        """Worker counts and chunk sizes must be positive."""
+        with pytest.raises(ValueError):
+            ProcessBatchExecutor(max_workers=0)
+        with pytest.raises(ValueError):
+            ProcessBatchExecutor(chunk_size=0)
+
+    def test_workers_capped_at_cores_minus_one(self):
+        """More workers than cores - 1 are never started."""
+        assert ProcessBatchExecutor(max_workers=10_000)._max_workers == default_max_workers()
+
+    def test_spec_key_tracks_config(self):
+        """Specs with the same factory and config share a built component."""
+        assert WorkerSpec(EchoWorker, ("!",)).key() == WorkerSpec(EchoWorker, ("!",)).key()
+        assert WorkerSpec(EchoWorker, ("!",)).key() != WorkerSpec(EchoWorker, ("?",)).key()
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self, executor):
+        """Chunks finishing out of order are reassembled in input order."""
+        items = [f"item{i}" for i in range(20)]
+
+        results = await executor.map(EchoWorker("!").worker_spec(), "shout", items)
+
+        assert results == [f"ITEM{i}!" for i in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, executor):
+        """An empty batch starts no workers."""
+        assert await executor.map(EchoWorker("!").worker_spec(), "shout", []) == []
+
+    @pytest.mark.asyncio
+    async def test_component_built_once_per_worker(self, executor):
+        """Every chunk a worker runs for a spec reuses the component it built."""
+        spec = EchoWorker("!").worker_spec()
+
+        first = await executor.map(spec, "identity", list(range(30)))
+        second = await executor.map(spec, "identity", list(range(30)))
+
+        pids = {pid for pid, _ in first + second}
+        assert len(set(first + second)) == len(pids) <= 2
+        assert os.getpid() not in pids
+
+    @pytest.mark.asyncio
+    async def test_specs_share_one_pool(self, executor):
+        """Different specs run on the same worker processes, each with its own component."""
+        first = await executor.map(EchoWorker("!").worker_spec(), "identity", list(range(30)))
+        second = await executor.map(EchoWorker("?").worker_spec(), "identity", list(range(30)))
+        shouted = await executor.map(EchoWorker("?").worker_spec(), "shout", ["a"])
+
+        assert len({pid for pid, _ in first + second}) <= 2
+        assert not set(first) & set(second)
+        assert shouted == ["A?"]
+
+    @pytest.mark.asyncio
+    async def test_worker_exception_propagates(self, executor):
+        """A failing item fails the batch with the worker's exception."""
+        with pytest.raises(ValueError, match="bad item"):
+            await executor.map(EchoWorker("!").worker_spec(), "fail", ["a"])
+
+    @pytest.mark.asyncio
+    async def test_inline_without_executor(self):
+        """map_batch runs the method in process when no executor is injected."""
+        items = [f"item{i}" for i in range(120)]
+
+        results = await map_batch(None, EchoWorker("?"), "shout", items)
+
+        assert results == [f"ITEM{i}?" for i in range(120)]
+
+
+class TestComponentBatches:
+    """Tests for component batch APIs backed by the executor."""
+
+    CONTENTS = [
+        "Our morning ritual supports focus",
+        "This tea cures everything - buy now",
+        "We share the best forest finds",
+        "",
+    ]
+
+    @pytest.mark.asyncio
+    async def test_compliance_batch_matches_sync(self, executor):
+        """Pool and inline checks equal check_content_sync per content."""
+        checker = EUComplianceChecker(RULES)
+        pooled = EUComplianceChecker(RULES, batch_executor=executor)
+
+        expected = [checker.check_content_sync(content) for content in self.CONTENTS]
+
+        assert await checker.check_patterns_batch(self.CONTENTS) == expected
+        assert await pooled.check_patterns_batch(self.CONTENTS) == expected
+
+    @pytest.mark.asyncio
+    async def test_brand_batch_matches_sync(self, executor):
+        """Pooled brand validation equals validate_content_sync per content."""
+        validator = BrandVoiceValidator(BRAND_PROFILE, batch_executor=executor)
+
+        results = await validator.validate_patterns_batch(self.CONTENTS)
+
+        assert results == [validator.validate_content_sync(content) for content in self.CONTENTS]
@@ -0,0 +1,196 @@
+"""Tests for per-stage pipeline telemetry.
+
+Tests verify:
+- Stages record wall time, items and throughput
+- Reporting hooks count against the active stage only
+- Tasks spawned inside a stage report into it
+- Retries and LLM cache misses are attributed to the stage
+- The store keeps a bounded, newest-first history and summarizes it
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from teams.dawo.middleware import (
+    LLMResponseCache,
+    PipelineTelemetry,
+    PipelineTelemetryStore,
+    RetryConfig,
+    RetryMiddleware,
+    SQLiteLLMCacheBackend,
+    cached_generate,
+)
+from teams.dawo.middleware.telemetry import (
+    current_stage,
+    record_call,
+    record_llm_call,
+    record_retry,
+)
+
+
+def _run(pipeline: str, harvest_calls: int = 1) -> PipelineTelemetry:
+    """Build a finished run with scan and harvest stages."""
+    telemetry = PipelineTelemetry(pipeline=pipeline)
+    with telemetry.stage("scan") as stage:
+        stage.items_out = 10
+    with telemetry.stage("harvest", items_in=10) as stage:
+        for _ in range(harvest_calls):
+            record_call(100)
+        stage.items_out = 8
+    return telemetry.finish()
+
+
+class TestPipelineTelemetry:
+    """Tests for stage recording."""
+
+    def test_stage_records_items_and_time(self):
+        """Stages keep items in/out and a non-negative wall time."""
+        telemetry = _run("reddit")
+
+        harvest = telemetry.get_stage("harvest")
+        assert [stage.name for stage in telemetry.stages] == ["scan", "harvest"]
+        assert harvest.items_in == 10
+        assert harvest.items_out == 8
+        assert harvest.wall_seconds >= 0
+        assert telemetry.total_seconds >= harvest.wall_seconds
+
+    def test_items_per_second_handles_zero_time(self):
+        """Throughput is zero rather than dividing by zero."""
+        telemetry = PipelineTelemetry(pipeline="reddit")
+        with telemetry.stage("scan") as stage:
+            stage.items_out = 5
+        stage.wall_seconds = 0.0
+
+        assert stage.items_per_second == 0.0
+
+    def test_hooks_count_against_active_stage(self):
+        """Calls, bytes, retries and LLM calls land on the active stage."""
+        telemetry = PipelineTelemetry(pipeline="youtube")
+        with telemetry.stage("summarize") as stage:
+            record_call(250)
+            record_call(50)
+            record_retry()
+            record_llm_call()
+
+        assert stage.external_calls == 2
+        assert stage.bytes_transferred == 300
+        assert stage.retries == 1
+        assert stage.llm_calls == 1
+
+    def test_hooks_are_noops_outside_stage(self):
+        """Reports made outside a stage are dropped."""
+        telemetry = PipelineTelemetry(pipeline="youtube")
+        with telemetry.stage("scan"):
+            pass
+
+        record_call(100)
+        record_retry()
+
+        assert current_stage() is None
+        assert telemetry.stages[0].external_calls == 0
+        assert telemetry.stages[0].retries == 0
+
+    def test_stage_resets_on_error(self):
+        """A failing stage still records its time and clears the context."""
+        telemetry = PipelineTelemetry(pipeline="news")
+        with pytest.raises(RuntimeError):
+            with telemetry.stage("scan"):
+                raise RuntimeError("boom")
+
+        assert current_stage() is None
+        assert telemetry.get_stage("scan").wall_seconds >= 0
+
+    @pytest.mark.asyncio
+    async def test_gathered_tasks_report_into_stage(self):
+        """Tasks spawned inside a stage share its metrics."""
+
+        async def fetch() -> None:
+            await asyncio.sleep(0)
+            record_call(10)
+
+        telemetry = PipelineTelemetry(pipeline="instagram")
+        with telemetry.stage("harvest") as stage:
+            await asyncio.gather(*(fetch() for _ in range(5)))
+
+        assert stage.external_calls == 5
+        assert stage.bytes_transferred == 50
+
+    @pytest.mark.asyncio
+    async def test_retry_middleware_reports_retries(self):
+        """Each repeated attempt counts as a retry."""
+        middleware = RetryMiddleware(RetryConfig(max_retries=3, base_delay=0.01))
+        operation = AsyncMock(
+            side_effect=[httpx.ConnectError("down"), httpx.ConnectError("down"), "ok"]
+        )
+
+        telemetry = PipelineTelemetry(pipeline="reddit")
+        with patch("asyncio.sleep", return_value=None):
+            with telemetry.stage("scan") as stage:
+                result = await middleware.execute_with_retry(operation, "scan")
+
+        assert result.success is True
+        assert stage.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_generate_counts_misses_only(self):
+        """LLM calls are counted on cache misses, not hits."""
+        cache = LLMResponseCache(SQLiteLLMCacheBackend(":memory:"))
+        generate = AsyncMock(return_value='{"summary": "ok"}')
+
+        telemetry = PipelineTelemetry(pipeline="pubmed")
+        with telemetry.stage("summarize") as stage:
+            for _ in range(2):
+                await cached_generate(
+                    cache, "summary-v1", "generate", {"text": "same"}, generate, json.loads
+                )
+
+        assert generate.await_count == 1
+        assert stage.llm_calls == 1
+
+
+class TestPipelineTelemetryStore:
+    """Tests for the rolling telemetry history."""
+
+    def test_invalid_window_size(self):
+        """Window size must be positive."""
+        with pytest.raises(ValueError):
+            PipelineTelemetryStore(window_size=0)
+
+    def test_history_is_newest_first_and_bounded(self):
+        """The store keeps the newest window_size runs per pipeline."""
+        store = PipelineTelemetryStore(window_size=2)
+        runs = [_run("reddit", harvest_calls=n) for n in (1, 2, 3)]
+        for run in runs:
+            store.record(run)
+        store.record(_run("news"))
+
+        history = store.get_history("reddit")
+        assert history == [runs[2], runs[1]]
+        assert store.get_history("reddit", limit=1) == [runs[2]]
+        assert store.pipelines() == ["news", "reddit"]
+
+    def test_summarize_averages_stages(self):
+        """Summaries average each stage across runs in execution order."""
+        store = PipelineTelemetryStore()
+        store.record(_run("reddit", harvest_calls=1))
+        store.record(_run("reddit", harvest_calls=3))
+
+        summary = store.summarize("reddit")
+
+        assert summary.runs == 2
+        assert [stage.name for stage in summary.stages] == ["scan", "harvest"]
+        harvest = summary.stages[1]
+        assert harvest.avg_external_calls == 2.0
+        assert harvest.avg_bytes_transferred == 200.0
+
+    def test_summarize_unknown_pipeline(self):
+        """Unknown pipelines summarize to zero runs."""
+        summary = PipelineTelemetryStore().summarize("missing")
+
+        assert summary.runs == 0
+        assert summary.stages == []
+        assert summary.last_run_at is None
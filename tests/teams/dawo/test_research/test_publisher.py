@@ -15,6 +15,7 @@ from uuid import uuid4
 from teams.dawo.research.models import ResearchSource, ComplianceStatus
 from teams.dawo.research.publisher import ResearchPublisher, TransformedResearch
 from teams.dawo.research.exceptions import ValidationError
+from teams.dawo.research.repository import BulkUpsertResult
 
 
 class TestPublisherInitialization:
@@ -216,8 +217,8 @@ class TestPublishBatchMethod:
         return ResearchPublisher(mock_repository)
 
     @pytest.mark.asyncio
-    async def test_publish_batch_calls_bulk_insert(self, publisher, mock_repository):
-        """publish_batch() calls repository.bulk_insert()."""
+    async def test_publish_batch_calls_bulk_upsert(self, publisher, mock_repository):
+        """publish_batch() calls repository.bulk_upsert()."""
         items = [
             TransformedResearch(
                 source=ResearchSource.REDDIT,
@@ -228,26 +229,26 @@ class TestPublishBatchMethod:
             for i in range(3)
         ]
 
-        mock_repository.bulk_insert.return_value = 3
+        mock_repository.bulk_upsert.return_value = BulkUpsertResult(inserted=3)
 
         result = await publisher.publish_batch(items)
 
-        mock_repository.bulk_insert.assert_called_once()
+        mock_repository.bulk_upsert.assert_called_once()
         assert result == 3
 
     @pytest.mark.asyncio
     async def test_publish_batch_empty_list(self, publisher, mock_repository):
         """publish_batch() handles empty list."""
-        mock_repository.bulk_insert.return_value = 0
+        mock_repository.bulk_upsert.return_value = BulkUpsertResult()
 
         result = await publisher.publish_batch([])
 
-        mock_repository.bulk_insert.assert_called_once()
+        mock_repository.bulk_upsert.assert_called_once()
         assert result == 0
 
     @pytest.mark.asyncio
     async def test_publish_batch_returns_count(self, publisher, mock_repository):
-        """publish_batch() returns count of items inserted."""
+        """publish_batch() returns count of items inserted or updated."""
         items = [
             TransformedResearch(
                 source=ResearchSource.YOUTUBE,
@@ -258,7 +259,7 @@ class TestPublishBatchMethod:
             for i in range(5)
         ]
 
-        mock_repository.bulk_insert.return_value = 5
+        mock_repository.bulk_upsert.return_value = BulkUpsertResult(inserted=2, updated=3)
 
         result = await publisher.publish_batch(items)
 
@@ -278,12 +279,12 @@ class TestPublishBatchMethod:
             )
         ]
 
-        mock_repository.bulk_insert.return_value = 1
+        mock_repository.bulk_upsert.return_value = BulkUpsertResult(inserted=1)
 
         await publisher.publish_batch(items)
 
         # Verify the conversion happened
-        call_args = mock_repository.bulk_insert.call_args
+        call_args = mock_repository.bulk_upsert.call_args
         assert call_args is not None
         create_items = call_args[0][0]  # First positional argument
         assert len(create_items) == 1
@@ -291,6 +292,51 @@ class TestPublishBatchMethod:
         assert create_items[0].title == "Research Paper"
         assert create_items[0].score == 8.5
 
+    @pytest.mark.asyncio
+    async def test_upsert_batch_returns_inserted_and_updated(self, publisher, mock_repository):
+        """upsert_batch() returns the repository's inserted/updated split."""
+        items = [
+            TransformedResearch(
+                source=ResearchSource.REDDIT,
+                title="Reddit Post",
+                content="Post content.",
+                url="https://example.com/article",
+                source_key="/r/Supplements/comments/abc123/post/",
+            )
+        ]
+
+        mock_repository.bulk_upsert.return_value = BulkUpsertResult(inserted=0, updated=1)
+
+        result = await publisher.upsert_batch(items)
+
+        assert result.inserted == 0
+        assert result.updated == 1
+        create_items = mock_repository.bulk_upsert.call_args[0][0]
+        assert create_items[0].source_key == "/r/Supplements/comments/abc123/post/"
+
+    @pytest.mark.asyncio
+    async def test_publish_then_upsert_same_url_share_source_key(
+        self, publisher, mock_repository
+    ):
+        """An item published without source_key is keyed by URL for later upserts."""
+        item = TransformedResearch(
+            source=ResearchSource.NEWS,
+            title="News Article",
+            content="Article content.",
+            url="https://news.example.com/article",
+        )
+        mock_repository.add_item.return_value = MagicMock(id=uuid4())
+        mock_repository.bulk_upsert.return_value = BulkUpsertResult(inserted=0, updated=1)
+
+        await publisher.publish(item)
+        result = await publisher.upsert_batch([item])
+
+        published = mock_repository.add_item.call_args[0][0]
+        upserted = mock_repository.bulk_upsert.call_args[0][0][0]
+        assert published.source_key == "https://news.example.com/article"
+        assert upserted.source_key == published.source_key
+        assert result.updated == 1
+
 
 class TestTransformedResearchURLValidation:
     """Tests for URL validation in TransformedResearch schema."""
@@ -4,6 +4,7 @@ Tests cover:
 - Repository initialization with session injection
 - Query filters dataclass
 - Repository method signatures and contracts
+- Batched score updates and streamed scoring reads
 
 Note: Full integration tests require PostgreSQL database.
 Unit tests use mocks to test repository logic independently.
@@ -14,7 +15,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from teams.dawo.research.models import ResearchSource, ComplianceStatus
+from teams.dawo.research.models import ResearchItem, ResearchSource, ComplianceStatus
 from teams.dawo.research.repository import ResearchPoolRepository, ResearchQueryFilters
 from teams.dawo.research.schemas import ResearchItemCreate
 from teams.dawo.research.exceptions import ItemNotFoundError
@@ -37,6 +38,7 @@ class TestQueryFiltersDataclass:
         assert filters.limit == 50
         assert filters.offset == 0
         assert filters.sort_by == "score"
+        assert filters.cursor is None
 
     def test_custom_values(self):
         """Filters accept custom values."""
@@ -409,6 +411,109 @@ class TestSearchMethod:
         mock_session.execute.assert_called_once()
 
 
+class TestKeysetPagination:
+    """Tests for cursor-based (keyset) pagination in query_page/search_page."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a mock async session."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        """Create repository with mock session."""
+        return ResearchPoolRepository(mock_session)
+
+    @staticmethod
+    def _make_items(count: int) -> list[ResearchItem]:
+        """Build detached ResearchItem rows in score order."""
+        created = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        return [
+            ResearchItem(id=uuid4(), score=9.0 - i, created_at=created)
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_query_page_returns_cursor_when_more_items(self, repository, mock_session):
+        """query_page fetches limit + 1 rows and emits a cursor if more exist."""
+        items = self._make_items(3)
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = items
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        page, next_cursor = await repository.query_page(ResearchQueryFilters(limit=2))
+
+        assert page == items[:2]
+        assert next_cursor is not None
+        assert repository._decode_cursor(next_cursor, "score") == (
+            items[1].score,
+            items[1].created_at,
+            items[1].id,
+        )
+
+    @pytest.mark.asyncio
+    async def test_query_page_last_page_has_no_cursor(self, repository, mock_session):
+        """query_page returns None cursor when all items fit the page."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = self._make_items(2)
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        page, next_cursor = await repository.query_page(ResearchQueryFilters(limit=2))
+
+        assert len(page) == 2
+        assert next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_cursor_replaces_offset(self, repository, mock_session):
+        """A cursor adds a row-value keyset predicate and no OFFSET."""
+        item = self._make_items(1)[0]
+        cursor = repository._encode_cursor(
+            "score",
+            {"score": item.score, "created_at": item.created_at, "id": item.id},
+        )
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = []
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        await repository.query(ResearchQueryFilters(cursor=cursor, offset=100))
+
+        sql = str(mock_session.execute.call_args[0][0])
+        assert "(research_items.score, research_items.created_at, research_items.id) <" in sql
+        assert "OFFSET" not in sql
+
+    def test_cursor_for_other_sort_is_rejected(self, repository):
+        """Cursors issued for one sort order are ignored for another."""
+        cursor = repository._encode_cursor(
+            "date",
+            {"created_at": datetime(2026, 1, 1, tzinfo=timezone.utc), "id": uuid4()},
+        )
+
+        assert repository._decode_cursor(cursor, "score") is None
+
+    def test_invalid_cursor_is_ignored(self, repository):
+        """Malformed cursors decode to None instead of raising."""
+        assert repository._decode_cursor("not-a-cursor", "score") is None
+
+    @pytest.mark.asyncio
+    async def test_search_page_cursor_carries_rank(self, repository, mock_session):
+        """search_page encodes ts_rank of the last row in the cursor."""
+        items = self._make_items(2)
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(items[0], 0.5), (items[1], 0.25)]
+        mock_session.execute = AsyncMock(return_value=mock_result)
+
+        page, next_cursor = await repository.search_page(
+            "lions mane", ResearchQueryFilters(limit=1)
+        )
+
+        assert page == [items[0]]
+        assert repository._decode_cursor(next_cursor, "search") == (
+            0.5,
+            items[0].score,
+            items[0].id,
+        )
+
+
 class TestBulkInsertMethod:
     """Tests for repository bulk_insert method."""
 
@@ -479,6 +584,154 @@ class TestBulkInsertMethod:
         mock_session.rollback.assert_called_once()
 
 
+class TestBulkUpsertMethod:
+    """Tests for repository bulk_upsert method."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a mock async session."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        """Create repository with mock session."""
+        return ResearchPoolRepository(mock_session)
+
+    @staticmethod
+    def _returning(flags: list[bool]) -> MagicMock:
+        """Build a mock result whose scalars() yields RETURNING flags."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value = iter(flags)
+        return mock_result
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_counts_inserted_and_updated(self, repository, mock_session):
+        """bulk_upsert splits RETURNING (xmax = 0) flags into counts."""
+        items = [
+            ResearchItemCreate(
+                source=ResearchSource.REDDIT,
+                title=f"Test Item {i}",
+                content=f"Test content {i}.",
+                url=f"https://example.com/{i}",
+            )
+            for i in range(3)
+        ]
+        mock_session.execute = AsyncMock(return_value=self._returning([True, False, True]))
+
+        result = await repository.bulk_upsert(items)
+
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_called_once()
+        assert result.inserted == 2
+        assert result.updated == 1
+        assert result.total == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_empty_list_skips_database(self, repository, mock_session):
+        """bulk_upsert returns zero counts without touching the session."""
+        result = await repository.bulk_upsert([])
+
+        mock_session.execute.assert_not_called()
+        assert result.total == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_collapses_in_batch_duplicates(self, repository, mock_session):
+        """Items sharing (source, source_key) are sent once, last one wins."""
+        items = [
+            ResearchItemCreate(
+                source=ResearchSource.YOUTUBE,
+                title=title,
+                content="Transcript.",
+                url="https://youtube.com/watch?v=abc",
+            )
+            for title in ("First", "Second")
+        ]
+        mock_session.execute = AsyncMock(return_value=self._returning([True]))
+
+        result = await repository.bulk_upsert(items)
+
+        stmt = mock_session.execute.call_args[0][0]
+        params = stmt.compile().params
+        assert "Second" in params.values()
+        assert "First" not in params.values()
+        assert result.inserted == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_chunks_large_batches(self, repository, mock_session):
+        """Batches larger than UPSERT_CHUNK_SIZE use multiple statements."""
+        from teams.dawo.research.repository import UPSERT_CHUNK_SIZE
+
+        items = [
+            ResearchItemCreate(
+                source=ResearchSource.NEWS,
+                title=f"Article {i}",
+                content="Body.",
+                url=f"https://news.example.com/{i}",
+            )
+            for i in range(UPSERT_CHUNK_SIZE + 1)
+        ]
+        mock_session.execute = AsyncMock(
+            side_effect=[
+                self._returning([True] * UPSERT_CHUNK_SIZE),
+                self._returning([False]),
+            ]
+        )
+
+        result = await repository.bulk_upsert(items)
+
+        assert mock_session.execute.call_count == 2
+        mock_session.commit.assert_called_once()
+        assert result.inserted == UPSERT_CHUNK_SIZE
+        assert result.updated == 1
+
+    def test_build_upsert_row_defaults_source_key_to_url(self):
+        """Items without source_key are keyed by URL."""
+        item = ResearchItemCreate(
+            source=ResearchSource.NEWS,
+            title="Article",
+            content="Body.",
+            url="https://news.example.com/article",
+        )
+
+        row = ResearchPoolRepository._build_upsert_row(item)
+
+        assert row["source_key"] == "https://news.example.com/article"
+
+    def test_create_schema_defaults_source_key_to_truncated_url(self):
+        """The URL default is applied once, in ResearchItemCreate, for every write path."""
+        from teams.dawo.research.models import MAX_SOURCE_KEY_LENGTH
+
+        url = "https://news.example.com/" + "a" * MAX_SOURCE_KEY_LENGTH
+        item = ResearchItemCreate(
+            source=ResearchSource.NEWS,
+            title="Article",
+            content="Body.",
+            url=url,
+        )
+
+        assert item.source_key == url[:MAX_SOURCE_KEY_LENGTH]
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_rolls_back_on_error(self, repository, mock_session):
+        """bulk_upsert rolls back and wraps errors in DatabaseError."""
+        from teams.dawo.research.exceptions import DatabaseError
+
+        items = [
+            ResearchItemCreate(
+                source=ResearchSource.REDDIT,
+                title="Test Item",
+                content="Test content.",
+                url="https://example.com/123",
+            )
+        ]
+        mock_session.execute = AsyncMock(side_effect=Exception("Database error"))
+
+        with pytest.raises(DatabaseError):
+            await repository.bulk_upsert(items)
+
+        mock_session.rollback.assert_called_once()
+
+
 class TestURLValidation:
     """Tests for URL validation in schemas."""
 
@@ -691,3 +944,189 @@ class TestUpdateItemMethod:
             await repository.update_item(item_id, updates)
 
         mock_session.rollback.assert_called_once()
+
+
+class TestBulkUpdateScores:
+    """Tests for repository bulk_update_scores method."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a mock async session."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def repository(self, mock_session):
+        """Create repository with mock session."""
+        return ResearchPoolRepository(mock_session)
+
+    @pytest.mark.asyncio
+    async def test_single_update_from_values(self, repository, mock_session):
+        """All scores are written by one UPDATE ... FROM (VALUES ...)."""
+        from sqlalchemy.dialects import postgresql
+
+        mock_session.execute = AsyncMock(return_value=MagicMock(rowcount=2))
+
+        updated = await repository.bulk_update_scores(
+            [(uuid4(), 7.5), (uuid4(), 3.0), (uuid4(), 5.0)]
+        )
+
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_called_once()
+        assert updated == 2
+
+        sql = str(mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE research_items SET score=new_scores.score FROM (VALUES")
+        assert "IS DISTINCT FROM new_scores.score" in sql
+
+    @pytest.mark.asyncio
+    async def test_commit_false_defers_commit(self, repository, mock_session):
+        """commit=False leaves the transaction open for the caller."""
+        mock_session.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+
+        await repository.bulk_update_scores([(uuid4(), 7.5)], commit=False)
+
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_empty_scores_skip_database(self, repository, mock_session):
+        """An empty batch never reaches the session."""
+        assert await repository.bulk_update_scores([]) == 0
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rolls_back_on_error(self, repository, mock_session):
+        """Database errors roll back and raise DatabaseError."""
+        from teams.dawo.research.exceptions import DatabaseError
+
+        mock_session.execute = AsyncMock(side_effect=Exception("Database error"))
+
+        with pytest.raises(DatabaseError):
+            await repository.bulk_update_scores([(uuid4(), 1.0)])
+
+        mock_session.rollback.assert_called_once()
+
+
+class TestFetchScoringRows:
+    """Tests for repository fetch_scoring_rows method."""
+
+    @pytest.mark.asyncio
+    async def test_first_batch_as_dicts(self):
+        """Rows come back as plain dicts, ordered by id and limited."""
+        from sqlalchemy.dialects import postgresql
+
+        session = AsyncMock()
+        rows = [{"id": uuid4(), "title": "A"}, {"id": uuid4(), "title": "B"}]
+        result = MagicMock()
+        result.mappings.return_value = rows
+        session.execute = AsyncMock(return_value=result)
+        repository = ResearchPoolRepository(session)
+
+        assert await repository.fetch_scoring_rows(limit=2) == rows
+
+        sql = str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "ORDER BY research_items.id" in sql
+        assert "LIMIT" in sql
+        assert "WHERE" not in sql
+
+    @pytest.mark.asyncio
+    async def test_next_batch_starts_after_id(self):
+        """Later batches continue after the last id of the previous one."""
+        from sqlalchemy.dialects import postgresql
+
+        session = AsyncMock()
+        session.execute = AsyncMock(return_value=MagicMock())
+        repository = ResearchPoolRepository(session)
+
+        await repository.fetch_scoring_rows(after_id=uuid4())
+
+        sql = str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "WHERE research_items.id >" in sql
+
+    @pytest.mark.asyncio
+    async def test_error_raises_database_error(self):
+        """Query failures roll back and raise DatabaseError."""
+        from teams.dawo.research.exceptions import DatabaseError
+
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=Exception("query error"))
+        repository = ResearchPoolRepository(session)
+
+        with pytest.raises(DatabaseError):
+            await repository.fetch_scoring_rows()
+
+        session.rollback.assert_called_once()
+
+
+class TestFindExistingSourceKeys:
+    """Tests for repository find_existing_source_keys method."""
+
+    @pytest.mark.asyncio
+    async def test_returns_keys_present_in_pool(self):
+        """Only keys returned by the query are reported as existing."""
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value = ["https://example.com/a"]
+        session.execute = AsyncMock(return_value=result)
+        repository = ResearchPoolRepository(session)
+
+        existing = await repository.find_existing_source_keys(
+            ResearchSource.NEWS,
+            ["https://example.com/a", "https://example.com/b"],
+        )
+
+        assert existing == {"https://example.com/a"}
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_long_keys_match_truncated_rows(self):
+        """Keys longer than the column match the row they were upserted into."""
+        from teams.dawo.research.models import MAX_SOURCE_KEY_LENGTH
+
+        long_key = "https://example.com/" + "x" * 400
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value = [long_key[:MAX_SOURCE_KEY_LENGTH]]
+        session.execute = AsyncMock(return_value=result)
+        repository = ResearchPoolRepository(session)
+
+        existing = await repository.find_existing_source_keys(ResearchSource.NEWS, [long_key])
+
+        assert existing == {long_key}
+
+    @pytest.mark.asyncio
+    async def test_query_error_raises_database_error(self):
+        """Lookup failures roll back and raise DatabaseError."""
+        from teams.dawo.research.exceptions import DatabaseError
+
+        session = AsyncMock()
+        session.execute = AsyncMock(side_effect=Exception("db error"))
+        repository = ResearchPoolRepository(session)
+
+        with pytest.raises(DatabaseError):
+            await repository.find_existing_source_keys(ResearchSource.NEWS, ["a"])
+
+        session.rollback.assert_called_once()
+
+
+class TestStreamSourceKeys:
+    """Tests for repository stream_source_keys method."""
+
+    @pytest.mark.asyncio
+    async def test_yields_key_chunks(self):
+        """Each cursor partition is yielded as a list of keys."""
+
+        async def partition_iter(size):
+            yield ["a", "b"]
+            yield ["c"]
+
+        stream_result = MagicMock()
+        stream_result.scalars.return_value.partitions = partition_iter
+        session = AsyncMock()
+        session.stream = AsyncMock(return_value=stream_result)
+        repository = ResearchPoolRepository(session)
+
+        chunks = [
+            keys async for keys in repository.stream_source_keys(ResearchSource.REDDIT, 2)
+        ]
+
+        assert chunks == [["a", "b"], ["c"]]
@@ -10,6 +10,7 @@ Tests:
     - PubMed: 50+ citations = 10, linear scale
     - News: Default score 5 (no engagement metrics)
     - Missing engagement data defaults to 5
+    - score_batch() rounds exactly like score(), including .xx5 values
 """
 
 import pytest
@@ -199,6 +200,23 @@ class TestEngagementConstants:
         assert DEFAULT_ENGAGEMENT_SCORE == 5.0
 
 
+class TestScoreBatch:
+    """Tests for score_batch() parity with score()."""
+
+    def test_half_cent_values_round_like_score(self):
+        """Scores landing on .xx5 round the same way per item and in a batch."""
+        # 2000 likes for max score: every odd like count scales to a .xx5 score
+        scorer = EngagementScorer(config=EngagementConfig(instagram_max_likes=2000))
+        items = [
+            _create_test_item(ResearchSource.INSTAGRAM.value, {"likes": likes})
+            for likes in range(1, 400, 2)
+        ]
+
+        batch = scorer.score_batch(items)
+
+        assert batch.tolist() == [scorer.score(item).raw_score for item in items]
+
+
 def _create_test_item(
     source: str,
     source_metadata: dict = None,
@@ -7,6 +7,7 @@ Tests:
     - Score calculation 0-10 based on match density
     - Case-insensitive matching
     - Matching in both title and content
+    - KeywordMatcher single-pass matching (overlaps, substrings, order)
 """
 
 import pytest
@@ -17,6 +18,7 @@ from teams.dawo.research.models import ResearchSource, ComplianceStatus
 from teams.dawo.research.scoring.components.relevance import (
     RelevanceScorer,
     RelevanceConfig,
+    KeywordMatcher,
     PRIMARY_KEYWORD_BONUS,
     SECONDARY_KEYWORD_BONUS,
     MAX_PRIMARY_BONUS,
@@ -243,6 +245,66 @@ class TestRelevanceConstants:
         assert MAX_SCORE == 10.0
 
 
+class TestKeywordMatcher:
+    """Tests for the compiled single-pass keyword matcher."""
+
+    def test_finds_keywords_case_insensitive_config(self):
+        """Keywords configured in any case should match lowercase text."""
+        matcher = KeywordMatcher(["Reishi"], ["Sleep"])
+        matches = matcher.match("reishi before sleep")
+
+        assert matches.primary == ["reishi"]
+        assert matches.secondary == ["sleep"]
+
+    def test_keyword_contained_in_longer_keyword(self):
+        """A keyword inside a longer hit should also be reported."""
+        matcher = KeywordMatcher([], ["adaptogen", "adaptogenic"])
+
+        assert matcher.find("an adaptogenic blend") == {"adaptogen", "adaptogenic"}
+
+    def test_overlapping_keywords(self):
+        """Keywords starting inside an earlier hit should not be skipped."""
+        matcher = KeywordMatcher(["cordyceps"], ["psilocybin"])
+
+        assert matcher.find("cordycepsilocybin") == {"cordyceps", "psilocybin"}
+
+    def test_substring_semantics_match_in_operator(self):
+        """Matching should be plain substring containment, like `in`."""
+        matcher = KeywordMatcher([], ["rest", "immune system"])
+
+        assert matcher.find("an interesting immune systems study") == {"rest", "immune system"}
+
+    def test_matches_in_config_order(self):
+        """Matches should follow configuration order, not text order."""
+        matcher = KeywordMatcher(["chaga", "reishi"], [])
+
+        assert matcher.match("reishi and chaga").primary == ["chaga", "reishi"]
+
+    def test_empty_keywords(self):
+        """A matcher without keywords should never match."""
+        matcher = KeywordMatcher([], [])
+        matches = matcher.match("reishi")
+
+        assert matches.primary == []
+        assert matches.secondary == []
+
+    def test_agrees_with_substring_checks_on_defaults(self, default_relevance_config: RelevanceConfig):
+        """Default keyword hits should equal per-keyword `in` checks."""
+        matcher = KeywordMatcher(
+            default_relevance_config.primary_keywords,
+            default_relevance_config.secondary_keywords,
+        )
+        text = "lion's mane and cordyceps militaris improve cognitive energy and rest"
+        expected = {
+            kw.lower()
+            for kw in default_relevance_config.primary_keywords
+            + default_relevance_config.secondary_keywords
+            if kw.lower() in text
+        }
+
+        assert matcher.find(text) == expected
+
+
 def _create_test_item(
     title: str,
     content: str,
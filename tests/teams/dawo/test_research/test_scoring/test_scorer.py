@@ -8,12 +8,14 @@ Tests:
     - ScoringResult generation with component breakdown
     - AC#2: PubMed RCT scores 8+
     - AC#3: High-engagement Reddit scores 4-6
+    - Batch scoring, vectorized and through a process pool
 """
 
 import pytest
 from uuid import uuid4
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+from teams.dawo.middleware import ProcessBatchExecutor
 from teams.dawo.research.models import ResearchSource, ComplianceStatus
 from teams.dawo.research.scoring.scorer import ResearchItemScorer
 from teams.dawo.research.scoring.config import ScoringConfig, ScoringWeights
@@ -254,6 +256,156 @@ class TestWeightedAverage:
         assert len(result.component_scores) >= 4
 
 
+class TestCalculateScores:
+    """Tests for the vectorized batch scoring API."""
+
+    @pytest.fixture
+    def mixed_items(self) -> list[dict]:
+        """Items covering every source, metric scale and compliance status."""
+        old = datetime.now(timezone.utc) - timedelta(days=12)
+        return [
+            _create_test_item(
+                source=ResearchSource.PUBMED.value,
+                title="Lion's mane RCT on cognition",
+                source_metadata={"study_type": "RCT", "citation_count": 20},
+            ),
+            _create_test_item(
+                source=ResearchSource.REDDIT.value,
+                title="Chaga for immunity and energy",
+                source_metadata={"upvotes": 150},
+                compliance_status=ComplianceStatus.WARNING.value,
+            ),
+            _create_test_item(
+                source=ResearchSource.YOUTUBE.value,
+                content="Reishi sleep and stress review",
+                source_metadata={"views": 2500},
+            ),
+            _create_test_item(
+                source=ResearchSource.INSTAGRAM.value,
+                source_metadata={},
+                compliance_status=ComplianceStatus.REJECTED.value,
+            ),
+            {**_create_test_item(source=ResearchSource.NEWS.value), "created_at": old},
+            {**_create_test_item(source="unknown"), "created_at": None},
+        ]
+
+    def test_matches_per_item_scores(
+        self, composite_scorer: ResearchItemScorer, mixed_items: list[dict]
+    ):
+        """Batch scores equal calculate_score() for every item."""
+        batch = composite_scorer.calculate_scores(mixed_items)
+
+        assert len(batch) == len(mixed_items)
+        for index, item in enumerate(mixed_items):
+            single = composite_scorer.calculate_score(item)
+            assert batch.final_scores[index] == pytest.approx(single.final_score, abs=0.01)
+            for name, component in single.component_scores.items():
+                assert getattr(batch, name)[index] == pytest.approx(
+                    component.raw_score, abs=0.01
+                )
+
+    def test_rejected_items_score_zero(
+        self, composite_scorer: ResearchItemScorer, mixed_items: list[dict]
+    ):
+        """REJECTED items are forced to 0 in the batch too."""
+        batch = composite_scorer.calculate_scores(mixed_items)
+
+        assert batch.rejected.tolist() == [False, False, False, True, False, False]
+        assert batch.final_scores[3] == 0.0
+
+    def test_uses_per_source_weights(self):
+        """Source overrides produce per-row weight vectors."""
+        config = ScoringConfig(
+            source_overrides={
+                "reddit": ScoringWeights(
+                    relevance=0.2, recency=0.2, source_quality=0.1,
+                    engagement=0.4, compliance=0.1,
+                ),
+            }
+        )
+        scorer = ResearchItemScorer(
+            config=config,
+            relevance_scorer=RelevanceScorer(config=RelevanceConfig()),
+            recency_scorer=RecencyScorer(config=RecencyConfig()),
+            source_quality_scorer=SourceQualityScorer(config=SourceQualityConfig()),
+            engagement_scorer=EngagementScorer(config=EngagementConfig()),
+            compliance_adjuster=ComplianceAdjuster(),
+        )
+        items = [
+            _create_test_item(source=ResearchSource.REDDIT.value),
+            _create_test_item(source=ResearchSource.NEWS.value),
+        ]
+
+        batch = scorer.calculate_scores(items)
+
+        assert batch.weights[0].tolist() == [0.2, 0.2, 0.1, 0.4, 0.1]
+        assert batch.weights[1].tolist() == [0.25, 0.20, 0.25, 0.20, 0.10]
+
+    def test_result_materializes_reasoning_lazily(
+        self, composite_scorer: ResearchItemScorer, mixed_items: list[dict]
+    ):
+        """result(i) builds a full ScoringResult with notes and reasoning."""
+        batch = composite_scorer.calculate_scores(mixed_items)
+
+        result = batch.result(0)
+
+        assert isinstance(result, ScoringResult)
+        assert result.final_score == batch.final_scores[0]
+        assert "Final score:" in result.reasoning
+        assert "lion's mane" in result.component_scores["relevance"].notes
+        assert len(list(batch.results())) == len(mixed_items)
+
+    def test_empty_batch(self, composite_scorer: ResearchItemScorer):
+        """An empty batch returns empty arrays."""
+        batch = composite_scorer.calculate_scores([])
+
+        assert len(batch) == 0
+        assert batch.weights.shape == (0, 5)
+
+
+class TestCalculateScoreBatch:
+    """Tests for full per-item results of a batch, inline or in a process pool."""
+
+    @pytest.mark.asyncio
+    async def test_inline_matches_per_item(self, composite_scorer: ResearchItemScorer):
+        """Without an executor, results equal calculate_score() in input order."""
+        items = [
+            _create_test_item(title=f"Lion's mane study {i}", source_metadata={"upvotes": i * 40})
+            for i in range(7)
+        ]
+
+        results = await composite_scorer.calculate_score_batch(items)
+
+        expected = [composite_scorer.calculate_score(item) for item in items]
+        assert [r.final_score for r in results] == pytest.approx(
+            [e.final_score for e in expected], abs=0.01
+        )
+        assert [r.component_scores["relevance"] for r in results] == [
+            e.component_scores["relevance"] for e in expected
+        ]
+
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_inline(self, composite_scorer: ResearchItemScorer):
+        """Workers rebuilt from worker_spec() score identically."""
+        items = [
+            _create_test_item(source=ResearchSource.PUBMED.value, source_metadata={"study_type": "RCT"}),
+            _create_test_item(compliance_status=ComplianceStatus.REJECTED.value),
+            _create_test_item(title="Chaga and reishi", source_metadata={"upvotes": 300}),
+        ]
+        spec = composite_scorer.worker_spec()
+        async with ProcessBatchExecutor(max_workers=1, chunk_size=2) as executor:
+            pooled = spec.factory(*spec.args, batch_executor=executor)
+            results = await pooled.calculate_score_batch(items)
+
+        expected = [composite_scorer.calculate_score(item) for item in items]
+        assert [r.final_score for r in results] == pytest.approx(
+            [e.final_score for e in expected], abs=0.01
+        )
+        assert [r.component_scores["source_quality"] for r in results] == [
+            e.component_scores["source_quality"] for e in expected
+        ]
+
+
 def _create_test_item(
     source: str = ResearchSource.REDDIT.value,
     title: str = "Test article about mushrooms",
@@ -0,0 +1,124 @@
+"""Tests for ResearchScoringService.
+
+Tests:
+    - rescore_pool pages through the pool and scores each chunk in batch
+    - Batched score writes are committed per chunk
+    - Progress reporting and throughput counters
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from teams.dawo.research.models import ResearchSource, ComplianceStatus
+from teams.dawo.research.scoring import (
+    ResearchItemScorer,
+    ResearchScoringService,
+    RescoreResult,
+)
+
+
+def _pool_row(title: str, days_old: int = 1) -> dict:
+    """Build a streamed research_items row for scoring."""
+    return {
+        "id": uuid4(),
+        "source": ResearchSource.REDDIT.value,
+        "title": title,
+        "content": "Lion's mane improved focus and memory.",
+        "url": f"https://reddit.com/r/test/{title}",
+        "tags": [],
+        "source_metadata": {"upvotes": 120, "comments": 15},
+        "created_at": datetime.now(timezone.utc) - timedelta(days=days_old),
+        "score": 0.0,
+        "compliance_status": ComplianceStatus.COMPLIANT.value,
+    }
+
+
+def _repository(chunks: list[list[dict]], updated_per_chunk: int = 1) -> MagicMock:
+    """Build a repository mock returning the given chunks, then no rows."""
+    repository = MagicMock()
+    repository.fetch_scoring_rows = AsyncMock(side_effect=[*chunks, []])
+    repository.bulk_update_scores = AsyncMock(return_value=updated_per_chunk)
+    return repository
+
+
+class TestRescorePool:
+    """Tests for ResearchScoringService.rescore_pool."""
+
+    @pytest.mark.asyncio
+    async def test_scores_and_commits_every_chunk(self, full_scorer: ResearchItemScorer):
+        """Each chunk is fetched after the previous one's last id and committed."""
+        chunks = [[_pool_row("a"), _pool_row("b")], [_pool_row("c", days_old=40)]]
+        repository = _repository(chunks)
+        service = ResearchScoringService(repository=repository, scorer=full_scorer)
+
+        result = await service.rescore_pool(chunk_size=2)
+
+        # The short second chunk ends the run without another query
+        assert [call.kwargs for call in repository.fetch_scoring_rows.await_args_list] == [
+            {"after_id": None, "limit": 2},
+            {"after_id": chunks[0][-1]["id"], "limit": 2},
+        ]
+        assert repository.bulk_update_scores.await_count == 2
+        for call in repository.bulk_update_scores.await_args_list:
+            assert call.kwargs == {}
+
+        assert result.scanned == 3
+        assert result.updated == 2
+        assert result.chunks == 2
+        assert result.elapsed_seconds > 0
+
+    @pytest.mark.asyncio
+    async def test_written_scores_match_individual_scoring(self, full_scorer: ResearchItemScorer):
+        """Batched rescoring writes the same scores as calculate_score."""
+        rows = [_pool_row("a"), _pool_row("b", days_old=20)]
+        repository = _repository([rows])
+        service = ResearchScoringService(repository=repository, scorer=full_scorer)
+
+        await service.rescore_pool()
+
+        written = repository.bulk_update_scores.await_args_list[0].args[0]
+        assert [item_id for item_id, _ in written] == [row["id"] for row in rows]
+        for (_, score), row in zip(written, rows):
+            assert score == pytest.approx(full_scorer.calculate_score(row).final_score)
+
+    @pytest.mark.asyncio
+    async def test_reports_progress_after_each_chunk(self, full_scorer: ResearchItemScorer):
+        """progress_callback receives running totals per chunk."""
+        repository = _repository([[_pool_row("a")], [_pool_row("b")]])
+        service = ResearchScoringService(repository=repository, scorer=full_scorer)
+        seen: list[dict] = []
+
+        async def on_progress(progress: RescoreResult) -> None:
+            seen.append(progress.to_dict())
+
+        await service.rescore_pool(chunk_size=1, progress_callback=on_progress)
+
+        assert [entry["scanned"] for entry in seen] == [1, 2]
+        assert [entry["chunks"] for entry in seen] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_empty_pool(self, full_scorer: ResearchItemScorer):
+        """An empty pool writes nothing and reports zero throughput."""
+        repository = _repository([])
+        service = ResearchScoringService(repository=repository, scorer=full_scorer)
+
+        result = await service.rescore_pool()
+
+        repository.bulk_update_scores.assert_not_called()
+        assert result.scanned == 0
+
+
+class TestRescoreResult:
+    """Tests for RescoreResult throughput reporting."""
+
+    def test_items_per_second(self):
+        """Throughput is scanned items over elapsed seconds."""
+        result = RescoreResult(scanned=500, elapsed_seconds=2.0)
+
+        assert result.items_per_second == 250.0
+
+    def test_items_per_second_before_start(self):
+        """Throughput is zero before any time has elapsed."""
+        assert RescoreResult().items_per_second == 0.0
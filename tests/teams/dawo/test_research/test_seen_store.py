@@ -0,0 +1,196 @@
+"""Tests for the cross-run seen-item store.
+
+Tests verify:
+- Bloom filter sizing and offsets
+- Bloom negatives skip the database; positives are confirmed in Postgres
+- A source's Bloom filter is seeded from the pool on first use
+- Without Redis (or on Redis failure) every key is checked in Postgres
+- Database failures treat items as new instead of raising
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from teams.dawo.research import ResearchSource, SeenItemStore
+from teams.dawo.research.seen_store import bloom_offsets, bloom_parameters
+
+
+class FakePipeline:
+    """Buffered getbit/setbit commands against a FakeRedis."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._commands: list[tuple] = []
+
+    def getbit(self, name: str, offset: int) -> "FakePipeline":
+        self._commands.append(("getbit", name, offset))
+        return self
+
+    def setbit(self, name: str, offset: int, value: int) -> "FakePipeline":
+        self._commands.append(("setbit", name, offset, value))
+        return self
+
+    async def execute(self) -> list[int]:
+        results = []
+        for command, name, offset, *value in self._commands:
+            bits = self._redis.bitmaps.setdefault(name, set())
+            previous = int(offset in bits)
+            if command == "setbit":
+                bits.add(offset)
+            results.append(previous)
+        self._redis.round_trips += 1
+        return results
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for bitmaps and plain keys."""
+
+    def __init__(self) -> None:
+        self.bitmaps: dict[str, set[int]] = {}
+        self.values: dict[str, object] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.values)
+
+    async def set(self, key: str, value: object) -> None:
+        self.values[key] = value
+
+
+def make_repository(existing: set[str], pool_keys: list[str] = ()) -> MagicMock:
+    """Mock repository whose pool holds the given source keys."""
+
+    async def find_existing(source, keys):
+        return {key for key in keys if key in existing}
+
+    async def stream_keys(source, chunk_size):
+        if pool_keys:
+            yield list(pool_keys)
+
+    repository = MagicMock()
+    repository.find_existing_source_keys = AsyncMock(side_effect=find_existing)
+    repository.stream_source_keys = stream_keys
+    return repository
+
+
+class TestBloomHelpers:
+    """Tests for Bloom filter sizing and hashing."""
+
+    def test_parameters_for_one_percent(self) -> None:
+        """1% error rate should need ~9.6 bits and 7 hashes per key."""
+        bits, hashes = bloom_parameters(1000, 0.01)
+
+        assert 9500 <= bits <= 9700
+        assert hashes == 7
+
+    def test_invalid_parameters_rejected(self) -> None:
+        """Out-of-range sizing should raise ValueError."""
+        with pytest.raises(ValueError):
+            bloom_parameters(0, 0.01)
+        with pytest.raises(ValueError):
+            bloom_parameters(1000, 1.5)
+
+    def test_offsets_are_stable_and_in_range(self) -> None:
+        """The same key should always map to the same offsets."""
+        offsets = bloom_offsets("https://pubmed.ncbi.nlm.nih.gov/1/", 1000, 7)
+
+        assert offsets == bloom_offsets("https://pubmed.ncbi.nlm.nih.gov/1/", 1000, 7)
+        assert len(offsets) == 7
+        assert all(0 <= offset < 1000 for offset in offsets)
+
+
+class TestSeenItemStore:
+    """Tests for SeenItemStore lookups."""
+
+    @pytest.mark.asyncio
+    async def test_without_redis_checks_database(self) -> None:
+        """Postgres-only mode should check every key in the pool."""
+        repository = make_repository(existing={"a"})
+        store = SeenItemStore(repository)
+
+        seen = await store.find_seen(ResearchSource.NEWS, ["a", "b", "a"])
+
+        assert seen == {"a"}
+        repository.find_existing_source_keys.assert_awaited_once_with(
+            ResearchSource.NEWS, ["a", "b"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_bloom_negatives_skip_database(self) -> None:
+        """Keys never seen before should not reach Postgres."""
+        repository = make_repository(existing=set())
+        store = SeenItemStore(repository, FakeRedis(), capacity=1000)
+
+        seen = await store.find_seen(ResearchSource.REDDIT, ["/r/a/1", "/r/a/2"])
+
+        assert seen == set()
+        repository.find_existing_source_keys.assert_not_awaited()
+        assert store.stats.bloom_negatives == 2
+
+    @pytest.mark.asyncio
+    async def test_second_run_confirms_positives_in_database(self) -> None:
+        """Keys recorded by an earlier run should be confirmed in Postgres."""
+        redis = FakeRedis()
+        repository = make_repository(existing=set())
+        await SeenItemStore(repository, redis, capacity=1000).find_seen(
+            ResearchSource.REDDIT, ["published", "rejected"]
+        )
+
+        # Only "published" made it into the pool during the first run
+        repository = make_repository(existing={"published"})
+        store = SeenItemStore(repository, redis, capacity=1000)
+        seen = await store.find_seen(ResearchSource.REDDIT, ["published", "rejected", "new"])
+
+        assert seen == {"published"}
+        repository.find_existing_source_keys.assert_awaited_once_with(
+            ResearchSource.REDDIT, ["published", "rejected"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_seeds_bloom_from_pool_once(self) -> None:
+        """An unseeded source should load the pool's keys into its filter."""
+        redis = FakeRedis()
+        repository = make_repository(existing={"old"}, pool_keys=["old"])
+        store = SeenItemStore(repository, redis, capacity=1000)
+
+        assert await store.find_seen(ResearchSource.YOUTUBE, ["old", "new"]) == {"old"}
+        assert await redis.exists("dawo:seen:youtube:seeded")
+
+        repository.stream_source_keys = MagicMock(side_effect=AssertionError("reseeded"))
+        assert await store.find_seen(ResearchSource.YOUTUBE, ["old"]) == {"old"}
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_database(self) -> None:
+        """Redis errors should degrade to Postgres-only lookups."""
+        redis = MagicMock()
+        redis.exists = AsyncMock(side_effect=ConnectionError("redis down"))
+        repository = make_repository(existing={"a"})
+        store = SeenItemStore(repository, redis)
+
+        seen = await store.find_seen(ResearchSource.NEWS, ["a", "b"])
+
+        assert seen == {"a"}
+        assert store.stats.errors == 1
+
+    @pytest.mark.asyncio
+    async def test_database_failure_treats_items_as_new(self) -> None:
+        """A failed pool lookup should never stop a scan."""
+        repository = make_repository(existing=set())
+        repository.find_existing_source_keys = AsyncMock(side_effect=Exception("db down"))
+        store = SeenItemStore(repository)
+
+        assert await store.find_seen(ResearchSource.NEWS, ["a"]) == set()
+        assert store.stats.errors == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_keys(self) -> None:
+        """No keys should mean no lookups."""
+        repository = make_repository(existing=set())
+        store = SeenItemStore(repository)
+
+        assert await store.find_seen(ResearchSource.NEWS, []) == set()
+        repository.find_existing_source_keys.assert_not_awaited()
@@ -187,6 +187,74 @@ class TestInstagramClient:
         with pytest.raises(RateLimitError):
             await client.search_hashtag("test")
 
+    @pytest.mark.asyncio
+    async def test_search_hashtag_caches_hashtag_id(self, client_setup, mock_hashtag_search_response):
+        """Test a repeated hashtag skips the ID lookup call."""
+        client = client_setup
+
+        with patch.object(client, "_api_call", new_callable=AsyncMock) as mock_api:
+            mock_api.side_effect = [
+                {"data": [{"id": "17843853986012965"}]},
+                mock_hashtag_search_response,
+                mock_hashtag_search_response,
+            ]
+
+            await client.search_hashtag("lionsmane")
+            await client.search_hashtag("#LionsMane")
+
+        assert mock_api.call_count == 3
+        assert client.rate_limit_remaining == 200 - 3
+
+    @pytest.mark.asyncio
+    async def test_get_user_media_expands_username(self, client_setup, mock_competitor_media_response):
+        """Test competitor media carries username so no lookup is needed."""
+        client = client_setup
+
+        with patch.object(client, "_api_call", new_callable=AsyncMock) as mock_api:
+            mock_api.return_value = mock_competitor_media_response
+            items = await client.get_user_media("competitor_brand")
+
+        fields = mock_api.call_args.args[1]["fields"]
+        assert "username" in fields.split("media.limit")[1]
+        assert all(item["username"] for item in items)
+
+    @pytest.mark.asyncio
+    async def test_get_media_details_batch_groups_lookups(self, client_setup):
+        """Test lookups go out in Graph API batches of up to 50."""
+        import json
+
+        client = client_setup
+        media_ids = [f"m{i}" for i in range(60)]
+
+        async def fake_batch(url, params, data=None):
+            requests = json.loads(data["batch"])
+            return [
+                {"code": 200, "body": json.dumps({"id": r["relative_url"].split("?")[0]})}
+                if not r["relative_url"].startswith("m5?") else {"code": 400, "body": "{}"}
+                for r in requests
+            ]
+
+        with patch.object(client, "_api_call", side_effect=fake_batch) as mock_api:
+            details = await client.get_media_details_batch(media_ids)
+
+        assert mock_api.call_count == 2
+        assert len(details) == 59
+        assert "m5" not in details
+        assert client.rate_limit_remaining == 200 - 60
+
+    @pytest.mark.asyncio
+    async def test_get_media_details_batch_stops_at_rate_limit(self, client_config, mock_retry_middleware):
+        """Test batches the hourly limit cannot cover are not sent."""
+        tracker = RateLimitTracker()
+        tracker.check_and_use(170)
+        client = InstagramClient(client_config, mock_retry_middleware, tracker)
+
+        with patch.object(client, "_api_call", new_callable=AsyncMock) as mock_api:
+            details = await client.get_media_details_batch([f"m{i}" for i in range(40)])
+
+        mock_api.assert_not_called()
+        assert details == {}
+
     def test_client_rate_limit_remaining(self, client_setup):
         """Test rate_limit_remaining property."""
         client = client_setup
@@ -12,7 +12,6 @@ from teams.dawo.scanners.instagram import (
     HarvesterError,
     RawInstagramPost,
     HarvestedPost,
-    InstagramAPIError,
 )
 
 
@@ -23,7 +22,7 @@ class TestInstagramHarvester:
     def mock_client(self):
         """Mock InstagramClient for testing."""
         client = AsyncMock()
-        client.get_media_details.return_value = {
+        details = {
             "id": "17841563789012345",
             "caption": "Lion's mane for focus! #lionsmane #focus #biohacking",
             "permalink": "https://www.instagram.com/p/ABC123/",
@@ -32,6 +31,10 @@ class TestInstagramHarvester:
             "media_type": "IMAGE",
             "username": "wellness_user",
         }
+        client.get_media_details.return_value = details
+        client.get_media_details_batch.side_effect = lambda ids: {
+            media_id: {**details, "id": media_id} for media_id in ids
+        }
         return client
 
     @pytest.fixture
@@ -101,10 +104,10 @@ class TestInstagramHarvester:
     @pytest.mark.asyncio
     async def test_harvest_continues_on_api_error(self, harvester, raw_posts, mock_client):
         """Test that harvest continues if one post fails."""
-        # First post fails, second succeeds
-        mock_client.get_media_details.side_effect = [
-            InstagramAPIError("API error"),
-            {
+        # First post's lookup fails inside the batch, second succeeds
+        mock_client.get_media_details_batch.side_effect = None
+        mock_client.get_media_details_batch.return_value = {
+            "17841563789012346": {
                 "id": "17841563789012346",
                 "caption": "Adaptogens!",
                 "permalink": "https://www.instagram.com/p/ABC124/",
@@ -113,7 +116,7 @@ class TestInstagramHarvester:
                 "media_type": "IMAGE",
                 "username": "other_user",
             },
-        ]
+        }
 
         result = await harvester.harvest(raw_posts)
 
@@ -121,6 +124,37 @@ class TestInstagramHarvester:
         assert len(result) == 1
         assert result[0].media_id == "17841563789012346"
 
+    @pytest.mark.asyncio
+    async def test_harvest_batches_lookups(self, harvester, raw_posts, mock_client):
+        """Test all detail lookups go out in one batch call."""
+        await harvester.harvest(raw_posts)
+
+        mock_client.get_media_details_batch.assert_awaited_once_with(
+            ["17841563789012345", "17841563789012346"]
+        )
+        mock_client.get_media_details.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_harvest_skips_lookup_for_prefetched_posts(self, harvester, mock_client):
+        """Test posts with field-expanded details need no API call."""
+        prefetched = RawInstagramPost(
+            media_id="17841563789099999",
+            permalink="https://www.instagram.com/p/XYZ999/",
+            timestamp=datetime.now(timezone.utc),
+            caption="Reishi nights #reishi",
+            is_competitor=True,
+            like_count=120,
+            comments_count=7,
+            username="competitor_brand",
+        )
+
+        result = await harvester.harvest([prefetched])
+
+        mock_client.get_media_details_batch.assert_not_called()
+        assert result[0].account_name == "competitor_brand"
+        assert result[0].likes == 120
+        assert result[0].hashtags == ["reishi"]
+
     @pytest.mark.asyncio
     async def test_harvest_single(self, harvester, raw_posts):
         """Test harvest_single method."""
@@ -215,6 +215,48 @@ class TestInstagramResearchPipeline:
 
         assert result.status in [PipelineStatus.PARTIAL, PipelineStatus.FAILED]
 
+    @pytest.mark.asyncio
+    async def test_publish_failure_retry_resumes_from_checkpoints(
+        self, mock_scanner, mock_harvester, mock_transformer, mock_validator,
+        mock_scorer, mock_publisher
+    ):
+        """Test a publish that stored nothing is retried without rescanning."""
+        checkpoint_store = MagicMock()
+        checkpoint_store.load = AsyncMock(return_value={})
+        checkpoint_store.save = AsyncMock()
+        checkpoint_store.clear = AsyncMock()
+        mock_publisher.publish_batch.side_effect = [Exception("Database unavailable"), 1]
+        mock_publisher.publish.side_effect = Exception("Database unavailable")
+
+        pipeline = InstagramResearchPipeline(
+            scanner=mock_scanner,
+            harvester=mock_harvester,
+            transformer=mock_transformer,
+            validator=mock_validator,
+            scorer=mock_scorer,
+            publisher=mock_publisher,
+            checkpoint_store=checkpoint_store,
+        )
+
+        failed = await pipeline.execute()
+
+        assert failed.status == PipelineStatus.FAILED
+        assert failed.retry_scheduled is True
+        checkpoint_store.clear.assert_not_called()
+
+        saved = {
+            call.args[2]: call.args[3] for call in checkpoint_store.save.await_args_list
+        }
+        checkpoint_store.load = AsyncMock(return_value=saved)
+
+        retried = await pipeline.execute(run_id=failed.run_id)
+
+        assert retried.status == PipelineStatus.COMPLETE
+        assert retried.retry_scheduled is False
+        mock_scanner.scan.assert_called_once()
+        mock_harvester.harvest.assert_called_once()
+        checkpoint_store.clear.assert_awaited_once_with("instagram", failed.run_id)
+
 
 class TestPipelineStatistics:
     """Test suite for PipelineStatistics."""
@@ -186,3 +186,18 @@ class TestNewsCategorizer:
 
         # Without competitor brands configured, should not match COMPETITOR
         assert result.category != NewsCategory.COMPETITOR
+
+    @pytest.mark.asyncio
+    async def test_categorize_batch_matches_categorize(
+        self, categorizer: NewsCategorizer
+    ) -> None:
+        """Test batch categorization returns per-article results in order."""
+        articles = [
+            self._make_article("EU Novel Food ruling", "Regulators publish a decision."),
+            self._make_article("RivalCo launches a tincture", "New product line."),
+            self._make_article("Forest walk", "A quiet story."),
+        ] * 30
+
+        results = await categorizer.categorize_batch(articles)
+
+        assert results == [categorizer.categorize(article) for article in articles]
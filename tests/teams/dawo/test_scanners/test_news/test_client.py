@@ -9,6 +9,9 @@ import pytest
 from teams.dawo.scanners.news.tools import (
     NewsFeedClient,
     FeedFetchError,
+    FeedResponse,
+    FeedValidators,
+    InMemoryFeedValidatorStore,
 )
 from teams.dawo.scanners.news.config import (
     FeedSource,
@@ -27,7 +30,7 @@ class TestNewsFeedClient:
     @pytest.fixture
     def client(self, client_config: NewsFeedClientConfig) -> NewsFeedClient:
         """Create client instance."""
-        return NewsFeedClient(client_config)
+        return NewsFeedClient(client_config, AsyncMock())
 
     @pytest.fixture
     def feed_source(self) -> FeedSource:
@@ -72,7 +75,7 @@ class TestNewsFeedClient:
         with patch.object(
             client, "_fetch_content", new_callable=AsyncMock
         ) as mock_fetch:
-            mock_fetch.return_value = "<rss>content</rss>"
+            mock_fetch.return_value = FeedResponse("<rss>content</rss>", FeedValidators())
 
             with patch(
                 "teams.dawo.scanners.news.tools.feedparser.parse"
@@ -112,7 +115,7 @@ class TestNewsFeedClient:
         with patch.object(
             client, "_fetch_content", new_callable=AsyncMock
         ) as mock_fetch:
-            mock_fetch.return_value = "<rss>content</rss>"
+            mock_fetch.return_value = FeedResponse("<rss>content</rss>", FeedValidators())
 
             with patch(
                 "teams.dawo.scanners.news.tools.feedparser.parse"
@@ -157,7 +160,7 @@ class TestNewsFeedClient:
         with patch.object(
             client, "_fetch_content", new_callable=AsyncMock
         ) as mock_fetch:
-            mock_fetch.return_value = "<rss>content</rss>"
+            mock_fetch.return_value = FeedResponse("<rss>content</rss>", FeedValidators())
 
             with patch(
                 "teams.dawo.scanners.news.tools.feedparser.parse"
@@ -197,7 +200,7 @@ class TestNewsFeedClient:
         with patch.object(
             client, "_fetch_content", new_callable=AsyncMock
         ) as mock_fetch:
-            mock_fetch.return_value = "<rss>content</rss>"
+            mock_fetch.return_value = FeedResponse("<rss>content</rss>", FeedValidators())
 
             with patch(
                 "teams.dawo.scanners.news.tools.feedparser.parse"
@@ -226,7 +229,7 @@ class TestNewsFeedClient:
         with patch.object(
             client, "_fetch_content", new_callable=AsyncMock
         ) as mock_fetch:
-            mock_fetch.return_value = "<rss></rss>"
+            mock_fetch.return_value = FeedResponse("<rss></rss>", FeedValidators())
 
             with patch(
                 "teams.dawo.scanners.news.tools.feedparser.parse"
@@ -252,6 +255,94 @@ class TestNewsFeedClient:
             with pytest.raises(FeedFetchError, match="HTTP 500"):
                 await client.fetch_feed(feed_source)
 
+    @pytest.mark.asyncio
+    async def test_fetch_feed_sends_stored_validators(
+        self,
+        client_config: NewsFeedClientConfig,
+        feed_source: FeedSource,
+        mock_feed_response: dict,
+    ) -> None:
+        """Test validators are sent only once they were stored after publishing."""
+        store = InMemoryFeedValidatorStore()
+        client = NewsFeedClient(client_config, AsyncMock(), validator_store=store)
+        validators = FeedValidators(etag='"abc"', last_modified="Mon, 01 Jan 2026 00:00:00 GMT")
+
+        with patch.object(
+            client, "_fetch_content", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = FeedResponse("<rss>content</rss>", validators)
+
+            with patch(
+                "teams.dawo.scanners.news.tools.feedparser.parse"
+            ) as mock_parse:
+                mock_parse.return_value = MagicMock(**mock_feed_response)
+
+                await client.fetch_feed(feed_source)
+                # Not published yet - the next fetch is unconditional
+                await client.fetch_feed(feed_source)
+                await client.store_validators(
+                    {feed_source.url: client.take_validators(feed_source.url)}
+                )
+                await client.fetch_feed(feed_source)
+
+        assert mock_fetch.await_args_list[0].args == (feed_source.url, None)
+        assert mock_fetch.await_args_list[1].args == (feed_source.url, None)
+        assert mock_fetch.await_args_list[2].args == (feed_source.url, validators)
+        assert await store.get(feed_source.url) == validators
+        assert client.take_validators(feed_source.url) == validators
+
+    @pytest.mark.asyncio
+    async def test_fetch_feed_parse_failure_keeps_no_validators(
+        self,
+        client: NewsFeedClient,
+        feed_source: FeedSource,
+    ) -> None:
+        """Test a body that fails to parse leaves nothing to store."""
+        with patch.object(
+            client, "_fetch_content", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = FeedResponse("<rss>", FeedValidators(etag='"abc"'))
+
+            with patch(
+                "teams.dawo.scanners.news.tools.feedparser.parse"
+            ) as mock_parse:
+                mock_parse.side_effect = RuntimeError("broken feed")
+
+                with pytest.raises(FeedFetchError):
+                    await client.fetch_feed(feed_source)
+
+        assert client.take_validators(feed_source.url) is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_feed_not_modified_skips_parsing(
+        self,
+        client: NewsFeedClient,
+        feed_source: FeedSource,
+    ) -> None:
+        """Test a 304 response returns no articles without parsing."""
+        with patch.object(
+            client, "_fetch_content", new_callable=AsyncMock
+        ) as mock_fetch:
+            mock_fetch.return_value = FeedResponse(None, FeedValidators(etag='"abc"'))
+
+            with patch(
+                "teams.dawo.scanners.news.tools.feedparser.parse"
+            ) as mock_parse:
+                result = await client.fetch_feed(feed_source)
+
+        assert result == []
+        mock_parse.assert_not_called()
+
+    def test_validators_request_headers(self) -> None:
+        """Test validators map to conditional request headers."""
+        validators = FeedValidators(etag='"abc"', last_modified="Mon, 01 Jan 2026 00:00:00 GMT")
+
+        assert validators.request_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2026 00:00:00 GMT",
+        }
+        assert FeedValidators().request_headers() == {}
+
     def test_clean_html(
         self,
         client: NewsFeedClient,
@@ -74,6 +74,11 @@ class TestNewsFeedClientConfig:
         with pytest.raises(ValueError, match="max_retries must be >= 0"):
             NewsFeedClientConfig(max_retries=-1)
 
+    def test_client_config_invalid_max_connections(self) -> None:
+        """Test that a zero connection pool raises error."""
+        with pytest.raises(ValueError, match="max_connections must be >= 1"):
+            NewsFeedClientConfig(max_connections=0)
+
 
 class TestNewsScannerConfig:
     """Tests for NewsScannerConfig."""
@@ -106,6 +111,12 @@ class TestNewsScannerConfig:
         with pytest.raises(ValueError, match="hours_back must be >= 1"):
             NewsScannerConfig(feeds=feeds, hours_back=0)
 
+    def test_scanner_config_invalid_max_concurrent_feeds(self) -> None:
+        """Test that zero feed concurrency raises error."""
+        feeds = [FeedSource("Feed", "https://feed.com/rss")]
+        with pytest.raises(ValueError, match="max_concurrent_feeds must be >= 1"):
+            NewsScannerConfig(feeds=feeds, max_concurrent_feeds=0)
+
     def test_scanner_config_defaults(self) -> None:
         """Test scanner config defaults."""
         feeds = [FeedSource("Feed", "https://feed.com/rss")]
@@ -98,7 +98,7 @@ class TestNewsResearchPipeline:
     def mock_validator(self) -> MagicMock:
         """Create mock validator."""
         validator = MagicMock()
-        validator.validate.return_value = [
+        validator.validate = AsyncMock(return_value=[
             ValidatedResearch(
                 source="news",
                 title="Test Article",
@@ -110,7 +110,7 @@ class TestNewsResearchPipeline:
                 compliance_status="COMPLIANT",
                 score=5.0,
             )
-        ]
+        ])
         return validator
 
     @pytest.fixture
@@ -305,6 +305,83 @@ class TestNewsResearchPipeline:
         assert result.status == PipelineStatus.COMPLETE
         mock_publisher.publish.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_execute_stores_feed_validators_after_publish(
+        self,
+        pipeline: NewsResearchPipeline,
+        mock_scanner: AsyncMock,
+    ) -> None:
+        """Test feed validators are stored once every article is published."""
+        result = await pipeline.execute()
+
+        assert result.status == PipelineStatus.COMPLETE
+        mock_scanner.store_feed_validators.assert_awaited_once_with(
+            mock_scanner.scan.return_value
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_publish_failure_keeps_feed_validators(
+        self,
+        pipeline: NewsResearchPipeline,
+        mock_scanner: AsyncMock,
+        mock_publisher: AsyncMock,
+    ) -> None:
+        """Test feeds are refetched in full when articles failed to publish."""
+        mock_publisher.publish_batch.return_value = []
+
+        result = await pipeline.execute()
+
+        assert result.status == PipelineStatus.PARTIAL
+        mock_scanner.store_feed_validators.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_execute_publish_failure_retry_resumes_from_checkpoints(
+        self,
+        mock_scanner: AsyncMock,
+        mock_harvester: MagicMock,
+        mock_transformer: MagicMock,
+        mock_validator: MagicMock,
+        mock_scorer: MagicMock,
+        mock_publisher: AsyncMock,
+    ) -> None:
+        """Test a publish that stored nothing is retried without refetching."""
+        checkpoint_store = MagicMock()
+        checkpoint_store.load = AsyncMock(return_value={})
+        checkpoint_store.save = AsyncMock()
+        checkpoint_store.clear = AsyncMock()
+        mock_publisher.publish_batch.side_effect = [
+            Exception("Database unavailable"),
+            [MagicMock(id=uuid4())],
+        ]
+        mock_publisher.publish.side_effect = Exception("Database unavailable")
+        pipeline = NewsResearchPipeline(
+            scanner=mock_scanner,
+            harvester=mock_harvester,
+            transformer=mock_transformer,
+            validator=mock_validator,
+            scorer=mock_scorer,
+            publisher=mock_publisher,
+            checkpoint_store=checkpoint_store,
+        )
+
+        failed = await pipeline.execute()
+
+        assert failed.retry_scheduled is True
+        checkpoint_store.clear.assert_not_called()
+
+        saved = {
+            call.args[2]: call.args[3] for call in checkpoint_store.save.await_args_list
+        }
+        checkpoint_store.load = AsyncMock(return_value=saved)
+
+        retried = await pipeline.execute(run_id=failed.run_id)
+
+        assert retried.status == PipelineStatus.COMPLETE
+        assert retried.retry_scheduled is False
+        mock_scanner.scan.assert_called_once()
+        mock_harvester.harvest.assert_called_once()
+        checkpoint_store.clear.assert_awaited_once_with("news", failed.run_id)
+
     @pytest.mark.asyncio
     async def test_execute_statistics_accuracy(
         self,
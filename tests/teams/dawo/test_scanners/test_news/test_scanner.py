@@ -3,12 +3,14 @@
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
+import asyncio
+
 import pytest
 
 from teams.dawo.scanners.news.agent import NewsScanner, NewsScanError
 from teams.dawo.scanners.news.schemas import RawNewsArticle
 from teams.dawo.scanners.news.config import FeedSource, NewsScannerConfig
-from teams.dawo.scanners.news.tools import NewsFeedClient, FeedFetchError
+from teams.dawo.scanners.news.tools import NewsFeedClient, FeedFetchError, FeedValidators
 
 
 class TestNewsScanner:
@@ -18,6 +20,7 @@ class TestNewsScanner:
     def mock_client(self) -> AsyncMock:
         """Create mock feed client."""
         client = AsyncMock(spec=NewsFeedClient)
+        client.take_validators.return_value = None
         return client
 
     @pytest.fixture
@@ -94,6 +97,80 @@ class TestNewsScanner:
         assert len(result.articles) == 1
         assert result.statistics.duplicates_removed == 1
 
+    @pytest.mark.asyncio
+    async def test_scan_skips_articles_already_in_pool(
+        self,
+        scanner_config: NewsScannerConfig,
+        mock_client: AsyncMock,
+    ) -> None:
+        """Test that articles published by earlier runs are dropped."""
+        seen_store = AsyncMock()
+        seen_store.find_seen = AsyncMock(return_value={"https://ex.com/1"})
+        scanner = NewsScanner(scanner_config, mock_client, seen_store=seen_store)
+        mock_client.fetch_feed.side_effect = [
+            [self._make_raw_article(title="Article 1", url="https://ex.com/1")],
+            [self._make_raw_article(title="Article 2", url="https://ex.com/2")],
+        ]
+
+        result = await scanner.scan()
+
+        assert [a.url for a in result.articles] == ["https://ex.com/2"]
+        assert result.statistics.already_seen == 1
+        assert result.statistics.articles_after_filter == 1
+
+    @pytest.mark.asyncio
+    async def test_scan_hands_feed_validators_to_result(
+        self,
+        scanner: NewsScanner,
+        mock_client: AsyncMock,
+    ) -> None:
+        """Test validators ride on the result and are stored only on request."""
+        validators = FeedValidators(etag='"abc"')
+        mock_client.fetch_feed.side_effect = [
+            [self._make_raw_article(title="Article 1", url="https://ex.com/1")],
+            FeedFetchError("down"),
+        ]
+        mock_client.take_validators.side_effect = lambda url: validators
+
+        result = await scanner.scan()
+
+        assert result.feed_validators == {"https://feed1.com/rss": validators}
+        mock_client.store_validators.assert_not_awaited()
+
+        await scanner.store_feed_validators(result)
+
+        mock_client.store_validators.assert_awaited_once_with(result.feed_validators)
+
+    @pytest.mark.asyncio
+    async def test_scan_fetches_feeds_concurrently(
+        self,
+        mock_client: AsyncMock,
+    ) -> None:
+        """Test feeds are fetched concurrently up to max_concurrent_feeds."""
+        config = NewsScannerConfig(
+            feeds=[FeedSource(f"Feed{i}", f"https://feed{i}.com/rss") for i in range(5)],
+            max_concurrent_feeds=2,
+        )
+        scanner = NewsScanner(config, mock_client)
+        in_flight = 0
+        peak = 0
+
+        async def fetch_feed(feed: FeedSource, **kwargs) -> list[RawNewsArticle]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [self._make_raw_article(title=feed.name, url=feed.url)]
+
+        mock_client.fetch_feed.side_effect = fetch_feed
+
+        result = await scanner.scan()
+
+        assert peak == 2
+        assert [a.title for a in result.articles] == [f"Feed{i}" for i in range(5)]
+        mock_client.session.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_scan_handles_partial_failure(
         self,
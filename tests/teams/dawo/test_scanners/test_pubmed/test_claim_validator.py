@@ -13,14 +13,17 @@ Test categories:
     - Batch processing
 """
 
+import asyncio
 import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from teams.dawo.scanners.pubmed.config import LLMBatchConfig
 from teams.dawo.scanners.pubmed.schemas import (
     FindingSummary,
     ClaimValidationResult,
     ContentPotential,
+    LLMCallStats,
 )
 from teams.dawo.scanners.pubmed.claim_validator import (
     ClaimValidator,
@@ -364,6 +367,47 @@ class TestBatchValidation:
         # First one should be default result
         assert result["0"].can_make_claim is False
 
+    @pytest.mark.asyncio
+    async def test_batch_runs_calls_concurrently(self, sample_summaries):
+        """Should overlap LLM calls and keep the PMID mapping."""
+        in_flight = 0
+        peak = 0
+
+        async def generate(prompt, max_tokens):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return json.dumps({"content_potential": ["citation_only"]})
+
+        mock_llm = AsyncMock()
+        mock_llm.generate = generate
+        validator = ClaimValidator(mock_llm, batch_config=LLMBatchConfig(max_concurrency=3))
+        stats = LLMCallStats()
+
+        result = await validator.validate_batch(sample_summaries, stats=stats)
+
+        assert peak == 3
+        assert list(result) == list(sample_summaries)
+        assert all(
+            r.content_potential == [ContentPotential.CITATION_ONLY] for r in result.values()
+        )
+        assert stats.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_counts_failures(self, sample_summaries):
+        """Failed validations should be counted in stats."""
+        mock_llm = AsyncMock()
+        mock_llm.generate = AsyncMock(side_effect=Exception("LLM down"))
+        validator = ClaimValidator(mock_llm)
+        stats = LLMCallStats()
+
+        result = await validator.validate_batch(sample_summaries, stats=stats)
+
+        assert len(result) == 3
+        assert stats.failures == 3
+
 
 class TestClaimValidationError:
     """Tests for ClaimValidationError exception."""
@@ -210,6 +210,31 @@ class TestPubMedClient:
         # Should be called twice (batch 1: 200, batch 2: 50)
         assert mock_bio_module.efetch.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_entrez_calls_reported_to_telemetry(
+        self, entrez_config, retry_middleware, mock_bio_module
+    ):
+        """Test every Entrez call counts once, with the response bytes read."""
+        import io
+
+        from teams.dawo.middleware.telemetry import PipelineTelemetry
+        from teams.dawo.scanners.pubmed.tools import PubMedClient
+
+        client = PubMedClient(entrez_config, retry_middleware)
+        mock_bio_module.esearch.return_value = io.BytesIO(b"<eSearchResult/>")
+        mock_bio_module.efetch.return_value = io.BytesIO(b"<PubmedArticleSet/>")
+        mock_bio_module.read.side_effect = lambda handle: (
+            handle.read() and {"IdList": ["1"], "PubmedArticle": []}
+        )
+
+        telemetry = PipelineTelemetry(pipeline="pubmed")
+        with telemetry.stage("scan") as stage:
+            await client.search("reishi")
+            await client.fetch_details(["1"])
+
+        assert stage.external_calls == 2
+        assert stage.bytes_transferred == len(b"<eSearchResult/>") + len(b"<PubmedArticleSet/>")
+
 
 class TestExtractSampleSize:
     """Tests for sample size extraction utility."""
@@ -137,6 +137,63 @@ class TestPubMedScannerConfig:
         assert "email" in str(exc_info.value).lower()
 
 
+class TestLLMBatchConfig:
+    """Tests for LLMBatchConfig dataclass."""
+
+    def test_defaults(self):
+        """Test default fan-out limits."""
+        from teams.dawo.scanners.pubmed.config import (
+            LLMBatchConfig,
+            DEFAULT_LLM_MAX_CONCURRENCY,
+            DEFAULT_LLM_CALL_TIMEOUT,
+        )
+
+        config = LLMBatchConfig()
+        assert config.max_concurrency == DEFAULT_LLM_MAX_CONCURRENCY
+        assert config.call_timeout == DEFAULT_LLM_CALL_TIMEOUT
+
+    def test_rejects_zero_concurrency(self):
+        """Test max_concurrency must be at least 1."""
+        from teams.dawo.scanners.pubmed.config import LLMBatchConfig
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            LLMBatchConfig(max_concurrency=0)
+
+    def test_rejects_non_positive_timeout(self):
+        """Test call_timeout must be positive."""
+        from teams.dawo.scanners.pubmed.config import LLMBatchConfig
+
+        with pytest.raises(ValueError, match="call_timeout"):
+            LLMBatchConfig(call_timeout=0)
+
+
+class TestEUtilsClientConfig:
+    """Tests for EUtilsClientConfig dataclass."""
+
+    def test_defaults(self):
+        """Test default history batch size."""
+        from teams.dawo.scanners.pubmed.config import (
+            EUtilsClientConfig,
+            DEFAULT_HISTORY_BATCH_SIZE,
+        )
+
+        assert EUtilsClientConfig().history_batch_size == DEFAULT_HISTORY_BATCH_SIZE
+
+    def test_rejects_batch_size_above_ncbi_limit(self):
+        """Test history_batch_size is capped at the efetch retmax ceiling."""
+        from teams.dawo.scanners.pubmed.config import EUtilsClientConfig
+
+        with pytest.raises(ValueError, match="history_batch_size"):
+            EUtilsClientConfig(history_batch_size=10_001)
+
+    def test_rejects_zero_connections(self):
+        """Test max_connections must be at least 1."""
+        from teams.dawo.scanners.pubmed.config import EUtilsClientConfig
+
+        with pytest.raises(ValueError, match="max_connections"):
+            EUtilsClientConfig(max_connections=0)
+
+
 class TestConfigConstants:
     """Tests for configuration constants."""
 
@@ -0,0 +1,275 @@
+"""Tests for the async PubMed E-utilities client.
+
+Tests verify:
+- Token bucket pacing
+- Incremental efetch XML parsing (chunked input, tree cleared per article)
+- History-server flow: one EPost, efetch batches by WebEnv/query_key
+- ESearch JSON handling and error mapping
+- Calls and bytes, streamed efetch included, reported to telemetry
+"""
+
+from unittest.mock import patch
+from urllib.parse import parse_qs
+
+import httpx
+import pytest
+
+from teams.dawo.middleware.retry import RetryResult
+from teams.dawo.middleware.telemetry import PipelineTelemetry
+from teams.dawo.scanners.pubmed.config import EntrezConfig, EUtilsClientConfig
+from teams.dawo.scanners.pubmed.eutils import (
+    EUTILS_BASE_URL,
+    ArticleStreamParser,
+    AsyncPubMedClient,
+    TokenBucket,
+)
+from teams.dawo.scanners.pubmed.tools import PubMedFetchError, PubMedSearchError
+
+
+def _article_xml(pmid: str, title: str = "Title") -> str:
+    return (
+        "<PubmedArticle><MedlineCitation>"
+        f"<PMID Version=\"1\">{pmid}</PMID><Article>"
+        "<Journal><JournalIssue><PubDate><Year>2024</Year><Month>Mar</Month>"
+        "</PubDate></JournalIssue><Title>Journal of Mushrooms</Title></Journal>"
+        f"<ArticleTitle>{title} of <i>Hericium</i></ArticleTitle>"
+        "<Abstract><AbstractText Label=\"BACKGROUND\">Part one.</AbstractText>"
+        "<AbstractText>Part two.</AbstractText></Abstract>"
+        "<AuthorList><Author><LastName>Smith</LastName><ForeName>J</ForeName></Author>"
+        "</AuthorList><PublicationTypeList>"
+        "<PublicationType>Randomized Controlled Trial</PublicationType>"
+        "</PublicationTypeList></Article></MedlineCitation>"
+        "<PubmedData><ArticleIdList>"
+        f"<ArticleId IdType=\"pubmed\">{pmid}</ArticleId>"
+        "<ArticleId IdType=\"doi\">10.1000/xyz</ArticleId>"
+        "</ArticleIdList></PubmedData></PubmedArticle>"
+    )
+
+
+def _efetch_xml(pmids: list[str]) -> bytes:
+    articles = "".join(_article_xml(pmid) for pmid in pmids)
+    return f'<?xml version="1.0" ?>\n<PubmedArticleSet>{articles}</PubmedArticleSet>'.encode()
+
+
+class PassThroughRetry:
+    """Retry middleware stand-in that runs the operation once."""
+
+    async def execute_with_retry(self, operation, context: str) -> RetryResult:
+        try:
+            return RetryResult(success=True, response=await operation(), attempts=1)
+        except Exception as e:
+            return RetryResult(success=False, attempts=1, last_error=str(e), is_incomplete=True)
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill_when_empty(self):
+        """Test the second request waits 1/rate seconds."""
+        now = [0.0]
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=4, clock=lambda: now[0])
+        with patch("teams.dawo.scanners.pubmed.eutils.asyncio.sleep", fake_sleep):
+            await bucket.acquire()
+            await bucket.acquire()
+            await bucket.acquire()
+
+        assert sleeps == [pytest.approx(0.25), pytest.approx(0.25)]
+
+    @pytest.mark.asyncio
+    async def test_no_wait_after_idle(self):
+        """Test a request after an idle period proceeds immediately."""
+        now = [0.0]
+        bucket = TokenBucket(rate=3, clock=lambda: now[0])
+        await bucket.acquire()
+        now[0] = 1.0
+
+        with patch("teams.dawo.scanners.pubmed.eutils.asyncio.sleep") as mock_sleep:
+            await bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_invalid_rate(self):
+        """Test non-positive rates are rejected."""
+        with pytest.raises(ValueError, match="rate must be > 0"):
+            TokenBucket(rate=0)
+
+
+class TestArticleStreamParser:
+    """Tests for ArticleStreamParser."""
+
+    def test_parses_chunked_input(self):
+        """Test articles are parsed from arbitrarily split chunks."""
+        data = _efetch_xml(["111", "222"])
+        parser = ArticleStreamParser()
+
+        for i in range(0, len(data), 7):
+            parser.feed(data[i:i + 7])
+        articles = parser.close()
+
+        assert [a["pmid"] for a in articles] == ["111", "222"]
+        first = articles[0]
+        assert first["title"] == "Title of Hericium"
+        assert first["abstract"] == "Part one. Part two."
+        assert first["authors"] == ["Smith J"]
+        assert first["journal"] == "Journal of Mushrooms"
+        assert first["pub_date"].year == 2024 and first["pub_date"].month == 3
+        assert first["doi"] == "10.1000/xyz"
+        assert first["publication_types"] == ["Randomized Controlled Trial"]
+
+    def test_discards_parsed_articles_from_tree(self):
+        """Test each PubmedArticle is removed once converted."""
+        parser = ArticleStreamParser()
+        parser.feed(_efetch_xml(["111", "222", "333"]))
+        parser.close()
+
+        assert len(parser._root) == 0
+
+
+class TestAsyncPubMedClient:
+    """Tests for AsyncPubMedClient."""
+
+    @pytest.fixture
+    def entrez_config(self) -> EntrezConfig:
+        return EntrezConfig(email="test@example.com", api_key="key")
+
+    def _client(self, entrez_config, handler, batch_size: int = 2) -> AsyncPubMedClient:
+        client = AsyncPubMedClient(
+            entrez_config,
+            PassThroughRetry(),
+            EUtilsClientConfig(history_batch_size=batch_size),
+        )
+        client._http = httpx.AsyncClient(
+            base_url=EUTILS_BASE_URL,
+            transport=httpx.MockTransport(handler),
+        )
+        client._bucket = TokenBucket(rate=1000)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_fetch_details_uses_history_server(self, entrez_config):
+        """Test one EPost followed by efetch batches from the history set."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path.endswith("/epost.fcgi"):
+                form = parse_qs(request.content.decode())
+                assert form["id"] == ["1,2,3,4,5"]
+                assert form["email"] == ["test@example.com"]
+                return httpx.Response(
+                    200,
+                    content=b"<ePostResult><QueryKey>1</QueryKey>"
+                    b"<WebEnv>MCID_abc</WebEnv></ePostResult>",
+                )
+            params = request.url.params
+            assert params["WebEnv"] == "MCID_abc"
+            assert params["query_key"] == "1"
+            start = int(params["retstart"])
+            pmids = ["1", "2", "3", "4", "5"][start:start + int(params["retmax"])]
+            return httpx.Response(200, content=_efetch_xml(pmids))
+
+        client = self._client(entrez_config, handler)
+        articles = await client.fetch_details(["1", "2", "3", "4", "5"])
+        await client.close()
+
+        assert [a["pmid"] for a in articles] == ["1", "2", "3", "4", "5"]
+        paths = [r.url.path.rsplit("/", 1)[-1] for r in requests]
+        assert paths.count("epost.fcgi") == 1
+        assert paths.count("efetch.fcgi") == 3
+
+    @pytest.mark.asyncio
+    async def test_calls_reported_to_telemetry(self, entrez_config):
+        """Test the pooled client reports every EPost and streamed efetch."""
+        efetch_body = _efetch_xml(["1", "2"])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/epost.fcgi"):
+                return httpx.Response(
+                    200,
+                    content=b"<ePostResult><QueryKey>1</QueryKey>"
+                    b"<WebEnv>W</WebEnv></ePostResult>",
+                )
+            return httpx.Response(200, content=efetch_body)
+
+        client = AsyncPubMedClient(
+            entrez_config,
+            PassThroughRetry(),
+            EUtilsClientConfig(history_batch_size=2),
+        )
+        client._get_http()._transport = httpx.MockTransport(handler)
+        client._bucket = TokenBucket(rate=1000)
+
+        telemetry = PipelineTelemetry(pipeline="pubmed")
+        with telemetry.stage("scan") as stage:
+            articles = await client.fetch_details(["1", "2"])
+        await client.close()
+
+        assert len(articles) == 2
+        assert stage.external_calls == 2
+        assert stage.bytes_transferred > len(efetch_body)
+
+    @pytest.mark.asyncio
+    async def test_iter_details_yields_batches(self, entrez_config):
+        """Test iter_details yields one list per history batch."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/epost.fcgi"):
+                return httpx.Response(
+                    200,
+                    content=b"<ePostResult><QueryKey>1</QueryKey>"
+                    b"<WebEnv>W</WebEnv></ePostResult>",
+                )
+            start = int(request.url.params["retstart"])
+            return httpx.Response(200, content=_efetch_xml(["1", "2", "3"][start:start + 2]))
+
+        client = self._client(entrez_config, handler)
+        batches = [batch async for batch in client.iter_details(["1", "2", "3"])]
+
+        assert [[a["pmid"] for a in batch] for batch in batches] == [["1", "2"], ["3"]]
+
+    @pytest.mark.asyncio
+    async def test_epost_error_raises_fetch_error(self, entrez_config):
+        """Test an EPost without WebEnv raises PubMedFetchError."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"<ePostResult><ERROR>bad ids</ERROR></ePostResult>")
+
+        client = self._client(entrez_config, handler)
+
+        with pytest.raises(PubMedFetchError, match="bad ids"):
+            await client.fetch_details(["x"])
+
+    @pytest.mark.asyncio
+    async def test_search_returns_idlist(self, entrez_config):
+        """Test ESearch JSON id list is returned."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["retmode"] == "json"
+            assert request.url.params["api_key"] == "key"
+            assert "[Publication Type]" in request.url.params["term"]
+            return httpx.Response(200, json={"esearchresult": {"idlist": ["9", "8"]}})
+
+        client = self._client(entrez_config, handler)
+        pmids = await client.search(
+            "lion's mane",
+            max_results=2,
+            date_filter=90,
+            publication_types=["Review"],
+        )
+
+        assert pmids == ["9", "8"]
+
+    @pytest.mark.asyncio
+    async def test_search_http_error_raises_search_error(self, entrez_config):
+        """Test HTTP failures map to PubMedSearchError."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500)
+
+        client = self._client(entrez_config, handler)
+
+        with pytest.raises(PubMedSearchError):
+            await client.search("reishi")
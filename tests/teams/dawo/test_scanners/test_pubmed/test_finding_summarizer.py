@@ -12,14 +12,17 @@ Test categories:
     - Batch processing
 """
 
+import asyncio
 import json
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
+from teams.dawo.scanners.pubmed.config import LLMBatchConfig
 from teams.dawo.scanners.pubmed.schemas import (
     HarvestedArticle,
     FindingSummary,
+    LLMCallStats,
     StudyType,
 )
 from teams.dawo.scanners.pubmed.finding_summarizer import (
@@ -406,6 +409,62 @@ class TestBatchSummarization:
         # First one should be default summary
         assert result["0"].compound_studied == "Functional mushroom compound"
 
+    @pytest.mark.asyncio
+    async def test_batch_respects_concurrency_limit(self, sample_articles):
+        """Should never run more LLM calls at once than max_concurrency."""
+        in_flight = 0
+        peak = 0
+
+        async def generate(prompt, max_tokens):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return json.dumps({"compound_studied": "Test"})
+
+        mock_llm = AsyncMock()
+        mock_llm.generate = generate
+        summarizer = FindingSummarizer(mock_llm, batch_config=LLMBatchConfig(max_concurrency=2))
+
+        result = await summarizer.summarize_batch(sample_articles)
+
+        assert peak == 2
+        assert list(result) == ["0", "1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_batch_timeout_falls_back_to_default(self, sample_articles):
+        """Calls exceeding call_timeout should get the default summary."""
+
+        async def generate(prompt, max_tokens):
+            if "Article 1" in prompt:
+                await asyncio.sleep(1)
+            return json.dumps({"compound_studied": "Test"})
+
+        mock_llm = AsyncMock()
+        mock_llm.generate = generate
+        summarizer = FindingSummarizer(mock_llm, batch_config=LLMBatchConfig(call_timeout=0.05))
+        stats = LLMCallStats()
+
+        result = await summarizer.summarize_batch(sample_articles, stats=stats)
+
+        assert result["0"].compound_studied == "Test"
+        assert result["1"].compound_studied == "Functional mushroom compound"
+        assert result["2"].compound_studied == "Test"
+        assert stats.timeouts == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_records_per_call_latency(self, mock_llm_client, sample_articles):
+        """Should record one latency sample per article."""
+        summarizer = FindingSummarizer(mock_llm_client)
+        stats = LLMCallStats()
+
+        await summarizer.summarize_batch(sample_articles, stats=stats)
+
+        assert stats.calls == 3
+        assert stats.failures == 0
+        assert all(latency >= 0 for latency in stats.latencies_ms)
+
 
 class TestSummarizationError:
     """Tests for SummarizationError exception."""
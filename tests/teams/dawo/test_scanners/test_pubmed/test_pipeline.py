@@ -258,6 +258,48 @@ class TestPipelineExecution:
 
         assert result.status == PipelineStatus.COMPLETE
 
+    @pytest.mark.asyncio
+    async def test_publish_failure_retry_resumes_from_checkpoints(
+        self, mock_scanner, mock_harvester, mock_summarizer, mock_claim_validator,
+        mock_transformer, mock_validator, mock_scorer, mock_publisher
+    ):
+        """Should retry a failed publish without re-running the LLM stages."""
+        checkpoint_store = MagicMock()
+        checkpoint_store.load = AsyncMock(return_value={})
+        checkpoint_store.save = AsyncMock()
+        checkpoint_store.clear = AsyncMock()
+        published_item = MagicMock()
+        published_item.id = uuid4()
+        mock_publisher.publish_batch = AsyncMock(
+            side_effect=[Exception("Database unavailable"), [published_item]]
+        )
+
+        pipeline = PubMedResearchPipeline(
+            mock_scanner, mock_harvester, mock_summarizer, mock_claim_validator,
+            mock_transformer, mock_validator, mock_scorer, mock_publisher,
+            checkpoint_store=checkpoint_store,
+        )
+
+        failed = await pipeline.execute()
+
+        assert failed.retry_scheduled is True
+        assert failed.run_id is not None
+        checkpoint_store.clear.assert_not_called()
+
+        saved = {
+            call.args[2]: call.args[3] for call in checkpoint_store.save.await_args_list
+        }
+        checkpoint_store.load = AsyncMock(return_value=saved)
+
+        retried = await pipeline.execute(run_id=failed.run_id)
+
+        assert retried.status == PipelineStatus.COMPLETE
+        assert retried.published_ids == [published_item.id]
+        mock_scanner.scan.assert_called_once()
+        mock_summarizer.summarize_batch.assert_called_once()
+        mock_claim_validator.validate_batch.assert_called_once()
+        checkpoint_store.clear.assert_awaited_once_with("pubmed", failed.run_id)
+
     @pytest.mark.asyncio
     async def test_execute_tracks_published_ids(
         self, mock_scanner, mock_harvester, mock_summarizer, mock_claim_validator,
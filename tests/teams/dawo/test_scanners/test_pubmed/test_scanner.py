@@ -132,6 +132,23 @@ class TestPubMedScanner:
         assert result.statistics.total_pmids_found == 4
         assert result.statistics.pmids_after_dedup == 2
 
+    @pytest.mark.asyncio
+    async def test_scan_skips_pmids_already_in_pool(self, scanner_config, mock_pubmed_client):
+        """Test PMIDs seen by earlier runs are not fetched again."""
+        from teams.dawo.scanners.pubmed.agent import PubMedScanner
+
+        seen_store = AsyncMock()
+        seen_store.find_seen = AsyncMock(
+            return_value={"https://pubmed.ncbi.nlm.nih.gov/12345678/"}
+        )
+
+        scanner = PubMedScanner(scanner_config, mock_pubmed_client, seen_store=seen_store)
+        result = await scanner.scan()
+
+        mock_pubmed_client.fetch_details.assert_awaited_once_with(["87654321"])
+        assert result.statistics.pmids_after_dedup == 2
+        assert result.statistics.already_seen == 1
+
     @pytest.mark.asyncio
     async def test_scan_tracks_statistics(self, scanner_config, mock_pubmed_client):
         """Test scan tracks execution statistics."""
@@ -366,3 +366,36 @@ class TestPipelineResult:
         assert result.status == PipelineStatus.INCOMPLETE
         assert result.retry_scheduled is True
         assert "Entrez" in result.error
+
+
+class TestLLMCallStats:
+    """Tests for LLMCallStats latency summaries."""
+
+    def test_empty_stats(self):
+        """Test summaries are zero before any call."""
+        from teams.dawo.scanners.pubmed.schemas import LLMCallStats
+
+        stats = LLMCallStats()
+        assert stats.calls == 0
+        assert stats.mean_ms == 0.0
+        assert stats.p95_ms == 0.0
+        assert stats.max_ms == 0.0
+
+    def test_latency_summaries(self):
+        """Test mean, p95 and max over recorded latencies."""
+        from teams.dawo.scanners.pubmed.schemas import LLMCallStats
+
+        stats = LLMCallStats(latencies_ms=[float(ms) for ms in range(1, 101)])
+        assert stats.calls == 100
+        assert stats.mean_ms == 50.5
+        assert stats.p95_ms == 96.0
+        assert stats.max_ms == 100.0
+
+    def test_pipeline_statistics_track_llm_stages(self):
+        """Test PipelineStatistics carries per-stage call stats."""
+        from teams.dawo.scanners.pubmed.schemas import PipelineStatistics, LLMCallStats
+
+        stats = PipelineStatistics()
+        assert isinstance(stats.summarize_calls, LLMCallStats)
+        assert isinstance(stats.claim_validation_calls, LLMCallStats)
+        assert stats.summarize_calls is not stats.claim_validation_calls
@@ -15,6 +15,7 @@ from datetime import datetime, timezone
 import httpx
 
 from teams.dawo.scanners.reddit import (
+    AdaptiveRateLimiter,
     RedditClient,
     RedditClientConfig,
     RedditAPIError,
@@ -139,17 +140,87 @@ class TestRedditClientRateLimit:
         mock_reddit_client_config: RedditClientConfig,
         mock_retry_middleware: RetryMiddleware,
     ) -> None:
-        """Rate limit should track request timestamps."""
-        client = RedditClient(mock_reddit_client_config, mock_retry_middleware)
+        """Rate limit waits should spend tokens from the limiter."""
+        limiter = AdaptiveRateLimiter(requests_per_window=10)
+        client = RedditClient(
+            mock_reddit_client_config,
+            mock_retry_middleware,
+            rate_limiter=limiter,
+        )
 
         async with client:
-            # Make a few rate limit waits
             await client._rate_limit_wait()
             await client._rate_limit_wait()
             await client._rate_limit_wait()
 
-            # Should have 3 timestamps recorded
-            assert len(client._request_timestamps) == 3
+            assert limiter.remaining == 7
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for header-driven AdaptiveRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_headers_set_remaining_quota(self) -> None:
+        """Remaining/Reset headers replace the assumed quota."""
+        limiter = AdaptiveRateLimiter(requests_per_window=60, clock=lambda: 0.0)
+
+        await limiter.acquire()
+        limiter.complete({
+            "x-ratelimit-used": "590",
+            "x-ratelimit-remaining": "10.0",
+            "x-ratelimit-reset": "120",
+        })
+
+        assert limiter.remaining == 10
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_count_against_header_quota(self) -> None:
+        """Requests still in flight are subtracted from Reddit's remaining count."""
+        limiter = AdaptiveRateLimiter(requests_per_window=60, clock=lambda: 0.0)
+
+        await limiter.acquire()
+        await limiter.acquire()
+        await limiter.acquire()
+        limiter.complete({"x-ratelimit-remaining": "5", "x-ratelimit-reset": "60"})
+
+        # Two requests still in flight will consume two of the five
+        assert limiter.remaining == 3
+
+    @pytest.mark.asyncio
+    async def test_waits_for_reset_when_exhausted(self) -> None:
+        """An empty bucket sleeps until the reported reset, then refills."""
+        now = [0.0]
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        limiter = AdaptiveRateLimiter(requests_per_window=60, clock=lambda: now[0])
+        await limiter.acquire()
+        limiter.complete({
+            "x-ratelimit-used": "100",
+            "x-ratelimit-remaining": "0",
+            "x-ratelimit-reset": "42",
+        })
+
+        with patch("teams.dawo.scanners.reddit.tools.asyncio.sleep", fake_sleep):
+            await limiter.acquire()
+
+        assert sleeps == [42.0]
+        assert limiter.remaining == 99
+
+    @pytest.mark.asyncio
+    async def test_ignores_missing_or_malformed_headers(self) -> None:
+        """Responses without usable headers leave the quota unchanged."""
+        limiter = AdaptiveRateLimiter(requests_per_window=60, clock=lambda: 0.0)
+
+        await limiter.acquire()
+        limiter.complete({"x-ratelimit-remaining": "abc", "x-ratelimit-reset": "60"})
+        await limiter.acquire()
+        limiter.complete(None)
+
+        assert limiter.remaining == 58
 
 
 class TestRedditClientSearch:
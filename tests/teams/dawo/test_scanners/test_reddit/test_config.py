@@ -172,3 +172,8 @@ class TestRedditScannerConfig:
         """rate_limit < 1 should raise ValueError."""
         with pytest.raises(ValueError, match="rate_limit must be >= 1"):
             RedditScannerConfig(rate_limit_requests_per_minute=0)
+
+    def test_zero_max_concurrent_requests_raises_error(self) -> None:
+        """max_concurrent_requests < 1 should raise ValueError."""
+        with pytest.raises(ValueError, match="max_concurrent_requests must be >= 1"):
+            RedditScannerConfig(max_concurrent_requests=0)
@@ -7,6 +7,8 @@ Tests:
     - Error handling
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock
 
@@ -27,6 +29,12 @@ class TestRedditHarvesterInit:
         assert harvester._client == mock_reddit_client
 
 
+    def test_harvester_rejects_zero_concurrency(self, mock_reddit_client: AsyncMock) -> None:
+        """Harvester should require at least one request in flight."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            RedditHarvester(mock_reddit_client, max_concurrency=0)
+
+
 class TestRedditHarvesterHarvest:
     """Tests for harvest() method."""
 
@@ -147,6 +155,41 @@ class TestRedditHarvesterDeletedPosts:
         assert len(result) == 0
 
 
+    @pytest.mark.asyncio
+    async def test_harvest_runs_concurrently_in_order(self) -> None:
+        """Detail requests overlap up to max_concurrency; output keeps input order."""
+        in_flight = 0
+        peak = 0
+
+        async def get_post_details(post_id: str) -> dict:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"id": post_id, "author": "user", "selftext": "Content"}
+
+        mock_client = AsyncMock()
+        mock_client.get_post_details.side_effect = get_post_details
+        posts = [
+            RawRedditPost(
+                id=f"post{i}",
+                subreddit="Test",
+                title=f"Post {i}",
+                score=100,
+                created_utc=1707177600,
+                permalink=f"/r/Test/comments/post{i}/",
+            )
+            for i in range(6)
+        ]
+
+        harvester = RedditHarvester(mock_client, max_concurrency=3)
+        result = await harvester.harvest(posts)
+
+        assert peak == 3
+        assert [post.id for post in result] == [f"post{i}" for i in range(6)]
+
+
 class TestRedditHarvesterErrors:
     """Tests for error handling."""
 
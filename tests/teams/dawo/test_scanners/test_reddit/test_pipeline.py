@@ -4,6 +4,7 @@ Tests:
     - Pipeline initialization
     - Full pipeline execution
     - Graceful degradation
+    - Failed publish retried from checkpoints
     - Statistics tracking
 """
 
@@ -287,6 +288,53 @@ class TestRedditResearchPipelineGracefulDegradation:
         assert result.retry_scheduled is True
         assert result.error is not None
 
+    @pytest.mark.asyncio
+    async def test_publish_failure_retry_resumes_from_checkpoints(
+        self,
+        mock_scanner: AsyncMock,
+        mock_harvester: AsyncMock,
+        mock_transformer: AsyncMock,
+        mock_validator: AsyncMock,
+        mock_scorer: AsyncMock,
+        mock_publisher: AsyncMock,
+    ) -> None:
+        """A publish that stored nothing is retried without rescanning."""
+        checkpoint_store = MagicMock()
+        checkpoint_store.load = AsyncMock(return_value={})
+        checkpoint_store.save = AsyncMock()
+        checkpoint_store.clear = AsyncMock()
+        mock_publisher.publish_batch.side_effect = [Exception("Database unavailable"), 1]
+        mock_publisher.publish.side_effect = Exception("Database unavailable")
+
+        pipeline = RedditResearchPipeline(
+            mock_scanner,
+            mock_harvester,
+            mock_transformer,
+            mock_validator,
+            mock_scorer,
+            mock_publisher,
+            checkpoint_store=checkpoint_store,
+        )
+
+        failed = await pipeline.execute()
+
+        assert failed.status == PipelineStatus.FAILED
+        assert failed.retry_scheduled is True
+        checkpoint_store.clear.assert_not_called()
+
+        saved = {
+            call.args[2]: call.args[3] for call in checkpoint_store.save.await_args_list
+        }
+        checkpoint_store.load = AsyncMock(return_value=saved)
+
+        retried = await pipeline.execute(run_id=failed.run_id)
+
+        assert retried.status == PipelineStatus.COMPLETE
+        assert retried.retry_scheduled is False
+        mock_scanner.scan.assert_called_once()
+        mock_harvester.harvest.assert_called_once()
+        checkpoint_store.clear.assert_awaited_once_with("reddit", failed.run_id)
+
     @pytest.mark.asyncio
     async def test_empty_scan_returns_complete(
         self,
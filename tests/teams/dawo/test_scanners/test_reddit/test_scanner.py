@@ -8,6 +8,8 @@ Tests:
     - Error handling
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock
 from datetime import datetime, timezone
@@ -157,6 +159,36 @@ class TestRedditScannerScan:
         assert result.statistics.subreddits_scanned == 2
         assert len(result.posts) == 2
 
+    @pytest.mark.asyncio
+    async def test_scan_searches_concurrently(self) -> None:
+        """Subreddit x keyword searches should overlap up to the configured limit."""
+        mock_client = AsyncMock()
+        in_flight = 0
+        peak = 0
+
+        async def mock_search(subreddit, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        mock_client.search_subreddit.side_effect = mock_search
+
+        config = RedditScannerConfig(
+            subreddits=["Nootropics", "Supplements", "Biohackers"],
+            keywords=["chaga", "reishi"],
+            max_concurrent_requests=4,
+        )
+
+        scanner = RedditScanner(config, mock_client)
+        result = await scanner.scan()
+
+        assert peak == 4
+        assert mock_client.search_subreddit.await_count == 6
+        assert result.statistics.keywords_searched == 6
+
     @pytest.mark.asyncio
     async def test_scan_statistics_accuracy(
         self,
@@ -0,0 +1,331 @@
+"""Tests for sharded scans.
+
+Tests verify:
+- Sources split into ordered shards of the requested size
+- Shard statistics are summed, cross-shard duplicates counted
+- Shard results merge in shard order with duplicates dropped
+- Per-source maps of the shards are merged
+- Failed shards are reported without losing the others
+- A scan settles once every enqueued shard recorded, and is claimed once
+- Every scanner exposes its sources and scans a subset of them
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from teams.dawo.scanners.news.agent import NewsScanner, NewsScanError
+from teams.dawo.scanners.news.config import FeedSource, NewsScannerConfig
+from teams.dawo.scanners.news.schemas import RawNewsArticle, ScanStatistics
+from teams.dawo.scanners.news.tools import NewsFeedClient
+from teams.dawo.scanners.sharding import (
+    ScanShardStore,
+    ShardableScanner,
+    merge_statistics,
+    split_sources,
+)
+
+
+class FakeRedis:
+    """Minimal async Redis stand-in for hashes and strings with TTLs."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.strings: dict[str, bytes] = {}
+        self.expiry: dict[str, int] = {}
+
+    async def hsetnx(self, name: str, key: str, value: bytes) -> bool:
+        fields = self.hashes.setdefault(name, {})
+        if key.encode("utf-8") in fields:
+            return False
+        fields[key.encode("utf-8")] = value
+        return True
+
+    async def hset(self, name: str, key: str, value: bytes) -> None:
+        self.hashes.setdefault(name, {})[key.encode("utf-8")] = value
+
+    async def hgetall(self, name: str) -> dict[bytes, bytes]:
+        return dict(self.hashes.get(name, {}))
+
+    async def hlen(self, name: str) -> int:
+        return len(self.hashes.get(name, {}))
+
+    async def get(self, name: str) -> bytes | None:
+        return self.strings.get(name)
+
+    async def set(self, name: str, value, ex: int | None = None, nx: bool = False):
+        if nx and name in self.strings:
+            return None
+        self.strings[name] = str(value).encode("utf-8")
+        return True
+
+    async def expire(self, name: str, seconds: int) -> None:
+        self.expiry[name] = seconds
+
+    async def delete(self, *names: str) -> None:
+        for name in names:
+            self.hashes.pop(name, None)
+            self.strings.pop(name, None)
+            self.expiry.pop(name, None)
+
+
+def _article(url: str) -> RawNewsArticle:
+    """Build a raw article with the given URL."""
+    return RawNewsArticle(
+        title=f"Article {url}",
+        summary="Test summary",
+        url=url,
+        published=datetime.now(timezone.utc),
+        source_name="TestSource",
+        is_tier_1=False,
+    )
+
+
+@pytest.fixture
+def mock_client() -> AsyncMock:
+    """Create mock feed client."""
+    client = AsyncMock(spec=NewsFeedClient)
+    client.take_validators.return_value = None
+    return client
+
+
+@pytest.fixture
+def scanner(mock_client: AsyncMock) -> NewsScanner:
+    """Create a news scanner with three feeds."""
+    config = NewsScannerConfig(
+        feeds=[FeedSource(f"Feed{i}", f"https://feed{i}.com/rss") for i in range(3)],
+        keywords=["mushrooms"],
+    )
+    return NewsScanner(config, mock_client)
+
+
+@pytest.fixture
+def store() -> ScanShardStore:
+    """Create a shard store over a fake Redis."""
+    return ScanShardStore(FakeRedis(), ttl_seconds=600)
+
+
+class TestSplitSources:
+    """Tests for split_sources."""
+
+    def test_splits_in_order(self):
+        """Shards keep source order; the last shard may be short."""
+        assert split_sources(["a", "b", "c"], 2) == [["a", "b"], ["c"]]
+        assert split_sources(["a", "b"]) == [["a"], ["b"]]
+        assert split_sources([], 3) == []
+
+    def test_invalid_shard_size(self):
+        """Shard size must be positive."""
+        with pytest.raises(ValueError):
+            split_sources(["a"], 0)
+
+
+class TestMergeStatistics:
+    """Tests for merge_statistics."""
+
+    def test_sums_fields_and_adds_duplicates(self):
+        """Numeric fields are summed; duplicates land in duplicates_removed."""
+        merged = merge_statistics(
+            [
+                ScanStatistics(feeds_processed=1, total_articles_found=3),
+                ScanStatistics(feeds_processed=1, feeds_failed=1, total_articles_found=2),
+            ],
+            duplicates=2,
+        )
+
+        assert merged.feeds_processed == 2
+        assert merged.feeds_failed == 1
+        assert merged.total_articles_found == 5
+        assert merged.duplicates_removed == 2
+
+
+class TestScanShardStore:
+    """Tests for recording and merging shards."""
+
+    def test_invalid_ttl(self):
+        """TTL must be positive."""
+        with pytest.raises(ValueError):
+            ScanShardStore(FakeRedis(), ttl_seconds=0)
+
+    def test_scanner_is_shardable(self, scanner: NewsScanner):
+        """Scanners satisfy the ShardableScanner protocol."""
+        assert isinstance(scanner, ShardableScanner)
+        assert scanner.sources() == ["Feed0", "Feed1", "Feed2"]
+
+    @pytest.mark.asyncio
+    async def test_merges_shards_and_drops_duplicates(
+        self,
+        scanner: NewsScanner,
+        mock_client: AsyncMock,
+        store: ScanShardStore,
+    ):
+        """Shards merge in shard order; an item reported twice is kept once."""
+        mock_client.fetch_feed.side_effect = [
+            [_article("https://ex.com/2"), _article("https://ex.com/shared")],
+            [_article("https://ex.com/shared"), _article("https://ex.com/1")],
+        ]
+        shards = split_sources(scanner.sources()[:2])
+
+        # Shard 1 finishes first - order must still follow the shards
+        first = await scanner.scan(shards[0])
+        second = await scanner.scan(shards[1])
+        assert await store.record(scanner, "news", "run-1", 1, second) == 0
+        assert await store.record(scanner, "news", "run-1", 0, first) == 1
+
+        merged, failures = await store.collect("news", "run-1", scanner.SHARD_ITEMS_FIELD)
+
+        assert failures == []
+        assert [a.url for a in merged.articles] == [
+            "https://ex.com/2",
+            "https://ex.com/shared",
+            "https://ex.com/1",
+        ]
+        assert merged.statistics.feeds_processed == 2
+        assert merged.statistics.duplicates_removed == 1
+
+    @pytest.mark.asyncio
+    async def test_merges_per_source_maps(
+        self,
+        scanner: NewsScanner,
+        mock_client: AsyncMock,
+        store: ScanShardStore,
+    ):
+        """Dict fields (feed validators) are the union of every shard's."""
+        mock_client.fetch_feed.return_value = [_article("https://ex.com/1")]
+        mock_client.take_validators.side_effect = lambda url: f"validators:{url}"
+        for index, shard in enumerate(split_sources(scanner.sources()[:2])):
+            await store.record(scanner, "news", "run-1", index, await scanner.scan(shard))
+
+        merged, _ = await store.collect("news", "run-1", scanner.SHARD_ITEMS_FIELD)
+
+        assert merged.feed_validators == {
+            "https://feed0.com/rss": "validators:https://feed0.com/rss",
+            "https://feed1.com/rss": "validators:https://feed1.com/rss",
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_shard_is_reported(
+        self,
+        scanner: NewsScanner,
+        mock_client: AsyncMock,
+        store: ScanShardStore,
+    ):
+        """A failed shard's error is merged into the surviving result."""
+        mock_client.fetch_feed.return_value = [_article("https://ex.com/1")]
+        await store.record(scanner, "news", "run-1", 0, await scanner.scan(["Feed0"]))
+        await store.record_failure("news", "run-1", 1, "Shard 1 (Feed1): timeout")
+
+        merged, failures = await store.collect("news", "run-1", scanner.SHARD_ITEMS_FIELD)
+
+        assert failures == ["Shard 1 (Feed1): timeout"]
+        assert len(merged.articles) == 1
+        assert "Shard 1 (Feed1): timeout" in merged.errors
+
+    @pytest.mark.asyncio
+    async def test_all_shards_failed(self, store: ScanShardStore):
+        """No merged result when no shard succeeded."""
+        await store.record_failure("news", "run-1", 0, "boom")
+
+        merged, failures = await store.collect("news", "run-1", "articles")
+
+        assert merged is None
+        assert failures == ["boom"]
+
+    @pytest.mark.asyncio
+    async def test_unorderable_items_and_repeated_positions(
+        self,
+        scanner: NewsScanner,
+        mock_client: AsyncMock,
+        store: ScanShardStore,
+    ):
+        """Items are ordered by position only; a re-reported position is kept once."""
+        mock_client.fetch_feed.return_value = [_article("https://ex.com/1")]
+        await store.record(scanner, "news", "run-1", 0, await scanner.scan(["Feed0"]))
+        # Retried shard 0 found a different article at the same position
+        mock_client.fetch_feed.return_value = [_article("https://ex.com/retry")]
+        await store.record(scanner, "news", "run-1", 0, await scanner.scan(["Feed0"]))
+
+        merged, _ = await store.collect("news", "run-1", scanner.SHARD_ITEMS_FIELD)
+
+        assert len(merged.articles) == 1
+
+    @pytest.mark.asyncio
+    async def test_settles_when_every_shard_recorded(
+        self,
+        scanner: NewsScanner,
+        mock_client: AsyncMock,
+        store: ScanShardStore,
+    ):
+        """settled() turns true with the last shard, failed or not."""
+        mock_client.fetch_feed.return_value = [_article("https://ex.com/1")]
+        assert not await store.settled("news", "scan-1")
+        await store.begin("news", "scan-1", 2)
+
+        await store.record(scanner, "news", "scan-1", 0, await scanner.scan(["Feed0"]))
+        assert not await store.settled("news", "scan-1")
+        await store.record_failure("news", "scan-1", 1, "Shard 1 (Feed1): timeout")
+
+        assert await store.settled("news", "scan-1")
+
+    @pytest.mark.asyncio
+    async def test_claimed_once(self, store: ScanShardStore):
+        """Only the first claim wins, even after the scan was cleared."""
+        assert await store.claim("news", "scan-1")
+        await store.clear("news", "scan-1")
+
+        assert not await store.claim("news", "scan-1")
+        assert await store.claim("news", "scan-2")
+
+    @pytest.mark.asyncio
+    async def test_missing_shards_reported(
+        self,
+        scanner: NewsScanner,
+        mock_client: AsyncMock,
+        store: ScanShardStore,
+    ):
+        """Shards that never recorded are reported as failed."""
+        mock_client.fetch_feed.return_value = [_article("https://ex.com/1")]
+        await store.record(scanner, "news", "scan-1", 0, await scanner.scan(["Feed0"]))
+
+        merged, failures = await store.collect(
+            "news", "scan-1", scanner.SHARD_ITEMS_FIELD, shard_count=3
+        )
+
+        assert failures == ["Shard 1: did not finish", "Shard 2: did not finish"]
+        assert len(merged.articles) == 1
+
+    @pytest.mark.asyncio
+    async def test_clear(self, scanner: NewsScanner, mock_client: AsyncMock, store):
+        """Clearing drops the run's shard results."""
+        mock_client.fetch_feed.return_value = [_article("https://ex.com/1")]
+        await store.record(scanner, "news", "run-1", 0, await scanner.scan(["Feed0"]))
+
+        await store.clear("news", "run-1")
+
+        assert await store.collect("news", "run-1", "articles") == (None, [])
+
+
+class TestScanSources:
+    """Tests for scanning a shard of sources."""
+
+    @pytest.mark.asyncio
+    async def test_scan_only_given_feeds(self, scanner: NewsScanner, mock_client: AsyncMock):
+        """scan(sources) fetches just the named feeds."""
+        mock_client.fetch_feed.return_value = [_article("https://ex.com/1")]
+
+        result = await scanner.scan(["Feed2"])
+
+        assert mock_client.fetch_feed.await_count == 1
+        assert mock_client.fetch_feed.call_args.kwargs["feed"].name == "Feed2"
+        assert result.statistics.feeds_processed == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_shard_raises(self, scanner: NewsScanner, mock_client: AsyncMock):
+        """A shard whose feeds all fail raises like a full scan would."""
+        from teams.dawo.scanners.news.tools import FeedFetchError
+
+        mock_client.fetch_feed.side_effect = FeedFetchError("down")
+
+        with pytest.raises(NewsScanError):
+            await scanner.scan(["Feed0"])
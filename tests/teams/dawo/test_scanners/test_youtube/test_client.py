@@ -78,6 +78,87 @@ class TestQuotaTracker:
             tracker.check_and_use(YOUTUBE_DAILY_QUOTA + 1)
 
 
+class FakeQuotaRedis:
+    """Minimal async Redis stand-in for the shared quota ledger."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+        self.expiries: dict[str, int] = {}
+
+    async def incrby(self, key: str, amount: int) -> int:
+        self.values[key] = self.values.get(key, 0) + amount
+        return self.values[key]
+
+    async def decrby(self, key: str, amount: int) -> int:
+        self.values[key] -= amount
+        return self.values[key]
+
+    async def expire(self, key: str, seconds: int) -> None:
+        self.expiries[key] = seconds
+
+    async def get(self, key: str):
+        value = self.values.get(key)
+        return None if value is None else str(value).encode()
+
+
+class TestRedisQuotaTracker:
+    """Tests for RedisQuotaTracker class."""
+
+    @pytest.mark.asyncio
+    async def test_trackers_share_one_budget(self):
+        """Test two trackers (workers) spend from the same ledger."""
+        from teams.dawo.scanners.youtube import RedisQuotaTracker, YOUTUBE_DAILY_QUOTA
+
+        redis = FakeQuotaRedis()
+        first = RedisQuotaTracker(redis)
+        second = RedisQuotaTracker(redis)
+
+        await first.reserve(100)
+        await second.reserve(250)
+
+        assert await first.remaining() == YOUTUBE_DAILY_QUOTA - 350
+        assert list(redis.expiries.values()) == [2 * 24 * 60 * 60]
+
+    @pytest.mark.asyncio
+    async def test_refused_reservation_is_rolled_back(self):
+        """Test an overshooting reservation raises and releases its units."""
+        from teams.dawo.scanners.youtube import (
+            RedisQuotaTracker,
+            QuotaExhaustedError,
+            YOUTUBE_DAILY_QUOTA,
+        )
+
+        redis = FakeQuotaRedis()
+        tracker = RedisQuotaTracker(redis)
+        await tracker.reserve(YOUTUBE_DAILY_QUOTA - 50)
+
+        with pytest.raises(QuotaExhaustedError):
+            await tracker.reserve(100)
+
+        assert await tracker.remaining() == 50
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_counter(self):
+        """Test Redis failures degrade to the in-process counter."""
+        from teams.dawo.scanners.youtube import RedisQuotaTracker, YOUTUBE_DAILY_QUOTA
+
+        redis = MagicMock()
+        redis.incrby = AsyncMock(side_effect=ConnectionError("down"))
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        tracker = RedisQuotaTracker(redis)
+
+        await tracker.reserve(100)
+
+        assert await tracker.remaining() == YOUTUBE_DAILY_QUOTA - 100
+
+    def test_quota_day_is_pacific(self):
+        """Test the quota day rolls over at midnight Pacific, not UTC."""
+        from teams.dawo.scanners.youtube.tools import quota_day
+
+        # 03:00 UTC on Mar 2 is still Mar 1 in California
+        assert quota_day(datetime(2026, 3, 2, 3, 0, tzinfo=timezone.utc)).day == 1
+
+
 class TestYouTubeClientSearch:
     """Tests for YouTubeClient.search_videos method."""
 
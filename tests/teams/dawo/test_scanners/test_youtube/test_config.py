@@ -99,3 +99,30 @@ class TestYouTubeScannerConfig:
 
         with pytest.raises(ValueError, match="search_queries"):
             YouTubeScannerConfig(search_queries=[])
+
+
+class TestQueryPlannerConfig:
+    """Tests for QueryPlannerConfig dataclass."""
+
+    def test_query_planner_config_defaults(self):
+        """Test QueryPlannerConfig keeps a quota reserve by default."""
+        from teams.dawo.scanners.youtube import QueryPlannerConfig, DEFAULT_QUOTA_RESERVE_UNITS
+
+        config = QueryPlannerConfig()
+
+        assert config.quota_reserve_units == DEFAULT_QUOTA_RESERVE_UNITS
+        assert config.prune_after_searches >= 1
+
+    def test_query_planner_config_validates_reserve(self):
+        """Test that a reserve covering the whole quota raises ValueError."""
+        from teams.dawo.scanners.youtube import QueryPlannerConfig, YOUTUBE_DAILY_QUOTA
+
+        with pytest.raises(ValueError, match="quota_reserve_units"):
+            QueryPlannerConfig(quota_reserve_units=YOUTUBE_DAILY_QUOTA)
+
+    def test_query_planner_config_validates_threshold(self):
+        """Test that high_score_threshold must be on the 0-10 scale."""
+        from teams.dawo.scanners.youtube import QueryPlannerConfig
+
+        with pytest.raises(ValueError, match="high_score_threshold"):
+            QueryPlannerConfig(high_score_threshold=11)
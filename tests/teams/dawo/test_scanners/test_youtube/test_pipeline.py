@@ -272,6 +272,68 @@ class TestYouTubeResearchPipelineExecute:
         assert result.status == PipelineStatus.QUOTA_EXCEEDED
         assert result.retry_after is not None
 
+    @pytest.mark.asyncio
+    async def test_publish_failure_retry_resumes_from_checkpoints(
+        self,
+        mock_scan_result,
+        mock_harvested_videos,
+        mock_transformed_research,
+        mock_validated_research,
+    ):
+        """Test a publish that stored nothing is retried without rescanning."""
+        from teams.dawo.scanners.youtube.pipeline import YouTubeResearchPipeline
+        from teams.dawo.scanners.youtube import PipelineStatus
+
+        checkpoint_store = MagicMock()
+        checkpoint_store.load = AsyncMock(return_value={})
+        checkpoint_store.save = AsyncMock()
+        checkpoint_store.clear = AsyncMock()
+
+        scanner = AsyncMock()
+        scanner.scan = AsyncMock(return_value=mock_scan_result)
+        harvester = AsyncMock()
+        harvester.harvest = AsyncMock(return_value=mock_harvested_videos)
+        transformer = AsyncMock()
+        transformer.transform = AsyncMock(return_value=mock_transformed_research)
+        validator = AsyncMock()
+        validator.validate = AsyncMock(return_value=mock_validated_research)
+        scorer = MagicMock()
+        scorer.calculate_score = MagicMock(return_value=MagicMock(final_score=7.5))
+        publisher = AsyncMock()
+        publisher.publish_batch = AsyncMock(
+            side_effect=[Exception("Database unavailable"), 1]
+        )
+        publisher.publish = AsyncMock(side_effect=Exception("Database unavailable"))
+
+        pipeline = YouTubeResearchPipeline(
+            scanner=scanner,
+            harvester=harvester,
+            transformer=transformer,
+            validator=validator,
+            scorer=scorer,
+            publisher=publisher,
+            checkpoint_store=checkpoint_store,
+        )
+
+        failed = await pipeline.execute()
+
+        assert failed.status == PipelineStatus.FAILED
+        assert failed.retry_scheduled is True
+        checkpoint_store.clear.assert_not_called()
+
+        saved = {
+            call.args[2]: call.args[3] for call in checkpoint_store.save.await_args_list
+        }
+        checkpoint_store.load = AsyncMock(return_value=saved)
+
+        retried = await pipeline.execute(run_id=failed.run_id)
+
+        assert retried.status == PipelineStatus.COMPLETE
+        assert retried.retry_scheduled is False
+        scanner.scan.assert_called_once()
+        harvester.harvest.assert_called_once()
+        checkpoint_store.clear.assert_awaited_once_with("youtube", failed.run_id)
+
 
 class TestPipelineError:
     """Tests for PipelineError exception."""
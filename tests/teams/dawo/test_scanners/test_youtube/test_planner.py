@@ -0,0 +1,158 @@
+"""Tests for the quota-aware YouTube query planner.
+
+Tests verify:
+- Queries are ordered by historical yield per quota unit
+- Low-yield queries are pruned and re-explored after skipped runs
+- Plans stop before the quota (and its reserve) is exhausted
+- High-scoring videos credit the queries that found them
+- The scanner searches only planned queries and records their yield
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from teams.dawo.scanners.youtube import (
+    QueryPlanner,
+    QueryPlannerConfig,
+    QuotaTracker,
+    QuotaExhaustedError,
+    YouTubeScanner,
+    YouTubeScannerConfig,
+    SEARCH_QUOTA_COST,
+    YOUTUBE_DAILY_QUOTA,
+)
+
+
+class FakeHashRedis:
+    """Minimal async Redis stand-in for per-query yield hashes."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+
+    async def hgetall(self, key: str) -> dict[bytes, bytes]:
+        return dict(self.hashes.get(key, {}))
+
+    async def hincrby(self, key: str, name: str, amount: int) -> int:
+        fields = self.hashes.setdefault(key, {})
+        value = int(fields.get(name.encode(), b"0")) + amount
+        fields[name.encode()] = str(value).encode()
+        return value
+
+
+def _search_result(video_id: str) -> dict:
+    return {
+        "id": {"videoId": video_id},
+        "snippet": {"publishedAt": "2026-02-01T10:00:00Z", "title": video_id},
+    }
+
+
+class TestQueryPlanner:
+    """Tests for QueryPlanner."""
+
+    @pytest.mark.asyncio
+    async def test_orders_by_yield_per_unit(self):
+        """Test productive queries are planned first; ties keep config order."""
+        planner = QueryPlanner(QuotaTracker())
+        await planner.record_search("weak", SEARCH_QUOTA_COST, [])
+        await planner.record_search("strong", SEARCH_QUOTA_COST, ["a", "b", "c", "d", "e", "f"])
+
+        plan = await planner.plan(["weak", "untried", "strong", "other"], 10)
+
+        assert plan.queries == ["strong", "untried", "other", "weak"]
+
+    @pytest.mark.asyncio
+    async def test_stops_before_quota_and_reserve(self):
+        """Test queries beyond the budget (minus reserve) are deferred."""
+        tracker = QuotaTracker()
+        tracker.check_and_use(YOUTUBE_DAILY_QUOTA - 800)
+        planner = QueryPlanner(tracker, QueryPlannerConfig(quota_reserve_units=300))
+
+        plan = await planner.plan(["a", "b", "c", "d"], 50)
+
+        # 800 left, 300 reserved: each search needs 100 + 50 statistics units
+        assert plan.queries == ["a", "b", "c"]
+        assert plan.deferred == ["d"]
+        assert plan.planned_units == 450
+
+    @pytest.mark.asyncio
+    async def test_prunes_then_reexplores_low_yield_query(self):
+        """Test a query with no new videos sits out, then gets retried."""
+        planner = QueryPlanner(
+            QuotaTracker(),
+            QueryPlannerConfig(prune_after_searches=2, reexplore_after_skips=2),
+        )
+        for _ in range(2):
+            await planner.record_search("stale", SEARCH_QUOTA_COST, [])
+
+        first = await planner.plan(["stale", "fresh"], 10)
+        second = await planner.plan(["stale", "fresh"], 10)
+        third = await planner.plan(["stale", "fresh"], 10)
+
+        assert first.pruned == ["stale"]
+        assert second.pruned == ["stale"]
+        assert "stale" in third.queries
+
+    @pytest.mark.asyncio
+    async def test_high_scoring_videos_credit_their_queries(self):
+        """Test record_scores counts only videos above the threshold."""
+        redis = FakeHashRedis()
+        planner = QueryPlanner(QuotaTracker(), redis_client=redis)
+        await planner.record_search("reishi", SEARCH_QUOTA_COST, ["v1", "v2"])
+
+        await planner.record_scores({"v1": 8.5, "v2": 3.0})
+
+        fields = redis.hashes["dawo:youtube:query_yield:reishi"]
+        assert fields[b"high_scoring"] == b"1"
+        assert fields[b"new_videos"] == b"2"
+
+    @pytest.mark.asyncio
+    async def test_history_shared_through_redis(self):
+        """Test a second planner (worker) sees yield recorded by the first."""
+        redis = FakeHashRedis()
+        await QueryPlanner(QuotaTracker(), redis_client=redis).record_search(
+            "chaga", SEARCH_QUOTA_COST, ["a", "b", "c", "d", "e", "f"]
+        )
+
+        plan = await QueryPlanner(QuotaTracker(), redis_client=redis).plan(
+            ["untried", "chaga"], 10
+        )
+
+        assert plan.queries == ["chaga", "untried"]
+
+
+class TestScannerWithPlanner:
+    """Tests for YouTubeScanner driven by a QueryPlanner."""
+
+    @pytest.mark.asyncio
+    async def test_scan_searches_planned_queries_only(self):
+        """Test deferred queries are not searched and yield is recorded."""
+        tracker = QuotaTracker()
+        tracker.check_and_use(YOUTUBE_DAILY_QUOTA - 700)
+        planner = QueryPlanner(tracker, QueryPlannerConfig(quota_reserve_units=500))
+        client = MagicMock()
+        client.search_videos = AsyncMock(return_value=[_search_result("v1")])
+        config = YouTubeScannerConfig(
+            search_queries=["first", "second"],
+            max_videos_per_query=50,
+        )
+
+        result = await YouTubeScanner(config, client, planner=planner).scan()
+
+        assert client.search_videos.await_count == 1
+        assert result.statistics.queries_deferred == 1
+        assert result.statistics.quota_used == SEARCH_QUOTA_COST
+        assert planner._local["first"].new_videos == 1
+
+    @pytest.mark.asyncio
+    async def test_scan_stops_on_quota_exhaustion(self):
+        """Test remaining queries are skipped once the quota runs out."""
+        client = MagicMock()
+        client.search_videos = AsyncMock(side_effect=QuotaExhaustedError("spent"))
+        config = YouTubeScannerConfig(search_queries=["a", "b", "c"])
+
+        result = await YouTubeScanner(config, client).scan()
+
+        assert client.search_videos.await_count == 1
+        assert result.statistics.queries_deferred == 3
+        assert result.statistics.queries_searched == 0
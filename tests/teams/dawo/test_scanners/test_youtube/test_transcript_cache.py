@@ -0,0 +1,142 @@
+"""Tests for the on-disk transcript cache and cached TranscriptClient.
+
+Tests verify:
+- Round trip of compressed transcripts keyed by video and language
+- Unavailable transcripts are not cached
+- Least-recently-used eviction beyond max_bytes
+- The client downloads a transcript once (cache and in-flight sharing)
+- Downloads are bounded by max_concurrent_fetches
+"""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from teams.dawo.scanners.youtube import (
+    TranscriptCache,
+    TranscriptClient,
+    TranscriptConfig,
+    TranscriptResult,
+)
+
+
+def _result(text: str = "lion's mane transcript", language: str = "en") -> TranscriptResult:
+    return TranscriptResult(text=text, language=language, available=True, duration_seconds=42)
+
+
+class TestTranscriptCache:
+    """Tests for TranscriptCache."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        """Test a stored transcript is returned for any listed language."""
+        cache = TranscriptCache(tmp_path)
+        await cache.put("abc123xyz", _result(language="en-GB"))
+
+        cached = await cache.get("abc123xyz", ["en", "en-GB"])
+
+        assert cached == _result(language="en-GB")
+        assert await cache.get("abc123xyz", ["no"]) is None
+        assert cache.total_bytes > 0
+
+    @pytest.mark.asyncio
+    async def test_unavailable_transcripts_not_cached(self, tmp_path):
+        """Test missing transcripts are re-checked on later runs."""
+        cache = TranscriptCache(tmp_path)
+        await cache.put("abc123xyz", TranscriptResult(text="", available=False, reason="disabled"))
+
+        assert await cache.get("abc123xyz", ["en"]) is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, tmp_path):
+        """Test the oldest entry is evicted once max_bytes is exceeded."""
+        text = os.urandom(400).hex()  # Random, so every entry compresses to ~550 bytes
+        cache = TranscriptCache(tmp_path, max_bytes=1500)
+        await cache.put("old", _result(text))
+        await cache.put("recent", _result(text))
+        past = time.time() - 60
+        os.utime(next(tmp_path.glob("ol/old.*")), (past, past))
+        cache._index = None  # Re-read access times from disk
+        await cache.get("recent", ["en"])
+
+        await cache.put("new", _result(text))
+
+        assert await cache.get("old", ["en"]) is None
+        assert await cache.get("recent", ["en"]) is not None
+        assert await cache.get("new", ["en"]) is not None
+        assert cache.total_bytes <= 1500
+
+    def test_invalid_max_bytes(self, tmp_path):
+        """Test non-positive size budgets are rejected."""
+        with pytest.raises(ValueError, match="max_bytes"):
+            TranscriptCache(tmp_path, max_bytes=0)
+
+
+class TestCachedTranscriptClient:
+    """Tests for TranscriptClient with caching and bounded concurrency."""
+
+    @pytest.fixture
+    def mock_api(self):
+        """YouTubeTranscriptApi stand-in returning one manual transcript."""
+        transcript = MagicMock()
+        transcript.language_code = "en"
+        transcript.fetch.return_value = [{"text": "Reishi and sleep.", "start": 0.0, "duration": 5.0}]
+        api = MagicMock()
+        api.list.return_value.find_manually_created_transcript.return_value = transcript
+        return api
+
+    @pytest.mark.asyncio
+    async def test_transcript_fetched_once(self, tmp_path, mock_api):
+        """Test concurrent and later requests reuse one download."""
+        client = TranscriptClient(TranscriptConfig(), MagicMock(), cache=TranscriptCache(tmp_path))
+
+        with patch("teams.dawo.scanners.youtube.tools.YouTubeTranscriptApi", return_value=mock_api):
+            first, second = await asyncio.gather(
+                client.get_transcript("abc123xyz"),
+                client.get_transcript("abc123xyz"),
+            )
+            third = await client.get_transcript("abc123xyz")
+
+        assert first.text == second.text == third.text == "Reishi and sleep."
+        assert mock_api.list.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_text_truncated_on_read(self, tmp_path):
+        """Test max_transcript_length applies to cached transcripts."""
+        cache = TranscriptCache(tmp_path)
+        await cache.put("abc123xyz", _result("x" * 100))
+        client = TranscriptClient(TranscriptConfig(max_transcript_length=10), MagicMock(), cache=cache)
+
+        result = await client.get_transcript("abc123xyz")
+
+        assert result.text == "x" * 10
+
+    @pytest.mark.asyncio
+    async def test_downloads_are_bounded(self, mock_api):
+        """Test no more than max_concurrent_fetches downloads run at once."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_list(video_id):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return mock_api.list.return_value
+
+        mock_api.list.side_effect = slow_list
+        client = TranscriptClient(TranscriptConfig(max_concurrent_fetches=2), MagicMock())
+
+        with patch("teams.dawo.scanners.youtube.tools.YouTubeTranscriptApi", return_value=mock_api):
+            results = await asyncio.gather(*(client.get_transcript(f"vid{i}") for i in range(6)))
+
+        assert all(r.available for r in results)
+        assert peak == 2
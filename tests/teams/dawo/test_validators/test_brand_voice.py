@@ -10,8 +10,11 @@ Tests cover:
 - Config injection (not direct file loading)
 - LLM integration with mocks
 - Word boundary edge cases
+- Term index single-pass matching
 """
 
+import re
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -27,6 +30,7 @@ from teams.dawo.validators.brand_voice import (
     BrandProfile,
     TonePillar,
     validate_profile,
+    TermIndex,
 )
 
 
@@ -496,6 +500,64 @@ class TestWordBoundaryEdgeCases:
         assert len(med_issues) >= 3
 
 
+class TestTermIndex:
+    """Tests for the compiled term index used by the validator."""
+
+    @staticmethod
+    def _regex_hits(terms: list[str], content: str) -> list[tuple[str, int, int]]:
+        """Hits of the per-term word-boundary regexes the index replaces."""
+        return [
+            (term, match.start(), match.end())
+            for term in terms
+            for match in re.finditer(r'\b' + re.escape(term.lower()) + r'\b', content.lower())
+        ]
+
+    @pytest.mark.parametrize("content", [
+        "Cure, cures and CURED - no cure here: cure!",
+        "Treatment treats the treatments; treatment.",
+        "Buy now buy nowhere, buy now!",
+        "Skog og øl: ølbrygging, øl.",
+        "anti-aging anti aging anti-agingly",
+        "aa aa aa",
+    ])
+    def test_hits_match_word_boundary_regex(self, content):
+        """Positions are identical to re.finditer with \\b per term."""
+        terms = ["cure", "cures", "treatment", "buy now", "now", "øl", "anti-aging", "aa aa"]
+        scan = TermIndex({"terms": terms}).scan(content)
+
+        assert list(scan.hits("terms")) == self._regex_hits(terms, content)
+
+    def test_non_word_edges(self):
+        """Terms starting or ending with punctuation keep regex semantics."""
+        terms = ["-free", "wow!", "x-"]
+        content = "sugar-free wow! wow!! x-ray -free"
+        scan = TermIndex({"terms": terms}).scan(content)
+
+        assert list(scan.hits("terms")) == self._regex_hits(terms, content)
+
+    def test_shared_term_across_groups(self):
+        """A term in several groups is reported in each of them."""
+        index = TermIndex({"superlatives": ["revolutionary"], "negative": ["revolutionary"]})
+        scan = index.scan("A revolutionary idea")
+
+        assert scan.found_terms("superlatives") == ["revolutionary"]
+        assert scan.terms_found("negative") == 1
+        assert scan.terms_found("missing") == 0
+
+    def test_validator_positions_unchanged(self, validator):
+        """Issue contexts are cut around the same positions as before."""
+        content = "Our tea is the best. It cures nothing, and heals nobody - simple."
+        result = validator.validate_content_sync(content)
+
+        phrases = [i.phrase for i in result.issues]
+        # Medicinal terms (+-15 characters) first, then superlatives (+-10)
+        assert phrases == [
+            "s the best. It cures nothing, and h",
+            "s nothing, and heals nobody - simpl",
+            "ea is the best. It cures",
+        ]
+
+
 class TestEUComplianceIntegration:
     """Tests for EU Compliance Checker integration - Task 5."""
 
@@ -9,8 +9,11 @@ Tests cover:
 - Chaga supplement-only validation
 - Config injection (not direct loading)
 - Word boundary edge cases (treatment vs treats, supporter vs supports)
+- Compiled single-pass rule matcher (overlapping hits, priority order)
+- Incremental sentence-level checks against a validation snapshot
+- Packed batch checks (several contents per LLM prompt)
 - Regulation reference constants
-- LLM integration capability
+- LLM integration capability (malformed replies fail the LLM stage)
 """
 
 import pytest
@@ -25,8 +28,10 @@ from teams.dawo.validators.eu_compliance import (
     NovelFoodCheck,
     RegulationRef,
     ComplianceScoring,
+    ValidationSnapshot,
+    split_sentences,
 )
-from teams.dawo.validators.eu_compliance.rules import ComplianceRules
+from teams.dawo.validators.eu_compliance.rules import ComplianceRules, CompiledRules
 
 
 # Test configuration - loaded via injection, not from file
@@ -576,6 +581,291 @@ class TestWordBoundaryEdgeCases:
         assert result.prohibited_count >= 3
 
 
+class TestCompiledRules:
+    """Tests for the single-pass compiled rule matcher."""
+
+    def test_compile_returns_matcher(self, rules):
+        """Test rules compile into a CompiledRules matcher."""
+        assert isinstance(rules.compile(), CompiledRules)
+
+    def test_matches_tagged_with_spans(self, rules):
+        """Test every hit carries its status, category and span."""
+        content = "Ritual that Supports focus and treats stress"
+        matches = rules.compile().find_all(content)
+
+        assert [(m.status, m.pattern) for m in matches] == [
+            ("prohibited", "treats"),
+            ("borderline", "supports"),
+            ("permitted", "ritual"),
+        ]
+        treats = matches[0]
+        assert treats.category == "treatment_claim"
+        assert content[treats.start:treats.end] == "treats"
+
+    def test_overlapping_patterns_all_reported(self):
+        """Test nested patterns are found like a per-pattern scan would."""
+        config = {
+            "prohibited_patterns": [
+                {"pattern": "cancer", "category": "disease_reference"},
+                {"pattern": "anti-cancer", "category": "disease_reference"},
+                {"pattern": "fights disease", "category": "treatment_claim"},
+                {"pattern": "fights", "category": "treatment_claim"},
+            ],
+            "borderline_patterns": [],
+            "permitted_patterns": [],
+        }
+        matches = ComplianceRules(config).compile().find_all(
+            "Anti-cancer blend fights disease"
+        )
+
+        assert [(m.pattern, m.start) for m in matches] == [
+            ("cancer", 5),
+            ("anti-cancer", 0),
+            ("fights disease", 18),
+            ("fights", 18),
+        ]
+
+    def test_word_boundaries_respected(self, rules):
+        """Test patterns only match whole words."""
+        assert rules.compile().find_all("A supporter of treatment") == []
+
+    def test_empty_rules(self):
+        """Test rules without patterns match nothing."""
+        config = {
+            "prohibited_patterns": [],
+            "borderline_patterns": [],
+            "permitted_patterns": [],
+        }
+        assert ComplianceRules(config).compile().find_all("treats cancer") == []
+
+    @pytest.mark.asyncio
+    async def test_check_content_flags_each_hit(self, checker):
+        """Test prohibited hits come before borderline ones, each counted."""
+        result = await checker.check_content("Supports immunity, treats cancer.")
+
+        assert [r.status for r in result.flagged_phrases] == [
+            ComplianceStatus.PROHIBITED,
+            ComplianceStatus.PROHIBITED,
+            ComplianceStatus.BORDERLINE,
+        ]
+
+
+class TestIncrementalCheck:
+    """Tests for check_content_incremental and validation snapshots."""
+
+    def test_split_sentences(self):
+        """Sentences end at terminal punctuation or line breaks."""
+        assert split_sentences("Morning ritual. Supports focus!\n#DAWO  ") == [
+            "Morning ritual.",
+            "Supports focus!",
+            "#DAWO",
+        ]
+        assert split_sentences("  \n ") == []
+
+    @pytest.mark.asyncio
+    async def test_matches_full_check(self, checker):
+        """Merged sentence findings score like a whole-content check."""
+        content = "Supports immunity. Treats cancer!\nA daily ritual."
+
+        full = await checker.check_content(content)
+        incremental, _ = await checker.check_content_incremental(content)
+
+        assert incremental.overall_status == full.overall_status
+        assert incremental.compliance_score == pytest.approx(full.compliance_score)
+        assert sorted(r.status.value for r in incremental.flagged_phrases) == sorted(
+            r.status.value for r in full.flagged_phrases
+        )
+
+    @pytest.mark.asyncio
+    async def test_only_changed_sentences_rechecked(self):
+        """An edit re-checks the edited sentences in one prompt and reuses the rest."""
+        mock_llm = AsyncMock()
+        mock_llm.generate.side_effect = [
+            "NO_FLAGGED_PHRASES",
+            "ITEM: 1\nNO_FLAGGED_PHRASES\nITEM: 2\nNO_FLAGGED_PHRASES",
+        ]
+        checker = EUComplianceChecker(TEST_CONFIG, llm_client=mock_llm)
+
+        _, snapshot = await checker.check_content_incremental(
+            "Supports immunity. A daily ritual. Made in Norway."
+        )
+        result, snapshot = await checker.check_content_incremental(
+            "Supports immunity. A calm daily ritual. Made in Finland.",
+            ValidationSnapshot.from_dict(snapshot.to_dict()),
+        )
+
+        assert mock_llm.generate.await_count == 2
+        prompt = mock_llm.generate.call_args.kwargs["prompt"]
+        assert "Supports immunity" not in prompt and "Made in Finland." in prompt
+        assert result.overall_status == OverallStatus.WARNING
+        assert len(snapshot.sentences) == 3
+
+    @pytest.mark.asyncio
+    async def test_llm_findings_attributed_to_sentences(self):
+        """A whole-content LLM finding stays with its sentence across edits."""
+        mock_llm = AsyncMock()
+        mock_llm.generate.return_value = (
+            "PHRASE: sharpens memory\nSTATUS: BORDERLINE\nEXPLANATION: Function claim"
+        )
+        checker = EUComplianceChecker(TEST_CONFIG, llm_client=mock_llm)
+
+        first, snapshot = await checker.check_content_incremental(
+            "A daily ritual. It sharpens memory."
+        )
+        mock_llm.generate.return_value = "ITEM: 1\nNO_FLAGGED_PHRASES"
+        second, _ = await checker.check_content_incremental(
+            "A calm daily ritual. It sharpens memory.", snapshot
+        )
+
+        assert mock_llm.generate.await_count == 2
+        assert first.overall_status == second.overall_status == OverallStatus.WARNING
+        assert [r.phrase for r in second.flagged_phrases] == ["sharpens memory"]
+
+    @pytest.mark.asyncio
+    async def test_unplaced_llm_finding_not_recorded(self):
+        """A finding not found in the content is reported but not snapshotted."""
+        mock_llm = AsyncMock()
+        mock_llm.generate.return_value = (
+            "PHRASE: improves memory\nSTATUS: BORDERLINE\nEXPLANATION: Function claim"
+        )
+        checker = EUComplianceChecker(TEST_CONFIG, llm_client=mock_llm)
+
+        result, snapshot = await checker.check_content_incremental("Good for the mind.")
+
+        assert result.overall_status == OverallStatus.WARNING
+        assert snapshot.sentences == {}
+
+    @pytest.mark.asyncio
+    async def test_snapshot_from_other_rules_ignored(self, checker):
+        """Findings taken under different rules are never reused."""
+        _, snapshot = await checker.check_content_incremental("A daily ritual.")
+        stricter = EUComplianceChecker({
+            **TEST_CONFIG,
+            "prohibited_patterns": [{"pattern": "ritual", "category": "cure_claim"}],
+        })
+
+        result, _ = await stricter.check_content_incremental("A daily ritual.", snapshot)
+
+        assert result.overall_status == OverallStatus.REJECTED
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_not_recorded(self):
+        """Sentences whose LLM stage failed are retried next time."""
+        mock_llm = AsyncMock()
+        mock_llm.generate.side_effect = RuntimeError("LLM down")
+        checker = EUComplianceChecker(TEST_CONFIG, llm_client=mock_llm)
+
+        result, snapshot = await checker.check_content_incremental("Treats cancer.")
+
+        assert result.llm_failed is True
+        assert result.overall_status == OverallStatus.REJECTED
+        assert snapshot.sentences == {}
+
+    def test_snapshot_version_mismatch(self):
+        """Snapshots from another layout version are discarded."""
+        assert ValidationSnapshot.from_dict(None) is None
+        assert ValidationSnapshot.from_dict({"version": 0, "sentences": {}}) is None
+
+
+class TestPackedBatchCheck:
+    """Tests for check_content_batch."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_pack_size(self, checker):
+        """Pack size and concurrency must be at least 1."""
+        with pytest.raises(ValueError):
+            await checker.check_content_batch(["text"], pack_size=0)
+        with pytest.raises(ValueError):
+            await checker.check_content_batch(["text"], max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_findings_scattered_to_items(self):
+        """Each item gets only its own section of the packed response."""
+        mock_llm = AsyncMock()
+        mock_llm.generate.return_value = (
+            "ITEM: 2\nPHRASE: sharpens memory\nSTATUS: BORDERLINE\n"
+            "EXPLANATION: Function claim\nITEM: 1\nNO_FLAGGED_PHRASES"
+        )
+        checker = EUComplianceChecker(TEST_CONFIG, llm_client=mock_llm)
+
+        checks = await checker.check_content_batch(["Forest walk", "It sharpens memory"])
+
+        assert mock_llm.generate.await_count == 1
+        assert "ITEM: 2\nIt sharpens memory" in mock_llm.generate.call_args.kwargs["prompt"]
+        assert [c.overall_status for c in checks] == [
+            OverallStatus.COMPLIANT,
+            OverallStatus.WARNING,
+        ]
+        assert checks[1].llm_enhanced is True
+
+    @pytest.mark.asyncio
+    async def test_echoed_item_headers(self):
+        """Headers reformatted by the model ("ITEM 2:") still split the response."""
+        mock_llm = AsyncMock()
+        mock_llm.generate.return_value = (
+            "ITEM 1:\nNO_FLAGGED_PHRASES\n\nITEM 2:\nPHRASE: sharpens memory\n"
+            "STATUS: BORDERLINE\nEXPLANATION: Function claim"
+        )
+        checker = EUComplianceChecker(TEST_CONFIG, llm_client=mock_llm)
+
+        checks = await checker.check_content_batch(["Forest walk", "It sharpens memory"])
+
+        assert [c.llm_failed for c in checks] == [False, False]
+        assert checks[1].overall_status == OverallStatus.WARNING
+
+    @pytest.mark.asyncio
+    async def test_missing_item_fails_pack(self):
+        """A response missing an item fails the whole pack and is not cached."""
+        from teams.dawo.middleware.llm_cache import LLMResponseCache, SQLiteLLMCacheBackend
+
+        mock_llm = AsyncMock()
+        mock_llm.generate.return_value = "ITEM: 1\nNO_FLAGGED_PHRASES"
+        checker = EUComplianceChecker(
+            TEST_CONFIG,
+            llm_client=mock_llm,
+            response_cache=LLMResponseCache(SQLiteLLMCacheBackend(":memory:")),
+        )
+
+        checks = await checker.check_content_batch(["Forest walk", "Supports focus"])
+        await checker.check_content_batch(["Forest walk", "Supports focus"])
+
+        assert [c.llm_failed for c in checks] == [True, True]
+        assert checks[1].overall_status == OverallStatus.WARNING
+        assert mock_llm.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_verdict_cache_hits_not_packed(self):
+        """Contents already in the verdict cache are not sent to the LLM again."""
+        from teams.dawo.validators.verdict_cache import VerdictCache
+
+        mock_llm = AsyncMock()
+        mock_llm.generate.return_value = "NO_FLAGGED_PHRASES"
+        checker = EUComplianceChecker(
+            TEST_CONFIG, llm_client=mock_llm, verdict_cache=VerdictCache()
+        )
+        cached = await checker.check_content("Forest walk")
+        mock_llm.generate.return_value = "ITEM: 1\nNO_FLAGGED_PHRASES"
+
+        checks = await checker.check_content_batch(["Forest walk", "Mushroom soup"])
+        again = await checker.check_content("Mushroom soup")
+
+        assert checks[0] == cached
+        prompt = mock_llm.generate.call_args.kwargs["prompt"]
+        assert "Forest walk" not in prompt and "ITEM: 1\nMushroom soup" in prompt
+        assert again == checks[1]
+        assert mock_llm.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_without_llm_client(self, checker):
+        """Pattern-only checkers never build prompts."""
+        checks = await checker.check_content_batch(["Treats cancer", "Morning ritual"])
+
+        assert [c.overall_status for c in checks] == [
+            OverallStatus.REJECTED,
+            OverallStatus.COMPLIANT,
+        ]
+
+
 class TestRegulationRefConstants:
     """Tests for RegulationRef constant values."""
 
@@ -660,7 +950,7 @@ EXPLANATION: Test finding from LLM"""
     async def test_llm_client_called_with_prompts(self):
         """Test LLM client is called with correct prompts."""
         mock_llm = AsyncMock()
-        mock_llm.generate.return_value = ""
+        mock_llm.generate.return_value = "NO_FLAGGED_PHRASES"
 
         checker = EUComplianceChecker(TEST_CONFIG, llm_client=mock_llm)
         await checker.check_content("Test content", product_name="chaga")
@@ -698,6 +988,53 @@ EXPLANATION: Test finding from LLM"""
         mock_llm.generate.assert_not_called()
         assert result.llm_enhanced is False
 
+    @pytest.mark.parametrize(
+        "response",
+        [
+            "",
+            "I could not analyze this content.",
+            "PHRASE: sharpens memory\nSTATUS: BORDERLINE\nEXPLANATION: Function claim\nPHRASE: cures",
+            "PHRASE: sharpens memory\nSTATUS: MAYBE\nEXPLANATION: Unsure",
+        ],
+        ids=["empty", "garbage", "truncated", "unknown-status"],
+    )
+    def test_malformed_response_raises(self, checker, response):
+        """Responses not in the requested format are rejected, not read as compliant."""
+        with pytest.raises(ValueError):
+            checker._parse_llm_response(response)
+
+    def test_no_findings_line(self, checker):
+        """NO_FLAGGED_PHRASES is an explicit all-clear."""
+        assert checker._parse_llm_response("Analysis done.\nNO_FLAGGED_PHRASES") == []
+
+    @pytest.mark.asyncio
+    async def test_malformed_response_not_cached(self):
+        """A malformed reply fails the LLM stage and is cached nowhere."""
+        from teams.dawo.middleware.llm_cache import LLMResponseCache, SQLiteLLMCacheBackend
+        from teams.dawo.validators.verdict_cache import VerdictCache
+
+        mock_llm = AsyncMock()
+        mock_llm.generate.side_effect = [
+            "Sorry, something went wrong",
+            "PHRASE: sharpens memory\nSTATUS: BORDERLINE\nEXPLANATION: Function claim",
+        ]
+        response_cache = LLMResponseCache(SQLiteLLMCacheBackend(":memory:"))
+        checker = EUComplianceChecker(
+            TEST_CONFIG,
+            llm_client=mock_llm,
+            response_cache=response_cache,
+            verdict_cache=VerdictCache(),
+        )
+
+        first = await checker.check_content("It sharpens memory")
+        second = await checker.check_content("It sharpens memory")
+
+        assert first.llm_failed is True
+        assert first.overall_status == OverallStatus.COMPLIANT
+        assert mock_llm.generate.await_count == 2
+        assert second.llm_failed is False
+        assert second.overall_status == OverallStatus.WARNING
+
 
 class TestComplianceScoring:
     """Tests for ComplianceScoring constants."""
@@ -2,10 +2,14 @@
 
 Tests cover:
 - Concurrent batch processing
+- Bounded concurrency
+- Packed mode (pattern pre-screen, several items per LLM prompt)
 - Partial failure handling
 - Statistics tracking
 """
 
+import asyncio
+
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock
@@ -13,6 +17,7 @@ from unittest.mock import AsyncMock
 from teams.dawo.research import TransformedResearch, ResearchSource, ComplianceStatus
 from teams.dawo.validators.eu_compliance import (
     ContentComplianceCheck,
+    EUComplianceChecker,
     OverallStatus,
 )
 from teams.dawo.validators.research_compliance import (
@@ -301,3 +306,105 @@ class TestValidationStatistics:
         assert stats.total == 3
         assert stats.validated == 2
         assert stats.failed == 1
+
+
+def _reddit_items(contents: list[str]) -> list[TransformedResearch]:
+    """Build Reddit research items with the given contents."""
+    return [
+        TransformedResearch(
+            source=ResearchSource.REDDIT,
+            title=f"Item {i}",
+            content=content,
+            url=f"https://reddit.com/r/test/{i}",
+            tags=[],
+            source_metadata={},
+            score=5.0,
+            created_at=datetime.now(timezone.utc),
+        )
+        for i, content in enumerate(contents)
+    ]
+
+
+class TestBoundedConcurrency:
+    """Tests for the max_concurrency limit."""
+
+    def test_invalid_limits(self, mock_eu_compliance_checker: AsyncMock):
+        """Limits must be at least 1."""
+        with pytest.raises(ValueError):
+            ResearchComplianceValidator(mock_eu_compliance_checker, max_concurrency=0)
+        with pytest.raises(ValueError):
+            ResearchComplianceValidator(mock_eu_compliance_checker, pack_size=0)
+
+    @pytest.mark.asyncio
+    async def test_checks_in_flight_are_bounded(self, mock_eu_compliance_checker: AsyncMock):
+        """No more than max_concurrency checks run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_check(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ContentComplianceCheck(overall_status=OverallStatus.COMPLIANT)
+
+        mock_eu_compliance_checker.check_content = AsyncMock(side_effect=slow_check)
+        validator = ResearchComplianceValidator(mock_eu_compliance_checker, max_concurrency=3)
+
+        results = await validator.validate_batch(_reddit_items([f"Content {i}" for i in range(10)]))
+
+        assert len(results) == 10
+        assert peak == 3
+
+
+class TestPackedValidation:
+    """Tests for packed batch validation."""
+
+    RULES = {
+        "prohibited_patterns": [{"pattern": "cures", "category": "cure_claim"}],
+        "borderline_patterns": [],
+        "permitted_patterns": [],
+    }
+
+    @pytest.mark.asyncio
+    async def test_packs_items_needing_llm(self):
+        """Pattern-rejected items skip the LLM; the rest share prompts."""
+        mock_llm = AsyncMock()
+        mock_llm.generate.side_effect = [
+            "ITEM: 1\nPHRASE: sharpens memory\nSTATUS: BORDERLINE\nEXPLANATION: Function claim\n"
+            "ITEM: 2\nNO_FLAGGED_PHRASES",
+            "ITEM: 1\nNO_FLAGGED_PHRASES\nITEM: 2\nNO_FLAGGED_PHRASES",
+        ]
+        checker = EUComplianceChecker(self.RULES, llm_client=mock_llm)
+        validator = ResearchComplianceValidator(checker, pack_size=2)
+
+        results = await validator.validate_batch(_reddit_items([
+            "It sharpens memory",
+            "It cures everything",
+            "Morning ritual",
+            "Forest walk",
+        ]))
+
+        assert mock_llm.generate.await_count == 2
+        assert [r.compliance_status for r in results] == [
+            ComplianceStatus.WARNING,
+            ComplianceStatus.REJECTED,
+            ComplianceStatus.COMPLIANT,
+            ComplianceStatus.COMPLIANT,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_prompt_keeps_pattern_verdicts(self):
+        """A failed packed prompt falls back to pattern-only results."""
+        mock_llm = AsyncMock()
+        mock_llm.generate.side_effect = RuntimeError("LLM down")
+        checker = EUComplianceChecker(self.RULES, llm_client=mock_llm)
+        validator = ResearchComplianceValidator(checker, pack_size=8)
+
+        results = await validator.validate_batch(_reddit_items(["It cures colds", "Forest walk"]))
+
+        assert [r.compliance_status for r in results] == [
+            ComplianceStatus.REJECTED,
+            ComplianceStatus.COMPLIANT,
+        ]
@@ -0,0 +1,230 @@
+"""Tests for the validator verdict cache.
+
+Tests cover:
+- In-process LRU hits, copies and eviction
+- Direct get/set for verdicts computed in batches
+- Shared backend tier across cache instances
+- Keys: normalized content, parameters and config fingerprints
+- Verdicts from a failed LLM stage are never stored
+- EUComplianceChecker and BrandVoiceValidator integration
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from teams.dawo.middleware import SQLiteLLMCacheBackend
+from teams.dawo.validators import (
+    BrandVoiceValidator,
+    EUComplianceChecker,
+    OverallStatus,
+    VerdictCache,
+    config_fingerprint,
+)
+
+
+RULES = {
+    "prohibited_patterns": [{"pattern": "cures", "category": "cure_claim"}],
+    "borderline_patterns": [{"pattern": "supports", "category": "function_claim"}],
+    "permitted_patterns": [{"pattern": "ritual", "category": "lifestyle"}],
+}
+
+BRAND_PROFILE = {
+    "brand_name": "DAWO",
+    "tone_pillars": {
+        "warm": {
+            "description": "Friendly, inviting, personal",
+            "positive_markers": ["we", "share"],
+            "negative_markers": ["consumers"],
+        },
+    },
+    "forbidden_terms": {"medicinal": ["cure"], "sales_pressure": [], "superlatives": []},
+    "ai_generic_patterns": ["Look no further"],
+    "scoring_thresholds": {"pass": 0.8, "needs_revision": 0.5, "fail": 0.0},
+}
+
+LLM_RESPONSE = "PHRASE: boosts immunity\nSTATUS: BORDERLINE\nEXPLANATION: Function claim"
+
+
+@pytest.fixture
+def cache() -> VerdictCache:
+    """Create an in-process verdict cache."""
+    return VerdictCache()
+
+
+class TestVerdictCache:
+    """Tests for VerdictCache tiers and keys."""
+
+    def test_invalid_settings(self):
+        """Sizes and TTLs must be positive."""
+        with pytest.raises(ValueError):
+            VerdictCache(max_memory_entries=0)
+        with pytest.raises(ValueError):
+            VerdictCache(ttl_seconds=0)
+
+    @pytest.mark.asyncio
+    async def test_memory_hit_returns_copy(self, cache):
+        """Repeat lookups skip compute and never share mutable state."""
+        compute = AsyncMock(return_value={"issues": []})
+
+        first = await cache.get_or_compute("eu_compliance", "fp", "Text", compute)
+        first["issues"].append("mutated")
+        second = await cache.get_or_compute("eu_compliance", "fp", "Text", compute)
+
+        assert compute.await_count == 1
+        assert second == {"issues": []}
+        assert cache.stats.memory_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_normalized_content_shares_key(self, cache):
+        """Line endings and outer whitespace do not split the cache."""
+        compute = AsyncMock(return_value="verdict")
+
+        await cache.get_or_compute("brand_voice", "fp", "Line one\r\nLine two", compute)
+        await cache.get_or_compute("brand_voice", "fp", "  Line one\nLine two\n", compute)
+
+        assert compute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_params_and_fingerprint_split_keys(self, cache):
+        """Different parameters or configuration never share a verdict."""
+        compute = AsyncMock(return_value="verdict")
+
+        await cache.get_or_compute("eu_compliance", "fp-1", "Text", compute, {"product_name": None})
+        await cache.get_or_compute("eu_compliance", "fp-1", "Text", compute, {"product_name": "chaga"})
+        await cache.get_or_compute("eu_compliance", "fp-2", "Text", compute, {"product_name": None})
+
+        assert compute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_and_set_share_keys(self, cache):
+        """Verdicts stored with set() answer get() and get_or_compute()."""
+        compute = AsyncMock(return_value="computed")
+
+        assert await cache.get("eu_compliance", "fp", "Text") is None
+        await cache.set("eu_compliance", "fp", "Text", "stored", {"use_llm": True})
+
+        assert await cache.get("eu_compliance", "fp", "Text", {"use_llm": True}) == "stored"
+        assert await cache.get_or_compute(
+            "eu_compliance", "fp", "Text", compute, {"use_llm": True}
+        ) == "stored"
+        assert compute.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """The least recently used entry is evicted beyond max_memory_entries."""
+        cache = VerdictCache(max_memory_entries=2)
+        compute = AsyncMock(return_value="verdict")
+
+        for text in ("a", "b", "a", "c", "a", "b"):
+            await cache.get_or_compute("eu_compliance", "fp", text, compute)
+
+        # "b" was evicted by "c"; "a" stayed hot
+        assert compute.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_verdict_not_stored(self, cache):
+        """Verdicts rejected by cacheable are recomputed next time."""
+        compute = AsyncMock(return_value="degraded")
+
+        for _ in range(2):
+            await cache.get_or_compute(
+                "eu_compliance", "fp", "Text", compute, cacheable=lambda verdict: False
+            )
+
+        assert compute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_tier_across_instances(self):
+        """A second worker's cache is filled from the shared backend."""
+        backend = SQLiteLLMCacheBackend(":memory:")
+        compute = AsyncMock(return_value={"score": 0.9})
+
+        await VerdictCache(backend).get_or_compute("brand_voice", "fp", "Text", compute)
+        other = VerdictCache(backend)
+        verdict = await other.get_or_compute("brand_voice", "fp", "Text", compute)
+
+        assert verdict == {"score": 0.9}
+        assert compute.await_count == 1
+        assert other.stats.shared_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_backend_failure_degrades(self):
+        """Backend errors fall back to computing the verdict."""
+        backend = AsyncMock()
+        backend.get.side_effect = ConnectionError("redis down")
+        backend.set.side_effect = ConnectionError("redis down")
+        cache = VerdictCache(backend)
+
+        verdict = await cache.get_or_compute("brand_voice", "fp", "Text", AsyncMock(return_value=1))
+
+        assert verdict == 1
+        assert cache.stats.errors == 2
+
+    def test_fingerprint_tracks_config(self):
+        """Any config change yields a new fingerprint."""
+        changed = {**RULES, "permitted_patterns": []}
+
+        assert config_fingerprint(RULES, "tmpl:1") == config_fingerprint(dict(RULES), "tmpl:1")
+        assert config_fingerprint(RULES, "tmpl:1") != config_fingerprint(changed, "tmpl:1")
+        assert config_fingerprint(RULES, "tmpl:1") != config_fingerprint(RULES, "tmpl:2")
+
+
+class TestValidatorIntegration:
+    """Tests for validators running through the verdict cache."""
+
+    @pytest.mark.asyncio
+    async def test_compliance_check_cached(self, cache):
+        """Identical content reuses the verdict, including the LLM call."""
+        llm = AsyncMock()
+        llm.generate.return_value = LLM_RESPONSE
+        checker = EUComplianceChecker(RULES, llm_client=llm, verdict_cache=cache)
+
+        first = await checker.check_content("Boosts immunity and cures colds")
+        second = await checker.check_content("Boosts immunity and cures colds")
+
+        assert llm.generate.await_count == 1
+        assert second.overall_status == OverallStatus.REJECTED
+        assert second.flagged_phrases == first.flagged_phrases
+
+    @pytest.mark.asyncio
+    async def test_compliance_llm_failure_not_cached(self, cache):
+        """A pattern-only fallback verdict is not served once the LLM is back."""
+        llm = AsyncMock()
+        llm.generate.side_effect = [RuntimeError("LLM down"), LLM_RESPONSE]
+        checker = EUComplianceChecker(RULES, llm_client=llm, verdict_cache=cache)
+
+        degraded = await checker.check_content("Boosts immunity")
+        recovered = await checker.check_content("Boosts immunity")
+
+        assert degraded.llm_failed is True
+        assert degraded.overall_status == OverallStatus.COMPLIANT
+        assert recovered.llm_failed is False
+        assert recovered.overall_status == OverallStatus.WARNING
+
+    @pytest.mark.asyncio
+    async def test_new_rules_invalidate(self, cache):
+        """A checker built from changed rules does not see old verdicts."""
+        old = EUComplianceChecker(RULES, verdict_cache=cache)
+        new = EUComplianceChecker(
+            {**RULES, "prohibited_patterns": [{"pattern": "ritual", "category": "cure_claim"}]},
+            verdict_cache=cache,
+        )
+
+        assert (await old.check_content("Morning ritual")).is_compliant
+        assert not (await new.check_content("Morning ritual")).is_compliant
+
+    @pytest.mark.asyncio
+    async def test_brand_validation_keyed_by_eu_findings(self, cache):
+        """EU findings passed to the validator are part of the key."""
+        validator = BrandVoiceValidator(BRAND_PROFILE, verdict_cache=cache)
+        eu_result = await EUComplianceChecker(RULES).check_content("It cures colds")
+
+        plain = await validator.validate_content("It cures colds")
+        with_eu = await validator.validate_content("It cures colds", eu_result)
+        again = await validator.validate_content("It cures colds", eu_result)
+
+        assert cache.stats.misses == 2
+        assert cache.stats.memory_hits == 1
+        assert again.issues == with_eu.issues
+        assert plain.issues != with_eu.issues
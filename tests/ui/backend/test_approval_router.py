@@ -34,6 +34,7 @@ from ui.backend.schemas.approval_actions import (
     RejectActionSchema,
     EditActionSchema,
     ApplyRewriteSchema,
+    RevalidationResultSchema,
 )
 
 
@@ -64,6 +65,7 @@ class MockApprovalItem:
         approved_at=None,
         approved_by=None,
         scheduled_publish_time=None,
+        validation_snapshot=None,
     ):
         self.id = id or uuid4()
         self.thumbnail_url = thumbnail_url
@@ -87,6 +89,7 @@ class MockApprovalItem:
         self.approved_at = approved_at
         self.approved_by = approved_by
         self.scheduled_publish_time = scheduled_publish_time
+        self.validation_snapshot = validation_snapshot
 
 
 class MockEditHistoryItem:
@@ -487,6 +490,8 @@ class TestEditAction:
             item_id=str(mock_item.id),
             request=request,
             repository=mock_repository,
+            checker=None,
+            validator=None,
         )
 
         assert result.success is True
@@ -503,6 +508,50 @@ class TestEditAction:
             )
 
 
+class TestIncrementalRevalidation:
+    """Tests for sentence-level revalidation of caption edits."""
+
+    @pytest.mark.asyncio
+    async def test_edit_rechecks_only_changed_sentences(self):
+        """A second edit re-checks just the edited sentences."""
+        from teams.dawo.validators.eu_compliance import EUComplianceChecker
+
+        mock_llm = AsyncMock()
+        mock_llm.generate.side_effect = ["NO_FLAGGED_PHRASES", "ITEM: 1\nNO_FLAGGED_PHRASES"]
+        checker = EUComplianceChecker(
+            {
+                "prohibited_patterns": [{"pattern": "cures", "category": "cure_claim"}],
+                "borderline_patterns": [],
+                "permitted_patterns": [],
+            },
+            llm_client=mock_llm,
+        )
+        mock_item = MockApprovalItem()
+        mock_repository = AsyncMock()
+        mock_repository.update_caption.return_value = mock_item
+
+        await edit_item(
+            item_id=str(mock_item.id),
+            request=EditActionSchema(caption="Morning ritual. Made in Norway."),
+            repository=mock_repository,
+            checker=checker,
+            validator=None,
+        )
+        result = await edit_item(
+            item_id=str(mock_item.id),
+            request=EditActionSchema(caption="Morning ritual. It cures colds. Picked by hand."),
+            repository=mock_repository,
+            checker=checker,
+            validator=None,
+        )
+
+        # Pattern-rejected "It cures colds." needs no LLM; one prompt for the rest
+        assert mock_llm.generate.await_count == 2
+        assert "Morning ritual" not in mock_llm.generate.call_args.kwargs["prompt"]
+        assert result.revalidation.compliance_status == "REJECTED"
+        assert len(mock_item.validation_snapshot["sentences"]) == 3
+
+
 class TestApplyRewriteAction:
     """Tests for apply_rewrite endpoint."""
 
@@ -536,12 +585,86 @@ class TestApplyRewriteAction:
             item_id=str(mock_item.id),
             request=request,
             repository=mock_repository,
+            checker=None,
+            validator=None,
         )
 
         assert result.success is True
         assert "1" in result.message  # "Applied 1 suggestion(s)"
         mock_repository.update_caption.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_apply_rewrite_revalidates_with_injected_checker(self):
+        """The injected checker re-checks the rewritten caption."""
+        from teams.dawo.validators.eu_compliance import EUComplianceChecker
+
+        checker = EUComplianceChecker(
+            {
+                "prohibited_patterns": [{"pattern": "cures", "category": "cure_claim"}],
+                "borderline_patterns": [],
+                "permitted_patterns": [],
+            }
+        )
+        mock_item = MockApprovalItem(
+            full_caption="A morning ritual. It warms you.",
+            rewrite_suggestions=[
+                {"id": "sug-1", "original_text": "warms you", "suggested_text": "cures colds"},
+            ],
+        )
+        updated_item = MockApprovalItem(full_caption="A morning ritual. It cures colds.")
+        mock_repository = AsyncMock()
+        mock_repository.get_by_id.return_value = mock_item
+        mock_repository.update_caption.return_value = updated_item
+
+        result = await apply_rewrite(
+            item_id=str(mock_item.id),
+            request=ApplyRewriteSchema(suggestion_ids=["sug-1"]),
+            repository=mock_repository,
+            checker=checker,
+            validator=None,
+        )
+
+        assert result.revalidation.compliance_status == "REJECTED"
+        assert len(updated_item.validation_snapshot["sentences"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_apply_several_rewrites_revalidates_once(self):
+        """Several suggestions are saved as one edit and revalidated once."""
+        mock_item = MockApprovalItem(
+            full_caption="Boosts immunity and cures colds.",
+            rewrite_suggestions=[
+                {"id": "sug-1", "original_text": "Boosts immunity", "suggested_text": "A ritual"},
+                {"id": "sug-2", "original_text": "cures colds", "suggested_text": "warms you"},
+            ],
+        )
+        updated_item = MockApprovalItem(full_caption="A ritual and warms you.")
+
+        mock_repository = AsyncMock()
+        mock_repository.get_by_id.return_value = mock_item
+        mock_repository.update_caption.return_value = updated_item
+
+        revalidation = RevalidationResultSchema(compliance_status="COMPLIANT", quality_score=8.0)
+
+        with patch(
+            "ui.backend.routers.approval_queue._perform_revalidation",
+            new_callable=AsyncMock,
+            return_value=revalidation,
+        ) as revalidate:
+            result = await apply_rewrite(
+                item_id=str(mock_item.id),
+                request=ApplyRewriteSchema(suggestion_ids=["sug-1", "sug-2"]),
+                repository=mock_repository,
+                checker=None,
+                validator=None,
+            )
+
+        mock_repository.update_caption.assert_called_once()
+        assert mock_repository.update_caption.call_args.kwargs["new_caption"] == (
+            "A ritual and warms you."
+        )
+        revalidate.assert_awaited_once_with("A ritual and warms you.", updated_item, None, None)
+        assert result.revalidation == revalidation
+
     @pytest.mark.asyncio
     async def test_apply_rewrite_invalid_suggestion_id(self):
         """Test applying invalid suggestion ID fails."""
@@ -563,6 +686,8 @@ class TestApplyRewriteAction:
                 item_id=str(mock_item.id),
                 request=request,
                 repository=mock_repository,
+                checker=None,
+                validator=None,
             )
 
         assert exc_info.value.status_code == 400
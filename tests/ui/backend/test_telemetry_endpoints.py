@@ -0,0 +1,126 @@
+"""Tests for pipeline telemetry endpoints.
+
+Tests cover:
+- Pipeline summaries endpoint
+- Pipeline history endpoint (summary, runs, limit, 404)
+"""
+
+import pytest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from fastapi import FastAPI
+
+from ui.backend.routers.telemetry import router
+from teams.dawo.middleware import PipelineTelemetry, PipelineTelemetryStore
+
+
+@pytest.fixture
+def app():
+    """Create test FastAPI app."""
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    """Create test client."""
+    return TestClient(app)
+
+
+def _run(pipeline: str, published: int) -> PipelineTelemetry:
+    """Build a finished run with scan and publish stages."""
+    telemetry = PipelineTelemetry(pipeline=pipeline)
+    with telemetry.stage("scan") as stage:
+        stage.external_calls = 4
+        stage.bytes_transferred = 2048
+        stage.items_out = 12
+    with telemetry.stage("publish", items_in=12) as stage:
+        stage.items_out = published
+    return telemetry.finish()
+
+
+@pytest.fixture
+def store():
+    """Create a telemetry store with reddit and news runs."""
+    store = PipelineTelemetryStore()
+    store.record(_run("reddit", published=10))
+    store.record(_run("reddit", published=11))
+    store.record(_run("news", published=3))
+    return store
+
+
+class TestPipelineSummariesEndpoint:
+    """Tests for GET /api/telemetry/pipelines."""
+
+    def test_lists_all_pipelines(self, client, store):
+        """Test summaries for every recorded pipeline."""
+        with patch(
+            "ui.backend.routers.telemetry.get_telemetry_store",
+            return_value=store,
+        ):
+            response = client.get("/api/telemetry/pipelines")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["pipeline"] for item in data] == ["news", "reddit"]
+        reddit = data[1]
+        assert reddit["runs"] == 2
+        assert [stage["name"] for stage in reddit["stages"]] == ["scan", "publish"]
+        assert reddit["stages"][0]["avg_external_calls"] == 4.0
+
+    def test_empty_store(self, client):
+        """Test empty list when nothing has run."""
+        with patch(
+            "ui.backend.routers.telemetry.get_telemetry_store",
+            return_value=PipelineTelemetryStore(),
+        ):
+            response = client.get("/api/telemetry/pipelines")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+
+class TestPipelineHistoryEndpoint:
+    """Tests for GET /api/telemetry/pipelines/{pipeline}."""
+
+    def test_history_response(self, client, store):
+        """Test summary plus runs, newest first."""
+        with patch(
+            "ui.backend.routers.telemetry.get_telemetry_store",
+            return_value=store,
+        ):
+            response = client.get("/api/telemetry/pipelines/reddit")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["summary"]["runs"] == 2
+        assert len(data["runs"]) == 2
+        assert data["runs"][0]["stages"][1]["items_out"] == 11
+        scan = data["runs"][0]["stages"][0]
+        assert scan["bytes_transferred"] == 2048
+        assert "items_per_second" in scan
+
+    def test_limit(self, client, store):
+        """Test limit caps the runs returned."""
+        with patch(
+            "ui.backend.routers.telemetry.get_telemetry_store",
+            return_value=store,
+        ):
+            response = client.get("/api/telemetry/pipelines/reddit?limit=1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["runs"]) == 1
+        assert data["summary"]["runs"] == 2
+
+    def test_unknown_pipeline_returns_404(self, client, store):
+        """Test 404 for a pipeline without runs."""
+        with patch(
+            "ui.backend.routers.telemetry.get_telemetry_store",
+            return_value=store,
+        ):
+            response = client.get("/api/telemetry/pipelines/youtube")
+
+        assert response.status_code == 404
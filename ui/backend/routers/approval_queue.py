@@ -46,46 +46,31 @@ from ui.backend.schemas.batch_approval import (
     BatchRejectResponse,
 )
 from ui.backend.repositories.approval_repository import ApprovalItemRepository
+from teams.dawo.validators.brand_voice import BrandVoiceValidator
+from teams.dawo.validators.eu_compliance import EUComplianceChecker, ValidationSnapshot
 
 if TYPE_CHECKING:
     from core.approval.models import ApprovalItem
 
-# Lazy import validators to avoid circular dependencies
-_eu_compliance_checker = None
-_brand_voice_validator = None
 
-
-def _get_eu_compliance_checker():
-    """Lazy load EU Compliance Checker."""
-    global _eu_compliance_checker
-    if _eu_compliance_checker is None:
-        try:
-            from teams.dawo.validators.eu_compliance import EUComplianceChecker
-            _eu_compliance_checker = EUComplianceChecker()
-        except ImportError:
-            logger.warning("EUComplianceChecker not available")
-            return None
-    return _eu_compliance_checker
-
-
-def _get_brand_voice_validator():
-    """Lazy load Brand Voice Validator."""
-    global _brand_voice_validator
-    if _brand_voice_validator is None:
-        try:
-            from teams.dawo.validators.brand_voice import BrandVoiceValidator
-            _brand_voice_validator = BrandVoiceValidator()
-        except ImportError:
-            logger.warning("BrandVoiceValidator not available")
-            return None
-    return _brand_voice_validator
-
-
-async def _perform_revalidation(caption: str) -> RevalidationResultSchema:
+async def _perform_revalidation(
+    caption: str,
+    item: Optional["ApprovalItem"],
+    checker: Optional[EUComplianceChecker],
+    validator: Optional[BrandVoiceValidator],
+) -> RevalidationResultSchema:
     """Perform compliance and quality revalidation on caption.
 
+    EU compliance is checked sentence by sentence: with an item, only the
+    sentences changed since item.validation_snapshot are re-checked and
+    the refreshed snapshot is stored on the item, so it is committed with
+    the caption update in the same session.
+
     Args:
         caption: The caption text to validate
+        item: Approval item the caption belongs to (enables incremental checks)
+        checker: Configured EU Compliance Checker (None skips compliance)
+        validator: Configured Brand Voice Validator (None skips brand voice)
 
     Returns:
         RevalidationResultSchema with updated compliance and quality scores
@@ -97,11 +82,20 @@ async def _perform_revalidation(caption: str) -> RevalidationResultSchema:
     rewrite_suggestions = []
 
     # Run EU Compliance Check
-    checker = _get_eu_compliance_checker()
     if checker is not None:
         try:
-            compliance_result = await checker.check(caption)
-            compliance_status = compliance_result.overall_status.value
+            previous = (
+                ValidationSnapshot.from_dict(item.validation_snapshot)
+                if item is not None
+                else None
+            )
+            compliance_result, snapshot = await checker.check_content_incremental(
+                caption, previous
+            )
+            if item is not None:
+                item.validation_snapshot = snapshot.to_dict()
+
+            compliance_status = compliance_result.overall_status.value.upper()
             compliance_details = [
                 {
                     "phrase": r.phrase,
@@ -109,15 +103,15 @@ async def _perform_revalidation(caption: str) -> RevalidationResultSchema:
                     "explanation": r.explanation,
                     "regulation_reference": r.regulation_reference,
                 }
-                for r in compliance_result.results
+                for r in compliance_result.flagged_phrases
             ]
             # Generate rewrite suggestions for non-compliant phrases
-            for r in compliance_result.results:
-                if r.status.value in ("PROHIBITED", "BORDERLINE"):
+            for r in compliance_result.flagged_phrases:
+                if r.status.value in ("prohibited", "borderline"):
                     rewrite_suggestions.append({
                         "id": f"compliance-{hash(r.phrase) % 10000}",
                         "original_text": r.phrase,
-                        "suggested_text": r.suggested_alternative or "",
+                        "suggested_text": "",
                         "reason": r.explanation,
                         "type": "compliance",
                     })
@@ -125,7 +119,6 @@ async def _perform_revalidation(caption: str) -> RevalidationResultSchema:
             logger.warning("EU Compliance check failed: %s", str(e))
 
     # Run Brand Voice Validation
-    validator = _get_brand_voice_validator()
     if validator is not None:
         try:
             brand_result = await validator.validate(caption)
@@ -199,6 +192,30 @@ async def get_repository(
     return ApprovalItemRepository(session)
 
 
+async def get_eu_compliance_checker() -> EUComplianceChecker:
+    """Dependency to get the EU Compliance Checker used for revalidation.
+
+    Placeholder like get_db_session: the main application overrides it
+    with the checker the Team Builder configured from the compliance rules.
+
+    Returns:
+        Configured EUComplianceChecker
+    """
+    raise NotImplementedError("EU compliance checker dependency not configured")
+
+
+async def get_brand_voice_validator() -> BrandVoiceValidator:
+    """Dependency to get the Brand Voice Validator used for revalidation.
+
+    Placeholder like get_db_session: the main application overrides it
+    with the validator the Team Builder configured from the brand profile.
+
+    Returns:
+        Configured BrandVoiceValidator
+    """
+    raise NotImplementedError("Brand voice validator dependency not configured")
+
+
 @router.get(
     "",
     response_model=ApprovalQueueResponse,
@@ -441,6 +458,8 @@ async def edit_item(
     item_id: str,
     request: EditActionSchema,
     repository: ApprovalItemRepository = Depends(get_repository),
+    checker: EUComplianceChecker = Depends(get_eu_compliance_checker),
+    validator: BrandVoiceValidator = Depends(get_brand_voice_validator),
 ) -> ApprovalActionResponse:
     """Edit caption and trigger revalidation.
 
@@ -448,6 +467,8 @@ async def edit_item(
         item_id: Unique identifier of the approval item
         request: New caption and optional hashtags
         repository: Approval item repository
+        checker: EU Compliance Checker for revalidation
+        validator: Brand Voice Validator for revalidation
 
     Returns:
         ApprovalActionResponse with success status and revalidation results
@@ -464,7 +485,9 @@ async def edit_item(
         )
 
         # Trigger revalidation via compliance/quality validators
-        revalidation_result = await _perform_revalidation(request.caption)
+        revalidation_result = await _perform_revalidation(
+            request.caption, item, checker, validator
+        )
 
         return ApprovalActionResponse(
             success=True,
@@ -496,12 +519,16 @@ async def edit_item(
 async def revalidate_item(
     item_id: str,
     repository: ApprovalItemRepository = Depends(get_repository),
+    checker: EUComplianceChecker = Depends(get_eu_compliance_checker),
+    validator: BrandVoiceValidator = Depends(get_brand_voice_validator),
 ) -> RevalidationResultSchema:
     """Revalidate content for compliance and quality.
 
     Args:
         item_id: Unique identifier of the approval item
         repository: Approval item repository
+        checker: EU Compliance Checker for revalidation
+        validator: Brand Voice Validator for revalidation
 
     Returns:
         RevalidationResultSchema with updated scores
@@ -518,7 +545,7 @@ async def revalidate_item(
             )
 
         # Perform actual revalidation via validators
-        result = await _perform_revalidation(item.full_caption)
+        result = await _perform_revalidation(item.full_caption, item, checker, validator)
 
         logger.info(
             "Revalidated item %s: compliance=%s, quality=%.1f",
@@ -544,14 +571,16 @@ async def revalidate_item(
     summary="Apply AI rewrite suggestions",
     description="""
     Apply one or more AI-suggested rewrites to the content.
-    Each applied suggestion updates the caption and is tracked in edit history.
-    Triggers automatic revalidation after applying.
+    All applied suggestions are saved as one caption edit in edit history.
+    Triggers a single automatic revalidation after applying.
     """,
 )
 async def apply_rewrite(
     item_id: str,
     request: ApplyRewriteSchema,
     repository: ApprovalItemRepository = Depends(get_repository),
+    checker: EUComplianceChecker = Depends(get_eu_compliance_checker),
+    validator: BrandVoiceValidator = Depends(get_brand_voice_validator),
 ) -> ApprovalActionResponse:
     """Apply AI rewrite suggestions to content.
 
@@ -559,6 +588,8 @@ async def apply_rewrite(
         item_id: Unique identifier of the approval item
         request: List of suggestion IDs to apply
         repository: Approval item repository
+        checker: EU Compliance Checker for revalidation
+        validator: Brand Voice Validator for revalidation
 
     Returns:
         ApprovalActionResponse with success status
@@ -595,19 +626,24 @@ async def apply_rewrite(
             if original_text and original_text in new_caption:
                 new_caption = new_caption.replace(original_text, suggested_text, 1)
 
-        # Update caption if changes were made
+        # Save all applied suggestions as one edit and revalidate once
+        revalidation_result = None
         if new_caption != item.full_caption:
-            await repository.update_caption(
+            item = await repository.update_caption(
                 item_id=item_id,
                 new_caption=new_caption,
                 operator_id="ai_rewrite",
             )
+            revalidation_result = await _perform_revalidation(
+                new_caption, item, checker, validator
+            )
 
         return ApprovalActionResponse(
             success=True,
             message=f"Applied {len(request.suggestion_ids)} suggestion(s)",
             item_id=str(item.id),
             new_status=item.status,
+            revalidation=revalidation_result,
         )
     except HTTPException:
         raise
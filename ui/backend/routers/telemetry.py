@@ -0,0 +1,168 @@
+"""Pipeline Telemetry API router.
+
+Per-stage timing and throughput of the scanner pipelines, read from the
+rolling telemetry store the pipelines append to after every run. Used for
+capacity planning of the scan schedule.
+
+Endpoints:
+    GET /api/telemetry/pipelines - Stage averages for every pipeline
+    GET /api/telemetry/pipelines/{pipeline} - Stage averages plus recent runs
+"""
+
+import logging
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from teams.dawo.middleware import get_telemetry_store
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/telemetry", tags=["telemetry"])
+
+# Recent runs returned by the pipeline detail endpoint
+DEFAULT_RUN_LIMIT = 20
+MAX_RUN_LIMIT = 200
+
+
+class StageMetricsResponse(BaseModel):
+    """Metrics of one stage in one pipeline run."""
+
+    name: str = Field(..., description="Stage name")
+    wall_seconds: float = Field(..., description="Wall time spent in the stage")
+    items_in: int = Field(..., description="Items handed to the stage")
+    items_out: int = Field(..., description="Items the stage produced")
+    items_per_second: float = Field(..., description="Throughput (items out / wall time)")
+    external_calls: int = Field(..., description="HTTP requests sent")
+    llm_calls: int = Field(..., description="LLM calls (cache hits excluded)")
+    retries: int = Field(..., description="Retry attempts")
+    bytes_transferred: int = Field(..., description="Request plus response bytes")
+
+    model_config = {"from_attributes": True}
+
+
+class PipelineRunResponse(BaseModel):
+    """Telemetry of one pipeline run."""
+
+    pipeline: str = Field(..., description="Pipeline name")
+    started_at: datetime = Field(..., description="When the run started")
+    total_seconds: float = Field(..., description="Wall time of the run")
+    stages: list[StageMetricsResponse] = Field(
+        default_factory=list, description="Stages in execution order"
+    )
+
+    model_config = {"from_attributes": True}
+
+
+class StageSummaryResponse(BaseModel):
+    """Stage averages over a pipeline's recorded runs."""
+
+    name: str = Field(..., description="Stage name")
+    runs: int = Field(..., description="Runs in which the stage executed")
+    avg_wall_seconds: float = Field(..., description="Mean stage wall time")
+    max_wall_seconds: float = Field(..., description="Slowest stage wall time")
+    avg_items_per_second: float = Field(..., description="Mean throughput")
+    avg_external_calls: float = Field(..., description="Mean HTTP requests")
+    avg_llm_calls: float = Field(..., description="Mean LLM calls")
+    avg_retries: float = Field(..., description="Mean retries")
+    avg_bytes_transferred: float = Field(..., description="Mean bytes transferred")
+
+    model_config = {"from_attributes": True}
+
+
+class PipelineSummaryResponse(BaseModel):
+    """Aggregate telemetry of one pipeline."""
+
+    pipeline: str = Field(..., description="Pipeline name")
+    runs: int = Field(..., description="Runs in the rolling window")
+    last_run_at: Optional[datetime] = Field(
+        default=None, description="Start of the most recent run"
+    )
+    avg_total_seconds: float = Field(..., description="Mean run wall time")
+    max_total_seconds: float = Field(..., description="Slowest run wall time")
+    stages: list[StageSummaryResponse] = Field(
+        default_factory=list, description="Per-stage averages in execution order"
+    )
+
+    model_config = {"from_attributes": True}
+
+
+class PipelineHistoryResponse(BaseModel):
+    """Aggregate telemetry of one pipeline plus its recent runs."""
+
+    summary: PipelineSummaryResponse = Field(..., description="Stage averages")
+    runs: list[PipelineRunResponse] = Field(
+        default_factory=list, description="Recent runs, newest first"
+    )
+
+
+@router.get("/pipelines", response_model=list[PipelineSummaryResponse])
+async def get_pipeline_summaries() -> list[PipelineSummaryResponse]:
+    """Get stage averages for every pipeline with recorded runs.
+
+    Returns:
+        One PipelineSummaryResponse per pipeline, sorted by name
+    """
+    store = get_telemetry_store()
+    return [
+        PipelineSummaryResponse.model_validate(store.summarize(pipeline))
+        for pipeline in store.pipelines()
+    ]
+
+
+@router.get("/pipelines/{pipeline}", response_model=PipelineHistoryResponse)
+async def get_pipeline_history(
+    pipeline: str,
+    limit: int = Query(
+        default=DEFAULT_RUN_LIMIT,
+        ge=1,
+        le=MAX_RUN_LIMIT,
+        description="Maximum number of recent runs to return",
+    ),
+) -> PipelineHistoryResponse:
+    """Get stage averages and recent runs of one pipeline.
+
+    Args:
+        pipeline: Pipeline name (reddit, youtube, instagram, news, pubmed)
+        limit: Maximum number of recent runs to return (1-200)
+
+    Returns:
+        PipelineHistoryResponse with summary and runs, newest first
+
+    Raises:
+        HTTPException: 404 if the pipeline has no recorded runs
+    """
+    store = get_telemetry_store()
+    runs = store.get_history(pipeline, limit=limit)
+    if not runs:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No telemetry recorded for pipeline: {pipeline}",
+        )
+
+    logger.debug("Pipeline telemetry requested: %s (%d runs)", pipeline, len(runs))
+
+    return PipelineHistoryResponse(
+        summary=PipelineSummaryResponse.model_validate(store.summarize(pipeline)),
+        runs=[
+            PipelineRunResponse(
+                pipeline=run.pipeline,
+                started_at=run.started_at,
+                total_seconds=round(run.total_seconds, 4),
+                stages=[StageMetricsResponse(**stage.to_dict()) for stage in run.stages],
+            )
+            for run in runs
+        ],
+    )
+
+
+__all__ = [
+    "router",
+    "StageMetricsResponse",
+    "PipelineRunResponse",
+    "StageSummaryResponse",
+    "PipelineSummaryResponse",
+    "PipelineHistoryResponse",
+]